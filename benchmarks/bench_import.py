@@ -0,0 +1,50 @@
+"""
+Import time of the rpm modules, each measured in a fresh interpreter.
+The numeric modules are expected to stay within BUDGET as they do not load pint or mpmath.
+
+    python -m benchmarks.bench_import
+"""
+from __future__ import division
+from __future__ import print_function
+
+import subprocess
+import sys
+
+
+# seconds a numeric module may take to import, on top of numpy
+BUDGET = 0.05
+NUMERIC_MODULES = ("rpm", "rpm.batch", "rpm.solvers", "rpm.compiled", "rpm.probabilistic")
+MODULES = NUMERIC_MODULES + ("rpm.rpm_oop", "rpm.cli")
+REPEAT = 5
+
+TIMER = """
+import time
+import numpy
+start = time.perf_counter()
+import {}
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(module, repeat=REPEAT):
+    """Returns the shortest time in seconds taken to import module in a new interpreter"""
+    return min(float(subprocess.check_output([sys.executable, "-c", TIMER.format(module)]))
+               for _ in range(repeat))
+
+
+def main():
+    over_budget = []
+    print("{:>20} {:>10}".format("module", "import/ms"))
+    for module in MODULES:
+        seconds = import_time(module)
+        print("{:>20} {:>10.1f}".format(module, seconds * 1e3))
+        if module in NUMERIC_MODULES and seconds > BUDGET:
+            over_budget.append(module)
+    if over_budget:
+        print("over the {:.0f} ms budget: {}".format(BUDGET * 1e3, ", ".join(over_budget)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+Cost per design of the stages of the design pipeline, compared with a stored baseline.
+At the scalar scale a RoomAndPillar design is timed; at the array scales the same
+stages are timed on arrays of that many designs with rpm.batch and rpm.solvers.
+The report, to_html_with_header, is only timed for a single design. Times are saved
+as JSON and any stage more than --tolerance slower per design than in the baseline
+is reported.
+
+    python -m benchmarks.bench_pipeline --output results.json
+    python -m benchmarks.bench_pipeline --save-baseline
+"""
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+from rpm import (batch, Q_)
+from rpm.cases import design_from_case
+from rpm.formulas import ALL_FORMULA
+from rpm.solvers import solve_pillar_width
+
+
+SCALES = (1, 10 ** 3, 10 ** 5, 10 ** 6)
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline_pipeline.json")
+# relative slowdown per design reported as a regression, timings of a run vary by
+# tens of percent on a busy machine. The baseline is only meaningful on the machine
+# that saved it, see environment
+TOLERANCE = 1.0
+REPEAT = 5
+# designs timed per measurement at the array scales, smaller arrays are timed several times
+ARRAY_DESIGNS = 10 ** 5
+SCALAR_NUMBER = 100
+SEED = 2017
+
+CASE = {"project_name": "Benchmark", "ore_type": "coal", "room_span": "6", "sample_strength": "38.47",
+        "sample_height": "25.4", "sample_diameter": "54", "friction_angle": "19", "cohesion": "1.2",
+        "seam_height": "4", "mine_depth": "150", "overburden_density": "20", "floor_density": "22"}
+
+
+def best_time(func, number, repeat=REPEAT):
+    """Returns the shortest time in seconds of a call of func"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def scalar_stages():
+    """Returns the stage name and function of every stage timed on one RoomAndPillar"""
+    rap = design_from_case(CASE)
+    rap.formula_decide()
+    rap.pillar_width_from_fos_and_stress()
+
+    def strength(formula):
+        def run():
+            rap.formula = formula
+            return rap.pillar_strength
+        return run
+
+    def output(name):
+        def run():
+            rap.invalidate()
+            return getattr(rap, name)
+        return run
+
+    stages = [("pillar_strength/" + formula.name, strength(formula)) for formula in ALL_FORMULA]
+    stages += [("pillar_stress", output("pillar_stress")), ("bearing_capacity", output("bearing_capacity"))]
+    solver = design_from_case(CASE)
+    solver.formula_decide()
+    stages += [("pillar_width_from_fos_and_stress", solver.pillar_width_from_fos_and_stress),
+               ("to_html_with_header", rap.to_html_with_header)]
+    return stages
+
+
+def array_stages(size):
+    """Returns the stage name and function of every stage timed on arrays of size designs"""
+    random = np.random.RandomState(SEED)
+    width = random.uniform(3.0, 30.0, size)
+    length = width * random.uniform(1.0, 2.0, size)
+    height = random.uniform(2.0, 6.0, size)
+    depth = random.uniform(50.0, 500.0, size)
+    room_span = random.uniform(4.0, 10.0, size)
+    overburden_density = np.full(size, 0.025)
+    strength = Q_(random.uniform(20.0, 60.0, size), "megapascal")
+    diameter, sample_height = Q_(np.full(size, 54.0), "mm"), Q_(np.full(size, 25.4), "mm")
+    gaddy = batch.gaddy_factor(strength, diameter)
+    sample_volume, sample_shape = batch.sample_geometry(sample_height, diameter)
+    friction_angle = np.full(size, np.radians(19.0))
+    cohesion, floor_density = np.full(size, 1.2), np.full(size, 0.022)
+
+    def strength_of(formula):
+        k = None if formula.name == batch.CMRI.name else batch.sample_k(formula, strength, diameter, sample_height)
+        return lambda: batch.pillar_strength(formula, width, height, k, length, depth, strength, gaddy,
+                                             sample_volume, sample_shape)
+
+    def stress():
+        return batch.pillar_stress(batch.vertical_stress(depth, overburden_density), width, length, room_span)
+
+    formula = ALL_FORMULA[-1]
+
+    def width_solve():
+        return solve_pillar_width(depth, room_span, height, formula.k, formula.alpha, formula.beta,
+                                  formula.recommended_fos, formula.category, formula.unit_system,
+                                  overburden_density)
+
+    stages = [("pillar_strength/" + formula.name, strength_of(formula)) for formula in ALL_FORMULA]
+    stages += [("pillar_stress", stress),
+               ("bearing_capacity", lambda: batch.bearing_capacity(friction_angle, cohesion, floor_density, width,
+                                                                   length)),
+               ("pillar_width_from_fos_and_stress", width_solve)]
+    return stages
+
+
+def run(scales=SCALES, repeat=REPEAT):
+    """Returns a mapping of every stage to a mapping of the scale to the seconds per design"""
+    results = {}
+    for size in scales:
+        if size == 1:
+            stages, number = scalar_stages(), SCALAR_NUMBER
+        else:
+            stages, number = array_stages(size), max(1, ARRAY_DESIGNS // size)
+        for name, func in stages:
+            try:
+                seconds = best_time(func, number, repeat) / size
+            except Exception as e:
+                print("{} at {} failed: {}: {}".format(name, size, type(e).__name__, e), file=sys.stderr)
+                seconds = None
+            results.setdefault(name, {})[str(size)] = seconds
+    return results
+
+
+def environment():
+    return {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(),
+            "processor": platform.processor()}
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """
+    Returns (stage, scale, seconds, baseline seconds) of every time per design that is
+    more than tolerance slower than in baseline. Stages or scales missing from either are skipped.
+    """
+    regressions = []
+    for name, times in sorted(results.items()):
+        for size, seconds in sorted(times.items(), key=lambda item: int(item[0])):
+            before = baseline.get(name, {}).get(size)
+            if seconds is not None and before is not None and seconds > before * (1 + tolerance):
+                regressions.append((name, size, seconds, before))
+    return regressions
+
+
+def print_results(results, scales):
+    print("{:<42}".format("stage, us per design") + "".join("{:>12}".format(size) for size in scales))
+    for name, times in results.items():
+        cells = []
+        for size in scales:
+            seconds = times.get(str(size))
+            cells.append("{:>12}".format("-") if seconds is None else "{:>12.3f}".format(seconds * 1e6))
+        print("{:<42}".format(name) + "".join(cells))
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_pipeline", description=__doc__.split("\n")[1])
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES, help="designs per call, 1 for a single design")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="measurements of which the best is kept")
+    parser.add_argument("--output", help="JSON file the results are written to")
+    parser.add_argument("--baseline", default=BASELINE, help="JSON results compared with (default: %(default)s)")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="relative slowdown reported as a regression (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to the baseline")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    results = run(args.scales, args.repeat)
+    print_results(results, args.scales)
+    document = {"environment": environment(), "results": results}
+    for path in filter(None, (args.output, args.baseline if args.save_baseline else None)):
+        with open(path, "w") as output:
+            json.dump(document, output, indent=2, sort_keys=True)
+    if args.save_baseline or not os.path.exists(args.baseline):
+        return 0
+
+    with open(args.baseline) as baseline:
+        regressions = compare(results, json.load(baseline)["results"], args.tolerance)
+    for name, size, seconds, before in regressions:
+        print("regression: {} at {} designs {:.3f} us per design, was {:.3f} us".format(
+            name, size, seconds * 1e6, before * 1e6))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
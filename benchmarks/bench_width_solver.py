@@ -0,0 +1,63 @@
+"""
+Cost per solve of the pillar width root search for widths between 2 m and 200 m.
+The old one metre scan is kept here for comparison.
+
+    python -m benchmarks.bench_width_solver
+"""
+from __future__ import division
+from __future__ import print_function
+
+import timeit
+
+from mpmath import findroot
+
+from rpm.solvers import (bracket_root, width_coefficients)
+
+
+ROOM_SPAN, HEIGHT, EXP_M = 6.0, 4.0, 4.5
+ALPHA, BETA = 0.4, -0.6
+WIDTHS = (2, 5, 10, 20, 50, 100, 200)
+
+
+def width_polynomial(width):
+    """Returns the polynomial whose root is width by picking the matching k"""
+    k = EXP_M * (width + ROOM_SPAN) ** 2 / (HEIGHT ** BETA * width ** (ALPHA + 2))
+    coefs = width_coefficients("exponential", k, ALPHA, BETA, HEIGHT, ROOM_SPAN, EXP_M)
+    return lambda x: coefs.other_coef * x ** coefs.other_expo - coefs.square_coef * x ** 2 - \
+        coefs.uni_coef * x - coefs.constant_c
+
+
+def metre_scan(f):
+    cur_x, cur_val = 0, f(0)
+    op = "<" if cur_val < 0 else ">"
+    str_comp = "{} {} 0".format(cur_val, op)
+    while eval(str_comp):
+        cur_x += 1
+        cur_val = f(cur_x)
+        str_comp = "{} {} 0".format(cur_val, op)
+    return cur_x - 1
+
+
+def scan_solve(f):
+    return findroot(f, metre_scan(f), solver="newton", tol=0.001)
+
+
+def bracket_solve(f):
+    return findroot(f, bracket_root(f), solver="anderson", tol=0.001)
+
+
+def per_call(func, f, number=20):
+    return min(timeit.repeat(lambda: func(f), number=number, repeat=3)) / number
+
+
+def main():
+    print("{:>8} {:>14} {:>14} {:>14}".format("width/m", "bracket/us", "solve/us", "scan solve/us"))
+    for width in WIDTHS:
+        f = width_polynomial(width)
+        print("{:>8} {:>14.1f} {:>14.1f} {:>14.1f}".format(
+            width, per_call(bracket_root, f) * 1e6, per_call(bracket_solve, f) * 1e6,
+            per_call(scan_solve, f) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
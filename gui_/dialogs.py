@@ -1,10 +1,8 @@
 from qtpy.QtWidgets import (QDialog, QFileDialog, QApplication)
-from qtpy.QtGui import QPixmap
 from qtpy.QtCore import SIGNAL
-from os.path import join
 
 from . import (about_ui, export_ui)
-from . import GUI_DIR
+from .images import pixmap
 
 
 class AboutDialog(QDialog, about_ui.Ui_Dialog):
@@ -12,8 +10,7 @@ class AboutDialog(QDialog, about_ui.Ui_Dialog):
     def __init__(self, parent=None):
         super(AboutDialog, self).__init__(parent)
         self.setupUi(self)
-        logo = QPixmap(join(GUI_DIR, "icon.png"))
-        self.iconLabel.setPixmap(logo)
+        self.iconLabel.setPixmap(pixmap("icon"))
 
 
 class ExportDialog(QDialog, export_ui.Ui_Dialog):
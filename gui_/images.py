@@ -0,0 +1,41 @@
+"""
+Images of the gui.
+They are read from the image files beside the modules the first time they are
+needed and kept for later uses, instead of being embedded in resource modules
+whose bytes are all parsed and held in memory when they are imported.
+"""
+from functools import lru_cache
+from os.path import join
+
+from qtpy.QtGui import (QIcon, QPixmap)
+
+from . import GUI_DIR
+
+
+# name: path of the image file relative to GUI_DIR
+IMAGES = {
+    "icon": "icon.png",
+    "logo": "logo.png",
+    "watermark": "watermark.png",
+    "new_file": join("ui", "new_file.ico"),
+    "rect3364": join("ui", "rect3364.png"),
+}
+
+
+def image_path(name):
+    try:
+        return join(GUI_DIR, IMAGES[name])
+    except KeyError:
+        raise ValueError("No image called {}".format(name))
+
+
+@lru_cache(maxsize=None)
+def pixmap(name):
+    """Returns the QPixmap of an image of IMAGES, loaded on the first call"""
+    return QPixmap(image_path(name))
+
+
+@lru_cache(maxsize=None)
+def icon(name):
+    """Returns the QIcon of an image of IMAGES, loaded on the first call"""
+    return QIcon(image_path(name))
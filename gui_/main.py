@@ -1,39 +1,19 @@
+from collections import OrderedDict
 import sys
 
 from qtpy.QtCore import (SIGNAL, QSize, QRect)
-from qtpy.QtGui import QKeySequence, QIcon
-from qtpy.QtWidgets import (QAction, QApplication, QDesktopWidget, QTextBrowser, QMainWindow, QFileDialog)
+from qtpy.QtGui import QKeySequence
+from qtpy.QtWidgets import (QAction, QApplication, QDesktopWidget, QTextBrowser, QMainWindow, QFileDialog,
+                            QProgressBar, QMessageBox)
 import qtawesome as qta
 
 from .dialogs import AboutDialog, ExportDialog
-from .wizard import (text_to_enum, ProjectWizard, name_to_formula)
-from rpm import (ZERO_LENGTH, DimensionalityError, unit_reg, Q_)
-from rpm.rpm_oop import (RoomAndPillar, Sample, Pillar, StrengthFormula, ALL_FORMULA)
-from rpm.constants import (Countries, OreTypes)
-
-
-UNICODE_UNITS = {
-    "°": "degree",
-    "kg/m³": "kilogram per metre ** 3",
-}
-
-
-def quantity_from_spin(spin_widget):
-    magnitude = spin_widget.value()
-    unit = spin_widget.suffix().strip()
-    # pint does not support unicode units
-    unit = UNICODE_UNITS.get(unit, None) or unit
-    try:
-        unit = unit_reg(unit)
-    # AttributeError for when unit is None or NoneType
-    except (DimensionalityError, AttributeError) as e:
-        # print(e)
-        unit = None
-    quantity = Q_(magnitude)
-    if unit:
-        quantity *= unit
-    # print(quantity)
-    return quantity
+from .images import icon
+from .sensitivity import SensitivityDialog
+from .wizard import ProjectWizard
+from .workers import (design_worker, sensitivity_worker)
+from rpm.project import (Project, save_project, load_project)
+from rpm.sensitivity import default_ranges
 
 
 class MineRapper(QMainWindow):
@@ -43,7 +23,7 @@ class MineRapper(QMainWindow):
         self.setMinimumSize(QSize(400, 300))
         self.setGeometry(QRect(100, 100, 800, 600))
         self.setWindowTitle(QApplication.applicationName())
-        self.setWindowIcon(QIcon("gui_/icon.png"))
+        self.setWindowIcon(icon("icon"))
 
         # Children
         self.wiz = ProjectWizard(self)
@@ -51,10 +31,19 @@ class MineRapper(QMainWindow):
         self.create_toolbars()
         self.htmlview = QTextBrowser(self)
         self.setCentralWidget(self.htmlview)
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.hide()
+        self.status_bar.addPermanentWidget(self.progress_bar)
 
         self.rpm = None
+        # the Worker computing in the background, if any
+        self.worker = None
         # set to True when any data is modified
         self.dirty = False
+        # file the project was last saved to or opened from
+        self.project_path = None
+        self.sweeps = OrderedDict()
         self.bindings()
         self.center_on_screen()
         self.update_interface()
@@ -64,6 +53,11 @@ class MineRapper(QMainWindow):
         """Does the system has any data to work with"""
         return self.rpm is not None
 
+    @property
+    def is_busy(self):
+        """Is a worker computing in the background"""
+        return self.worker is not None and self.worker.isRunning()
+
     def bindings(self):
         self.connect(self.wiz, SIGNAL("finished(int)"), self.get_wiz_data)
 
@@ -104,86 +98,136 @@ class MineRapper(QMainWindow):
                                         slot=self.new_project)
         self.info_action = self.create_action("&About", icon="fa.info-circle", shortcut="Shift + A", tip="About Mine RAPPa",
                                          slot=self.about, icn_options={"color": "black"})
+        self.open_action = self.create_action("&Open", icon="fa.folder-open", shortcut=QKeySequence.Open,
+                                              tip="Open RAP Project", slot=self.open_project,
+                                              icn_options={"color": "black"})
         self.save_action = self.create_action("&Save", icon="fa.save", shortcut=QKeySequence.Save, tip="Save RAP Project",
                                          slot=self.save, icn_options={"color": "black"})
         self.graph_action = self.create_action("&Sensitivity", icon="fa.line-chart",
-                                          tip="Sensitivity Analysis for current plan", icn_options={})
+                                          tip="Sensitivity Analysis for current plan", icn_options={},
+                                          slot=self.sensitivity_analysis)
         self.export_action = self.create_action("&Export Results", icon="fa.file-pdf-o", tip="Export results",
                                            slot=self.export, icn_options={})
         self.config_action = self.create_action("&Settings", icon="fa.cog", tip="Change settings", icn_options={})
-        all_tools.addActions([self.new_action, self.save_action])
+        self.cancel_action = self.create_action("&Cancel", icon="fa.stop-circle", shortcut=QKeySequence.Cancel,
+                                                tip="Stop the running computation", slot=self.cancel_work,
+                                                icn_options={"color": "black"})
+        all_tools.addActions([self.new_action, self.open_action, self.save_action])
         all_tools.addSeparator()
-        all_tools.addActions([self.export_action, self.graph_action])
+        all_tools.addActions([self.export_action, self.graph_action, self.cancel_action])
         all_tools.addSeparator()
         all_tools.addActions([self.config_action, self.info_action])
 
     def update_interface(self):
         has_data = self.has_data
+        busy = self.is_busy
         data_dependent_ui = [self.save_action, self.graph_action, self.export_action, self.graph_action]
         for component in data_dependent_ui:
-            component.setEnabled(has_data)
+            component.setEnabled(has_data and not busy)
+        self.new_action.setEnabled(not busy)
+        self.open_action.setEnabled(not busy)
+        self.cancel_action.setEnabled(busy)
+
+    # ------------------ BACKGROUND WORK ------------------------#
+
+    def start_worker(self, worker, result_slot, finished_slot=None, message=None):
+        """
+        Runs a Worker, see gui_.workers. Its progress is shown in the status bar.
+        :param result_slot: called in the gui thread with the index and the result of every job
+        :param finished_slot: called in the gui thread once the worker stops, unless it was cancelled
+        """
+        if self.is_busy:
+            self.worker.cancel()
+            self.worker.wait()
+        self.worker = worker
+        self.connect(worker, SIGNAL("result(int, PyObject)"), result_slot)
+        self.connect(worker, SIGNAL("progress(int, int)"), self.show_progress)
+        self.connect(worker, SIGNAL("error(int, QString)"), self.show_error)
+        self.connect(worker, SIGNAL("finished()"), lambda: self.work_finished(worker, finished_slot))
+        if message:
+            self.status_bar.showMessage(message)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        worker.start()
+        self.update_interface()
+
+    def show_progress(self, done, total):
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+
+    def show_error(self, index, message):
+        self.htmlview.append("<p><b>Error:</b> {}</p>".format(message))
+
+    def cancel_work(self):
+        if self.is_busy:
+            self.worker.cancel()
+            self.status_bar.showMessage("Cancelling...")
+
+    def work_finished(self, worker, finished_slot=None):
+        if worker is not self.worker:
+            return
+        self.progress_bar.hide()
+        if worker.is_cancelled:
+            self.status_bar.showMessage("Cancelled", 3000)
+        else:
+            self.status_bar.clearMessage()
+            if finished_slot:
+                finished_slot()
+        self.update_interface()
 
     def new_project(self):
         self.wiz.exec_()
 
     def get_wiz_data(self):
-        rpm = RoomAndPillar()
-        rpm.project_name = self.wiz.projectNameLineEdit.text()
-        str_loc = self.wiz.locationCombo.currentText()
-        str_ore_type = self.wiz.oreTypeCombo.currentText()
-        rpm.location = text_to_enum(Countries, str_loc)
-        rpm.ore_type = text_to_enum(OreTypes, str_ore_type)
-
-        rpm.room_span = quantity_from_spin(self.wiz.roomWidthSpin)
-        rpm.min_extraction = self.wiz.minExtractionSpin.value()
-
-        rpm.fragment_method = RoomAndPillar.DRILL_BLAST if self.wiz.drillBlastRadio.isChecked() \
-            else RoomAndPillar.CONTINUOUS_MINER
-
-        rpm.design_type = RoomAndPillar.REDESIGN if self.wiz.redesignRadio.isChecked() else RoomAndPillar.INITIAL
-
-        # Page 2 Data
-        sample_height = quantity_from_spin(self.wiz.sampleHeightSpin)
-        sample_diameter = quantity_from_spin(self.wiz.sampleDiameterSpin)
-        sample_strength = quantity_from_spin(self.wiz.uniaxStrengthSpin)
-        is_cylinder = self.wiz.cylindricalSampleRadio.isChecked()
-
-        rpm.friction_angle = quantity_from_spin(self.wiz.frictionAngleSpin)
-        rpm.cohesion = quantity_from_spin(self.wiz.cohesionSpin)
-        rpm.rmr = self.wiz.rmrSpin.value()
-
-        rpm.seam_height = quantity_from_spin(self.wiz.seamHeightSpin)
-        rpm.seam_dip = quantity_from_spin(self.wiz.seamDipSpin)
-        rpm.mine_depth = quantity_from_spin(self.wiz.oreDepthSpin)
-
-        overburden_density = self.wiz.overburdenDensitySpin.value()
-        rpm.overburden_density = Q_("{}kilonewtons per metre ** 3".format(overburden_density))
-        floor_density = self.wiz.floorDensitySpin.value()
-        rpm.floor_density = Q_("{}kilonewtons per metre ** 3".format(floor_density))
-
-        sample = Sample(sample_strength, sample_height, sample_diameter, is_cylinder)
-        pillar_length = ZERO_LENGTH
-        rpm.pillar = Pillar(sample, rpm.seam_height, pillar_length)
-
-        if rpm.design_type == RoomAndPillar.REDESIGN:
-            formula = name_to_formula(self.wiz.pillarFormulaCombo.currentText())
-            formula.alpha = self.wiz.constantASpin.value()
-            formula.beta = self.wiz.constantBSpin.value()
-            if formula.k_type == StrengthFormula.OTHER:
-                formula.k = self.wiz.constantKSpin.value()
-            rpm.formula = formula
-
+        case = self.wiz.case()
+        self.htmlview.clear()
+        self.project_path = None
+        self.sweeps = OrderedDict()
+        self.start_worker(design_worker([case], self), self.show_design, message="Designing...")
+
+    def show_design(self, index, rpm):
+        """Shows every design as it arrives from the design worker"""
         self.rpm = rpm
+        self.dirty = True
+        if index == 0:
+            self.htmlview.setText(rpm.html_report)
+        else:
+            self.htmlview.append(rpm.html_report)
         self.update_interface()
-        self.rpm.formula_decide()
-        self.rpm.pillar_width_from_fos_and_stress()
-        self.rpm.to_html_with_header()
-        self.htmlview.setText(self.rpm.html_report)
 
     def save(self):
-        if not self.dirty:
+        if not self.dirty and self.project_path is not None:
+            return
+        if self.project_path is None:
+            file_name, ext = QFileDialog.getSaveFileName(parent=self, caption="Save RAP Project",
+                                                         filter="RAP Projects (*.rap)")
+            if not file_name:
+                return
+            self.project_path = file_name
+        project = Project(self.rpm.project_name, [self.rpm], self.sweeps)
+        save_project(self.project_path, project)
+        self.dirty = False
+        self.status_bar.showMessage("Saved {}".format(self.project_path), 3000)
+
+    def open_project(self):
+        file_name, ext = QFileDialog.getOpenFileName(parent=self, caption="Open RAP Project",
+                                                     filter="RAP Projects (*.rap)")
+        if not file_name:
+            return
+        try:
+            project = load_project(file_name)
+        except (IOError, ValueError) as e:
+            QMessageBox.warning(self, "Open RAP Project", "Could not open {}\n{}".format(file_name, e))
             return
-        pass
+        self.project_path = file_name
+        self.sweeps = project.sweeps
+        self.rpm = project.designs[0] if project.designs else None
+        self.htmlview.clear()
+        if self.rpm is not None:
+            self.rpm.to_html_with_header()
+            self.htmlview.setText(self.rpm.html_report)
+        self.dirty = False
+        self.update_interface()
 
     def export(self, ext=None):
         file_name, ext = QFileDialog.getSaveFileName(parent=self, caption="Export Results to Html",
@@ -194,6 +238,23 @@ class MineRapper(QMainWindow):
         # dialog = ExportDialog(self)
         # dialog.exec_()
 
+    def sensitivity_analysis(self):
+        ranges = default_ranges(self.rpm)
+        self.sweeps = OrderedDict()
+        self.start_worker(sensitivity_worker(self.rpm, ranges, self), self.add_sweep, self.show_sensitivity,
+                          message="Running sensitivity analysis...")
+
+    def add_sweep(self, index, result):
+        parameter, sweep = result
+        self.sweeps[parameter] = sweep
+        self.dirty = True
+
+    def show_sensitivity(self):
+        if not self.sweeps:
+            return
+        dialog = SensitivityDialog(self.sweeps, self)
+        dialog.exec_()
+
     def about(self):
         about_dlg = AboutDialog(self)
         about_dlg.show()
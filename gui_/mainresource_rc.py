@@ -1,2472 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt4 (Qt v4.8.7)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt4 import QtCore
-
-qt_resource_data = "\
-\x00\x00\x1e\xfd\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x94\x00\x00\x00\xaa\x08\x06\x00\x00\x00\x4b\x4c\x66\x09\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x19\x33\x00\x00\x19\x33\
-\x01\x7d\x51\x47\x75\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x1e\x7a\x49\x44\
-\x41\x54\x78\x9c\xed\x9d\x79\x78\x15\x55\x9e\xf7\x3f\x75\xeb\xde\
-\xec\x2b\x64\xc1\xac\x40\x48\x10\x48\x02\xb2\x68\x02\xb2\xa3\x20\
-\x8b\xb8\xc1\xb8\xb5\xed\xd2\x63\x77\x0b\x38\xd8\xf3\x8c\x3a\x6d\
-\xdb\xaf\x8e\xd3\x33\x6d\x8f\xfd\xda\xd3\xda\xe3\xfb\xa0\xa3\x0f\
-\x2e\x28\x6a\x4b\xdb\xa2\x2c\x2a\x24\x44\x16\x17\x16\x49\x24\x0b\
-\x84\x90\x04\x48\x42\xc8\xbe\xe7\x2e\xf5\xfe\x71\x72\xb3\xde\x9b\
-\xdc\xa5\x12\xc0\xe7\x7c\x9e\x27\xa9\x7b\xab\xea\x9c\x3a\x75\xea\
-\x5b\xe7\xfc\xce\xef\x2c\x57\x01\x34\x24\x12\x9d\x30\x5c\xea\x04\
-\x48\x7e\x5c\x48\x41\x49\x74\xc5\x68\xff\x10\x19\x0e\x53\xc6\x43\
-\x68\x90\x7e\x91\xef\xf9\x0e\xae\x99\x08\xe1\xc1\x7d\xf7\xb7\x75\
-\x80\xd5\x0a\xcd\x6d\xd0\xda\x0e\x0d\xcd\x50\x5d\x27\xf6\x5f\x4e\
-\x04\xf8\xc1\x75\xa9\x10\x3d\x0a\x54\x55\x9f\x38\xff\x96\x05\xb3\
-\x26\x43\x6c\x54\xcf\xbe\xd6\x76\xe8\xe8\x84\xa6\x56\x68\x6c\x86\
-\x0b\x75\x50\x55\x0b\x36\x9b\x3e\xd7\x1c\x49\x8c\x00\x6b\x6f\x80\
-\xdb\x17\x81\xa2\xe8\x1b\xf9\x91\x02\xb8\x31\x03\x52\x12\x5c\x3b\
-\xbf\xae\x09\xf2\x4b\x20\xf7\x24\x1c\xca\x83\x96\x36\x7d\xd3\xe3\
-\x0e\x63\x63\xe0\xb7\xff\xa8\x10\xe4\xaf\xaf\x89\xb9\xfb\x90\x10\
-\xe9\x8c\x49\x83\x9f\x67\xb6\xc0\xd9\x0b\x90\x57\x0c\xc7\x0a\xc5\
-\x56\xeb\x97\x14\x45\x51\x18\x37\x6e\x1c\x49\x49\x49\x8c\x1f\x3f\
-\xbe\xfb\x2f\x3e\x3e\x1e\x5f\x5f\x5f\x42\x42\x42\x08\x0c\x0c\xc4\
-\xcf\xcf\x0f\x9b\xcd\x46\x5b\x5b\x1b\xed\xed\xed\xd4\xd5\xd5\xd1\
-\xd6\xd6\x46\x75\x75\x35\x05\x05\x05\x14\x14\x14\x90\x9f\x9f\x4f\
-\x61\x61\x21\x8d\x8d\x8d\x5e\xdd\x9f\x31\x32\x1c\xee\x58\x0c\x66\
-\x2d\x98\x6a\xf3\x62\xcc\x5a\x88\x57\x11\x02\x8c\x31\xed\xc6\x57\
-\xa9\xec\xb3\xef\x9c\xf9\x16\x2c\xdd\x71\x6b\xa8\xb4\xa3\x2a\x5d\
-\x7f\x34\xe3\xa3\xd4\x11\x18\x58\xc9\xec\xf4\x7a\x66\xa7\xc3\x03\
-\x37\xc3\xc1\xe3\xf0\xe1\x1e\xa8\xaa\x71\xed\xba\xeb\xd6\xad\x23\
-\x3d\x3d\xdd\xed\xf4\x5a\x2c\x16\x36\x6c\xd8\x80\xad\x57\x91\x70\
-\xeb\x02\x08\xf2\xd7\xb8\x68\x99\x4b\x93\x6d\x22\x9a\xe6\x9d\x75\
-\x10\xeb\xf3\x31\xbe\x4a\x55\x9f\x7d\xe7\xcc\xb7\xd1\x61\x8b\x40\
-\x55\x3a\x30\xd0\x81\xaa\xb4\x62\x54\x44\x5e\xf8\xaa\xd5\x24\xc6\
-\x54\x31\x2e\xc6\xcc\xaa\xb9\x70\xa1\x56\xe1\x48\x71\x34\x3e\x11\
-\x2b\x98\x3a\x6d\x26\xe9\xe9\xe9\xa4\xa5\xa5\x11\x1c\x1c\xec\xe4\
-\x8a\x03\x09\x0f\x0f\x1f\xf4\xb8\xcd\x66\xe3\xf0\xe1\xc3\xec\xdc\
-\xb9\x93\x77\xde\x79\x87\xc2\xc2\x42\xb7\xef\xd3\x18\xd6\x55\xc5\
-\x99\xb5\x70\xea\xad\x53\x01\xef\x8b\x29\x8b\xe6\x87\x6f\xbf\x68\
-\xda\x6c\xf1\x74\x6a\xa3\x87\x0c\x6b\x52\xea\x08\x31\xe4\x13\xa6\
-\x1e\x66\xfe\x8c\x1a\xe6\x4c\x83\x1d\xfb\x61\xeb\xe7\xd0\x69\x76\
-\x1e\xce\x60\x30\xf0\xdb\xdf\xfe\x96\xa8\xa8\x28\xe7\x27\x0d\xc2\
-\xab\xaf\xbe\xca\xb1\x63\xc7\xba\xbf\x07\xf8\x8b\x6d\xab\x2d\x81\
-\x36\x5b\x9c\x47\x71\xf6\xc6\xa6\x99\x06\x64\x6d\xa7\x16\x41\xbb\
-\x16\xe3\xb4\x9d\xad\x60\x21\xc0\x50\x46\xa8\x9a\x4b\xe4\xa8\x5c\
-\x96\x8d\xaa\x24\x28\x3c\x9b\x6b\x6e\x58\xc3\x98\x71\xb3\xbd\x4e\
-\x53\x7f\x0c\x06\x03\xb3\x66\xcd\x62\xd6\xac\x59\x3c\xfd\xf4\xd3\
-\xec\xdd\xbb\x97\xe7\x9e\x7b\x8e\xbd\x7b\xf7\xba\x1e\xc7\xe9\xf3\
-\xa2\x68\x0d\x30\x94\x91\xec\xfb\xdf\x44\x9b\xbe\x40\xa5\x45\xf7\
-\xc4\x06\x1a\x8a\x31\x30\x88\x22\xba\x30\x6b\xe1\xd4\x58\x67\x53\
-\xdc\xb9\x9e\x73\xe6\xdb\xd1\x0c\xa1\xac\x9a\x07\xff\xb9\x5e\xd8\
-\x79\xce\x98\x3e\x7d\xba\xc7\x62\x02\x58\xbc\x78\x71\x9f\xef\x5f\
-\x7e\x23\xaa\x98\x78\xd3\x3b\x8c\xf3\xfd\x5f\x42\x0c\xb9\x1e\xc7\
-\xed\x8c\x48\x63\x16\x41\x06\xe7\xa5\x80\x86\x91\x16\xdb\x78\xce\
-\x9b\x57\x53\xd4\xfe\x18\x75\xd6\x59\x34\xd7\x15\x93\xf3\xfe\x4d\
-\xfc\xf0\xd5\x33\x0c\xb7\xc7\x67\xe1\xc2\x85\xec\xd9\xb3\x87\x2d\
-\x5b\xb6\x30\x6a\xd4\x28\x97\xc2\xa8\x9a\xc6\x33\x87\x72\x85\x01\
-\x1a\x17\xd9\x41\x88\xa9\x8c\x50\xf5\x04\xf5\xd6\x19\x68\x78\x66\
-\x89\x86\xa9\xc7\xf0\x51\xea\xd9\x7d\x48\xd8\x4f\x31\x91\x10\xac\
-\x9e\x24\x5c\xfd\x06\x1b\xfe\xe2\xad\x1c\x12\x85\x0e\x2d\x9a\x7a\
-\xeb\x74\x4c\x4a\x23\x51\xc1\x55\x64\xa6\xc3\x37\x3f\x38\xb6\xad\
-\xd6\xae\x5d\xcb\xb2\x65\xcb\x3c\x4a\x2f\x88\x6a\x6f\xcb\x96\x2d\
-\xdd\xdf\xcf\x5e\x80\x93\xe5\x10\x16\x0c\x31\xe1\x8d\x84\x1a\xf3\
-\xe9\xd4\xc2\xe9\xd0\xc6\x78\x14\x7f\xb8\x7a\x04\x93\xd2\xc8\x67\
-\xfb\x61\x74\x28\xc4\x45\x43\xb0\x4f\x0d\xa1\x6a\x1e\x7e\x4a\x25\
-\xcd\xb6\x89\x83\xe6\xb7\x86\x0f\xcd\xb6\x14\x5a\x6c\x49\x04\xa9\
-\x27\xa9\x29\xdf\x4d\x5b\xd3\x59\x62\x92\x57\xa1\x47\xad\x32\x18\
-\x69\x69\x69\xdc\x76\xdb\x6d\xec\xdc\xb9\x93\xda\xda\xda\x41\xcf\
-\x55\x81\x67\x3a\x3a\xe1\x70\x3e\x7c\xfa\x15\xc4\x46\x42\x62\x74\
-\x3b\xed\xb6\x28\x3a\xb4\x68\x8f\x12\xd0\x5b\x50\x3b\x0e\xc0\xd7\
-\x79\xd0\xd4\x02\xe3\x63\x6d\x84\xfb\x14\x61\xd5\xfc\x69\xd3\x5c\
-\xab\x46\x34\x8c\x34\xd9\xae\x46\x55\x3a\x19\xe5\x7f\x96\xb4\x09\
-\xb0\xf7\xbb\x81\x2d\xa0\xb0\xb0\x30\xee\xbd\xf7\x5e\x8f\xd2\x0b\
-\x30\x66\xcc\x18\x5e\x78\xe1\x85\x3e\x76\x54\x55\x0d\xec\x3b\x0a\
-\xb9\xa7\x60\xd1\x2c\x50\x95\x0e\x1a\xac\xd3\x3c\x8a\xbf\xb7\xa0\
-\xbe\xce\x83\xbf\x67\x8b\x97\x23\xf1\x2a\x88\x09\xbf\x88\x49\x69\
-\xa0\xc9\x36\x84\xa5\x0e\x98\xb5\x50\x1a\x2c\xa9\x04\xab\x45\x34\
-\x5d\xd8\x8f\xa6\x59\x89\x4a\x5c\xe4\x51\x9a\xdc\x61\xf4\xe8\xd1\
-\xac\x5e\xbd\x9a\x0f\x3e\xf8\x80\xa6\xa6\x26\xa7\xe7\xf5\xb1\x34\
-\xcd\x16\xf1\x56\x02\x98\x94\x06\xdd\x12\x53\x56\x29\x6c\xa0\xdf\
-\xfc\x8f\x86\xd9\x02\x91\xc6\x3d\x2e\x55\x7f\x3d\x28\x54\x9a\x6f\
-\xa4\xc9\x9a\x42\x7c\x34\xdc\xe6\x20\xff\xbe\xfa\xea\x2b\x2c\x16\
-\x8b\xc7\x69\x0c\x0e\x0e\x66\xd6\xac\x59\x0e\x8f\x9d\xbd\x20\xb6\
-\x46\xc5\x79\x46\x7a\x42\x69\x05\xfc\xfb\x6b\x50\xd3\x00\xa1\x6a\
-\x2e\x46\xa5\xd9\xa5\x70\x16\x42\x28\xeb\xbc\x17\x8b\x16\x48\xc1\
-\xc1\xff\xa0\xe6\xdc\x01\x5d\xd3\xe5\x8c\x84\x84\x04\xb6\x6e\xdd\
-\x8a\x3a\x88\x0f\x65\x40\xd3\xc5\xfe\x82\x2a\x8a\xfe\x4e\x90\xf2\
-\x2a\x38\x71\x5a\xbc\xe9\x3e\xca\x05\x37\x43\x2b\x54\x5a\x56\xa2\
-\x61\x64\xf9\x1c\x08\xf4\xef\x7b\xb4\xb9\xb9\x99\x23\x47\x8e\x78\
-\x95\xbe\x45\x8b\x1c\xbf\xe9\xdd\x79\x32\x0c\x36\x4b\x87\x19\x0a\
-\xce\x00\x68\xf8\xba\x91\x27\x9d\x5a\x38\x95\x96\xe5\x68\x9a\x8d\
-\xc3\xbb\x7e\x8e\xa6\x8d\x8c\xd3\x6a\xce\x9c\x39\xdc\x7f\xff\xfd\
-\x4e\x8f\x8f\xb8\xa7\xbc\xb2\xcb\x05\xe0\x63\xa8\x77\x3b\xac\x59\
-\x0b\xa1\xd1\x9a\x8a\xbf\x2f\x5c\x3b\x65\xe0\xf1\xec\xec\x6c\xaf\
-\xd2\xe6\x4c\x50\xc3\x4d\x73\xab\xd8\x1a\x68\x77\x2b\x5c\xa3\x75\
-\x0a\xad\xb6\x44\x1a\xaa\xf3\xa8\x3a\xf3\xf9\x30\xa4\xcc\x31\x4f\
-\x3d\xf5\x94\xd3\x52\x6a\xc4\x05\x65\xf7\x86\xab\x78\xe6\x16\x6f\
-\xb4\x5d\x0d\x40\x7a\xb2\xf8\xee\xe3\xe3\xd3\x7d\x2c\x2b\x2b\xcb\
-\x9b\xa4\x91\x99\x99\x89\xbf\xbf\xff\xd0\x27\xea\x8c\xc5\x2a\xb6\
-\x06\x0f\x6a\x85\x5a\xcb\xb5\x00\x94\x7c\xff\x5a\xf7\xbe\x8a\x8a\
-\x0a\x4e\x9d\x3a\x45\x5e\x5e\x1e\xa7\x4f\x9f\xe6\xdc\xb9\x73\x5e\
-\x99\x03\xfd\x19\x37\x6e\x1c\x0b\x16\x2c\x70\x78\xec\x8a\xeb\xcb\
-\x6b\xb7\x89\x56\x56\x5c\x97\x87\x60\xf5\xea\xd5\x8c\x1d\x3b\x16\
-\x10\x76\x94\xd5\x6a\xf5\x38\x6e\x3f\x3f\x3f\x66\xcf\xd6\xdf\xbf\
-\x33\x9c\x34\xd9\x52\xd0\x50\x29\x2d\xf8\x8c\xeb\xaf\x9f\x43\x50\
-\x50\x10\x31\x31\x31\x24\x27\x27\x93\x96\x96\x46\x52\x52\x12\x71\
-\x71\x71\xf8\xf9\xf9\x91\x90\x90\xc0\xaa\x55\xab\xf8\xc3\x1f\xfe\
-\x40\x49\x49\x89\x57\xd7\x5d\xbd\x7a\xb5\xc3\xfd\x57\x9c\xa0\x2c\
-\x9a\xf0\x0c\x87\x04\x8a\xef\x2b\x57\xae\xec\xae\xaa\x1a\x1b\x1b\
-\xfb\x38\x27\x3d\xe1\x52\x55\x7b\x9e\xa2\x61\xa2\x43\x1b\x83\xaa\
-\xb4\x52\x5c\x70\x80\x96\x16\xc7\x3e\x44\xab\xd5\x4a\x79\x79\x39\
-\xdb\xb7\x6f\xe7\x89\x27\x9e\x60\xc2\x84\x09\xac\x59\xb3\x86\xaa\
-\xaa\x2a\x87\xe7\x0f\xc5\xdc\xb9\x73\x1d\xee\xbf\xe2\x04\xd5\xdb\
-\x99\xa7\xaa\x2a\xcb\x97\x2f\xe7\x86\x1b\x6e\xe8\xde\xe7\x6d\xb5\
-\x77\xa5\x09\x0a\x84\x81\x0e\xc2\xbf\xe5\x2a\x36\x9b\x8d\x0f\x3f\
-\xfc\x90\x8c\x8c\x0c\x6a\x6a\x5c\xec\xdb\xea\xc5\xc4\x89\x13\x51\
-\x1c\x74\xfe\x5e\x71\x82\xb2\x37\xad\xeb\x9a\x20\x23\x23\x83\x88\
-\x88\x08\x96\x2c\x59\x82\xc1\x20\x6e\xc5\x5b\xc3\x7c\xe6\xcc\x99\
-\x84\x84\x78\xdf\x9f\x39\x92\x58\x6c\xc2\xee\x0b\x0a\x70\x3f\xec\
-\x99\x33\x67\x78\xea\xa9\xa7\xdc\x0e\xe7\xef\xef\x4f\x74\xf4\x40\
-\x3f\xe5\x15\x27\x28\x1f\x45\xbc\x4d\x35\x0d\xb0\x6a\xd5\x2a\x00\
-\x22\x22\x22\x98\x3a\x75\x2a\x00\xfb\xf6\xed\xf3\xca\x8e\x32\x1a\
-\x8d\xcc\x9b\x37\xcf\xfb\x84\x8e\x20\x8e\x4a\x0a\x77\x78\xef\xbd\
-\xf7\x3c\x32\xda\x43\x43\x07\x16\x89\x57\x9c\xa0\x82\x0d\x45\x00\
-\x1c\x3f\xd9\x23\x28\xa0\xbb\xda\x6b\x68\x68\xe0\xf8\xf1\xe3\x5e\
-\x5d\xe3\x4a\xab\xf6\x0c\x88\xbe\x28\x4f\x87\xfb\x34\x34\x34\x78\
-\x64\x4b\x39\x6a\x11\x1b\x1d\x9c\x77\xd9\x62\xa0\x83\x10\x35\x0f\
-\x4d\x83\x0b\xcd\xf1\x4c\x9e\x3c\xb9\xfb\x58\x6f\x2f\x77\x56\x56\
-\x16\xd7\x5c\x73\x8d\xc7\xd7\xe9\xdf\x51\x7c\xb9\x63\x54\x84\x21\
-\xde\xd4\xea\xda\xf9\x11\x11\x11\x44\x44\x44\x30\x7a\xf4\xe8\xee\
-\xcf\x76\x93\xc1\x1d\x1c\x85\x19\x71\x41\xd9\x4b\x67\x4f\x7c\xce\
-\x11\xc6\x7d\x18\x95\x16\xf6\x7e\x07\xf3\x16\xdd\xd6\xe7\xd8\xc1\
-\x83\x07\xbb\x3f\x67\x67\x67\xf3\xd8\x63\x8f\x79\x9c\xc6\xb4\xb4\
-\x34\xa2\xa3\xa3\x3d\x6e\x01\x8d\x2c\x1a\xbe\x4a\x05\x16\x2b\x9c\
-\xaf\x16\x7b\xa2\xa3\xa3\x49\x4d\x4d\x25\x29\x29\x89\x84\x84\x04\
-\x12\x12\x12\x18\x3b\x76\x2c\x09\x09\x09\xc4\xc6\xc6\x62\x34\x0e\
-\xdf\x63\x1f\x71\x41\xf9\x74\x5d\x51\xc3\xe4\x56\xb8\x10\xf5\x04\
-\x11\xc6\x03\xb4\xb6\xc3\x7b\xbb\xe0\xfd\x8f\x56\xf6\x39\xbe\x7d\
-\xfb\xf6\xee\xcf\x39\x39\x39\xd8\x6c\x36\x8f\xde\x3a\x10\x36\xc9\
-\xfc\xf9\xf3\x79\xff\xfd\xf7\x3d\x0a\x3f\x92\xf8\x2a\xd5\x18\x95\
-\x36\x5a\xb4\x31\xfc\xf5\xa3\x4d\x64\x66\x66\x12\x11\x11\x71\xc9\
-\xd2\x33\xe2\x36\x54\x74\xd7\x18\x3b\xb3\xe6\xfa\x48\xc3\x50\x35\
-\x8f\x58\xd3\x47\x58\xac\x1a\x2f\xbc\x05\x56\x25\xa4\x8f\xe1\x5c\
-\x58\x58\x48\x51\x51\x51\xf7\xf7\xda\xda\x5a\x72\x73\xbd\x1b\xbf\
-\xb4\x70\xe1\x42\xaf\xc2\xbb\x83\x5d\xf7\x9a\xe6\xbe\x71\x1d\xaa\
-\x7e\x0f\xc0\x75\x8b\xd6\xb3\x6a\xd5\xaa\x4b\x2a\x26\x18\x61\x41\
-\x5d\x3d\x16\xa6\x26\x83\x45\xf3\xa7\xcd\x16\x3b\xe4\xf9\x46\x1a\
-\x89\x31\x7d\x4c\xac\xe9\x43\xcc\x66\x0b\x2f\xbd\x27\xc6\x56\x2f\
-\x5d\xba\xb4\x4f\x97\xcb\x27\x9f\x7c\x32\x20\xac\xb7\xee\x83\x91\
-\xb4\xa3\xec\x4e\x5a\x2b\x81\x6e\x85\x33\xd0\x4e\xb8\xf1\x18\x8a\
-\xc1\xc8\xd8\xd4\xfb\xf5\x4f\x98\x07\x0c\x7b\x95\x97\x36\x01\x52\
-\x93\x20\x29\x4e\x7c\x06\x38\x6f\x59\x36\x48\x95\xa7\x11\x68\x28\
-\x25\x54\xfd\x9e\x10\x43\x2e\x06\xc5\xc2\xb9\x0b\xf0\xa7\x77\xc5\
-\x70\x0f\xe8\xdb\xba\x03\xe7\x82\x7a\xf4\xd1\x47\x3d\x4e\x77\x72\
-\x72\x32\x89\x89\x89\x94\x96\x96\x7a\x1c\x87\xab\xc4\x44\x8a\x6d\
-\xa7\x9b\xe3\xf9\xa3\x8c\x7b\x50\x69\x61\x5c\xfa\xc3\xf8\x07\x0f\
-\xfd\x82\x8e\x04\xc3\x2e\xa8\x5b\x17\x0a\x41\x81\x42\xab\x2d\x9e\
-\x6a\xcb\x02\x5a\x6c\xe3\xfb\x9c\x63\xa0\x83\x40\x43\x31\xc1\xea\
-\x29\x02\x0d\x45\x98\xba\x9c\x97\x55\x35\x62\xda\x51\xd6\x61\xb0\
-\x76\xf5\x9b\xaa\xaa\xca\x4d\x37\xdd\xd4\x1d\xb6\xae\xae\x8e\x03\
-\x07\x06\x8e\x07\xca\xca\xca\xf2\xca\x8e\x02\x58\xb0\x60\x01\x9b\
-\x37\x6f\xf6\x38\xbc\x2b\x8c\x8d\x81\x71\x31\xd0\xa1\x45\x61\xd6\
-\x5c\x1b\x66\x0b\x10\xaa\x1e\x67\x94\xf1\x5b\x7c\x03\xa2\x48\x9b\
-\xff\xfb\x61\x4c\xa1\x7b\x8c\x98\x51\x5e\xd2\xf1\x90\xd3\x51\x9a\
-\xe1\xea\xd7\x44\x9b\xf6\x74\x7f\x6f\x6d\x87\xf7\x76\x8b\x29\x47\
-\xfd\x47\x66\xf6\x37\x3a\x77\xec\xd8\xe1\xd0\x29\x57\x5b\x5b\xcb\
-\x89\x13\x27\x48\x4d\x4d\xf5\x38\xcd\x8b\x16\x2d\x1a\x36\x41\x05\
-\xfa\xc3\xb4\x14\xb8\xbb\x6b\xd4\x72\x8d\xe5\x3a\x97\xc3\x0a\x9b\
-\xf2\x63\x54\xa3\x2f\x99\xb7\x7c\x80\x8f\xdf\xe0\xb3\x59\x46\x92\
-\x11\x13\x94\xa6\x98\x9c\xfa\x0a\x3a\xb4\x18\xda\xb5\x58\x4c\x54\
-\xa3\x2a\x9d\x04\xf8\xc1\x83\x37\xc3\x1d\x8b\x15\xb2\x8f\x68\x7c\
-\xf1\x35\x54\x5c\x14\xe7\xba\x52\xdd\xd9\xc9\xca\xca\xf2\x4a\x50\
-\x4b\x96\x2c\xf1\x38\xec\x60\x3c\x70\x33\x2c\xcb\x14\x2e\x14\x4d\
-\x83\x8b\x96\x39\xd4\x5b\x67\x0c\x19\x4e\xc1\x4c\x94\x71\x2f\xa3\
-\x8d\x07\x51\x8d\x7e\x64\xac\xde\x4a\x64\xbc\xf7\x5e\x7d\xb3\xd9\
-\x8c\xaa\xaa\x5e\x95\xe6\x76\x46\x4c\x50\xe1\xea\x61\xea\xb5\x74\
-\x87\xa5\x54\xb3\x6d\x02\xcd\x1d\xc2\xc0\x32\x29\xf5\x04\x18\xca\
-\x09\x30\x9c\x21\x38\x20\x9f\x55\x73\x5b\x59\x3e\x47\xcc\x42\xd9\
-\xb2\x53\x8c\x2e\xb0\x63\xb1\x58\xd8\xb5\x6b\x97\xd3\x6b\x66\x67\
-\x67\xb3\x7e\xfd\x7a\x8f\xd3\x1c\x13\x13\x43\x4a\x4a\x0a\xe5\xa5\
-\x45\x43\x9f\xec\x06\x61\xc1\x42\x4c\x75\xd6\x99\xd4\x58\x32\xe8\
-\xd4\x06\x6f\x99\x29\x58\x09\x51\xf3\x88\x32\xee\x15\xf9\x13\x12\
-\xcf\xec\x5b\xb7\x11\x3e\x66\x68\x11\x02\x68\x9a\x46\x59\x59\x19\
-\x05\x05\x05\x14\x15\x15\x51\x5a\x5a\x4a\x79\x79\x39\xe5\xe5\xe5\
-\x94\x96\x96\x52\x59\x59\x49\x49\x49\x09\x09\x09\x2e\xce\xc8\x1d\
-\x84\x61\x17\x54\x53\xd7\x68\x8a\x70\xf5\x1b\xc2\xd5\x6f\xa8\xb7\
-\x4e\xe7\xbc\x79\x05\x38\x99\xe1\x61\xd6\xc2\x68\xb0\x86\xd1\x60\
-\x4d\xa3\x82\xe5\x84\xaa\xf9\x44\x1a\xf7\x70\x63\x46\x2d\xd3\xae\
-\x36\x11\x3f\xa6\x27\xc9\x39\x39\x39\xd4\xd5\xd5\x39\xbd\x76\x76\
-\x76\x36\x9a\xa6\x79\xd5\xd7\xb5\x68\xd1\x22\x36\xbf\xa1\xaf\xa0\
-\xec\x34\x58\xd3\x9c\x8a\x49\xa1\x93\x00\x43\x39\x41\x86\x62\xc2\
-\x8c\xc7\x51\x69\xc6\x60\x30\x91\x34\x7d\x23\x53\xae\xff\x3f\x98\
-\x7c\xc3\x06\x8d\xbb\xbd\xbd\x9d\xb7\xdf\x7e\x9b\xed\xdb\xb7\x93\
-\x95\x95\x45\x43\x83\x7e\x73\x04\x06\x63\xd8\x05\xf5\xe2\x16\xd8\
-\xb4\x0d\x92\xe3\xe1\xbe\x95\x10\x17\x75\x04\xb3\x16\x46\xb5\xc5\
-\x95\xa2\x5a\xa5\xc1\x9a\x4a\xa3\x75\x12\x63\x4c\x3b\x88\x0a\xfb\
-\x8e\x7d\x5b\x97\xb0\xe4\xfe\x23\xf8\xfa\x47\xf4\x71\x66\x3a\xa2\
-\xba\xba\x9a\xfc\xfc\xfc\x3e\x5d\x34\xee\x22\x04\xf5\xff\x3c\x0e\
-\x3f\x18\xc1\x6a\x11\x7e\x86\x4a\x14\xcd\x8c\xd1\xd0\x86\x4a\x2b\
-\x46\xa5\x09\x1f\x2e\xe2\x63\x68\xc0\x6e\x23\x18\x7d\x42\x19\x97\
-\xbe\x91\x09\xd3\xd7\x11\x14\x3e\x61\xc8\x78\xb7\x6d\xdb\xc6\xba\
-\x75\xeb\xa8\xa8\xa8\x18\x96\x74\x0f\xc6\x88\x54\x79\x2d\x6d\x70\
-\xac\x08\xce\xbe\x0e\xff\xf7\x57\x10\xe1\xb3\x8f\x1a\x4b\x06\x36\
-\x7c\x86\x0e\x8c\x98\xb8\x5e\x61\xee\xaa\xea\x1a\xbf\xe3\xc8\xae\
-\x5f\x90\x79\xcb\x87\x43\x0a\x0a\x84\x1d\xe5\xad\xa0\x84\x6d\xa1\
-\xff\x24\x80\xd1\xea\x7e\x87\xfb\x6b\x1a\xc0\x4c\x24\x0b\x96\x3e\
-\x48\x54\xe2\x62\x22\xe2\xae\x47\x35\xba\x36\x34\xf9\xad\xb7\xde\
-\xe2\x81\x07\x1e\xf0\x6a\xc4\x85\x37\x8c\x68\xd7\xcb\xc5\x7a\x38\
-\x5a\x00\x99\xe9\x16\x02\x0c\xa5\x34\xdb\x92\xdd\x0a\x5f\x69\x5e\
-\x46\x90\xa1\x88\x73\x45\xdb\x38\x7e\x78\x57\x1f\xef\xb8\x33\xb2\
-\xb3\xb3\x79\xe4\x91\x47\x3c\x4d\x32\xa3\x47\x8f\xee\x12\x64\x9e\
-\xc7\x71\xf4\xe7\xd3\x1c\x38\xd4\x35\x20\xa2\xd3\x22\xa6\xd8\xb7\
-\x75\x88\x55\x68\x1a\x9b\xc5\x4c\x98\xdf\xfd\x6e\x23\x69\xf3\x7f\
-\xed\x56\xbc\x8d\x8d\x8d\xac\x5b\xb7\xee\x92\x89\x09\x2e\x41\x5f\
-\x5e\x4d\x57\x55\xae\x2a\x2e\x76\x8d\xf7\x42\xc3\x48\xbd\x75\x3a\
-\x91\x4a\x16\x5f\xef\xf9\xb3\x4b\x61\xb2\xb2\xb2\xbc\xb6\xa3\xc4\
-\x80\x7c\xfd\x04\x55\x54\x36\xf4\x39\x69\x69\x69\x6e\xc7\x7b\xe8\
-\xd0\xa1\x41\x27\x61\x8e\x04\x23\x2e\x28\x6b\xf7\x1c\x37\xcf\xaa\
-\x10\xfb\x24\x85\x8a\xb2\xa3\x00\xf8\xfa\xfa\xf2\xe6\x9b\x6f\x0e\
-\x2a\x98\xce\xce\x4e\x7c\x7d\x7d\x3d\xba\x1e\xc0\xbc\x79\xf3\x68\
-\xcb\x7f\xd9\xe3\xf0\x9e\xe0\xc9\x3a\x0d\xde\x4e\x3c\xd0\x83\x11\
-\x17\x94\x7d\x8d\x23\x4f\x27\x4d\xda\xf0\x03\xa0\xb1\x5e\x2c\x17\
-\x94\x91\x91\xc1\xda\xb5\x6b\x75\x49\x9b\x33\xe6\xcc\x99\xc3\x17\
-\xf9\xc3\x7a\x89\x01\x78\x32\x0c\xd9\xdb\x91\x9b\x7a\x70\xc5\x8d\
-\xd8\xb4\xa3\x75\x29\x73\xfe\xfc\xf9\xc3\x7e\xad\xa0\x20\x1d\x97\
-\xf5\x73\x11\x4f\x86\xe4\x5e\x75\xd5\x55\xc3\x90\x12\xf7\xb8\x62\
-\x05\x65\x67\x24\x04\x75\x29\xa8\xae\xae\x76\x3b\xcc\x8c\x19\x33\
-\xfa\x8c\xc2\x70\x95\x35\x6b\xd6\x38\x9c\x70\xe0\x09\x57\xd4\x10\
-\x60\x47\x6c\xdc\xb8\xd1\xa5\x4c\xdc\xbc\x79\x33\x53\xa6\x38\x98\
-\xbf\x7e\x99\x72\xe1\x82\xbb\x6b\x3f\x08\xcf\xfe\x8b\x2f\xbe\xc8\
-\xfa\xf5\xeb\xbb\x4b\xf0\xc1\x88\x88\x88\xe0\xd9\x67\x9f\xf5\xaa\
-\x15\xdc\x9f\x2b\x5e\x50\xae\x0e\xa4\xdb\xb3\x67\xcf\x15\x25\xa8\
-\xa3\x47\x8f\x72\xe7\x9d\x77\xba\x1d\xee\x91\x47\x1e\x21\x31\x31\
-\x91\x27\x9f\x7c\x92\xbc\x3c\xc7\x2d\xd3\xb4\xb4\x34\xee\xbc\xf3\
-\x4e\xd6\xaf\x5f\xaf\xfb\x94\xb1\x4b\x66\x94\x6b\x3a\xac\x64\x12\
-\xe8\x0f\x4b\x33\x85\x17\xfe\xf4\x39\xf8\x38\xdb\xf9\xb2\x89\xfb\
-\xf6\xed\x63\xc3\x86\x0d\x5e\x5f\x73\xa4\xd8\xb5\x6b\x17\xcf\x3f\
-\xff\xbc\x47\x61\x57\xac\x58\xc1\x8a\x15\x2b\x28\x2b\x2b\xa3\xb8\
-\xb8\x98\xda\xda\x5a\x6c\x36\x1b\x91\x91\x91\x8c\x1f\x3f\x5e\x97\
-\x3e\x3b\x67\x8c\xb8\xa0\x5a\xbb\x16\x18\x31\x2a\xee\xad\x34\x62\
-\xc7\x2e\xc3\xb0\x60\x78\xf6\xe7\x90\x30\x46\x88\x74\xc6\x24\x31\
-\x80\xef\xd9\x57\xc5\x92\xd5\xfd\xc9\xc9\xc9\xf1\xda\x1f\x35\x92\
-\x1c\x3f\x7e\x9c\xb2\xb2\x32\xaf\x1e\xbe\x7d\x82\xc2\x48\x32\xe2\
-\x46\x79\x63\x57\x67\xb1\xab\x8b\x6b\xf5\xa7\x53\x8b\x40\xd3\xc4\
-\x70\xe2\x84\x31\x50\x6f\x9d\x46\x61\xc7\x93\xb4\xda\x12\xb8\x7a\
-\xac\x7d\x30\xdf\x40\xaa\xaa\xaa\x5c\xf2\xac\x0f\x17\x5a\xd7\xb2\
-\x85\x06\x17\xf5\xac\x69\x1a\xbf\xff\xfd\xe5\x33\x70\xce\x55\x06\
-\x08\xca\xa7\x6b\x64\xae\xe6\x62\x3f\x9b\x23\x6c\x88\x39\xd1\x21\
-\x0e\x86\x48\x17\x9f\x15\x5b\x7f\xc5\xb3\xa1\xb5\x16\x2d\x88\x6a\
-\xeb\x62\xda\x6c\x71\x54\x5b\x16\x71\xde\xbc\x1a\x1b\x7e\xd8\x10\
-\x7d\x5d\xe6\x41\x5a\xdb\x9e\x4e\x5c\xe8\x6c\x13\x83\xb1\xac\x9a\
-\xe7\x4b\xfd\x58\x11\x93\x32\xa2\x5c\x1f\x94\xc9\x6b\xaf\xbd\xc6\
-\xe9\xd3\xa7\x3d\xbe\xe6\xa5\xa0\x5b\x50\xaa\x2a\xaa\x8c\xd9\x5d\
-\xcb\x7c\xb7\xdb\x3c\x6f\x46\xb6\x58\x13\x01\x31\x1a\x71\xe1\x4c\
-\xf1\x4b\x04\x76\xca\xab\xa0\xb6\x11\xfc\x0d\x15\x98\x94\xc1\x17\
-\x00\x75\xc6\x45\xcb\x5c\x4a\x3a\x7f\xd6\x35\x62\x41\xc1\x5f\x39\
-\x4b\x90\xa1\x88\x86\x66\x38\x39\x48\xb7\x86\xa3\xa9\xd3\x83\xd1\
-\xd9\x5e\xc7\xa9\x23\x2f\x73\xe8\xef\x77\x01\xd0\x62\x1b\xe7\x51\
-\x7a\x01\xea\x2d\x62\xa0\xdf\xc6\xbb\xc5\xdf\xe2\x59\xe0\x3f\x84\
-\xf3\xde\x6c\x36\x73\xdf\x7d\xf7\xd1\xd1\x31\xbc\x3f\x31\xf1\xf2\
-\xcb\x2f\x73\xfe\xfc\x79\x5d\xe2\x32\x80\xb0\x3f\x5e\xf9\x57\x85\
-\xa7\x7f\x26\x16\x11\x6d\xb4\x4e\xf1\x2a\xf3\x6a\xad\x33\x69\xb4\
-\x4e\x26\x39\x01\x7e\x79\x07\xbc\xf4\x38\x3c\xf5\x20\x04\x07\x08\
-\x7b\x67\xd7\x41\x00\x8d\x28\x63\x96\xd7\x37\x60\x54\x5a\x88\x35\
-\xfd\x15\xd0\x78\xfb\x33\xc7\x25\x54\x70\x70\x30\x2f\xbe\xf8\x62\
-\x9f\x55\x5a\x86\xa2\xf1\xe2\x09\x76\x6c\x9a\xc8\xd1\xcf\x37\x50\
-\x5b\xf1\x2d\x4d\xb6\xab\xb9\x68\xb9\xde\xe3\x74\x36\xd9\x26\x53\
-\x69\x5e\x8a\x9f\x7f\x10\xb3\xd3\xe1\xe7\xb7\xc3\x0b\x1b\x21\x7c\
-\x88\x46\xd6\xfe\xfd\xfb\x79\xf8\xe1\x87\x3d\xbe\xee\x60\x74\x74\
-\x74\xf0\xd0\x43\x0f\xb1\x61\xc3\x06\xdd\x16\x24\x33\x06\x07\xc0\
-\x3f\xdd\x05\x3e\x26\x03\xb5\xd6\x59\x34\x5a\x27\xd1\x6a\xf3\xd6\
-\x90\x53\x39\x6b\x5e\x8b\xaf\xa5\x1a\xff\xae\x85\xdb\xa7\xa6\x9c\
-\xe1\xae\x65\xb0\xe9\x23\xf8\x6c\xbf\x68\x9d\x8d\x0a\x39\x4e\x8b\
-\x2d\xd1\xa5\xe1\xaf\x0e\x13\xaf\x34\x11\x6f\x7a\x07\x1f\x43\x1d\
-\x5f\x7e\x0b\xd9\x0e\x96\xd8\x4c\x4b\x4b\xe3\xd3\x4f\x3f\x25\x3e\
-\x3e\xde\xad\xb8\x4f\x1c\x78\x8e\xce\xb6\x6a\x6a\xac\x73\xa8\x31\
-\x67\x60\xc1\xf5\x79\x84\xce\xa8\xb5\x66\x52\x6b\xcd\xc4\x47\xa9\
-\x25\xc2\xf8\x15\x91\xe1\x47\x58\x3e\x07\xde\xd9\x31\x78\xb8\x37\
-\xdf\x7c\x13\x3f\x3f\x3f\x5e\x7a\xe9\x25\x8f\x1c\x97\x8e\x28\x2c\
-\x2c\xe4\xee\xbb\xef\xf6\x7a\x5d\xd2\xfe\x18\x62\x22\xc1\xcf\x07\
-\x5a\x6c\x13\xa8\x34\x2f\xa3\xd5\x96\x88\x5e\xeb\x5e\x77\x68\x91\
-\xd4\x5b\x67\x50\x69\x5e\x01\x08\x23\x1a\xc4\x0f\xe5\xfc\xd7\x9b\
-\x62\x7b\x95\xe9\x53\x22\x8c\x39\xb8\x3b\x39\x3d\xd0\x70\x8a\xf1\
-\xbe\xaf\xe2\x6f\xa8\xe4\x60\x2e\xbc\xb6\xcd\xf1\x79\x4b\x97\x2e\
-\x75\x5b\x4c\x00\xe6\x76\x31\x12\xb4\xd9\x9a\xac\x8b\x98\x7a\x23\
-\xd6\x3b\x17\x23\x35\x4d\x2e\xb6\xb3\x37\x6d\xda\xc4\x92\x25\x4b\
-\xbc\xae\x9a\xcc\x66\x33\x7f\xfc\xe3\x1f\x99\x31\x63\x86\xee\x62\
-\x02\x30\x96\x57\x41\x7b\x27\x04\x99\x4e\x12\x67\xda\x8a\x59\x0b\
-\x05\x45\x1f\x6f\x82\x82\x15\x95\x36\x02\x0c\xc5\x00\x1c\xed\xf5\
-\xa3\x01\xc5\x67\xe1\xf9\xcd\xb0\xf1\x6e\x8d\xa8\xc0\x2f\x09\x55\
-\x73\xa9\xb1\x64\xd0\x6c\x9b\x88\x45\x73\x3c\xe1\xd1\x80\x99\x20\
-\xf5\x14\x61\xea\x61\x82\x0c\xa7\x50\x14\x03\xc7\xce\x4c\xe0\x4f\
-\x5b\x4e\x0d\xf8\x61\x1d\x3b\x1f\x7f\xfc\x31\xbf\xfa\xd5\xaf\xdc\
-\xee\xe7\x4a\x98\x72\x0f\x95\x25\xbb\x48\xf4\xd9\x8c\x95\x40\xac\
-\x9a\x7b\x53\xe7\x9d\xa2\xd9\x30\x2a\xad\x18\x14\x33\xed\x9d\x0a\
-\x59\x87\x5d\x7f\x91\x72\x72\x72\x48\x4e\x4e\xe6\xd1\x47\x1f\xe5\
-\xf1\xc7\x1f\x1f\xf2\xb7\x5b\x7a\x53\x5b\x5b\xcb\x1b\x6f\xbc\xc1\
-\x2b\xaf\xbc\x42\x71\x71\xf1\x80\xe3\xb9\xb9\xb9\x6e\x77\xf7\xb4\
-\xb6\x0e\x1c\x82\xa4\x00\xda\x94\xf1\x70\xff\x2a\x61\x3f\x0d\x07\
-\x4d\xad\x0a\xbb\x0e\x6a\x7c\xf0\xc5\xc0\x5f\x54\x0a\x0d\x82\x9f\
-\x2c\x87\xd9\x53\xc1\xd8\x35\xcc\xbc\xd3\x16\x8e\x99\x50\xac\x9a\
-\x3f\x8a\xa2\x60\xa0\x1d\x93\xd2\x88\x89\x1a\x14\x45\x44\x50\x5e\
-\x1d\xcc\xeb\x7f\xb7\xf2\xc3\xc9\xa1\xc7\x55\xf9\xf9\xf9\x31\x79\
-\xf2\x64\x97\x7f\x5e\xc2\xce\xd8\xc8\x0b\xa4\xc4\x54\x10\x1a\xd0\
-\x86\x6a\xe8\x71\x6e\x59\xad\x56\xcc\x66\xb3\x4b\xdd\x1b\xfd\xd1\
-\x34\xb1\x4a\x4a\xc9\x39\xf1\xa3\x00\xe7\xdc\xef\x61\x01\xc4\x52\
-\x3a\x0b\x16\x2c\x60\xf9\xf2\xe5\xcc\x98\x31\x83\x31\x63\xc6\x74\
-\xf7\xc7\x35\x35\x35\x75\xff\xd2\x54\x5e\x5e\x1e\x5f\x7e\xf9\x25\
-\x87\x0e\x1d\xd2\x75\xe1\x56\x67\x28\xf4\xaa\x6b\x82\x03\x84\xc3\
-\xd0\xd5\x62\x78\x28\xcc\x16\xb1\x64\x72\x43\xcb\xd0\xbf\xfd\x16\
-\x1e\x02\xd7\x4f\x13\xfe\xa5\xa4\x38\xe1\x72\xb0\x0b\x4c\xd3\xa0\
-\xbe\x59\x2c\xa0\x7f\xb2\x0c\xf6\x7f\xef\xf9\x83\x90\x0c\x2f\x7d\
-\x04\x75\xb9\xe1\xe7\x23\xa6\x1b\x5d\x6e\x3f\xcc\x28\x71\xce\x65\
-\x2d\x28\xc9\x95\xc7\x15\x3f\x1e\x4a\x72\x79\x21\x05\x25\xd1\x15\
-\x29\x28\x89\xae\x48\x41\x49\x74\x45\x0a\x4a\xa2\x2b\x52\x50\x12\
-\x5d\x91\x82\x92\xe8\x8a\x14\x94\x44\x57\xa4\xa0\x24\xba\x22\x05\
-\x25\xd1\x15\x29\x28\x89\xae\x48\x41\x49\x74\x45\x0a\x4a\xa2\x2b\
-\x52\x50\x12\x5d\x91\x82\x92\xe8\x8a\x14\x94\x44\x57\xa4\xa0\x24\
-\xba\x22\x05\x25\xd1\x15\x29\x28\x89\xae\x48\x41\x49\x74\x45\x0a\
-\x4a\xa2\x2b\x52\x50\x12\x5d\x91\x82\x92\xe8\x8a\x14\x94\x44\x57\
-\xa4\xa0\x24\xba\x22\x05\x25\xd1\x15\x29\x28\x89\xae\x48\x41\x49\
-\x74\x45\x0a\x4a\xa2\x2b\x52\x50\x12\x5d\x91\x82\x92\xe8\x8a\x14\
-\x94\x44\x57\xa4\xa0\x24\xba\x22\x05\x25\xd1\x15\x29\x28\x89\xae\
-\x48\x41\x49\x74\x45\x0a\x4a\xa2\x2b\x52\x50\x12\x5d\x91\x82\x92\
-\xe8\x8a\x14\x94\x44\x57\xa4\xa0\x24\xba\x22\x05\x25\xd1\x15\x29\
-\x28\x89\xae\x48\x41\x49\x74\x45\x0a\x4a\xa2\x2b\x52\x50\x12\x5d\
-\x91\x82\x92\xe8\x8a\x14\x94\x44\x57\xa4\xa0\x24\xba\x22\x05\x25\
-\xd1\x15\x29\x28\x89\xae\x48\x41\x49\x74\x45\x0a\x4a\xa2\x2b\x52\
-\x50\x12\x5d\x91\x82\x92\xe8\x8a\x14\x94\x44\x57\xa4\xa0\x24\xba\
-\x22\x05\x25\xd1\x15\x29\x28\x89\xae\x48\x41\x49\x74\x45\x0a\x4a\
-\xa2\x2b\x52\x50\x12\x5d\x91\x82\x92\xe8\x8a\x14\x94\x44\x57\xa4\
-\xa0\x24\xba\x22\x05\x25\xd1\x15\x29\x28\x89\xae\x48\x41\x49\x74\
-\x45\x0a\x4a\xa2\x2b\x52\x50\x12\x5d\x91\x82\x92\xe8\x8a\x14\x94\
-\x44\x57\xa4\xa0\x24\xba\x22\x05\x25\xd1\x15\x29\x28\x89\xae\x48\
-\x41\x49\x74\x45\x0a\x4a\xa2\x2b\x52\x50\x12\x5d\x91\x82\x92\xe8\
-\x8a\x14\x94\x44\x57\xa4\xa0\x24\xba\x22\x05\x25\xd1\x15\x29\x28\
-\x89\xae\x48\x41\x49\x74\x45\x0a\x4a\xa2\x2b\x52\x50\x12\x5d\x91\
-\x82\x92\xe8\x8a\xf1\x52\x27\xc0\x5b\x26\x26\xc2\xa8\x10\x28\xab\
-\x84\x73\xd5\x97\x3a\x35\x12\xdd\x04\x35\x69\x1c\xcc\x9c\x0c\x29\
-\x09\x10\x16\x04\x46\x23\xd4\x37\x41\x79\x15\x1c\x29\x80\xef\x4e\
-\x80\xc5\xaa\xd7\xd5\x7a\xb8\x79\x3e\xcc\x9a\x0c\x5b\x76\xc2\xb9\
-\x2c\xfd\xe3\xf7\x86\x55\xf3\x60\x42\x3c\x9c\xbb\x00\xef\x7f\x7e\
-\xa9\x53\x33\x32\x78\x2d\xa8\xb1\x31\x70\xff\x4a\x21\xa8\xe2\xb3\
-\x70\xfc\x24\xd4\x35\x41\xa7\x59\x94\x1c\x29\x89\xb0\xe1\x1f\xa0\
-\xae\x11\xde\xd9\x01\x07\x73\xf5\x48\xf6\x95\x41\x4a\x02\x5c\x97\
-\x0a\xf9\x25\x7d\xf7\x47\x86\xc3\x5f\x9e\x10\x9f\xef\x7d\x5a\xe4\
-\xd5\x8f\x05\xaf\x04\x95\x99\x0e\xeb\xd6\x40\xc1\x19\x78\xfc\xcf\
-\x50\x5a\xe1\xf8\xbc\x90\x40\xb8\x63\x31\x6c\xbc\x1b\x92\xbf\x82\
-\xb7\x77\x80\xcd\xe6\xcd\x95\xaf\x0c\xbe\xf9\x01\x2a\x6b\xe0\x42\
-\xed\xa5\x4e\xc9\xc8\xe1\xb1\xa0\xae\x4b\x85\x8d\x77\xc1\xdf\xb2\
-\xe0\xbd\xdd\xa0\x69\xce\xcf\x6d\x6c\x81\xd7\xff\x0e\xb9\xa7\xe0\
-\xd1\x3b\xc1\xa8\x8a\xef\x3f\x76\x72\x8e\x5e\xea\x14\x8c\x3c\x1e\
-\x09\x2a\x36\x0a\xd6\xaf\x85\x4f\xbf\x82\x77\x77\xf5\x8a\x4c\x85\
-\x69\x13\x61\x42\x1c\xf8\xfa\xc0\xc5\x7a\x38\x5b\x05\x79\xa7\xc1\
-\x6a\x85\x6f\x4f\xc0\x9f\xde\x85\xc7\xef\x83\xd3\xe7\x20\xeb\xb0\
-\xf3\x6b\xf8\xfa\xc0\xb4\x14\x18\x7b\x15\x04\xf8\x41\x53\x2b\x9c\
-\x2c\x87\xbc\x53\x60\x1d\xa4\x74\x8b\x1e\x25\xc4\x1e\x1b\x25\xaa\
-\x92\x82\x33\x70\x28\xd7\x71\x18\x5f\x1f\x18\x17\x03\x09\x63\x20\
-\x34\x08\x82\x03\xa0\xb9\x0d\x1a\x9a\xa1\xa8\x0c\x4a\xce\x39\xbe\
-\x46\x7c\x34\x84\x05\x43\x75\x9d\x28\x81\x40\x84\x8f\x8d\x02\x05\
-\x38\x53\x01\x2d\x6d\x70\x55\x04\x44\x84\x89\xea\xfe\xec\x85\xae\
-\xbc\x8b\x84\xf1\x71\x3d\x71\xa5\x26\x81\xd9\xd2\xf3\xfd\x42\x2d\
-\x54\xf5\x2b\xd1\xc2\x43\x20\x23\x15\x62\x22\xc1\xc7\x24\xce\xf9\
-\x2e\xdf\x79\x8d\x60\xc7\xc7\x04\x33\x27\x09\xb3\xc3\xdf\x17\x9a\
-\x5b\xe1\x87\xd3\x70\xac\x68\xf8\x6a\x08\x05\x18\xa4\x6c\x71\xcc\
-\x13\x3f\x15\x19\xfa\xd4\xff\xf4\x24\xec\xea\xb1\xc2\x56\x8a\x0c\
-\x1f\x78\x7e\x53\x2b\x3c\xf9\x92\x78\x00\x00\x3f\x59\x01\xf3\xae\
-\x81\x47\xff\x0b\xda\x3a\x06\x9e\x3f\x67\x2a\x3c\x70\xb3\xa8\x2a\
-\xfb\x53\xd7\x04\xaf\x7f\x0c\x5f\xe7\x89\xef\xff\x72\x9f\x30\xca\
-\xff\xfa\x25\x04\x07\xc2\xe2\x6b\x41\xed\xe7\x0c\x29\x38\x03\xff\
-\xfe\xbf\x03\x6d\x95\x87\x56\xc3\xd2\x4c\xe7\xf7\x79\xa4\x00\xfe\
-\xfb\xdd\x81\x69\x5c\xb7\x16\xe6\x4f\x87\x6d\x7b\xc5\x4b\x71\xef\
-\x72\xf1\xe0\x14\x45\x1c\x7f\xe5\x43\xd8\xfb\x1d\xdc\x73\x13\xac\
-\x9e\x2f\x3e\xbf\xf2\xa1\x6b\xd7\xfc\xe0\x0b\xf1\x67\x67\xc5\xf5\
-\x70\xd7\x52\x21\x8e\xde\x68\x1a\xec\x3b\x0a\x9b\x3e\xea\x2b\x48\
-\x3b\x29\x09\xc2\xc4\x88\x08\x1b\x78\xac\xb4\x02\x5e\x78\x1b\xaa\
-\x6a\x9c\xa7\xc3\x53\xdc\x2e\xa1\xe2\xa2\x60\xc6\x24\xf1\x80\xec\
-\x62\x4a\xbc\x0a\x9e\x7a\x50\xbc\xf1\x5f\x7c\x03\x07\xbe\x87\xea\
-\x7a\x71\x33\x19\xa9\xe2\x21\xfb\xf9\xf4\xc4\xf1\xd1\x1e\x58\x72\
-\x2d\x2c\x98\x01\x3b\x0e\xf4\x8d\x7f\xe1\x4c\xf8\xc5\xed\xe2\xe1\
-\x1c\x2d\x84\x83\xc7\xa1\xb5\x5d\x94\x3c\x19\x69\x90\x9c\x00\xe3\
-\x63\x7b\x04\x65\xe7\xd6\x85\x60\x30\x88\x92\xef\x48\x81\x10\x4f\
-\x72\xbc\x68\x79\x5e\x3d\x16\x6e\x9e\x07\x1f\x7e\x39\xf0\x7e\x6a\
-\x1b\xe1\x58\xa1\x68\x8d\xd6\x35\x82\xc9\x24\xc2\xcd\x9b\x0e\xd3\
-\xaf\x16\x02\x78\xf9\x7d\xc7\x79\x91\x9e\x0c\x37\xcd\x11\xf7\xd6\
-\xd2\x26\x4a\x37\x47\x2f\x41\x6f\x8e\x9f\x12\xe9\xbc\xe1\x3a\xf1\
-\xfd\x93\x9c\xbe\xa5\x45\xc1\x99\x9e\xcf\x4b\x33\xe1\xa7\x2b\xc5\
-\xf1\xcf\xbf\x16\x2d\xe5\x0e\xb3\xb8\x9f\x55\x73\x85\xa8\x7d\x4c\
-\xf0\xe2\x3b\x7d\xaf\x11\x1b\x05\xbf\xf9\x99\x48\xd7\x0f\xa7\xe1\
-\xf3\x43\xe2\x45\x8c\x1e\x05\x2b\xe7\x8a\xe7\xf5\xcc\xc3\xc2\xee\
-\x6d\x6a\x19\x3c\xbd\xee\xe2\xb6\xa0\x66\x4c\x12\xee\x80\xdc\x53\
-\x3d\xfb\xee\xb9\x49\x88\x69\xc7\x7e\x78\xe3\x93\x9e\xfd\x55\x35\
-\xf0\x43\x31\x6c\xcf\x11\x99\x6d\xa7\xa5\x4d\x3c\xf4\x19\x93\xfa\
-\x0a\x2a\x3c\x58\x3c\x40\x45\x81\xad\xbb\xe1\xaf\x7b\xfa\x5e\xfb\
-\x93\x1c\xb8\x66\xa2\xe3\xb7\xae\xa1\x19\xde\xfc\x14\xf6\x7f\xdf\
-\x77\xff\x3f\xde\x2a\x1e\xde\x9c\xa9\x03\x05\xf5\xfe\x17\xc2\x96\
-\xeb\x6f\xff\x65\x1f\x86\xc3\xf9\xf0\xaf\x0f\xc0\xec\xa9\xf0\xea\
-\xdf\xa0\xa3\x73\xe0\x35\x93\xe2\xa0\xe4\x3c\xbc\xb9\x1d\x4e\x94\
-\xf4\xc4\x63\x54\x07\x9e\x6b\xe7\xdb\x1f\xe0\xcc\xf9\x1e\x41\x6d\
-\xdd\xed\xb8\x95\x17\x1c\x20\x4a\x3e\x80\xd7\xfe\x26\x5e\x54\x3b\
-\x27\x4e\x8b\xf4\xfd\xc7\x3a\xc8\x4c\x83\xac\x89\xe2\xe5\xb3\xf3\
-\xe0\xcd\x42\x4c\xdf\x9e\x80\x17\xde\xea\x49\x57\x7e\x89\x78\x41\
-\xff\xed\x17\x30\x2e\x16\xfe\xe1\x06\x11\xb7\x9e\xb8\xed\x29\x4f\
-\x8a\x83\xfc\x33\x3d\x89\xf4\xf5\x81\xb4\x24\xf1\x79\xe7\x41\xc7\
-\x61\xaa\x6a\x85\x88\x7a\x73\xe2\xb4\x88\xab\x37\x8b\x66\x89\x37\
-\xae\xbc\x0a\x3e\xda\xeb\x38\xae\xa3\x85\xe2\x6d\xed\xcf\x8e\x03\
-\x03\xc5\x04\xc2\x7e\x02\x61\xcf\xd8\xab\x24\x3b\x4d\x2d\xce\x1b\
-\x13\xc7\x8a\x84\xdd\x65\x54\x61\x74\xa8\xe3\x73\x0e\x1e\x87\x5f\
-\xbf\x2c\x4a\x81\xde\xf1\xe8\xe1\x6f\x9b\x33\x0d\x7c\x4d\xc2\x59\
-\xfb\xe5\xb7\x03\x8f\x97\x56\x88\xaa\x14\x44\xbe\xd9\x89\x0c\x17\
-\x76\x19\xc0\xdb\x9f\x0d\xbc\xbf\x0e\xb3\x68\x44\x81\x28\xe1\x06\
-\x13\xbf\x27\xb8\x5d\x42\x85\x06\x89\x37\xcc\xce\xe8\x50\x50\x55\
-\x91\xf9\xee\x34\x8f\x6b\x1b\x21\xd0\x1f\x4c\xc6\x1e\x1b\x60\xf2\
-\x78\xb1\x3d\x7e\x72\xf0\x56\xa3\x3b\xd4\x35\x8a\xad\xc1\x20\xc4\
-\xda\xbf\xa4\x51\x14\x61\x6f\x4c\x1e\x2f\xaa\xf3\xd0\x20\x51\x6d\
-\x05\x07\x82\xa1\x4b\x80\x26\x27\xb9\x54\x59\x33\x78\x03\xc1\x1b\
-\x26\x26\x8a\x6d\x51\xa9\xf3\xbc\x28\x2c\x85\x1b\x33\x44\x15\x68\
-\x27\x25\x41\xdc\x53\x63\x0b\x54\x5c\x74\x1c\xce\x5e\xad\xfa\xfa\
-\x08\x3f\xe2\xa9\x72\xbd\x52\xed\x81\xa0\x14\xa5\xaf\x15\x6f\xbf\
-\x59\xa5\xfb\x9f\xfb\xf1\xd9\x19\x15\x22\xb6\x76\xe3\x5d\x0f\xda\
-\x1d\x54\x55\x76\x92\xe2\xe0\x97\x77\x88\x56\x5e\x6f\x5a\xda\x44\
-\x43\xe2\x52\x12\x1e\x2c\xb6\x35\x0d\xce\xcf\xb9\x58\x2f\xb6\x21\
-\x81\xa2\x21\x62\xb5\xf5\xe4\xe1\x60\xe1\xda\x3a\xc4\x9f\xbf\xaf\
-\x68\x41\xea\x89\xdb\x82\x6a\x68\xee\xb9\x59\x80\xda\x06\xe1\x12\
-\x50\x55\xd1\x24\x2e\xab\x74\x2d\x9e\xf0\x60\xf1\xe0\x7a\xdb\x0f\
-\xf6\xe2\xd7\x51\xab\x45\x6f\x22\xc3\xe1\x37\x0f\x89\x52\xb2\xb4\
-\x42\xb8\x40\x4a\xce\xc3\xf9\xea\x9e\xeb\xbf\xfd\xdc\xc0\xd6\xd5\
-\x48\xa1\x76\xe5\xc5\x60\xd5\xa7\xa5\x2b\x9d\x8a\x22\x4a\x60\xab\
-\x4d\x6c\x7b\x1f\x73\x86\xd9\x22\x04\x65\xd4\x79\x78\x80\xdb\xd1\
-\x95\x9c\x17\x45\xac\xbd\x64\xe9\x30\x8b\x96\x0b\xc0\xed\x8b\x1c\
-\x87\x99\x10\x2f\xaa\x90\xde\x4c\x1a\xd7\xb7\xea\x84\x9e\x52\xc1\
-\x91\xd1\xad\x37\x37\x5c\x27\xc4\x54\x5e\x05\xbf\xfe\x8b\x68\xfe\
-\x97\x56\x8c\x8c\x98\x7b\xe3\xac\x50\x6f\xec\x6a\x7d\x39\xb3\xdf\
-\xa0\x27\x9f\xda\x3a\x7a\xd2\xdd\xdc\x95\x87\xa3\x06\x09\xe7\x63\
-\x12\x46\x7f\xef\xeb\xe8\x85\xdb\x82\x3a\x9c\x2f\x8a\xc9\xc9\xe3\
-\x7a\xf6\x6d\xd9\x29\x6c\x93\xcc\x74\xf8\x97\x9f\xc0\xf5\xd3\x84\
-\x0d\x30\x3b\x1d\xfe\xf9\x5e\xf8\xdd\x23\xa2\xc3\xd8\x8e\xbf\xaf\
-\x68\x92\x7f\x97\xdf\x37\xee\xe2\xb3\x62\x3b\x21\xde\x93\x5b\x71\
-\x8f\xd8\x48\xb1\x3d\x56\x34\xf2\x22\xea\x5d\x7a\x18\x9d\xd4\x11\
-\x76\xa7\x6a\xff\xea\xb8\x37\x09\x57\xf5\x3d\x17\xe0\x74\xd7\x4b\
-\x1a\x1e\xec\xdc\x85\x91\x30\xa6\xcb\x74\xd1\x84\x13\x56\x4f\xdc\
-\x16\x54\x69\x05\x7c\x7f\x12\xee\x5a\xd6\x53\x4a\x95\x56\xc0\xbf\
-\xbd\x26\x7a\xd5\x67\x4d\x11\xdd\x2b\xcf\xfd\x52\x38\xd6\xae\x4b\
-\x15\x5e\xe2\xde\x6e\x83\x5b\x16\x80\x4d\x1b\xe8\x29\x3f\x70\x5c\
-\x6c\x53\x93\x7a\x5a\x2a\xfd\x09\x0e\x84\xb4\x09\xee\xa6\x7a\x20\
-\xe6\xae\xaa\x24\xca\x81\x23\x16\x60\x6a\x4a\x4f\xb5\xa3\x37\xf5\
-\xcd\x3d\x55\x99\x33\xc1\x1c\xcc\x15\x0f\x3c\x25\x41\x94\xe6\xfd\
-\x09\xf4\x87\xc5\x5d\xad\x3b\x7b\xbe\x81\x28\xf5\x2b\x2e\x8a\xaa\
-\x6f\xd5\x3c\xc7\x71\xdf\xdc\xb5\xff\x58\xd1\xc0\xd6\xb7\xb7\xa8\
-\xc0\x33\xee\x06\x2a\xab\x14\x9d\xbd\x46\xa3\xf0\x33\x81\xb0\xa5\
-\x76\x1f\x12\x89\x2c\x39\x27\xdc\x02\xfb\x8e\x0a\x3f\xcb\x07\x5f\
-\x40\x7b\x97\xb7\x39\x3d\x19\x7e\x76\x8b\x68\xd2\xf6\x76\xe2\x81\
-\x30\x32\x13\xc6\x40\x5c\x34\x5c\x9b\x2a\x4a\x8e\xba\x46\x21\xdc\
-\xf8\x68\xb8\x31\x53\x78\xe3\x9b\x5a\x21\xaf\xeb\xba\x73\xa6\x8a\
-\xd2\x26\xf7\xd4\xc0\xf8\x40\x74\xdb\xac\xb8\x5e\x7c\xde\xb6\x57\
-\xd8\x7b\x20\xfc\x34\xb3\xa6\x88\xb0\x8a\x22\xaa\x0a\x7f\x5f\xe1\
-\x38\xbd\xe7\x26\xe1\x9d\xb6\xb7\xf2\x3e\xff\x5a\xd8\x8e\x76\xae\
-\x9d\x22\xba\x84\x0a\xce\xf4\xa4\xc3\x11\xe9\xc9\xc2\x3c\x38\x73\
-\x5e\x38\x25\x7b\x33\x6b\x8a\x28\xe9\x63\x22\x85\xdd\x66\x30\x88\
-\x16\x57\x58\xb0\xc8\xcb\xa6\x16\x61\xe7\x8d\x8b\x15\x5e\xf8\xea\
-\x7a\xe1\xd7\xb3\x8b\x6c\xe3\xdd\xc2\x15\x72\xf6\x02\xbc\xba\xad\
-\xaf\x73\xb4\xb6\x41\xf8\xcf\x26\x26\x8a\x97\xa2\xac\x52\xd8\xaa\
-\xa3\x43\x85\xa3\x74\xee\x35\x42\xd0\x7f\x7e\x57\xf8\x14\xf5\xc4\
-\xa3\xbe\xbc\xd2\x0a\xe1\xf2\x7f\x64\x8d\x48\xe8\xb6\x2e\x9f\x91\
-\xa6\xc1\xc9\x32\xf1\xe7\x88\xa9\xc9\xf0\xd8\x3d\xa2\xd3\x74\xf7\
-\x21\xc7\xe7\xfc\xe5\x7d\xd1\x62\x99\x39\x59\xdc\xfc\x4f\x57\x0e\
-\x3c\xa7\x59\x87\x16\x58\xce\x51\x91\xe9\xd3\x52\x60\xcd\x12\xf1\
-\x67\xc7\x66\x13\x46\xfa\x8d\x19\xce\x5d\x06\xde\xb2\x75\x37\x3c\
-\xfe\x53\xf1\xd0\x9f\xfb\x65\xcf\xfe\x0f\xbe\xe8\xc9\xbf\xd7\x3f\
-\x16\x02\xbb\x66\x22\x3c\x76\xb7\xc8\x5f\x9b\xad\xa7\xe4\xac\xaa\
-\x81\xe7\x37\x0f\xac\xb2\xbf\xf9\x01\xde\xfa\x0c\xee\xbd\x49\xd8\
-\xb5\xb7\x2f\x12\x02\xea\xdd\xe8\x79\x69\xab\xb0\x87\xf5\xc6\xa3\
-\x12\x0a\x84\xa8\xea\x1a\x85\x37\x77\x7c\x9c\x28\x95\x9c\x3d\xe8\
-\x00\x3f\x58\x7b\x03\x3c\xb8\x1a\xbe\x3a\x06\xaf\x6d\x13\x55\x9e\
-\x23\x2c\x56\xe1\xa0\x2c\x38\x23\x6e\xdc\x6c\x11\xc5\xf2\xf9\x6a\
-\x11\x76\xd3\x47\x7d\x6d\x2f\x93\x2a\x8a\xf8\x13\xa7\x1d\xbb\x1b\
-\x14\x45\xfc\x15\x96\x8a\x52\xcc\x7e\x5d\x4d\x13\x55\x45\x5b\x87\
-\x30\x50\x6d\x9a\x88\xe7\x9b\x3c\xd8\xb4\x0d\xb2\x8f\x08\x31\x9d\
-\x2c\x13\x1d\xd2\xbd\xdd\x0f\x46\x55\xf8\xdc\x4e\x9c\xee\xe9\x1c\
-\x76\x84\x51\x15\xfe\xb6\x13\x25\x3d\x9d\xc3\x76\x2a\x6b\xe0\xfb\
-\x22\x21\x0e\xb3\x45\xa4\x3d\xbf\x04\x0e\xe5\xf5\xb8\x03\xac\x36\
-\x91\x17\x67\x2f\x88\xfb\x34\x18\x44\x55\x5d\x72\x1e\x76\x1d\x10\
-\xfd\x83\xbd\x4b\xce\xde\x14\x95\x0a\x7b\xd7\x60\x10\xf7\x61\xb3\
-\x09\x07\xf3\x81\xef\x45\x57\x52\x61\xa9\xf3\x74\x7b\x83\x47\x9d\
-\xc3\xbd\x49\x49\x10\x1d\xb9\x63\x63\x44\x86\xe4\x9e\x12\x3e\x10\
-\xab\x55\xbc\x5d\x29\x89\xa2\x14\x68\xef\x84\xf7\x76\xf5\x78\x77\
-\x25\x3f\x4e\xbc\x16\x14\x88\x12\x60\x5a\x4a\xaf\x21\xc0\xc1\xe2\
-\xed\xac\x6f\x16\xc3\x57\x0e\xe7\x0b\x23\xd3\x51\x7f\x98\xe4\xc7\
-\x85\x2e\x82\x92\x48\xec\xc8\x69\x54\x12\x5d\x91\x82\x92\xe8\x8a\
-\x14\x94\x44\x57\xa4\xa0\x24\xba\x22\x05\x25\xd1\x15\x29\x28\x89\
-\xae\x48\x41\x49\x74\xe5\xff\x03\x2f\xe8\x9e\xab\xff\xb7\x42\xb3\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x78\x48\
-\x00\
-\x05\x6c\xf6\x78\x9c\xec\x7d\x07\x7c\x54\xc7\xb9\x3d\x0e\x2e\xb1\
-\x71\x8b\xdb\xb3\xf3\x92\xd8\x49\x5e\xca\x3f\x79\x2f\x71\x62\x3b\
-\x4e\x62\x1b\x4c\x31\xbd\x23\x54\x11\x42\x15\x49\xf4\x8e\x10\x4d\
-\x20\xd1\x0c\x98\xde\x4c\xef\x98\xde\x8b\x0b\x2d\x36\x48\xa8\xa1\
-\x5e\x50\xef\x7d\x25\xad\xb4\x2a\xc0\xfc\xbf\x99\xbb\xe5\xee\xdd\
-\xdb\x76\xf7\xae\x76\x57\x9e\xcf\x3e\xbf\x2d\xf7\x6a\xb5\x62\xe6\
-\x9c\xf9\xe6\x9b\x73\xe7\x76\xe9\xf2\x44\x97\xa7\xbb\xe0\x78\xa2\
-\xcb\x3b\x5d\xfe\xf8\xce\x93\x5d\x82\xe0\xf9\xe2\xc5\xda\xd7\x3f\
-\x7d\xa2\xcb\x5a\x78\xef\xdd\x77\x99\xd7\x47\x7f\xd7\xa5\xcb\xa5\
-\x3f\x3e\xd5\xe5\x9d\x77\xb4\xaf\x5f\xee\xd2\x65\xec\xd0\xa7\xba\
-\xbc\xf9\x26\xf3\x7a\xc5\xb3\x5d\xba\x3c\xed\xf3\x54\x97\x97\x5f\
-\x66\x5e\x07\x3f\xd9\xa5\xcb\xda\xe0\xa7\xba\xfc\x91\xf9\x05\x5d\
-\xba\xfc\x84\x79\x9f\x06\x0d\x1a\x34\x68\xd0\xa0\x41\x83\x06\x0d\
-\x1a\x34\x68\xd0\xa0\x41\x83\x06\x0d\x1a\x34\x68\xd0\xa0\x41\x83\
-\x06\x0d\x1a\x34\x68\xd0\xa0\x41\x83\x06\x0d\x1a\x34\x68\xd0\xa0\
-\x41\x83\x06\x0d\x1a\x34\x68\xd0\xa0\x41\x83\x06\x0d\x1a\x34\x6c\
-\x11\x4b\x17\x2c\x7c\x31\x7c\xd6\xec\x57\xe6\xce\x9c\xf5\xe6\xcc\
-\xa9\xd3\x7e\x39\x29\x24\xe4\x9d\x09\xe3\x83\x7f\x1b\x1a\x34\xfe\
-\x77\x80\xff\x51\x02\x13\x83\x43\x8c\x30\x29\x24\xf4\x7f\x26\x85\
-\x86\xfe\xce\x1a\x4c\x0e\x9d\xf0\xbb\x29\x13\x26\xca\xc2\xd4\x89\
-\x93\xfe\x30\x6d\xd2\x64\x5e\x4c\x9f\x3c\xe5\x0f\x33\xa6\x4c\xfd\
-\x23\xe0\xf7\xe6\x61\x8a\x09\x66\x4e\x9d\xfa\xfb\x59\xd3\xa6\xfd\
-\x91\x1f\x53\xff\xa0\xc3\xec\xe9\xd3\xff\x30\x67\xc6\x0c\x59\x98\
-\x3b\x63\xe6\xff\x53\x1a\xf3\x66\xcd\xfe\x93\x16\x7f\x94\x8b\xf0\
-\xd9\x73\xfe\x14\x3e\x67\xae\x29\x66\x8b\x63\xfe\xdc\xb0\x3f\x4b\
-\x21\x7c\x6e\xd8\xff\x13\xc1\x1f\xe6\x01\xe6\x87\xcd\xfb\xf5\xc2\
-\x79\xe1\xff\xbd\x38\x7c\xfe\xeb\x4b\xe7\x2f\x78\x31\x62\xfe\x82\
-\x9f\x02\x9e\xb4\x37\x7f\x9c\x3d\xe6\xce\x9c\xf9\xf3\x19\x93\xa7\
-\xfc\x66\xea\x84\x49\xff\x07\x5c\xfd\xc7\x78\x7f\xff\x4f\x02\x7c\
-\xfd\x7a\x06\xfa\xfa\xf5\x08\xf2\xf7\xef\x29\x85\xf1\xfe\x01\xbd\
-\xe4\x22\x38\x20\x90\x20\x24\x30\xa8\x57\x48\x50\x50\x6f\x23\x04\
-\x1a\x10\x3a\x7e\xbc\x24\x40\xa3\x7a\x83\x96\xf4\x99\x38\x5e\x04\
-\x70\x1c\xf4\x8c\x80\x9c\x1b\x1c\xd2\x9b\x0b\x38\xd6\x7b\x72\x68\
-\xe8\x67\xa0\x27\x66\x01\x74\xa5\xaf\x29\x26\xf5\x05\xad\xe1\xc5\
-\xf4\xc9\x93\xfb\xe9\x30\x0d\x63\x92\x3c\x80\x3e\x49\x62\xd6\x94\
-\xa9\xfd\x67\x98\x81\x59\x53\xa7\xf5\x23\x98\x36\x7d\x80\xb5\x98\
-\x33\x7d\xfa\x40\x51\xcc\x98\x29\x09\x18\x7b\x06\x09\x01\x8e\x0f\
-\x00\xcd\xea\x03\x63\xd4\x27\x61\x33\x67\xbd\x07\x7a\xf1\xfb\x45\
-\xf3\xc2\xdf\x5a\x14\x3e\xff\x85\x25\x8c\x06\xfc\xc4\xde\x1c\x72\
-\xe6\x80\xbe\xf9\xa7\xd0\xa0\x90\x0f\x03\xfd\x02\x3e\xf3\xf5\xf1\
-\x1d\xe5\xed\x31\xc6\xdb\xdb\xc3\xcb\x0f\x63\xac\xa7\x29\xc6\xe8\
-\xe0\x35\xc6\x1f\xc3\xdb\xcb\xdb\x04\x3e\x63\xc6\x06\xf0\x61\x1c\
-\x0b\x63\x39\xf0\x1d\x3b\x2e\x50\x07\x3f\x1d\x7c\x7c\x83\xc4\xe0\
-\x3f\xce\x37\x08\xb4\x6a\xbc\x5c\xc0\xdf\x18\xcc\x0f\x3f\x80\x7f\
-\x70\x90\x5f\x60\x88\x01\xfe\xe2\xf0\x0f\x30\x42\x70\xc0\xf8\x50\
-\x5e\x04\x32\x08\x09\x0c\x9e\x20\x04\xf8\xf7\x9f\xa8\xc5\x04\x8b\
-\x30\x3e\x64\xe2\xc4\xe0\x09\xa2\x98\x14\x32\x61\x92\xa2\x08\x9d\
-\x38\x19\x63\xf2\x84\x89\x53\x44\x11\x3a\x49\x12\xa0\x9b\x53\xd9\
-\x98\x3a\x61\xb2\x01\xf0\x2b\xa6\x4d\x9a\x1a\x30\x63\xca\x74\x0f\
-\xd0\xac\xa1\x61\xa0\x03\x38\x2f\x80\x3c\xe0\xad\x08\x26\x0f\xa0\
-\x39\x80\x15\x31\x71\xfc\xf8\xbe\x33\x26\x8e\x9d\x1d\xe4\xe7\xb6\
-\x7c\x9c\xd7\xc8\xad\xde\xee\x43\xf7\x79\xb9\x0e\x39\xe2\x39\x5a\
-\x87\xa1\x07\xd9\x18\xe3\x36\xf4\x10\x81\xfb\xb0\x43\xde\xee\xc3\
-\x0f\x7b\xbb\x0f\xe3\xc1\x70\x03\x3c\x86\x1f\xd1\x61\x8c\x9b\x01\
-\xde\x6e\xc3\xf4\x18\xeb\x31\xe2\xc8\x58\xcf\x91\x7a\xf8\x78\x8e\
-\x3c\xca\x60\x94\x28\xc6\x79\x8d\x3a\xe6\xeb\x69\x19\xfc\xc6\xb8\
-\x7c\x25\x8e\xd1\xc7\x79\xe1\x65\x0a\x7f\xaf\xd1\x27\xf4\xf0\xe6\
-\x60\x8c\x31\x7c\xc7\x9a\xc2\x7f\xac\xeb\x49\x0c\x3f\x36\xbc\xa5\
-\x11\xe0\xe3\x76\x8a\xc0\xdb\xed\x54\xe0\x58\x77\x51\x04\x8c\x75\
-\x3f\x1d\xe4\x23\x00\x5f\x0f\x4b\x70\x26\x10\x63\x9c\xc7\x99\x20\
-\x11\x8c\xf7\xf5\x3c\xc7\x83\xb3\x7a\xf8\x79\x9e\x0d\xe4\x20\xc8\
-\xcf\xf3\x3c\x46\xb0\xbf\xd7\xf9\xe0\x80\xb1\xa7\x27\x07\x8e\x39\
-\x0f\x7d\xf4\xc4\x8c\x49\xe3\x97\x4d\x9f\x3c\x6d\x34\x68\xc0\xc7\
-\xa0\x01\xbf\x03\x0d\x78\x15\xf8\xff\xb4\xbd\x39\xe4\xcc\xb1\x68\
-\xfe\xfc\xf0\x99\xd3\xa7\x6c\x0b\x0e\xf4\x3f\xee\x37\xd6\xfb\x6b\
-\x2f\x4f\xb7\xef\x3d\xdc\x46\x47\xbb\xbb\x8e\x8e\x71\x77\x73\x89\
-\x71\x1f\xd1\xbb\x14\x50\xcc\x42\x29\x0b\x25\x22\x28\x23\x18\x29\
-\x84\xcf\xf4\xf0\x18\xd9\x07\x1e\x0d\x80\xd7\xe5\xb2\x30\xca\x14\
-\xee\xa3\x3e\x13\x84\xc7\xc8\xcf\x2a\xf4\x18\x65\x19\x3c\x5d\x3e\
-\xab\x14\x03\x9c\x23\x09\x4f\x0e\x78\xdf\x77\xe9\x5b\x25\x07\x5e\
-\x2e\xfd\xb5\xe8\x27\x81\x01\xd5\x63\x46\xcb\x84\xab\x08\x58\xe7\
-\x79\x6b\xe1\x35\xba\x9f\x59\x18\x33\xba\x5f\x8d\x1c\xc0\xf7\xae\
-\xf6\x71\x1f\x58\xed\xef\x35\xa4\x7c\x62\xc0\xc8\xd2\xf9\x33\x83\
-\x92\x17\xcd\x5f\xb4\x74\xfa\xc4\xc9\x03\x40\x03\xde\x5d\xc4\xe4\
-\x00\xcf\xd8\x9b\x43\xce\x1c\x9b\x37\x6e\x3c\x8c\x20\x5a\x1a\x54\
-\xa8\x4d\xdd\xc0\xa0\x91\x85\x06\x61\xb4\xca\x46\xbd\xb2\xa8\x57\
-\xe8\x33\xb8\x10\x3c\x5f\x65\x39\xea\x1d\x03\x6d\xf5\x75\x66\xa2\
-\x96\x17\xad\x2a\x53\xb4\x98\x09\xbe\xcf\x10\x43\x4b\x5d\x2d\x42\
-\x4d\x4d\xa8\xe8\x41\x76\xeb\xa4\x90\xd0\x8d\x33\x26\x4d\x76\x9d\
-\x37\x7b\xce\xbf\x21\x07\xf8\x15\xe4\x00\xcf\xda\x9b\x43\xce\x1c\
-\xeb\xd6\xae\x39\x81\xd0\x23\xd4\x58\x53\x65\x8a\x6a\x25\x51\xa9\
-\x1c\xaa\xec\x85\x0a\xcb\x50\xe9\xcc\x28\x37\x41\x43\x45\xc7\xa3\
-\x0d\x34\x2c\x2f\x3d\xb5\xd5\xdf\xd7\x6f\xcf\xb4\x89\x93\xc6\xcd\
-\x9d\x39\xeb\xd3\x79\x73\xe6\xbe\x03\xfc\x7f\xce\xde\x1c\x72\xe6\
-\xf8\xe2\xf3\xcf\xcf\x63\xfe\x37\x60\x5e\xd9\x5c\x03\x14\xd4\x01\
-\x67\xe2\xbf\xd3\xeb\x80\xa9\x06\x74\xb4\x0e\x60\xfe\xe7\xa6\xa7\
-\xb5\x8d\xf3\xf1\x39\x3c\x75\xc2\xc4\xf1\xc0\xff\x3e\xe1\x73\xe6\
-\xfe\x06\xf8\xdf\xcd\xde\x1c\x72\xe6\x58\xbb\x6a\xe5\x05\x51\xfe\
-\xd3\x5c\x40\x59\x1d\xb0\x3b\x97\x9d\x53\x03\x30\xff\x73\xd2\x52\
-\xdb\xbd\xc7\x8c\x39\x3a\x25\x74\x62\xf0\xbc\xd9\xb3\x3f\x83\xfc\
-\xff\xb7\xc0\xff\xe7\xed\xcd\x21\x67\x8e\x35\xab\x56\xc8\xe3\x3f\
-\xd5\x01\xaa\x03\x22\x3a\x60\x6b\x2d\xa0\xfc\xb7\x4d\x98\xcd\x7f\
-\x3a\x27\x50\x4e\x07\xec\xce\x65\x65\x75\x80\xf2\xdf\xf9\xc2\x22\
-\xfe\x53\x0d\xa0\xb9\x80\x48\x2e\x60\x4b\xfe\x8f\xf5\x1e\x73\x74\
-\x72\xe8\x84\xe0\xb9\xb3\x67\x61\xfe\xff\x0f\xe5\xbf\x75\xb1\xf6\
-\xf3\x55\x17\xf0\xfa\x5f\x93\x4a\x85\x9a\x55\xf5\xe6\xa3\x4e\x29\
-\xa8\x94\x45\x6d\x47\xa3\xce\x3a\xd4\x38\x23\x6a\x05\xd1\x54\xad\
-\x2c\x1e\x35\x35\xa3\xfc\xcc\x8c\xb6\xb1\x63\xc6\x1c\x99\x1c\x1a\
-\x4a\xf9\xaf\x50\xac\x8c\x5c\x74\xa1\x24\xe3\x5b\x94\x12\x73\x16\
-\xa5\xde\x3b\x67\x19\xa2\x59\x88\x31\x13\x77\xcf\x32\x30\x7a\xff\
-\xac\x32\xd0\x7d\x76\x74\x47\xe2\x8c\x75\xb8\xa3\xc5\xdd\xce\x81\
-\x94\xdb\x5a\xdc\xb1\x1c\xf7\xaf\x1f\x47\x19\xf0\x6f\x73\xfb\xd2\
-\xd1\x36\xdf\x71\x7e\x47\x26\x87\x84\x50\xfe\x2b\x14\x6b\x56\xad\
-\x3a\x8f\xd0\x63\xd4\x58\x5b\x85\xd4\xb5\xd5\xd6\xa3\x46\x49\x54\
-\x29\x83\x6a\x7b\xa1\xd2\x72\x54\x39\x2b\x2a\x78\x61\xed\x5c\xa3\
-\xbd\xa1\x1e\xf2\xff\x34\x3a\xfe\x2b\x1c\xab\x57\xae\x10\x5f\xff\
-\x37\x17\xb4\x26\x40\x6b\x02\x36\xa8\x09\x68\xe7\xff\x94\xff\x0a\
-\x87\xe2\xfc\x77\x54\x0d\xa0\x6b\x84\x76\xd7\x00\x6b\x74\xc0\x84\
-\xff\x33\x67\x52\xfe\x2b\x10\x36\xe1\x3f\xd5\x00\xe5\x74\xc0\xee\
-\x5c\x56\x56\x07\x94\xe1\xff\x84\xe0\x39\x33\x66\x60\xff\x1f\x5d\
-\xff\xb3\x32\x56\xaf\x58\x71\xce\x26\xfc\xa7\x5a\x40\xb5\x40\x41\
-\x2d\xd0\xf1\xdf\x1b\xf8\x3f\x29\x34\x74\x3c\xe5\xbf\x32\xd1\x21\
-\xfc\xa7\x7e\x01\x65\xf8\xef\xf4\x3a\x60\xf9\x9c\x80\xf2\xdf\x36\
-\xd1\x61\xfc\xa7\xb9\x80\xb2\x3a\x60\x77\x2e\x77\xac\x06\x50\xfe\
-\xdb\x26\xd6\xac\x5c\x75\xce\x2a\xff\x4f\x67\xf1\x0c\x75\xb8\x5f\
-\x88\x7a\x86\xcc\xf1\x0c\xe9\xfc\x3f\x94\xff\xca\xc6\xb2\x88\x85\
-\xe7\xac\xf6\xff\x58\xe4\x19\x3a\xcb\xf8\x85\x78\xfd\x3f\xe6\x42\
-\x21\xbf\x90\x33\x7a\x86\xee\x9c\xe9\xf4\x9e\x21\xae\xff\x87\xf2\
-\x5f\xb9\x60\xc6\x7f\x05\xfd\x3f\x76\xf5\x0b\x51\xcf\x90\x73\x42\
-\xda\x33\xa4\xf3\xff\xe0\xf1\x7f\x62\x48\xe8\xf8\xd9\xd3\x67\xf4\
-\xa6\xfc\xb7\x3e\x3a\x7c\xfe\x4f\xeb\x82\xb4\x26\x60\x41\x4d\x80\
-\x3d\xff\xa7\xfc\x57\x2e\x80\xff\x67\xec\xca\x7f\x5a\x17\x54\x56\
-\x07\xec\xce\x65\x65\x75\x80\x97\xff\xc1\x21\x41\xc0\x7f\x9a\xff\
-\x2b\x10\xc0\xff\xd3\x0e\xc1\x7f\x9a\x0b\x28\x97\x07\x38\xb5\x0e\
-\xf0\x6b\x00\x1f\xff\xe7\xcd\x9e\x43\xf9\x6f\x65\x30\xfc\x7f\x8c\
-\x1a\xec\xcd\x7d\x67\xc8\x07\x9c\x2d\x17\xe8\x44\x3a\xd0\xde\xa0\
-\x42\xb9\x98\xff\x5e\x0c\xff\xf1\x3d\x81\xc2\x66\xce\xfa\xcd\xa2\
-\x79\xe1\x94\xff\x56\x84\xc3\xf2\xdf\x51\x35\xc0\x19\xf3\x01\xbb\
-\x73\xd9\x7a\x0d\xa0\xfc\xb7\x4d\x18\xf1\xbf\xb6\xda\xfe\x9c\xa7\
-\x1a\x60\x1b\x1d\xb0\x3b\x97\xad\x41\x19\xe5\xbf\x8d\x62\xf5\xca\
-\x95\xa7\x88\xff\xa7\xbe\x1e\x35\xd7\x37\x00\xea\x19\x74\x94\x17\
-\xc8\x59\xfd\x42\xd4\x33\xd4\xa1\x78\xdc\xdc\x8c\x0a\xb0\xff\x87\
-\xf2\x5f\xd1\x88\x8a\x08\x3f\x55\x92\x79\x03\xa5\x60\x4f\x4e\xec\
-\x79\x63\xb0\x3d\x36\x1d\xe9\x0d\xb2\xc5\x3e\x43\x1d\xe1\x19\x72\
-\x16\xdf\x90\x93\x79\x86\x92\xae\x1f\x47\x99\x31\x67\xd0\x9d\x2b\
-\x47\xdb\x7c\x7d\x7c\x8f\x4c\x18\x1f\x4c\xf9\xaf\x50\x7c\xbe\x72\
-\x05\x19\xff\x1b\xeb\xaa\x91\xba\xae\x46\x18\xf6\xf0\x06\x39\xdb\
-\x3e\x43\x35\x4e\xe6\x17\xaa\xb6\xb7\xef\x47\x3e\x1e\x36\x36\x40\
-\xfe\x9f\x0e\xe3\xbf\x17\x1d\xff\x15\x8c\x55\x2b\x96\x9d\x32\x9a\
-\xff\x0b\xc1\xde\x75\x00\x5a\x17\x50\xbe\x2e\xe8\x44\x75\x01\xec\
-\xff\xcb\xc5\xfe\x3f\xca\x7f\x45\x43\x36\xff\x1d\x51\x07\x1c\x51\
-\x03\x9c\xad\x2e\xe8\x24\x1a\xc0\xf0\x1f\xd7\xff\xbc\x0e\x4f\x0a\
-\x01\xfe\x4f\xa7\xfc\x57\x22\x9c\x9a\xff\x54\x03\x7e\x34\x1a\xc0\
-\xe5\xff\xec\x69\xd3\x7b\x53\xfe\x5b\x1f\x66\xf3\xdf\x51\xb5\x40\
-\x51\x1d\xa0\x5a\xe0\x68\x60\xf3\x1f\xe7\xff\x33\xa7\x4e\xeb\x05\
-\x73\x00\xca\x7f\x2b\xc3\x2a\xfe\x3b\x9a\x06\x38\x6a\x3e\xe0\x8c\
-\x3a\xe0\x00\x9c\xa7\xfc\xb7\x7d\xac\x5a\x6e\x25\xff\x1d\x51\x07\
-\x68\x2e\xd0\xe9\xf2\x00\xe6\xfa\xdf\xd4\xb6\x31\x1e\x5e\x87\x80\
-\xff\x81\xc0\xff\xde\x94\xff\xd6\xc7\xe7\x2b\x56\x70\xfc\x3f\x16\
-\xa2\xc1\x01\x7c\x42\xd4\x37\xa4\xbc\x5f\xc8\x41\x3c\x43\x8f\x9b\
-\x35\x64\xff\x1f\x2f\x4f\xca\x7f\x25\x23\x6a\x71\xf8\xa9\xe2\x8c\
-\xeb\xcc\xfe\x3f\x56\x7b\x6a\xce\xb1\x7c\x26\x12\xde\x15\xfd\x1e\
-\x40\xac\xd7\xba\xf7\x6c\xe1\x19\x52\xe2\x6f\xfb\xb1\xfa\x85\xec\
-\x7c\x5f\x32\x9d\xff\xe7\xf6\x95\x23\x6d\x3e\x63\x7d\x29\xff\x15\
-\x0c\xdd\xf8\xdf\x28\xe6\xfd\x31\x0b\xb5\x0c\xec\xed\x0f\xa2\x7e\
-\x21\xdb\xf8\x86\xaa\xec\xe7\xff\xc1\xf9\x3f\x1d\xff\x95\x8d\x95\
-\xcb\x97\x9d\x54\x64\xfe\xef\xc8\xf5\x00\x5a\x17\x74\xfa\xba\xa0\
-\x6e\xfe\xef\x45\xe7\xff\x8a\x86\xcd\xf8\xef\x88\x3a\x40\xeb\x82\
-\x4e\x5b\x1b\xa4\xfc\xb7\x4d\xd8\x9c\xff\x8e\xa6\x01\x34\x17\x70\
-\xca\x5c\x40\xb7\xfe\xe7\xe5\xe9\x79\x30\x24\x20\x28\x60\xe6\xb4\
-\xe9\x94\xff\x0a\x04\xc3\x7f\x04\xfc\xb7\x11\xf7\xa9\x16\x38\x89\
-\x16\x58\x91\x0b\x74\x80\x16\x18\xf1\x3f\x30\x28\x60\xc6\x94\xa9\
-\x74\xfd\x5f\x81\x30\xe6\x7f\x8d\x08\xa8\x06\xd0\x39\x81\xfd\x34\
-\x80\xf2\xdf\x36\x21\x9f\xff\x0a\x6b\x82\xbd\x39\x4f\x35\xc0\xa9\
-\x34\x40\x37\xff\xf7\xf4\xf0\xa0\xfc\x57\x30\x56\xad\x58\x71\x92\
-\xf1\xff\x60\x1f\x4f\xa3\x99\xa0\x7e\xa1\xce\xe7\x17\x72\xcc\x3d\
-\x86\x74\xfe\x1f\xca\x7f\x65\x23\x72\x71\xf8\xc9\xd2\xcc\x9b\x28\
-\xe5\x1e\xde\xf3\xe7\x82\x82\x38\x2f\x8e\x98\x73\x8e\xb9\xcf\x90\
-\xa2\x7b\x0c\x51\xcf\x90\x12\x9e\x21\xc3\xfe\x3f\x47\xda\xc6\x7a\
-\xfb\x1c\x0c\x09\x08\xa4\xfc\x57\x28\x56\x2e\x8b\x3a\x6e\xf0\xff\
-\xd4\xda\x10\x32\xfd\x43\x62\x1e\x9e\x8e\x06\xbd\x37\x99\x32\xfb\
-\x0c\x55\x29\xe7\xff\xc1\xe3\x7f\x68\xe0\xf8\x80\xe9\x93\x27\xf7\
-\x9c\x33\x7d\xc6\x6f\x22\xc2\x17\x50\xfe\x5b\x11\x2b\xa2\x22\x8f\
-\x5b\x3e\xff\xb7\x14\x4e\x52\x17\xa0\x7e\x01\x87\xa9\x09\x18\xe6\
-\xff\xee\x94\xff\x0a\x86\x7d\xf8\x2f\xa1\x03\xf6\xe6\xbd\x33\xd4\
-\x06\x7f\x64\x6b\x84\x94\xff\xb6\x89\xe5\x76\xe5\xbf\x88\x0e\xd8\
-\x9b\xf3\xce\xa0\x01\x3f\xa2\xf5\x01\xca\x7f\xdb\x84\x63\xf0\x5f\
-\x48\x13\x1c\x80\xf7\xce\xa0\x03\xce\xa8\x05\x94\xff\x0e\x11\xcb\
-\xa3\xa2\x1c\x94\xff\x9c\xdc\xc0\xde\xbc\xb7\x99\x06\xd0\x7c\xc0\
-\x0c\xfe\xb7\x7a\xba\xb9\x1f\x08\x0d\xa2\xfc\x57\x2a\x1c\x9f\xff\
-\x2c\x1d\xb0\x37\xef\x69\x2e\x60\x37\x0d\x30\xf0\xdf\xed\x40\x48\
-\x60\x90\xff\xf4\xc9\x53\x7a\x51\xfe\x5b\x1f\xcb\xa2\xa2\x8e\x59\
-\xee\xff\xe9\x48\xe8\xbc\x43\xd8\xab\xa3\xb2\xbf\x57\x88\x7a\x86\
-\x3a\xd4\x33\xa4\xf5\xff\xb4\x7a\xba\xbb\x1b\xf1\x7f\x49\xf8\x42\
-\xca\x7f\x2b\x62\xc9\xc2\x79\xc7\x4a\x32\xbf\x43\x29\xd1\x0a\xf9\
-\x54\xac\x81\x39\xfe\x22\x47\xf1\x0b\x39\x83\x67\xc8\x59\xfc\x42\
-\x02\x9e\x21\x96\xff\xa7\xd5\x7b\xcc\xd8\x03\x21\x01\x41\xfe\x33\
-\xa7\x4e\xed\x05\xf8\xf5\xcc\x69\x53\xbb\xd9\x9b\x43\xce\x1c\x2b\
-\x97\x2d\x3f\xc6\xf8\x7f\xb0\x47\xa7\xce\xce\x30\xc7\x4f\xa4\xfd\
-\x19\x7b\x7b\x84\x6c\xea\x19\x72\x66\xbf\x90\xb2\x9e\x21\xad\xff\
-\x47\x3f\xfe\xeb\xf9\x3f\x95\xf2\xdf\x9a\x58\xa1\xcd\xff\x1d\x7f\
-\xfe\x2f\x80\x9a\x1a\xfb\xd7\x01\x1c\xbd\x26\xd0\x09\xea\x82\xda\
-\xeb\xff\xf0\xfc\x7f\x1f\xf6\xff\x53\xfe\x2b\x13\xcb\x23\x97\x3a\
-\x37\xff\x89\x06\x54\x6b\xe1\x00\xfc\x77\x54\x0d\x70\x46\x1d\x10\
-\xe1\xff\xf4\xc9\x94\xff\x4a\xc4\xf2\xc8\x48\x26\xff\xaf\xc1\xde\
-\xfb\x5a\x23\x34\x12\x38\x00\xbf\xcd\xd2\x01\x07\xe0\xbf\xe2\x1a\
-\xf0\x23\xce\x05\x38\xfc\xf7\x02\xfe\x07\x07\x04\xfa\x4f\x9b\x34\
-\xb9\xe7\xac\x69\xd3\x28\xff\xad\x8c\xe5\x51\x5a\xfe\xd7\x9a\xf2\
-\x5f\x0a\x8d\x26\x70\x00\x0d\x30\xd2\x01\x07\xd1\x03\xaa\x05\x56\
-\xeb\x40\x7b\x23\xf0\x3f\x3d\xb5\xcd\xd3\xcd\x7d\xef\x78\xbf\x00\
-\xbf\x19\x53\x28\xff\x95\x08\x23\xfe\x8b\xd5\xdb\xcc\xd6\x03\x47\
-\xd1\x01\xaa\x01\x9d\x41\x03\xf4\xfc\x77\x05\xfe\xfb\x53\xfe\x2b\
-\x15\x90\xff\x1f\x91\xc5\x7f\x33\x35\xc1\x34\x37\xb0\x93\x26\x38\
-\x92\x06\x28\xae\x03\xce\xac\x01\xe6\xe9\x80\x81\xff\x6e\xc0\xff\
-\x40\xbf\x69\x93\x26\xf5\xa4\xf3\x7f\xeb\x63\x79\x54\x14\xe1\xbf\
-\xa6\xa1\x11\xa0\x36\x0f\x8d\x3c\xa8\x37\x45\xb3\x1e\x76\xf2\x0d\
-\xa9\x1a\xec\xef\x13\x72\x74\xcf\x50\x87\xfb\x85\xcc\xf3\x0c\x3d\
-\xd6\x68\x50\x41\x56\x26\x93\xff\x03\xff\xa7\x4e\x9c\xd4\x73\xc6\
-\x14\xca\x7f\x6b\x23\x62\x41\xd8\x91\x92\xac\x1b\x28\xc5\x56\x5e\
-\x1a\x23\x5f\xcb\x05\x16\x78\x7c\x2f\x8a\xee\x3f\xc4\xf5\x0b\x9d\
-\x37\xc0\xde\x7e\x21\xc5\x3d\x43\x0a\x7a\xb0\x1c\x70\x9f\xa1\xa4\
-\x1b\xc7\x51\xe6\xbd\x33\xe8\xee\xd5\xa3\x6d\xde\x5e\xde\x7b\x03\
-\x7d\xfd\x28\xff\x15\x8a\xe5\x51\xcb\xc8\xf8\xaf\x56\xd5\xa1\x26\
-\x95\xca\xc6\x80\xdf\x51\xc7\x40\x0d\x63\x8e\x29\x2c\xf1\x01\x59\
-\x80\xda\xce\xbc\xcf\x90\x42\x9e\xa1\x1a\xc7\xf2\x0c\x3d\x54\x37\
-\xa0\x3c\xc8\xff\xdd\xdd\x5c\xf7\x04\xf9\xf9\x53\xfe\x2b\x14\xcb\
-\xa3\x22\x0f\x5b\x3c\xff\xb7\x9a\x87\x42\x75\x02\x1b\xd7\x0b\xf4\
-\x35\x01\x07\xa9\x0b\x38\x62\x4d\xc0\xc1\x6a\x83\xba\xf9\xbf\x87\
-\xab\xdb\x9e\x40\x3f\x3f\xdf\x29\x13\x26\x7e\x3a\x93\xf2\xdf\xea\
-\xb0\x2b\xff\x59\x10\xd7\x01\x1b\x68\x01\xd5\x00\xa7\xd2\x00\xca\
-\x7f\xdb\x84\xa3\xf0\x5f\xbe\x0e\x28\xac\x05\x9d\x56\x03\x14\xd4\
-\x01\x07\xd0\x00\xca\x7f\xdb\xc4\xf2\xa8\x28\x2d\xff\x6b\x3b\x6e\
-\xfe\xad\xa8\x16\x28\xa4\x07\x8e\xa4\x03\x8e\x9a\x0f\xd8\x71\x9d\
-\x90\xf2\xdf\x36\x01\xe3\xff\x21\x53\xfe\x5b\x7b\x6d\x5e\x47\xd7\
-\x09\x14\xd2\x02\xaa\x01\x0e\xab\x03\x94\xff\xb6\x09\xf9\xfc\x77\
-\x00\x3d\x10\xf5\x16\x29\x98\x0f\x74\x5a\x0d\x70\xde\x5c\xa0\xbd\
-\xb1\x01\xf8\x9f\x06\xfc\x1f\x4d\xf9\xaf\x60\xac\x58\x16\x45\xf8\
-\xdf\xd2\xa0\x06\x34\x19\x41\x23\x0a\x33\xbd\x42\x4a\xc2\xc4\x57\
-\xc4\x85\x12\x9e\x21\x07\xf0\x09\x39\xba\x67\xa8\x03\x7d\x43\x8f\
-\x35\x2d\xe4\xfe\x5f\xee\xa3\x5d\x29\xff\x15\x8c\x25\x0b\xc3\x0e\
-\x96\x66\xdf\x24\xbe\x98\xb4\x7b\xd2\x48\xd5\xe3\x22\x0b\xe7\x79\
-\x20\xdf\x0b\x93\x16\x77\xd1\x7c\xe8\x7e\x77\xac\x14\x94\xf0\x0c\
-\x39\x80\x5f\xc8\x19\x3c\x43\x36\xf2\x06\x25\xdd\x38\x81\x32\xe1\
-\xef\xbf\x73\xe5\x68\x9b\x97\xa7\xd7\x9e\x00\x5f\x5f\xca\x7f\x85\
-\x62\x65\x54\xe4\x01\x66\xff\x3f\x95\x76\x6f\x3d\xb9\x60\xfb\x7a\
-\xea\x79\x50\xc7\x82\x0c\x5f\x90\xa5\xa8\x63\x7b\x8a\x6c\x35\x57\
-\x71\x30\xbf\x90\xa3\x7a\x86\xcc\xf6\xfa\xc8\xc7\x43\x75\x23\xb9\
-\xff\xb7\x9b\xeb\xe8\xdd\x74\xfc\x57\x2e\x56\x44\x2e\x25\xfc\xc7\
-\xfd\x9c\xcb\x27\x73\x60\xd7\x5a\x41\x47\x5c\x9b\x6c\xef\x3a\x80\
-\x33\xd4\x06\x6d\x3c\xff\xc7\xfb\xff\xbb\x8d\x76\xd9\x1d\xe8\xeb\
-\x3b\x6e\xca\x84\x09\x9f\xce\x9c\x46\xf9\x6f\x6d\x98\xf0\xdf\x0a\
-\x0d\xb0\xab\x16\x74\xc4\x35\xc9\x8e\x54\x17\xfc\x91\x69\x00\x97\
-\xff\x93\x42\x42\x7a\x4c\x9f\x3c\xe5\x37\x94\xff\xd6\x85\x81\xff\
-\xc2\x79\xb5\xb3\xeb\x00\xd5\x80\x0e\xd6\x00\x1b\xe8\x00\xe5\xbf\
-\x6d\x62\xc5\x52\x36\xff\x05\xe6\xe4\x0a\x68\x81\xb8\x26\x74\x5c\
-\x3e\xa0\xdc\xde\x66\x0e\xc0\x7d\x9b\xe9\x80\xe3\xe5\x03\x64\xfd\
-\x0f\xf8\xef\x4e\xf9\xaf\x68\x2c\xd7\x8d\xff\xbc\x75\x3a\xe5\x73\
-\x02\xc7\xd3\x01\x6b\x34\xc0\xc1\x72\x81\x4e\x9c\x0f\x50\xfe\xdb\
-\x26\x8c\xf8\x5f\xaf\x32\x45\x87\xe7\x02\x36\xd0\x01\xc9\xbd\xcb\
-\xac\xd4\x00\x47\xd3\x81\x4e\x98\x0b\xb0\xf9\x1f\x40\xf8\x1f\xda\
-\x63\xca\x84\x49\xef\xcc\x98\x32\x85\xf2\xdf\x8a\x58\xb1\x7c\x19\
-\xe1\x7f\x8b\xba\x09\xb5\x34\x35\x0b\xa0\xc9\x00\x75\x93\x89\x4f\
-\xc8\x5a\xd8\xdc\x5b\xc4\xb3\x27\x91\x31\x1a\x09\xac\xbf\x2f\x99\
-\x83\xc1\x11\x3d\x43\x56\xf8\x7f\x0a\xb0\xff\xc7\x75\x34\xe1\xff\
-\x64\xe0\xff\xe4\xd0\x89\x94\xff\x56\x46\xc4\x82\xb0\xbd\x65\x0f\
-\x6e\xa1\xd4\x7b\x17\x50\x5a\xac\x10\x2e\x71\x5e\xcb\xf3\x0a\xc9\
-\x46\xdc\x25\x09\x58\xe0\x0f\xe2\xf1\x0b\x11\xc4\x0a\xc1\xda\x3d\
-\x86\xce\x33\x70\xa4\xfb\x92\xb1\x3d\x43\x8e\x78\x5f\x32\x99\x9e\
-\x21\x83\xff\xe7\x58\xab\xa7\xa7\xd7\x4e\x3f\x1f\x1f\x9f\x89\xc1\
-\x21\x30\xfe\x53\xfe\x5b\x1b\xcb\x97\x45\xee\x25\xfe\x9f\x06\xd0\
-\xf9\x86\x06\x01\x70\x8f\xd5\x1b\xa3\x9e\x05\x8b\xc6\x2a\x95\x11\
-\x6c\xe6\x15\x92\x35\x7f\xa9\xd5\xc3\xfc\xb9\x46\x8d\x01\xf6\xf6\
-\x07\xd9\xd4\x2f\xd4\xf1\x9e\x21\xc6\xff\x93\xd6\xea\xea\x3a\x7a\
-\xa7\xff\xb8\x71\x94\xff\x0a\xc5\xf2\xa8\xa5\x7b\x45\xe7\xff\xbc\
-\xa8\x33\x86\xc5\x5c\xb3\x66\xfd\xd0\x8a\x3a\x81\x8c\x7a\x80\x0e\
-\x9d\xa2\x1e\xd0\x09\x6a\x02\xda\xf5\xbf\x56\xd7\xd1\x2e\x94\xff\
-\x0a\x86\x65\xfc\xe7\xd1\x01\x45\xc6\x5e\x73\xf9\xdf\x31\x1a\x60\
-\x9e\x0e\x54\x1b\xc3\xde\xbc\xef\x24\x1a\x40\xf9\x6f\x9b\x58\x16\
-\x19\xb9\x87\xe1\x3f\xe6\x73\x3d\x07\x0a\xe6\x02\x56\x68\x81\xcd\
-\x74\xc0\x26\x1a\x50\xed\xd8\x1a\xa0\xb8\x0e\x74\xcc\x1a\x21\xe5\
-\xbf\x6d\x42\xc7\x7f\x3c\xb7\x36\x9a\xc7\x73\x60\xaa\x0d\x5c\x9d\
-\xb0\x50\x07\xcc\xd4\x05\x9b\xec\x51\x60\xa6\x0e\xc8\xd3\x02\x1e\
-\x1d\xa0\x5a\x60\xb1\x0e\x50\xfe\xdb\x26\x96\x47\x46\xee\x96\xc3\
-\x7f\x79\x5a\x60\xc1\x9c\xc0\x02\x1d\x30\x4f\x03\x64\xea\x80\x05\
-\x1a\x20\xad\x03\x54\x03\x94\xd2\x00\xc2\xff\x74\xe0\xbf\x8b\xcb\
-\x4e\x3f\x9f\x71\x3e\x13\xc6\x07\x77\x9f\x1c\x3a\xe1\x6d\xca\x7f\
-\xeb\xc2\x12\xfe\x8b\x6b\x01\xd7\x3f\xe4\x28\x3a\x60\x1b\xfe\x53\
-\x0d\xb0\xa1\x06\x54\x57\x9a\x8e\xff\xa3\x46\x69\xf9\x3f\xbe\xfb\
-\xa4\xd0\x50\xca\x7f\x2b\x63\x59\x64\xd4\x2e\xcc\xff\x56\x75\x33\
-\x6a\x6d\xd2\x58\x85\x16\x23\x70\xbc\x43\x8d\x5a\xef\x90\x5c\xf0\
-\x9d\x2f\xcb\x3b\x64\xc5\x7e\x45\x32\x3c\x42\x62\x10\xf7\x07\x71\
-\xe1\x00\xfe\x20\x67\xf0\x0b\xa9\xd8\xfb\xff\x64\x02\xff\x5d\x28\
-\xff\x15\x8c\xc5\x0b\xc2\x76\x95\x3f\xb8\x45\xbc\x31\xe9\xb1\xca\
-\xc0\xd8\x57\x73\xc9\x80\x7b\x18\x17\x78\xc0\xf5\x04\x69\x3f\x87\
-\x3c\x5e\x12\x85\xb4\x77\xc8\x4c\x4f\x91\x84\x47\x48\x0c\xb2\xfc\
-\x41\x7c\x60\x7b\x6c\x1c\xc5\x2f\xe4\x40\x9e\xa1\xa4\x9b\xfa\xfd\
-\x7f\x5a\x3d\xdc\x3d\x77\xfa\x8e\xa5\xfc\x57\x2a\x74\xe3\x3f\xf6\
-\xf5\x30\xf7\x00\x55\x0e\xcd\x46\xa8\x37\xf6\x11\x19\x8d\x85\x2a\
-\x16\xea\x39\xaf\x25\x20\xcb\x33\x64\xa6\x9f\x48\xa6\x3f\x48\x08\
-\xb2\x3d\x42\x7c\xb0\xb7\x4f\xc8\x41\x3d\x43\x0f\x9b\x1a\x51\x6e\
-\x46\x2a\x1d\xff\x15\x8e\x65\x51\x91\xbb\xf4\xfb\x7f\xf1\xf9\xf9\
-\x14\x00\x7f\x5d\x40\x41\x7f\x9f\xc5\x75\x41\x91\xda\x80\x85\xb5\
-\x00\xab\x6a\x02\x8e\x56\x17\x70\x20\xbf\x40\xbb\x5a\x5b\xff\xa3\
-\xf3\x7f\x45\x83\x97\xff\x62\xfe\x5e\x25\x75\x40\x69\x9f\xaf\x92\
-\xfc\xb7\xa9\x06\x88\xf0\xdf\xd1\x34\xc0\x41\x6a\x83\x3a\xfe\x8f\
-\x1e\x35\x72\xa7\xdf\x58\x9f\xb1\xb8\xfe\x4f\xf9\x6f\x7d\xc8\xe2\
-\xbf\xc2\x5a\x60\x53\x0d\x50\x39\x8b\x06\x38\x51\x1e\xe0\x00\x1a\
-\x40\xf9\x6f\x9b\x58\x16\x15\xa5\xe5\x7f\x3d\x12\xbf\xfe\x47\x79\
-\x4d\xb0\xe9\x9c\xc0\x22\x1d\xb0\x64\x7d\xd0\x5a\x0d\xa0\x3a\x60\
-\x16\xff\x47\x8e\xfa\xd2\xd7\x7b\xec\xd8\xd0\xa0\xf1\x78\xfd\x9f\
-\xfa\x7f\xac\x8c\x65\x91\x91\x3b\xa5\xf9\x6f\x5b\x2d\xb0\x65\x3e\
-\xe0\x1c\x79\x80\x93\xe9\x80\x1d\xea\x02\x7a\xfe\x8f\x18\xb5\xc3\
-\xc7\x6b\x8c\x37\xe5\xbf\x32\xb1\x2c\x32\x6a\xa7\xf4\xf5\xbf\x66\
-\xea\x81\x83\xe5\x02\x54\x03\x9c\x41\x07\xa4\xf9\x9f\x0b\xfc\x1f\
-\x31\x7c\xf8\x0e\x9f\x31\xde\x94\xff\x0a\xc5\xb2\xc8\x65\x84\xff\
-\xad\xcd\x1a\xd4\xaa\x69\x41\xad\x4d\x80\x66\x73\xa0\x11\x86\x5a\
-\x0b\x59\xfe\xa1\x66\x02\xa3\x7d\x87\x1a\xf9\xd0\x64\x3e\xcc\xf2\
-\x09\x89\x78\x85\x6c\xe2\x0f\x92\xeb\x17\x6a\x30\xe8\xa5\xbd\x7d\
-\x42\x76\xf0\x0c\x3d\x6e\x69\x41\xf9\x59\x99\x94\xff\x0a\xc7\xe2\
-\x05\xf3\x76\x96\xe7\xdd\x26\x9e\x98\xf4\x78\x2d\xe2\x94\xc0\x45\
-\x03\x2c\xf0\x0f\xe1\x9f\x4b\x23\x1e\x9f\xcb\x02\x10\xf7\x05\x99\
-\xf8\x84\x2c\xf2\x0a\x75\xa4\x3f\xc8\x0c\xbf\x90\xa3\xee\x33\xa4\
-\x88\x5f\xc8\xd4\x33\x84\xfd\x3f\x59\xb1\xe7\xd0\xed\xab\x47\x5b\
-\x5d\x47\xbb\xed\x18\x07\xf9\x7f\x70\x40\xe0\x27\x93\x42\x68\xfd\
-\xcf\xda\xd0\xe5\xff\xcd\x6a\x18\xa3\xd4\x6a\x53\x34\x2a\x05\xec\
-\x2f\xd2\x41\xae\x7f\x48\xce\x9c\xc2\x7c\xaf\x90\x79\x7e\xa1\x8e\
-\xf6\x07\xc9\xf4\x09\xfd\xc8\xfc\x42\x3a\xff\xcf\x88\xe1\x23\x76\
-\x8c\x83\xf1\x9f\xf2\x5f\x99\x58\xb6\x74\xc9\x0e\xfd\xfc\x1f\x38\
-\x6a\x02\x8b\x6a\x02\x12\x50\xb4\x2e\x68\xdd\xf5\x44\x8e\xe7\x0d\
-\x72\x62\xaf\x80\x0d\xeb\x82\xfa\xf9\xff\x88\xe1\xa4\xfe\x37\xde\
-\x3f\x80\xf2\x5f\x81\xd0\xf1\x1f\x8f\xb1\x64\x8c\xe6\xd3\x00\x3b\
-\xea\x80\xbc\xba\xa0\x23\x69\x80\xd2\xfc\x77\x32\x0d\xb0\x51\x5d\
-\x90\x8f\xff\x13\x83\x43\x28\xff\xad\x0c\x3e\xfe\x73\x61\x53\x0d\
-\x90\xa1\x05\xf2\x7c\x83\x3f\x72\x0d\x70\x34\x1d\x50\x38\x17\x30\
-\xe2\xbf\xe7\x18\xef\x90\xc0\xa0\x4f\x82\x03\x82\x7e\x05\xfc\x7f\
-\xde\xde\x1c\x72\xe6\x58\xb6\x74\xa9\x24\xff\x4d\x60\x4b\x1d\x60\
-\xaf\x29\x5a\x94\x0f\x58\xa7\x03\x66\xdf\x97\xa4\x43\x35\x40\xa6\
-\x0e\x74\x42\x2d\x68\xc7\xfb\xff\xa6\xa7\x61\xfe\x6f\xa7\xfc\x57\
-\x2e\x96\x2d\x8d\xdc\xc6\xf0\xbf\x11\xb8\xad\x83\x3c\x0d\xb0\xad\
-\x0e\x88\x69\x40\xbd\x4d\x73\x01\x61\x1d\x50\xd6\x1b\x68\x19\xff\
-\x9d\x54\x03\xac\xd4\x01\x3d\xff\x87\x0f\xdf\x3e\xd6\x63\xcc\x18\
-\xca\x7f\x65\xc2\x98\xff\xba\x5a\x7d\xa3\x00\x3a\x5a\x07\x84\x7d\
-\x45\xd2\x73\x02\xeb\xf9\x6f\xbd\x06\xd8\x2a\x07\xf8\xf1\x69\x00\
-\xe5\xbf\x6d\x62\x59\x54\x14\xe1\x7f\x9b\xa6\x15\xb5\xb5\xb4\x31\
-\x68\xd6\xa1\x95\x79\x5f\x8f\x16\x7e\x34\x69\x61\x96\x6f\x48\x02\
-\x4d\x5a\x6f\x11\xdb\x23\xc4\xf1\x15\xb5\xa8\x9b\x0d\x30\xf1\x0b\
-\x99\xe1\x0f\x92\x71\x4f\x33\xcb\xbc\x41\x4a\x79\x82\xcc\xf5\x09\
-\xb1\xe1\x00\x1e\x21\x05\xfc\x42\x8f\x5b\x5a\x51\x7e\x56\x16\xe5\
-\xbf\xc2\xb1\x78\x7e\xd8\xb6\x8a\xfc\x68\x94\x1e\x7f\x05\x65\x24\
-\xf0\x20\xfe\xb2\x4c\x5c\x42\x19\x71\x0c\x94\xf0\x0f\x65\xc4\xeb\
-\x1e\xaf\x30\x9f\xcd\xf3\x3b\xd3\xe3\x04\x60\xa9\x4f\x48\xe4\xfb\
-\xc8\xda\x3b\x48\xd0\x17\x24\xec\x0d\x52\xe4\x9e\x63\x72\xe0\x48\
-\x7b\x0c\x99\xb9\xcf\x50\xd2\xcd\x93\x28\x0b\xfe\x86\xdb\x57\x8f\
-\x61\xff\xcf\x76\x6f\xca\x7f\xc5\x22\x4a\x9b\xff\x6b\x9a\xc4\xee\
-\xff\xa9\x85\xec\xbd\xfb\x1a\x09\x98\x39\x83\xb5\xbe\x21\xdd\x67\
-\x08\xac\x4d\x48\xce\x19\x2c\xf3\x07\x09\xc1\x72\x5f\x90\xb0\x37\
-\xc8\xa2\x7b\x17\x58\xe2\x15\x72\x44\xcf\x90\x4c\xdf\xd0\xc3\x26\
-\x35\xca\xcd\x48\x6b\x1d\x39\x7c\xc4\xf6\x31\x1e\x1e\x63\x82\xfd\
-\x03\x3f\x06\x0d\xa0\xeb\x7f\x56\x46\xd4\x92\x25\xcc\xfc\xbf\x51\
-\xc0\xff\x67\x04\xa1\xba\x00\x07\x46\x1e\x3e\x1b\xd6\x03\xb4\x10\
-\xdf\x7f\xd8\x8c\x5a\x80\x24\x7f\xd9\x35\x01\x4b\xae\x11\x12\xae\
-\x09\x58\x5e\x07\x30\xb3\x1e\xe0\xa4\x35\x01\x3c\xff\xcf\x49\x4f\
-\x6d\x19\x3e\x7c\xd8\x36\x6f\x0f\x2f\xe0\x7f\x00\xe5\xbf\x02\xb1\
-\x2c\x32\x72\xab\x7c\xfe\x6b\x35\x40\x07\x99\x1a\xa0\xac\x0e\x58\
-\xa2\x01\xca\xd4\x02\x4d\x75\xc0\x12\xfe\x3b\x88\x06\x38\x9a\x0e\
-\x98\xc3\x7f\x77\x0f\xaf\xe0\x00\x3a\xfe\x2b\x11\xcb\xcd\xe6\x3f\
-\x47\x03\xc4\xb4\xc0\xae\x1a\xc0\x5d\x23\xec\x20\x0d\x90\xc5\x7f\
-\x7e\x0d\xb0\x9e\xff\x4e\xae\x01\x22\x3a\x40\xf9\x6f\x9b\x80\xfc\
-\x7f\x8b\xf9\xfc\x97\xd0\x02\xae\x2e\xf0\x5e\xdb\x63\x1b\x1d\x10\
-\xbe\x2f\x91\xca\x86\xf7\x27\xb4\x54\x03\x4c\x75\xc0\x2e\x1a\xe0\
-\x68\x3a\x20\xc6\xff\x61\x43\xb7\x7a\xbb\x7b\x52\xfe\x2b\x14\x4b\
-\x16\x2f\xde\x6c\x1d\xff\x65\x68\x80\xda\x34\x27\xe8\xd8\x3c\x80\
-\xa3\x01\x8a\xdf\xaf\xd8\xd2\x79\x80\xa9\x06\x28\xc3\xff\x4e\xa0\
-\x01\x1c\x1d\xc0\xfc\x7f\x00\xfc\x1f\x09\xfc\xf7\x72\x73\xf7\x0a\
-\xf2\xf3\xa7\xfc\x57\x20\x0c\xfc\xc7\x3c\x6e\xb2\x42\x03\xcc\xd0\
-\x01\x45\xf3\x00\x7e\x0d\x68\x56\x42\x03\xcc\xc8\x01\x3a\x8d\x06\
-\x38\x9a\x0e\x50\xfe\xdb\x34\x96\x45\x45\x6d\x66\xfc\x3f\xed\xa8\
-\xad\xa5\xdd\xe0\x01\xb2\x08\xad\xf2\x81\xfd\x44\x4d\xad\xc4\x37\
-\xc4\xbb\xe7\x50\x13\xeb\x51\x14\x02\xfb\x09\x35\xeb\x3c\x42\x6c\
-\xe8\xfc\x42\xda\x75\x4a\xf6\xbd\xc9\x2c\xf4\x05\x19\x60\x8e\x2f\
-\x48\xdc\x2b\x64\xb9\x27\xc8\x52\x8f\x90\x03\x7b\x86\xb4\xdf\xe5\
-\x31\xf4\x97\xbc\xac\x4c\xca\x7f\x85\x63\xf1\xfc\xb0\xcd\xa2\xfe\
-\x1f\x8b\x70\x59\x1e\x8c\xbc\x3c\x62\xfe\x1f\x29\xf0\xfb\x83\x44\
-\x3d\x42\x71\x9c\xdf\x69\xa1\x2f\xc8\xd8\x23\x24\xe0\x0b\x92\xdc\
-\x37\xc8\xd8\x27\x64\x9d\x27\xc8\x0a\x8f\x90\x83\xee\x33\x94\x74\
-\xfb\x24\xca\x8a\xc3\xfe\x9f\xa3\x2d\xa3\x5d\x46\x53\xfe\x2b\x18\
-\xcb\x22\x99\xf1\x5f\x43\x3c\x3e\xdc\x7b\x78\xf2\x41\x86\x4f\xc8\
-\x08\x4d\xf2\x80\xe7\x1e\xbc\x7e\x21\x39\x9e\x03\x61\x7f\x90\x61\
-\xcf\x21\xbe\xb9\x83\x6e\x8f\x21\x95\x01\x16\xfa\x82\x18\xd8\xb0\
-\x9e\xd0\x91\xfe\x20\x07\xf4\x0c\x3d\x6a\x56\xa3\x9c\x8c\xd4\x96\
-\x11\x43\x87\x6c\xf1\x72\xf3\xa4\xfc\x57\x28\x96\x45\x46\x72\xe6\
-\xff\x72\xa0\x70\x4d\x80\x55\x1f\xb4\x55\x2d\xc0\xf8\xba\x21\x2e\
-\xea\xa4\x6b\x02\xd6\x78\x02\x2c\xa8\x09\x28\x57\x03\xb0\xb2\x16\
-\xe0\x20\x35\x01\xbc\xff\x17\xae\xff\x0f\x03\xfe\x7b\xba\xb9\x79\
-\x8e\xf7\xa3\xf5\x7f\x25\x22\x6a\xc9\x92\x4d\xe6\xf3\xdf\x5c\x1d\
-\xe8\x28\x0d\x90\xe6\xbf\x2c\x1d\xb0\x25\xff\x65\x6a\x40\x23\xd5\
-\x00\x51\xfe\x07\xfa\x52\xff\x9f\x12\xb1\x24\x22\x62\x83\xe5\xfc\
-\x37\x47\x07\x64\x6a\x80\xda\x06\x1a\x20\xba\xaf\x10\x77\x7d\x40\
-\x24\x17\x50\xc2\x1f\x6c\x16\xff\xa9\x06\xf0\xf1\xdf\xc3\xd5\xd5\
-\xd3\xdf\xc7\xf7\xa3\xe0\x80\x40\x7a\xfd\x8f\x95\x11\xb9\x84\xe1\
-\x7f\x0b\x70\x14\xcf\xc3\x2d\xd7\x00\x85\xb5\xa0\x83\xf2\x00\x7e\
-\x2d\x10\xd0\x01\xb3\x3c\x41\xd6\xeb\x40\xa3\xcd\x74\xc0\x4a\x0d\
-\xb0\x83\x16\x98\xf0\x7f\x1c\xe5\xbf\x12\x11\xa9\x1d\xff\x5b\x9a\
-\x80\xff\xcd\xc6\x35\x39\x87\xd0\x00\x8b\xf7\x1d\x34\x8f\xff\xb2\
-\xf2\x01\x8b\xf8\xdf\xc9\x35\xa0\x83\x74\x80\xf0\x3f\x23\xb5\x65\
-\xe8\x90\xc1\x9b\xdd\x47\xbb\x7a\x04\xfa\xfa\x7d\x14\x30\xce\xf7\
-\x57\x33\xa7\x4e\x7b\xce\xde\x1c\x72\xe6\x88\x8c\x58\x62\xcc\x7f\
-\x1d\xac\xd2\x01\xe5\xea\x02\xd6\xef\x3b\xaa\xa0\x06\x98\x3d\x07\
-\xb0\x5e\x03\x6c\xc7\x7f\xe7\xd2\x00\x21\xfe\x8f\xf7\x0f\xa0\xfc\
-\xb7\x22\x22\x97\x44\x12\xfe\xb7\xb7\xb6\xa3\xf6\x36\x0e\x5a\x8d\
-\x61\xf0\x08\x49\x41\x49\xbf\x10\xb3\xc7\x90\x65\xf7\x26\xe3\xb9\
-\x3f\x99\x8c\xfb\x91\xf1\xaf\x79\x1a\xd6\x29\xe5\x7a\x82\x64\xdd\
-\x53\xac\x41\xbb\xce\x29\xe0\x0b\x6a\x36\x82\x92\xde\x20\x6b\xfc\
-\x41\x3c\x68\xb0\xad\xff\x07\xb5\x32\xfe\x9f\x61\x2c\xfe\x03\x7e\
-\xe5\xef\x33\x8e\xf2\xdf\x8a\x58\x38\x6f\xce\xfa\x8a\x82\x68\xe2\
-\xdb\xc9\x4c\x94\x86\x72\x1e\x21\x33\x3d\x43\xf1\x06\x4f\x50\x47\
-\xdc\x8f\xcc\xd8\x93\x73\xc9\x78\xdf\x9e\x7b\xe7\x65\x21\xd5\x08\
-\x17\x59\xcf\x05\xbc\x2e\x92\xf7\xc5\xba\xc0\x7b\x7f\x2c\xcb\x71\
-\x5e\xfb\xa8\xe0\xbd\xbb\xa2\xcf\xb0\x70\xd6\x7a\xe0\xfb\x7f\xdd\
-\x62\xfc\x3f\xb7\xae\x1c\x69\x19\x39\x62\xd4\x26\x37\x97\xd1\xee\
-\x3a\xfe\x43\x0e\x40\xf9\x6f\x45\x44\x2e\x89\x58\x4f\xee\xff\xa9\
-\x69\x06\x68\xc4\xa1\x1d\x43\xe5\xf9\x84\x6c\xe0\x19\xc2\x35\x4a\
-\x2d\x2c\xbf\x37\x59\x83\xe0\x35\x89\xa6\xd7\x28\x72\xa1\x9d\x53\
-\x70\xe7\x0d\x22\xe3\x57\x93\x1e\x2a\xce\x73\x01\xd4\x99\x42\xad\
-\x47\x1d\xeb\x51\x09\xd4\x6a\x1f\x15\xf0\x07\xe9\xc1\x9e\xd7\x28\
-\xe1\xfd\xa9\x61\xf9\x7f\xd2\x5a\x86\x0e\x1e\x4c\xf9\xaf\x60\x44\
-\x46\x2c\x5e\xcf\x3b\xff\xe7\x43\x93\x35\x75\x01\x05\x3c\x43\x8a\
-\xdd\x87\x40\xba\x0e\x20\x79\xfd\x90\xc5\xfb\x07\x9b\xef\x11\x6a\
-\x74\xa6\x3a\x80\x8d\x6a\x02\xcc\xfc\x3f\x4d\x33\x78\xe0\xa0\x8d\
-\x94\xff\xca\x45\x64\x44\x84\x7c\xfe\x3b\x84\x06\x18\xeb\x80\x55\
-\xb5\x41\xb3\x35\x40\x64\x5f\x21\xb3\xf8\x6f\xad\x06\x28\xcd\x7f\
-\xc7\xd7\x00\xca\x7f\xdb\x44\x64\xc4\x92\x75\x66\xf1\x9f\x47\x03\
-\xcc\xd3\x01\xa5\x34\xa0\xd1\xfa\x3c\xa0\x5e\x5a\x03\x44\xf9\xcf\
-\xb7\xb7\x98\x52\x1a\xd0\xe1\x39\x80\x0d\x35\x40\x01\x1d\xa0\xfc\
-\xb7\x4d\x58\xc4\x7f\x31\x2d\xd0\x5e\x5b\x6b\x73\x1d\x10\xba\x2f\
-\x89\x3d\x34\x80\x6f\x8f\x31\x59\xfc\x37\x4f\x07\x6c\xcf\x7f\x1b\
-\x6b\x80\x15\x3a\x60\xe0\xff\xc0\x0d\x6e\x2e\x6e\x1e\x01\xe3\xc6\
-\x51\xfe\x2b\x10\x06\xfe\x5b\xc0\x7d\x21\x1d\x50\x1b\xc3\x7a\xfe\
-\x0b\xe8\x80\xd0\xfd\x89\x6c\x3a\x0f\x10\xe0\xbf\x55\x1a\x20\x6f\
-\x2e\xd0\x31\xfc\x77\x4c\x0d\x60\xf3\xdf\x1d\xf8\xef\x3b\xd6\xe7\
-\xdf\xc0\xfd\x5f\x52\xfe\x5b\x17\xc6\xfc\x6f\x56\x46\x03\xd4\xfc\
-\x50\x66\x7e\x20\xc6\x7f\x0b\x35\xc0\xda\x3a\x80\xd4\x7e\xe3\xd6\
-\xe6\x00\x75\x1d\x39\x07\x70\x4c\x0d\xd0\xf1\x7f\xc8\xe0\x41\x9b\
-\x5c\x47\xb9\xba\x8f\xf3\x1e\x4b\xf9\xaf\x40\x2c\x8d\x88\x58\xcb\
-\xf8\x7f\x1e\xa2\xf6\xb6\x87\xa6\x1e\x20\x73\xa1\xf3\x0b\x69\x00\
-\x2d\xc2\xb0\xdc\x3b\xc4\xb3\x8f\x90\xc0\x3d\xca\x64\x7b\x86\xcc\
-\xf6\x04\x89\xac\x5d\x36\xf2\xdf\x27\x45\x63\xe2\x07\x32\xc3\x1f\
-\xa4\xf5\x08\x35\xdb\xdc\x0f\x64\x23\x6f\x90\x90\x5f\x48\x8e\x67\
-\x88\xed\xff\xc9\xcc\xd2\x0c\x1d\x34\x68\xa3\xeb\xa8\xd1\xc0\x7f\
-\x6f\xca\x7f\x05\x22\x3c\x6c\xe6\xda\x8a\x82\x58\x94\x91\x70\x15\
-\x65\x26\x4a\x41\x9e\x47\x48\x8f\x04\x61\x28\xe6\x19\x12\xbb\x1f\
-\x19\xf6\x0b\xc9\xf5\x0c\x99\xed\x09\xe2\xbf\x9f\x17\xe3\x0f\xba\
-\x04\xb8\xc0\x02\x9f\x1f\x88\x0b\x99\xfb\xe1\x18\xf9\x6d\x94\xf2\
-\x01\x75\x90\x37\xc8\x12\xcf\x90\xb1\xff\x47\x33\x7c\xe8\xf0\xf5\
-\xa3\x47\x8e\x72\xa3\xfc\x57\x26\x22\x97\x44\xac\x61\xfc\x3f\x78\
-\xbc\x6c\xd5\x3e\xca\x81\x84\x57\x48\x07\xd9\x1e\x5b\x0b\x7d\x44\
-\x6a\xfe\xf1\xd6\x30\xe7\x68\x34\xcc\x1d\xc4\x7c\x41\x66\xfb\x81\
-\x24\xfc\x05\x0d\xec\xf1\x8e\x33\x87\x50\xf1\xa1\x4e\xdc\x17\xa4\
-\x85\xda\xc4\x0f\x64\x2b\xd8\xc2\x1b\x64\x89\x67\xc8\xc8\xff\xa3\
-\x19\x32\x70\x20\xe5\xbf\x82\x11\x19\xc1\xf0\x9f\x70\x09\x7b\xfb\
-\x48\x0d\x40\x2e\x64\xd6\x04\xac\xaa\x07\x48\xd4\x07\x24\xf6\x08\
-\x6b\xd6\x5d\x43\x28\xe9\x15\x50\xb0\x06\x20\x50\x0f\x50\xeb\x60\
-\x69\x0d\xa0\xae\x23\xe7\xff\x1d\x58\x0b\x90\x51\x17\xd0\xd7\xff\
-\x06\x50\xfe\x2b\x19\x4b\x4c\xf8\xaf\x31\x53\x07\x3a\x5a\x03\x44\
-\xea\x82\xa2\x1a\x20\xa5\x03\xd2\xd7\x07\x5a\xc4\x7f\x8e\x47\x40\
-\x2d\xaa\x03\x94\xff\x42\x1a\x40\xf9\x6f\x9b\x88\x58\xbc\x58\x80\
-\xff\x1d\xa3\x01\xca\xef\x2f\x20\xc6\x7f\x99\x1a\x20\x7b\xcf\x30\
-\xf3\x35\x40\x2d\xaa\x01\xd2\xfc\x37\xd6\x80\x8e\xe2\xbf\xfd\x35\
-\x40\xcf\xff\x41\x83\xd6\xbb\x8c\x18\xe9\x36\x6e\x2c\xe5\xbf\x12\
-\x21\xce\x7f\x4b\xb4\x40\x02\xba\xfb\x88\x73\xf7\xfe\x55\x54\x03\
-\x8c\xd7\x0a\x9b\x4d\x34\x40\x4a\x0b\x84\x75\xc0\x62\xfe\x6b\x35\
-\xc0\x84\xff\x26\x5a\x20\x43\x03\x7e\x0c\x39\x00\x47\x0b\x58\xfc\
-\xdf\x30\x6a\xf8\x08\x57\x9f\x31\x63\xfe\x45\xf9\x6f\x7d\xc8\xe7\
-\xbf\x82\x1a\xd0\x2c\xbd\x2f\xb8\x2d\xf6\x19\x52\x42\x03\xac\xca\
-\x01\x64\x69\x80\x3c\xfe\xdb\x6e\x8f\x50\xc7\xd4\x00\x36\xff\x5d\
-\x46\x8c\x70\x1d\xeb\xe5\xf5\x2f\x7f\x9f\x71\x94\xff\x56\xc6\x92\
-\x25\x11\xab\xe5\xf3\x5f\x49\x0d\x10\xe7\xbf\x7c\x1d\x30\xdf\x37\
-\x28\x5f\x03\x4c\xeb\x02\x56\xf3\x1f\x20\xca\x7f\x55\x2d\x03\x87\
-\xe4\xbf\xfd\x34\xe0\x61\xb3\x1a\x3d\x00\xfe\x0f\x1a\x38\x70\x1d\
-\xf0\xdf\xcd\x9b\xf2\x5f\x91\x58\xb2\x78\xc9\x4a\xc6\xff\xf3\x08\
-\xb5\xb7\xc9\xc5\x43\x85\xc0\xbf\xcf\x90\x18\x4c\xf7\x20\xb2\x7c\
-\x9f\xa1\xd6\xe6\x56\xd3\x35\x4f\x93\xfb\x91\xb1\xf6\x0e\xe2\x5d\
-\x93\x34\x67\x5f\x03\x06\xb2\xf4\x4c\xe6\x7e\x41\xb6\xf5\x00\xd9\
-\xc1\x17\x64\xe2\x13\x62\x1e\x51\x7b\x3b\xca\xcd\xca\xd4\x0c\x1c\
-\x30\x60\xdd\x68\x2d\xff\x03\xc6\x51\xfe\x5b\x1b\xf3\xe6\xcc\x58\
-\x59\x95\x7f\x0f\x65\xc4\x5f\x45\x99\x09\xe6\x42\xdc\xe3\x23\x09\
-\xbd\xa7\xc8\x4c\x6f\x91\xc5\x1e\x22\xd3\x7d\x85\xd2\xe3\x75\xb8\
-\x64\x0c\x11\x8f\x90\xd0\x7d\xbb\xe4\x22\xf5\x9e\x0e\x56\x78\x82\
-\x3a\xc4\x03\x24\x86\x0e\xf0\x05\xc5\xe8\xee\xff\x75\x0a\x65\xc5\
-\x5f\x40\x37\xaf\x1c\xd5\x0c\x1b\x32\x8c\x8c\xff\x3e\x63\xbc\xff\
-\x35\xd6\x63\xcc\x2f\xfc\x7c\xc6\x3d\x6b\x6f\x0e\x39\x73\x44\x2c\
-\x5a\xb4\xd2\xd8\xff\x63\x09\xe4\x7a\x86\x64\x7a\x8a\xb8\x7b\xf6\
-\x71\x21\xea\x23\x92\x3b\x0e\x73\xeb\x8f\x02\x73\x07\xee\xde\x41\
-\x64\x4e\xc0\xb7\x37\x50\xbd\xec\xeb\x0d\x9a\xea\x75\x50\xf1\xcc\
-\x27\xc4\xf6\x1b\xe0\xdb\x27\x48\xe7\xd3\xe9\x68\x74\x84\x2f\x48\
-\xe7\x0d\xaa\x41\x8f\x5a\x35\x24\xff\xc7\xe3\xbf\x8e\xff\xde\x9e\
-\x94\xff\xd6\xc6\xe2\x85\x0c\xff\xe5\xcf\xff\x6d\x5c\x13\x90\x59\
-\x17\x10\x5e\x47\xb4\xe0\x5a\x42\xed\x75\x43\xcd\x7c\xe0\xe5\xaf\
-\x4c\xbe\x0a\xce\xff\xd9\x90\x51\x0b\xe0\xab\x09\x70\xee\x1d\xde\
-\xd9\xeb\x00\x0f\x35\x4d\x0c\xff\xfb\x0f\x58\x37\x6a\xf8\x70\xd7\
-\xb1\x5e\x9e\xff\x1c\xeb\x45\xf9\x6f\x6d\x28\xc3\x7f\x25\x75\x40\
-\xa6\x06\x88\x7a\x09\xcc\xbc\xa6\x98\x75\xdd\x20\xaf\x06\x34\xf2\
-\x8d\xdf\x96\x6b\x80\x31\xff\x2d\xd4\x00\x0e\xff\x3b\xbb\x06\xb0\
-\xf9\x3f\x92\xf2\x5f\xb1\x58\xbc\x68\xb1\x82\xfc\x57\x42\x03\x78\
-\xae\x27\x96\xc9\x7f\x83\x0e\x98\xb9\xaf\x00\x77\x0f\x11\xab\x34\
-\xc0\x12\xfe\x4b\x69\x40\x9d\x84\x06\xfc\x18\xf8\x8f\xfd\xff\xe9\
-\x38\xff\xff\x62\xc4\xb0\x61\xa3\x81\xfb\x94\xff\x0a\x44\xc4\xe2\
-\x08\x66\xfe\xdf\xcc\xec\xff\xab\x8c\x06\x58\xab\x03\x02\xfe\x41\
-\x99\x1a\x60\xd1\xde\x22\x7c\x7b\x09\x89\xe8\x80\x78\x0e\x20\x67\
-\x8f\x00\x4b\x34\x80\xa3\x05\x1c\xfe\x77\x56\x1d\x68\xa8\xa9\x42\
-\xed\xcd\x8d\xcc\xf8\x3f\x90\xf2\x5f\xc9\xe0\xf2\xdf\x31\x34\x40\
-\xc4\x43\x6c\xb3\x1c\x80\x3f\x0f\x10\xd4\x01\xd1\x3a\x40\x07\x69\
-\x80\x3e\x0f\xe8\xdc\xfc\x57\x55\x57\xa2\x36\x75\x03\xca\x4e\x4f\
-\xa5\xfc\x57\x38\xf8\xf8\xaf\xac\x06\x58\xaa\x03\x32\x34\xc0\x26\
-\xfc\xe7\xcf\x03\xf8\x35\xc0\x7a\xfe\x5b\xa5\x01\x75\x9d\x5b\x03\
-\xf0\xb8\x8f\x51\xcf\xe2\xff\xa0\x01\xfd\xbf\x18\x36\x64\x88\x8b\
-\x37\xe5\xbf\x22\xb1\x24\x62\x29\xe1\xff\xc3\xb6\x47\xe8\x61\xbb\
-\x29\xe4\x7b\x82\x94\xf6\x0b\x49\xec\x33\xd4\xc2\xda\x67\x88\x07\
-\x6d\x9a\x36\xf3\xd0\x8c\xd1\xca\x42\x8b\x09\x4c\xf6\x0d\xd2\x69\
-\xa5\x5a\x08\xcd\xc2\x68\x34\x40\x63\x82\x26\x79\x30\xf2\x05\x81\
-\x66\xd5\x1b\xc3\xa9\x7d\x41\x90\x5f\x19\xd6\x1a\x55\xe8\x71\x4b\
-\x0b\xca\xc9\xcc\x64\xf8\x3f\x78\x88\x8b\xa7\xab\xdb\x87\xde\x1e\
-\x9e\xbf\xa4\xfc\xb7\x2e\xe6\xcd\x9e\xb9\xbc\xba\x28\x16\x65\x26\
-\x5e\x43\x59\xf7\xf9\x81\x8f\x29\x07\xf1\x3d\x86\x98\xdf\x87\x1f\
-\xaf\xea\x1f\x45\x91\xc8\x0f\xe6\xf3\xcc\xf8\x5e\x09\xd7\xb4\xbe\
-\x22\x3e\x9f\xd3\x65\x02\x21\x4f\x51\x7a\xa2\xd6\x43\x14\x67\x06\
-\x62\x0d\x48\x33\xc1\x25\x79\x88\xd3\xe1\xa2\x16\x17\x18\x68\xf7\
-\x1d\x22\x1e\xa3\xd8\x8e\xc4\x79\x45\x90\x72\xef\x1c\x4a\x89\x3e\
-\x8b\x92\x63\x18\x24\xdc\x3c\x8e\xd2\xef\x9d\x45\x37\x2e\x1f\xd1\
-\x0c\x1d\x3a\x8c\xf2\x5f\xc1\x88\x58\xb4\x68\x39\xf1\xff\x82\xbe\
-\xb6\xcb\xb8\x1f\xa7\xe5\x1e\x21\x73\x3d\x43\x32\xee\x47\x26\xb9\
-\xc7\x90\x4c\x2f\x81\x7e\x3e\xd1\x6c\x74\x8f\x31\x03\x74\x73\x0a\
-\xbe\xfb\x11\x34\xe8\x21\xeb\x5a\x22\x59\xd7\x17\xcb\xbd\x96\x88\
-\x0b\xbc\x8f\x50\xad\x11\xe4\x5e\x53\xac\x0c\xac\xf3\xfa\xb0\x73\
-\x7e\x1d\x54\x55\x15\x04\xad\x8d\xf5\x28\x2b\x35\x05\xaf\xff\xad\
-\xa5\xfc\x57\x2e\x16\x2f\x64\xf8\xdf\x06\x73\xee\x36\xe0\x52\x9b\
-\x04\xd7\x3a\xb6\x26\x20\x50\x03\x90\xbd\xb7\x80\x35\xeb\x00\x7c\
-\xfb\x08\xf0\xad\x07\xd4\x1b\xa1\x49\xb0\x26\x20\xc5\x5d\x76\x2d\
-\x40\xee\xfc\x5f\xda\x97\xe7\x4c\x35\x00\xdd\x5c\x9f\x8d\xba\xca\
-\x72\x82\x96\x06\x15\xf0\x3f\x19\xf8\xdf\x9f\xf2\x5f\xc1\x58\xb4\
-\x70\xe1\x32\xc2\xff\x16\x79\xfc\xef\x58\x0d\x90\xc9\x7f\x01\x1d\
-\xb0\x88\xff\x92\xfb\x08\xc9\xe0\x3f\xaf\x06\x74\x14\xff\xeb\x8c\
-\xc6\x62\x67\xe6\x3f\x1e\xf7\x31\xf7\x6b\x2b\xca\x90\xa6\xbe\x0e\
-\x65\x52\xfe\x2b\x1e\x0b\x17\xcc\x8f\xe2\xf2\xdf\x71\x34\xc0\x4c\
-\xfe\x73\x34\xc0\x62\xfe\x0b\x68\x80\xc9\xf5\xc2\x3c\xfc\x97\xad\
-\x01\x62\x7b\x7c\x5a\xcd\x7f\x8e\x06\x74\xa8\x0e\x28\xc7\x7d\xcc\
-\x7b\x1d\xf0\x5c\x26\x23\x25\x49\x33\x70\x00\xe5\xbf\x92\x61\xc4\
-\xff\x16\x8d\x59\x1a\xd0\x71\x5a\x60\x99\x06\x28\x72\xaf\x31\xc1\
-\x7d\xc4\xd8\x5a\x60\xaa\x01\x46\x3a\x60\xa2\x05\x52\x1a\xa0\x04\
-\xff\xd9\xeb\x83\x5a\x0d\xe8\x30\x1d\x50\x86\xfb\x35\xe5\xa5\xfa\
-\x47\xca\x7f\xdb\xc4\xc2\x05\x0b\xac\xe6\x7f\xc7\xf8\x05\xcc\xcf\
-\x05\x34\x4d\xca\x6a\x80\xf8\x3e\x62\x32\x34\xa0\xc1\x5e\xfc\xe7\
-\x68\x80\xcd\x75\x40\x99\x71\x5f\x97\xfb\x57\x97\x95\x90\xef\x9f\
-\x9e\x7c\xbf\x79\x40\xff\x7e\x6b\x86\x0e\x1e\xec\xe2\x45\xf9\xaf\
-\x48\x18\xf8\xdf\xc2\xf0\x5f\x07\x0b\x34\xc0\xf6\xb9\x80\x05\xfc\
-\x37\xd9\x43\xc8\x72\x0d\x10\xe6\xbf\x85\x1a\x20\xc2\x7f\x59\x1a\
-\x60\xe6\x7d\xc5\x1a\x09\x1c\x47\x03\xc4\xe6\xfb\xec\xb1\xbf\xaa\
-\xb4\x08\xce\xaf\x42\x69\x49\x09\x26\xfc\x0f\xf0\xf5\xa3\xfc\xb7\
-\x22\x16\x2d\x58\xb8\x04\xf3\xff\x51\xfb\x63\xf4\xe8\xe1\x23\x13\
-\xf0\x79\x82\xa4\x60\x3b\xcf\x90\xf9\xf7\x23\x23\x7b\x04\xe9\xf6\
-\x0d\x32\xcb\x17\xc4\xb9\xaf\x98\x6e\xbf\x20\x41\xb4\x08\xef\x57\
-\x80\x75\x91\xbd\x47\x41\xb3\xc6\xc4\x03\x64\x8c\x26\x3d\xc4\xfd\
-\x3f\x72\xa0\x36\x02\xef\xde\x05\x76\xf0\x03\x19\xee\x5f\xc2\xd4\
-\x3c\x1b\x6b\xeb\x40\x03\x6a\x40\x03\xaa\xb5\xa8\x22\xa8\xad\xa8\
-\x24\xc0\xeb\xa8\x19\x29\xc9\xcd\x03\x06\xf4\x5f\x83\xf3\x7f\x77\
-\x97\xd1\x1f\x8e\x01\xfe\x7b\xb9\xbb\xff\xd4\xde\x1c\x72\xe6\x98\
-\x3b\x6b\xda\x92\x9a\xe2\x78\x94\x75\xff\x6b\x94\x9d\x74\xcd\x04\
-\x42\x9e\x20\x31\x58\xe3\x0f\xc2\xdf\x83\xfd\xdc\x18\xdf\x48\xfb\
-\x81\x38\xc8\x64\x83\x78\x82\xbe\xe6\x78\x8e\xa4\xbe\x93\x6e\xdf\
-\xa1\xab\xe4\x1e\x69\xf2\x70\x89\x05\xed\x3e\x43\x46\x7b\x0d\x69\
-\x11\x2b\x84\x4b\x7a\xc8\xf3\xff\x88\xe1\xa2\x11\x52\xf5\xb8\x60\
-\xc0\x3d\x16\x3a\xc0\x0f\x84\xfd\x3d\x3a\x6f\x0f\x46\xd2\x9d\x33\
-\xe8\xfe\xdd\x33\x28\xe1\xd6\x29\x94\x70\x5b\x8b\x5b\x27\x51\xfc\
-\x0d\xc0\xcd\x53\x28\xf6\xdb\xa3\x28\xe5\xf6\x69\xf4\xed\x85\x83\
-\xcd\x83\x06\x0d\x5d\x3d\x64\xd0\xe0\x51\xee\xa3\x5d\xff\x81\xfd\
-\xbf\xc1\x81\x41\xcf\xd8\x9b\x43\xce\x1c\x8b\x16\x2c\x58\xc2\xec\
-\xff\xd7\xca\x0b\x29\x3f\x50\xc7\xf9\x85\x5a\xcd\x9e\x8b\xf0\xcf\
-\x47\xb4\xd7\x39\x1b\xdd\x53\x4c\x0c\xcd\x5a\x58\xb2\x96\xa0\x36\
-\xf2\x07\x19\x79\x84\x1a\x39\xde\x20\x13\x3f\x90\x4a\x0f\xf9\xfe\
-\x1f\xf1\xf9\x84\xf0\xbc\x42\x60\x8f\x11\x85\xfd\x40\x5c\x7f\x8f\
-\x2e\xe7\xe7\xd6\xfa\x71\xce\x8f\xe7\xfc\x18\x55\xa5\xc5\xa8\xa2\
-\xa4\x88\x5c\x03\x94\x92\x10\x0f\xf9\x7f\xff\x35\xc0\xff\x11\x6e\
-\xa3\x5c\xde\x83\xf1\xff\xe7\x63\x3c\x3c\x9e\xb2\x37\x87\x9c\x39\
-\x16\xce\x9f\xbf\xc4\x30\xff\xe7\xd4\x00\x5a\xcc\xe7\x9b\xed\xeb\
-\x82\x16\xd6\x00\xb8\xb0\xa0\x26\x20\x3e\xff\x97\xb7\x3e\xc8\xbf\
-\x26\x60\x09\x67\xe5\xce\xff\xb9\x75\x40\x76\x2d\xa0\x23\x6a\x02\
-\xd2\xf3\x7d\x0c\xcc\x79\x1d\x74\xbc\xc7\xa8\x04\xee\x57\x14\x17\
-\x92\x73\x53\x12\xe2\x9a\x07\x0e\x1c\x10\x35\x7c\xf0\xd0\xc1\x5e\
-\x6e\xee\xef\x8e\xf5\xf4\x7a\x7d\xc9\x82\x85\x3f\xb1\x37\x87\x9c\
-\x39\xa4\xf8\xaf\x84\x06\xd8\xa6\x2e\x68\x25\xff\x8d\x74\x40\x69\
-\xfe\xcb\xd4\x00\xee\x9a\xa0\xcd\xf8\x6f\xaa\x01\x8d\x1d\xa6\x01\
-\xd2\x6b\x7c\x52\xdc\x2f\x2f\x2a\x20\xe7\xa7\xde\x4f\x68\x1a\x32\
-\x78\x50\xd8\xc0\xfe\xfd\x7b\xbb\x8e\x72\xf9\x93\x9b\xab\x4b\x37\
-\x7b\xf3\xc7\xd9\xa3\xa3\xf8\x6f\xaf\x5c\x40\x92\xff\x4d\xe6\xf0\
-\xdf\x1a\x0d\x68\x30\xe5\x3f\x37\x07\x30\xca\xeb\xeb\xa4\x35\xc0\
-\xa2\x7b\xfa\xca\xd4\x00\x05\x75\x80\x9d\xef\x8b\x71\x9f\xa9\xf5\
-\x9b\x72\xbf\xac\x30\x1f\xd5\x55\x94\xa3\xc4\xd8\x7b\xb5\x9f\x7c\
-\xfc\xef\xc0\x9e\x3d\x7a\x7c\x0c\xfc\xff\x9f\x80\x71\xbe\x4f\xdb\
-\x9b\x3f\xce\x1e\xc0\xff\x88\x8e\xe2\xbf\x6d\xb4\xa0\x49\x54\x0b\
-\x64\xf1\x1f\xcf\xed\x65\xcc\xef\x19\xfe\x9b\xa3\x03\xfc\xfb\x07\
-\xf1\xaf\x07\x72\x75\xc0\x94\xff\xd2\xf7\x0f\x55\x42\x03\x94\xd5\
-\x82\x86\x9a\x6a\xde\x9c\x9f\x8f\xf7\xba\xb1\x9f\xe1\x7e\x81\x96\
-\xfb\x05\xa8\x28\x37\x07\xde\x2f\x41\x59\x69\xc9\x9a\x5e\x7d\x7a\
-\xcd\xfd\xd9\xcb\x2f\xff\xf5\x93\x8f\x3e\xfa\x65\x54\xc4\xd2\xae\
-\xf6\xe6\x8f\xb3\xc7\xc2\xf9\x0b\x22\x78\xd7\xff\x6d\xc8\x7d\xdb\
-\xf9\x85\xf8\xbd\x80\x4a\x69\x80\x72\xfc\x17\xd3\x00\x16\xff\xa5\
-\x34\xc0\xa6\xfc\xb7\x7e\x4e\xc0\x70\xbf\x4a\x0b\x86\xff\xec\x1a\
-\x1f\x37\xe7\xd7\x8d\xf9\x18\x98\xf7\x18\x25\xf9\x79\xa8\x28\xe7\
-\x01\xaa\x00\xfe\xd7\x40\x0e\xe0\x1f\xe0\xbf\x1d\xba\xed\xdb\xff\
-\xf5\xc6\x1b\x6f\xf4\xec\xde\xe3\x09\x7b\xf3\xc7\xd9\xc3\xc0\xff\
-\x56\x5e\xfe\x5b\xea\x03\xb2\x5f\x5d\xc0\x74\x0f\x51\xb3\xf8\x2f\
-\xa2\x03\xca\xf2\x5f\x48\x03\x38\xfc\xe7\xd1\x80\x8e\xcb\x01\xac\
-\xd3\x01\x03\xf7\xab\x78\xc7\x7d\x76\x8d\x9f\xd4\xf9\xb5\xdc\xc7\
-\xe3\x7e\x69\x41\x01\x2a\xce\xcb\x25\xc8\xcf\xce\x42\xb5\x65\xa5\
-\x28\xe1\x5e\x4c\xcd\x6f\x7f\xfb\x9b\xfe\xd0\x6d\x7f\xfe\xec\xb3\
-\xcf\xbe\x64\x6f\xee\x74\x86\x58\xb4\x60\x61\x04\xe3\xff\x01\x3c\
-\x7c\xac\x05\xcb\x03\xd4\xae\x85\xfe\x98\x39\x90\xe7\x21\x52\xce\
-\x2f\xa4\x7b\x64\x79\x80\x74\xf7\x0d\x93\x44\x9b\x29\x74\x5e\x20\
-\xed\x7d\xc4\x5a\x35\x6c\x58\xbe\xc7\x41\x4b\xb3\x0e\x1c\x0d\xc3\
-\x7b\x06\xf1\xdd\x9f\x44\x87\x46\xf6\xb5\x4d\x2c\xc8\xf2\x01\x89\
-\x79\x82\xa4\x60\x9e\x5f\x48\x5d\x57\x4f\xd0\x58\xab\xd2\x3f\xd6\
-\x57\xd7\xb2\x7c\x3d\xd5\xa0\x05\x3a\x6f\x4f\x05\xaa\xad\xac\x04\
-\x1d\x28\x07\x94\x81\x0e\x94\x81\x06\x94\x02\xff\x8b\x00\x85\xc0\
-\xff\x02\x54\x90\x93\x8b\xca\x8a\x8b\xd1\xed\xeb\xdf\x95\xbc\xf2\
-\xca\xcf\xfe\x0f\xba\xed\xcf\x9f\x7e\xfa\xe9\x17\xec\xcd\x9d\xce\
-\x10\xb3\xa6\x4f\x5d\x5c\x53\x1c\x47\xf6\xcc\xc9\xbe\x7f\x4d\x18\
-\x3c\xde\x20\x69\x5c\x65\x70\xdf\x14\x8c\x3f\xe7\x1a\xeb\xd1\x16\
-\x7b\x0c\x19\xdf\x37\x2c\xc3\x52\xe8\xf6\xfa\x89\xbf\x82\xd2\x8d\
-\xc0\xe3\xe9\x31\xc2\x25\x5e\x88\xfa\x74\x4c\xee\x25\x76\xde\x18\
-\x92\xf7\x0c\x93\x8b\x73\xc4\xef\x63\xec\x09\x92\x82\xb4\x67\x28\
-\x05\x3e\x3b\x39\xe6\x9c\x1e\x49\xd1\x67\x89\xb7\x27\xf1\xce\x69\
-\x83\xb7\x07\xc0\x78\x7b\xb4\xfe\x9e\xef\x8e\xa3\xd8\xeb\xc7\xd1\
-\xbd\xeb\x5f\xa1\xe8\x6f\x8f\xa3\x3b\x5f\x1f\x43\x77\xaf\x1d\x45\
-\xb7\xaf\x1c\x41\x37\xaf\x1c\x42\x5f\x9f\xdb\x8d\xee\x7e\x73\x1c\
-\x7d\xfb\xf5\x85\xc2\xd7\xde\x78\xe3\x2f\xd0\x6d\xdf\x7a\xe6\x99\
-\x67\x68\xed\x5f\x81\x58\x10\x1e\xbe\x98\xf1\xff\xb4\x09\xdc\x73\
-\xb3\xcd\x0a\xf0\x7b\x8a\xf4\x68\x69\x15\xdc\x73\x48\xb9\x3d\x86\
-\x34\x46\x5e\x5c\xf9\xf5\x44\x1e\x34\x31\x7b\xf7\x69\x8c\xc0\xf5\
-\x12\x48\xfb\x0a\x8c\xe7\x11\x3c\xf3\x0a\x89\xbd\x83\x78\xeb\x86\
-\x2a\x73\x21\xb1\xb6\x28\x09\x53\xcf\x10\x3b\xe7\x57\x55\x55\xea\
-\x51\x5b\x51\xae\x45\x99\x3e\xe7\xaf\x86\x7c\xbe\xbc\xa4\x00\x55\
-\x94\x14\x12\x94\x15\x15\x92\xb9\x3e\xce\xf7\x0b\x72\xb2\x51\x6e\
-\x76\x26\xca\xce\x48\x47\x69\xf7\xef\xa3\x8c\xa4\xfb\x28\x3d\x33\
-\x19\x7d\x7b\xf9\xca\xfd\x57\x5f\x7b\xf5\xcf\xd0\x6d\xdf\x78\xeb\
-\xcd\x37\xa9\xef\x57\x81\x98\x3f\x8f\xe1\xbf\xb0\x87\xaf\xc5\x0a\
-\xf0\xd4\x13\x78\xea\x0b\xb6\xab\x0b\x34\xeb\x6b\x00\x46\xf7\x14\
-\x37\xb7\x16\xc0\xae\x09\x68\xef\x05\x28\xaf\x0e\x20\x72\xff\x00\
-\x41\x70\xf7\x0a\xa9\x33\x81\x5a\x07\x05\xeb\x00\xe2\xf3\xff\x3a\
-\x16\x78\xbc\x7d\xb5\xba\x3d\x87\xab\x8d\xeb\xfc\x5a\xd4\x94\x97\
-\x69\x61\x58\xdf\xab\x2e\x2d\x41\xe5\xb8\xc6\xaf\x45\x69\x61\x21\
-\xe1\x7e\x51\xee\x03\x94\xff\x20\x0b\xe5\x66\x65\x68\xf9\x9f\x80\
-\xb2\x53\x53\x48\xed\xe0\xd0\xa1\x7d\xe9\xc0\xff\xff\x7e\xf5\x95\
-\x57\x7f\xe6\xe5\xe6\x4e\x6b\xff\x0a\xc4\xc2\xf9\x0b\x24\xf8\x6f\
-\xa9\x06\xc8\xe0\xbe\xc4\x1a\x83\xa2\xeb\x02\x4a\x69\x80\x09\xff\
-\x2d\xd0\x80\x06\x31\x0d\xa8\x97\xd4\x00\xb5\x62\x1a\x60\xca\xff\
-\x06\x2d\xd8\x9c\x17\xbb\xa6\x18\xa3\xa1\x16\xc6\xfc\x5a\xf6\xfa\
-\x7e\xb9\xfe\x3a\x3e\x7d\xbd\x1f\xc6\x7b\xcc\x79\x8c\xca\x92\x62\
-\xe0\x7c\x21\xe1\x7d\x59\x51\x01\x2a\x29\xc8\x47\xc5\x30\xf6\x17\
-\xe4\x3c\x40\x79\x30\xee\xe7\x64\x66\xe0\xbd\xfe\x50\x76\x4a\x32\
-\xba\x73\xe3\x3b\xb2\x0e\x10\x1f\x7b\x0f\xad\x5e\xbe\x22\xea\x6f\
-\x7f\x7d\xf7\xf5\x21\x83\x06\x53\xcf\xbf\x42\x21\x8f\xff\x96\xe8\
-\x80\x23\xf1\x9f\xb5\x26\x60\x8d\x06\xa8\x85\x72\x00\x31\x0d\xb0\
-\x94\xff\x02\x6b\x01\x5c\xfe\xd7\x5b\xc3\xff\x3a\x7d\x4d\xbf\xbe\
-\xa6\x1a\xd5\x41\xde\xae\x03\xe6\xb4\x0a\xe7\xf2\x78\x0d\xcf\x08\
-\xf8\x18\xf3\xc8\xa0\x92\x3c\xe2\x71\x1e\x7b\xf4\x0d\xe3\x7d\x29\
-\x2b\xe7\x2f\xd5\xaf\xef\x55\x92\xfa\x7e\x21\xf1\xf4\x10\xde\xe7\
-\xe5\xa1\xc2\xdc\x1c\x18\xf3\xb3\xc9\x98\xff\x20\x2b\x13\x65\xa5\
-\xa4\xa0\xac\xa4\x24\x74\xfb\xdb\x6f\xd0\xcd\x6f\xbe\x26\x9f\xbf\
-\x65\xd3\x86\xc3\xdd\xbb\x7f\xf4\xea\x90\x81\x83\x5e\xb6\x37\x67\
-\x3a\x53\x98\xc7\x7f\x73\x34\xc0\x7a\xfe\x5b\xaf\x05\x22\xfb\x09\
-\x59\x3b\x0f\x60\x69\x81\xd9\x79\x40\x83\x98\x06\x08\xf9\x82\x44\
-\xf8\xcf\x86\x59\xdc\xaf\x65\x78\x0f\x73\xf4\x9a\xf2\x72\x54\x45\
-\xc6\xe5\x22\x86\x9f\x80\x72\xbc\x1e\x0f\xef\x55\xc2\x98\x5d\x85\
-\xc7\x6f\x9c\xbf\x97\x01\xb7\x61\x6c\xaf\x06\x8e\xe3\xf7\xf0\x6b\
-\xfc\x9c\x1c\x2b\x87\xb1\x1d\xf3\x1c\xe7\xf8\x65\x25\xe4\xe7\xf0\
-\xcf\xe3\xcf\x2a\x05\xbe\x97\x02\xdf\x4b\xf1\x7a\x7e\x6e\x2e\x2a\
-\x84\xb1\xbe\x00\x38\x8f\x73\x7d\x3c\xde\x67\xa7\xa7\xa1\x8c\xd4\
-\x34\xc8\xf7\x13\x09\x6e\xc3\xb8\xff\xd5\x91\xc3\xa8\x0a\xbe\xcf\
-\xa1\x03\x07\xe2\x06\x0d\x18\xf8\x8b\x7f\xff\xeb\x5f\x2f\x8d\x71\
-\xf7\xa4\x7e\x7f\x05\x63\x7e\x78\xf8\x22\xf3\xf8\x2f\x57\x07\x94\
-\xe3\xbe\xe5\x3a\x20\xbe\xb7\xa0\x45\xdc\xe7\xd1\x80\x66\xb5\x99\
-\x79\x00\xf7\x7e\xe2\xb2\xf8\xaf\x92\xc7\x7f\x33\xf2\x00\xcc\xfd\
-\xda\xca\x0a\xe2\xad\xc3\xdc\x2c\x84\xb9\x77\x2e\x8c\xbf\x39\x19\
-\x30\x0e\x03\x72\x33\x33\x21\x1f\xcf\x02\x8e\x02\x57\x81\xb3\x45\
-\x79\x79\x64\xbc\xc6\xc0\xeb\xf3\x15\xc5\xc5\xe4\x67\x71\x3e\x5f\
-\x86\xe7\xef\xc0\xed\x12\x3d\x72\xc9\xb8\x5e\x98\x07\x63\x3b\x70\
-\x3d\x9f\xe4\xf6\x78\x8c\xc7\x7c\xcf\x84\x71\x3e\x1d\x65\xa5\xa5\
-\xa2\xcc\xf4\x14\x94\x9e\x9c\x84\x52\x12\x13\x50\x62\x6c\x2c\x4a\
-\x8a\x8f\x43\x37\xbe\xbe\x86\xf6\xed\xdd\x45\x7c\x3f\x09\xf7\xee\
-\x95\xb9\xb9\xba\xf6\xea\xf1\xf1\x27\xaf\xf7\xec\xde\x9d\xfa\x7d\
-\x14\x8e\xf0\x79\xf3\x16\x5a\xc6\x7f\x65\x34\xc0\x76\x9e\x21\x79\
-\xf7\x19\xb3\x98\xff\x82\x1a\x20\x23\x07\x30\xb9\x3f\x80\x80\x1f\
-\x48\x40\x03\x44\xf9\x6f\xc6\x7c\x00\xe7\xf7\x78\xdc\xc6\x63\x73\
-\x4e\x66\x3a\x70\x31\x15\x5f\x63\x83\x92\x12\xe2\xd1\x7d\xe0\x21\
-\x46\x72\x62\x3c\x4a\x4d\x4a\x44\xe9\x29\x49\x30\x3e\x27\xa3\x4c\
-\x3c\x2f\xcf\x48\x23\x5c\xaf\x28\x2a\x22\xf3\xfa\x0a\x18\xa3\x0b\
-\x40\x23\x72\xb4\x9a\x81\xf1\x20\x3d\x9d\x00\x8f\xeb\x84\xe7\x00\
-\xfc\x19\x69\xc9\xf7\x51\x1a\x3c\x26\xe3\xdf\x11\x17\x8b\x3d\xfd\
-\x28\x3e\x26\x1a\xc5\xde\xbd\x83\x62\x6e\xdf\x42\x27\x8f\x1d\x45\
-\x7b\x76\x7e\x49\xb4\x23\x3d\xe5\xbe\x3a\x74\x7c\xb0\x7b\xbf\x3e\
-\x7d\xdf\x18\xd8\xaf\x3f\xcd\xfb\x6d\x10\x30\xfe\x2f\x34\xf8\x7f\
-\x2c\x85\x3c\x1f\x90\x12\x7b\x0b\xc9\xf7\x0d\xc9\xbf\xcf\x98\x6c\
-\x3f\x10\x9f\x3f\x48\xe7\x0d\xd2\xa1\x59\x62\x3d\xb2\x89\xe7\x3e\
-\x62\x42\x7e\x20\xbd\x27\x88\x0d\xb9\xd7\x34\x09\x78\x83\xb4\x7b\
-\x07\xe1\x75\xcc\x86\xba\x7a\xc8\xe5\x2b\x81\xff\xc5\x28\x27\x2b\
-\x1b\x78\x9e\x8c\x62\x63\xee\xa1\x98\x3b\x77\xd1\xed\x5b\xb7\xd0\
-\x1d\x40\x34\x3c\x8f\x8d\x89\x45\x71\xf0\x3e\x3e\x96\x94\x78\x1f\
-\xb8\x99\x07\x63\x3e\xe3\xd5\xa9\xa9\xa8\x84\xbc\xbf\x82\x8c\xef\
-\x69\x30\x67\xc7\x9f\x41\x70\x1f\x8f\xe9\xf7\x81\xe7\x09\x80\x44\
-\x18\xd7\x61\x7c\x8f\x8b\x47\x89\xf7\xe2\x51\x02\x7c\xde\xbd\xdb\
-\x77\xd1\xdd\x9b\x37\xd1\xed\xeb\xd7\xd1\xf5\x6b\x57\xd1\xa5\x73\
-\x67\xd1\x81\xbd\x7b\xd0\xb1\xc3\x87\xc8\x7c\x02\xf2\x84\x47\x21\
-\xc1\xc1\xfe\x83\xfa\x0f\x78\x63\xc4\xd0\x61\xaf\xba\x8e\x1a\x45\
-\xf7\xf9\xb2\x41\xcc\x9a\x31\x65\x61\x6d\x49\x1c\xf1\xe1\xe8\x7d\
-\x3b\x62\x3e\x20\x8b\x20\xe4\x01\xba\xc6\xdc\xaf\xcb\x82\x3d\x86\
-\xa4\x3d\x43\xe2\xf7\x19\xe3\xc2\x6a\x6f\x10\x20\x9d\x40\xc2\x13\
-\x14\x77\x49\x10\xdc\xbd\x7a\x8c\x3d\x41\x3a\x5c\x42\xa9\x04\x12\
-\xfb\xec\xf0\x78\x7e\xb0\xcf\x08\xfb\x71\x92\xa3\xcf\x10\x24\xdc\
-\x3c\x81\x62\xbe\x3d\x86\x6e\x5c\x3a\x80\x2e\x9e\xdc\x81\x4e\x1e\
-\xde\x88\x0e\xef\x59\x83\xf6\xed\x58\x85\xf6\x6e\x59\x81\xf6\x6e\
-\x5b\x81\xf6\x6d\x5f\x81\xf6\xc3\x6b\x8c\xdd\x5b\x97\xa3\xf3\x5f\
-\x6d\x43\xb7\xae\x1c\x46\xb7\xae\x1e\x24\xb8\x73\x95\x79\x7e\xe9\
-\xf8\x0e\x74\x74\xcf\x5a\x74\x6c\xdf\x17\xe8\xab\x03\xeb\xd0\xb1\
-\xbd\x5f\x90\xd7\x47\x77\x63\xac\x41\x87\x76\x7e\x8e\x0e\xec\x5a\
-\x89\x0e\x7c\xb9\x12\x3e\x77\x39\xfc\x8e\xcf\xd1\xe9\x93\xc7\xd1\
-\xb1\x23\x87\x60\x7e\xbf\x0f\x7d\x75\xf4\x30\xe4\x1a\x09\xa8\xad\
-\xa9\x19\x74\x22\x16\xf9\xfb\xfa\x86\x0e\xe8\xdf\xff\x75\x97\x91\
-\x23\x5f\x05\x74\xeb\xdf\xb7\x2f\x9d\xf7\xdb\x20\xc2\xc3\x99\xfc\
-\xbf\xbd\xad\xcd\xc4\x33\x6b\x39\x64\xf8\x80\xac\xdc\x57\x48\xda\
-\x2f\x24\x75\x7f\x31\x29\x4f\xae\x19\xf7\x2a\x6e\x32\x40\x7c\x9f\
-\x11\xdd\xf8\xab\xe6\x85\xe0\xbc\x81\xe3\xbf\x65\xe6\x06\x22\xd7\
-\x11\x88\xde\x7f\x80\x79\xae\x86\xe7\x75\x15\x55\xa8\x34\xbf\x08\
-\xc6\xed\xfb\xe8\xbb\xab\x30\x06\x9f\x3e\x85\x4e\x1d\x3f\x8e\x0e\
-\xee\xdf\x87\xf6\xec\xfa\x92\xe4\xe1\xbb\x76\xe2\xc7\x9d\x68\xef\
-\xae\x5d\x68\xef\xee\x5d\xf0\x1c\x3f\xee\x46\xfb\xf6\xec\x86\xf7\
-\x76\xc2\x3c\x7d\x37\x83\x3d\x7b\xd0\x81\x7d\x7b\xd1\x7e\x18\xc3\
-\xf7\xed\xdd\x4b\xc6\xf2\x03\xf8\x71\xdf\x3e\x74\x68\xff\x7e\x74\
-\xe8\xe0\x3e\x74\xf0\xc0\x01\xf2\xfc\x08\x8c\xf1\x47\x0e\x1d\x40\
-\x87\x0f\xec\x47\x57\x2f\x5d\x40\x39\xd9\x19\xa8\xae\xa6\x12\x3d\
-\xd2\x34\x91\x3a\x40\x60\x40\xc0\xcc\xbe\x7d\xfa\xbc\xec\xe1\xea\
-\xfa\x3a\xa0\x9b\xeb\xc8\x91\x4f\x3f\xfb\xdc\x73\x74\xee\x6f\x83\
-\x98\x33\x67\xce\x7c\x32\xff\xc7\x7b\x7d\xe9\x60\x35\x1f\x65\xd4\
-\x00\x6c\x7e\x1d\x91\x19\xfc\x25\x75\x00\x1d\xcc\x98\xff\xf3\xd6\
-\x01\x1a\x8d\xc1\xcb\x65\xfe\x1a\x40\xb3\x10\x8f\x59\x5c\x56\x6b\
-\xb9\x6b\x0c\x89\x3a\x80\x8a\xe7\xb5\xaa\x16\x55\x96\x96\x12\x6f\
-\x7d\x42\xdc\x3d\x74\xe9\xc2\x05\xc2\xeb\xd5\xab\x56\xa1\x1d\xdb\
-\xb6\xa3\x93\x5f\x1d\x23\xf5\xf7\xaf\x0e\x1f\x26\x39\xf9\x71\x18\
-\x9f\x31\x7f\xb1\x16\xec\xc6\xba\xf0\xe5\x0e\xb4\x69\xfd\x06\xb4\
-\xe1\x8b\xb5\x68\xcb\xa6\x4d\x80\x8d\x68\xf3\xc6\x0d\xe4\x71\xfb\
-\xd6\x2d\x68\xe7\x8e\xed\x04\x3b\xb6\x6f\x03\x2d\xd9\x49\x3e\xe7\
-\xe2\x85\xb3\xe8\xee\x9d\xdb\x28\x3b\x33\x03\x95\x95\x14\xa1\x5a\
-\xbc\xee\x50\x59\x81\xf2\x1e\x64\x11\x3f\x40\x46\x4a\x12\x0a\xf0\
-\xf7\x9f\x03\xdc\x7f\xd1\xdd\xc5\xe5\x75\x2f\x77\xf7\x6e\x30\xf6\
-\x3f\xd5\x8d\x72\xdf\x66\xc1\xcb\x7f\xab\x75\x40\x1e\xff\x95\xbe\
-\xb6\x50\x59\x0d\x30\x83\xff\x4d\x22\xfc\xe7\x6a\x80\x22\xfc\xe7\
-\xd3\x00\x01\x1d\x50\xf1\xbf\x87\xd7\xfe\xf0\xda\x5d\x61\x5e\x2e\
-\x8a\xbf\x17\x83\x2e\x9d\x3f\x4f\xc6\xee\xb5\xab\x57\xa3\xea\x8a\
-\x32\x44\x02\x17\x77\x1e\x3f\x42\x46\xf1\xe8\x31\xbc\x07\x68\x7f\
-\x88\x1e\x43\xce\xf8\xa8\xb5\x05\x3d\x82\xf6\x7c\x0c\x8f\x8f\xdb\
-\xdb\x10\x7a\xa8\x2d\x24\xc1\xe3\xa3\xb6\x56\xf2\x3e\x6e\x63\x5c\
-\xb7\x68\x54\xa9\x50\x45\x59\x09\xf0\x3d\x9b\xe4\xfa\xb8\xee\x87\
-\xeb\x03\xb8\xd6\x17\x1b\x7d\xf7\xf1\xf8\x80\x80\x59\x7d\x7a\xf6\
-\x7a\xd6\xdd\xd5\xe5\x8d\xb1\x5e\x5e\xdd\x46\x0e\x1f\x4e\xb9\x6f\
-\xe3\x10\xe5\xbf\xd5\xb9\x80\xb8\xef\xd7\x16\x1a\x60\xaa\x03\x1d\
-\xad\x01\x3c\xfc\x67\xeb\x80\x04\xff\xa5\x34\x40\x9c\xff\x2a\xfe\
-\xf1\x9f\x47\x17\x30\xff\x31\xcf\x8b\xf2\xf3\x51\xc2\xbd\x58\x74\
-\xf1\xdc\x39\xb4\x77\xcf\x2e\xf4\x05\xf0\x1f\xaf\xef\x6b\x1a\x1b\
-\x50\x0b\x7c\x67\x8c\x8c\x94\x14\x94\x14\x17\x07\xbc\xcd\x24\x5e\
-\x01\x7c\x2f\x04\xfc\x5d\x4c\xaf\x4d\x60\xfc\x4a\xf8\x77\xe2\xb5\
-\x05\x7c\xbd\x7e\x69\x61\x01\x59\xf3\xc3\xb5\xc1\xfb\xf0\x19\xc0\
-\x73\x52\xe7\xc7\xf5\xfe\x07\x19\xe9\xa8\xae\xb2\x92\xac\x37\x8c\
-\xf1\xf0\x9c\xd2\xeb\xd3\x4f\x9f\x1b\x35\x62\xc4\x7f\x8d\xf3\xf6\
-\xee\x36\x74\xf0\x60\xca\xfd\x0e\x08\x49\xfe\x5b\xa5\x05\x22\x79\
-\x80\x86\x1f\xb6\xd1\x01\xf3\xe7\xf2\x1a\x93\xb9\xbc\x5c\x0d\x90\
-\xe0\xbf\xa8\x06\xf0\x5c\xe3\x23\xc8\x7f\x31\x0d\x10\x9f\x17\x34\
-\x69\xb5\xa1\x1a\xf8\x89\xf9\x8f\xd7\xdd\x2f\x5f\x38\x4f\xe6\xf1\
-\x98\xff\x78\xaf\x0d\xcc\x7b\xfc\x3d\xee\xde\xba\x89\x36\xae\x5b\
-\x87\x0e\x1f\x3c\x88\xbe\xfb\xfa\x6b\x94\x04\xe3\x76\x4d\x45\x05\
-\xb3\x66\xc9\x53\x5f\x68\xa8\xad\x45\xb5\x95\x55\x64\x6e\x51\x5e\
-\x54\x44\xbc\x03\x39\xe9\xe9\x64\x8d\x1f\xaf\xf7\xc5\xdf\x8b\x46\
-\xf1\xb1\x31\x28\x23\x35\x09\xf2\x87\x56\xec\xf5\x79\x1c\x14\x18\
-\x38\xfd\xb3\xde\xbd\x5f\xc6\xdc\xf7\xf5\xf1\x79\x6e\xe8\xa0\x41\
-\x74\x4f\xdf\x0e\x8a\x79\x61\x61\xf2\xf9\x6f\x96\x06\x48\xf8\x01\
-\x04\xf8\x6f\x8b\xbd\x46\x2c\xab\xe3\x59\xa6\x01\x82\xdc\x37\x53\
-\x03\x84\x72\x00\xf3\xf8\x6f\xaa\x01\x8c\x87\x88\xd9\x63\xb0\xaa\
-\x1c\xe6\xff\xb9\x79\x28\x11\xc6\xe5\xcb\x17\x2f\xe8\xf9\xdf\x58\
-\x53\x47\x52\xfd\x86\xda\x1a\xb4\x7a\xe5\x0a\x74\xe2\xf8\x31\xe0\
-\x7d\x22\x4a\x4b\x49\x46\x09\xa0\x15\x69\xc9\xc9\x26\xfb\x95\xe3\
-\x6b\x0a\x31\xf7\xf1\x78\x8e\xe7\x15\xd8\xf3\x87\xfd\xfc\xd9\xc0\
-\xfd\x0c\xf8\x39\xec\xeb\x89\x8b\x8e\xc6\x7b\x78\xa0\xd4\xa4\xfb\
-\xe8\x11\xb4\x4b\x7a\x4a\xd2\xa3\xf1\x41\x41\xc0\xfd\x3e\xff\x35\
-\x7c\xe8\xd0\xb7\x82\xfc\xfc\x9e\x1f\x31\x74\xe8\x53\xcf\x3d\xff\
-\x3c\x1d\xf7\x3b\x28\xc2\xe7\xcd\x33\x8f\xff\xb2\x34\x40\xa6\x2f\
-\xa8\x83\x34\x40\x76\x0e\xd0\x64\xbd\x06\xc8\xe6\xbf\xc9\x75\xbe\
-\xb6\xe2\xbf\xca\x94\xfb\x64\x9c\xae\x21\xfc\x2f\x02\xfe\xdf\xd7\
-\xf1\x7f\xcf\x6e\xb4\x01\xc6\xfa\x8d\x5f\x7c\x81\xb6\x6c\x5c\x8f\
-\xb6\x6e\xda\x08\xe3\xfe\x01\xf4\xcd\xd5\x6b\xe8\x1e\xe4\xeb\xc4\
-\x17\x04\xb8\x7d\xe3\x26\xd1\x0f\x1d\xf7\x5b\xf0\x77\x86\xd7\x84\
-\xfb\xe5\xe5\x84\xfb\xd8\x4b\x88\xaf\xdf\xc3\x9e\x9f\x44\xf8\x99\
-\x78\x98\x63\x90\x71\x1f\x5e\x3f\xd2\xb4\xc2\xfc\x3f\xf1\x21\x8c\
-\xf5\xd3\x7a\xf6\xe8\xf1\xf6\xd0\xc1\x43\x7e\xe9\xe9\xea\xfe\xd2\
-\x80\x7e\xfd\x9e\xb4\x37\x1f\x7e\x6c\x31\x3f\x3c\x7c\xbe\xae\xd4\
-\xf3\xe8\x91\x19\x50\xca\x0f\xd4\x6e\x0a\x6b\x7d\x41\xfc\x90\xe1\
-\x05\x6a\x35\x45\x1b\x81\x5c\x5f\x90\x76\xed\xb1\x45\x02\xdc\x35\
-\x4a\x23\x4f\x90\x46\x72\x9f\x02\x4d\x93\x0e\xcd\x82\x30\xe8\x97\
-\x46\xfb\xda\x70\x3f\x93\x56\x78\x4f\x5d\xdf\x80\x6a\xab\xab\x61\
-\x7e\x5e\x82\x92\xef\x27\xa1\x6b\x57\xae\xa0\x83\xfb\x0f\xa0\xf5\
-\xc0\x7d\xbc\xfe\x8e\xfd\xbd\x78\xcc\xde\xb4\x61\x1d\x3a\x7f\xe6\
-\x1c\xba\xf1\xed\xb7\x30\x17\xb8\x4d\x3c\x41\x77\x01\x1a\x9d\x8f\
-\x11\x74\xac\x91\x78\x09\xab\x51\x35\xe1\x7e\x11\xf1\x0a\x67\x67\
-\x64\x00\xf7\x93\x21\x57\x48\x22\x39\x43\x62\x7c\x2c\xf1\x02\x3e\
-\x06\xfd\x4f\x4d\x4a\x7a\x1c\xe8\x1f\x30\xb3\x77\xaf\x5e\xbf\x1f\
-\x32\x70\xd0\xdb\xa3\x47\x8e\x7a\xd5\x7f\x9c\x2f\xbd\xa6\xcf\x0e\
-\x31\x6b\xc6\x94\xf9\xb5\xa5\xf1\x28\x2b\xe9\x6b\x94\x9d\x6c\x01\
-\x92\x2c\xc5\x35\x41\xbf\x91\x35\x7e\x20\x61\x68\xef\x07\x66\xb6\
-\x2f\x48\x07\x39\x7e\xa0\xcb\x04\xe9\x09\x12\xe0\xdb\x23\xc8\xc8\
-\x0b\x74\x91\x40\xc8\x0f\x94\x1a\xab\x03\xff\x7d\xb7\x74\x7b\x07\
-\x31\xaf\x99\x73\xf1\x6b\xfc\xfb\x92\xa3\xcf\xa1\x94\x98\xb3\xe8\
-\xfe\x9d\x53\x28\xf6\xc6\x71\x74\xf3\xd2\x01\x74\xfa\xc8\x56\xb4\
-\x67\xeb\x32\xb4\x76\x55\x38\x5a\xf3\xf9\x4a\x54\x0a\xe3\x37\x7a\
-\xf8\x90\xd4\x08\xf7\xed\xd9\x05\x79\xc0\x66\x74\xf6\xec\x69\x74\
-\xf1\xdc\x79\x74\xe1\xec\x79\xe0\x72\x3c\x73\x3f\x54\xe0\x3f\x33\
-\xdf\x67\x72\xfe\xd2\x62\xc8\xf9\x73\x73\x48\xce\x8f\xb9\x8f\x91\
-\x72\x3f\x91\xe8\x09\xae\x01\x3e\x06\x7d\xcc\x48\x4d\x79\xe4\xeb\
-\x33\x76\x5a\xef\x9e\x3d\x7f\x37\x74\xc8\x90\x77\x5c\x47\xba\xbc\
-\xe6\x33\x66\x4c\xb7\x41\xfd\xfb\xd3\x39\xbf\x1d\x42\x37\xfe\x1b\
-\xf9\x7f\xcc\x85\x6c\x1f\x90\xc8\x1e\x41\x2d\xca\x7b\x82\xc4\xe6\
-\x25\x26\x1e\x20\x1e\x4f\xae\xb1\x37\x57\xc0\x9f\xab\xdf\x6b\x14\
-\xcf\x21\xd4\x48\xfe\x3d\x47\x04\xf6\x08\xd2\xfb\x81\x84\xbd\x40\
-\x4d\x7a\x98\x5e\x3f\x68\x7c\x4d\x41\x3d\x39\xcf\xc4\x43\xa4\x06\
-\xde\xaa\xea\x50\x25\x70\x16\x8f\xd5\xd8\x97\x7b\xf5\xd2\x45\x74\
-\x70\xdf\x3e\xb4\x66\xf5\xe7\xe8\x41\x66\x16\xe4\x08\x6a\xf4\x10\
-\xe6\x68\xb8\x8e\x77\xf4\xe0\x41\xb4\x7e\xed\x5a\xb4\x73\xfb\x36\
-\x74\xe1\xdc\x59\x72\xbf\xce\x56\xbc\x9e\x07\xe3\x7e\x5d\x55\x15\
-\x33\xee\x17\x17\xa3\xc2\xfc\x5c\x52\xd3\xc7\xb5\x3e\x3c\xe7\x27\
-\xd7\xf2\x25\x25\xa2\x82\x9c\x1c\xd4\x0e\xff\x2e\x59\xe9\x69\x0f\
-\x03\xfc\xfc\xa6\xf6\xec\xf1\xe9\xdb\xfd\xfb\xf5\x7d\xdb\x65\xf8\
-\xc8\xd7\x86\x0e\x1a\xfc\x9c\xff\xb8\x71\x4f\x7f\xd6\xab\x17\xf5\
-\xf7\xd9\x21\x2c\x9a\xff\x9b\x55\x17\x30\xe3\x5a\x61\x1b\xd4\xfe\
-\x4c\xd1\xac\x87\xd8\xdc\x9f\xbf\x16\x20\xe7\x7a\xc1\x46\x02\xd9\
-\x35\x00\xc1\xfd\x01\x2c\xf1\x01\x19\xdf\x1f\x90\x9c\xc3\xf5\x02\
-\xe2\xb9\x3a\xfc\x0e\xbc\xc7\x07\xae\xf3\xe3\xf1\x3a\x21\x36\x0e\
-\x5d\xb9\x68\xe0\x7f\x0e\x8c\xd5\xad\xcd\xf8\xbb\xd5\xc3\x63\x13\
-\x59\xc7\xc7\xf9\x00\x6a\x6f\x07\x4d\x68\x21\xda\x84\xc7\x7d\x92\
-\xf3\xe3\x5a\x1f\xe1\x7e\x1e\xf1\xf5\xe0\x31\x1f\xaf\xed\xe3\x6b\
-\x86\x70\x9d\xaf\x28\x27\x17\x7e\xa6\x15\x5f\xff\x83\xb9\x3f\xf9\
-\x93\x8f\x3e\x7a\x7d\xf0\xc0\x41\xbf\x74\x73\x19\xfd\xaa\xcb\x88\
-\x11\xdd\x60\xec\x7f\xaa\xff\x67\x9f\x75\xed\xfa\xe4\x93\xb4\xe6\
-\x67\x87\x30\xbb\xfe\x6f\x33\x0d\x68\xe9\x00\xee\x8b\x68\x80\xd5\
-\xfc\x6f\xd2\x73\x5f\x92\xff\x6a\x11\xee\xeb\x35\x40\xee\x3a\x20\
-\x3f\xf7\xf5\xe7\xf0\xfc\x3c\xe6\x7e\x2d\x8c\xdb\x95\x65\xa5\xc4\
-\x8b\x13\x17\x13\x83\x2e\x5f\xb8\x88\x0e\xec\xdb\x83\xbe\x58\xb3\
-\x06\xe5\x66\x67\x13\xde\x0b\x5d\xb3\xcc\xd4\xf9\x99\x71\xbf\x14\
-\xe6\xfb\x98\xfb\x0f\x58\xdc\x67\xd6\x08\x92\x50\x41\x5e\x0e\xf1\
-\x08\xe5\xe7\x64\xa3\xa0\x00\xff\xc9\x3d\x3e\xf9\xe4\xc5\x41\xfd\
-\x07\xbd\xe9\xe9\xe6\xfe\xe2\x38\x6f\xef\xa7\x3f\xeb\xdd\xfb\x49\
-\x4f\x57\xd7\x9f\xfc\xa4\x6b\x57\xca\x7d\x3b\x45\xd8\xec\x39\x73\
-\x15\xe5\x3f\xaf\x06\xc8\xe5\xbf\x7d\x34\x40\xaf\x03\x92\x1a\x20\
-\x77\xcf\x10\xb9\x39\x80\x08\xff\x1b\xad\xe7\xbf\x6e\xbc\x37\x5e\
-\x3f\x50\x69\xf9\x5f\x09\xe3\x7f\x31\x70\x3d\x0b\xc5\xdf\xbb\x87\
-\x2e\xe3\xf1\x7f\xff\x7e\xe0\xff\x6a\xed\xf8\x6f\xe0\xbf\x06\x7e\
-\x4e\xa3\x7d\xae\xae\x55\x91\x9c\xbf\xa6\xbc\x02\x95\x17\x43\xfe\
-\x90\x87\xb9\x9f\x69\xc4\x7d\xec\xe1\xcf\xce\x4c\x27\x1e\x41\x3c\
-\xbf\x18\x1f\x14\x38\x15\xc6\xfd\x6e\x83\x06\x0c\x7a\xc3\xc3\xd5\
-\xed\xb9\x4f\xbb\x77\xef\xea\xee\xea\x4a\x39\xef\x00\x11\x36\x27\
-\x4c\x79\xfe\xcb\x5a\x27\xe4\xe3\x3e\x17\x1d\xab\x01\xad\x12\x1a\
-\x20\x2f\x07\x68\xd2\xfb\x80\x44\xbd\x40\x6a\x29\xfe\xb3\xee\x17\
-\xc8\xbd\x67\x20\x8f\x17\x48\x9a\xfb\x0d\x7a\xee\xd7\xc3\xf8\x8d\
-\x7d\xf7\xe5\x25\x25\x28\xff\x41\x0e\x8a\x8b\x8d\x21\xfc\x3f\x74\
-\xe0\x00\x5a\x0b\xf9\x7f\x46\x6a\x2a\xa9\x63\xe0\x39\x3b\xdb\xff\
-\xdb\x0e\x73\x34\xbc\x6f\x00\xce\x1d\xf0\xcf\x16\xe6\x17\x90\x5a\
-\x41\x7a\x4a\x2a\x70\xff\x3e\x53\xe7\x8f\x8b\x43\xb9\x39\x59\x64\
-\x9e\x90\x9b\x9d\x03\xdc\x0f\x9a\xd6\xfd\xe3\x8f\x5e\x1a\xd8\x7f\
-\xc0\x7f\x8d\x71\xf3\xec\x36\x6c\xf0\x60\x5a\xe7\x73\xa0\xb0\x29\
-\xff\x25\x75\x40\x8c\xfb\x76\xe0\xbf\x84\x06\xf0\xfb\x01\x84\xf8\
-\x2f\x72\x3d\x80\x9a\xa9\xc1\x11\xc8\xe5\x3f\xcf\x7d\x43\x0d\xdc\
-\xaf\x97\x39\xee\xd7\x11\x34\x62\xfe\x57\x54\x90\x79\x7b\x8e\x76\
-\xfc\xbf\xa2\x1f\xff\xd7\xc0\x5c\x3d\x8d\xd4\xfe\xb0\xd7\x37\x2e\
-\x36\x1a\x8e\x5d\xc0\xf7\xde\x20\xbe\x9f\x3c\xb2\x17\x50\x1e\x2a\
-\x2c\x28\x24\xdc\x4f\x4b\x66\xb8\x8f\x6b\x88\x29\x49\xc9\x28\x17\
-\xe6\x13\x78\x11\x18\xd7\xfc\x02\x03\x02\x66\x7c\xf2\xd1\xc7\xaf\
-\x62\xee\xc3\x7c\xff\xf9\x61\x83\x06\x3d\xf5\x3c\xf5\xf6\x38\x54\
-\x74\x08\xff\x25\x72\x01\xe9\xeb\x73\x3b\x5e\x03\x84\x74\x40\x16\
-\xff\xb9\xfb\x02\x59\xc1\xff\x26\x3e\x70\xbc\x40\xd2\xfc\x6f\x20\
-\xd7\xde\xe8\xf8\x5f\x57\x5d\xcd\xec\xfb\x51\x5c\x44\xf6\xdb\xd4\
-\xf1\x1f\x8f\xff\x98\xff\x59\xe9\xe9\xf0\xb7\xaa\xd1\x77\xdf\x7c\
-\x83\xbe\xdc\xb6\x0d\x9d\x39\x75\x12\x5d\xbd\x7c\x09\xdd\xba\x71\
-\x83\xec\x0d\x82\x79\x8e\xf7\x0b\x49\x4b\x4e\x41\xf7\xe3\xe3\xc9\
-\x7a\x60\x4a\x52\x12\x68\x43\x0e\xb9\x36\x28\x2f\xfb\x01\x0a\xf0\
-\xf3\x9b\xfd\xc9\xc7\x1f\xbd\x35\x74\xd0\xe0\xb7\xbc\xdc\x3d\x20\
-\xf7\x1f\x40\xc7\x7d\x07\x8c\x0e\xe3\xbf\xd5\x3a\xe0\x18\x1a\x20\
-\x8f\xff\x7c\x1a\xc0\xd5\x01\x39\xfc\x6f\xe0\xe7\x7f\xa3\xfc\xf1\
-\xbf\x11\x5f\xeb\xa7\xaa\xd3\x73\xbf\x41\xbb\x66\x87\xf7\xec\xc1\
-\xb5\x3b\x86\xff\x31\xc0\xff\x4b\xe4\xfa\xde\x75\x6b\xd7\xa2\x42\
-\x98\xd3\xe3\xf3\xd6\xad\x59\x4d\xae\x0b\x8a\xb9\x7b\x07\xc5\x46\
-\x47\xc3\xe3\x5d\x74\xf3\xfa\x0d\xf4\xdd\xb7\xdf\x91\xbd\x3a\x93\
-\xef\xdf\x47\x49\x09\x09\x44\x07\xf2\x73\xf2\x88\x31\xac\x30\x2f\
-\x1f\xc6\xfd\xc0\xb9\x3d\x3e\xf9\xe4\xed\x5e\x9f\x7e\xfa\xd6\xb0\
-\x21\x43\x5e\xea\xdd\xb3\x17\xbd\x4f\xb7\x83\x46\x87\xf3\xdf\x21\
-\x73\x01\x61\xfe\xf3\x6b\x80\xa5\xfc\x57\x9b\xf2\x5f\x42\x03\x04\
-\xf9\xdf\xc0\xe6\x3e\x07\x9c\x5a\x1f\x9b\xfb\x2a\xb2\xe7\x27\xf0\
-\x1f\x8f\xff\xc0\x7f\xbc\xdf\x67\x6c\x4c\xb4\x7e\xfe\x8f\xaf\xf5\
-\x59\xb5\x3c\x0a\xad\x59\xb5\x12\xed\xd8\xba\x05\x9d\x3a\x71\x12\
-\x7d\x7b\xed\x6b\x74\xe3\x9b\xef\xd0\x8d\xef\xae\xa3\xaf\xaf\x5e\
-\x41\x47\x0f\xe3\xbd\x7a\x12\x51\x0a\xf0\x3f\x3d\x29\x05\x15\xe5\
-\xe6\x93\x3a\x3f\xde\x1f\x34\x38\x68\x7c\x78\x8f\x4f\xba\xbf\xdd\
-\xef\xb3\xcf\xfe\x1b\xb8\xff\xb3\xe1\x43\x06\x3f\x3d\xb0\x5f\x3f\
-\x9a\xf3\x3b\x68\x84\xcd\xb5\x03\xff\xad\xaa\x09\xd8\x47\x03\x74\
-\x3a\x20\xdf\xdb\x23\xc4\x7f\xb5\x99\xfc\x17\xd1\x80\x46\x61\xfe\
-\xb3\xb9\xdf\xc8\xca\xfb\x75\xb9\x3f\xae\xdf\x15\x17\x14\xa0\x1c\
-\x98\xc3\xc7\xc6\xdc\xd5\xd6\xff\x0f\xa0\x0d\xeb\xbe\x20\xeb\x7f\
-\x78\xbe\x80\xe7\xfd\xd8\x0f\xbc\x6b\xc7\x97\x68\xbf\x76\x4f\x9f\
-\x1d\x5b\xb6\xa0\x63\x87\x8f\x90\x39\x3f\xae\x13\x96\x14\x16\x92\
-\x6b\xfd\x8b\x8b\x0a\x50\x48\x70\x70\xf8\xbf\xff\xf9\xaf\x5f\xf6\
-\xed\xd3\xe7\x17\x43\x06\x0c\x7a\xc5\xd5\xc5\xe5\xb9\xe1\x43\x86\
-\x3c\xf5\xf4\x33\xcf\x50\xfe\x3b\x68\xcc\x9a\x39\x73\x8e\x5d\xf8\
-\xcf\xab\x01\x72\xd6\x04\x6c\xa5\x01\xd2\xfc\x6f\x35\x8b\xff\xd6\
-\x6b\x40\x93\x1c\xfe\xf3\xec\xf3\xa5\x5b\x0f\x64\x8f\xfd\xaa\x9a\
-\x1a\x54\x5b\xc5\xf0\xbf\xba\xa2\x02\x55\x95\x95\xa3\xe2\xfc\x7c\
-\xec\xc9\x43\xf7\xa2\xef\x92\xfd\x7f\x0e\x1d\x38\x48\xf8\x9e\x93\
-\xf5\x80\xfc\x0c\xde\xdb\x33\xfa\xce\x1d\x74\xec\xe8\x61\xb4\x67\
-\xe7\x0e\x74\xf8\xd0\x41\x74\xed\xf2\x65\xb2\x97\x67\x46\x6a\x0a\
-\x2a\x81\xfc\x01\x3d\x6a\x23\x75\x84\x60\xe0\xfe\xbf\x3e\xfc\xf0\
-\x75\xc8\xf9\x7f\x3e\x78\xc0\xc0\x57\x3c\xdc\xdc\x9e\x1b\xe7\xed\
-\xfd\xd4\x53\x4f\x3f\x4d\xb9\xef\xc0\x31\x7b\xd6\xac\xd9\x76\xe3\
-\xbf\x89\x06\x98\xc3\x7f\xa5\x75\x80\x87\xff\x7c\x39\x80\x59\xfe\
-\x5e\x31\xfe\xab\x95\xe3\x3f\xcf\xfa\xbe\x8e\xfb\x98\xf7\xb8\x8e\
-\x5f\x57\x65\x18\xfb\xab\x2a\xca\x51\x79\x69\x09\x99\xe7\x67\xb3\
-\xf8\xbf\x7f\xef\x7e\x72\xfd\x1f\xae\xef\xe3\xfa\x40\x45\x69\x19\
-\x2a\x2d\x29\x85\x31\xbe\x08\xe5\x63\x5f\x7f\x66\x06\x19\xf3\xb3\
-\x32\x32\x18\xee\xc3\xb8\x5f\x56\x5c\x82\x42\xc6\x8f\x0f\xfb\xc7\
-\xfb\xef\xbf\xd8\xa7\x57\x9f\x9f\xf7\xe9\xd5\xeb\xe5\xe1\x43\x87\
-\x3e\x0b\x39\xc0\x93\xbd\x7b\xf6\xfc\x09\xad\xf7\x3b\x76\xd8\x9d\
-\xff\x46\x3a\x20\xe4\x09\x72\x0c\xfe\xb3\xef\x23\xa6\x0c\xff\x59\
-\xb5\x00\x51\xfe\x8b\xd7\x01\xf8\xb9\xcf\xac\xf3\xab\xaa\x6b\x48\
-\xbd\x0f\xf3\x1f\x73\x1f\x03\x8f\xff\x65\x25\x8c\x5f\x3f\x1d\xc6\
-\xf1\xbb\xb7\x6f\xa1\x0b\xe7\xce\xa3\xbd\xbb\xf7\xa0\x8d\xeb\xd7\
-\x93\x79\x41\x71\x41\x21\x2a\x22\xeb\xfb\xc0\xf9\xe4\x64\x94\x9c\
-\x74\x1f\xa5\x00\x32\x33\xd2\x50\x51\x41\x11\xd9\x07\xac\x0c\xe6\
-\x10\x13\x42\x42\xc3\x3f\x78\xef\x83\x67\xfb\xf7\xed\xfb\xa6\xcb\
-\xc8\x11\x2f\xba\x8f\x1e\xfd\xcc\x9f\xff\xfc\x67\x7a\x6f\x4e\x27\
-\x09\x87\xe1\xbf\x91\x16\x58\xa2\x03\x4a\x68\x81\xb8\x06\x98\xdc\
-\x4b\x50\x4c\x0b\xcc\xd6\x80\x46\x11\xee\xcb\xc9\x01\x18\x4f\x7f\
-\x83\x0a\xd0\x00\xdc\x87\xe7\x64\xbe\x4f\xb8\x5f\x45\x72\x79\x1d\
-\xff\x2b\xcb\xcb\x48\xce\x4e\xf6\xec\xc7\xf7\xd8\xbc\x75\x13\x9d\
-\x3b\x73\x06\xed\xd9\xb5\x07\xad\x5b\xb7\x96\xfc\x5c\x61\x5e\x81\
-\x76\x7d\x3f\x99\xd4\xf9\x09\xf7\x21\x57\x28\x2e\x2c\x60\xb8\x5f\
-\x5a\x0a\xdc\x0f\x0e\xfb\xe0\xbd\xf7\x9f\xef\xf7\xd9\x67\xaf\xc1\
-\x98\xff\xdc\x5f\xff\xf2\xd7\xae\xae\xa3\x46\xd1\xf1\xde\x89\xc2\
-\x21\xf9\xdf\x6a\x29\xff\xad\xd1\x01\x01\xee\xcb\xe0\x3f\xaf\x06\
-\x58\xc4\x7f\x83\x2f\xd8\x1c\xfe\xe3\x71\x9f\x59\xdf\x67\xf8\x5f\
-\x87\xef\xe9\x87\xeb\xfc\x98\xfb\x95\xc6\xdc\xc7\xb9\x7f\x49\x51\
-\x21\xe1\x31\xf6\xfe\x63\x5e\xdf\xba\x71\x1d\x9d\x3d\x7d\x1a\xed\
-\xdc\xb1\x03\x6d\xdb\xb2\x85\xfc\x5c\x6e\x76\x2e\xca\x4a\xcf\x20\
-\xf5\xc1\xec\xcc\x4c\xe2\xeb\x21\x39\x3f\x44\x45\x59\x19\x0a\x0d\
-\x09\x09\xfb\xf0\x83\x7f\xbc\x08\xdc\x7f\x63\xe4\xf0\xe1\xdd\xde\
-\xff\xfb\x7b\x74\x7d\xdf\x09\x63\xd6\xcc\x99\x33\x1d\x8f\xff\xf6\
-\xd0\x00\x11\xfe\x73\xaf\x15\x14\xd0\x00\x23\x1d\x90\x5d\x07\xe4\
-\xd7\x00\xb9\xfc\x57\x37\xb0\xea\x7c\xb5\x0c\xf7\xf1\xbe\x1e\xb5\
-\xd5\x55\x04\xd5\x95\x15\x80\x4a\x66\x4f\x3e\x18\xf7\x2b\xca\x4a\
-\xc9\xdc\xbf\xa8\x20\x9f\x78\xff\xf0\x7e\x7e\xd7\xbf\xfd\x16\x9d\
-\x3a\x71\x0a\xb8\xbf\x19\x1d\x3f\x7a\x94\xf0\x1f\xdf\xc3\x07\xef\
-\xf9\x71\xee\xcc\x69\xe2\x0d\x4a\x8c\x8f\x43\xf8\xfe\x66\xc5\x85\
-\x85\x68\xd2\x84\x09\x73\xfe\xf5\xe1\x87\xaf\xc0\x1c\xff\xb5\xe1\
-\x43\x86\x62\xee\xd3\x7c\xdf\x49\x63\xe6\x8c\x19\x0e\xca\xff\x8e\
-\xd6\x00\x85\xf9\x6f\x65\x0e\xd0\x64\xa4\x01\xfc\xdc\x6f\xac\xaf\
-\x63\xf2\x7d\x2d\xff\x31\xef\x19\xfe\x1b\xb8\x5f\x43\xc0\xe4\xfc\
-\xba\xbc\x1f\xa3\x20\x0f\xc6\xf7\x8c\x74\x94\x10\x17\x8b\xbe\xb9\
-\x76\x0d\x9d\x3e\x79\x92\xec\xf5\x73\xf3\xbb\xef\x90\xaa\xa6\x16\
-\x1d\x3f\xfe\x15\xa9\x05\xe2\x3d\xc1\x2e\x9e\x3d\x0f\x39\xc2\x77\
-\xe4\x3e\x60\x73\xe7\xcc\x8e\xf8\xf0\x83\x0f\x5e\xed\xdb\xab\xcf\
-\xab\x98\xfb\xff\x78\xff\x03\x3a\xee\x3b\x71\x38\x3c\xff\x5b\xad\
-\xe1\xbf\x5c\x1d\x30\x97\xfb\xe2\x1a\xa0\xd7\x01\xab\xf9\xdf\x28\
-\x9b\xff\xf5\xfa\xb1\x9f\x3d\xee\x33\xfc\xd7\x71\x1f\xd7\xfc\x70\
-\xee\x8f\xc7\x7e\x9c\xcf\xa7\xa5\xa4\x00\xa7\x63\xc8\xde\x5f\x5f\
-\xc1\xb8\x8f\x6b\x7f\x71\xf7\x62\x49\x5d\x8f\xd9\xf7\xf3\x38\xf1\
-\x05\x7e\x07\x79\xc0\xe5\x8b\x97\xf1\xbd\x41\x76\x4e\x9e\x38\xf1\
-\xef\x03\xfa\xf5\x7b\x75\xe8\xa0\xc1\xdd\xfe\xf9\x8f\x0f\xbb\xd2\
-\xfa\xbe\x73\x07\xe4\xff\x33\x1c\x9e\xff\x1c\x1d\x70\x06\xfe\x1b\
-\x6b\x80\x14\xff\x8d\x35\xa0\xa9\x91\x0b\x53\x0d\x20\x79\xbf\x8a\
-\x35\xdf\x37\xc9\xf9\x99\x71\xbf\x4a\xcb\x7d\x9c\xf7\xe3\x71\x1f\
-\xf3\x9f\xec\xd3\x93\x95\x49\x3c\xfb\xd8\xd3\x8b\xbd\x3f\x87\x0f\
-\x1e\x22\xf7\xed\xc1\xbe\xbf\x95\xcb\x96\xa1\x1d\x5b\xb7\xa2\x53\
-\xc7\x4f\xa2\x6b\x97\xae\x90\x7d\x01\x22\x16\x2e\xbc\x36\x3f\x2c\
-\x6c\xe4\x82\xf0\xf0\x77\x5d\x86\x8f\x78\x1e\xe6\xfe\x5d\x5f\x78\
-\xe1\x05\xca\x7d\x27\x0f\xa7\xe2\x7f\xab\x35\x39\x80\x90\x0e\x58\
-\xca\x7d\x69\xfe\x13\x0d\x50\x8c\xff\x0d\xc2\xdc\x67\x8d\xfb\x35\
-\x55\x4c\x8d\xaf\xba\x4a\x37\xee\x97\x92\x7b\xee\xe8\xb8\x5f\x94\
-\x9f\x47\xd6\xf2\x71\xee\x8f\xaf\xdb\xc1\xfb\x79\x5e\x3c\x7f\x91\
-\xf8\xfb\xf0\xfd\xbb\xf0\x67\xe1\xfa\xde\xa9\xe3\x27\xd0\x81\xbd\
-\xbb\xc9\x7d\xff\x96\x45\x46\x7e\x13\x1e\x36\x6f\xc0\xbc\x39\x73\
-\xfe\x32\x29\x34\xf4\x67\xff\xf8\xe0\x83\x27\x9f\xeb\x46\xef\xcd\
-\xd1\x19\x02\xf2\xff\xe9\x4e\xc5\x7f\x2d\x94\xd3\x00\x6b\xf8\x2f\
-\x43\x03\xc8\x9e\xbb\xdc\x7b\x04\x0a\xf3\xdf\x94\xfb\xc6\xb5\xc0\
-\xc6\x7a\x03\xf7\x55\xb5\x06\xde\xeb\xc6\x7d\xc2\x7d\x78\xac\x00\
-\xde\x73\xb9\x8f\xf7\xe9\xc1\xf7\xfb\xc2\x75\xbf\x8c\xb4\x54\x98\
-\xfb\xc7\xa1\x1b\x30\xdf\x3f\x7f\xf6\x2c\xda\xba\x65\x33\xf1\x00\
-\x61\xbf\x50\x75\x45\x25\xf1\x0a\x9e\x3a\x71\x1c\x4d\x9b\x3a\x75\
-\x7f\xa0\xbf\xff\xbf\x42\x83\x83\x7f\x0f\x78\xe9\xfd\xf7\xde\xa3\
-\x7b\x74\x77\xa2\x98\x3e\x7d\xfa\x34\xc7\xe4\xbf\x30\xf7\x09\xff\
-\xad\xca\x03\x5a\x14\xe2\xbe\x7c\xfe\xb7\x34\x29\xc3\x7f\xbc\x6f\
-\x27\x86\xaa\xb6\x86\x80\x9b\xf3\x63\xfe\xe3\x5c\x5f\x57\xe7\xc7\
-\xdc\x2f\x2e\x2c\x22\xeb\x7d\xb8\xe6\x87\xd7\xfc\xf0\xbe\xfc\x78\
-\xdd\x0f\xcf\xfd\xbf\xbe\x7a\x15\x1d\x3f\x76\x0c\x6d\xda\xb0\x11\
-\xe5\xe7\xe4\x92\xbd\x3d\xf1\xfa\x7e\x29\xe3\xeb\x5b\x88\xfb\xc8\
-\xdf\xdf\x7d\xf7\xd9\x3e\xbd\x7a\x3d\xfd\xde\xbb\xef\x76\xa5\xf7\
-\xe1\xed\x5c\x61\xe0\x7f\x9b\x9e\x7b\x8f\x1e\x3e\x24\xfb\x01\xcb\
-\xe5\x2a\x3e\x5f\xee\xb9\xf8\x73\xe5\x9d\xcf\xf0\xfc\xd1\x43\xbc\
-\xc7\x30\xbf\x1e\x10\x1e\x73\x74\xe0\x61\x5b\xbb\x6c\x0d\xc0\x7b\
-\x8e\x3e\x6c\x6b\x95\xcd\x7f\x5d\xce\x20\x57\x03\xda\xe1\x3b\xb6\
-\x68\x8c\x35\xa0\xa5\x49\x88\xff\xcc\x1e\xc2\x06\xbe\x1b\x6b\x00\
-\xde\xc7\x0f\x83\xf8\x7a\xb4\x39\x7f\x3d\xf1\xf4\x1b\xfc\xbc\x64\
-\xdc\xd7\x71\xbf\xa4\x84\x5c\xdf\xc7\xac\xf5\x17\x12\x9f\x6e\xee\
-\x83\xec\x32\xd0\x81\xe5\xf0\xf8\x7d\xf2\xfd\x44\x74\xf7\xf6\x6d\
-\xc2\x7f\x7c\xaf\xef\x93\x30\xd7\x47\x8f\x99\x7d\x7e\xf0\x9e\x5d\
-\x41\x01\x81\x8b\xfe\xfa\x7f\x7f\x79\xb6\xfb\xc7\x1f\xbf\xfa\x59\
-\xef\x5e\xcf\xbd\xfb\x97\xbf\xd2\x71\xbf\x13\x06\x97\xff\x78\xff\
-\x06\xd2\x1f\x9b\x9a\xae\x01\x57\x83\x01\x17\x00\x8f\x85\x78\x8a\
-\xcf\xc7\xde\x13\x78\xbe\xb1\xbd\xbd\x7d\x0a\x9c\x1b\x2f\x74\xee\
-\x43\xe0\xfd\xc3\xf6\x76\xc8\x61\xeb\xab\xe0\x71\x06\x9c\xbf\x1c\
-\xce\x2f\x13\xe2\x3f\xde\x7b\x0a\xd7\xd0\xe0\xfb\xdc\x69\x6f\x6b\
-\x87\xef\xd2\x7a\x0c\xd0\x6a\x92\x07\x68\x35\x00\x8f\x5b\xf0\xd9\
-\xf8\xf9\x1e\xf8\x7b\x26\xc0\xa9\xdf\xb7\x09\x70\x1f\xef\x3d\xfe\
-\x08\x7e\x4f\x7d\x7d\x5d\x23\x7c\x4e\x38\x70\x75\x21\x9c\x9b\x2b\
-\xc4\xfd\x87\xa0\x5b\xf8\xbb\xc0\xe7\xa7\xb6\xb5\xb4\x86\xb6\x69\
-\x34\x7b\x5a\x34\x9a\x46\x21\xfe\x3f\x6a\x6f\x23\xe3\x34\xcc\xff\
-\x4f\x82\x66\x84\xc0\x67\x7e\xdb\x6a\x72\xaf\x20\x03\x70\x5d\xa3\
-\xae\xa6\xe6\x21\xfc\x8e\x28\x4d\x53\xf3\x2c\xf8\xb9\x34\x1d\xf7\
-\xf1\xdf\x84\x3f\xab\x5e\xbb\xc6\x87\x35\x00\x8f\xf9\x15\xe5\x65\
-\xf9\xf5\xaa\xba\xc9\xb5\x35\xd5\x1b\x81\xfb\xb5\xe5\x90\xeb\x13\
-\xfe\x97\x96\x12\xee\xe3\x31\x1f\xd7\xfa\xf1\x1c\xe0\xe6\xf5\xeb\
-\xc0\xff\xcc\x7f\xe3\x36\x2f\x29\x2e\x7a\x21\x3b\x2b\x33\xe8\xf6\
-\xad\x9b\xe8\xc2\xb9\x73\xc0\xfd\x13\x68\xff\x9e\x3d\xe8\xd0\x81\
-\x7d\xe8\x41\x56\x16\x0a\x0e\x0a\x5a\x04\x7c\x7f\x01\xb8\xff\x4a\
-\xef\x9e\x3d\x9f\x7b\xff\xef\x34\xe7\xef\xac\x31\x63\xfa\x0c\x86\
-\xff\x2d\x6d\xe4\x7e\x3c\x0d\xf5\x0d\xe8\xfc\xb9\xb3\xfb\xd4\x6a\
-\xf5\xb3\xf8\x38\x70\xf4\x69\xe0\xea\x48\xe0\xe9\x43\x13\x3e\x03\
-\x97\x0b\xf2\xf3\xd1\xd5\x4b\x97\x42\x74\x9f\x07\xe7\xbf\x0c\xe7\
-\xae\xe5\x1b\xf7\xdb\x00\xf7\xa2\xa3\x8b\x13\x13\x12\xde\xd7\x9d\
-\x0f\x9f\xf1\x73\x38\x16\xc3\x97\x53\x34\x41\x3e\x7c\xf1\xc2\x85\
-\x4b\xb5\x55\x35\xaf\x30\x9f\xdd\xf6\x04\x9c\xdf\x13\x34\xa0\x9e\
-\xcb\x7f\xfc\x5d\xca\xca\xca\xd0\xc5\xf3\xe7\xc3\xf5\xdf\xa5\xad\
-\xed\x05\x38\x77\x3e\xb7\x66\x48\xae\x35\x00\xfe\x27\x25\x24\xaa\
-\xee\xdc\xba\xdd\xc7\x70\x7e\xeb\x1b\x90\x13\x5c\xe6\xf2\x1f\xdf\
-\x9f\x00\x73\xf4\xea\xe5\x2b\x77\x8a\x0a\xf2\x7e\xa1\x3f\xbf\xb5\
-\xf5\x6f\xc0\xed\x72\xbe\x71\x1f\x8f\xc5\x17\xce\x9d\x5d\x03\xbf\
-\x9b\xec\x6b\x0f\x9f\xfb\x2c\x60\x3c\xb3\x2e\x60\xac\x01\x58\x57\
-\x32\xd2\xd2\x1e\x7e\xf3\xf5\xd7\x6e\xba\xcf\x86\xcf\x7d\x15\x34\
-\xe0\xa0\x1a\xfb\x7a\xb1\xb7\x8f\xf0\x1f\x8f\xfd\x4c\xce\xff\xcd\
-\xb5\xab\xe9\x29\xc9\x49\x7f\xd4\x9d\xaf\xaa\xad\xfb\x6d\x75\x45\
-\x45\x16\xce\x03\xca\x8a\x8a\xc9\x75\xb9\x98\xfb\x78\xce\x8f\xd7\
-\xfd\x0e\xee\xdf\x5f\xc6\x6e\xf7\xc2\xfc\x82\x97\x6f\xde\xb8\xde\
-\x8e\xaf\xe5\xdd\x07\xdc\xdf\xbb\x7b\x17\x3a\xb4\x6f\x3f\x1a\x1f\
-\x18\xb8\xf0\x6f\x7f\xfd\xdb\x2b\x98\xfb\xbd\xba\xf7\xe8\xf6\xc1\
-\xdf\xdf\x7f\xf2\x85\x17\xe8\x1a\x5f\x67\x0d\x1d\xff\xf1\x7d\xa9\
-\x70\xa4\x26\xa7\xa0\x2d\x1b\x37\xbe\xcf\x3d\x0f\xb8\x74\x86\xcb\
-\xd1\xc7\x8f\x1e\xa1\xab\x57\xae\x20\xee\xb9\xc0\xc5\xb7\x81\xeb\
-\x45\xdc\x73\x1b\x60\x1c\xdb\xbf\x77\xef\x79\x93\xf3\x1f\x3e\xf4\
-\x30\xc9\x2b\x20\x72\xb2\xb3\xd1\xd6\xcd\x9b\x5d\x4c\xbe\x4b\x7b\
-\xdb\x76\x2e\xff\x71\xe0\xfd\xa9\x36\xae\x5f\x6f\x74\x1f\x09\xf8\
-\xde\x3f\x03\xbe\x27\x73\xc7\x7e\xcc\xb9\x63\x47\x8e\xdc\x37\xf9\
-\xec\xd6\xd6\xbe\xc0\xff\x87\x6c\xfe\xe3\x7d\x6d\x8a\x0a\x0a\xd0\
-\x8e\x6d\xdb\x66\x72\xcf\x87\x1c\x22\x92\xcb\x7f\x9c\x48\xe3\x3d\
-\x35\x36\x6d\xd8\xf0\x16\xfb\x5c\xf8\xbe\x4f\xc1\x67\xdf\x36\xbd\
-\x6f\x60\x13\xf6\xdf\x54\x71\x3f\x1b\x34\xe0\x6f\x30\xf6\x37\x60\
-\xfe\x63\xde\xe3\x9c\x1f\x3f\xcf\xcf\xcd\x43\xbb\xbe\xdc\xb5\x91\
-\x7b\x7e\x6d\x6d\xed\x24\x9c\xeb\x13\xee\x83\x2e\xe3\xf9\x3e\xce\
-\x01\x72\x1f\x64\x91\xb1\x7d\xcb\xa6\x4d\xdd\x74\xe7\x26\xc4\xc5\
-\xbd\x7a\xf5\xf2\xa5\x82\x63\x47\x0e\x93\x75\x82\x8c\xb4\x14\x14\
-\x1a\x1c\xbc\x10\xc6\x7a\xcc\xfd\x97\x3f\xed\xde\xe3\xb9\x0f\xde\
-\x7b\x9f\x7a\x7b\x3a\x79\xcc\x98\xa1\xe5\xbf\x96\x73\x5f\x5f\xbb\
-\x86\x39\x14\xc2\x3d\x0f\x38\xed\xc9\xc7\xd1\xbd\x30\x76\x6c\xdf\
-\xba\xf5\x4f\xdc\xf3\x81\x77\x17\xb9\xe7\x56\x56\x54\xa0\xf5\xeb\
-\xd6\xdd\x03\x4e\x9b\xdc\xeb\x85\xef\xb3\x63\xa2\xa3\xb1\x07\x2d\
-\x92\x7b\xee\xa3\x87\xed\x1f\xf1\xf1\xff\xc8\xe1\xc3\x58\x2f\x3e\
-\x36\xf9\xec\x96\xd6\xad\xdc\x1a\x41\x83\xaa\x1e\x6d\xde\xb8\xa9\
-\x70\xdb\x96\x2d\xcf\x73\xcf\x07\xde\x55\xb1\x73\x00\x1c\x78\xad\
-\x7c\xfd\x17\x5f\xec\xe6\x9e\x0b\xf3\x9f\x5f\x9b\xf2\x1f\x01\x9f\
-\x4f\xe1\xef\x32\xd2\xf4\xbb\x68\xc2\xf8\xee\x1b\x0a\xff\x86\x6a\
-\xf8\x2e\x6f\x71\xcf\x87\x9c\x3f\xb9\xa6\xaa\x8a\xe4\xfd\xf8\x11\
-\xcf\x07\xb0\x6f\x67\xe3\xfa\x75\x17\xb8\xe7\xc2\xb1\x6e\x98\xff\
-\xf8\xfa\x3d\x7c\x6d\x2f\x06\xde\x83\x1f\xe7\x00\x47\x0e\x1d\x42\
-\x5f\x6e\xdf\xfe\x89\xee\xdc\xaf\x8e\x1c\xf9\x9f\xb3\x67\x4e\x11\
-\x8d\xc0\x80\x71\x3f\x42\x3b\xee\xbf\xd4\xfd\xe3\xee\xcf\x51\x6f\
-\xcf\x8f\x23\xb8\xfc\xc7\xd7\x7a\x7d\xb9\x6d\x5b\xf4\x97\x3b\x76\
-\xfc\x4c\x77\xce\xb9\xb3\x67\x7f\x02\x87\x8e\xf1\x8d\xff\xd8\x3b\
-\x02\xfd\xdc\x68\x2c\x4a\xba\x7f\xff\xb7\x70\x7e\x1e\xb7\x4e\xa0\
-\x82\xb1\x0b\xf2\x50\x0d\xf4\x73\xa3\x31\xbd\xae\xb6\xd6\x0d\xe7\
-\xef\x5c\xfe\xe3\x7b\x48\x42\x9f\xcd\x80\x71\xf7\x57\xec\xf3\x1f\
-\x3f\x7a\xbc\x89\x8f\xff\xd8\xc7\x0e\x3c\x3a\xcc\x3e\x37\xfa\xce\
-\x9d\x37\xe0\x50\x22\x77\xfc\xc7\x79\xf7\x57\x47\x8f\x3e\x86\xf3\
-\x83\xd9\xe7\x17\x17\x15\xf5\x79\xd4\x0e\x59\x00\x9b\xff\xf0\xdd\
-\x0b\x61\x3c\xdd\xbd\x73\x67\x29\x7c\x97\xbf\xb2\xcf\x6f\xd7\x68\
-\x16\xf0\x8d\xff\xf8\x9a\x5a\x38\xf7\xea\xce\x1d\x3b\xf4\x7b\xdf\
-\x7d\x73\xed\x5a\x37\xc8\x25\xbe\x6b\xe1\x70\x1f\xff\x0c\xf6\xdf\
-\xc2\xf9\x0b\xd9\x9f\x9d\x99\x9e\xf9\x77\xc8\xff\xeb\x74\xdc\xc7\
-\xc0\xe3\x3f\xce\x8b\xf6\xee\xde\x5d\x07\xe7\xf7\x62\x9f\x5f\x52\
-\x5c\x1c\x8a\xbf\x27\xe6\x3d\xd6\x00\x7c\x6f\x1f\x5c\xef\xc7\x7b\
-\xf4\xe3\x35\x3e\xf8\xb7\x7c\x0c\x7f\xc3\xcc\x6f\xbf\xbe\xfa\xcb\
-\x2b\x17\x2f\x6a\x54\xb5\xb5\xe4\xdf\xd8\xd7\xc7\x27\xf2\x6f\xef\
-\xbe\xfb\x22\x1e\xf7\x7b\x7c\xdc\xbd\xdb\x87\xff\xf8\xf0\x29\xea\
-\xed\xf9\x71\x84\x8e\xff\x78\x3e\xfc\x08\xfe\x53\xd5\xa9\xd0\xc9\
-\x13\x27\x70\x5f\xbc\xb3\xeb\xcb\x2f\xfd\x8f\x1e\x3a\xd4\xf5\xc2\
-\x99\xb3\x1b\xd4\x0d\x8d\x26\x75\x7b\xcc\xd9\xdc\xdc\x5c\x04\xe7\
-\x60\xde\x1d\x85\x79\xe4\x7b\xc0\xef\xd7\x81\x73\xdf\x93\x39\x3f\
-\x8b\xd3\xba\xf5\x84\x68\x18\xd3\xe1\xdc\x06\xf8\xfc\xd5\x87\x0f\
-\x1e\x7c\xe9\xf0\xa1\x43\x7d\x73\x73\x72\x6a\xb8\xeb\x0d\xf8\x77\
-\x35\xc2\x58\x87\xeb\x53\x70\x7e\x12\xe8\xd1\xb4\xa3\x87\x0f\x77\
-\x3d\x75\xfc\x78\x04\xce\x85\xf1\xba\x00\x9b\xff\xf8\x7c\xe8\xff\
-\x64\x0f\x6b\xf8\xec\xb3\x7b\x76\xed\xea\x73\xe8\xe0\xc1\x6e\xa0\
-\x09\x17\x99\x39\x7c\xbb\xd1\xfc\x1f\x6b\x00\xbe\xa7\xfd\x8e\x6d\
-\xdb\xdb\x77\x6c\xdb\xba\x09\x7e\xee\xcd\x43\xfb\xf7\xbf\x9b\x9e\
-\x9a\x5a\xa0\xbb\x17\x91\xee\xbe\xe1\x78\xfe\x8f\xe7\xe1\xd8\x27\
-\x0b\xdf\x25\x1f\x3e\x3f\x0c\xbe\xcb\x93\xc7\x8f\x1d\x9b\x84\xbd\
-\x32\x78\x1d\x81\xcd\x7f\xbc\xa6\x80\xe7\xe1\x38\xb7\x86\x73\xbf\
-\x01\xce\x8d\x3e\x72\xe8\xc0\xd3\x57\x2e\x5d\x3a\x80\xaf\xd5\xc5\
-\xfb\xe8\x73\xf9\x8f\xc7\x74\xf8\xf7\xc6\xe7\xef\x82\x39\xd2\xef\
-\x0e\xec\xdb\xff\xeb\x7b\xd1\xd1\xc9\xcc\x7c\xbf\x9a\xf8\x7a\x30\
-\xaa\x89\x9f\xb7\x9c\xd4\xed\xb7\x6f\xdd\x56\xb1\x63\xfb\xf6\xa5\
-\x47\x0e\x1e\x7a\xf6\xd0\x81\x03\xee\x90\xa3\x34\x63\xfe\xe7\xe5\
-\xe4\xa0\x7c\x00\xbe\x8f\x47\x7a\x5a\x2a\xb9\xbf\x2f\x5e\xeb\xc7\
-\x7b\xf8\xe2\x6b\xfc\x6e\xdd\xbc\xf1\x34\x5e\x6b\xbc\x7c\xf9\x82\
-\xca\xdd\xd5\x7d\xc2\xc7\xff\xfe\xe8\xc9\xbe\x7d\xfa\xbc\xd0\xb3\
-\xc7\xa7\x38\xe7\x7f\x92\x8e\xfb\x3f\x9e\x60\x8f\xff\xb8\x3e\x87\
-\xa3\xae\xae\x8e\xec\xeb\xba\x6f\xdf\x3e\xfc\xf2\xd5\xf2\xf2\x0a\
-\xb2\x36\xd4\xda\x62\xba\x26\xa8\x0b\x3c\xbe\xdc\xba\x79\xf3\x30\
-\x3c\xf5\xac\x85\x3e\x8b\xc7\x4c\xcc\x4b\x2e\xa7\x31\xcf\xf3\x40\
-\x33\x80\x9f\xa8\x5e\xa5\xfa\x48\xa3\xd1\x24\xe0\xf3\x4c\xd6\x1b\
-\xf1\x98\x8e\xd7\x16\x80\x2f\x69\xa9\x0c\x37\x20\x5e\xac\x80\xbe\
-\x8f\xd7\x05\xc8\xfd\x02\xd9\xf5\x7f\x00\xce\x47\x2a\x60\x8e\x81\
-\xfd\xea\x17\xcf\x9f\x4f\x80\xf3\xff\x5d\x55\x59\x4e\xde\x6f\x21\
-\xf7\xd5\x6e\xd1\x03\x6b\x00\x9e\x07\x14\xe4\xe5\x93\x7b\xdc\xc3\
-\xa3\xe7\xa3\x87\x8f\x0e\x61\x9e\xb7\xe3\xcf\x63\xed\xfb\x89\xe7\
-\xe7\x90\x13\x10\x0d\xc0\x7b\x63\xe3\x3d\xb1\xf1\xbf\x0b\xe6\x21\
-\x59\xe3\x6b\x56\x1b\xad\xef\x61\x4e\x3f\x6e\x6f\x23\xf3\x6a\xbc\
-\x77\x2e\xe4\x19\x8d\x70\xfe\x6f\x70\x1d\x0e\xdf\x4b\x8f\xbb\x17\
-\x38\xd1\x0c\xf8\x1c\x9c\x87\x9f\xf8\xea\x2b\x74\x3f\x21\x71\x31\
-\x7c\xc0\xa2\x52\xd0\x33\x3c\x46\x57\x96\x1b\xd6\xf5\xb0\xa7\x07\
-\xe7\x01\xf8\x5a\x5c\x7c\x4d\xde\x4e\xf8\x2e\x75\xb5\x35\xbf\x81\
-\x9c\xa0\x1e\x8f\xf3\xb9\x0f\x1e\xa0\x6c\xe0\x3d\x1e\xd7\xf1\x77\
-\x4d\x23\xf7\xe2\x4c\x25\x7b\xfa\xa9\xea\x6a\xf0\xbf\xfb\x5d\xf8\
-\xb7\x7c\x76\x69\xc4\xe2\x6c\x1f\x1f\xef\xff\xc3\x7d\x60\xc8\xa0\
-\x81\xdd\x46\x0c\x1b\xf6\xd3\x7f\xfc\x83\x5e\xcb\xf3\x63\x8b\xb0\
-\xb0\xb0\x70\x24\x10\x30\x6e\x91\xda\x9e\xd0\x71\x76\xe0\x5c\x60\
-\xfb\x96\x2d\xbb\x81\xbb\xfd\xe4\x9c\x1f\x17\x1b\x8b\xce\x9c\x3e\
-\xfd\xff\xe0\xe9\x2d\x39\xe7\x43\xae\x20\xfb\xbb\xe0\x80\x39\x46\
-\x4c\x63\x43\xe3\xef\xe4\x9c\x8b\xd7\xbc\xe0\xf3\x07\xc1\xd3\x2d\
-\x72\xce\xc7\xb9\xba\x39\xdf\x05\xc6\x74\x55\x55\x45\xc5\x4f\xe5\
-\x9c\x8b\xd7\xed\xe1\xdf\x7d\xfa\xa3\xf6\xb6\x50\x39\xe7\x5f\xbd\
-\x7c\x19\x5d\xba\x78\xa1\x1b\x3c\x2d\xc1\xaf\xb1\x4e\x3d\x02\x2d\
-\xc5\xed\x01\x73\x13\xe2\x25\xc0\xd7\xed\x56\x81\x76\xe0\x7d\xbe\
-\x20\x47\xfb\x10\x7f\xf7\x29\x13\x27\xbe\x8e\x1f\xc7\xb8\x7b\x3c\
-\x8b\xef\xc5\xd7\xa7\x77\xef\x27\x9f\xef\xd6\x8d\x8e\xfb\x3f\xb2\
-\x08\x0a\x0a\xf2\x3e\x0e\x71\xf8\xf0\xe1\x4b\xa7\x4e\x9e\x8c\x3e\
-\x71\xe2\x04\xc1\xe9\xd3\xa7\xef\xe1\x5c\x74\xfd\xba\x75\xbf\x3f\
-\x7b\xe6\x4c\xca\x89\xe3\xf0\xbe\x1e\xc7\xa3\x8f\x7f\xf5\x15\x01\
-\xcc\x15\x62\x4e\x9f\x3a\x15\x07\xef\xdd\x59\xbf\x76\xad\x1f\x8c\
-\x2d\xee\xc0\xeb\x74\x78\xff\x1e\x20\x16\x03\x3e\x37\x8e\x8d\x33\
-\x67\xce\x24\x1d\x39\x74\xe8\xdb\x35\xab\x56\xfd\xe5\xe8\x91\x23\
-\x07\xe0\xfc\x14\x78\x3f\x9e\xe0\x04\x79\x4c\x34\xe0\x44\xe2\x85\
-\xb3\x67\x53\x76\xed\xfc\xf2\xfc\x17\x6b\xd6\xfc\x16\xbe\x4b\xf6\
-\xe9\x53\x27\xef\x9f\x02\x9c\x3c\x79\xf2\x3e\x70\x31\x89\x0d\xf8\
-\xac\x64\x78\x4c\xdc\xb4\x61\xc3\x7c\xc8\xd5\x07\x9c\x3b\x7b\x36\
-\x0f\x3e\x07\xbf\x97\xc2\x07\x38\x9e\x09\xe3\x73\xf4\x9a\xcf\x3f\
-\xff\x14\x34\x60\x1d\xe4\x31\xb9\xf0\x7e\xba\x29\x4e\x65\xc0\x63\
-\x06\xcc\x47\x72\x80\x43\xdf\xae\x5d\xbd\xfa\x0f\x67\x4e\x9d\x4a\
-\x61\xde\x3f\xc1\x8b\xb3\xa7\x4f\x65\x9e\x39\x7d\x2a\x7b\xeb\xe6\
-\xcd\x9b\xb7\x6c\xdc\xd4\xfd\xc2\xb9\x33\x15\xa7\x4f\x9c\xc8\x82\
-\xcf\xc9\xe6\x03\x1c\x2f\x80\xf1\x3f\x19\xfe\x4e\x57\xf8\x1d\x8b\
-\xe0\x75\x19\x7c\x4e\xce\x99\x53\x27\x01\x27\x38\x38\x99\x0b\xc7\
-\x4b\x61\xde\x72\x07\xce\xff\xeb\xa9\x13\xc7\xa3\xcf\x9f\x3d\x53\
-\x04\xbf\x33\xef\xdc\xe9\xd3\x39\xf0\x3d\xb3\xcf\x9d\x39\x93\x7e\
-\xfc\xd8\xd1\xfb\x07\xf6\xed\x8d\xde\xbc\x71\xe3\xc9\x65\x91\x4b\
-\xd7\x6e\x58\xfb\xc5\xff\xee\xdd\xb9\xeb\xc9\x2f\x3e\xff\xfc\xc9\
-\x39\xd3\x67\x3c\xb5\x78\xde\xfc\x27\x67\x4d\x9f\xfe\x93\xb7\x7e\
-\xfe\x16\xe5\x3e\x0d\x1a\x34\x68\xd0\xa0\x41\x83\x06\x0d\x1a\x34\
-\x68\xd0\xa0\x41\x83\x06\x0d\x1a\x34\x68\xd0\xa0\x41\x83\x06\x0d\
-\x1a\x34\x68\xd0\xa0\x41\x83\x06\x0d\x1a\x34\x68\xd0\xa0\x41\x83\
-\x06\x0d\x1a\x34\x68\xd0\xa0\x41\x83\x06\x0d\x1a\x34\x68\xd0\xa0\
-\x41\x83\x06\x0d\x1a\x34\x68\xd0\xa0\x41\x83\x06\x0d\x1a\x34\x3a\
-\x4d\xc8\xdd\x1f\x8a\x86\x1d\x63\x31\x6f\xd3\x2d\x92\x38\xde\x83\
-\x1e\xa7\xc7\xe9\x71\x7a\x9c\x1e\xa7\xc7\xe9\x71\x7a\x9c\x1e\xa7\
-\xc7\xe9\x71\x7a\x9c\x1e\xa7\xc7\xe9\x71\x7a\x9c\x1e\xa7\xc7\xe9\
-\x71\x7a\xbc\x93\x1e\x5f\x64\xe7\xe3\xc8\xb1\x8f\x3f\x21\x71\xbc\
-\xab\x95\xc7\x9f\x91\x38\xfe\x92\x9d\x8f\xbf\x2d\x71\xbc\x87\xc4\
-\xf1\x45\xe2\xc7\x59\xff\xbc\x16\x1d\x7f\x46\xe2\xf8\x4b\x76\x3e\
-\xfe\xb6\xc4\x71\x24\x7e\xbc\xab\x95\xc7\x5f\x92\x38\xfe\xb6\x8d\
-\x8f\xf7\xb0\xee\x38\xbb\xf5\xf9\x8e\x77\x95\x38\xfe\x92\xc4\xf1\
-\xb7\x25\x8e\xf7\xb0\xf2\xf8\x22\x89\xe3\x48\xfc\x78\x57\x89\xe3\
-\xbd\x25\x8e\xbf\x24\x7a\xfc\x49\xce\x9f\x8f\x16\x2f\x7e\xf3\x89\
-\xc5\x2f\x77\xed\xf2\x6e\xd7\x2e\xef\x3c\xdd\x65\xdc\x8b\xdc\xe3\
-\x11\xf9\x1f\x77\xbd\xf1\x71\xd7\xc5\x73\x9f\x59\x3c\xf5\xa5\x2e\
-\xaa\xa7\x39\x7f\x1e\x1c\xff\xd5\x13\xe4\x94\x67\xf0\x29\xa6\xc7\
-\x17\xdf\xf8\xc5\x13\x37\x7e\xd1\x75\xf1\x3f\xbb\x2e\x7e\xf7\x99\
-\x2e\x53\x4d\x56\x55\xb9\xdf\xff\x09\x89\xe3\xdc\xbb\x13\x2d\xfe\
-\x14\xde\xfc\x29\xfe\x41\x72\xf8\x27\xcb\x25\x7e\x9e\xf3\xcf\x43\
-\x83\x86\x50\xfc\x11\xba\x0b\xe9\x3e\x4f\xe0\xff\xdf\x31\x21\x32\
-\x0d\x1a\x34\x68\xd0\xa0\x41\x83\x06\x0d\x1a\x34\x68\x58\x1b\x4b\
-\x17\x2c\x7c\x32\x6c\xe6\xac\xe7\xa6\x4e\x9c\xf4\x52\x68\xd0\xf8\
-\x57\xe4\x60\x62\x70\x08\xc1\xa4\x90\xd0\x57\x26\x85\x8a\x63\xca\
-\x84\x89\x26\x80\xdf\xf5\xda\xb4\x49\x93\xf5\x98\x31\x65\x2a\xc6\
-\xab\xa6\x98\xa2\xc7\xcc\xa9\x53\x5f\x9b\x35\x6d\x9a\x16\x53\x09\
-\x66\x4f\x9f\xfe\xda\x9c\x19\x33\x4c\x30\x77\xc6\x4c\x59\x98\x37\
-\x6b\xf6\xeb\x80\xd7\xf8\x10\x3e\x67\xee\xeb\x04\xb3\x39\x80\xf7\
-\xe6\xcf\x0d\x7b\x83\x8d\xf0\xb9\x61\xaf\x71\xf0\xca\xa2\x79\xe1\
-\xcf\x2f\x99\xbf\xe0\xe9\x88\xf9\x0b\x1c\xfa\x5e\x99\xf0\xef\xfa\
-\xb3\x89\xc1\xa1\xef\xf9\x8f\xf3\x1d\x30\xce\x7b\xec\x08\xbf\xb1\
-\x3e\x23\x31\x7c\x75\xf0\x19\x37\xd2\x4f\x0b\x7f\x1f\xdf\x51\x3a\
-\x04\x8c\xc3\xf0\x1b\xe5\xef\xeb\xe7\x12\x00\x08\xf4\xf5\x77\x09\
-\xf2\x03\xf8\x07\x18\x61\x7c\x40\xe0\xe8\xe0\x80\x40\x57\x13\x04\
-\x06\xe9\x11\x12\x14\xe4\x1a\x1a\x14\xec\x06\x7d\xcb\x14\xe3\x83\
-\xdd\x27\x10\x84\xba\xc3\xf7\x64\x10\x12\xea\x3e\x29\x64\x82\x07\
-\x0b\x9e\xec\xd7\x93\x43\x27\x1a\x61\xca\x84\x49\x9e\x5c\x40\x1f\
-\xf4\x9c\x36\x71\xb2\x27\xf4\x3f\x2f\x51\x4c\x9e\x32\x66\xba\x09\
-\xa6\x1a\x61\xc6\x94\x69\x63\x31\x66\x32\x8f\x63\x66\x4d\x9b\x31\
-\x7c\xee\xcc\x59\xff\x5a\x38\x2f\xfc\xe7\xd0\xfe\xcf\xd8\xbb\x8d\
-\xc5\x02\xf8\xf4\xee\xa4\x10\xdf\x75\x63\x3d\x47\x9f\xf2\x70\x1d\
-\x71\xc5\xc3\x65\xf0\x75\x8f\x51\xfd\xff\x03\xf8\xde\xd3\xa5\xff\
-\x0f\x9e\x2e\x03\x8c\x31\x7a\xc0\x1d\x02\x17\x1d\x06\xde\xf1\x1a\
-\x0d\x70\x1d\x74\x67\x8c\xeb\xa0\xbb\x7c\xf0\xd6\x3f\x1f\xac\x87\
-\xb7\xeb\xe0\x68\x02\xb7\xc1\x31\xc6\x18\xa2\xc7\x58\x03\xee\x11\
-\xb8\x6b\x1f\x01\xde\xee\x06\xc0\xfb\xb1\x06\x0c\x35\x82\x8f\xc7\
-\xb0\x58\x1f\xf7\x61\xb1\xe3\x3c\x0c\xf0\xf1\x18\x1e\xe7\xeb\x39\
-\x3c\x5e\x0f\xaf\x11\xc2\xf0\x1c\x11\x3f\x0e\xce\x61\xc3\xd7\x6b\
-\x78\x02\x1b\xe3\xb4\x80\xe7\x89\x7e\x63\x46\xc6\x4f\x0c\x70\xbd\
-\x37\x77\xfa\x94\xd5\x73\x66\xcc\xfc\xc7\xe2\xf0\xf9\x2f\xda\xbb\
-\x8d\xc5\x62\xc3\xba\x75\x2e\x6d\x9a\x26\xd4\xac\xaa\x65\x50\x27\
-\x07\x35\xf2\x50\x6b\x0d\xaa\x85\x51\x63\x2b\x54\x19\xa1\xa9\xda\
-\x32\xb4\xc0\xbf\xd1\xc1\x3d\x7b\xa2\x67\x4d\x9d\x36\x78\x41\xd8\
-\xbc\xd7\xec\xdd\xc6\x62\xb1\x76\xd5\x2a\xcf\x96\xa6\x46\xd4\x08\
-\x7f\x2f\x41\xb5\x5c\x54\x4a\xa3\xca\x1a\x54\x88\xa3\xd2\x96\x28\
-\xd7\xa3\xa1\xc2\x7c\xe0\xbe\xb4\x7b\xc7\xf6\xfb\x33\xa7\x4c\x75\
-\x85\xf6\xff\x2f\x7b\xb7\xb1\x58\xac\x59\xb5\xc2\xb8\xfd\x9d\xa9\
-\x1f\x74\x50\x1f\x30\xb7\x1f\xe0\xf6\xdf\xb5\x7d\x5b\xd2\xcc\xa9\
-\xd3\x70\xfb\xbf\x69\xef\x36\x16\x8b\x35\xab\x56\x7a\xb6\x36\x37\
-\x21\x75\x6d\x2d\x3f\x6a\xe4\xa0\x46\x1e\xaa\x2d\x45\xb5\x38\xaa\
-\x6c\x89\x2a\x3d\x1a\x2b\xe5\x41\x53\x5b\x47\xf8\x3f\x63\xea\x14\
-\x87\x6f\xff\xcf\x97\x47\x7a\x56\x16\xa5\xa2\xe2\x07\x09\xc2\xc8\
-\x16\x43\xbc\x16\xec\xe7\x22\xc8\xb2\x14\x71\xd2\xc8\xb4\x25\x62\
-\x19\x64\xc4\xa2\xa2\x74\x40\x86\x30\x4a\xe0\xfc\xad\x1b\xbe\x48\
-\x84\x79\xab\xc3\xb7\xff\xea\x95\x02\xfa\x4f\xc7\x03\x8b\x73\x02\
-\xad\xfe\x3b\x47\xfb\xaf\x58\xe1\x21\xab\xfd\x69\x1f\x30\xea\x07\
-\x72\xda\x7f\xfa\xe4\xc9\x9d\xab\xfd\x9d\xa9\x1f\xd8\x51\x0f\x9c\
-\xa9\xfd\x57\x46\x45\x7a\x54\x15\xa7\xa3\x92\x9c\xfb\xe6\xe3\x01\
-\x20\x5b\xfb\x28\x8a\x44\x69\x64\x5b\x83\x04\x61\x64\x75\x1c\x8a\
-\xd3\x01\x99\x09\xa8\x14\x9e\x6f\x83\xf1\xdf\x19\xda\x7f\xf5\x8a\
-\x95\x1e\x2d\xcd\x6a\xf3\xf8\xef\x8c\x7a\xd0\x81\x5a\xa0\xe3\xff\
-\xb4\x49\x93\x47\x3b\x7e\xfb\xaf\x70\x37\x5b\xff\x69\xfb\x8b\xe6\
-\x05\x46\xed\x3f\x37\xcc\xf1\xdb\xdf\x5a\xfe\xd3\x7e\x60\xd4\x07\
-\x34\xb5\xd0\xfe\xdb\x60\xfc\x87\xf6\x9f\x3f\x67\xae\x43\xd7\xff\
-\xa0\xfd\xdd\x5a\x35\xcd\x48\x5d\x27\x50\xff\xb1\x04\x3f\xf2\x9a\
-\x51\x4b\x5d\x1d\xda\xbd\x7d\xbb\x53\xb4\xff\x8a\xa8\x08\xb7\x4a\
-\xc8\xff\x8a\x73\x12\x19\x88\xd5\x81\xcc\x81\x68\xcd\x88\x5b\x3b\
-\xb2\x55\xcd\x48\xa2\x6e\x64\xa3\x5a\x51\x29\x60\xdb\x86\xb5\x44\
-\xff\x1d\xbd\xfd\x57\xad\x58\xe6\x46\xf4\x1f\x34\x4b\x0f\x25\xc6\
-\x02\x87\x19\x0f\x3a\x7e\x8e\xa8\xa9\xad\x71\x1a\xfd\xe7\x6d\xff\
-\x4e\xd7\x07\x3a\x36\x27\xd0\xb5\xff\xd4\x89\x93\x5c\xc2\x67\xcf\
-\x71\xec\xf6\x5f\x2e\xd0\xfe\xb4\x1f\xfc\x28\xda\x7f\x45\x64\x84\
-\x5b\x55\x71\x06\x2a\xc9\x49\x12\x01\xbb\x8e\xc3\xaa\xeb\xe4\xb0\
-\x1e\xcd\xa9\x19\xc9\x82\xf3\xd6\x8c\xca\xe0\xf3\xb7\xc2\xf8\xef\
-\x0c\xed\xbf\x6a\xf9\x72\xe0\x7f\x93\x30\xff\xed\xaa\x07\x32\xb4\
-\xc0\x01\xf5\x00\xf3\x7f\xe7\x56\xe7\xe0\xff\xca\xe5\xcb\x5c\x45\
-\xf5\x9f\x8e\x07\x16\xb6\xff\xd6\x84\x29\x13\x26\x3a\x49\xfb\x9b\
-\xc1\xff\x4e\xd9\x0f\x94\x9d\x23\x90\xf6\xdf\xb6\x35\x61\x72\xe8\
-\x84\x51\x8e\xdf\xfe\xcb\x5d\x5b\x35\x1a\xa4\xae\x53\x09\xa0\x4e\
-\x04\xb4\x66\xc4\x5f\xff\x51\x39\x4d\xfb\x2f\x5b\xba\xd8\x15\xe7\
-\x7f\xc5\x90\x9b\x49\x23\x91\x83\x84\x4e\x58\x33\xb2\xde\x63\x84\
-\xeb\x3f\x5b\xd7\xaf\x49\x98\x1c\x12\xea\xf0\xed\xbf\x22\x2a\x52\
-\xab\xff\x35\x16\x80\x8e\x07\x42\xfa\xff\xe5\xd6\x2d\xb8\xfd\x47\
-\xce\x9f\xed\xd8\xf5\x9f\xe5\x56\xb5\x3f\xa7\x1f\xd4\x28\xd4\x0f\
-\x1c\xa2\x0f\x58\x9e\x1b\x3a\x57\xfb\x47\x29\xd0\xfe\x9c\xbe\xf0\
-\x23\xef\x07\xa4\xfd\xb7\x6c\x89\x9f\xe4\x04\xed\x1f\x19\xb1\xc8\
-\x45\xba\xfe\x23\x03\xb9\xc9\x1c\x24\x59\xe6\x29\x72\xd8\x9a\x91\
-\x48\xbd\x28\x9b\xa7\xfe\xb3\x7e\x4d\x3c\xe6\xff\xdc\x19\x33\xdf\
-\xb0\x77\x1b\x8b\xc5\x8a\xa8\x65\x2e\x2d\xcd\xcd\xc0\xdb\x5a\x2b\
-\x21\xa2\x09\x8e\x56\x33\xb2\x95\x16\x54\x19\xf3\x1f\xe7\xff\x33\
-\xa7\x4e\x75\xe8\xf6\x5f\x1e\xb9\xd4\x45\x59\xfd\xe7\x6b\xff\x8e\
-\x1c\x0f\x64\xb4\xbf\x8d\xc7\x03\x32\xff\xdf\xb2\x25\x0e\xeb\xbf\
-\xc3\xb7\x7f\x54\xa4\x4b\x2b\xf0\x5f\x68\x5e\x2e\x8b\xdf\x0e\xd9\
-\x0f\x6c\xad\x05\xc2\x7d\x40\x53\xa7\x6d\xff\xe0\x10\xc7\x6f\xff\
-\xc8\x48\x97\x36\x8d\x06\x35\xa9\xea\xa5\x51\xc7\x40\x4d\x20\x54\
-\x2f\x92\x42\x9d\xe3\xd5\x8c\x2c\xae\x17\xf1\xd7\x8c\x5a\x54\x2a\
-\x5c\xff\x8d\x9b\x30\x3e\x64\xe4\x8c\x29\x8e\xdd\xfe\x86\xfc\xcf\
-\xfc\x9c\xac\x98\x0d\x59\xf5\x23\x56\x1d\xe9\x81\x42\x75\x23\x07\
-\xac\x19\x95\x02\xb6\xae\x5b\x1d\x17\x1a\x34\xde\xe1\xdb\x1f\xf4\
-\x7f\x14\xd1\x7f\x5c\xcb\xb5\x00\x66\xe5\x81\x9d\x3a\x2f\x30\xd6\
-\x7f\xc8\xff\x62\xa1\xfd\x87\xcf\xec\xe4\xed\x2f\xdc\x0f\x64\xf6\
-\x85\x1a\x85\xea\x05\x0e\x94\x13\x38\x59\xfb\x8f\x64\xda\x9f\xb3\
-\xae\xd3\xd1\x7d\xa1\x13\x69\x01\xd3\xfe\x9b\x9d\xa2\xfd\xa3\x96\
-\x2c\x1a\x59\x5d\x92\x89\xca\x72\x53\x08\x4a\x79\x91\x2c\x8e\xbc\
-\x14\x7e\xc0\xcf\x96\x98\x80\x5b\x27\xe2\xd6\x8c\x14\xaa\x1b\x29\
-\x55\x2f\xb2\xa0\x66\x54\x06\x9f\xbd\x65\xdd\xea\xd8\x90\xa0\x20\
-\x87\x6f\xff\x15\x91\x4b\x47\xb6\x92\xfc\x5f\x05\xb9\x3d\x17\x75\
-\x04\xd2\x6b\xc1\x12\x9a\x60\xf6\x5c\xd2\x01\x7d\x46\x66\xf1\xbf\
-\x16\xed\xd8\xbc\x09\xf8\x0f\xed\xef\xe0\xf3\x3f\xa6\xfd\x9b\xa1\
-\xfd\xeb\xf4\xed\x2d\x04\x8b\xc7\x08\x4b\xea\x09\x8e\x36\x1e\x58\
-\xd0\xfe\x21\x81\x81\xc3\x67\x4c\x99\xe2\xd0\xed\xbf\x7c\x29\x8b\
-\xff\xb8\x0f\xc8\xe8\x07\x16\xf7\x05\xde\xda\x52\x07\xe8\x40\x07\
-\xe7\x86\xb8\xfd\xbf\x74\x96\xf6\x87\xfc\xaf\xad\xa5\x05\x35\x37\
-\x36\x32\x68\xc0\x68\x60\xa0\x92\x87\x26\x3d\x64\xd4\x90\x58\x75\
-\x24\x03\x24\xea\x45\x8e\xe8\x33\x12\xa9\x09\xb5\xc0\xdf\x88\xf3\
-\xbf\x60\x68\xff\xa9\x13\x27\x39\x74\xfb\x47\x46\x2c\x1c\x5e\x5d\
-\x9a\x09\xf9\x5a\xb2\x29\x20\x1f\xd3\x23\x47\x04\xda\x3c\xd0\x28\
-\x8f\x93\x02\xd7\x5f\xae\x85\xb0\xef\x48\x21\x8f\x91\x92\x35\x23\
-\x81\x7a\x10\xbe\xfe\x7f\xf3\x17\x9f\xc7\x8c\xf7\x0f\x18\x36\x6d\
-\x92\x63\xb7\xff\xf2\xa8\xa5\xc3\x89\xfe\xd7\xab\x78\x50\xc7\x40\
-\x55\x27\x7b\x6c\x30\x2b\x37\x34\xe1\xa7\x23\xe5\x84\x96\x8f\x07\
-\x58\xff\xb7\x6f\xde\x14\x33\x3e\xc0\xf1\xdb\x7f\x59\x64\xa4\xb6\
-\xfd\xeb\xb5\x10\xe8\x07\x2a\x1e\xd8\xa8\x0f\xf0\xf7\x03\xe7\xb9\
-\x06\xc1\x99\xda\x7f\x79\x64\xe4\x30\xbc\xfe\xd3\x0c\x6d\xcf\x45\
-\x93\x11\x44\xfa\x81\x40\x7f\x90\x3d\x5f\x14\xe8\x03\x4e\xd7\x0f\
-\x38\xed\x1f\xe4\xef\x3f\x74\xea\xc4\x89\xaf\xdb\xbb\x8d\xc5\x62\
-\xe9\xe2\x45\x43\x6b\x4a\xb3\x51\x79\x7e\x9a\x28\xca\x08\x52\x0d\
-\xc8\xc3\x48\xe1\x40\xfb\xbe\xfe\x38\x83\x52\x41\x18\xd7\x8a\xc4\
-\x6a\x4e\x26\x75\x22\xa3\x5c\xc2\xb1\x3c\x46\xb8\xfe\x83\xc7\xff\
-\x20\x3f\xc7\x6f\x7f\xd0\xff\xa1\x24\xff\xc7\xf9\x7e\xbd\x3c\x18\
-\xf4\x40\x97\xd3\xab\x8c\xe7\x8f\x3c\xba\x20\x79\x1d\x81\x84\x0e\
-\x48\x6a\x81\x03\xcd\x15\x35\x2a\xe7\xe1\xff\xb2\x28\xdc\xfe\xa0\
-\xff\x0d\xf5\x06\xf0\x8c\x05\xa6\x63\x83\x36\x37\x50\xa9\xa4\xdb\
-\x5f\x25\xb3\xfd\x4d\xfa\x40\x8d\x44\x1f\x70\xcc\x6b\x13\x99\xf6\
-\xdf\xe8\x7c\xfc\xd7\xa3\x5e\x76\x7f\x50\xae\x1f\x58\xda\x07\xec\
-\x99\x13\xf0\xf7\x03\xd2\xfe\x9b\x36\xc5\x04\xfa\xfa\x0d\x75\xf4\
-\xf9\xff\xb2\xc8\xa8\xa1\xed\xad\xad\x48\xa3\x6e\x12\x80\xda\x80\
-\x46\x40\x83\xf6\xd1\x08\xac\xda\x51\xbd\x0e\x22\xe3\x87\x4a\x08\
-\x42\x35\x22\xd3\xb5\x09\xe9\xeb\xd4\xec\x57\x2f\x6a\x01\x5e\x6c\
-\xdb\xb4\x31\x26\xc0\x09\xda\x1f\xe7\x7f\xd5\x65\x59\xa8\xac\x20\
-\xd5\x38\xbf\xe3\x45\x0a\x03\x92\xeb\x25\x9b\xe4\x7f\x4c\x2e\x97\
-\x2c\x7b\xdd\x50\x70\x0d\x50\xa2\x46\x24\x5c\x2b\xe2\xb9\x3e\xcd\
-\x0e\x35\xa3\x32\x78\xbe\x61\xcd\xca\x98\x00\x9f\x71\x43\x1c\x5e\
-\xff\x97\x2e\x19\xc2\xd4\x7f\x1b\x18\x34\x98\x01\xa1\xf1\x40\xce\
-\x58\x20\xa7\x56\x60\xf6\x38\x60\xef\x9c\xa0\x4a\xaf\xff\x5b\x37\
-\x6d\x88\xf1\x87\xf6\x9f\x32\xc1\x39\xda\x5f\x03\x6d\xaf\x83\xb5\
-\xfd\xc0\x34\x27\xb0\x4d\x1f\x10\xad\x15\xda\x71\x6e\xa0\x6d\xff\
-\xe8\x00\x1f\xdf\x21\x93\x42\x42\x1d\xbc\xfd\x23\x07\xb7\xb5\xb4\
-\x92\x31\x9c\xdd\x07\x08\xcc\xe9\x03\xba\xbc\xd1\x0a\x2d\x68\x52\
-\xb4\x0f\xd8\xb0\x1f\x48\xf4\x05\x0d\xfc\x4d\x5b\x37\x6e\x8c\xf6\
-\xf7\xf1\x1d\xec\xe8\xed\x0f\xe3\xff\xe0\xda\x8a\x5c\x54\x51\x94\
-\x89\x2a\x0a\x31\x32\xb4\x48\x37\xa0\x20\x1d\x95\x9b\x85\x34\x54\
-\x5e\xc8\x3c\x2f\xd3\xd7\x8e\x00\x79\x69\x46\x75\x21\x31\x88\xd7\
-\x87\xe4\xe4\x11\x22\x6b\x51\x36\xbe\x2e\xad\x1c\xf2\x95\x0d\x6b\
-\x57\x39\x45\xfb\x47\x2d\x59\x3a\xb8\x8d\x2f\xff\x37\xc9\xf1\x71\
-\xee\xaf\x5b\x1f\x16\x83\xe9\x1c\xd2\x64\x6d\x41\xe6\x5a\x82\xdc\
-\xda\x90\x2c\x3f\x51\x07\x6a\x01\xc3\xff\x0d\x77\xfd\xc6\xfa\x0c\
-\x9e\x1c\xea\xd8\xed\x0f\xf3\x7f\x6d\xfb\xab\x39\x68\x64\xd0\xc8\
-\x42\x43\xa3\xb6\x0f\xc8\x1c\x0b\xac\x6c\xff\x26\xd1\xf6\x77\xa0\
-\x3e\xc0\xd3\xfe\x5b\x9c\xa4\xfd\x97\x46\x44\x0c\xe2\x6f\x7f\x4e\
-\x3f\x60\xf7\x07\x0b\xfa\x81\xc9\x5a\x92\xc2\x7d\x40\xde\x35\x07\
-\x1d\xa3\x03\x4c\xfb\xaf\xbf\xeb\xeb\x3d\xd6\xe1\xdb\x3f\x72\xc9\
-\x92\x81\xed\x6d\xed\xa8\xa5\x59\x23\x81\x66\x63\x34\x01\xd4\x80\
-\x46\x3c\x56\xe8\xc6\x0c\x3e\x18\x8f\x21\xcd\x0d\x3a\xb0\xfa\x0f\
-\xb7\x46\x64\xe2\x31\x12\xf3\x0e\xd5\x8b\xd4\x84\xcc\xdc\xcf\x48\
-\x21\x8f\x51\x0b\xfc\x0d\x58\xff\xc7\x8d\xf1\x76\xf8\xf6\x87\xfc\
-\x6f\x60\x4d\x79\x0e\x93\xaf\x49\x22\xcd\x14\x90\xeb\x31\xb5\xa3\
-\x14\xe9\xba\x11\xab\x7e\x64\xec\x15\x97\xf0\x97\xf3\xae\xf9\x99\
-\xd6\x87\x2c\xdb\xc3\x48\xf9\x9a\x51\x19\x7c\xce\xfa\xd5\xcb\xef\
-\x8c\x1b\xe3\xf8\xfc\x8f\x5a\xba\x74\x20\x6f\xfe\xc7\xad\xfd\x0a\
-\x8d\x07\xda\x31\xc1\x9c\x7c\x80\xd7\x5b\x20\x99\x0b\x4a\x79\x06\
-\xcc\xb9\xf6\xcc\xb6\x7b\xdb\x69\xea\x41\xff\x37\xac\x87\xf6\xf7\
-\x1e\xe4\xe8\xed\x0f\xe3\xff\x00\xf1\xfa\x3f\x5f\x3f\xe0\xe9\x03\
-\xea\x46\x89\xba\x11\xff\x7a\x92\xa0\xbf\xc4\x82\x3e\x60\xde\xf5\
-\x87\xb6\xeb\x03\xba\xf6\x1f\xeb\xe9\x35\xd0\xd1\xe7\x7f\x91\xb8\
-\xfd\xdb\x5a\x61\x3c\x6f\x22\xb0\xb6\x1f\x58\xd2\x07\x78\xfb\x81\
-\xa8\xaf\x4c\xaa\x0f\xc8\xed\x07\xb6\xd9\xeb\x12\xb7\xff\xe6\x0d\
-\xeb\x7e\x18\xeb\x35\x66\x60\x70\x40\xa0\x43\xdf\xff\x39\x62\xe1\
-\x82\x01\xb5\x95\xb9\xa8\xb2\x24\x93\x41\x31\x03\x52\x0f\x92\x85\
-\x0c\x0e\xd2\xf5\xb5\x1f\xc1\xda\x90\x0e\xbc\x1e\xa3\x34\x43\xce\
-\x90\x6b\x0a\xc1\xb5\xa5\x1c\x06\x25\x46\xb0\x72\x4f\x23\xa9\xfd\
-\xaf\xf9\x00\xe7\x96\x43\x7e\xb2\x6e\xf5\xf2\x1f\x30\xff\x03\xc6\
-\xf9\x3a\x74\xfb\x47\x46\x2c\xee\xdf\xde\xd6\xc6\x9f\xdf\x03\x34\
-\x6a\x3e\xc8\x59\x2b\xd6\xe5\x05\x12\x75\x22\x13\x6f\x91\x0e\x2c\
-\x5f\x91\xc9\xda\x6f\x1d\x7f\x2e\x5f\xcb\xa0\x91\xc0\x9c\x7d\x8b\
-\xe4\xee\x7b\x5b\x23\x8b\xff\x2d\x98\xff\xeb\xd7\x39\x49\xfb\x47\
-\xf4\x27\xfa\xdf\xdc\x64\x0c\xc9\xf1\x40\x22\x37\xd4\xae\x27\x98\
-\xbf\x76\xc4\x53\x2b\x92\x7b\xdd\x91\x45\x63\x80\x39\xed\x2f\x6f\
-\x2c\xc0\xfa\xbf\x69\xfd\xba\xef\x9d\xa3\xfd\x97\xf0\xb7\x3f\xa7\
-\x1f\xb4\xc8\xee\x03\x7c\xb5\x43\x91\xb5\xa4\x7a\xa1\x3e\xc0\xf2\
-\x9f\xab\x8c\xfb\x81\x9c\xf5\x42\xf3\xf7\x2c\x52\x6e\xff\x6b\x6d\
-\xfb\xff\xc7\xdb\xc3\xf1\xdb\x1f\xf2\xff\xfe\x0f\xdb\xdb\x51\x6b\
-\x4b\x8b\x38\x34\x80\x66\x63\xb4\x18\x41\xa0\x5e\xd4\xa4\x83\x50\
-\x1f\x6a\xe2\xf5\x14\x35\x13\x34\xf2\x5f\x97\x66\xe2\x21\x32\xbd\
-\xc6\x4c\x6d\xd1\x3e\x45\x52\x3e\x45\x79\xbe\xd5\x56\xf8\x8e\x9b\
-\x37\xac\xff\xde\xcb\xdd\x63\x80\xa3\xb7\xff\xa2\x05\xf3\xfa\xd5\
-\x56\xe4\xf1\xe4\x71\x4c\x2e\x67\x02\xd6\xba\xa0\x74\xad\x88\x93\
-\xef\xe1\x3a\x11\x9f\xcf\xc8\xc4\x47\xce\xaa\x0b\x19\x5d\x8f\xa6\
-\x03\xb7\x06\x24\xe0\x0d\x22\x7b\x13\x25\x9a\x09\x4b\xfd\x41\x86\
-\xeb\xc2\xca\xe0\x73\xbe\x58\x15\xf5\x1f\x4f\x37\xf7\xfe\x8e\xde\
-\xfe\xc0\xff\xbe\xbc\xf9\x9f\x1e\x3c\xe3\x81\xda\x00\xc9\xfc\xa0\
-\x51\x6d\xb4\x86\xc4\xf0\x59\xdc\x37\xc0\x3b\x06\x70\xc6\x02\xb5\
-\x89\x97\xd4\x38\x17\xb0\x6e\xdf\x3a\x33\xc7\x02\xce\x78\x40\xf4\
-\x7f\xdd\x3a\xa7\x68\xff\x88\xc5\x8b\xb5\xed\x2f\x50\xe7\x97\xe8\
-\x03\xf2\xeb\x05\xe6\xf5\x01\xd1\xeb\xd1\x74\xed\xaf\x12\xc9\x05\
-\xeb\x3a\xb8\xfd\x59\x7d\x40\x37\xfe\x7b\xb8\xba\x39\x7e\xfb\x47\
-\x70\xdb\x5f\xac\x1f\x70\xe7\x88\x4d\x46\x30\xa7\x66\xd4\xcc\xdb\
-\x0f\xf8\xea\xc3\x7c\xd7\x23\x72\xfa\x80\x4a\xe0\x1a\x43\x8b\xdb\
-\xdf\x8a\x3e\x00\xd0\xb5\xbf\xbb\xab\x6b\x7f\x7f\x9f\x71\x0e\xdd\
-\xfe\x0b\xc3\xe7\xf5\xa9\xab\xc8\x47\x95\xc5\xd9\x3c\xc8\x92\x06\
-\xab\x66\xc4\x46\x85\x68\x0d\xc9\x90\x63\x94\x17\x66\x18\x72\x06\
-\x56\x7d\xa8\x8c\xef\x9a\x33\x0e\x4c\xd6\x90\x78\xd6\x91\xac\xaa\
-\xf9\x10\x98\xbb\x0f\x76\x12\x2a\x87\xef\xb1\x76\xd5\x32\xe0\xbf\
-\x6b\x7f\xbf\xb1\x3e\xaf\xda\xbb\x8d\xc5\x62\xf1\xc2\x45\x7d\x98\
-\xf5\x5f\x6e\x3e\x2f\x96\xdb\x0b\xac\x0f\x37\x71\xa0\x66\x20\x5c\
-\x33\x32\xd4\x8a\xf8\x72\x7d\xa3\x5a\x10\x0f\xd4\x38\xcf\x87\x7c\
-\xc0\x18\x9c\x71\x41\x76\x1d\xc8\xda\xda\x90\x01\x2d\x8d\xf5\x68\
-\xe3\xba\x2f\x48\xfb\xfb\x8c\x19\xfb\x8a\xbd\xdb\x58\x2c\x98\xf6\
-\xe7\xd3\x7f\x73\xc7\x83\x26\x93\xf1\xc0\x34\x4f\x14\xa8\x15\xe8\
-\x3c\xc7\x1c\xef\xb1\xe9\xf5\xc7\xc6\x30\x69\x73\x82\x5a\x06\x46\
-\xf3\x32\x4b\xc7\x00\xcb\xda\x5f\xd3\xa0\xc2\xed\x7f\xdb\x6d\xf4\
-\xe8\x7e\xe3\xbc\x1d\xbb\xfd\x23\x16\x47\xf4\x79\x28\xab\xfd\x65\
-\xf6\x01\x6e\x3f\x30\xea\x03\x02\xf5\x22\x96\xf7\x98\xdd\x0f\x9a\
-\xa4\xfa\x00\x1f\xef\xb9\x7d\xc1\x6c\x8f\x90\xf5\x7d\xa0\x09\x7e\
-\xef\x06\xa6\xfd\xfb\x3a\x7e\xfb\x2f\xe9\xf3\xb0\xfd\x21\x6a\x6b\
-\x6d\x43\x6d\x2d\x6d\xa8\x55\x16\x5a\x05\xc0\xa9\x17\xe9\x6a\x46\
-\x4d\x3a\x40\x1f\x12\x02\x19\x2b\xf8\xe6\x15\x6c\xcf\x90\xce\x37\
-\xc4\x42\x7d\x23\xf4\x05\x1d\x1a\x4c\xa1\xbb\x3e\xd9\x2c\x8f\x90\
-\xe5\x75\x21\xdc\x5f\x34\xf5\x44\xff\x6f\x8f\x1e\x39\xaa\xaf\xcf\
-\x18\x6f\x87\x1e\xff\x17\xcc\x0b\xeb\x53\x57\x99\x67\x46\xee\x26\
-\xb6\xf6\xa7\x45\x31\x0b\x45\x19\x2c\x4f\x79\x86\x70\xbd\xc8\xa8\
-\x4e\xa4\xf5\x14\xe9\x01\xf9\x5d\xbe\xf0\x1e\x93\xa5\x92\x7b\x4b\
-\xe2\xbc\x4c\x6c\x7f\x21\xeb\x7d\x43\x45\x0f\x12\x50\x51\x76\x3c\
-\x2a\xcc\x8e\x43\x45\x59\x71\x68\xf5\x8a\xc8\xdb\x2e\x23\x46\x3a\
-\x7c\xfb\x2f\x5a\xb8\xb0\xf7\xc3\x76\xe0\xbe\x46\x83\x5a\x59\xb0\
-\x7c\x3c\x10\x58\x43\x90\x35\x06\xb0\x6b\x04\xba\x71\xa0\x9e\xa0\
-\x89\xd7\x47\x6c\x80\xe0\x18\x60\x54\x1f\xb0\xdd\x18\x50\x5f\x5d\
-\x49\x50\x57\x59\x4e\x6a\x00\xeb\xd7\xae\xb9\xe5\x0c\xed\xbf\x70\
-\xc1\xfc\x5e\x7c\xed\x6f\x79\x1f\x10\x59\x47\x92\x5a\x33\xe2\xab\
-\x13\x8a\xf5\x01\x15\xb7\x0f\x88\xb5\xbf\xb5\x7d\x40\xb8\xed\x1b\
-\xa0\xbd\x75\x6d\x5f\x53\x5e\x4a\x9e\x3b\x4f\xfb\x2f\xe8\x85\xd7\
-\x7f\x70\xfb\xf3\xf5\x01\xf9\xfd\x40\x23\xdd\x07\x9a\xe5\xaf\x1b\
-\x1a\xcd\x07\xb9\x7d\xa0\x81\xbf\x0f\x48\xb7\x3f\xab\x0f\x58\xd4\
-\x0f\x84\xdb\x5e\x55\x55\x41\xda\xbe\xb6\xa2\x8c\xf4\x83\x2f\xd6\
-\x7c\x0e\xed\x3f\xa2\xef\x38\x07\x6f\xff\xf0\xb0\x39\x3d\x55\x55\
-\x05\xa8\xba\x2c\x9b\xa0\xaa\x54\x18\x95\x25\xe6\x20\x4b\x10\x15\
-\xc5\x80\xa2\x2c\x56\x1e\xc1\x7d\x8d\xf3\x84\x4c\x16\x74\x75\xa2\
-\x34\xfd\xba\x52\x19\xbe\xb6\xac\x40\x77\x4d\x99\xf1\xb5\x65\xc2\
-\xfb\x0d\x19\x5f\x57\x56\x92\x97\xcc\x40\xf2\x1a\x32\xfe\xeb\xc9\
-\x70\x5e\x50\xf4\x20\x11\xc6\xfc\x04\x94\x97\x1e\x87\xf2\xd2\x62\
-\x51\x6e\x6a\x2c\x2a\x80\xc7\x55\xcb\x97\xde\x1c\x35\x7c\xc4\x67\
-\xc0\x7f\x87\xce\xff\x17\xce\x9f\xdf\x93\xf0\x1f\x72\x76\x1d\xf4\
-\xb9\xbb\x00\xc4\x6b\x45\x3a\x08\xcf\x13\x35\xd8\x57\x84\xeb\xc5\
-\x4d\xcd\x82\x7a\xd0\x6c\xa2\x01\x02\x5a\x60\xa2\x03\x52\xfc\x37\
-\xd4\x8a\x1b\xf5\x30\x47\x0f\x4c\x79\x8f\x39\x8f\xb9\x5f\x5d\x56\
-\x02\x3c\x29\x46\xd5\xf0\x7c\xed\xea\xcf\x6f\x40\xfb\x7f\x1a\xe4\
-\xe7\xff\xa2\xbd\xdb\x58\x2c\x0c\xed\xaf\xd1\x83\x6f\x0c\xb0\x3c\
-\x2f\xe0\xe8\x7f\x13\x07\x66\xb5\xbf\x50\x3e\x60\x7c\x7d\xb1\xad\
-\xdb\x9f\x3b\xde\xeb\xda\xbe\xb2\xa4\x08\xb4\xad\x90\xf4\x81\xcf\
-\x57\x2e\x3f\x33\x64\xd0\xa0\xf7\xbc\xbd\x3c\x9f\xb4\x77\x1b\x8b\
-\x05\xb4\xff\xa7\xec\xf6\x97\x6a\x7b\xcb\xfa\x81\x48\xfb\x13\xf0\
-\xb5\xbf\x54\x1f\x68\x30\xcd\x05\x58\xfe\x71\xf1\xf6\xe7\xeb\x03\
-\xf2\xfa\x41\x43\x4d\xb5\xd1\x78\x8f\x81\xdb\x1b\xb7\x7d\x79\x51\
-\x01\x2a\x2d\xc8\x27\xf8\x72\xfb\xb6\x5b\x6f\xbd\xf9\xe6\x3b\xfe\
-\x3e\xbe\x4f\xd8\xbb\x8d\xc5\x62\xe1\xfc\x05\x9f\x3e\x7a\xf8\x08\
-\xe1\x1a\x30\x41\xab\x34\xda\xd8\x30\xab\x5e\xa4\x1d\x3f\x4c\xa0\
-\x61\xd0\xac\xad\x05\xc1\xa3\xa6\x49\xa3\x1d\x27\xb8\x30\xf4\x9b\
-\x66\x35\x86\x9a\x41\x03\xab\x6f\xe8\x3c\x42\xba\x35\x04\x89\xfd\
-\x86\xd4\x26\xd0\xce\x27\x39\x75\x20\xec\x2b\x6d\xa8\xa9\x81\xf6\
-\xaf\x06\xee\x63\xdd\xc7\xfc\x2f\x03\xee\x97\x42\xfb\x17\xa3\xb2\
-\xc2\x42\x54\x9c\x97\x87\x4a\xf2\xf3\xd1\xb4\x29\x93\x37\x74\xed\
-\xda\xd5\xa1\xd7\xfe\x70\x84\xcd\x9e\xf5\xa9\xaa\x2a\x0f\x55\x41\
-\x5e\x26\x0f\x99\x7a\x18\xf9\xc5\x65\xd7\x8c\x18\x1f\x51\xb9\x18\
-\xf4\xf9\x9d\x36\xc7\x33\x82\xa1\x2e\x54\x9a\xaf\x03\x7b\x0d\x30\
-\x89\x81\xe8\xb5\x62\xac\x35\xbe\xdc\xfb\xa8\x18\xe7\x72\x26\xb8\
-\xcf\x40\x5b\xff\xc1\xf5\x9d\x82\xac\x78\x00\xe4\x79\x19\xf7\x20\
-\xcf\x8b\x41\x39\x29\xd1\x28\x3b\xf9\x0e\xca\xba\xff\x03\x4a\x8f\
-\xff\x0f\x4a\xbe\x77\x13\xc5\xfd\xf0\x2d\x8a\xfd\xe1\x6b\x14\x3c\
-\x3e\x70\xe9\x4f\x9f\x79\xe6\x65\x7b\xb7\xaf\x54\x2c\x08\xc7\xfa\
-\xff\x10\xe1\x3d\x40\x18\xb4\x88\x40\x63\x0a\xb3\xc7\x03\x96\x5f\
-\x80\x6f\x1c\xd0\x81\xcf\x03\x68\xa2\xff\x6c\xb0\xc6\x00\x2d\xd4\
-\xf5\x52\x63\x40\x9d\x7e\x0c\x68\xd0\x82\x19\x07\xea\xc8\x23\x9e\
-\x27\x62\x34\xd4\xea\x34\xbf\x1c\xd5\x6a\xc7\xfc\xea\x52\x66\xbc\
-\x2f\x03\xcd\x2f\x01\xbd\x2f\xc8\xc9\x46\x39\x99\xe9\x28\x25\x01\
-\xfa\x47\x76\x16\xf2\xf6\xf2\xf2\xef\xfe\xf1\x27\xcf\xd8\xbb\x7d\
-\xa5\x02\xeb\xbf\x71\xfb\x8b\xf5\x03\x9e\xf6\x6f\x31\x37\x27\x68\
-\x96\xd7\x07\xd4\x42\x7d\xc0\x78\x9d\xd0\xb8\xfd\x8d\xfb\x80\x5a\
-\x46\x1f\x68\x80\x31\x5d\x55\x55\x09\x39\x7b\x19\xc9\xdb\xf1\x63\
-\x4d\x05\x6e\xe7\x0a\x54\x87\x73\xfb\x4a\x6d\x9b\x43\x8e\x5f\x85\
-\xf3\x7b\xd0\xfa\x8a\x62\x18\xeb\x0b\xa1\xdd\xf3\xf3\x50\x61\x6e\
-\x0e\xca\xcd\xca\x44\x59\x69\xa9\x28\x39\x2e\x0e\xfd\x70\xf3\x06\
-\xda\xf5\xe5\x8e\x83\xfd\xfb\xf6\x7d\xc1\xde\x6d\x2b\x27\xc2\xe7\
-\xcd\xeb\xc1\xdf\xfe\x7c\x7d\x40\xbc\xed\xa5\xfb\x81\x69\xad\x50\
-\x90\xff\x4d\x62\xb9\x20\x67\x9d\xb8\x81\x3f\x17\x54\xcb\xe8\x03\
-\xb8\x9d\x71\x3b\x66\x67\xa4\xa1\xf4\xe4\x24\x94\x91\x92\x0c\xcf\
-\xd3\x49\x9b\xe2\xb6\xc5\xe3\x7a\x69\x41\x01\x2a\x78\x90\x4d\x80\
-\xdf\x7f\x90\x99\x81\xb2\xd2\xd3\x50\x46\x6a\x0a\x4a\xbd\x9f\x88\
-\xee\xc7\xc5\x92\x76\xbf\x72\xf1\x3c\xfa\xe6\xca\x95\xd8\x01\xfd\
-\xfa\xbf\x6d\xef\x76\x95\x1b\x73\xe7\xcc\xea\x51\x5f\x8d\xeb\x3f\
-\x0f\x40\xd3\xe4\x22\x5b\x8f\xaa\x12\x73\x6b\x46\x7c\xf5\xa0\x4c\
-\x61\x40\xce\x50\x4e\x90\xc1\xaa\x03\x65\x18\x5d\x53\x66\x92\x27\
-\x68\x7d\x43\xfa\xdc\x80\x0d\xa3\xfb\x92\x25\x91\x7a\x4d\xfc\x9d\
-\xeb\xe8\xdb\x2b\xa7\xd1\xf9\x53\x47\xd0\x85\x53\x87\xd1\xe5\x73\
-\x5f\xa1\xaf\x2f\x9d\x42\x29\x71\xff\x41\x19\x89\x3f\xa0\xc4\x98\
-\x1b\xe8\xfa\xd5\x33\x80\xb3\xe8\xdb\xcb\xa7\xd1\x37\x17\x4f\xa2\
-\xab\x17\x8e\xa3\x4b\xa7\x8f\x41\x9b\x5f\x40\x67\x4f\x9e\x40\x3f\
-\xdc\xba\x85\xae\x7f\xf3\x75\xa6\xcb\xc8\x91\x7f\x1c\x3e\x74\xe8\
-\x73\xf6\x6e\x57\xb9\x11\x16\x36\xb7\xfb\xc3\x87\x86\xf5\x5f\x71\
-\x98\x6a\x82\x54\xad\xc8\xb8\x66\x24\x3c\x2e\x70\x73\x7b\xbe\x1a\
-\x81\x3e\xd7\xd7\x8d\x0b\xac\x75\x60\xa3\x5c\x40\xbb\xf6\xab\xc6\
-\x1e\x11\xec\x13\x22\x8f\x5a\x70\xd6\x8a\xca\x8b\x8a\xd1\x0f\xb7\
-\x6f\xa1\x83\x7b\xf7\xa2\xfd\x7b\xf7\xa0\x83\xfb\xf6\x02\xf6\xa1\
-\xbd\xbb\x77\xa3\x3d\xbb\x76\xa2\xed\x5b\xb7\xc0\x5c\x6e\x3b\xda\
-\xb9\x63\x3b\xda\xbd\xf3\x4b\xf2\xde\xc1\xfd\xfb\xd0\xd9\x33\xa7\
-\xd0\x7f\x6e\xdd\x40\xf1\xf7\x62\x50\x71\x61\x1e\xba\x7d\xfd\xbb\
-\x9c\x91\xc3\x87\xff\xc9\x7d\xf4\xe8\xe7\x7f\xfb\x9b\xdf\xfc\xc4\
-\xde\xed\x2a\x37\xe6\xcc\x99\xa3\x6d\xff\x56\x06\xbc\xe3\x00\x7b\
-\x3c\x30\xce\xfd\x84\xd6\x0c\x84\xc7\x03\xa9\x9a\xa0\x9a\x77\x1c\
-\x68\xc6\x9e\x51\x1d\xb8\xd7\x83\xb0\xf5\x5f\x3b\x06\x98\xb4\x3b\
-\x7b\x1c\xd0\x3e\xc7\x39\x5e\x59\x51\x11\xba\xf5\xdd\x77\x68\xeb\
-\xe6\xcd\xa8\x11\xce\x6b\x87\xbf\xab\xb2\xac\x0c\x35\x42\x1f\x21\
-\x7f\x1b\x7c\xa7\x56\xf8\x0e\x6d\x24\x67\x51\x93\x9f\xa9\x28\x2d\
-\x45\xb9\x90\xe3\x25\x81\xee\x67\xa7\xa5\xa1\xcb\xe7\xcf\x67\x0f\
-\x1f\x32\xe4\x8f\x1e\xae\xae\xcf\xff\xe6\xd7\xbf\x76\x9a\xb6\xc7\
-\x31\x77\xee\x5c\xe3\xf6\x17\xed\x07\x9c\x3c\x40\x63\x5e\x1f\x30\
-\xf4\x03\x3e\x2f\xb1\x78\x1f\x30\x6a\x7f\x7d\x1f\x30\xf6\x0e\xb3\
-\xfb\x80\x9a\xb7\x0f\xa8\x4c\x72\x82\x52\x68\xff\xdb\x37\x6e\xa0\
-\x6d\x5b\x36\x93\xf3\x13\x62\xa2\xd1\xc9\xe3\xc7\x51\x5c\x4c\x0c\
-\xe4\x7a\x65\xfa\x3d\xee\xf1\xbc\xbf\x12\xda\xbd\xe0\xc1\x03\x92\
-\x27\x60\xde\xe3\x5c\xe0\x3f\x37\x6f\x64\x83\xde\xff\xaf\xa7\xbb\
-\xfb\xf3\xff\xfb\xe7\x3f\x3b\x55\xdb\xe3\x80\xfc\xaf\x3b\xa9\xff\
-\x40\x0e\x68\x82\x36\x2e\xda\x39\x10\xa9\x0b\x89\x81\xcf\x3b\xa4\
-\x61\xd0\x42\xc0\xaa\x09\xe9\x6b\x43\xd0\x37\xd8\xd0\xf5\x17\xdd\
-\xbe\x43\xba\x5c\x91\x35\x46\x34\x11\x34\xf2\x40\x3b\x7f\x84\xb6\
-\x2d\x2f\x29\x41\xdf\xc3\xd8\xbd\x63\xdb\x36\x74\xf9\xc2\x79\x74\
-\xf4\xf0\x41\xf4\xdd\xd7\xdf\xa0\xd8\xbb\x77\x61\x3e\x97\x49\xbc\
-\xe8\x38\x4f\xc4\x7d\xa1\x20\x27\x07\xa5\x43\x7e\x98\x00\xbc\xc7\
-\x73\xbc\x5b\xd7\xaf\x67\x0f\x1e\x38\xf0\x03\xf7\xd1\xae\xaf\x0c\
-\xe8\xd7\xcf\xa1\xeb\x7c\x42\x01\xf9\x5f\x77\x55\x75\xbe\x68\x0e\
-\x47\x72\x3c\x3d\x78\xea\x41\x3c\xfe\x6f\x29\xe8\xbd\x41\x1c\x94\
-\xeb\xc1\xae\x09\xa5\x01\x52\x51\x59\x61\x9a\x31\xf4\x7b\x0f\x19\
-\xf6\x19\x62\xe7\x79\x25\xec\x35\x3e\xad\x3f\x9c\xbd\xe6\x57\x94\
-\x93\x88\xd2\xe2\xff\x83\x2e\x9e\x39\x8a\x36\xae\x5b\x8d\x6a\xab\
-\xaa\x88\xae\xef\xdd\xb5\x0b\x9d\x02\x0d\xa8\xa9\xa8\x80\xf9\x61\
-\x2d\xd3\xf6\x30\x17\xc0\x73\x83\xd4\xa4\x44\x98\x17\xe4\xa2\xef\
-\x6f\xde\xcc\x1a\x34\x60\xc0\x07\x23\x86\x0e\x7b\xcd\x65\xc4\x88\
-\xa7\xed\xdd\x8e\x96\xc6\xbc\xb0\x30\x7e\xfd\x17\x1c\x0f\xf8\xeb\
-\x02\xe6\xac\x1b\x30\x68\x26\xe0\xf3\x8d\x9b\xe6\x82\x78\x0c\x68\
-\xe4\x1f\x03\x8c\xea\x01\xe2\x39\x40\x93\x36\x1f\xd4\x79\x48\x70\
-\xbd\xa7\xb8\x20\x1f\x78\x8c\xf5\x7f\x0b\xaa\x82\xb9\x3f\xfe\x9c\
-\x36\xf8\x4e\x78\xdc\xd7\xb7\x7d\x5e\x2e\xe1\x7d\x72\x62\x02\x2a\
-\x81\x79\xff\x0f\xb7\x6f\x67\x0d\xec\x3f\xe0\x4f\x6e\x2e\xa3\x7f\
-\x86\xdb\xfe\xad\xb7\xde\x72\x4a\xee\xe3\x08\x9b\x3d\xf7\x63\x59\
-\xed\x2f\xd2\x07\x98\x1c\x5f\xe9\x3e\xc0\xb7\x46\x24\xd1\xfe\x8d\
-\x7c\x39\x80\xa1\xed\xf5\xf7\xac\x81\x63\x8d\x30\xf6\xd7\x55\x57\
-\xa1\xa2\x7c\x68\xff\x1b\xd7\x21\xcf\xdf\x4a\xf2\xba\x56\xc8\xf3\
-\xda\xb5\xf7\xc3\xa8\x2e\xaf\x80\xb6\xcf\x83\xb6\x4f\x41\x89\x71\
-\x71\xa8\x10\xfa\x41\xf4\x0f\x77\x1e\x00\xef\xff\x38\x6a\xf8\xc8\
-\xe7\x41\xfb\x9d\xb6\xdd\x75\x11\x36\x27\x4c\x7e\xfb\xf3\xe6\x86\
-\xdc\xb9\x9e\x65\x7d\xa0\xb5\x59\x4a\x03\x9a\x4c\xe7\x01\x6a\xce\
-\x75\x03\x78\x4c\xc7\x7d\xa0\xd1\x58\x03\xb8\x6d\x8f\xfb\x43\x03\
-\x8c\xe9\x75\xa0\xf7\x98\xdb\x38\xff\xd3\xb5\xff\xf7\xb7\x6e\xa2\
-\xab\x97\x2e\x92\xf6\xce\xc9\xca\x46\x69\xc9\x29\xe8\x7e\x42\x02\
-\xcc\xf1\x0a\xd1\xdd\xef\xbf\xcf\x81\xb6\xff\xcb\x88\x61\xc3\x5f\
-\xf8\x3f\x27\xcc\xf5\xf8\xc2\xa2\xf6\xe7\x99\x1f\x28\xdd\x07\x84\
-\xda\xdf\x90\xe3\x49\xb4\x7f\xa3\x41\x03\xd8\xed\x8f\x79\x8f\xdb\
-\xbe\x1e\xb4\xbd\xba\xa2\x12\xc6\xf5\x5c\x9c\xc7\x91\x39\xfe\xb5\
-\xcb\x97\xd1\x81\xbd\x7b\x21\xa7\xbf\x85\x6e\xc2\x7b\xff\x81\xbc\
-\x30\x25\xf1\x3e\x68\x7e\x11\xba\x77\xf7\x6e\x2e\x68\xfe\xfb\x83\
-\x07\x0c\x78\xb9\x6f\x9f\x3e\x9d\xa2\xed\x71\xcc\x99\x3d\xdb\xb2\
-\xf6\x97\xd4\x01\x73\xfa\x41\xb3\x51\x1f\x68\x6d\xe6\x6b\x7b\x9e\
-\x1c\x9f\xa7\x0f\x34\xf1\xf4\x01\xfd\xf5\x62\x84\xf7\xb5\xa4\xed\
-\x6b\xab\xaa\x61\x6c\x2f\x47\x79\x30\x9f\xbb\x79\xfd\x3b\xd2\xfe\
-\x78\x2e\x70\xfd\xdb\x6f\xd1\xbe\x3d\xbb\xd1\x91\x83\x07\x41\xeb\
-\x7f\x20\xef\xc5\xc6\x44\xe7\xf6\xfb\xac\xef\xdf\x87\x0e\x1a\xfc\
-\x4a\xaf\x9e\x3d\x9f\xb2\x77\x9b\x29\x19\xb3\x67\xcd\xfa\xc8\xe2\
-\xf6\xe7\xc9\x09\x2c\xeb\x03\xa6\xed\x2f\xe6\x15\x6a\x36\x82\x8c\
-\xf6\x6f\xd0\xf1\xbe\x16\xa9\x60\x1e\x8f\x75\xbf\xa6\xb2\x12\x55\
-\x94\x95\x82\xc6\x67\xa2\xeb\xdf\x7c\x03\xfa\xbf\x0d\x78\x5e\x88\
-\x8a\x0a\x0a\xd0\x03\x98\xf7\x65\xa4\xa5\xa2\xf2\xd2\x32\x98\xe7\
-\xdf\x83\xb6\xff\xec\x4f\x43\x06\x0e\x7a\xf9\xd3\x1e\x3d\x9e\xfc\
-\xc3\xef\x7f\xef\xf4\x63\x3e\x3b\xac\x6e\x7f\xa3\xbe\x20\x56\x13\
-\x96\xd9\xfe\xba\x71\x80\xe5\x1b\x92\xd6\x80\x46\x56\xdb\x73\xda\
-\xbf\xd1\xc0\x7b\x55\x6d\x0d\x99\xe3\xd5\x80\xee\x57\xc3\xdc\xae\
-\xb4\xb8\x88\xac\xe3\x7c\x7d\xe5\x32\xda\x06\xe3\x7f\x59\x71\x09\
-\xbc\x4e\xd7\xb6\x7d\x29\x8a\x8f\x8d\x23\x6d\x0f\x78\xbe\xd7\xa7\
-\x3d\x3b\x55\xbb\xeb\x62\xe6\x8c\x19\xff\x56\xac\xfd\x5b\xa5\xd6\
-\x05\xe4\xb5\x3f\x9f\x77\xd0\xd0\xfe\x7c\x1a\xc0\xcc\x05\xf8\xda\
-\xbf\xb1\x9e\xe1\x7d\x5d\x4d\x35\xaa\x85\x7c\xbf\xba\xb2\x82\xb4\
-\x7d\x79\x69\x09\xe4\x74\x05\x28\x0d\xe6\x75\x97\x2e\x5c\x40\x87\
-\x0f\xec\x47\xe9\xa9\xa9\xe8\xd8\x91\xc3\x30\x06\x7c\x83\xee\x7c\
-\xff\x43\x7e\xff\xbe\x7d\xff\xb7\x5f\x9f\xcf\x9e\x7f\xff\xef\xef\
-\x75\xca\xb6\xc7\xa1\x6c\xfb\x1b\xfa\x80\xf8\x7a\x90\xdc\xf6\x17\
-\xea\x03\x42\xed\xdf\x68\xd4\xfe\xea\x06\xe0\xbd\x8a\xd1\x7c\x43\
-\xdb\x97\x13\xdd\x2f\x29\x2a\x44\x79\x39\x0f\x50\x62\x7c\x3c\x3a\
-\x73\xea\x14\x8c\xf9\x7b\xd0\xa1\xfd\xfb\xd1\xf9\x33\x67\xd1\xe1\
-\x83\x07\x6b\xe7\xcf\x9b\xe7\xd2\xff\xb3\xbe\xdd\xfe\xfb\xe7\x3f\
-\xef\xb4\x6d\x8f\x03\xda\xff\x5f\x8a\xb7\xbf\x59\x7d\x40\xac\xed\
-\x05\xfc\xc3\x3c\xed\xcf\xad\xef\xaa\x61\xcc\xc7\x6d\xcf\xe6\x7d\
-\x95\xb6\xed\xb1\xee\x17\xe1\x35\xff\xcc\x0c\x92\xe3\x1d\x3d\x7c\
-\x18\xc5\xdc\xbd\x03\xe3\x7e\x16\x5e\x07\x28\x9f\x39\x7d\xba\x87\
-\xaf\x8f\xcf\x6b\xef\xbc\xf3\x76\xa7\x6e\x7b\x1c\xd3\xa7\x4f\xff\
-\xa7\xae\xfd\x71\x3d\x5f\x91\xb6\xd7\xa2\x55\x46\x1f\x60\x6a\x87\
-\xf2\xdb\xbf\x45\xbb\x0e\xc7\xdf\x07\x1a\x48\xfb\xab\x1b\x1a\xc8\
-\x5a\x1e\x1e\xef\x71\x8d\x07\xb7\x3b\x06\xd6\x7c\xdc\xf6\x78\x2e\
-\x9f\x9f\x9b\x93\x9d\x91\x9a\xa2\xc2\x73\xbf\xfd\x7b\xf7\xc1\xcf\
-\x34\xc2\x1c\x2f\x3a\x0f\xc6\xfa\xdf\xff\xfb\x9f\xff\x7c\xe6\x57\
-\xbf\xfc\x65\xa7\x6f\x7b\x1c\xa4\xfd\xdb\x99\xf6\x2f\x2e\x2a\xda\
-\x0e\x7d\x00\xef\x07\x9b\xac\x6b\xd3\x26\xf8\xb7\x2d\xcc\xcb\x5b\
-\x04\xef\x8d\x82\xd7\x45\xba\xf7\xeb\x6a\x6b\x5b\x2a\x2b\x2a\x02\
-\xe0\x7d\x3f\x78\xdd\xa0\x7b\x1f\xf2\xa6\x9a\xa6\x46\xf5\xf0\xf6\
-\xb6\xd6\x30\xe8\x03\x0f\x75\xd7\x83\x17\x15\x16\xe6\xb6\xb6\xb4\
-\xf6\x82\x73\x36\xea\xda\x1f\xcf\x1b\x60\xfe\x1d\x03\xe7\x75\x87\
-\x7e\xf0\x95\xae\xcd\x71\xbf\x28\xc8\xcb\x3b\xd5\xa6\x69\xe9\x05\
-\xcf\x6f\x1b\xb8\xaf\x06\xdd\x2e\xfa\x02\xfa\xc9\x60\x78\x9d\xc9\
-\xac\x0b\xaa\x81\xe3\x35\x8f\xf3\xf3\xf2\x66\x6b\x9a\x9a\xdd\xa1\
-\xfd\xcb\x1b\x70\x6d\x0f\x34\xbf\x30\x3f\xaf\xa9\xb8\xa8\x70\x6c\
-\x6d\x75\x75\x08\xf0\xbe\x19\xaf\xf5\x15\x15\xe4\xa3\xb8\x7b\x31\
-\xad\xb9\x0f\x32\x5f\x84\x9f\xf9\xf5\x95\x4b\x97\x1e\xe3\xf5\x7e\
-\x98\xf7\xe7\xf5\xec\xf1\xe9\xff\x76\xff\xe8\xe3\x6e\xef\xbc\xdd\
-\xf9\x79\xaf\x8b\x19\xd3\x67\x90\xf6\x2f\x2a\x2c\x42\x9b\x36\x6c\
-\xf8\x03\x7e\x0f\xda\xb4\x97\xae\x3d\x53\x53\x52\x70\x6d\xec\x39\
-\xed\xfb\x93\xf1\x7b\xf8\x7a\x81\xdb\xb7\x6e\xe5\xe9\x3e\xa3\xad\
-\xad\x6d\x0b\x79\x1f\x74\xe4\xc2\xb9\x73\x97\x74\xef\x43\x1f\xb8\
-\x80\xdb\x1e\x9f\x7f\xf0\xc0\x81\x2f\xb4\x9f\xf1\x24\xb4\x7d\x16\
-\xe3\x09\x69\x46\x3b\xff\x7f\x7b\x57\x02\x1d\x55\x95\xa6\xb1\xe9\
-\x39\xf4\x71\x46\x70\x3c\x67\x5a\x85\x68\xf0\x9c\x19\x15\x9d\xe3\
-\xb4\x3d\x8d\x6c\x42\x88\x76\xdb\x33\x73\xfa\xf4\xf4\x39\xad\x88\
-\x20\x42\x42\x65\xab\xec\x04\x82\x80\xc8\x19\x11\xdb\x05\x5b\x6d\
-\x40\xc2\x2a\xab\x2c\x49\x2a\x21\xfb\x52\x95\x84\x2c\x95\xb0\x64\
-\x4f\x25\x95\xad\xf6\xbd\x52\x5b\x2a\x49\x25\x86\xf0\xe6\xbf\x6f\
-\x7f\xaf\xaa\x92\xa2\x82\x4e\xf7\x58\xf7\x9c\xef\xbc\xba\x2f\x79\
-\xf7\xff\xef\xff\xdf\xed\xfd\xf7\xbe\xff\x3f\x7e\x22\x0d\xbf\x3f\
-\x31\xf1\x08\xe4\x27\xd0\x3d\x1b\xac\xd1\x8f\x1c\x3a\xf4\x6b\x74\
-\xff\xee\xe4\xe4\x12\x4a\xff\x8a\xc1\x41\x74\x7f\x11\xba\x3f\x31\
-\xee\xf9\x03\xb5\x37\xdc\x7c\xeb\x96\x27\xeb\xeb\xaf\xf1\x3d\x18\
-\xe8\xfb\xef\x23\xdd\x3b\xe1\x1d\xbf\xbc\xb4\xac\x9d\xe2\x05\xda\
-\xea\x69\x64\xeb\x45\x36\xdc\xba\xeb\xd5\xc8\xde\xff\x88\xb8\xa2\
-\x62\xbe\xa4\xb2\x62\xbc\xb6\xa6\x5a\xf5\x6a\xe4\x2b\xff\xba\x7a\
-\xd5\xcb\x0f\x2e\x0e\x5f\xfc\xff\xc6\xb6\x13\x48\xca\xc8\xc8\xc0\
-\xc7\x7f\x87\xc3\x81\x7d\x73\xea\xd4\xe5\x73\x67\xce\x2c\xec\xee\
-\x92\x7d\x41\xe9\x1f\xfa\x2d\x76\xea\xc4\x89\x3f\xc3\xfd\x47\xf4\
-\x3a\x5d\x01\x35\x4f\xc8\x64\xb2\x29\x68\x17\xdb\x61\xad\xf4\x4f\
-\x2e\xa7\xb3\x8d\x6a\x17\x8d\x0d\x0d\xa3\xc7\xb3\xb2\xd6\x67\x5f\
-\xbe\xfc\x14\xf4\x5d\x1d\xd2\x3f\xfa\x7f\xe8\x67\xe6\x93\xc7\x8f\
-\xaf\x2e\x2f\x2b\x7b\xe9\xbb\x89\xef\xdc\xd4\x18\x90\x7d\xe5\xaa\
-\xfc\x9b\x53\x27\x9f\xbf\xd9\xd4\xf4\x06\xac\x19\xee\x22\xfd\xa3\
-\xf1\x1b\xe8\x49\x60\x4d\x16\x0e\xef\x63\xbb\x29\xfd\x5b\x4c\x46\
-\xec\xf4\xc9\x93\xa7\xcf\x9d\xf9\xe6\x51\xb8\x7f\x62\x9c\xd4\xff\
-\x60\x7f\x1f\xb2\xdf\x7c\x04\xe3\xf8\x23\x6a\xa5\x4a\x82\xda\x0f\
-\x9a\xf3\x9b\xa4\xd2\xc9\x63\x59\x59\x49\xdf\x9e\xbf\xf0\x98\x72\
-\x70\x50\x8e\x6c\x7d\xe8\x7d\x1f\xda\x0b\x76\xfe\xec\xd9\x81\x5b\
-\x37\x9a\x3e\x82\xb5\x7f\xf7\x6f\x5e\x7d\x75\xc9\xcb\x2b\x57\x3d\
-\xb8\x70\xe1\xc2\x1f\x95\xee\x51\xca\xcc\xcc\x5c\x35\x35\x35\x85\
-\x21\xa0\x36\x50\x5d\x55\xf5\xe1\x04\xae\xcb\x3b\x78\x7f\x46\xf7\
-\xad\x16\x0b\x26\xeb\xec\xdc\x05\xfd\x1c\xd7\x31\x75\xbf\xa3\xbd\
-\x1d\xd3\xeb\xf5\x7b\x51\x1e\x07\xfa\x1b\x40\x5a\x5f\x8f\x79\x3c\
-\x9e\xfd\x53\x53\xcc\x3d\x54\x66\xed\xf5\xeb\x06\xcf\xd8\xd8\xd1\
-\x29\xf4\xbf\xdf\x11\xf7\xc7\x46\xc7\xb0\xda\x9a\x9a\x2b\x93\x93\
-\x93\x2d\x28\x3f\x49\xd2\x70\xbb\x5c\xd0\x4f\xaf\x7f\x88\xf6\xfe\
-\x91\x7f\x62\x04\x74\x7f\x08\x74\x7b\xeb\xe6\xcd\xfd\xe3\xb0\x56\
-\xa0\xda\x28\xfa\x7e\x7d\xb0\xbf\x1f\xeb\xeb\x95\xef\x44\xf3\xd5\
-\x08\x5a\x03\xa0\x35\x20\x5c\x6f\x34\x4a\x31\x95\x52\xf1\x3f\x76\
-\x18\x13\xac\xe8\xbd\x4f\xaf\xc3\xed\x3c\x55\x12\x71\xf5\x81\x0f\
-\x3e\x58\xb3\x69\xe3\xc6\xf9\x7f\xf8\xfd\xef\xe7\x3d\xb5\xf8\xc7\
-\xd5\xef\xa9\x14\x1b\x1b\xfb\xe8\xe5\xcb\x97\xd7\xe7\xe6\xe4\x08\
-\x72\x73\x73\x63\x8e\x1c\x3e\xfc\xa2\x28\x57\x14\x97\x93\x9d\x23\
-\xc8\xbe\x7a\x55\x90\x93\x9d\x1d\x03\x7f\x8b\x39\x7a\xf8\xf0\x0b\
-\xa2\xdc\xdc\x78\xf8\x1d\x0b\x57\x1c\xe8\xef\xd0\xd7\x7f\x95\x27\
-\x12\xc5\x8b\x72\x72\xe3\xd0\xdf\x45\xb9\x39\xf1\xb0\x9e\x8e\x3e\
-\x73\xfa\xf4\x5a\x91\x08\xe5\x73\x13\xf2\x10\x44\xa2\x04\xe8\xcf\
-\x7f\xbc\x78\xe1\xc2\x7f\xc1\x3d\x61\x1e\x89\xfc\xbc\xbc\x44\xe8\
-\xbb\xaf\xe4\x5c\xbd\xfa\x36\xe4\x93\x28\x5c\xcb\xcb\x4b\x3e\x7a\
-\xe4\xc8\x8a\xbc\x5c\x51\x62\x5e\x6e\x4e\x12\x85\xfc\x3c\x51\xf2\
-\xd7\x87\x0f\x2f\xbd\x96\x27\x4a\x87\xff\x4b\xa1\x90\x2f\xca\x4d\
-\x86\x31\x1d\xbf\x9f\x2f\xca\x49\x21\x91\x9a\x73\xf5\x4a\x22\x8c\
-\x19\x6b\x0a\xf2\xf3\xd2\x0a\xf3\xf3\x53\x44\x39\x39\xc2\x93\xc7\
-\x8f\xbd\x73\xf0\x93\x4f\x5e\x38\x7a\xe8\xf0\x4f\xf6\x64\xee\xfc\
-\xc9\x6f\x5f\xfb\xcd\x8f\x66\xbe\x0f\xa5\x50\x0a\xa5\x50\x0a\xa5\
-\x50\x0a\xa5\x50\x0a\xa5\x50\x0a\xa5\x50\x0a\xa5\x50\x0a\xa5\xbf\
-\xfe\x84\x7d\xef\xc9\xc9\x10\x9b\x17\xca\x87\xf2\xa1\x7c\x28\x1f\
-\xca\xff\x20\xf9\x05\xf7\x98\x0f\xe7\xe5\x23\xee\x31\xbf\x8f\x97\
-\xc7\xb8\xf9\x07\x78\xf9\xb9\x33\xe4\x17\xf0\xf2\xe1\xbc\x7c\x04\
-\x2f\xbf\x6f\xfa\x3c\x41\x9e\xc9\xcf\xe5\xe5\xe7\xf1\xf2\x0b\x78\
-\xf9\x70\x5e\x3e\x82\xcc\x7f\xf0\x58\xd4\x4f\x1f\x8e\xfc\x07\x92\
-\x1c\xf3\x77\x8c\x9b\x7f\x80\x97\x27\xc9\xff\x1f\xa7\x67\x81\x93\
-\x5f\x00\xb6\x20\x0e\xe7\x2c\x9e\x13\x4a\x7f\x7b\x69\x47\xfa\xb6\
-\xbf\x8b\x17\xc4\x2e\x16\x6c\x89\xfa\x17\x41\x54\x34\xc2\xd3\x31\
-\xd1\x5b\x9f\x8e\xdd\x2a\x78\x3a\x4e\x10\xf3\x74\x7c\x4c\xcc\x33\
-\x09\x31\xb1\xcf\x08\x63\xe3\x9e\x11\xc6\xc5\x3f\x93\x18\x97\xf0\
-\x4c\x52\xbc\xf0\xd9\xa4\xf8\x84\x67\x93\x13\x84\xcf\xa6\x08\x13\
-\x9f\x4d\x4d\x4c\x5a\x92\x96\x94\x8c\x23\x3d\x29\x65\x49\x7a\x72\
-\xca\x92\x6d\xc9\xa9\x4b\xb6\xa5\xa4\x3e\x97\x91\x9a\x86\x63\x7b\
-\x6a\xfa\x73\xdb\xd3\xd2\x9f\xdb\x91\x96\xfe\xfc\x8e\xf4\x0c\x1c\
-\x99\xdb\x32\x9e\xdf\x99\xb1\xfd\x9f\xf7\xed\xde\xf3\xb3\x60\xf9\
-\xbf\x7c\xf1\xc2\x52\x49\x59\x91\xaa\xa2\x28\xcf\x04\x30\x03\x2c\
-\x14\x2a\xb9\xb0\x56\x16\xe5\x5b\xc5\x1c\xe4\x59\xc5\xc5\x79\xc4\
-\xb5\x28\x6f\x08\xee\x71\x20\x29\xa6\x70\x8d\xfa\x6d\x83\xfb\x36\
-\x31\x5c\xf1\xdf\x80\xf2\x6b\xb9\x5a\xa8\xc3\xbf\x07\xcb\x7f\xb5\
-\xa4\xfc\x15\xa7\x45\x8f\x39\xcc\x3a\xcc\x61\xa2\xa0\x67\xfd\x26\
-\x61\xd4\x02\x74\x24\xb4\xac\x2b\x82\x06\x73\x18\x02\x84\x5e\x83\
-\xd9\x59\xd0\xf6\xf5\x4c\x80\x5e\xd6\xcc\x82\xff\x48\xd7\x90\x09\
-\x73\x59\x8d\x04\x2c\x7c\x18\x18\x98\xfd\x41\x4f\xc0\x14\x20\xa0\
-\xee\x4e\x12\xba\x81\x3e\xe0\x3f\x2d\x78\xfe\x2b\xcb\x22\xed\x26\
-\x90\x85\x51\xcd\x85\x81\x0f\x15\x03\xbd\x3f\x28\x09\xe8\x02\x83\
-\x4d\xab\xc0\xd4\xf2\xae\x89\x8c\x59\xf0\x7f\xbd\xba\x2a\x12\xf7\
-\x03\x3b\x64\xf1\x0f\x2b\x1b\x66\x2e\x2c\xbe\x60\x62\x60\x9e\x1e\
-\x06\xc5\xe0\x44\x46\x6a\xea\xea\x60\xf9\xaf\x42\xf2\x37\x6b\x41\
-\xe6\x3e\x74\xf0\x03\xe8\x42\xd3\x2b\x9b\xc8\x48\x99\x05\xff\xe2\
-\xf2\xb5\xc3\x36\x14\x6f\xc1\x0c\xed\x1f\xc1\xe4\x1b\x16\x3e\x58\
-\x7d\xc4\xec\x0f\xac\x3e\x62\xf2\x0d\xfd\x60\xff\xf8\xb6\xe4\x94\
-\xa0\xf9\x97\x54\x96\xad\xa5\xc7\x1f\x0a\xf8\x98\xa3\xf5\x1e\x83\
-\xe8\xb1\x48\xc7\x1b\x7f\x58\x30\xf0\xe1\x3d\xfe\xb0\x01\xe3\xcf\
-\x78\xfa\x2c\xf9\xb7\x03\xcf\x76\xe0\x97\x80\x86\xc0\x0f\xd4\x9e\
-\x34\xbd\x5d\xe3\x30\xef\xbd\x1c\x2c\xff\xd5\x55\x92\xb5\x94\x2f\
-\x5f\xdf\xb0\xde\x43\xdf\xb6\x04\xd0\xb7\xcd\x9c\xbe\x0d\xfd\x77\
-\x56\xfc\x8b\x2b\x4a\xd7\xda\xa1\x4d\xd8\x8d\x5a\x6f\x50\x3a\xf9\
-\x1e\x75\xa1\x91\x77\x8d\xc3\x1a\x24\x78\xf9\x4b\x24\x11\xa3\x94\
-\x0f\xe6\x99\xe2\xef\xd9\x86\xfc\x63\x88\x82\xd5\x1b\x56\x3e\x2c\
-\x34\x8c\x4a\xc5\x78\x52\x42\xc2\xaa\x59\xc8\x3f\x82\xdb\xfe\x29\
-\x99\x6b\x31\x1b\x0e\x0d\x0f\x6a\xcc\x06\xb2\xf5\x09\x3d\x1f\x4a\
-\x06\x3a\xdf\x50\xf7\x76\x8e\x27\xc6\xc7\xaf\x9c\x0d\xff\x0e\x33\
-\xb1\xde\xb1\xf3\x80\xc6\x22\xa2\x6e\x14\xee\x7f\x7b\x82\xf1\x7f\
-\x3c\x31\x2e\x78\xfe\xa1\xfd\xac\x21\x62\x7a\x39\xb0\xd1\x7b\x89\
-\xff\x6b\xe3\xc6\x69\xe6\xc0\xab\x0d\x59\x18\x58\xb9\x30\x40\xfb\
-\x11\xc6\xc5\xcd\x46\xfe\x6b\x9c\x56\x03\xe6\x80\xf5\x19\xae\x07\
-\x9f\xd0\x71\xd6\xa7\xdc\x76\x36\x3b\x5d\x20\xf9\xc3\xfb\xc5\x8a\
-\x60\xf9\xaf\x02\xf9\x73\xe3\x33\x32\xbe\xf7\x71\xf8\x8a\xcb\x6d\
-\xe7\xc7\xe3\x9d\x46\x17\x33\xe8\x03\xc9\x1f\xde\x91\x82\xe6\x1f\
-\xe4\xbf\x1a\xad\x9b\x9d\x20\x7f\x0a\x8c\x2e\x74\x1c\x78\xf7\x03\
-\x42\xfe\x74\xbf\x9e\xae\x6f\x7b\xf5\x6f\xa2\x5f\xab\x61\xfe\x8a\
-\x17\xcc\x86\xff\xb2\xd5\x68\xfd\xef\x44\x75\xa0\x60\x61\xea\xe3\
-\x30\x7b\xb7\x2b\x3b\x02\xbf\x2e\x00\x9b\x89\x57\x17\x3e\x0c\x7c\
-\xa8\x30\x75\x9f\x6c\x1c\xde\x55\x97\x07\xcb\x3f\xb4\x9f\xd5\x1e\
-\xaf\xf8\xdf\xc3\x4c\xec\x6f\x27\x2f\x9e\x03\xbb\x2d\xf9\x8c\xe7\
-\xe8\x1d\x83\x7d\xba\xb6\x84\xda\x4f\x4c\x54\x74\xd0\xfc\x8b\xcb\
-\xcb\x5e\x1e\xb6\xc3\xfa\xd3\x06\x6b\x4f\xf4\x1e\x86\xeb\x82\x81\
-\x8b\xd6\x09\xd2\x87\x1e\x73\x9a\x09\xd0\xed\xcb\x57\x9f\xa6\xd6\
-\x51\x01\xf4\x6d\x75\x5f\xb7\x47\x30\x0b\xfe\x25\x62\xf1\xcb\x3e\
-\xe3\xb2\xf3\xfd\xe9\xd1\xba\x70\xd0\x63\xed\x28\x19\x53\xd7\x7f\
-\x5c\xd5\x99\x75\x61\x50\x29\x3c\x82\x2d\x51\xcb\x82\xe5\xbf\xb2\
-\xbc\x14\xe4\x6f\x05\xf9\x5b\x48\x98\x49\xf0\x75\xc1\xe8\xc1\x61\
-\xe1\x8e\xad\xec\xbe\x60\xe3\x40\xc3\xc0\x4f\x9f\x80\xf6\xef\xd9\
-\xba\x65\xcb\x6c\xf8\x5f\xe5\x76\xc0\x1a\xd3\x6e\x99\xa6\x0e\x46\
-\x0e\xff\x74\x1d\xe8\xb6\xa3\x63\x8d\x47\xbe\xd6\x1c\x2c\xf0\xfa\
-\x30\xe2\x7f\xcb\xdb\x9b\x5e\x0a\x9a\xff\x8a\xb2\x55\xfe\xbe\xcb\
-\xa6\xda\x14\x27\xae\xbb\x8b\x15\xd3\xdd\xc9\x9b\xb3\xed\x3e\xe6\
-\x69\x5f\xb1\xb6\x58\x6d\x08\xb5\x9f\x77\x36\x6c\x5c\x1a\x2c\xff\
-\x15\x65\x25\xab\xdc\x4e\x58\xe7\x23\x1d\x50\xb0\x93\xfa\xa0\xe0\
-\xd5\xb7\x09\x5d\x38\x58\xf3\x36\x67\x4c\xf5\xb5\x16\x37\x6a\x7c\
-\x80\x90\xff\xdb\x6f\x6d\x08\x9a\x7f\x71\x65\xe5\x4a\xaf\xd8\x2a\
-\x7c\x3d\xb8\x59\x71\xb5\x49\x1d\x50\x73\x35\x3b\x36\x0a\xee\xef\
-\x9e\x15\xdb\xc4\xe7\xbb\x10\x0f\x48\xfe\x1b\xd7\xbf\xf5\xab\x60\
-\xf9\x2f\x2f\x2d\x59\xe9\x76\x02\x3d\xc7\x10\x09\xab\x0f\x5d\xb0\
-\xf4\x41\xea\xc2\x39\x44\xea\x80\x9a\xaf\x2d\xa4\x0e\xcc\xdc\xbe\
-\x30\x93\x0e\xd4\xfd\xdd\x9e\x0d\x6f\xbe\x19\x3c\xff\x65\x25\x2b\
-\x47\xdd\x4e\xfc\xfb\x72\x06\x0e\x06\x2e\x3b\x1d\x87\x1a\xd5\x13\
-\x07\xd4\xd3\x4d\xd6\x8d\xee\xef\x43\x66\xa8\x13\x02\xd9\xc6\x2c\
-\xec\xba\xf1\xa1\xa7\xa1\x1e\x90\x8f\xad\x7f\x63\x5d\xd0\xf6\x4f\
-\x90\xff\x8a\xf1\x51\x37\xe3\x4f\xcd\x4f\x7c\xad\xb1\x61\xb6\xef\
-\x24\x2a\xb6\x16\x59\x27\x07\x15\x0b\x89\xdd\x46\x48\x9b\x8c\x17\
-\x4c\x34\x50\x5d\x54\xfd\xf2\xb1\x37\x5f\x7f\x23\x68\xfe\xcb\x4a\
-\x8a\x96\x8f\x0e\xc3\x1a\x80\x92\x2d\xde\x96\x28\x80\x9c\x9d\x08\
-\x56\x1c\x54\x3b\xa2\xe7\x6b\x76\x5b\xa2\xd7\x4b\xbc\xb9\xc1\xcc\
-\x9f\x97\x89\xb9\x79\x08\xc6\x4e\xb3\x66\x10\xeb\xeb\x6a\x45\xfc\
-\xff\x32\x58\xfe\x2b\xca\xcb\x97\x4f\x1f\x37\x81\xe7\x1f\x9f\x17\
-\x13\x8b\x1d\xef\x80\xf0\x65\xcd\x7e\xdf\x21\xfa\xf3\x30\x05\xb2\
-\x1f\xbb\x60\xde\x45\x71\xca\x50\xcc\x8a\xfe\x6e\xd9\xe8\xab\x91\
-\x91\x8b\x83\xe5\xbf\xb4\x18\xc9\x1f\x68\xba\x6c\x2c\x0c\xe1\xe0\
-\xeb\x82\xea\xd3\xec\x71\x95\x6e\xf3\xa8\x3d\xe0\xfd\x59\xcf\xf4\
-\x65\x13\xd9\x9f\xe9\xf7\x50\x2d\x36\x04\x63\xa6\x59\xab\xc0\xf4\
-\xca\x3e\x4c\xd9\x2b\xc3\xea\x6b\xc4\xa6\x47\x7f\xfe\xf3\xa0\x7d\
-\xac\x97\x96\x14\x2f\xf7\xfe\xbe\x7c\x04\x07\xe3\x6f\x98\xed\x5b\
-\x82\xe5\x57\x64\xd8\xc5\xf8\x11\x86\xfe\xe0\x76\x12\x71\xa3\xf0\
-\xba\x92\xfd\x01\xc5\x06\x1a\xe8\xed\xc1\xfa\x7b\x64\x98\x41\xa3\
-\xc2\x54\x03\x7d\xd8\x40\x4f\x37\x1e\x2b\xe0\xa6\xb4\x61\x6a\xef\
-\xee\xdd\x5b\x83\xe5\x1d\xa5\xe2\xa2\x82\x65\x63\x23\x2e\xa6\x9f\
-\xe2\x70\x40\x7f\x85\xb9\x95\x05\xc2\xcf\xb1\x1d\x07\xce\xa7\x93\
-\xe8\x1b\x04\xaf\x44\x9f\xa5\xc6\x22\x46\x27\x46\xcc\xa8\x51\x62\
-\x25\x85\xf9\x58\xfd\xf5\x2a\xac\xe5\x66\x23\x76\xbb\xa9\x01\x93\
-\xd6\x56\x63\x37\x1b\x1b\xa6\xfe\xf4\xe1\xfe\xcc\xd5\xab\x56\xcd\
-\x9d\x0d\xff\x25\xc5\x85\xcb\x46\xdd\x68\xac\xb4\x13\x70\xb1\xda\
-\x12\xab\x4f\x13\x18\xe2\xcc\x13\x2e\x07\x6a\x47\xc0\xab\x8d\xe1\
-\xd7\xc1\x9e\x97\xe1\xaa\x53\x0d\x60\xe5\x25\x45\x18\xac\xd3\x31\
-\x93\x4e\x87\xfb\xf8\x96\x77\x75\x4e\x1d\xf8\x60\xff\x9e\xff\xfe\
-\xdd\xef\x66\xed\xbf\xab\xb4\xa4\x74\x19\xfa\xee\x90\x1d\xef\xdc\
-\xbf\x1f\x4c\xb6\x7f\x6b\x2a\x6e\xd5\x08\xe3\xaf\x06\xf7\x4f\xc5\
-\xf5\x51\x6d\x04\x9e\x6b\xaa\x24\x98\x0d\xda\x11\xfa\x66\x5d\x2e\
-\x93\x4d\x7d\xb4\x7f\xff\xf6\xff\x7c\xed\xb7\xf7\xc5\xf7\x58\x49\
-\x71\xc9\x4b\xde\xfc\x4f\xb0\xfc\x35\xf8\xf0\xcf\x82\xd7\xc1\x07\
-\xff\x54\x9f\x20\xeb\x80\x7c\xab\x21\x9f\xaa\xe5\xa5\xa5\xa0\x83\
-\x12\xac\xa3\xb5\x75\xea\xc0\xfe\xfd\x7b\xd6\x46\x44\xdc\x37\xbf\
-\x69\xc5\x45\x45\xde\xfc\xd3\xbe\xc8\xa6\xd3\x03\xcb\x7f\x08\xed\
-\x1b\x9a\xf0\x15\x82\xf8\x77\xc1\x78\x89\xfc\x82\xa1\xef\x89\xc5\
-\x15\x15\x58\x6b\x73\xf3\xdd\x3f\x1d\x38\xb0\xf3\xd7\xaf\xbc\x7a\
-\x5f\x63\xf8\x15\x15\x15\x2d\xa5\xf8\x9f\xd9\x7f\x0e\xcf\x4f\xea\
-\x18\x13\x2f\x8f\xf2\x7b\x82\xbe\x97\x76\xc1\x18\x84\x7c\x9c\x18\
-\xf5\xba\xbb\xed\x2d\x2d\x53\x92\xca\xca\xa9\xf7\xdf\x7b\xef\xc3\
-\x95\x2b\x56\xdc\x77\x7f\x75\x85\x85\x85\x4b\x0d\x7a\xfd\x2d\xcf\
-\xd8\xd8\xe7\x43\x56\xab\xc3\xe5\x74\x26\x8d\x8d\x8e\x4e\xa9\x55\
-\x2a\x01\xd4\x61\x5c\xa9\x50\xec\x81\xba\x0d\x6a\xd4\xea\xd3\x30\
-\x9f\x55\xea\xb5\xba\x46\xe0\xfd\x88\xd9\x68\x34\x03\xaf\x69\xc8\
-\x37\x87\x46\xa5\xda\x0c\xf5\x98\x50\x0c\x0c\xec\x74\x39\x1c\xba\
-\xfe\x5e\xf9\x31\xa3\x5e\x5f\xd3\xd6\xd2\xdc\x56\x77\xbd\x26\x2b\
-\x3d\x35\x75\xe7\x8b\xff\xf6\x8b\x59\x8d\x33\xfe\x52\x76\x76\xf6\
-\x92\x81\xfe\xfe\xea\xf6\xb6\xb6\xaf\xb4\x5a\x6d\xfd\xad\x1b\x37\
-\x3e\x35\x19\x8d\x52\x69\x43\xc3\x41\xb3\xc9\xd4\x20\x6d\xa8\x3f\
-\x64\x30\xe8\xaf\xb7\x34\x37\xe7\xab\x95\xaa\xf3\xbd\x3d\xf2\xeb\
-\xb2\xae\xae\xbf\xa8\x95\x4a\x29\xfc\xef\x97\x26\x83\xbe\xa9\xa1\
-\xae\xee\xcf\x26\xa3\xa1\xa9\xb1\xa1\xe1\x4b\xb8\xdf\xd0\x24\x95\
-\x5e\x92\x75\x76\x5e\xbb\xd1\x28\x95\x7c\xfe\xd9\x67\x2b\x96\xbf\
-\xb4\xec\x7b\xe1\x3d\x94\x42\x29\x90\xc4\x3f\x37\x74\x17\xdd\xdc\
-\x17\xba\x72\xae\x18\xf7\xfa\x00\x79\x9d\x4b\x5e\xe7\x91\xd7\x05\
-\xe4\x35\x9c\xbc\x46\x90\xd7\x7d\x33\x9c\xd3\x5a\x0c\x58\x3b\xe7\
-\x6f\xef\x9c\x56\x62\x5c\xc2\x3f\x0a\xa2\xa2\x1e\x17\x44\x45\x3f\
-\x1e\x1b\xbd\xf5\xf1\x38\x41\xcc\xc2\xf8\x98\xd8\x85\xc2\xd8\xb8\
-\x85\x89\x71\xf1\x0b\x93\xe2\x13\x16\x26\x27\x08\x17\xa5\x08\x13\
-\x17\xa5\x26\x26\x2d\x4a\x4b\x4a\x5e\x94\x9e\x94\xb2\x68\x5b\x72\
-\x6a\xd8\xb6\x94\xd4\xb0\xed\xa9\xe9\x61\xdb\xd3\xd2\xc3\x76\xa4\
-\x6d\x0b\xdb\x91\x9e\x11\x96\xb9\x2d\x23\x6c\xf7\x8e\x9d\x01\xc7\
-\x41\x87\xb5\x66\x6d\xb3\xb4\xce\x09\x70\xe1\x68\xac\x73\xb5\x20\
-\x48\x69\x0c\x43\x1e\x50\x3b\xdc\x22\xa5\x50\x87\xa3\x55\x5a\xe7\
-\x6e\x6d\x24\x00\xf7\x69\x64\x5f\x3c\x2f\x7e\x7f\xd7\xee\x80\xe6\
-\x42\xed\x60\x6f\x37\xf7\x6c\x10\xb5\x37\xef\x63\xef\x7d\xa6\x73\
-\x40\x7a\x35\x66\x07\x88\x8b\x0b\x6f\xec\xdd\xb5\x3b\xa0\x38\x01\
-\x40\x5f\xe6\x7d\x36\x80\xc5\x87\xaf\x33\x00\xd3\xf1\xa1\xd7\x60\
-\x95\x45\x05\x37\xf6\xbe\xbb\x2b\x20\xfa\x1a\x45\x9f\x8c\xbf\x0f\
-\x32\x5b\x59\xa0\xfa\xbf\xb7\xf3\xdd\x7b\xa0\xaf\xf7\xde\x8f\xf1\
-\x3a\x17\x11\xb8\x2c\xa0\xfe\x4d\x7b\x32\x77\x06\x4e\x9f\x63\x33\
-\x9e\xbd\x2c\xee\x89\xfe\x20\xaa\x3f\xb5\x8f\x63\xc0\x66\x96\xc5\
-\xcc\x3c\x54\x14\x5e\x6b\xda\xb3\x23\x30\xfa\x06\xb5\xba\x6b\x84\
-\xbf\x0f\xef\x6f\x0f\xd5\xd7\x1e\x9d\x95\x0f\x33\x26\x29\x29\x69\
-\xdc\x9e\x96\x16\xa8\xfc\xbb\xbc\xf7\xe6\xd8\xb2\xf0\x77\x3e\xc6\
-\xdf\xb9\x18\x0d\x56\x5e\x98\xdf\x98\x91\x1a\x18\x7d\xad\x62\xa0\
-\x8b\x3a\x43\xe4\xbd\xc7\x66\xf4\xbb\x57\x38\x5d\xdb\x2c\x2f\x40\
-\xf4\x53\x03\xa3\xaf\x1c\xe8\x24\xce\x36\x31\x67\x99\x68\x1b\x34\
-\x9b\x07\x9c\x8f\xc0\xda\x66\x59\x41\xbe\x14\xc6\xe9\x80\xc6\x3f\
-\x9d\x72\xb0\x13\xd9\xf2\x18\x7b\x1e\x8f\x0f\x0b\xb3\xdf\xe8\x53\
-\x16\x3e\xfa\x29\x41\x3f\x29\x30\xfa\x2a\x45\x27\x65\x9f\xc0\xf9\
-\x18\xe2\xf2\x11\x10\x0f\x3c\x3e\x4a\xaf\xe5\x35\x04\x4c\x5f\xad\
-\xec\xc0\xed\xb5\x94\x1d\x9a\x63\xdb\x64\xc9\x82\x4d\xdf\xdf\x78\
-\xc1\xa2\x0f\x73\x66\xe0\xf4\x69\x9b\xf1\x10\x63\x0f\xf7\xcb\x83\
-\x71\x7a\x1e\x00\x25\xf9\xa2\xfa\x14\x61\x60\xf4\xf5\x1a\x44\x9f\
-\x8a\x87\xce\xe2\x81\x2d\x07\xf2\x7c\x1d\x4d\xdf\xdf\x78\x45\xd6\
-\xbf\x38\x3f\xb7\x5e\x18\x1b\x1b\x10\x7d\x93\xc1\xd0\x4e\xdb\x4c\
-\x38\x7b\x1a\x6e\x26\xb6\x37\xb9\x37\x49\xed\x0d\x7b\x9d\x1b\xa2\
-\xf7\x8d\x88\xf1\xaa\xb4\xe0\x5a\x9d\x60\x4b\x54\x60\xf2\xd7\xa8\
-\xda\x29\xbb\xd9\x08\x65\xeb\x26\x65\xc1\xd7\x83\x93\xdd\x0e\xfc\
-\x9d\xe1\x00\x14\x8a\x72\xea\xb6\x6e\xde\x12\xa0\xfc\xd5\x6d\xdc\
-\x58\x65\xbc\xfd\x04\x92\x0f\x17\xc9\x07\x33\x36\xf8\xdf\x33\x28\
-\xcc\xcb\xa9\xdd\xb2\xe9\x9d\xc0\xe8\x6b\xd5\x6d\x5c\x9b\x14\xc3\
-\x03\x6d\xfb\xc7\x79\xb0\xe0\x71\x91\x5d\xf4\x1e\x86\xaf\xfd\x0b\
-\x42\x0e\xf9\xd9\x57\x6a\x37\xbf\xbd\x29\x20\xfa\x06\x44\xdf\xed\
-\x24\xec\x62\x14\x1f\xc3\x84\xbd\xd0\xcd\x96\x01\xcd\x03\x6b\x0f\
-\x85\xcf\x83\x19\xc5\x69\x56\x61\x39\x97\x2e\x56\x47\x6d\x7a\x27\
-\xa0\x77\x72\xa0\xdf\x3a\x06\xf4\x29\x30\xb2\x70\x90\xb6\x54\x1b\
-\xcb\xe6\x4b\xe9\x81\xd9\x77\x26\x6c\xda\x46\x92\xb6\x1a\xd3\x29\
-\xfa\xb0\x43\x5f\x7c\x7e\x39\x10\xda\xa4\xfc\x5b\x99\x7d\x18\x82\
-\x3e\x9b\x07\x37\x9b\x07\x14\x9b\x1a\xb7\xe3\x32\x32\x90\xb5\x35\
-\x63\x37\xa5\xf5\x58\xf3\x0d\x29\x76\xab\xb1\x1e\xc5\xa8\xb3\x25\
-\x0b\x85\x2f\x04\x4c\x5f\x07\xf4\x69\xbf\xfa\x20\x83\x61\x16\x0f\
-\xa4\x5d\x99\xe2\x81\x2d\x03\xca\x26\xdb\x58\x5f\x8b\xc7\x4a\x42\
-\x7e\xf6\xdb\x6e\xdf\xb6\xa7\x26\x25\xdd\xd3\x59\x05\x93\xd1\xd8\
-\xc2\xb5\xe7\x79\xdb\x53\xd9\x76\xc8\x31\x96\x5d\x1e\xc5\xf6\x68\
-\xac\xaf\xc7\x7d\xf8\xb7\x35\x37\x03\xed\xe4\x7b\xde\xa7\x37\x1a\
-\x48\xfa\x24\x0f\x13\x3e\x79\x18\xa5\xf7\x09\x28\x3b\x28\x8a\x31\
-\x80\x7c\x8b\x37\xd4\xd5\xa1\x98\x32\xf6\x24\xa1\x30\xa8\x33\x1a\
-\x06\xbd\xbe\x11\x68\xbb\xc6\x3d\x1e\x0b\x60\x14\x7e\x8f\x8c\x7b\
-\xc6\x2c\x9e\xd1\x31\x17\xd0\x1f\x07\xba\x16\xa0\x6b\xf7\x8c\x8d\
-\x4e\x42\xfd\x2d\x23\xc3\xc3\x43\xc3\x4e\xc7\xd4\x90\xc5\x6c\xd5\
-\x28\x15\xca\xa2\x82\x02\xbb\x20\x3a\x3a\xe8\xf3\xed\xcd\xb7\x6f\
-\x9f\x50\xab\xd4\xa7\x3a\x3b\x3a\x3e\x1d\x1c\x18\xa8\x02\x7d\x7c\
-\xdb\xde\xd6\xf6\x59\xaf\x5c\x5e\x60\x31\x99\x0b\x3a\xda\xda\x0e\
-\xf6\xc8\x64\xe7\xcc\x46\x63\x43\x57\x47\xfb\x41\x40\x96\x4a\xa1\
-\xb8\xdd\xde\xda\xfa\x65\x8d\x44\x72\x54\xb0\x75\x6b\xd0\x7b\x7b\
-\x3f\xb6\x84\x6c\x05\xe3\x73\xe6\x84\x03\x16\x7c\x0f\x08\x27\x11\
-\x01\xd8\x07\x00\x5a\x0f\x00\xe6\x72\xec\x14\x8f\xcd\x21\xbe\x29\
-\xfb\x6b\xb1\x53\x64\x1d\x39\xbc\xe0\xf4\xb1\xa3\xfb\x4f\x1d\x3d\
-\xf2\xf1\xa9\xac\x23\x1f\x9f\x3e\xf6\xf5\xc7\xdf\x1c\x3b\xfa\xc9\
-\x99\xe3\x08\x59\x9f\x9c\x3d\x91\xf5\x29\xc2\xb9\x13\xc7\x3e\x3d\
-\x77\xf2\xf8\x67\xe7\x01\x17\x4e\x9d\x00\xe0\xd7\x83\x90\xff\x78\
-\xd7\x8e\xcc\x05\xfe\xca\xaf\xad\x91\x3c\x85\xbf\x5b\x98\x29\x90\
-\x67\xb4\x4c\x6c\x30\xdf\xbb\x30\x20\xde\x27\xcc\x2a\xc5\x1d\x78\
-\x97\xf0\x1b\xe3\xbb\xb6\x9a\x2c\x3f\x28\x1a\x3a\xcc\xa2\x56\xdc\
-\xd9\x96\x92\xea\xb7\xfc\x1a\x49\xc5\x62\xaf\xf5\x06\xff\xfb\x25\
-\xfe\xf7\x02\xac\xef\x03\x2c\xaa\xc1\x3b\xe9\xc9\x29\x7e\xcb\xaf\
-\x16\x97\x2f\x76\xf8\x3d\xdf\xcf\x3a\xa3\xc6\x3f\x6b\x4a\x9e\x2f\
-\x35\x29\xfb\xef\xc0\xbb\xc6\x93\x7e\xcb\xaf\x12\x2f\x66\x9f\x97\
-\x63\x9f\x5d\xf4\x92\x99\x0f\x79\x21\xf9\xa4\x08\x13\xa7\x2d\x9f\
-\x5a\xa3\xfa\xa5\x33\x8d\x5e\x2c\x1a\xc5\x9d\xc4\xb8\xf8\x27\xfc\
-\x96\x2f\x11\x87\x33\xef\x24\x66\xfa\x3b\x94\x40\xeb\x62\xd1\x28\
-\xef\xc0\x5a\xd8\x7f\xf9\x55\xe2\x70\xe2\x6c\x05\xf3\x1d\x02\xbe\
-\xce\xb2\xb2\xe9\xf8\xa2\x41\xd0\x81\xf2\x27\xe3\x04\x02\xbf\xe5\
-\x57\x89\xcb\xc3\x89\x77\x5a\xee\xf9\x07\xe6\x3c\x13\xa1\x73\xdf\
-\xe7\x40\x55\x98\x51\xd5\x37\x19\x1b\xbd\x35\x6c\x1a\xf9\x3c\x39\
-\x42\xbd\x3f\xd8\xa9\x73\x22\xac\xba\x58\xcd\xbc\x77\x5a\x6e\x5d\
-\x2c\x5a\xd5\x24\xac\xd5\xfd\x96\x5f\x25\xa9\x7c\x92\xd8\x7f\x67\
-\xad\xcf\x39\x34\x58\x72\xf2\x41\x03\x95\x1f\xbd\x79\xf3\x22\xff\
-\xf2\xa9\x7c\x92\x58\x6f\x91\xe7\xa4\xe8\xba\x30\x34\x38\xba\xe0\
-\x9d\xbf\x45\xe5\xbf\xb3\x61\xa3\xdf\xf2\x25\xe2\xca\x27\x88\x7d\
-\x53\x2a\x26\xa5\x37\x0d\x7a\x5d\xed\x75\x96\xd1\x88\x59\x74\xaa\
-\xc9\x8d\xeb\xd7\x2f\xf4\x57\x7e\x65\x79\xe9\x13\xcc\x9e\xbf\x8d\
-\xf3\xce\x30\xcc\x5a\xab\x72\xce\xb1\x99\x99\x73\x17\x26\xcd\xe0\
-\xe4\xfa\x37\xd6\xf9\x2d\xbf\xa2\xbc\x34\xcc\xff\xba\x98\xb5\x26\
-\xa6\xfb\x1d\x77\x3d\xae\x53\xf6\x4f\xbe\xf9\xfa\xeb\x8f\xfb\xe7\
-\xbf\x2c\xcc\x83\xd6\x9f\x23\x64\x4c\x47\x72\x9f\x7c\x84\xd4\x09\
-\x7e\x66\x0d\xd1\xb1\x59\xb8\x72\x02\xd9\x58\x0d\x1a\xac\x4f\xd6\
-\xe1\xf9\xe5\x8b\x2f\xfa\x3d\x1f\x52\x5e\x56\x1a\x46\xc5\x93\xf4\
-\x8c\xb0\xe2\xc6\xd1\xeb\x5b\x3b\x6b\x6d\x6d\xc1\xcf\xcd\xdc\xbe\
-\xd1\x88\xc9\xbb\xda\x61\x3d\x7b\xf3\xee\x17\x07\x0f\x66\xfa\x2b\
-\x1b\x2f\xbf\xb4\x74\x91\x67\x8c\x88\x59\x4a\x9f\x85\xa4\xe3\x53\
-\x92\x75\x20\xd7\xce\x2e\x90\xd5\x10\x8c\x09\x4d\xd2\x06\x3c\x16\
-\xe5\xe1\xaf\xbe\x7a\xef\x3f\x5e\x7b\x6d\x5a\x7f\xb4\xa5\x50\x3e\
-\x67\xff\x1b\xf7\xa5\xce\x9c\x1b\xc2\xd7\xc6\xf8\xde\xb6\x0b\x8f\
-\x83\x80\x7c\x1e\xa3\xb8\x66\x47\xfe\x72\x68\x6f\xc4\x9a\x35\x33\
-\xfa\xba\x2d\x29\x2e\x5e\x34\xe2\x76\x77\x8f\x8e\x8c\x74\xc3\x55\
-\x3e\x3a\xe2\x1e\x18\x19\x76\x2b\x60\x9d\xa9\x02\x28\xc7\x46\xdc\
-\xfd\xc3\x4e\x67\xb7\xc3\x66\xeb\x36\x1b\x0d\xdd\x5d\xed\xed\xbd\
-\x07\x3e\xd8\xbf\x6f\xd5\x8a\x15\x01\xf9\xd1\x15\x89\x44\x0f\xf6\
-\xf4\xf4\xbc\x2e\x07\x90\xd7\x75\x7d\xbd\xbd\x6f\x0f\xf4\xf7\xbf\
-\xd5\x27\x97\xaf\xeb\x93\xf7\xac\xeb\x91\x75\xad\x93\x75\x76\xbe\
-\xd1\xd6\xd2\xb2\x2e\x37\x3b\x7b\xcd\xca\xe5\x81\x95\xfd\x7d\x25\
-\x58\x2a\x45\xaa\xe6\xcc\xbb\x0f\x58\x40\x22\x1c\x10\x01\xd8\x17\
-\x89\xca\x46\xeb\xb0\x87\xe7\x10\x7b\x46\x81\xac\xc3\x12\xe3\x12\
-\x7e\x2a\x88\x8a\x7e\x28\x76\xab\xe0\xa1\x84\x98\xd8\x87\x12\xe3\
-\x13\x1e\x4a\x4e\x10\x3e\x04\xf3\xee\x7c\x98\xdb\xe7\xc3\xfa\x64\
-\xfe\xf6\xb4\xf4\xf9\x3b\xd2\x33\xe6\xef\xc9\x7c\xd7\xeb\xbd\xbb\
-\xab\xf5\x76\xac\xa2\xa7\x6b\x5c\xd1\xd3\x89\x43\x49\xa1\xbb\x63\
-\x42\xd9\xdd\x49\xa2\x63\x42\x21\xeb\x98\xb8\x72\xee\xac\x80\xff\
-\xbc\x66\xb0\x37\x91\x6b\x63\xf3\x6f\xfb\xce\xbb\x7c\x29\xce\xeb\
-\x79\x45\x9f\xd0\xd7\x77\x2e\x5c\xfb\x2d\xf1\xbc\xe8\xd2\xb7\x5e\
-\xcf\xeb\x94\x0a\xa1\x8b\x33\x2f\xf2\xbe\xf3\x64\x7d\xcf\x29\xba\
-\xe4\x4d\x5f\xab\xe8\x17\x32\x36\x44\xca\x7e\xe5\xbb\x3e\xd9\x17\
-\xcf\xc7\x7a\x3d\xaf\x1c\x14\x0e\xb3\x6c\xb4\x5c\x1b\x10\xb7\x9c\
-\xab\x17\xce\x79\x3d\xaf\x53\x2b\x12\x38\xb6\x24\x5f\x65\x90\xe5\
-\x5c\x3e\x7f\x36\xc6\xfb\x79\x65\x02\x6d\x87\xc1\xe7\x0b\xa6\x0c\
-\xbe\x3d\xf4\xd2\xb9\x33\x5e\xcf\x1b\x74\xda\x84\x31\xea\xfc\x91\
-\x8b\x38\x43\x48\x9c\x01\x66\xe6\x1e\xca\xce\x78\xf1\xcc\x37\x5e\
-\xfa\xd7\x6b\xd4\xf1\x23\xbc\xb9\x0b\x1f\xf7\xf1\xb1\xd8\xc8\x19\
-\xef\xcf\x9e\x3a\xe1\x75\xde\xcd\xa0\x55\xc7\xd3\x36\x1e\x17\x71\
-\x8e\x6e\x98\x1c\xd3\xd9\x76\x1c\x98\xeb\xb0\xac\xc3\x87\x36\x78\
-\xd1\xd7\xaa\xe3\xd8\xf6\x11\x7a\x4c\xb5\x13\xb6\x10\x65\xbf\x1c\
-\xeb\xee\x6c\xc7\xca\x8a\x0b\x1b\xe2\x62\x62\xfe\x9e\xff\x3c\xbc\
-\xd3\xc6\xb1\xdf\xed\x99\x71\x73\x18\x9f\xd3\xfa\xe5\x72\x74\x06\
-\xa8\x21\x7a\xf3\x96\xf9\xfc\x67\x51\xea\xeb\xed\x5b\x3f\x64\xb5\
-\xd6\x38\xec\xf6\x4e\xb3\xc9\x24\xb5\x59\xad\x4d\x80\x2e\xa3\x5e\
-\x57\xad\xd7\x6a\xdb\x0b\xaf\x5d\xfb\x76\xd3\xc6\x8d\x0f\xfb\x7a\
-\x76\x36\xa9\x66\x6e\x4e\xe4\x3d\x63\x1e\x60\x41\x0e\x8c\x33\x39\
-\x91\xff\x0b\x76\xbf\xca\x90\
-"
-
-qt_resource_name = "\
-\x00\x05\
-\x00\x6f\xa6\x53\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x04\
-\x00\x07\x35\xdf\
-\x00\x6c\
-\x00\x6f\x00\x67\x00\x6f\
-\x00\x0c\
-\x09\x80\x19\x87\
-\x00\x72\
-\x00\x65\x00\x63\x00\x74\x00\x33\x00\x33\x00\x36\x00\x34\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x02\xc1\xe4\x1f\
-\x00\x6e\
-\x00\x65\x00\x77\x00\x5f\x00\x66\x00\x69\x00\x6c\x00\x65\x00\x2e\x00\x69\x00\x63\x00\x6f\
-"
-
-qt_resource_struct = "\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x04\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
-\x00\x00\x00\x3c\x00\x01\x00\x00\x00\x01\x00\x00\x1f\x01\
-\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -1,2254 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt4 (Qt v4.8.7)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt4 import QtCore
-
-qt_resource_data = "\
-\x00\x00\x79\x85\
-\xff\
-\xd8\xff\xe1\x06\xac\x45\x78\x69\x66\x00\x00\x4d\x4d\x00\x2a\x00\
-\x00\x00\x08\x00\x07\x01\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\
-\x00\x01\x1a\x00\x05\x00\x00\x00\x01\x00\x00\x00\x62\x01\x1b\x00\
-\x05\x00\x00\x00\x01\x00\x00\x00\x6a\x01\x28\x00\x03\x00\x00\x00\
-\x01\x00\x02\x00\x00\x01\x31\x00\x02\x00\x00\x00\x22\x00\x00\x00\
-\x72\x01\x32\x00\x02\x00\x00\x00\x14\x00\x00\x00\x94\x87\x69\x00\
-\x04\x00\x00\x00\x01\x00\x00\x00\xa8\x00\x00\x00\xd4\x00\x2d\xc6\
-\xc0\x00\x00\x27\x10\x00\x2d\xc6\xc0\x00\x00\x27\x10\x41\x64\x6f\
-\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x43\x20\
-\x32\x30\x31\x37\x20\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x00\x32\
-\x30\x31\x37\x3a\x30\x33\x3a\x32\x39\x20\x31\x32\x3a\x32\x35\x3a\
-\x35\x38\x00\x00\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\
-\x00\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x00\xc8\xa0\x03\x00\
-\x04\x00\x00\x00\x01\x00\x00\x01\x2c\x00\x00\x00\x00\x00\x00\x00\
-\x06\x01\x03\x00\x03\x00\x00\x00\x01\x00\x06\x00\x00\x01\x1a\x00\
-\x05\x00\x00\x00\x01\x00\x00\x01\x22\x01\x1b\x00\x05\x00\x00\x00\
-\x01\x00\x00\x01\x2a\x01\x28\x00\x03\x00\x00\x00\x01\x00\x02\x00\
-\x00\x02\x01\x00\x04\x00\x00\x00\x01\x00\x00\x01\x32\x02\x02\x00\
-\x04\x00\x00\x00\x01\x00\x00\x05\x72\x00\x00\x00\x00\x00\x00\x00\
-\x48\x00\x00\x00\x01\x00\x00\x00\x48\x00\x00\x00\x01\xff\xd8\xff\
-\xed\x00\x0c\x41\x64\x6f\x62\x65\x5f\x43\x4d\x00\x01\xff\xee\x00\
-\x0e\x41\x64\x6f\x62\x65\x00\x64\x80\x00\x00\x00\x01\xff\xdb\x00\
-\x84\x00\x0c\x08\x08\x08\x09\x08\x0c\x09\x09\x0c\x11\x0b\x0a\x0b\
-\x11\x15\x0f\x0c\x0c\x0f\x15\x18\x13\x13\x15\x13\x13\x18\x11\x0c\
-\x0c\x0c\x0c\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x01\x0d\x0b\x0b\x0d\x0e\x0d\x10\x0e\x0e\x10\x14\x0e\x0e\
-\x0e\x14\x14\x0e\x0e\x0e\x0e\x14\x11\x0c\x0c\x0c\x0c\x0c\x11\x11\
-\x0c\x0c\x0c\x0c\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\xff\xc0\x00\x11\x08\x00\x48\x00\x30\x03\x01\x22\x00\
-\x02\x11\x01\x03\x11\x01\xff\xdd\x00\x04\x00\x03\xff\xc4\x01\x3f\
-\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\
-\x00\x03\x00\x01\x02\x04\x05\x06\x07\x08\x09\x0a\x0b\x01\x00\x01\
-\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\
-\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x10\x00\x01\x04\x01\x03\
-\x02\x04\x02\x05\x07\x06\x08\x05\x03\x0c\x33\x01\x00\x02\x11\x03\
-\x04\x21\x12\x31\x05\x41\x51\x61\x13\x22\x71\x81\x32\x06\x14\x91\
-\xa1\xb1\x42\x23\x24\x15\x52\xc1\x62\x33\x34\x72\x82\xd1\x43\x07\
-\x25\x92\x53\xf0\xe1\xf1\x63\x73\x35\x16\xa2\xb2\x83\x26\x44\x93\
-\x54\x64\x45\xc2\xa3\x74\x36\x17\xd2\x55\xe2\x65\xf2\xb3\x84\xc3\
-\xd3\x75\xe3\xf3\x46\x27\x94\xa4\x85\xb4\x95\xc4\xd4\xe4\xf4\xa5\
-\xb5\xc5\xd5\xe5\xf5\x56\x66\x76\x86\x96\xa6\xb6\xc6\xd6\xe6\xf6\
-\x37\x47\x57\x67\x77\x87\x97\xa7\xb7\xc7\xd7\xe7\xf7\x11\x00\x02\
-\x02\x01\x02\x04\x04\x03\x04\x05\x06\x07\x07\x06\x05\x35\x01\x00\
-\x02\x11\x03\x21\x31\x12\x04\x41\x51\x61\x71\x22\x13\x05\x32\x81\
-\x91\x14\xa1\xb1\x42\x23\xc1\x52\xd1\xf0\x33\x24\x62\xe1\x72\x82\
-\x92\x43\x53\x15\x63\x73\x34\xf1\x25\x06\x16\xa2\xb2\x83\x07\x26\
-\x35\xc2\xd2\x44\x93\x54\xa3\x17\x64\x45\x55\x36\x74\x65\xe2\xf2\
-\xb3\x84\xc3\xd3\x75\xe3\xf3\x46\x94\xa4\x85\xb4\x95\xc4\xd4\xe4\
-\xf4\xa5\xb5\xc5\xd5\xe5\xf5\x56\x66\x76\x86\x96\xa6\xb6\xc6\xd6\
-\xe6\xf6\x27\x37\x47\x57\x67\x77\x87\x97\xa7\xb7\xc7\xff\xda\x00\
-\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xf3\x1c\x0a\x19\x93\
-\x9d\x8d\x8d\x61\x21\x97\x5a\xca\xdc\x5b\xc8\x0e\x70\x63\xb6\xfd\
-\xeb\xa8\xea\x7f\x51\xa8\x63\xf2\x1f\x83\x92\x5b\x55\x15\x39\xc1\
-\x97\xfb\xdc\xfb\x19\xf6\xa7\xbd\x8d\xba\x96\xb2\xad\x9e\x8e\x1f\
-\xfd\x6e\xf7\xfd\x9e\xcf\xdf\x59\xdd\x3f\xea\xb7\x58\x7e\x3e\x2f\
-\x54\xc4\xb6\x90\x5d\xfa\x7a\xc6\xe2\x5e\xc1\x59\xb7\x6d\xb6\x57\
-\xe9\xbb\xfc\x26\x25\x8d\xff\x00\x09\xfc\xb5\xa7\x99\x8d\xf5\xf1\
-\xad\xb2\x96\xdf\xf6\xbf\x5f\xd6\xa6\xd6\x63\x86\x98\x0d\x3b\xed\
-\xff\x00\x05\x5f\xa7\xeb\xbf\xa8\x3e\xba\xbd\x3f\xd3\x5d\xbe\xca\
-\x13\xe2\x34\xd4\x12\xa4\x47\xea\x05\x82\xf3\x49\xcf\xae\x43\x47\
-\xb8\x56\xf2\x3d\x4d\xef\xc7\xb2\xbf\xea\xb2\xca\xff\x00\x9c\x55\
-\x68\xfa\x9d\x65\xf9\x99\x78\xac\xcb\x67\xea\xd4\xd5\x75\x6f\x2c\
-\x7c\x3f\xd7\xab\xed\x55\x34\xff\x00\xa1\xda\xdf\x65\x9b\xff\x00\
-\x3f\xf9\xba\xec\x57\x71\x0f\xd7\x9c\xab\x5f\x75\xb9\x3f\x65\x0c\
-\xc1\x39\xfe\xbe\x43\x5a\x18\x71\xa9\x3e\xaf\xaa\xcf\x4e\x9b\x5d\
-\x65\x8e\xb3\x23\xf3\x6b\xf5\x2d\xb1\xff\x00\xa6\x5a\x6e\xfa\xa9\
-\xf5\xf7\x0b\xa8\x5f\x55\x79\xd8\xcf\xb6\xcc\x33\x91\x65\x8c\x3b\
-\x98\xf6\x60\xed\xc1\x6e\x38\x6b\xf1\xbd\xb9\x55\x32\xcf\x4e\xaf\
-\xd1\x56\xc7\xfb\xff\x00\x58\xfe\x71\x23\xc1\xd8\xa9\xce\xc4\xfa\
-\x81\x5b\xb3\xb1\xeb\xc8\xce\x0e\xc6\x79\x68\xb7\xd3\x61\x6d\x92\
-\xe7\xe3\xd3\xe9\xd7\xbf\x7b\x3f\xed\x57\xf3\xab\x8f\xb1\xa1\xaf\
-\x73\x47\x00\x90\x3e\x4b\xbd\xbf\xa6\x7f\x8c\x7c\x6b\x31\x2d\xc4\
-\xc8\x6e\x75\x97\xd6\x6c\x68\xc5\x6b\x1d\xe9\xc3\x71\x72\xb6\xe4\
-\xfa\xd4\x53\x5b\x2d\xda\xec\x37\x53\xf4\xff\x00\xe0\x97\x39\x91\
-\xf5\x43\xaf\x51\xd2\xf2\x3a\xbe\x5d\x23\x1e\x9a\x1b\x4d\xce\x65\
-\x92\xdb\x1d\x5e\x4b\xbd\x3a\x6e\xa9\xbb\x76\x39\xbe\xa7\xb2\xd6\
-\x6f\xf5\xa9\xff\x00\x44\x84\x8c\x7a\x0a\x53\xff\xd0\xe2\xb1\x3e\
-\xb7\x5d\x8b\x4f\x4f\xc7\x14\xbc\xe3\xe0\x53\x7d\x56\x52\x2d\x2d\
-\x65\xaf\xb8\x5e\xd6\x64\x3d\x9b\x36\xb5\xf4\x7d\xa7\xd9\xfc\xe7\
-\xd0\xfc\xc5\x7e\xbf\xaf\xf5\xb3\x20\x5e\x7a\x70\x71\x6d\x8f\xb1\
-\xbf\xa6\xd4\x17\xba\x87\x40\x3e\x8f\xfd\xd7\xd9\xf4\x7f\x3f\xfc\
-\x1a\xe4\x12\x4e\x13\x90\xea\xa7\xa3\xa3\xeb\x7b\x6a\xc9\xbe\xc7\
-\xe2\x17\xd5\x93\xd2\xbf\x64\xbe\xb1\x6c\x10\xdd\xb5\xb7\xed\x15\
-\xd8\x6a\x7b\x5b\xef\xab\x7f\xa5\xe9\xae\x8a\xcf\xf1\xba\xd3\x90\
-\x32\xdb\xd1\x98\x72\x65\xad\x75\x96\x64\x17\xcd\x22\xef\xb5\xfa\
-\x3f\xcc\x56\xed\xcc\xfa\x18\xef\xdd\xb2\x8f\xf4\x3f\xe0\x97\x9d\
-\x24\x9a\x4d\xa9\xed\xf1\xff\x00\xc6\x6d\xb5\x75\xd3\xd4\xec\xc2\
-\x7d\xd8\xac\xc7\xae\x8c\x4c\x27\x64\x12\xda\x3d\x33\x43\x9f\x65\
-\x2e\x75\x0f\xab\xf5\x8f\xb3\x7e\x9b\xf5\x6f\x57\xfe\x19\x54\xeb\
-\x3f\x5f\x5d\xd4\xf0\x7a\x86\x18\xc2\xf4\xbf\x68\x51\x85\x8e\x5e\
-\x6e\x2f\xd8\xdc\x27\x3e\xef\x63\x7d\x26\x7f\x3f\x65\x9f\xd8\x5c\
-\x9a\x49\x29\xff\xd1\xf2\xa4\x92\x49\x25\x29\x24\x92\x49\x4a\x49\
-\x24\x92\x53\xff\xd2\xf2\xa4\x92\x49\x25\x29\x24\x92\x49\x4a\x49\
-\x24\x92\x53\xff\xd3\xf2\xba\xcb\x03\xda\x6c\x04\xb0\x11\xb8\x03\
-\x04\x8f\xce\x82\xb4\xdb\x93\xd0\x03\xa5\xd8\xb6\x1d\xa4\x91\x04\
-\x80\xed\x06\xdd\xcc\x75\xd6\x6d\xfd\x26\xff\x00\xf0\xab\x2d\x24\
-\x92\xea\x1c\xae\x86\x1c\x36\x63\x3c\x34\xbc\x17\xee\x1b\xce\xdd\
-\x96\x30\xed\xfd\x33\x3f\xc2\x3d\x8e\xd9\xff\x00\x07\xfc\xf7\xf8\
-\x35\x63\x07\x33\xea\xe5\x42\xfa\x72\x69\x73\xaa\xb6\xcc\x7b\x01\
-\x15\x0b\x9d\xb1\x82\xc7\x65\xe3\xb6\xd7\x5d\x85\x75\x3e\xa5\xaf\
-\xad\x9b\xe9\x7b\x37\xd7\x57\xf9\xf8\x69\x24\xa7\xa5\xfd\xa3\xf5\
-\x1f\xda\x0f\x4d\xc8\xd8\xd0\xe9\x01\xda\xb9\xce\x6d\x71\x2e\x37\
-\x39\xed\x65\x76\xd7\x67\xe7\x7f\x85\xff\x00\x05\xe9\xd9\x56\x46\
-\x06\x6d\xb4\xdd\x9b\x91\x6e\x3b\x3d\x3a\x2c\xb5\xef\xaa\xb8\x03\
-\x6b\x1c\xe2\xe6\x33\x6b\x7d\xad\xda\xd4\x14\x92\x43\xff\xd9\xff\
-\xed\x0e\xba\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x33\x2e\x30\
-\x00\x38\x42\x49\x4d\x04\x25\x00\x00\x00\x00\x00\x10\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x38\x42\x49\
-\x4d\x04\x3a\x00\x00\x00\x00\x00\xe5\x00\x00\x00\x10\x00\x00\x00\
-\x01\x00\x00\x00\x00\x00\x0b\x70\x72\x69\x6e\x74\x4f\x75\x74\x70\
-\x75\x74\x00\x00\x00\x05\x00\x00\x00\x00\x50\x73\x74\x53\x62\x6f\
-\x6f\x6c\x01\x00\x00\x00\x00\x49\x6e\x74\x65\x65\x6e\x75\x6d\x00\
-\x00\x00\x00\x49\x6e\x74\x65\x00\x00\x00\x00\x43\x6c\x72\x6d\x00\
-\x00\x00\x0f\x70\x72\x69\x6e\x74\x53\x69\x78\x74\x65\x65\x6e\x42\
-\x69\x74\x62\x6f\x6f\x6c\x00\x00\x00\x00\x0b\x70\x72\x69\x6e\x74\
-\x65\x72\x4e\x61\x6d\x65\x54\x45\x58\x54\x00\x00\x00\x01\x00\x00\
-\x00\x00\x00\x0f\x70\x72\x69\x6e\x74\x50\x72\x6f\x6f\x66\x53\x65\
-\x74\x75\x70\x4f\x62\x6a\x63\x00\x00\x00\x0c\x00\x50\x00\x72\x00\
-\x6f\x00\x6f\x00\x66\x00\x20\x00\x53\x00\x65\x00\x74\x00\x75\x00\
-\x70\x00\x00\x00\x00\x00\x0a\x70\x72\x6f\x6f\x66\x53\x65\x74\x75\
-\x70\x00\x00\x00\x01\x00\x00\x00\x00\x42\x6c\x74\x6e\x65\x6e\x75\
-\x6d\x00\x00\x00\x0c\x62\x75\x69\x6c\x74\x69\x6e\x50\x72\x6f\x6f\
-\x66\x00\x00\x00\x09\x70\x72\x6f\x6f\x66\x43\x4d\x59\x4b\x00\x38\
-\x42\x49\x4d\x04\x3b\x00\x00\x00\x00\x02\x2d\x00\x00\x00\x10\x00\
-\x00\x00\x01\x00\x00\x00\x00\x00\x12\x70\x72\x69\x6e\x74\x4f\x75\
-\x74\x70\x75\x74\x4f\x70\x74\x69\x6f\x6e\x73\x00\x00\x00\x17\x00\
-\x00\x00\x00\x43\x70\x74\x6e\x62\x6f\x6f\x6c\x00\x00\x00\x00\x00\
-\x43\x6c\x62\x72\x62\x6f\x6f\x6c\x00\x00\x00\x00\x00\x52\x67\x73\
-\x4d\x62\x6f\x6f\x6c\x00\x00\x00\x00\x00\x43\x72\x6e\x43\x62\x6f\
-\x6f\x6c\x00\x00\x00\x00\x00\x43\x6e\x74\x43\x62\x6f\x6f\x6c\x00\
-\x00\x00\x00\x00\x4c\x62\x6c\x73\x62\x6f\x6f\x6c\x00\x00\x00\x00\
-\x00\x4e\x67\x74\x76\x62\x6f\x6f\x6c\x00\x00\x00\x00\x00\x45\x6d\
-\x6c\x44\x62\x6f\x6f\x6c\x00\x00\x00\x00\x00\x49\x6e\x74\x72\x62\
-\x6f\x6f\x6c\x00\x00\x00\x00\x00\x42\x63\x6b\x67\x4f\x62\x6a\x63\
-\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x52\x47\x42\x43\x00\x00\
-\x00\x03\x00\x00\x00\x00\x52\x64\x20\x20\x64\x6f\x75\x62\x40\x6f\
-\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x47\x72\x6e\x20\x64\x6f\
-\x75\x62\x40\x6f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\x6c\
-\x20\x20\x64\x6f\x75\x62\x40\x6f\xe0\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x42\x72\x64\x54\x55\x6e\x74\x46\x23\x52\x6c\x74\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\x6c\x64\x20\x55\x6e\
-\x74\x46\x23\x52\x6c\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x52\x73\x6c\x74\x55\x6e\x74\x46\x23\x50\x78\x6c\x40\x72\
-\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x0a\x76\x65\x63\x74\x6f\x72\
-\x44\x61\x74\x61\x62\x6f\x6f\x6c\x01\x00\x00\x00\x00\x50\x67\x50\
-\x73\x65\x6e\x75\x6d\x00\x00\x00\x00\x50\x67\x50\x73\x00\x00\x00\
-\x00\x50\x67\x50\x43\x00\x00\x00\x00\x4c\x65\x66\x74\x55\x6e\x74\
-\x46\x23\x52\x6c\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x54\x6f\x70\x20\x55\x6e\x74\x46\x23\x52\x6c\x74\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x63\x6c\x20\x55\x6e\x74\
-\x46\x23\x50\x72\x63\x40\x59\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x10\x63\x72\x6f\x70\x57\x68\x65\x6e\x50\x72\x69\x6e\x74\x69\x6e\
-\x67\x62\x6f\x6f\x6c\x00\x00\x00\x00\x0e\x63\x72\x6f\x70\x52\x65\
-\x63\x74\x42\x6f\x74\x74\x6f\x6d\x6c\x6f\x6e\x67\x00\x00\x00\x00\
-\x00\x00\x00\x0c\x63\x72\x6f\x70\x52\x65\x63\x74\x4c\x65\x66\x74\
-\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x0d\x63\x72\x6f\x70\
-\x52\x65\x63\x74\x52\x69\x67\x68\x74\x6c\x6f\x6e\x67\x00\x00\x00\
-\x00\x00\x00\x00\x0b\x63\x72\x6f\x70\x52\x65\x63\x74\x54\x6f\x70\
-\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x38\x42\x49\x4d\x03\xed\x00\
-\x00\x00\x00\x00\x10\x01\x2c\x00\x00\x00\x01\x00\x02\x01\x2c\x00\
-\x00\x00\x01\x00\x02\x38\x42\x49\x4d\x04\x26\x00\x00\x00\x00\x00\
-\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\x80\x00\x00\x38\
-\x42\x49\x4d\x04\x0d\x00\x00\x00\x00\x00\x04\x00\x00\x00\x5a\x38\
-\x42\x49\x4d\x04\x19\x00\x00\x00\x00\x00\x04\x00\x00\x00\x1e\x38\
-\x42\x49\x4d\x03\xf3\x00\x00\x00\x00\x00\x09\x00\x00\x00\x00\x00\
-\x00\x00\x00\x01\x00\x38\x42\x49\x4d\x27\x10\x00\x00\x00\x00\x00\
-\x0a\x00\x01\x00\x00\x00\x00\x00\x00\x00\x02\x38\x42\x49\x4d\x03\
-\xf5\x00\x00\x00\x00\x00\x48\x00\x2f\x66\x66\x00\x01\x00\x6c\x66\
-\x66\x00\x06\x00\x00\x00\x00\x00\x01\x00\x2f\x66\x66\x00\x01\x00\
-\xa1\x99\x9a\x00\x06\x00\x00\x00\x00\x00\x01\x00\x32\x00\x00\x00\
-\x01\x00\x5a\x00\x00\x00\x06\x00\x00\x00\x00\x00\x01\x00\x35\x00\
-\x00\x00\x01\x00\x2d\x00\x00\x00\x06\x00\x00\x00\x00\x00\x01\x38\
-\x42\x49\x4d\x03\xf8\x00\x00\x00\x00\x00\x70\x00\x00\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\x03\xe8\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x03\
-\xe8\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x03\xe8\x00\x00\x00\
-\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\x03\xe8\x00\x00\x38\x42\x49\x4d\x04\
-\x00\x00\x00\x00\x00\x00\x02\x00\x02\x38\x42\x49\x4d\x04\x02\x00\
-\x00\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x38\x42\x49\
-\x4d\x04\x30\x00\x00\x00\x00\x00\x04\x01\x01\x01\x01\x38\x42\x49\
-\x4d\x04\x2d\x00\x00\x00\x00\x00\x06\x00\x01\x00\x00\x00\x08\x38\
-\x42\x49\x4d\x04\x08\x00\x00\x00\x00\x00\x10\x00\x00\x00\x01\x00\
-\x00\x02\x40\x00\x00\x02\x40\x00\x00\x00\x00\x38\x42\x49\x4d\x04\
-\x1e\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x38\x42\x49\x4d\x04\
-\x1a\x00\x00\x00\x00\x03\x53\x00\x00\x00\x06\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x01\x2c\x00\x00\x00\xc8\x00\x00\x00\x0f\x00\
-\x77\x00\x69\x00\x7a\x00\x61\x00\x72\x00\x64\x00\x77\x00\x61\x00\
-\x74\x00\x65\x00\x72\x00\x6d\x00\x61\x00\x72\x00\x6b\x00\x00\x00\
-\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\xc8\x00\x00\x01\x2c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x01\x00\x00\
-\x00\x00\x00\x00\x6e\x75\x6c\x6c\x00\x00\x00\x02\x00\x00\x00\x06\
-\x62\x6f\x75\x6e\x64\x73\x4f\x62\x6a\x63\x00\x00\x00\x01\x00\x00\
-\x00\x00\x00\x00\x52\x63\x74\x31\x00\x00\x00\x04\x00\x00\x00\x00\
-\x54\x6f\x70\x20\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x00\
-\x4c\x65\x66\x74\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x00\
-\x42\x74\x6f\x6d\x6c\x6f\x6e\x67\x00\x00\x01\x2c\x00\x00\x00\x00\
-\x52\x67\x68\x74\x6c\x6f\x6e\x67\x00\x00\x00\xc8\x00\x00\x00\x06\
-\x73\x6c\x69\x63\x65\x73\x56\x6c\x4c\x73\x00\x00\x00\x01\x4f\x62\
-\x6a\x63\x00\x00\x00\x01\x00\x00\x00\x00\x00\x05\x73\x6c\x69\x63\
-\x65\x00\x00\x00\x12\x00\x00\x00\x07\x73\x6c\x69\x63\x65\x49\x44\
-\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x07\x67\x72\x6f\x75\
-\x70\x49\x44\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x06\x6f\
-\x72\x69\x67\x69\x6e\x65\x6e\x75\x6d\x00\x00\x00\x0c\x45\x53\x6c\
-\x69\x63\x65\x4f\x72\x69\x67\x69\x6e\x00\x00\x00\x0d\x61\x75\x74\
-\x6f\x47\x65\x6e\x65\x72\x61\x74\x65\x64\x00\x00\x00\x00\x54\x79\
-\x70\x65\x65\x6e\x75\x6d\x00\x00\x00\x0a\x45\x53\x6c\x69\x63\x65\
-\x54\x79\x70\x65\x00\x00\x00\x00\x49\x6d\x67\x20\x00\x00\x00\x06\
-\x62\x6f\x75\x6e\x64\x73\x4f\x62\x6a\x63\x00\x00\x00\x01\x00\x00\
-\x00\x00\x00\x00\x52\x63\x74\x31\x00\x00\x00\x04\x00\x00\x00\x00\
-\x54\x6f\x70\x20\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x00\
-\x4c\x65\x66\x74\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x00\
-\x42\x74\x6f\x6d\x6c\x6f\x6e\x67\x00\x00\x01\x2c\x00\x00\x00\x00\
-\x52\x67\x68\x74\x6c\x6f\x6e\x67\x00\x00\x00\xc8\x00\x00\x00\x03\
-\x75\x72\x6c\x54\x45\x58\x54\x00\x00\x00\x01\x00\x00\x00\x00\x00\
-\x00\x6e\x75\x6c\x6c\x54\x45\x58\x54\x00\x00\x00\x01\x00\x00\x00\
-\x00\x00\x00\x4d\x73\x67\x65\x54\x45\x58\x54\x00\x00\x00\x01\x00\
-\x00\x00\x00\x00\x06\x61\x6c\x74\x54\x61\x67\x54\x45\x58\x54\x00\
-\x00\x00\x01\x00\x00\x00\x00\x00\x0e\x63\x65\x6c\x6c\x54\x65\x78\
-\x74\x49\x73\x48\x54\x4d\x4c\x62\x6f\x6f\x6c\x01\x00\x00\x00\x08\
-\x63\x65\x6c\x6c\x54\x65\x78\x74\x54\x45\x58\x54\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x09\x68\x6f\x72\x7a\x41\x6c\x69\x67\x6e\x65\
-\x6e\x75\x6d\x00\x00\x00\x0f\x45\x53\x6c\x69\x63\x65\x48\x6f\x72\
-\x7a\x41\x6c\x69\x67\x6e\x00\x00\x00\x07\x64\x65\x66\x61\x75\x6c\
-\x74\x00\x00\x00\x09\x76\x65\x72\x74\x41\x6c\x69\x67\x6e\x65\x6e\
-\x75\x6d\x00\x00\x00\x0f\x45\x53\x6c\x69\x63\x65\x56\x65\x72\x74\
-\x41\x6c\x69\x67\x6e\x00\x00\x00\x07\x64\x65\x66\x61\x75\x6c\x74\
-\x00\x00\x00\x0b\x62\x67\x43\x6f\x6c\x6f\x72\x54\x79\x70\x65\x65\
-\x6e\x75\x6d\x00\x00\x00\x11\x45\x53\x6c\x69\x63\x65\x42\x47\x43\
-\x6f\x6c\x6f\x72\x54\x79\x70\x65\x00\x00\x00\x00\x4e\x6f\x6e\x65\
-\x00\x00\x00\x09\x74\x6f\x70\x4f\x75\x74\x73\x65\x74\x6c\x6f\x6e\
-\x67\x00\x00\x00\x00\x00\x00\x00\x0a\x6c\x65\x66\x74\x4f\x75\x74\
-\x73\x65\x74\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x0c\x62\
-\x6f\x74\x74\x6f\x6d\x4f\x75\x74\x73\x65\x74\x6c\x6f\x6e\x67\x00\
-\x00\x00\x00\x00\x00\x00\x0b\x72\x69\x67\x68\x74\x4f\x75\x74\x73\
-\x65\x74\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x38\x42\x49\x4d\x04\
-\x28\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x02\x3f\xf0\x00\x00\x00\
-\x00\x00\x00\x38\x42\x49\x4d\x04\x14\x00\x00\x00\x00\x00\x04\x00\
-\x00\x00\x0c\x38\x42\x49\x4d\x04\x0c\x00\x00\x00\x00\x05\x8e\x00\
-\x00\x00\x01\x00\x00\x00\x30\x00\x00\x00\x48\x00\x00\x00\x90\x00\
-\x00\x28\x80\x00\x00\x05\x72\x00\x18\x00\x01\xff\xd8\xff\xed\x00\
-\x0c\x41\x64\x6f\x62\x65\x5f\x43\x4d\x00\x01\xff\xee\x00\x0e\x41\
-\x64\x6f\x62\x65\x00\x64\x80\x00\x00\x00\x01\xff\xdb\x00\x84\x00\
-\x0c\x08\x08\x08\x09\x08\x0c\x09\x09\x0c\x11\x0b\x0a\x0b\x11\x15\
-\x0f\x0c\x0c\x0f\x15\x18\x13\x13\x15\x13\x13\x18\x11\x0c\x0c\x0c\
-\x0c\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x01\x0d\x0b\x0b\x0d\x0e\x0d\x10\x0e\x0e\x10\x14\x0e\x0e\x0e\x14\
-\x14\x0e\x0e\x0e\x0e\x14\x11\x0c\x0c\x0c\x0c\x0c\x11\x11\x0c\x0c\
-\x0c\x0c\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\xff\xc0\x00\x11\x08\x00\x48\x00\x30\x03\x01\x22\x00\x02\x11\
-\x01\x03\x11\x01\xff\xdd\x00\x04\x00\x03\xff\xc4\x01\x3f\x00\x00\
-\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x03\
-\x00\x01\x02\x04\x05\x06\x07\x08\x09\x0a\x0b\x01\x00\x01\x05\x01\
-\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x02\x03\
-\x04\x05\x06\x07\x08\x09\x0a\x0b\x10\x00\x01\x04\x01\x03\x02\x04\
-\x02\x05\x07\x06\x08\x05\x03\x0c\x33\x01\x00\x02\x11\x03\x04\x21\
-\x12\x31\x05\x41\x51\x61\x13\x22\x71\x81\x32\x06\x14\x91\xa1\xb1\
-\x42\x23\x24\x15\x52\xc1\x62\x33\x34\x72\x82\xd1\x43\x07\x25\x92\
-\x53\xf0\xe1\xf1\x63\x73\x35\x16\xa2\xb2\x83\x26\x44\x93\x54\x64\
-\x45\xc2\xa3\x74\x36\x17\xd2\x55\xe2\x65\xf2\xb3\x84\xc3\xd3\x75\
-\xe3\xf3\x46\x27\x94\xa4\x85\xb4\x95\xc4\xd4\xe4\xf4\xa5\xb5\xc5\
-\xd5\xe5\xf5\x56\x66\x76\x86\x96\xa6\xb6\xc6\xd6\xe6\xf6\x37\x47\
-\x57\x67\x77\x87\x97\xa7\xb7\xc7\xd7\xe7\xf7\x11\x00\x02\x02\x01\
-\x02\x04\x04\x03\x04\x05\x06\x07\x07\x06\x05\x35\x01\x00\x02\x11\
-\x03\x21\x31\x12\x04\x41\x51\x61\x71\x22\x13\x05\x32\x81\x91\x14\
-\xa1\xb1\x42\x23\xc1\x52\xd1\xf0\x33\x24\x62\xe1\x72\x82\x92\x43\
-\x53\x15\x63\x73\x34\xf1\x25\x06\x16\xa2\xb2\x83\x07\x26\x35\xc2\
-\xd2\x44\x93\x54\xa3\x17\x64\x45\x55\x36\x74\x65\xe2\xf2\xb3\x84\
-\xc3\xd3\x75\xe3\xf3\x46\x94\xa4\x85\xb4\x95\xc4\xd4\xe4\xf4\xa5\
-\xb5\xc5\xd5\xe5\xf5\x56\x66\x76\x86\x96\xa6\xb6\xc6\xd6\xe6\xf6\
-\x27\x37\x47\x57\x67\x77\x87\x97\xa7\xb7\xc7\xff\xda\x00\x0c\x03\
-\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xf3\x1c\x0a\x19\x93\x9d\x8d\
-\x8d\x61\x21\x97\x5a\xca\xdc\x5b\xc8\x0e\x70\x63\xb6\xfd\xeb\xa8\
-\xea\x7f\x51\xa8\x63\xf2\x1f\x83\x92\x5b\x55\x15\x39\xc1\x97\xfb\
-\xdc\xfb\x19\xf6\xa7\xbd\x8d\xba\x96\xb2\xad\x9e\x8e\x1f\xfd\x6e\
-\xf7\xfd\x9e\xcf\xdf\x59\xdd\x3f\xea\xb7\x58\x7e\x3e\x2f\x54\xc4\
-\xb6\x90\x5d\xfa\x7a\xc6\xe2\x5e\xc1\x59\xb7\x6d\xb6\x57\xe9\xbb\
-\xfc\x26\x25\x8d\xff\x00\x09\xfc\xb5\xa7\x99\x8d\xf5\xf1\xad\xb2\
-\x96\xdf\xf6\xbf\x5f\xd6\xa6\xd6\x63\x86\x98\x0d\x3b\xed\xff\x00\
-\x05\x5f\xa7\xeb\xbf\xa8\x3e\xba\xbd\x3f\xd3\x5d\xbe\xca\x13\xe2\
-\x34\xd4\x12\xa4\x47\xea\x05\x82\xf3\x49\xcf\xae\x43\x47\xb8\x56\
-\xf2\x3d\x4d\xef\xc7\xb2\xbf\xea\xb2\xca\xff\x00\x9c\x55\x68\xfa\
-\x9d\x65\xf9\x99\x78\xac\xcb\x67\xea\xd4\xd5\x75\x6f\x2c\x7c\x3f\
-\xd7\xab\xed\x55\x34\xff\x00\xa1\xda\xdf\x65\x9b\xff\x00\x3f\xf9\
-\xba\xec\x57\x71\x0f\xd7\x9c\xab\x5f\x75\xb9\x3f\x65\x0c\xc1\x39\
-\xfe\xbe\x43\x5a\x18\x71\xa9\x3e\xaf\xaa\xcf\x4e\x9b\x5d\x65\x8e\
-\xb3\x23\xf3\x6b\xf5\x2d\xb1\xff\x00\xa6\x5a\x6e\xfa\xa9\xf5\xf7\
-\x0b\xa8\x5f\x55\x79\xd8\xcf\xb6\xcc\x33\x91\x65\x8c\x3b\x98\xf6\
-\x60\xed\xc1\x6e\x38\x6b\xf1\xbd\xb9\x55\x32\xcf\x4e\xaf\xd1\x56\
-\xc7\xfb\xff\x00\x58\xfe\x71\x23\xc1\xd8\xa9\xce\xc4\xfa\x81\x5b\
-\xb3\xb1\xeb\xc8\xce\x0e\xc6\x79\x68\xb7\xd3\x61\x6d\x92\xe7\xe3\
-\xd3\xe9\xd7\xbf\x7b\x3f\xed\x57\xf3\xab\x8f\xb1\xa1\xaf\x73\x47\
-\x00\x90\x3e\x4b\xbd\xbf\xa6\x7f\x8c\x7c\x6b\x31\x2d\xc4\xc8\x6e\
-\x75\x97\xd6\x6c\x68\xc5\x6b\x1d\xe9\xc3\x71\x72\xb6\xe4\xfa\xd4\
-\x53\x5b\x2d\xda\xec\x37\x53\xf4\xff\x00\xe0\x97\x39\x91\xf5\x43\
-\xaf\x51\xd2\xf2\x3a\xbe\x5d\x23\x1e\x9a\x1b\x4d\xce\x65\x92\xdb\
-\x1d\x5e\x4b\xbd\x3a\x6e\xa9\xbb\x76\x39\xbe\xa7\xb2\xd6\x6f\xf5\
-\xa9\xff\x00\x44\x84\x8c\x7a\x0a\x53\xff\xd0\xe2\xb1\x3e\xb7\x5d\
-\x8b\x4f\x4f\xc7\x14\xbc\xe3\xe0\x53\x7d\x56\x52\x2d\x2d\x65\xaf\
-\xb8\x5e\xd6\x64\x3d\x9b\x36\xb5\xf4\x7d\xa7\xd9\xfc\xe7\xd0\xfc\
-\xc5\x7e\xbf\xaf\xf5\xb3\x20\x5e\x7a\x70\x71\x6d\x8f\xb1\xbf\xa6\
-\xd4\x17\xba\x87\x40\x3e\x8f\xfd\xd7\xd9\xf4\x7f\x3f\xfc\x1a\xe4\
-\x12\x4e\x13\x90\xea\xa7\xa3\xa3\xeb\x7b\x6a\xc9\xbe\xc7\xe2\x17\
-\xd5\x93\xd2\xbf\x64\xbe\xb1\x6c\x10\xdd\xb5\xb7\xed\x15\xd8\x6a\
-\x7b\x5b\xef\xab\x7f\xa5\xe9\xae\x8a\xcf\xf1\xba\xd3\x90\x32\xdb\
-\xd1\x98\x72\x65\xad\x75\x96\x64\x17\xcd\x22\xef\xb5\xfa\x3f\xcc\
-\x56\xed\xcc\xfa\x18\xef\xdd\xb2\x8f\xf4\x3f\xe0\x97\x9d\x24\x9a\
-\x4d\xa9\xed\xf1\xff\x00\xc6\x6d\xb5\x75\xd3\xd4\xec\xc2\x7d\xd8\
-\xac\xc7\xae\x8c\x4c\x27\x64\x12\xda\x3d\x33\x43\x9f\x65\x2e\x75\
-\x0f\xab\xf5\x8f\xb3\x7e\x9b\xf5\x6f\x57\xfe\x19\x54\xeb\x3f\x5f\
-\x5d\xd4\xf0\x7a\x86\x18\xc2\xf4\xbf\x68\x51\x85\x8e\x5e\x6e\x2f\
-\xd8\xdc\x27\x3e\xef\x63\x7d\x26\x7f\x3f\x65\x9f\xd8\x5c\x9a\x49\
-\x29\xff\xd1\xf2\xa4\x92\x49\x25\x29\x24\x92\x49\x4a\x49\x24\x92\
-\x53\xff\xd2\xf2\xa4\x92\x49\x25\x29\x24\x92\x49\x4a\x49\x24\x92\
-\x53\xff\xd3\xf2\xba\xcb\x03\xda\x6c\x04\xb0\x11\xb8\x03\x04\x8f\
-\xce\x82\xb4\xdb\x93\xd0\x03\xa5\xd8\xb6\x1d\xa4\x91\x04\x80\xed\
-\x06\xdd\xcc\x75\xd6\x6d\xfd\x26\xff\x00\xf0\xab\x2d\x24\x92\xea\
-\x1c\xae\x86\x1c\x36\x63\x3c\x34\xbc\x17\xee\x1b\xce\xdd\x96\x30\
-\xed\xfd\x33\x3f\xc2\x3d\x8e\xd9\xff\x00\x07\xfc\xf7\xf8\x35\x63\
-\x07\x33\xea\xe5\x42\xfa\x72\x69\x73\xaa\xb6\xcc\x7b\x01\x15\x0b\
-\x9d\xb1\x82\xc7\x65\xe3\xb6\xd7\x5d\x85\x75\x3e\xa5\xaf\xad\x9b\
-\xe9\x7b\x37\xd7\x57\xf9\xf8\x69\x24\xa7\xa5\xfd\xa3\xf5\x1f\xda\
-\x0f\x4d\xc8\xd8\xd0\xe9\x01\xda\xb9\xce\x6d\x71\x2e\x37\x39\xed\
-\x65\x76\xd7\x67\xe7\x7f\x85\xff\x00\x05\xe9\xd9\x56\x46\x06\x6d\
-\xb4\xdd\x9b\x91\x6e\x3b\x3d\x3a\x2c\xb5\xef\xaa\xb8\x03\x6b\x1c\
-\xe2\xe6\x33\x6b\x7d\xad\xda\xd4\x14\x92\x43\xff\xd9\x38\x42\x49\
-\x4d\x04\x21\x00\x00\x00\x00\x00\x5d\x00\x00\x00\x01\x01\x00\x00\
-\x00\x0f\x00\x41\x00\x64\x00\x6f\x00\x62\x00\x65\x00\x20\x00\x50\
-\x00\x68\x00\x6f\x00\x74\x00\x6f\x00\x73\x00\x68\x00\x6f\x00\x70\
-\x00\x00\x00\x17\x00\x41\x00\x64\x00\x6f\x00\x62\x00\x65\x00\x20\
-\x00\x50\x00\x68\x00\x6f\x00\x74\x00\x6f\x00\x73\x00\x68\x00\x6f\
-\x00\x70\x00\x20\x00\x43\x00\x43\x00\x20\x00\x32\x00\x30\x00\x31\
-\x00\x37\x00\x00\x00\x01\x00\x38\x42\x49\x4d\x04\x06\x00\x00\x00\
-\x00\x00\x07\x00\x08\x00\x00\x00\x01\x01\x00\xff\xe1\x0f\x81\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x00\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\
-\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\
-\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\
-\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\
-\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\
-\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\
-\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\
-\x36\x2d\x63\x31\x33\x38\x20\x37\x39\x2e\x31\x35\x39\x38\x32\x34\
-\x2c\x20\x32\x30\x31\x36\x2f\x30\x39\x2f\x31\x34\x2d\x30\x31\x3a\
-\x30\x39\x3a\x30\x31\x20\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\
-\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\
-\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\
-\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\
-\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\
-\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\
-\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\
-\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\
-\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\
-\x76\x74\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\
-\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\
-\x73\x54\x79\x70\x65\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\
-\x65\x6e\x74\x23\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\
-\x6f\x73\x68\x6f\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\
-\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\
-\x73\x68\x6f\x70\x2f\x31\x2e\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3a\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\
-\x2e\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\x6e\x74\x73\
-\x2f\x31\x2e\x31\x2f\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\
-\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x37\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x65\x44\x61\x74\x65\x3d\x22\x32\x30\x31\x37\x2d\
-\x30\x33\x2d\x32\x39\x54\x31\x32\x3a\x32\x35\x3a\x35\x38\x5a\x22\
-\x20\x78\x6d\x70\x3a\x4d\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\
-\x65\x3d\x22\x32\x30\x31\x37\x2d\x30\x33\x2d\x32\x39\x54\x31\x32\
-\x3a\x32\x35\x3a\x35\x38\x5a\x22\x20\x78\x6d\x70\x3a\x4d\x6f\x64\
-\x69\x66\x79\x44\x61\x74\x65\x3d\x22\x32\x30\x31\x37\x2d\x30\x33\
-\x2d\x32\x39\x54\x31\x32\x3a\x32\x35\x3a\x35\x38\x5a\x22\x20\x78\
-\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\
-\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\x66\x34\x64\x34\x63\x62\x64\
-\x64\x2d\x65\x36\x62\x31\x2d\x31\x66\x34\x32\x2d\x39\x61\x32\x66\
-\x2d\x33\x63\x61\x30\x65\x33\x64\x37\x34\x36\x63\x64\x22\x20\x78\
-\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\
-\x22\x61\x64\x6f\x62\x65\x3a\x64\x6f\x63\x69\x64\x3a\x70\x68\x6f\
-\x74\x6f\x73\x68\x6f\x70\x3a\x63\x63\x61\x35\x33\x61\x30\x36\x2d\
-\x31\x34\x37\x61\x2d\x31\x31\x65\x37\x2d\x39\x30\x32\x36\x2d\x61\
-\x39\x33\x32\x37\x38\x32\x32\x61\x31\x36\x38\x22\x20\x78\x6d\x70\
-\x4d\x4d\x3a\x4f\x72\x69\x67\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\
-\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x61\
-\x64\x64\x32\x32\x66\x61\x32\x2d\x32\x33\x30\x36\x2d\x36\x38\x34\
-\x34\x2d\x38\x33\x36\x62\x2d\x61\x63\x61\x34\x33\x37\x39\x62\x64\
-\x35\x32\x38\x22\x20\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\
-\x6f\x6c\x6f\x72\x4d\x6f\x64\x65\x3d\x22\x33\x22\x20\x70\x68\x6f\
-\x74\x6f\x73\x68\x6f\x70\x3a\x49\x43\x43\x50\x72\x6f\x66\x69\x6c\
-\x65\x3d\x22\x73\x52\x47\x42\x20\x49\x45\x43\x36\x31\x39\x36\x36\
-\x2d\x32\x2e\x31\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\x74\x3d\
-\x22\x69\x6d\x61\x67\x65\x2f\x6a\x70\x65\x67\x22\x3e\x20\x3c\x78\
-\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\x72\
-\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\x20\
-\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\x72\
-\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x61\x64\x64\x32\x32\x66\x61\x32\x2d\x32\x33\x30\x36\x2d\x36\
-\x38\x34\x34\x2d\x38\x33\x36\x62\x2d\x61\x63\x61\x34\x33\x37\x39\
-\x62\x64\x35\x32\x38\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\x65\
-\x6e\x3d\x22\x32\x30\x31\x37\x2d\x30\x33\x2d\x32\x39\x54\x31\x32\
-\x3a\x32\x35\x3a\x35\x38\x5a\x22\x20\x73\x74\x45\x76\x74\x3a\x73\
-\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\x6e\x74\x3d\x22\x41\x64\
-\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x43\
-\x20\x32\x30\x31\x37\x20\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\
-\x2f\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\x20\x73\x74\x45\x76\x74\
-\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x73\x61\x76\x65\x64\x22\x20\
-\x73\x74\x45\x76\x74\x3a\x69\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\
-\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\x66\x34\x64\x34\x63\x62\
-\x64\x64\x2d\x65\x36\x62\x31\x2d\x31\x66\x34\x32\x2d\x39\x61\x32\
-\x66\x2d\x33\x63\x61\x30\x65\x33\x64\x37\x34\x36\x63\x64\x22\x20\
-\x73\x74\x45\x76\x74\x3a\x77\x68\x65\x6e\x3d\x22\x32\x30\x31\x37\
-\x2d\x30\x33\x2d\x32\x39\x54\x31\x32\x3a\x32\x35\x3a\x35\x38\x5a\
-\x22\x20\x73\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\
-\x41\x67\x65\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\
-\x74\x6f\x73\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x37\x20\x28\
-\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x73\x74\x45\x76\x74\x3a\
-\x63\x68\x61\x6e\x67\x65\x64\x3d\x22\x2f\x22\x2f\x3e\x20\x3c\x2f\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\
-\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\x70\x68\x6f\x74\x6f\
-\x73\x68\x6f\x70\x3a\x54\x65\x78\x74\x4c\x61\x79\x65\x72\x73\x3e\
-\x20\x3c\x72\x64\x66\x3a\x42\x61\x67\x3e\x20\x3c\x72\x64\x66\x3a\
-\x6c\x69\x20\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x4c\x61\x79\
-\x65\x72\x4e\x61\x6d\x65\x3d\x22\x52\x6f\x6f\x6d\x20\x61\x6e\x64\
-\x20\x50\x69\x6c\x6c\x61\x72\x20\x28\x52\x41\x50\x61\x72\x29\x22\
-\x20\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x4c\x61\x79\x65\x72\
-\x54\x65\x78\x74\x3d\x22\x52\x6f\x6f\x6d\x20\x61\x6e\x64\x20\x50\
-\x69\x6c\x6c\x61\x72\x20\x28\x52\x41\x50\x61\x72\x29\x22\x2f\x3e\
-\x20\x3c\x72\x64\x66\x3a\x6c\x69\x20\x70\x68\x6f\x74\x6f\x73\x68\
-\x6f\x70\x3a\x4c\x61\x79\x65\x72\x4e\x61\x6d\x65\x3d\x22\x63\x72\
-\x65\x61\x74\x65\x64\x20\x62\x79\x20\x45\x7a\x65\x6b\x69\x65\x6c\
-\x22\x20\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x4c\x61\x79\x65\
-\x72\x54\x65\x78\x74\x3d\x22\x63\x72\x65\x61\x74\x65\x64\x20\x62\
-\x79\x20\x45\x7a\x65\x6b\x69\x65\x6c\x22\x2f\x3e\x20\x3c\x2f\x72\
-\x64\x66\x3a\x42\x61\x67\x3e\x20\x3c\x2f\x70\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x3a\x54\x65\x78\x74\x4c\x61\x79\x65\x72\x73\x3e\x20\
-\x3c\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x44\x6f\x63\x75\x6d\
-\x65\x6e\x74\x41\x6e\x63\x65\x73\x74\x6f\x72\x73\x3e\x20\x3c\x72\
-\x64\x66\x3a\x42\x61\x67\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\x3e\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x64\x61\x34\x62\x62\x37\x61\x64\
-\x2d\x36\x61\x63\x34\x2d\x39\x33\x34\x65\x2d\x62\x34\x30\x30\x2d\
-\x30\x62\x66\x35\x39\x66\x31\x32\x38\x30\x32\x62\x3c\x2f\x72\x64\
-\x66\x3a\x6c\x69\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x42\x61\x67\x3e\
-\x20\x3c\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x41\x6e\x63\x65\x73\x74\x6f\x72\x73\x3e\x20\
-\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\
-\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\x2f\
-\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x3f\x78\x70\x61\
-\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x77\x22\x3f\x3e\xff\xe2\
-\x0c\x58\x49\x43\x43\x5f\x50\x52\x4f\x46\x49\x4c\x45\x00\x01\x01\
-\x00\x00\x0c\x48\x4c\x69\x6e\x6f\x02\x10\x00\x00\x6d\x6e\x74\x72\
-\x52\x47\x42\x20\x58\x59\x5a\x20\x07\xce\x00\x02\x00\x09\x00\x06\
-\x00\x31\x00\x00\x61\x63\x73\x70\x4d\x53\x46\x54\x00\x00\x00\x00\
-\x49\x45\x43\x20\x73\x52\x47\x42\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x01\x00\x00\xf6\xd6\x00\x01\x00\x00\x00\x00\xd3\x2d\
-\x48\x50\x20\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x11\x63\x70\x72\x74\x00\x00\x01\x50\x00\x00\x00\x33\
-\x64\x65\x73\x63\x00\x00\x01\x84\x00\x00\x00\x6c\x77\x74\x70\x74\
-\x00\x00\x01\xf0\x00\x00\x00\x14\x62\x6b\x70\x74\x00\x00\x02\x04\
-\x00\x00\x00\x14\x72\x58\x59\x5a\x00\x00\x02\x18\x00\x00\x00\x14\
-\x67\x58\x59\x5a\x00\x00\x02\x2c\x00\x00\x00\x14\x62\x58\x59\x5a\
-\x00\x00\x02\x40\x00\x00\x00\x14\x64\x6d\x6e\x64\x00\x00\x02\x54\
-\x00\x00\x00\x70\x64\x6d\x64\x64\x00\x00\x02\xc4\x00\x00\x00\x88\
-\x76\x75\x65\x64\x00\x00\x03\x4c\x00\x00\x00\x86\x76\x69\x65\x77\
-\x00\x00\x03\xd4\x00\x00\x00\x24\x6c\x75\x6d\x69\x00\x00\x03\xf8\
-\x00\x00\x00\x14\x6d\x65\x61\x73\x00\x00\x04\x0c\x00\x00\x00\x24\
-\x74\x65\x63\x68\x00\x00\x04\x30\x00\x00\x00\x0c\x72\x54\x52\x43\
-\x00\x00\x04\x3c\x00\x00\x08\x0c\x67\x54\x52\x43\x00\x00\x04\x3c\
-\x00\x00\x08\x0c\x62\x54\x52\x43\x00\x00\x04\x3c\x00\x00\x08\x0c\
-\x74\x65\x78\x74\x00\x00\x00\x00\x43\x6f\x70\x79\x72\x69\x67\x68\
-\x74\x20\x28\x63\x29\x20\x31\x39\x39\x38\x20\x48\x65\x77\x6c\x65\
-\x74\x74\x2d\x50\x61\x63\x6b\x61\x72\x64\x20\x43\x6f\x6d\x70\x61\
-\x6e\x79\x00\x00\x64\x65\x73\x63\x00\x00\x00\x00\x00\x00\x00\x12\
-\x73\x52\x47\x42\x20\x49\x45\x43\x36\x31\x39\x36\x36\x2d\x32\x2e\
-\x31\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x12\x73\x52\x47\
-\x42\x20\x49\x45\x43\x36\x31\x39\x36\x36\x2d\x32\x2e\x31\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\xf3\x51\x00\x01\x00\x00\
-\x00\x01\x16\xcc\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x58\x59\x5a\x20\x00\x00\x00\x00\
-\x00\x00\x6f\xa2\x00\x00\x38\xf5\x00\x00\x03\x90\x58\x59\x5a\x20\
-\x00\x00\x00\x00\x00\x00\x62\x99\x00\x00\xb7\x85\x00\x00\x18\xda\
-\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\x24\xa0\x00\x00\x0f\x84\
-\x00\x00\xb6\xcf\x64\x65\x73\x63\x00\x00\x00\x00\x00\x00\x00\x16\
-\x49\x45\x43\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\
-\x65\x63\x2e\x63\x68\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x16\x49\x45\x43\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
-\x69\x65\x63\x2e\x63\x68\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x64\x65\x73\x63\x00\x00\x00\x00\x00\x00\x00\x2e\
-\x49\x45\x43\x20\x36\x31\x39\x36\x36\x2d\x32\x2e\x31\x20\x44\x65\
-\x66\x61\x75\x6c\x74\x20\x52\x47\x42\x20\x63\x6f\x6c\x6f\x75\x72\
-\x20\x73\x70\x61\x63\x65\x20\x2d\x20\x73\x52\x47\x42\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x2e\x49\x45\x43\x20\x36\x31\x39\
-\x36\x36\x2d\x32\x2e\x31\x20\x44\x65\x66\x61\x75\x6c\x74\x20\x52\
-\x47\x42\x20\x63\x6f\x6c\x6f\x75\x72\x20\x73\x70\x61\x63\x65\x20\
-\x2d\x20\x73\x52\x47\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x64\x65\x73\x63\
-\x00\x00\x00\x00\x00\x00\x00\x2c\x52\x65\x66\x65\x72\x65\x6e\x63\
-\x65\x20\x56\x69\x65\x77\x69\x6e\x67\x20\x43\x6f\x6e\x64\x69\x74\
-\x69\x6f\x6e\x20\x69\x6e\x20\x49\x45\x43\x36\x31\x39\x36\x36\x2d\
-\x32\x2e\x31\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2c\x52\
-\x65\x66\x65\x72\x65\x6e\x63\x65\x20\x56\x69\x65\x77\x69\x6e\x67\
-\x20\x43\x6f\x6e\x64\x69\x74\x69\x6f\x6e\x20\x69\x6e\x20\x49\x45\
-\x43\x36\x31\x39\x36\x36\x2d\x32\x2e\x31\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x76\x69\x65\x77\x00\x00\x00\x00\x00\x13\xa4\xfe\
-\x00\x14\x5f\x2e\x00\x10\xcf\x14\x00\x03\xed\xcc\x00\x04\x13\x0b\
-\x00\x03\x5c\x9e\x00\x00\x00\x01\x58\x59\x5a\x20\x00\x00\x00\x00\
-\x00\x4c\x09\x56\x00\x50\x00\x00\x00\x57\x1f\xe7\x6d\x65\x61\x73\
-\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x8f\x00\x00\x00\x02\
-\x73\x69\x67\x20\x00\x00\x00\x00\x43\x52\x54\x20\x63\x75\x72\x76\
-\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x05\x00\x0a\x00\x0f\
-\x00\x14\x00\x19\x00\x1e\x00\x23\x00\x28\x00\x2d\x00\x32\x00\x37\
-\x00\x3b\x00\x40\x00\x45\x00\x4a\x00\x4f\x00\x54\x00\x59\x00\x5e\
-\x00\x63\x00\x68\x00\x6d\x00\x72\x00\x77\x00\x7c\x00\x81\x00\x86\
-\x00\x8b\x00\x90\x00\x95\x00\x9a\x00\x9f\x00\xa4\x00\xa9\x00\xae\
-\x00\xb2\x00\xb7\x00\xbc\x00\xc1\x00\xc6\x00\xcb\x00\xd0\x00\xd5\
-\x00\xdb\x00\xe0\x00\xe5\x00\xeb\x00\xf0\x00\xf6\x00\xfb\x01\x01\
-\x01\x07\x01\x0d\x01\x13\x01\x19\x01\x1f\x01\x25\x01\x2b\x01\x32\
-\x01\x38\x01\x3e\x01\x45\x01\x4c\x01\x52\x01\x59\x01\x60\x01\x67\
-\x01\x6e\x01\x75\x01\x7c\x01\x83\x01\x8b\x01\x92\x01\x9a\x01\xa1\
-\x01\xa9\x01\xb1\x01\xb9\x01\xc1\x01\xc9\x01\xd1\x01\xd9\x01\xe1\
-\x01\xe9\x01\xf2\x01\xfa\x02\x03\x02\x0c\x02\x14\x02\x1d\x02\x26\
-\x02\x2f\x02\x38\x02\x41\x02\x4b\x02\x54\x02\x5d\x02\x67\x02\x71\
-\x02\x7a\x02\x84\x02\x8e\x02\x98\x02\xa2\x02\xac\x02\xb6\x02\xc1\
-\x02\xcb\x02\xd5\x02\xe0\x02\xeb\x02\xf5\x03\x00\x03\x0b\x03\x16\
-\x03\x21\x03\x2d\x03\x38\x03\x43\x03\x4f\x03\x5a\x03\x66\x03\x72\
-\x03\x7e\x03\x8a\x03\x96\x03\xa2\x03\xae\x03\xba\x03\xc7\x03\xd3\
-\x03\xe0\x03\xec\x03\xf9\x04\x06\x04\x13\x04\x20\x04\x2d\x04\x3b\
-\x04\x48\x04\x55\x04\x63\x04\x71\x04\x7e\x04\x8c\x04\x9a\x04\xa8\
-\x04\xb6\x04\xc4\x04\xd3\x04\xe1\x04\xf0\x04\xfe\x05\x0d\x05\x1c\
-\x05\x2b\x05\x3a\x05\x49\x05\x58\x05\x67\x05\x77\x05\x86\x05\x96\
-\x05\xa6\x05\xb5\x05\xc5\x05\xd5\x05\xe5\x05\xf6\x06\x06\x06\x16\
-\x06\x27\x06\x37\x06\x48\x06\x59\x06\x6a\x06\x7b\x06\x8c\x06\x9d\
-\x06\xaf\x06\xc0\x06\xd1\x06\xe3\x06\xf5\x07\x07\x07\x19\x07\x2b\
-\x07\x3d\x07\x4f\x07\x61\x07\x74\x07\x86\x07\x99\x07\xac\x07\xbf\
-\x07\xd2\x07\xe5\x07\xf8\x08\x0b\x08\x1f\x08\x32\x08\x46\x08\x5a\
-\x08\x6e\x08\x82\x08\x96\x08\xaa\x08\xbe\x08\xd2\x08\xe7\x08\xfb\
-\x09\x10\x09\x25\x09\x3a\x09\x4f\x09\x64\x09\x79\x09\x8f\x09\xa4\
-\x09\xba\x09\xcf\x09\xe5\x09\xfb\x0a\x11\x0a\x27\x0a\x3d\x0a\x54\
-\x0a\x6a\x0a\x81\x0a\x98\x0a\xae\x0a\xc5\x0a\xdc\x0a\xf3\x0b\x0b\
-\x0b\x22\x0b\x39\x0b\x51\x0b\x69\x0b\x80\x0b\x98\x0b\xb0\x0b\xc8\
-\x0b\xe1\x0b\xf9\x0c\x12\x0c\x2a\x0c\x43\x0c\x5c\x0c\x75\x0c\x8e\
-\x0c\xa7\x0c\xc0\x0c\xd9\x0c\xf3\x0d\x0d\x0d\x26\x0d\x40\x0d\x5a\
-\x0d\x74\x0d\x8e\x0d\xa9\x0d\xc3\x0d\xde\x0d\xf8\x0e\x13\x0e\x2e\
-\x0e\x49\x0e\x64\x0e\x7f\x0e\x9b\x0e\xb6\x0e\xd2\x0e\xee\x0f\x09\
-\x0f\x25\x0f\x41\x0f\x5e\x0f\x7a\x0f\x96\x0f\xb3\x0f\xcf\x0f\xec\
-\x10\x09\x10\x26\x10\x43\x10\x61\x10\x7e\x10\x9b\x10\xb9\x10\xd7\
-\x10\xf5\x11\x13\x11\x31\x11\x4f\x11\x6d\x11\x8c\x11\xaa\x11\xc9\
-\x11\xe8\x12\x07\x12\x26\x12\x45\x12\x64\x12\x84\x12\xa3\x12\xc3\
-\x12\xe3\x13\x03\x13\x23\x13\x43\x13\x63\x13\x83\x13\xa4\x13\xc5\
-\x13\xe5\x14\x06\x14\x27\x14\x49\x14\x6a\x14\x8b\x14\xad\x14\xce\
-\x14\xf0\x15\x12\x15\x34\x15\x56\x15\x78\x15\x9b\x15\xbd\x15\xe0\
-\x16\x03\x16\x26\x16\x49\x16\x6c\x16\x8f\x16\xb2\x16\xd6\x16\xfa\
-\x17\x1d\x17\x41\x17\x65\x17\x89\x17\xae\x17\xd2\x17\xf7\x18\x1b\
-\x18\x40\x18\x65\x18\x8a\x18\xaf\x18\xd5\x18\xfa\x19\x20\x19\x45\
-\x19\x6b\x19\x91\x19\xb7\x19\xdd\x1a\x04\x1a\x2a\x1a\x51\x1a\x77\
-\x1a\x9e\x1a\xc5\x1a\xec\x1b\x14\x1b\x3b\x1b\x63\x1b\x8a\x1b\xb2\
-\x1b\xda\x1c\x02\x1c\x2a\x1c\x52\x1c\x7b\x1c\xa3\x1c\xcc\x1c\xf5\
-\x1d\x1e\x1d\x47\x1d\x70\x1d\x99\x1d\xc3\x1d\xec\x1e\x16\x1e\x40\
-\x1e\x6a\x1e\x94\x1e\xbe\x1e\xe9\x1f\x13\x1f\x3e\x1f\x69\x1f\x94\
-\x1f\xbf\x1f\xea\x20\x15\x20\x41\x20\x6c\x20\x98\x20\xc4\x20\xf0\
-\x21\x1c\x21\x48\x21\x75\x21\xa1\x21\xce\x21\xfb\x22\x27\x22\x55\
-\x22\x82\x22\xaf\x22\xdd\x23\x0a\x23\x38\x23\x66\x23\x94\x23\xc2\
-\x23\xf0\x24\x1f\x24\x4d\x24\x7c\x24\xab\x24\xda\x25\x09\x25\x38\
-\x25\x68\x25\x97\x25\xc7\x25\xf7\x26\x27\x26\x57\x26\x87\x26\xb7\
-\x26\xe8\x27\x18\x27\x49\x27\x7a\x27\xab\x27\xdc\x28\x0d\x28\x3f\
-\x28\x71\x28\xa2\x28\xd4\x29\x06\x29\x38\x29\x6b\x29\x9d\x29\xd0\
-\x2a\x02\x2a\x35\x2a\x68\x2a\x9b\x2a\xcf\x2b\x02\x2b\x36\x2b\x69\
-\x2b\x9d\x2b\xd1\x2c\x05\x2c\x39\x2c\x6e\x2c\xa2\x2c\xd7\x2d\x0c\
-\x2d\x41\x2d\x76\x2d\xab\x2d\xe1\x2e\x16\x2e\x4c\x2e\x82\x2e\xb7\
-\x2e\xee\x2f\x24\x2f\x5a\x2f\x91\x2f\xc7\x2f\xfe\x30\x35\x30\x6c\
-\x30\xa4\x30\xdb\x31\x12\x31\x4a\x31\x82\x31\xba\x31\xf2\x32\x2a\
-\x32\x63\x32\x9b\x32\xd4\x33\x0d\x33\x46\x33\x7f\x33\xb8\x33\xf1\
-\x34\x2b\x34\x65\x34\x9e\x34\xd8\x35\x13\x35\x4d\x35\x87\x35\xc2\
-\x35\xfd\x36\x37\x36\x72\x36\xae\x36\xe9\x37\x24\x37\x60\x37\x9c\
-\x37\xd7\x38\x14\x38\x50\x38\x8c\x38\xc8\x39\x05\x39\x42\x39\x7f\
-\x39\xbc\x39\xf9\x3a\x36\x3a\x74\x3a\xb2\x3a\xef\x3b\x2d\x3b\x6b\
-\x3b\xaa\x3b\xe8\x3c\x27\x3c\x65\x3c\xa4\x3c\xe3\x3d\x22\x3d\x61\
-\x3d\xa1\x3d\xe0\x3e\x20\x3e\x60\x3e\xa0\x3e\xe0\x3f\x21\x3f\x61\
-\x3f\xa2\x3f\xe2\x40\x23\x40\x64\x40\xa6\x40\xe7\x41\x29\x41\x6a\
-\x41\xac\x41\xee\x42\x30\x42\x72\x42\xb5\x42\xf7\x43\x3a\x43\x7d\
-\x43\xc0\x44\x03\x44\x47\x44\x8a\x44\xce\x45\x12\x45\x55\x45\x9a\
-\x45\xde\x46\x22\x46\x67\x46\xab\x46\xf0\x47\x35\x47\x7b\x47\xc0\
-\x48\x05\x48\x4b\x48\x91\x48\xd7\x49\x1d\x49\x63\x49\xa9\x49\xf0\
-\x4a\x37\x4a\x7d\x4a\xc4\x4b\x0c\x4b\x53\x4b\x9a\x4b\xe2\x4c\x2a\
-\x4c\x72\x4c\xba\x4d\x02\x4d\x4a\x4d\x93\x4d\xdc\x4e\x25\x4e\x6e\
-\x4e\xb7\x4f\x00\x4f\x49\x4f\x93\x4f\xdd\x50\x27\x50\x71\x50\xbb\
-\x51\x06\x51\x50\x51\x9b\x51\xe6\x52\x31\x52\x7c\x52\xc7\x53\x13\
-\x53\x5f\x53\xaa\x53\xf6\x54\x42\x54\x8f\x54\xdb\x55\x28\x55\x75\
-\x55\xc2\x56\x0f\x56\x5c\x56\xa9\x56\xf7\x57\x44\x57\x92\x57\xe0\
-\x58\x2f\x58\x7d\x58\xcb\x59\x1a\x59\x69\x59\xb8\x5a\x07\x5a\x56\
-\x5a\xa6\x5a\xf5\x5b\x45\x5b\x95\x5b\xe5\x5c\x35\x5c\x86\x5c\xd6\
-\x5d\x27\x5d\x78\x5d\xc9\x5e\x1a\x5e\x6c\x5e\xbd\x5f\x0f\x5f\x61\
-\x5f\xb3\x60\x05\x60\x57\x60\xaa\x60\xfc\x61\x4f\x61\xa2\x61\xf5\
-\x62\x49\x62\x9c\x62\xf0\x63\x43\x63\x97\x63\xeb\x64\x40\x64\x94\
-\x64\xe9\x65\x3d\x65\x92\x65\xe7\x66\x3d\x66\x92\x66\xe8\x67\x3d\
-\x67\x93\x67\xe9\x68\x3f\x68\x96\x68\xec\x69\x43\x69\x9a\x69\xf1\
-\x6a\x48\x6a\x9f\x6a\xf7\x6b\x4f\x6b\xa7\x6b\xff\x6c\x57\x6c\xaf\
-\x6d\x08\x6d\x60\x6d\xb9\x6e\x12\x6e\x6b\x6e\xc4\x6f\x1e\x6f\x78\
-\x6f\xd1\x70\x2b\x70\x86\x70\xe0\x71\x3a\x71\x95\x71\xf0\x72\x4b\
-\x72\xa6\x73\x01\x73\x5d\x73\xb8\x74\x14\x74\x70\x74\xcc\x75\x28\
-\x75\x85\x75\xe1\x76\x3e\x76\x9b\x76\xf8\x77\x56\x77\xb3\x78\x11\
-\x78\x6e\x78\xcc\x79\x2a\x79\x89\x79\xe7\x7a\x46\x7a\xa5\x7b\x04\
-\x7b\x63\x7b\xc2\x7c\x21\x7c\x81\x7c\xe1\x7d\x41\x7d\xa1\x7e\x01\
-\x7e\x62\x7e\xc2\x7f\x23\x7f\x84\x7f\xe5\x80\x47\x80\xa8\x81\x0a\
-\x81\x6b\x81\xcd\x82\x30\x82\x92\x82\xf4\x83\x57\x83\xba\x84\x1d\
-\x84\x80\x84\xe3\x85\x47\x85\xab\x86\x0e\x86\x72\x86\xd7\x87\x3b\
-\x87\x9f\x88\x04\x88\x69\x88\xce\x89\x33\x89\x99\x89\xfe\x8a\x64\
-\x8a\xca\x8b\x30\x8b\x96\x8b\xfc\x8c\x63\x8c\xca\x8d\x31\x8d\x98\
-\x8d\xff\x8e\x66\x8e\xce\x8f\x36\x8f\x9e\x90\x06\x90\x6e\x90\xd6\
-\x91\x3f\x91\xa8\x92\x11\x92\x7a\x92\xe3\x93\x4d\x93\xb6\x94\x20\
-\x94\x8a\x94\xf4\x95\x5f\x95\xc9\x96\x34\x96\x9f\x97\x0a\x97\x75\
-\x97\xe0\x98\x4c\x98\xb8\x99\x24\x99\x90\x99\xfc\x9a\x68\x9a\xd5\
-\x9b\x42\x9b\xaf\x9c\x1c\x9c\x89\x9c\xf7\x9d\x64\x9d\xd2\x9e\x40\
-\x9e\xae\x9f\x1d\x9f\x8b\x9f\xfa\xa0\x69\xa0\xd8\xa1\x47\xa1\xb6\
-\xa2\x26\xa2\x96\xa3\x06\xa3\x76\xa3\xe6\xa4\x56\xa4\xc7\xa5\x38\
-\xa5\xa9\xa6\x1a\xa6\x8b\xa6\xfd\xa7\x6e\xa7\xe0\xa8\x52\xa8\xc4\
-\xa9\x37\xa9\xa9\xaa\x1c\xaa\x8f\xab\x02\xab\x75\xab\xe9\xac\x5c\
-\xac\xd0\xad\x44\xad\xb8\xae\x2d\xae\xa1\xaf\x16\xaf\x8b\xb0\x00\
-\xb0\x75\xb0\xea\xb1\x60\xb1\xd6\xb2\x4b\xb2\xc2\xb3\x38\xb3\xae\
-\xb4\x25\xb4\x9c\xb5\x13\xb5\x8a\xb6\x01\xb6\x79\xb6\xf0\xb7\x68\
-\xb7\xe0\xb8\x59\xb8\xd1\xb9\x4a\xb9\xc2\xba\x3b\xba\xb5\xbb\x2e\
-\xbb\xa7\xbc\x21\xbc\x9b\xbd\x15\xbd\x8f\xbe\x0a\xbe\x84\xbe\xff\
-\xbf\x7a\xbf\xf5\xc0\x70\xc0\xec\xc1\x67\xc1\xe3\xc2\x5f\xc2\xdb\
-\xc3\x58\xc3\xd4\xc4\x51\xc4\xce\xc5\x4b\xc5\xc8\xc6\x46\xc6\xc3\
-\xc7\x41\xc7\xbf\xc8\x3d\xc8\xbc\xc9\x3a\xc9\xb9\xca\x38\xca\xb7\
-\xcb\x36\xcb\xb6\xcc\x35\xcc\xb5\xcd\x35\xcd\xb5\xce\x36\xce\xb6\
-\xcf\x37\xcf\xb8\xd0\x39\xd0\xba\xd1\x3c\xd1\xbe\xd2\x3f\xd2\xc1\
-\xd3\x44\xd3\xc6\xd4\x49\xd4\xcb\xd5\x4e\xd5\xd1\xd6\x55\xd6\xd8\
-\xd7\x5c\xd7\xe0\xd8\x64\xd8\xe8\xd9\x6c\xd9\xf1\xda\x76\xda\xfb\
-\xdb\x80\xdc\x05\xdc\x8a\xdd\x10\xdd\x96\xde\x1c\xde\xa2\xdf\x29\
-\xdf\xaf\xe0\x36\xe0\xbd\xe1\x44\xe1\xcc\xe2\x53\xe2\xdb\xe3\x63\
-\xe3\xeb\xe4\x73\xe4\xfc\xe5\x84\xe6\x0d\xe6\x96\xe7\x1f\xe7\xa9\
-\xe8\x32\xe8\xbc\xe9\x46\xe9\xd0\xea\x5b\xea\xe5\xeb\x70\xeb\xfb\
-\xec\x86\xed\x11\xed\x9c\xee\x28\xee\xb4\xef\x40\xef\xcc\xf0\x58\
-\xf0\xe5\xf1\x72\xf1\xff\xf2\x8c\xf3\x19\xf3\xa7\xf4\x34\xf4\xc2\
-\xf5\x50\xf5\xde\xf6\x6d\xf6\xfb\xf7\x8a\xf8\x19\xf8\xa8\xf9\x38\
-\xf9\xc7\xfa\x57\xfa\xe7\xfb\x77\xfc\x07\xfc\x98\xfd\x29\xfd\xba\
-\xfe\x4b\xfe\xdc\xff\x6d\xff\xff\xff\xee\x00\x0e\x41\x64\x6f\x62\
-\x65\x00\x64\x40\x00\x00\x00\x01\xff\xdb\x00\x84\x00\x01\x01\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02\x02\
-\x02\x02\x02\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x01\x01\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x01\x02\x02\x03\x03\x03\
-\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\
-\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\
-\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\xff\xc0\
-\x00\x11\x08\x01\x2c\x00\xc8\x03\x01\x11\x00\x02\x11\x01\x03\x11\
-\x01\xff\xdd\x00\x04\x00\x19\xff\xc4\x01\xa2\x00\x00\x00\x06\x02\
-\x03\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x08\x06\x05\
-\x04\x09\x03\x0a\x02\x01\x00\x0b\x01\x00\x00\x06\x03\x01\x01\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x05\x04\x03\x07\x02\x08\
-\x01\x09\x00\x0a\x0b\x10\x00\x02\x01\x03\x04\x01\x03\x03\x02\x03\
-\x03\x03\x02\x06\x09\x75\x01\x02\x03\x04\x11\x05\x12\x06\x21\x07\
-\x13\x22\x00\x08\x31\x14\x41\x32\x23\x15\x09\x51\x42\x16\x61\x24\
-\x33\x17\x52\x71\x81\x18\x62\x91\x25\x43\xa1\xb1\xf0\x26\x34\x72\
-\x0a\x19\xc1\xd1\x35\x27\xe1\x53\x36\x82\xf1\x92\xa2\x44\x54\x73\
-\x45\x46\x37\x47\x63\x28\x55\x56\x57\x1a\xb2\xc2\xd2\xe2\xf2\x64\
-\x83\x74\x93\x84\x65\xa3\xb3\xc3\xd3\xe3\x29\x38\x66\xf3\x75\x2a\
-\x39\x3a\x48\x49\x4a\x58\x59\x5a\x67\x68\x69\x6a\x76\x77\x78\x79\
-\x7a\x85\x86\x87\x88\x89\x8a\x94\x95\x96\x97\x98\x99\x9a\xa4\xa5\
-\xa6\xa7\xa8\xa9\xaa\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc4\xc5\xc6\xc7\
-\xc8\xc9\xca\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe4\xe5\xe6\xe7\xe8\xe9\
-\xea\xf4\xf5\xf6\xf7\xf8\xf9\xfa\x11\x00\x02\x01\x03\x02\x04\x04\
-\x03\x05\x04\x04\x04\x06\x06\x05\x6d\x01\x02\x03\x11\x04\x21\x12\
-\x05\x31\x06\x00\x22\x13\x41\x51\x07\x32\x61\x14\x71\x08\x42\x81\
-\x23\x91\x15\x52\xa1\x62\x16\x33\x09\xb1\x24\xc1\xd1\x43\x72\xf0\
-\x17\xe1\x82\x34\x25\x92\x53\x18\x63\x44\xf1\xa2\xb2\x26\x35\x19\
-\x54\x36\x45\x64\x27\x0a\x73\x83\x93\x46\x74\xc2\xd2\xe2\xf2\x55\
-\x65\x75\x56\x37\x84\x85\xa3\xb3\xc3\xd3\xe3\xf3\x29\x1a\x94\xa4\
-\xb4\xc4\xd4\xe4\xf4\x95\xa5\xb5\xc5\xd5\xe5\xf5\x28\x47\x57\x66\
-\x38\x76\x86\x96\xa6\xb6\xc6\xd6\xe6\xf6\x67\x77\x87\x97\xa7\xb7\
-\xc7\xd7\xe7\xf7\x48\x58\x68\x78\x88\x98\xa8\xb8\xc8\xd8\xe8\xf8\
-\x39\x49\x59\x69\x79\x89\x99\xa9\xb9\xc9\xd9\xe9\xf9\x2a\x3a\x4a\
-\x5a\x6a\x7a\x8a\x9a\xaa\xba\xca\xda\xea\xfa\xff\xda\x00\x0c\x03\
-\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xf9\xff\x00\xfb\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd0\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\
-\xfd\xd7\xba\xf7\xbf\x75\xee\x8c\x67\xc4\x9e\x80\xff\x00\x66\x97\
-\xe4\x57\x57\xf4\x17\xf7\xb7\xfb\x8b\xfe\x92\x73\x19\x1c\x57\xf7\
-\xb3\xf8\x0f\xf7\x9f\xf8\x37\xd8\x6d\xfc\xbe\x77\xcf\xfc\x0b\xf8\
-\xce\xde\xfe\x23\xe5\xfe\x15\xe2\xd1\xf7\x90\x69\xf2\x6a\xb9\xd3\
-\xa4\xae\xdb\x2c\xbf\x78\xdf\x5b\xd9\x78\xba\x3c\x42\x46\xaa\x56\
-\x94\x04\xf0\xa8\xaf\x0f\x5e\xb6\x05\x48\x1d\x6c\x05\xff\x00\x40\
-\xd7\x7f\xe0\x68\x7f\xec\xba\x7f\xfa\x76\xf6\x35\xfe\xa1\xff\x00\
-\xd2\x57\xfe\xa9\x7f\xd7\x4e\xaf\xe1\xfc\xfa\xaf\x7f\x9e\x7f\xc9\
-\xd7\xb7\x7e\x14\x75\xd4\x9d\xc7\x8e\xec\x2c\x17\x71\xf5\x6e\x33\
-\x2b\x8f\xc5\x6e\x8c\xcd\x06\xdf\xa9\xd9\x9b\x83\x6a\x7f\x1a\xac\
-\xa3\xc5\xe0\xf2\x79\x5d\xbb\x57\x9a\xdc\x34\xb3\x62\x72\x39\xaa\
-\xc8\xe8\x8c\x94\xd5\xf3\xc9\x15\x44\xd0\x86\x8f\x44\x85\xd0\x93\
-\x79\xe5\x7b\x9d\xa6\x0f\xaa\x59\xc4\xb6\xe0\x80\x4d\x34\x91\x5c\
-\x02\x45\x4e\x09\xc6\x0f\x1a\x75\xa6\x42\x33\xe5\xd5\x3c\xfb\x0b\
-\xf5\x4e\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\
-\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\
-\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xad\x8d\x7a\x63\xfe\x13\xff\
-\x00\xfe\x97\xba\x2f\xa9\xfb\xa7\xfd\x9b\x4f\xee\xf7\xfa\x4f\xea\
-\x6d\x8b\xda\x3f\xdd\xaf\xf4\x0f\xfc\x5b\xf8\x1f\xf7\xd7\x67\xe2\
-\xb7\x67\xf0\x3f\xe3\x3f\xe9\x9b\x19\xfc\x4f\xf8\x67\xf1\x3f\xb7\
-\xfb\x9f\xb4\xa7\xf3\x68\xd7\xe2\x8e\xfa\x00\xea\xd3\x92\xfe\xaa\
-\xce\xda\xef\xf7\x96\x9f\x12\x35\x7a\x78\x75\xa6\xa5\x06\x95\xd6\
-\x2b\x4a\xd2\xb4\x1f\x67\x4e\x04\xa8\xad\x7a\xd7\x2b\xd8\x17\xa6\
-\xfa\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd1\
-\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xac\
-\x63\xf9\x49\xff\x00\xdb\xc5\x7e\x2f\xff\x00\xe1\xdf\xb8\x7f\xf7\
-\xdf\xee\xef\x67\xbc\xb5\xff\x00\x25\xcd\xbf\xfd\x31\xff\x00\x8e\
-\xb7\x5b\x5f\x88\x75\xb9\x47\xf3\x01\x3d\xd6\xbf\x1f\xe9\x5b\xe3\
-\xff\x00\xfa\x42\xff\x00\x48\xcb\xdc\x1d\x1e\x69\xbf\xd1\xa2\xe6\
-\xdb\x70\xff\x00\x00\x1d\xa3\xb6\x4e\xe8\xfb\xc5\xc1\x03\x33\x6d\
-\x7f\xe0\x5e\x7f\xe2\xc2\xa4\x1a\x03\x8f\xf2\xfd\xd7\xec\x6b\xf7\
-\x29\xef\x3f\x57\xf4\x43\xe8\xb5\xf8\xfe\x2c\x7f\x0d\x6b\x4d\x62\
-\xbc\x3c\xa9\x5d\x55\xc5\x2b\x5c\x74\xf3\x56\x82\x9d\x26\xbf\x9a\
-\x86\x4b\x05\x8b\xfe\x5f\x3f\x29\x67\xdc\x33\xd1\xc1\x45\x51\xd7\
-\x2d\x8d\xa4\x35\xa5\x04\x72\x67\x72\xb9\xcc\x36\x3b\x6d\xc1\x10\
-\x93\x86\xac\x9b\x3f\x53\x4c\xb0\x81\xea\xf2\x95\x23\x91\xed\xbe\
-\x62\x64\x5d\x97\x71\x2e\x45\x3c\x3a\x7e\x64\x80\x3f\x9d\x3a\xf3\
-\x7c\x27\xa2\xcd\xf1\xff\x00\xf9\x6c\x7c\x2e\xf8\x6b\xf1\x62\xbf\
-\xb3\x3b\xc3\xa6\xf6\x7f\x72\xee\xfd\x99\xd4\xb9\x7e\xd1\xee\x3d\
-\xd3\xbf\xf6\x8e\x23\xb1\xe7\xd5\xb7\xf6\xac\xfb\xbb\x74\xe2\x76\
-\x5e\xd5\xdd\x30\xcd\xb7\xb1\xd4\x58\x78\x68\x66\xa7\xa0\x58\xe0\
-\x82\xaa\xa4\x22\x9a\x89\x99\xdc\x90\x5f\x65\xb0\xed\x5b\x56\xdc\
-\xd3\xdd\xda\xa4\xb2\x24\x65\xdd\x99\x43\x70\x1a\x88\x50\x70\x00\
-\xe0\x3c\xcf\x99\xeb\x41\x40\x15\x23\xa6\xaf\x92\xbf\xcb\x2b\xe1\
-\x9f\xcb\xef\x8b\xf4\xfd\xb5\xd0\xbd\x51\xb4\xba\x67\x7b\x6e\x4e\
-\xaa\xa1\xed\x4e\xa2\xdc\xbb\x07\x6f\xe3\xba\xff\x00\x1f\x5d\x16\
-\x7f\x69\x63\xf7\x4e\xdf\xc2\x6f\x5d\xa1\xb6\x11\x76\xbd\x66\x3b\
-\x37\x46\x29\xe1\xa8\x91\x69\xa4\xab\xa1\x92\x47\x96\x9e\x6b\xb4\
-\xcb\x3d\x6f\xf9\x7f\x6a\xdc\xf6\xf1\x71\x67\x6c\xb1\x4a\xd1\xeb\
-\x42\xa0\x2f\x10\x08\x0c\xa3\x04\x1c\x57\x15\x1e\x47\x8d\x7c\x55\
-\x48\xa8\xe8\x96\xff\x00\x25\xdf\xe5\xa3\xd0\x5d\x97\xd1\xb4\x9f\
-\x29\x7b\xeb\x65\xe2\xbb\x53\x2d\xbc\x77\x1e\xe1\xc6\xf5\xf6\xd1\
-\xdd\x11\x1c\x86\xca\xc0\x6d\xfd\xa5\x97\x9f\x6f\x56\x65\x72\x3b\
-\x76\x40\xb4\x1b\x87\x37\x96\xdc\x38\xda\xd8\xd9\x2b\x96\xaa\x8e\
-\x1a\x58\x62\xd1\x10\x91\xe4\x6f\x65\x5c\xa9\xb0\x59\x4f\x66\x37\
-\x1b\xc8\x84\x8e\xec\x42\xa9\xca\x80\xa6\x95\x23\x81\x24\x83\xc6\
-\xa2\x94\xf9\xf5\x54\x50\x45\x4f\x56\x61\x85\xf8\x99\xfc\xb5\xfe\
-\x67\x6d\x3e\xe6\xda\xdb\x6f\xe3\x17\x5b\xed\x68\xba\xab\xb8\x3b\
-\x0f\xe3\xfe\xeb\xce\x6c\x8e\xb9\xda\xfd\x45\xbb\x31\x1d\x87\xd7\
-\x75\x18\x8f\xe3\x95\xdb\x77\x3b\xb0\xa1\xa0\xad\xaa\xa1\xa6\xa8\
-\xab\xa6\x96\x92\x4a\xad\x50\xd4\x46\x59\x26\xa6\x68\x65\x92\x39\
-\x0f\x93\x6d\xd8\x77\x58\xae\xa3\x8f\x6f\x8d\x44\x72\xb4\x6c\x55\
-\x42\x30\x65\xa5\x68\x56\x87\xd2\x95\xe3\xe6\x28\x7a\xb5\x14\xf9\
-\x75\x5b\xff\x00\xca\xd7\xe0\xc7\x51\x6c\x5f\x96\x5f\x3f\xfe\x3f\
-\xf7\x3f\x5c\xf5\x8f\x79\xd2\xf4\xd6\x47\xaa\xa8\x76\x76\x4f\xb2\
-\xfa\xff\x00\x69\xef\x56\x83\x09\xb8\x9b\x7b\x66\xb1\x79\x2a\x5a\
-\x6d\xcb\x86\xc8\xc1\x86\xca\xe6\x36\xe5\x46\x3c\xe4\x16\x98\x22\
-\x34\xf1\x69\xbb\xa4\x68\x7d\x91\x72\xf6\xcf\x6b\x0e\xe5\xbd\x59\
-\x5d\x41\x1c\xc2\x22\x9a\x4b\xaa\xb6\x0e\xa2\x0e\x41\xa1\x22\x95\
-\xa7\x55\x50\x35\x10\x7a\xb2\x11\xf1\xb3\xf9\x6d\x7f\xb3\xaf\x3f\
-\x4c\x49\xf1\x6f\xaa\xe5\xee\x19\xbe\x37\xe2\xfb\x32\x9b\x6f\x0e\
-\x9e\xd9\x10\xf4\xd6\x3f\x60\xe2\xbb\x0f\x3f\xb6\x25\xc8\xa6\xda\
-\x82\x86\x2d\xb9\x53\xd8\xd9\xac\xde\xe2\xd1\x53\x57\x3e\x32\x69\
-\x8e\x3b\x1f\x4a\x8b\x51\x19\x84\x23\x9e\xfd\x06\xc3\xfb\xd4\xda\
-\xfe\xee\x8f\xea\xbc\x00\xf4\xd0\xba\x02\x86\x22\xb4\xa5\x35\x12\
-\x72\x69\xc0\x0c\xe3\xab\x51\x6b\x4a\x67\xa4\x0e\xee\xf8\x45\xfc\
-\xb3\xba\x9f\xe6\x7f\x51\x52\x6e\x1e\x86\xc2\xd5\xf6\x17\xca\x1c\
-\x66\xfb\xc6\xf5\xe7\x5a\x0d\xb5\x8c\xca\xf4\x46\x1b\x27\xd4\xb8\
-\x0f\xef\x96\xf3\xdd\x35\x9b\x16\xb2\x54\xdb\xd8\x1a\xcc\xb6\x12\
-\xa6\x92\x8e\x9a\x9a\x2a\x39\xb1\xed\x2c\x44\xc5\x4b\x14\x92\x54\
-\x4e\x59\x97\x69\xd8\x2d\xb7\x5b\x60\xf6\x4b\xe3\xdc\x06\x0a\xb4\
-\x06\x30\x50\x6a\x63\xa7\x80\xa8\xa0\x18\xa7\xcb\x24\xf5\xea\x28\
-\x23\x1c\x7a\xad\x6f\xe7\xc7\xf0\xbb\xe3\xdf\x4b\xec\x1e\xa4\xef\
-\x3e\x9b\xeb\x9d\xb1\xd5\x59\xcc\xde\xfb\x6e\xb5\xdc\xd8\x0d\x83\
-\x88\xc7\x6d\x6d\x9d\x9a\xa0\xa9\xdb\x59\xcd\xc7\x8b\xca\xb6\xd5\
-\xc4\x52\x52\xe1\x71\xf9\x9c\x64\xd8\x19\x62\x35\x14\xb1\xc0\xd5\
-\x31\xd4\xda\x71\x29\x8e\x26\x8c\x87\x9c\x76\xab\x2b\x58\x2d\xaf\
-\x2d\x60\x58\xdc\xbe\x82\x14\x00\xa4\x50\x90\x68\x31\x51\x4e\x22\
-\x95\xae\x6b\x8e\xaa\xe0\x0a\x10\x3a\xab\x7f\xe5\x65\xf0\xf7\x69\
-\xfc\xd6\xf9\x53\x41\xd6\x9d\x81\x90\xc9\x52\x75\xf6\xd0\xd9\x99\
-\xbe\xd0\xde\xb4\x18\x79\xcd\x16\x53\x71\xe1\xb6\xfe\x5f\x6e\x60\
-\x69\xf6\xd5\x2e\x4d\x55\xe4\xc5\x43\x95\xce\xee\x9a\x31\x57\x3c\
-\x63\xce\x28\x56\x65\x81\xe1\x9d\xe3\x9e\x20\xef\x2e\xed\x71\x6e\
-\xdb\x88\xb7\x9d\x88\x81\x50\xbb\x01\xc4\x80\x40\xa5\x7c\xaa\x48\
-\xaf\x9d\x2b\x4a\x1c\x8a\xa8\xa9\xa7\x5b\x6a\x37\xc7\x9f\xe5\xc9\
-\xb1\x3b\x8f\xaf\x7e\x28\xb7\xc3\xfe\x94\x9b\x77\x6f\x8e\xb5\xde\
-\x7b\xfb\x6e\x65\x32\x5d\x2d\xd7\xbb\x96\x97\xf8\x0e\xce\xc9\xe2\
-\xb1\x79\x5a\x3c\xb6\xf4\xdc\x50\xe4\x37\xa4\xbb\x86\xa1\xf3\x7e\
-\x5a\x56\x61\x50\x3c\x34\xd2\x16\xa8\x89\xc4\x29\x24\x97\xf4\x3b\
-\x1c\x37\x50\x6d\xdf\xba\xe1\xf1\x5e\x36\x60\x4c\x6a\x70\xa4\x03\
-\x56\x3d\xd5\xce\x38\xf0\x39\xe1\xd3\xb4\x5a\xd2\x9d\x57\xdf\x74\
-\x7f\x2d\x0f\x8e\x1d\x31\xfc\xc5\xfe\x13\x6e\xad\x8f\xd7\x1b\x66\
-\x6e\x9f\xee\xfd\xd5\xda\xfb\x6f\xb0\x7a\x6b\x74\x63\x69\xb7\x7e\
-\xc0\x83\x72\xed\xde\xac\xdc\x7b\x8f\x0f\x5b\x8b\xdb\xfb\x9e\x1c\
-\xbd\x29\xc5\x65\xaf\x2c\xcf\x43\x29\x6a\x5a\x1a\xaa\x08\x9e\x95\
-\x11\x5c\x24\x44\x97\x7b\x05\x85\xae\xf9\xb4\xcb\x0d\xba\xfd\x2c\
-\xac\xe1\x90\x8a\xad\x42\x12\x08\x06\xb8\x3e\x9c\x01\x02\x9d\x54\
-\xa8\x0c\x3d\x3a\xb0\x1f\x92\x1f\x18\x7f\x97\x57\x5b\x62\x3a\xaa\
-\xbb\xb0\xfe\x26\xf4\xf5\x25\x06\xec\xef\x6e\xb2\xeb\x7d\xbd\x07\
-\x5d\x74\xef\x5d\x6d\xea\xbc\x8e\xf3\xec\x1c\x85\x5e\xd7\xdb\x14\
-\xbb\xa2\xab\x0f\x43\xb6\xeb\xea\xb6\x55\x35\x7e\x43\xef\x2b\xe9\
-\xd6\x79\x16\x4f\xb5\x42\xf0\x54\x2a\x98\x5c\xea\xfb\x6f\xd8\xe0\
-\x5b\x73\x3e\xdb\x10\x56\x99\x14\x69\x45\x15\x66\x34\x15\xa0\x07\
-\x4d\x4d\x4f\xd9\xc0\xf0\xea\xc4\x2f\x98\xe8\x9b\xff\x00\x38\x4f\
-\x80\xff\x00\x18\x31\x1f\x0c\x7b\x0b\xb8\xfa\xbf\xa4\xfa\xdf\xaa\
-\x7b\x07\xa9\x27\xda\x59\xac\x66\x4b\xac\xf6\x96\x07\x60\x53\x65\
-\xf0\xf9\x6d\xe7\x82\xdb\x39\xfc\x4e\x7f\x1b\xb6\x68\x31\xb8\xbc\
-\xbc\x5f\xc3\x73\xd2\x54\xc3\x24\xd0\xb5\x4c\x75\x14\xd1\xaa\x48\
-\xa8\xce\x8e\x57\xcc\xfb\x36\xde\xbb\x54\xf7\x56\xf6\x91\xc7\x3c\
-\x54\x20\xa2\x85\xa8\x2c\x01\x04\x00\x01\xc1\xaf\xda\x3a\xab\xa8\
-\xa5\x69\xd1\xb6\x6f\x80\x5f\xcb\xfb\xe3\x07\xc5\x9d\xcf\x2e\xfa\
-\xf8\xdd\xd7\x1b\xdb\x6d\x75\x5f\x58\x6e\x3d\xe5\xd8\x1b\xc3\x3f\
-\xb2\x30\x3b\xbf\xb5\x77\x0c\x5b\x63\x6e\xd4\x67\xf7\x56\x4a\x83\
-\x78\xe5\xd2\x1d\xc7\x4b\x96\xc8\x9c\x74\xcd\x47\x4d\x47\x5f\x41\
-\x49\x4c\xee\xb1\x53\x8a\x78\xb8\x06\x5f\xb9\x76\x5d\xbf\x6f\x90\
-\xcb\x61\x1b\xc7\x1c\x65\x99\x8a\x86\x73\x41\x52\x75\x1c\xd4\xd3\
-\x00\x10\x07\x01\x41\xd6\xf4\xa8\x1c\x3a\x39\x5d\x07\x27\x5f\xcd\
-\xf1\x93\xa5\xa6\xea\x7a\x7c\xb5\x27\x56\x4b\xd1\x3d\x73\x27\x5a\
-\x52\xe7\x99\xdb\x3b\x4d\xd7\xef\xd7\xf8\x66\xd9\xb4\xf9\xa6\x92\
-\x7a\x97\x6c\xb4\x3b\x74\xd3\x2d\x49\x69\x24\x26\x60\xd7\x66\xfa\
-\x93\x4b\x2f\x00\xd8\x5a\x1b\x60\x45\xb7\x82\xba\x2b\xc7\x4e\x91\
-\xa6\xbf\x3a\x52\xbd\x58\x70\xc7\x0e\xbe\x6b\x3e\xe0\x6e\x93\xf5\
-\xef\x7e\xeb\xdd\x7b\xdf\xba\xf7\x5e\xf7\xee\xbd\xd7\xff\xd2\xf9\
-\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xac\x63\
-\xf9\x49\xff\x00\xdb\xc5\x7e\x2f\xff\x00\xe1\xdf\xb8\x7f\xf7\xdf\
-\xee\xef\x67\xbc\xb5\xff\x00\x25\xcd\xbf\xfd\x31\xff\x00\x8e\xb7\
-\x5b\x5f\x88\x75\xba\x67\xcd\x8f\x90\x7b\x9f\xe3\x27\x49\xd3\xf6\
-\x96\xd3\xc4\x60\x73\xb9\x08\xfb\x3f\xa8\xb6\x8d\x6e\x37\x70\xc3\
-\x90\x96\x8e\x6c\x0e\xf8\xec\x3c\x06\xd6\xcf\xb5\x29\xc6\xe4\x71\
-\x93\xd3\xe5\xe2\xc4\xe4\xe5\x6a\x39\x9d\xe5\x86\x1a\x90\x8f\x24\
-\x33\x20\x31\xb4\xad\xba\xde\xc9\x61\x68\x2e\x23\x50\x5b\xc4\x45\
-\xa1\xaf\x06\x60\x0f\x02\x33\x43\x8f\x9f\x91\xe9\xe2\x69\xd1\x55\
-\xfe\x72\x3f\x1f\x76\xbf\x6f\xfc\x2a\xed\x8d\xe3\x93\xca\xee\x7c\
-\x6e\xe3\xea\x0c\x1c\x7d\x81\xb6\xfe\xc7\x74\x6e\x28\x76\xdd\x5c\
-\x98\x2a\xd8\x64\xc8\x63\xb3\x7b\x3a\x3c\x9a\xed\x6c\xa9\xc8\xe3\
-\x2a\x26\x48\xaa\xa5\xa4\x35\x94\xd3\x88\x9d\x25\x08\xaf\x1b\x97\
-\x73\x45\x94\x77\x5b\x4d\xcc\x8c\xcc\x1e\x25\xd4\x28\x4d\x31\xe4\
-\x56\xb4\x35\x1e\x74\xa8\xf5\xeb\x4e\x2a\x0f\x46\xfb\xe7\x1f\xfd\
-\x91\x4f\xcc\x0f\xfc\x55\xcf\x90\x1f\xfb\xe9\xb7\x6f\xb3\x3d\xdf\
-\xfe\x49\x3b\xa7\xfc\xf3\xc9\xff\x00\x1c\x6e\xb6\x78\x1f\xb3\xa8\
-\x3f\x0c\x7f\xec\x85\xbe\x28\x7f\xe2\xa6\xf4\x57\xfe\xf9\xfd\xad\
-\xee\xbb\x57\xfc\x92\x36\xdf\xf9\xe6\x8f\xfe\x38\x3a\xf0\xf8\x47\
-\xd9\xd1\x6a\xfe\x4b\x9f\xf6\xed\x1f\x8d\x9f\xf9\x58\xbf\xf7\xfe\
-\xf6\x9f\xb4\x1c\xa9\xff\x00\x24\x0b\x0f\xf6\xff\x00\xf5\x71\xfa\
-\xd2\x7c\x23\xaf\x7f\x2b\xef\xfb\xa8\x87\xfe\x35\x1f\xe5\xb7\xff\
-\x00\x33\xff\x00\x7e\xe5\xef\xf9\x6e\x7f\xd2\xc6\x6f\xf9\xf7\xaf\
-\x2f\xe2\xfb\x7a\x49\x7c\x49\xff\x00\xb7\xa7\x7f\x34\xff\x00\xfb\
-\x57\xfc\x4a\xff\x00\xdf\x4b\x27\xb6\xf6\xcf\xf9\x58\xb9\x8b\xec\
-\x87\xfe\x39\xd7\x87\xc6\xdd\x38\x7f\xdd\x6e\xff\x00\xf3\x1a\xbf\
-\xfc\xf1\x7e\xf7\xff\x00\x3b\x6f\xfd\x40\x7f\xd6\x5e\xbd\xf8\xff\
-\x00\x2e\xbd\xf2\xef\xfe\xde\x73\xfc\xa8\xff\x00\xf2\xf2\x3f\xf7\
-\xce\xe1\x7d\xfb\x73\xff\x00\x95\x83\x97\x3f\xe6\xff\x00\xfc\x70\
-\x75\xe3\xf1\x2f\x45\xab\xfe\x14\x51\xff\x00\x64\x7b\xd4\x9f\xf8\
-\xb2\xbb\x6f\xff\x00\x7d\x77\x6c\x7b\x41\xcf\x1f\xf2\x4b\xb6\xff\
-\x00\x9e\x81\xff\x00\x1c\x7e\xb5\x27\x01\xd5\x10\x7f\x29\x3d\xbb\
-\xf2\xb7\x79\x7c\x9d\xc9\xed\x1f\x89\x7d\xb3\x84\xe9\x4d\xd3\x95\
-\xeb\x8c\xc5\x5f\x60\xef\xfc\xde\xcd\xda\xbb\xe6\x1c\x57\x59\xe3\
-\x77\x16\xd6\x6c\x92\x52\x60\x37\x56\xdf\xcf\x53\xd6\xd7\xd4\xee\
-\x5a\x9c\x5a\x43\x14\x46\x8d\xa4\x90\xa8\x7a\x88\xe3\x0e\x7d\x83\
-\xb9\x69\x37\x29\x77\x06\x8b\x6d\xba\x10\xc8\x63\x25\x98\xa8\x6a\
-\x28\x23\xc8\x83\x9a\x91\xe9\xf6\xf5\x45\xad\x70\x7a\xdb\xab\x65\
-\x75\xee\xc2\xeb\x4e\xfd\xea\x25\xee\xbe\xe8\xdd\xdd\xfd\xf2\xd3\
-\x70\x75\xff\x00\x62\xe2\x36\x0e\xec\xdc\xfb\x7f\x64\xec\xf3\x88\
-\xeb\xaa\x17\xc1\xe5\xb7\xea\xe2\x76\x7f\x57\x6d\x8d\x9d\xb5\x31\
-\x98\x29\x72\x70\x50\x2a\xcf\x94\x5c\xb6\x5c\xd4\x54\x34\x70\x54\
-\x8a\x73\x2a\x47\x26\xc5\x04\x30\x5e\x5b\x7d\x5d\xd3\x4d\xb9\x14\
-\x60\xa4\x85\x5a\x2e\x0b\x51\x50\x28\x02\xb4\xe3\x56\xa9\xc1\xa7\
-\x4e\xf9\x8a\x9c\xf4\xd5\xf2\xdb\xfe\xca\x7b\xf9\x70\xff\x00\xe2\
-\xc0\x76\x87\xff\x00\x03\xa7\x67\x7b\xae\xe5\xfe\xe7\xec\x5f\xf3\
-\x5d\xff\x00\xea\xd3\xf5\xe6\xe2\xbf\x6f\x49\x3f\xe6\x6f\xff\x00\
-\x1e\xbf\xc3\x6f\xfc\x68\x97\xc4\xaf\xfd\xea\xf2\xde\xda\xdf\xff\
-\x00\xb3\xda\xff\x00\xe7\xba\x1f\xf8\xf7\x5a\x6f\x2f\xb7\xa9\xff\
-\x00\xcd\xd7\xfe\xdd\xcd\xf2\x7b\xff\x00\x0d\x8d\xa5\xff\x00\xbf\
-\x2b\x65\x7b\xb7\x32\xff\x00\xc9\x0f\x70\xff\x00\x4a\x3f\xe3\xcb\
-\xd6\xdf\xe1\x3d\x0d\xdf\x3d\x3f\xec\x88\x7e\x5e\x7f\xe2\xb5\x77\
-\x67\xfe\xfb\xad\xc5\xed\x56\xf3\xff\x00\x24\x9d\xcf\xfe\x79\xe4\
-\xff\x00\x8e\x9e\xbc\xdf\x09\xeb\xdf\x0c\x7f\xec\x85\xbe\x28\x7f\
-\xe2\xa6\xf4\x57\xfe\xf9\xfd\xad\xef\xdb\x57\xfc\x92\x36\xdf\xf9\
-\xe6\x8f\xfe\x38\x3a\xf0\xf8\x47\xd9\xd7\xce\x57\xdc\x19\xd3\x1d\
-\x7b\xdf\xba\xf7\x5e\xf7\xee\xbd\xd7\xbd\xfb\xaf\x75\xff\xd3\xf9\
-\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xac\x63\
-\xf9\x49\xff\x00\xdb\xc5\x7e\x2f\xff\x00\xe1\xdf\xb8\x7f\xf7\xdf\
-\xee\xef\x67\xbc\xb5\xff\x00\x25\xcd\xbf\xfd\x31\xff\x00\x8e\xb7\
-\x5b\x5f\x88\x75\xb6\x87\xf3\x6c\xff\x00\xb2\x41\x93\xff\x00\x13\
-\x8f\xc7\x6f\xfd\xfc\x7b\x47\xdc\x95\xcc\x9f\xf2\x4c\xff\x00\x9b\
-\xd1\x7f\xd5\xc5\xe9\xd6\xe0\x3e\xde\x84\xff\x00\xe6\x61\xff\x00\
-\x64\x0d\xf2\xbb\xff\x00\x10\xee\xe6\xff\x00\xa1\x21\xf6\xa3\x7e\
-\xff\x00\x92\x36\xe5\xff\x00\x34\x9b\xad\xb7\xc2\x7a\x83\xd6\x3d\
-\xd5\xd2\xff\x00\xcc\x5f\xe2\x16\xe6\xdb\xdb\x13\xb1\xf1\x94\xd5\
-\x7d\xcb\xd2\x7b\xb3\xaf\x37\xb6\x2a\x9e\xaf\x1d\x90\xdf\x1d\x6d\
-\x99\xde\x3b\x2e\x7d\xab\xb9\xa2\xcd\xed\x77\xad\x8a\xaf\xef\xb6\
-\xed\x5e\x77\x5a\x33\x94\xa6\xad\x43\x14\x91\x4a\xd0\xcd\x1c\x86\
-\xb0\x5d\x5a\xef\x9b\x64\x89\x0c\xe3\xf5\x62\x2a\xc3\x05\x94\xb2\
-\xd0\xd4\x7a\x8a\xfd\x87\x1e\x47\xaf\x02\x18\x74\x92\xf9\x01\xf2\
-\x1b\xa3\x7f\x97\x3f\xc3\xac\x26\xc2\xdd\x3d\x83\x85\xca\x6e\x9e\
-\xba\xe8\xec\x27\x57\x75\x8e\xcb\x93\x23\x41\x4d\xbe\xbb\x17\x2d\
-\xb4\xb6\x46\x37\x67\xe0\xaa\x69\xb6\xcc\x75\x39\x0c\x8d\x1e\x32\
-\x59\xe2\xa6\x9f\x23\x5a\xc9\x2d\x26\x3e\x19\x6e\xee\xcc\xd1\xac\
-\x8d\xde\xde\xd9\xec\x7b\x62\x43\x24\xc0\xbc\x70\x84\x45\xaf\x73\
-\x15\x50\xa3\x19\x34\xe1\x53\xc0\x75\xe2\x42\x8a\x74\x4c\x3f\x91\
-\x57\xcb\x2e\xa0\xcf\x7c\x54\xdb\x7f\x1b\x32\x7b\xcb\x0b\xb7\xbb\
-\x5b\xaa\xf7\x0e\xef\x86\x9b\x6a\x6e\x0c\xad\x16\x32\xbf\x74\x6d\
-\xdd\xe9\xbc\xf2\x7b\xb7\x1b\x9a\xda\x91\x55\xd4\x46\x73\x10\x45\
-\x96\xdd\x32\xd0\xd4\x41\x06\xa9\xe9\xea\x11\x4c\x88\xa9\x51\x03\
-\x48\x55\xc9\xfb\x95\xab\xed\xb1\xd8\x19\x42\xdc\xc6\xcd\xda\x4d\
-\x09\x0c\xc5\x81\x1e\xb9\x6a\x1f\x43\xf6\x8e\xaa\x84\x52\x9e\x7d\
-\x58\xef\x5d\x6c\x7e\x9f\xf8\x1f\xb4\xbe\x44\x6f\x7e\xc2\xee\x0c\
-\x0e\x0b\x6a\x77\x07\xc8\xce\xd7\xf9\x2b\x9f\xdc\x1b\xe6\xab\x19\
-\xb5\x28\x70\x59\x5e\xcf\x9f\x09\xe6\xda\x58\xd3\x51\x92\x9d\xb3\
-\x6f\x40\xd8\xb8\x29\xe9\x04\x2a\x2a\xeb\xa6\x95\x11\x20\x32\xba\
-\xab\x1e\x41\x0d\xae\xcf\x15\xf4\xb3\x5c\x85\x8e\x59\xde\x52\x5a\
-\x80\x02\xf4\xc0\xce\x78\x00\x3c\xcf\xa5\x7a\xb6\x16\xb9\xea\xb4\
-\xbf\x94\xd7\x7b\x61\x3e\x4c\x7c\xda\xfe\x65\x3d\xdf\xb6\x29\x6a\
-\xa9\x36\xce\xf8\xc9\x74\xc4\x9b\x69\x2b\x93\xc5\x5b\x3e\xdd\xc0\
-\x45\xbe\x76\xb6\x0b\x21\x59\x4e\x63\x8d\xa9\x2a\xb2\x98\xac\x1c\
-\x35\x32\x40\x41\x68\x1e\x53\x19\x67\x2a\x58\x90\xf2\xdd\xe2\x5f\
-\xee\xdb\xfd\xdc\x60\xf8\x6e\x63\xa5\x7d\x06\xa0\x0f\xe6\x05\x7a\
-\xaa\x9a\xb3\x1e\x8c\xdf\xfd\xd6\xef\xff\x00\x31\xab\xff\x00\xcf\
-\x17\xed\x7f\xfc\xed\xbf\xf5\x01\xff\x00\x59\x7a\xdf\xe3\xfc\xba\
-\xf7\xcb\xbf\xfb\x79\xcf\xf2\xa3\xff\x00\xcb\xc8\xff\x00\xdf\x3b\
-\x85\xf7\xed\xcf\xfe\x56\x0e\x5c\xff\x00\x9b\xff\x00\xf1\xc1\xd7\
-\x8f\xc4\xbd\x16\xaf\xf8\x51\x47\xfd\x91\xef\x52\x7f\xe2\xca\xed\
-\xbf\xfd\xf5\xdd\xb1\xed\x07\x3c\x7f\xc9\x2e\xdb\xfe\x7a\x07\xfc\
-\x71\xfa\xd4\x9c\x07\x55\x11\xfc\x87\x7b\x83\xaf\xfa\x9b\xe6\x76\
-\x7a\x9b\xb0\xf7\x26\xdf\xda\x54\x7d\x8f\xd3\x1b\x97\x62\xed\xbc\
-\xc6\xe1\xaa\xa1\xc5\xd2\xcd\xbb\x64\xde\x3b\x0b\x72\x63\x70\x83\
-\x33\x5f\x2c\x14\xf4\x47\x31\x8f\xdb\xd5\x69\x1c\x4c\xea\x2a\xaa\
-\xd2\x08\x94\x34\x86\x35\x21\x9e\x4d\xba\x86\xdb\x75\x71\x33\xaa\
-\x89\x22\x2a\x09\xc7\x76\xa5\x20\x54\xfa\x80\x7e\xd3\x4e\xaa\x86\
-\x87\xad\xab\xf7\xe7\x56\xec\x5a\xaf\x9a\x3d\x09\xdd\x19\x7e\xcd\
-\xa0\xc4\xef\x8c\x3f\x56\xf6\xaf\x5a\xed\x3e\xa8\x7a\x28\x27\xca\
-\xef\x08\x73\xcd\x8e\xdc\xd9\x3d\xd3\x4b\x58\x99\x68\xeb\x68\x71\
-\xfb\x63\x1d\x81\xa8\x8e\xa3\x55\x0c\xd4\xf2\xcb\x55\x0a\x99\xe1\
-\x93\x44\x73\xc8\xf3\x5b\xc4\x77\x4b\x3b\xa6\xb8\x02\x51\x1b\xa0\
-\x4f\x36\xad\x09\x3c\x78\x00\x33\x8a\x64\x64\x79\xb9\xe6\x0d\x7a\
-\x0f\x7e\x5b\x7f\xd9\x4f\x7f\x2e\x1f\xfc\x58\x0e\xd0\xff\x00\xe0\
-\x74\xec\xef\x6c\x6e\x5f\xee\x7e\xc5\xff\x00\x35\xdf\xfe\xad\x3f\
-\x5e\x6e\x2b\xf6\xf4\x93\xfe\x66\xff\x00\xf1\xeb\xfc\x36\xff\x00\
-\xc6\x89\x7c\x4a\xff\x00\xde\xaf\x2d\xed\xad\xff\x00\xfb\x3d\xaf\
-\xfe\x7b\xa1\xff\x00\x8f\x75\xa6\xf2\xfb\x7a\x9f\xfc\xdd\x7f\xed\
-\xdc\xdf\x27\xbf\xf0\xd8\xda\x5f\xfb\xf2\xb6\x57\xbb\x73\x2f\xfc\
-\x90\xf7\x0f\xf4\xa3\xfe\x3c\xbd\x6d\xfe\x13\xd0\xd5\xb9\x37\x87\
-\x4c\xfc\xc2\xf8\x77\xd8\x15\xfb\x77\xb5\xb6\xc5\x07\x56\x77\x4f\
-\x4e\xef\x0d\xa7\x90\xec\x7a\x7c\x9e\x2e\xa3\x1b\xb2\x53\x78\xed\
-\x5a\xcc\x16\x4e\x7c\xd0\xac\xc8\x63\xe9\x68\x32\xfb\x4a\xa7\x2b\
-\x6a\xba\x0a\xd9\xe9\x65\x8a\x78\x8c\x33\x18\x9a\xf6\x55\x24\x96\
-\xbb\x9e\xd9\x39\x4b\x95\x16\xd2\xc4\xcb\xaa\xa2\x8b\xa8\x50\xd7\
-\x3c\x45\x72\x0d\x33\x83\xd7\xb0\x47\x1c\x74\x20\xf4\x36\xdd\xda\
-\xbb\x43\xe3\x37\x4c\x6d\x3d\x8b\xba\x63\xdf\x3b\x23\x6b\xf4\x57\
-\x5d\x6d\xdd\x9d\xbd\xa1\x48\xa3\x8b\x78\xed\x5c\x26\xc0\xc3\xe3\
-\x76\xf6\xe9\x8a\x38\x1d\xe1\x48\xf7\x06\x22\x9a\x1a\xb5\x08\xc5\
-\x40\x9a\xc0\x91\xed\xfb\x38\xe3\x8a\xc2\xd6\x28\x64\xd7\x0a\xc2\
-\xa1\x5b\xf8\x80\x50\x01\xfc\xc6\x7a\xd8\xe1\xd7\xcd\x63\xdc\x0b\
-\xd2\x7e\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xff\
-\xd4\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\
-\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\
-\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\
-\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\
-\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\
-\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd5\
-\xd0\x73\x6b\xed\xac\xde\xf4\xdc\xdb\x77\x67\x6d\xaa\x2f\xe2\x5b\
-\x8f\x76\x67\x71\x1b\x6b\x6f\xe3\xbe\xe6\x92\x8f\xef\xf3\x79\xdc\
-\x85\x3e\x2f\x15\x45\xf7\x75\xf3\xd2\xd0\x52\xfd\xd5\x7d\x54\x71\
-\xf9\x27\x96\x38\x53\x56\xa7\x65\x50\x48\xbc\x71\xbc\xb2\x47\x14\
-\x62\xb2\x33\x00\x07\xa9\x26\x83\x8e\x38\xf5\xee\xac\xab\xfe\x19\
-\x73\xf9\x97\x7f\xde\x36\x7f\xec\x62\xe8\x2f\xfe\xda\x7e\xcf\xbf\
-\xaa\x9b\xff\x00\xfc\xa0\x7f\xc6\xe3\xff\x00\xa0\xfa\xb6\x86\xf4\
-\xe8\xb4\xfc\x81\xf8\x2f\xf2\xd3\xe2\xd6\x3e\x93\x33\xde\xdd\x23\
-\xba\xb6\x46\xdf\xac\xa9\x5a\x28\xb7\x3c\x55\x18\x2d\xd9\xb4\xe3\
-\xae\x91\x29\xe4\x82\x86\xb3\x75\xec\x9c\xbe\xe4\xdb\xb8\xfa\xea\
-\xb5\xa8\x02\x08\x6a\x2a\xa2\x96\x76\x49\x16\x35\x63\x14\xa1\x10\
-\x5e\xec\xfb\x9e\xdc\xa1\xef\x2d\x19\x10\xf9\xe1\x87\xed\x52\x40\
-\xf9\x54\xe7\xf2\x3d\x68\xa9\x1c\x47\x43\xe6\x43\xf9\x3f\x7f\x31\
-\x6c\x5e\xdc\xad\xdd\x95\xff\x00\x1e\x3c\x1b\x7f\x1d\x85\xa9\xdc\
-\x55\x99\x0f\xf4\xb5\xd1\x92\xf8\x70\xf4\x94\x2f\x92\xa8\xac\xfb\
-\x58\x7b\x36\x4a\xd9\x3c\x74\x51\x97\xf1\xa4\x6d\x29\xb5\x82\x96\
-\xe3\xda\xd6\xe5\x7d\xf5\x50\xc8\x6c\x7b\x00\xaf\xc7\x1f\x0e\x3f\
-\xc7\xd6\xf4\xb7\xa7\x4d\x3d\x7b\xfc\xa6\xbf\x98\x0f\x6a\x6c\x6d\
-\xa3\xd9\x5b\x0b\xa0\xbf\x8f\x6c\xad\xf7\xb7\xb1\x3b\xaf\x6a\xe6\
-\xbf\xd2\xa7\x4a\x62\xff\x00\x8a\xe0\x33\x94\x71\x64\x31\x75\xff\
-\x00\xc3\xb3\x3d\x8f\x8e\xcb\x50\xfd\xd5\x24\xea\xfe\x2a\x98\x21\
-\x99\x2f\x67\x45\x60\x47\xba\x41\xcb\x7b\xd5\xc4\x31\x4f\x0d\x95\
-\x62\x75\x04\x1d\x71\x8a\x83\x90\x68\x58\x1f\xdb\xd7\x82\xb1\xcd\
-\x3a\x41\xf4\x9f\xf2\xe7\xf9\x95\xf2\x2e\x83\x7a\x64\xfa\x6f\xa7\
-\x7f\xbe\x34\x3d\x7b\xbd\xf2\xdd\x71\xbc\x27\xff\x00\x48\x5d\x57\
-\xb7\xbf\x84\x6f\x3c\x1c\x34\x95\x19\x4c\x37\x8f\x74\xef\x8c\x1c\
-\xd9\x0f\xb5\x86\xba\x23\xf7\x14\xab\x3d\x23\xea\xb2\x4a\xc4\x10\
-\x1a\xb4\xd8\xb7\x5b\xe1\x2b\x5a\xda\xea\x08\xe5\x1b\xb9\x05\x18\
-\x71\x19\x61\x5e\x3c\x46\x3e\x7d\x68\x29\x3c\x07\x40\x67\x7d\x7c\
-\x7a\xee\x0f\x8c\x7d\x81\x37\x56\xf7\x8e\xd0\xfe\xe4\x6f\xba\x7c\
-\x4e\x33\x39\x36\x0b\xf8\xfe\xd7\xdc\xba\x31\x79\x84\x95\xf1\xd5\
-\x5f\xc4\xf6\x86\x6b\x3f\x87\x6f\xb8\x58\x58\xe8\x15\x06\x44\xb7\
-\xa9\x57\x8f\x68\xef\x6c\x6e\xb6\xf9\xbe\x9e\xf2\x2d\x13\x50\x1a\
-\x54\x1c\x1e\x19\x52\x47\xf3\xeb\xc4\x11\xc7\xa0\x5f\xda\x4e\xb5\
-\xd7\xbd\xfb\xaf\x75\xef\x7e\xeb\xdd\x7b\xdf\xba\xf7\x56\xf7\xf1\
-\x9f\xf9\x0a\xff\x00\x37\x1f\x97\xdd\x59\xb7\xbb\xaf\xa0\xfe\x18\
-\x6f\x2d\xcb\xd5\xfb\xbb\x1d\x49\x99\xda\x5b\xb7\x75\xef\xce\x9c\
-\xea\x3a\x5d\xd5\x84\xaf\x7a\xa4\xa0\xce\xed\xaa\x1e\xe2\xec\x6d\
-\x83\x96\xcf\xe0\xb2\x09\x48\xd2\xc1\x5b\x49\x4f\x35\x2c\xf0\x3c\
-\x53\x24\x8d\x14\xd0\xbb\xfb\xaf\x74\xeb\xd4\xff\x00\xf0\x9f\xef\
-\xe6\xe5\xde\x3b\xab\xbb\xb6\x4f\x56\xfc\x4b\xfe\xf4\x6e\x7f\x8e\
-\x5d\x96\x7a\x83\xb9\xb1\x9f\xe9\xe3\xe3\x36\x13\xfb\x9b\xd8\xa3\
-\x6d\xe0\xf7\x79\xdb\xbf\x7b\xb8\xbb\x9b\x11\x8f\xdc\x3f\xef\xdd\
-\xdc\x94\x55\x1f\x77\x8a\x96\xba\x87\xf7\xbc\x7e\x6f\x2a\x48\x8b\
-\xee\xbd\xd0\xbb\x96\xff\x00\x84\xc2\xff\x00\x3c\xec\x2e\x36\xb7\
-\x2d\x59\xf0\x57\x23\x35\x2e\x3e\x9e\x4a\xa9\xe2\xc4\xfc\x82\xf8\
-\xa5\x9f\xc9\x49\x1c\x42\xec\xb4\x58\x5c\x17\x7a\xe4\x73\x19\x3a\
-\x82\x3f\x4c\x34\xd0\x4b\x2b\x9e\x15\x4f\xbf\x75\xee\xa9\x53\xb6\
-\x3a\x9b\xb3\x7a\x27\xb1\xf7\x7f\x50\xf7\x26\xc4\xdd\x1d\x67\xd9\
-\xfb\x07\x31\x36\x07\x79\x6c\x5d\xe7\x88\xab\xc1\x6e\x4d\xbd\x95\
-\x85\x23\x9b\xed\xb2\x18\xda\xd8\xe3\x99\x12\xa2\x96\x78\xe7\x82\
-\x55\xd5\x0d\x4d\x34\xb1\xcd\x13\xbc\x52\x23\xb7\xba\xf7\x57\x43\
-\xb6\xbf\xe1\x32\x7f\xce\xff\x00\x77\xed\xcc\x06\xec\xdb\xdf\x09\
-\x1a\xbf\x01\xba\x30\x98\xad\xc5\x83\xae\x7f\x91\xff\x00\x12\x28\
-\x5a\xb3\x0f\x9b\xa1\x83\x25\x8c\xab\x6a\x2c\x8f\x7d\x52\x64\x28\
-\xda\xa2\x8a\xa5\x1c\xc5\x3c\x51\x4d\x19\x3a\x5d\x15\x81\x03\xdd\
-\x7b\xaa\xf9\xf9\x13\xfc\xb8\xfe\x67\x7c\x4f\xf9\x31\xb0\x7e\x1e\
-\x7c\x80\xe9\x89\x7a\xff\x00\xe4\x67\x68\x8d\x84\xdb\x0f\xaf\x24\
-\xdf\xbd\x5f\xb9\x53\x70\xa7\x67\xee\x6a\xad\x9d\xb1\xe4\x83\x78\
-\xec\xed\xed\xb8\x76\x15\x24\x59\xbd\xcd\x43\x35\x21\x6a\x9c\xa4\
-\x2b\x4a\xf1\xb3\x54\x18\x90\x6a\xf7\xee\xbd\xd5\x90\xff\x00\xd0\
-\x2e\x3f\xcf\x5f\xfe\xf0\x67\xff\x00\x66\x67\xe1\xe7\xff\x00\x74\
-\x17\xbf\x75\xee\x88\xbf\xcc\xaf\xe5\x29\xfc\xc6\x7f\x97\xee\x17\
-\x1d\xba\x7e\x5b\xfc\x53\xec\x1e\xaa\xd9\xb9\x3a\xe5\xc5\xc1\xbf\
-\x69\xab\x76\x8f\x63\x75\xdc\x19\x49\x63\xa2\x92\x93\x15\x94\xec\
-\x2e\xaa\xdc\x9b\xe3\x65\x61\x32\xb9\x11\x5c\xa2\x92\x9a\xb6\xbe\
-\x9e\x7a\xc7\x8e\x74\x81\x64\x6a\x7a\x81\x17\xba\xf7\x55\xd3\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\x34\x7f\x10\x3e\x17\
-\x7c\x96\xf9\xeb\xdc\x74\xfd\x03\xf1\x3b\xad\xbf\xd2\xb7\x6d\xd5\
-\xed\xcc\xee\xed\xa7\xda\x7f\xdf\x1d\x83\xb1\xbc\x9b\x7b\x6d\x25\
-\x33\xe6\xb2\x1f\xc7\xbb\x27\x75\x6c\xed\xb2\x9f\x64\x95\x71\x9f\
-\x13\x56\x89\xe4\xd5\xfb\x68\xd6\x36\xf7\x5e\xe8\xcb\x7c\xc4\xfe\
-\x4d\x1f\xcc\xd7\xe0\x2e\xc5\x5e\xd0\xf9\x5d\xf1\x37\x7a\x75\xa7\
-\x5b\x0a\xcc\x46\x3e\xaf\x7f\x63\x37\x37\x5b\xf6\x86\xcd\xc3\xd6\
-\xe7\xaa\xea\xb1\xf8\x6a\x5d\xc7\xb9\x7a\x8b\x7a\xef\xcc\x3e\xd8\
-\x9b\x25\x90\xa4\xfb\x78\x86\x46\x6a\x5d\x73\xcd\x04\x7f\xae\xa6\
-\x9d\x65\xf7\x5e\xea\xb1\xbd\xfb\xaf\x75\xff\xd6\xd1\xcf\xe2\xef\
-\xfd\x94\xc7\xc7\x6f\xfc\x4e\x9d\x47\xff\x00\xbd\xfe\xdf\xf6\xb3\
-\x6e\xff\x00\x92\x85\x8f\xfc\xd6\x4f\xf8\xf0\xeb\xc3\x8f\x5f\x42\
-\x4f\x96\x1d\xb1\xb8\xba\x27\xe3\x57\x78\x77\x26\xd1\xa2\xc2\xe4\
-\x77\x3f\x5a\x75\xb6\xe8\xde\x38\x2a\x0d\xc7\x4d\x5d\x57\x81\xab\
-\xc9\xe1\x71\xd2\xd5\xd2\xc1\x96\xa5\xc6\x64\xb1\x19\x09\xe8\x24\
-\x91\x00\x91\x61\xaa\x82\x42\xbf\x47\x53\xcf\xb9\xb3\x72\xb9\x7b\
-\x3b\x0b\xbb\xa8\x80\x32\x47\x19\x61\x5e\x15\x03\xce\x84\x1a\x7e\
-\x63\xa7\xc9\xa0\x27\xa2\xc3\xf2\x77\x72\xe2\xfe\x44\x7f\x2a\x5e\
-\xd0\xec\xbd\xc5\x81\xa4\x86\x1e\xc8\xf8\x5f\x37\x74\x26\x12\x44\
-\x4a\x9a\x7c\x3e\x72\xaf\xab\x29\xbb\x3b\x06\xb0\x1a\x8f\xb8\xfd\
-\xcc\x0e\x7e\x3a\x79\x21\x92\xe5\xd5\xe0\x56\x0d\xa8\x06\xf6\x5f\
-\xb8\x48\xb7\xdc\xb9\x71\x70\xe9\x89\x2d\x35\xd3\xd0\xe8\xd6\x3f\
-\x61\xa7\x5e\x39\x52\x7e\x5d\x28\xb7\xbf\x44\xf6\x8c\x3d\x0d\xbb\
-\xeb\xa4\xf9\xa1\xf2\x5a\xae\x9a\x2e\xa2\xcf\xd5\x49\x87\xa8\xda\
-\xdf\x0e\xd7\x1d\x53\x02\x6c\xda\xb9\x9b\x1b\x3c\xb4\xbf\x13\xa9\
-\xb2\xeb\x45\x34\x63\xc4\xcd\x1d\x54\x75\x22\x32\x4a\xca\xaf\x67\
-\x0e\x4b\x67\x70\x2d\x24\x3f\xbd\x6e\x08\xf0\xce\x29\x05\x3e\x1e\
-\x1f\xd8\xd7\xf9\xd7\xaf\x50\xd3\x8f\x4b\xef\xe5\xf3\xff\x00\x64\
-\x33\xf1\x1f\xff\x00\x15\xeb\xaa\x7f\xf7\x8e\xc5\x7b\x7b\x65\xff\
-\x00\x92\x46\xd9\xff\x00\x34\x13\xfe\x3a\x3a\xf2\xfc\x23\xa2\x21\
-\xfc\x93\x7f\xe3\xc4\xf9\x9f\xff\x00\x8b\xbb\xda\xff\x00\xfb\xa6\
-\xda\xbe\xc9\xf9\x53\xfb\x1d\xdb\xfe\x7b\x1f\xfc\x0b\xd6\x93\xf1\
-\x7d\xbd\x12\xef\x9b\xdf\x01\xf7\xc7\xcf\x8f\xe6\xad\xbb\xb6\x76\
-\x13\x3f\x4b\xb2\x76\x1e\xc7\xe9\x6e\xa7\xce\xf6\x56\xfb\xaa\xa4\
-\x6c\x9c\xd8\x7c\x7e\x48\x66\xa9\x30\xf8\x7c\x16\x1d\x26\xa7\x19\
-\x4d\xcb\xb8\x26\xa4\xa8\xfb\x74\x9a\x6a\x7a\x68\xa9\xe9\x6a\x26\
-\x92\x42\xd1\xc7\x04\xe5\x5b\xbe\xcb\x36\xf3\xcc\x52\x44\x8e\x12\
-\x14\x85\x0b\xb7\x1a\x56\xb4\x00\x79\x93\x9a\x70\x14\x04\xfc\x8e\
-\x99\x75\x37\x43\x1c\x1f\xc8\x07\xe0\xe5\x7d\x66\x5b\x63\xe3\x7e\
-\x42\xf7\x7d\x4f\x67\x6d\xfc\x16\x17\x2b\x9f\xc4\x41\xbd\x7a\x86\
-\xb2\xb3\x0b\x06\x74\xd6\xc3\x88\xce\xe5\xb6\x3c\x1d\x70\xbb\x83\
-\x19\x82\xce\x54\xe2\xaa\xc5\x17\x9a\xb1\x04\xc6\x9e\x45\x49\xe4\
-\x31\x39\xf6\xa4\x72\x5e\xd0\x4b\x44\xb7\xb3\x78\xea\x01\x23\x52\
-\x62\xbc\x09\x5d\x15\x00\xd0\xd3\x3e\x5c\x71\xd7\xb4\x2f\xae\x7a\
-\xa9\x9a\x5f\xe5\x51\xfe\x8f\x7f\x99\x4f\x53\x7c\x2a\xee\x9d\xdf\
-\x9d\xcb\xf5\xaf\x6b\x62\xb7\x36\xe9\xdb\xbd\x91\xd7\xe9\x41\xb6\
-\xb3\xd9\xcd\xa9\x8c\xd9\x7b\xfb\x35\x8f\x96\x18\x37\x06\x37\x77\
-\xe2\x70\x59\xfa\x4d\xc5\xb3\x0d\x36\x42\x91\xd2\xbc\x24\x27\x5c\
-\x6f\xa6\x78\x65\x01\xb1\xcb\x9e\x06\xfd\x6d\xb4\xdd\x4a\xc6\xde\
-\x50\x48\x65\xa0\x24\x05\x63\xe6\x18\x03\x55\xa1\x19\xc7\xda\x3a\
-\xae\x9a\x30\x07\x87\x56\xa7\xd8\xff\x00\xf0\x9d\xdf\x8f\xed\x1e\
-\xcc\xa5\xea\x8e\xd5\xee\xea\x2a\x9a\xdd\xef\x8d\x87\x7b\xe5\xb7\
-\xce\x73\xaf\xf7\x05\x16\x27\xaf\xa1\xc4\xe7\x2b\xf3\x53\xe1\x70\
-\xf8\x4e\xba\xda\x35\x55\x7b\x97\x21\x92\xa3\xa2\xa0\xa4\x79\x2b\
-\x0d\x3d\x31\xac\x6a\x89\x61\x99\x62\x31\x30\x8a\x7e\x47\xb2\xfd\
-\x21\x6f\x73\x30\x25\xc6\xa2\xc5\x4d\x16\x86\xb4\x01\x57\x24\xd0\
-\x0c\xd0\x56\xb4\x34\xa7\x56\xf0\xc7\x91\xeb\x59\x3f\x95\x5d\x55\
-\xb7\xba\x37\xe4\x9f\x78\xf4\xee\xd3\xac\xcc\xe4\x76\xcf\x59\xf6\
-\x76\xef\xd9\x78\x1a\xed\xc5\x51\x43\x57\x9d\xab\xc5\xe0\x33\x15\
-\x38\xfa\x3a\x8c\xbd\x56\x37\x1d\x88\xc7\xcf\x90\x96\x18\x41\x95\
-\xe1\xa5\xa7\x8d\x9a\xe5\x51\x47\x1e\xc0\x1b\x95\xb2\x59\xdf\xdd\
-\xda\xc4\x49\x8e\x39\x0a\x8a\xf1\xa0\x3e\x74\x00\x7f\x21\xd3\x64\
-\x50\x91\xd7\xd8\x3b\xe6\xe6\xf4\xde\x5f\x1d\x3f\x92\x57\x7d\xef\
-\x2e\xa7\xcf\x56\xec\x0d\xf3\xd5\x1f\xcb\xdf\x2d\x26\xc3\xdc\xbb\
-\x42\xaa\x4c\x4e\x4b\x66\xe6\xf0\x5d\x2d\x06\x3f\x0b\x99\xda\xf5\
-\xd0\x24\x53\xe2\xeb\xb0\x32\xa2\x4d\x45\x34\x62\x39\x20\x92\x24\
-\x64\xd2\xca\x08\x45\xd6\xba\xa5\x9f\xf8\x46\xb7\x62\xf6\x0f\x6d\
-\x7c\x42\xf9\xab\xd8\xfd\xab\xbe\xb7\x97\x66\x76\x1e\xed\xf9\x8d\
-\xfc\x53\x75\xef\xce\xc1\xdc\xf9\xbd\xe7\xbc\xf7\x36\x4c\xf4\xb7\
-\x59\xd3\x9c\x8e\xe1\xdd\x1b\x8e\xbb\x25\x9c\xcd\x57\x1a\x78\x11\
-\x3c\xd5\x33\xc9\x26\x84\x55\xbd\x80\x1e\xfd\xd7\xba\xbf\x3d\x8f\
-\xf3\x27\xb0\x77\x1f\xf3\x55\xef\xaf\x81\xf9\x1d\xb7\xb3\x53\xac\
-\xfa\xd7\xe1\xcf\x4c\xfc\x8e\xda\xfb\xb2\x8a\x9f\x37\x06\xfa\x97\
-\x75\x6f\xae\xc9\xde\xdb\x27\x73\xe0\xf3\xd5\x13\xe6\xaa\xf0\x19\
-\x0d\xbf\xf6\x38\x7a\x19\xa8\x05\x3d\x05\x15\x4d\x2c\xa9\x3f\x96\
-\x5a\x95\x9a\x31\x4f\xee\xbd\xd6\x99\x1f\xf0\xb0\x1f\x8e\x3b\x6b\
-\xb0\xbf\x99\x67\xf2\xed\xa7\xdb\x34\x89\x8d\xec\x1f\x92\xdb\x03\
-\x13\xd2\xdb\x8f\x23\x46\xab\xe5\xc8\x25\x07\x73\xd1\xed\xfd\x99\
-\x91\x9e\x94\x7e\xdc\xf9\x3a\x53\xd9\x35\x50\x79\xdd\x4c\x92\xc1\
-\x4f\x04\x45\x8a\x41\x1a\xaf\xba\xf7\x5f\x40\x1d\xd3\xbe\x36\xbf\
-\x52\x49\xd3\x9b\x46\x78\xa1\xa2\xa1\xdf\xdb\xe3\x1f\xd4\x5b\x56\
-\x05\x9a\x0a\x74\xa6\xae\x87\x60\x6f\x3d\xd5\x8b\xa5\xa7\x8a\x46\
-\x8f\xee\x2d\x8f\xd8\x92\x44\x23\x8f\xd6\x10\x97\x00\x84\x23\xdf\
-\xba\xf7\x5a\x4d\x7f\xc2\x9f\x3a\xaa\x8b\x0f\xfc\xe2\x7f\x91\xff\
-\x00\x76\xc7\x48\x63\xaf\xec\x4e\xc5\xeb\xee\xae\xab\xad\xd1\x64\
-\xaa\xa6\xe9\xdf\x94\x3d\x69\xba\xa8\xa9\xf5\x69\x1a\xe4\xa3\x93\
-\xbc\x66\x63\xc9\x21\x66\x5f\xa7\xe7\xdd\x7b\xad\xbb\xbf\x98\x8f\
-\xc8\x8d\xeb\xf1\x23\xe0\xbf\xca\xff\x00\x93\x9d\x71\x8b\xda\xd9\
-\xbd\xfb\xd1\x5d\x19\xd8\x1d\x9b\xb4\x71\x1b\xde\x8b\x2d\x92\xda\
-\x39\x1c\xf6\xd4\xc1\xd4\xe4\xf1\xd4\x9b\x8e\x83\x03\x9b\xdb\x79\
-\x9a\xbc\x44\xd3\xc2\x04\xd1\xd3\x57\xd1\xcc\xc9\x70\xb2\xa1\xe7\
-\xdf\xba\xf7\x44\x2f\xe7\x9e\xfb\xc0\x7c\xd3\xff\x00\x84\xf3\x77\
-\xff\x00\x7b\x6f\x1d\xa3\x8f\xa6\xa4\xef\x1f\xe5\x75\x5d\xf2\x82\
-\x1d\xab\x3c\x51\x56\xd2\xed\xbd\xd5\x93\xf8\xf7\x47\xdf\x1b\x51\
-\x29\x4d\x59\xad\xfd\xfd\xa3\xbb\xa1\xa3\x96\x9e\x5d\x6d\x2c\x72\
-\xd2\xa3\xab\x87\x01\xfd\xfb\xaf\x75\xa8\xb7\xf2\x7b\xff\x00\x84\
-\xa3\x6d\xdf\x97\xbf\x17\xb6\x67\xcc\x8f\x9d\xfd\xeb\xbe\x3a\x63\
-\xac\xfb\x5b\x6d\x9d\xfd\xd6\x9d\x6b\xd3\xf3\xec\xfc\x56\xf3\xff\
-\x00\x45\x93\xd1\x55\x55\x61\xbb\x1b\x7f\x76\x1e\xfe\xdb\xdb\xbf\
-\x6a\xed\x7a\x6d\xcb\x47\x1a\x65\x28\xe8\x20\xc4\xd7\x69\xc2\x3c\
-\x33\xd4\x55\xc1\x3c\xf2\x52\xd2\x7b\xaf\x74\x76\x3e\x47\x7f\xc2\
-\x36\xfe\x2b\x6f\xef\x8e\x92\x76\xcf\xf2\xd6\xf9\x83\xd9\xdb\xef\
-\x76\xe5\x36\x6c\x5b\xe7\xab\x87\x6e\xee\xce\xa2\xed\x5e\xa2\xee\
-\xac\x75\x5e\x3d\xf2\x98\x4a\x4d\xb3\xd9\x5d\x47\xb1\xba\xee\x93\
-\x03\x41\xba\xe8\xe5\x89\xb1\xf9\xa4\x4c\xdd\x03\x16\x52\xc9\xe1\
-\x94\xcf\x0f\xba\xf7\x40\x8f\xf2\x6b\xff\x00\x84\xbc\xfc\x17\xfe\
-\x60\x9f\xcb\xbb\xa4\x3e\x56\x7c\x81\xec\xff\x00\x99\x1b\x13\xb7\
-\xbb\x07\x33\xdc\xb8\x7d\xe3\xb4\xba\xeb\x7a\xf4\xfe\xd8\xda\x98\
-\x4a\xbe\xb5\xee\xee\xc4\xeb\x1a\x2a\x3a\x3c\x0e\xf6\xf8\xff\x00\
-\xbd\x37\x3e\x36\xb8\x63\x36\x7c\x0d\x5d\x1d\x56\x46\x66\xfb\xd3\
-\x29\x55\x89\x0a\xc4\x9e\xeb\xdd\x17\x8f\xe6\x49\xfc\x92\xb2\xff\
-\x00\xc8\x97\xe2\xd6\xee\xf9\xf5\xf1\xc7\xe5\xc7\xc9\xfe\xbd\xef\
-\x49\x7e\x61\x7f\xa1\x8e\x94\x1b\x27\xb1\x31\x7b\x3e\xb7\x6f\x7c\
-\x6b\xdc\x0d\xd8\x8d\x87\x1d\x95\xbb\xb6\x16\xdc\xda\xd9\x7d\xf7\
-\xbd\xf7\xce\x3b\x61\xe3\xb2\x95\xb1\xd1\xff\x00\x04\xc1\x53\xd3\
-\xd6\xb5\x05\x46\x36\xad\xe2\x35\x07\xdd\x7b\xad\xcd\x3f\x9d\x9a\
-\x26\xe5\xfe\x48\xff\x00\x38\xea\x33\xa8\x99\x29\xaa\xfe\x25\xe4\
-\xb3\xb5\x0d\x3a\x28\x12\x65\xe8\xe8\xf0\x99\xca\x4a\xed\x11\x84\
-\x45\x9a\x9f\x2f\x4d\x1c\xe9\x60\x15\x5d\x07\x16\xe3\xdf\xba\xf7\
-\x5f\x19\x9f\x7e\xeb\xdd\x7f\xff\xd7\xd1\xcf\xe2\xef\xfd\x94\xc7\
-\xc7\x6f\xfc\x4e\x9d\x47\xff\x00\xbd\xfe\xdf\xf6\xb3\x6e\xff\x00\
-\x92\x85\x8f\xfc\xd6\x4f\xf8\xf0\xeb\xc3\x8f\x5f\x45\x9e\xea\xc0\
-\x75\x66\xe9\xea\x5e\xc3\xdb\x9d\xdf\x3e\x16\x97\xa8\x73\x5b\x4f\
-\x31\x8e\xec\x7a\x8d\xc7\xb9\x26\xd9\xd8\x18\x76\x8d\x4d\x2b\xc7\
-\x99\x93\x2d\xba\x69\xf2\xb8\x39\xf0\x14\x0b\x48\x5b\xc9\x54\x95\
-\x94\xcd\x12\xfa\x84\x8b\xf5\xf7\x38\xdd\xa5\xbc\x96\xd3\xc7\x76\
-\x47\xd2\x95\x21\xaa\x74\x8d\x3e\x75\x35\x14\x1f\x3a\x8e\x94\x1a\
-\x53\x3c\x3a\xa9\x8f\xe6\x09\xf3\xf7\xe1\x57\x5d\x7c\x2b\xed\x3e\
-\x97\xea\xbe\xe2\xeb\x3e\xc0\xce\xef\x3e\x9d\xcb\x74\xdf\x5d\x6c\
-\x6e\xa0\xdd\x38\x5e\xc0\x87\x15\x8e\xcf\x6d\xda\x8d\x97\x47\x26\
-\x43\x25\xb7\x32\x19\x4c\x46\x07\x0f\xb6\xb0\xa5\xa5\x7f\xbb\xaa\
-\x8e\x76\x8e\x14\x48\xd2\x49\x24\x8d\x58\x37\xbd\x6f\x5b\x4c\x1b\
-\x55\xcd\xad\xbd\xd4\x6e\xef\x11\x45\x54\x21\xa9\x51\xa7\x34\x24\
-\x00\x07\xa9\xea\xac\xc2\x84\x03\xd5\xa6\x6f\xff\x00\xfb\x27\x5d\
-\xeb\xff\x00\x88\x57\x72\x7f\xef\x0d\x59\xec\x47\x37\xfb\x85\x2f\
-\xfc\xd2\x3f\xf1\xde\xad\xe5\xd0\x4f\xfc\xbe\x7f\xec\x86\x7e\x23\
-\xff\x00\xe2\xbd\x75\x4f\xfe\xf1\xd8\xaf\x69\x76\x5f\xf9\x24\x6d\
-\x9f\xf3\x41\x3f\xe3\xa3\xad\x2f\xc2\x3a\x22\x1f\xc9\x37\xfe\x3c\
-\x4f\x99\xff\x00\xf8\xbb\xbd\xaf\xff\x00\xba\x6d\xab\xec\x9f\x95\
-\x3f\xb1\xdd\xbf\xe7\xb1\xff\x00\xc0\xbd\x69\x3f\x17\xdb\xd6\x2d\
-\xfb\xf2\x3f\xba\x3a\x73\xf9\x96\xf7\xd7\x5e\x74\x4f\xc5\x0c\xb7\
-\xc9\x5d\xd7\xda\x9d\x4f\xf1\xd2\xbf\x37\x5f\x4f\xd9\xd4\xbd\x67\
-\x82\xd8\x38\x3d\x95\x0f\x60\xd2\xd3\xd6\xee\x1c\xc6\x4f\x63\xee\
-\x9c\x45\x35\x15\x75\x4e\xf1\x94\xf9\x26\xa8\xa5\x77\x68\x44\x71\
-\x47\x3b\x90\xa3\xd3\xdf\x5d\xda\xef\xd7\x70\x59\xed\xa6\x79\x24\
-\x8a\x22\x4e\xbd\x01\x42\xea\xe2\x4a\x91\xf8\xbd\x47\xca\xbd\x78\
-\x92\x1b\x03\xa3\xbb\xd2\x1d\x29\xbd\xb1\xdf\x22\xfb\x2f\xe4\xd7\
-\x6b\x4f\xb3\xf6\x87\x61\xf7\x07\x55\xec\x1d\x92\xdd\x33\xb3\xb7\
-\x55\x6e\xfd\xc7\xed\x5c\x57\x5e\x64\xb2\xb3\x4f\x9c\x6d\xf5\x94\
-\xdb\x7b\x06\xaf\x72\x54\xe4\x1f\x3f\x4b\x1c\xf1\x45\x80\xa7\xa6\
-\xc7\x4c\x19\x12\xaa\xad\x65\x49\x3d\x9b\x5a\x5a\x4a\xb7\xb3\xdf\
-\xdc\x95\x59\xe5\x8d\x57\x42\x92\xc0\x05\x27\x3a\x88\x5a\xd6\xa3\
-\xf0\x80\x3d\x4f\x5b\x1c\x6a\x7a\x27\xbf\x2b\x22\x8c\x7f\x38\x1f\
-\xe5\x9d\x38\x40\x25\x93\x64\x7c\x88\x89\xe4\xfe\xd3\x47\x0f\x5d\
-\xef\x27\x89\x0f\xf8\x23\x4e\xe4\x7f\xc1\x8f\xb2\xbd\xc7\xfe\x56\
-\x6e\x5f\x3f\xd0\x97\xfe\x38\x7a\xd1\xf8\x97\xa3\x4f\xfc\xc8\x3e\
-\x60\x66\xbe\x11\xfc\x65\xcc\x77\x26\xd6\xdb\x18\x6d\xd9\xbb\xea\
-\xf7\x3e\x07\x64\x6d\x3c\x66\xe3\x97\x20\x9b\x7a\x0c\xe6\xe0\x8b\
-\x25\x56\x99\x3c\xdc\x38\xa9\x69\x32\x35\xf8\xfc\x75\x06\x22\x79\
-\x1a\x9a\x1a\x9a\x37\xa8\x60\xa8\x27\x8a\xfa\xbd\x98\xef\xbb\x9b\
-\xed\x3b\x7b\xdd\x47\x18\x69\x75\x05\x50\x6b\x4a\x9a\xe4\xd3\x34\
-\x14\xe1\x51\x5f\x51\xd6\xd8\xd0\x57\xad\x08\xfb\x9b\xb5\x77\x0f\
-\x79\x76\xc7\x62\x77\x16\xec\xa3\xc3\x63\xb7\x37\x66\x6e\xfc\xe6\
-\xf4\xcf\x50\xed\xda\x7a\xea\x4c\x15\x26\x53\x3f\x5d\x2e\x42\xb2\
-\x9f\x11\x4b\x92\xc8\xe5\xf2\x10\x63\xe2\x9a\x62\x22\x49\xaa\xaa\
-\x24\x55\xb0\x67\x63\xcf\xb8\x6a\xee\xe5\xef\x2e\x67\xba\x94\x01\
-\x24\x8c\x58\xd3\x85\x4f\xa5\x49\x3f\xcc\xf4\xc1\x35\x35\xeb\xec\
-\x3f\xfc\xd4\xff\x00\xed\xc5\xff\x00\x31\x7f\xf1\x40\x37\x77\xfe\
-\xfa\xb8\xbd\xa7\xeb\xdd\x52\x47\xfc\x22\x5b\xfe\xc8\x3f\xe5\xa7\
-\xfe\x2d\xc0\xff\x00\xdf\x37\xd7\x1e\xfd\xd7\xba\xd9\xaf\x68\x77\
-\x9f\xc6\xbc\xb7\xcf\xde\xee\xf8\xeb\xb7\xfa\xde\x0c\x2f\xcb\x4d\
-\xa5\xf1\xb7\xa7\xbb\x43\x7f\x76\xb3\xec\x2d\xa1\x49\x36\xf9\xe9\
-\xad\xcb\xbc\xb7\xfe\x03\x64\x6d\x54\xec\x4c\x76\x42\x4d\xf1\xb8\
-\x20\xd8\x5b\x9f\x1d\x5d\x34\x98\xac\x94\x34\xd4\x34\x47\x30\xb2\
-\x51\x3c\xaf\x35\x57\x87\xdd\x7b\xad\x3b\x7f\x99\x9f\xc6\x1f\x94\
-\x5b\xf3\xfe\x15\x0f\xfc\xad\x29\x7e\x4a\xf6\x6e\xd9\xec\xae\xb5\
-\xde\x3b\xaf\xac\x37\xe7\x42\x9e\xbf\xd9\xd5\xbb\x03\x11\xb5\xb6\
-\x3f\xc7\xdd\xf3\xb8\xbb\x7f\x76\xf5\xde\x63\x69\x65\x77\x3e\xfd\
-\x9a\x5c\xda\xee\x5c\x1b\xbe\x4b\x2f\xf7\xf2\xbe\x53\x19\x91\xa7\
-\xb3\x53\x18\x16\x0a\x5f\x75\xee\xaf\x73\xf9\xe2\x7c\x97\x5e\x84\
-\xef\xef\xe4\x83\x83\x35\x3e\x28\xb7\xcf\xf3\x52\xeb\x19\x72\x90\
-\xad\x4f\x85\xe4\xdb\xf2\x6c\xcd\xd3\xd3\x19\xba\xc9\x61\x36\x5a\
-\x8a\x2c\x4c\x1d\xfc\x95\x12\x02\x6c\xae\x88\x40\x2d\xa4\xaf\xba\
-\xf7\x40\xff\x00\xfc\x29\x5f\xaa\x6a\xb7\x36\x2b\xf9\x4b\x76\xdd\
-\x0d\x01\xab\x7e\xaa\xfe\x6c\x3f\x18\x70\x39\x5a\x94\x11\xea\xc5\
-\xed\xee\xcc\xcc\x4b\x0c\xf5\x92\x3b\xba\xb8\xa6\x97\x71\xed\x0c\
-\x55\x3b\x2a\x06\x26\x49\xe3\x24\x58\x12\x3d\xd7\xba\xbf\x5f\x94\
-\x9b\x3f\xe3\xf7\x60\x7c\x74\xee\x9d\x91\xf2\xb2\xaf\x6b\x50\x7c\
-\x6c\xdd\x3d\x75\xb9\xb0\x9d\xdf\x5b\xbd\xf7\xcd\x4f\x59\xed\x1a\
-\x5e\xb6\xaf\xc7\x4b\x06\xe8\x9b\x71\xf6\x05\x1e\xe0\xda\x95\x5b\
-\x3b\x11\x1e\x35\x9c\xcd\x90\x8f\x25\x42\xf4\xc9\x77\x13\x25\xaf\
-\xef\xdd\x7b\xad\x74\xbf\x9c\xaf\xf3\x8b\xfe\x56\x7d\x2d\xfc\xad\
-\x7e\x41\xfc\x60\xf8\xfd\xf2\x6b\xa2\x7b\x93\x77\x76\x87\xc6\x6d\
-\xc9\xf1\x8f\xa5\x3a\x9b\xe3\x57\x60\xed\x6e\xe4\xa7\xc0\x61\xb7\
-\x8e\xc9\xae\xea\xec\x64\xd9\x9c\xd6\xc8\xcd\x67\xf6\xe6\xd1\xdb\
-\x3b\x17\x6c\x33\xd4\x4a\x72\x55\xf0\xd5\x3c\x34\xd1\xc7\x04\x73\
-\xcd\x34\x29\x27\xba\xf7\x4c\x9f\xca\x2b\xe6\x47\xf3\x0b\xf9\xa5\
-\xfc\xbf\xba\x4b\xa0\x3a\xf3\xf9\x5a\xed\xfe\x97\xf8\xc5\x83\xf8\
-\xbd\xb2\x7e\x33\x60\x3e\x56\xf7\x97\xcc\xca\xdd\xb9\x43\xbb\xf6\
-\x9e\xd4\xeb\x0a\x5e\xa4\xac\xec\x7e\xbd\xea\x3c\x5f\xc5\x5c\xf6\
-\xf8\xde\xb2\x3d\x1e\x21\xeb\x69\x60\x33\xd2\x61\xab\xaa\x99\x69\
-\xbf\x8e\x22\xf9\x6a\xe2\xf7\x5e\xeb\x60\x4f\x80\x9f\x1c\x71\x3f\
-\x10\x7e\x19\x7c\x72\xf8\xbb\x86\xec\x2a\x6e\xd7\xa3\xe8\x5e\xb3\
-\xc2\xf5\x7c\xdd\x89\x47\x41\x0e\x22\x9b\x75\x65\xb6\x9b\x54\x62\
-\xf3\xd9\x18\xb0\xd0\x66\xb7\x1a\x61\x15\x73\x90\xd4\x45\xf6\x26\
-\xbe\xad\xe8\x8c\x7e\x07\x95\x9e\x36\x3e\xfd\xd7\xba\x27\xff\x00\
-\xc8\xc6\x9e\x1a\x4f\xe5\xf1\x89\xa5\xa7\x8d\x61\xa7\xa6\xf9\x59\
-\xfc\xc2\x69\xe0\x89\x38\x48\xa1\x87\xe7\xc7\xc9\x28\xe2\x8d\x47\
-\x36\x54\x45\x00\x7f\x80\xf7\xee\xbd\xd6\x90\x1f\xf0\xa7\x9f\xe7\
-\x61\xdb\xbf\x27\xfb\x9f\xbf\xbf\x96\x3e\x3f\xab\xfa\xc7\x6c\xfc\
-\x7a\xf8\xe9\xf2\x07\x17\x12\x6f\x49\x22\xdd\xd9\x2e\xe2\xdd\x3d\
-\x95\xd5\x34\x3b\x97\x6d\xe6\xb2\x52\x66\x5b\x71\xe3\x76\x66\x23\
-\x67\x56\x56\xee\x6a\xa8\xa2\xc6\xae\x06\xa6\xad\x7e\xd5\x26\xfe\
-\x22\xcb\x29\x89\x7d\xd7\xba\xdd\xb7\xf9\xcb\x7f\xdb\x90\x3e\x6d\
-\x7f\xe2\x9a\xe6\xff\x00\xf7\x9d\xc5\xfb\xf7\x5e\xeb\xe3\x2f\xef\
-\xdd\x7b\xaf\xff\xd0\xd1\xcf\xe2\xef\xfd\x94\xc7\xc7\x6f\xfc\x4e\
-\x9d\x47\xff\x00\xbd\xfe\xdf\xf6\xb3\x6e\xff\x00\x92\x85\x8f\xfc\
-\xd6\x4f\xf8\xf0\xeb\xc3\x8f\x5b\xea\xff\x00\x31\xaf\xfb\x21\x0f\
-\x96\x7f\xf8\x82\xf7\xff\x00\xfe\xe9\x2a\x3d\xcc\x9b\xe7\xfc\x91\
-\xf7\x2f\xf9\xa2\xdf\xe0\xe9\xf6\xf8\x4f\x5f\x3b\x6f\x70\x7f\x4c\
-\x75\xf4\xb2\xdf\xff\x00\xf6\x4e\xbb\xd7\xff\x00\x10\xae\xe4\xff\
-\x00\xde\x1a\xb3\xdc\xf9\x37\xfb\x85\x2f\xfc\xd2\x3f\xf1\xde\x94\
-\x79\x74\x13\xff\x00\x2f\x9f\xfb\x21\x9f\x88\xff\x00\xf8\xaf\x5d\
-\x53\xff\x00\xbc\x76\x2b\xda\x5d\x97\xfe\x49\x1b\x67\xfc\xd0\x4f\
-\xf8\xe8\xeb\x4b\xf0\x8e\x88\x87\xf2\x4d\xff\x00\x8f\x13\xe6\x7f\
-\xfe\x2e\xef\x6b\xff\x00\xee\x9b\x6a\xfb\x27\xe5\x4f\xec\x77\x6f\
-\xf9\xec\x7f\xf0\x2f\x5a\x4f\xc5\xf6\xf4\x70\x3a\x6e\x6c\x48\xfe\
-\x60\x3f\x37\x29\xcb\x5b\x39\x27\x52\xfc\x3e\x99\x56\x49\x29\xef\
-\x26\x26\x2a\x6e\xf2\x47\x6a\x38\xb4\x0a\xa1\xe1\xac\x99\x7e\xe5\
-\xb5\x18\xcf\x92\x01\x60\x45\xd8\xd2\xd4\xaf\xef\x9d\xd4\x7e\x3f\
-\x0a\x1f\xd9\xfa\x9f\xea\x3f\x97\x5b\xfc\x47\xa7\xbd\x97\xd5\x5d\
-\xa9\x8f\xf9\xed\xdd\xfd\xcb\x9e\xa6\x73\xd4\xdb\x8b\xa0\x3a\x9f\
-\x62\xec\x1c\x83\xe6\xf1\xb5\x28\xd9\xec\x26\xe4\xdd\x19\x5d\xd9\
-\x8c\xa6\xc0\xc7\x5e\xf9\x7c\x5f\xd9\xc9\x57\x0c\xf2\xcd\x2d\x2c\
-\x74\xf5\x06\xad\x3c\x72\xc8\xc9\x22\xc7\x68\xad\xee\x17\x78\xbb\
-\xba\x71\xfe\x2c\xd0\xa2\xa9\xa8\xe2\x0b\x16\x14\xad\x47\x97\x96\
-\x6b\xd7\xbf\x11\x3e\x5d\x13\xef\x95\xbf\xf6\xf7\xcf\xe5\x97\xff\
-\x00\x86\x67\xc8\xcf\xfd\xf7\x1b\xb7\xd9\x66\xe5\xff\x00\x2b\x37\
-\x2f\xff\x00\xa5\x97\xfe\x38\x7a\xd1\xf8\x97\xa4\x97\xfc\x28\x17\
-\xfe\xc8\x53\x0b\xff\x00\x89\xf7\xaf\xff\x00\xf7\x99\xdf\xfe\xda\
-\xe7\x4f\xf9\x23\xaf\xfc\xd6\x5f\xf0\x37\x5e\x7e\x1d\x69\x4f\xee\
-\x27\xe9\x9e\xbe\xd1\x7f\x37\x76\x5e\xf5\xf9\x15\xfc\x92\x7b\xeb\
-\x66\xf5\x26\x02\xb3\xb0\x37\xd7\x6b\xff\x00\x2f\x9c\xa4\x5b\x13\
-\x6c\xed\x2a\x79\x72\x99\x1d\xe3\x99\xcf\x74\xc5\x36\x43\x11\x88\
-\xda\xf4\x54\xe6\xa2\xa3\x29\x5f\x9c\x77\x58\xa8\x60\x8c\xbc\x95\
-\x12\xc9\x1a\x2d\xd9\x87\xbf\x75\xee\xa9\x6b\xfe\x11\xad\xd7\x5d\
-\x83\xd4\xbf\x10\xbe\x6a\xf5\xc7\x6a\xec\x5d\xe5\xd6\x7d\x87\xb4\
-\xbe\x63\x7f\x0b\xdd\x7b\x0f\xb0\x76\xc6\x6f\x66\x6f\x3d\xb3\x93\
-\x1d\x2d\xd6\x75\x07\x1d\xb8\x76\xbe\xe3\xa1\xc6\xe7\x30\xb5\xc2\
-\x9e\x74\x7f\x0d\x4c\x11\xc9\xa1\xd5\xad\x62\x0f\xbf\x75\xee\xac\
-\xe3\xaa\xbf\xee\x23\x5f\x96\xff\x00\xf8\xcb\x3f\x8d\xdf\xfb\xff\
-\x00\x7b\x07\xdf\xba\xf7\x4d\x1f\x27\x7a\xb2\x8b\xb0\xff\x00\xe1\
-\x43\x3f\xcb\x07\x74\xd6\x43\x24\xcf\xd2\x1f\x0b\x3e\x6d\x76\x9d\
-\x0e\x90\xc6\x28\xab\x72\x35\x9b\x27\xa7\x56\x6a\x85\x12\x22\x34\
-\x71\xd3\xf6\xd4\x9a\x35\x2b\x85\x9b\x43\x00\x18\x2b\x2f\xba\xf7\
-\x46\x4b\xf9\x90\xff\x00\x38\x7f\x8c\xdf\xca\xf7\x7f\xfc\x5d\xeb\
-\x8e\xfe\xd8\xdd\xeb\xbb\xf3\x9f\x2d\x77\x06\xe8\xdb\x7d\x71\x55\
-\xd3\xfb\x67\x60\x67\xf1\x58\x5a\xed\xa5\x9a\xeb\xac\x16\x46\x5d\
-\xed\x3e\xf4\xec\xee\xbf\xab\xc6\xd2\x4f\x57\xd9\xb4\x0d\x03\x50\
-\x41\x92\x76\x8e\x1a\x82\xca\x8c\xb1\xac\xbe\xeb\xdd\x2b\xbf\x9b\
-\x4f\x51\x54\x76\xff\x00\xc4\x6c\x7d\x1d\x00\x4f\xe2\xbd\x7f\xf2\
-\x8f\xe1\x3f\x6e\xd0\x19\x0d\x91\x69\xfa\xe7\xe5\xc7\x4c\xe7\xb7\
-\x21\x3f\xb9\x18\xd6\xdb\x36\x3c\x92\xa5\xf5\x7e\xe1\x5e\x09\xb7\
-\xbf\x75\xee\x9a\xbf\x9d\xaf\xfd\xba\x2f\xf9\x8c\x7f\xe2\xa3\xf7\
-\x37\xfe\xf2\x55\xde\xfd\xd7\xba\xf8\xa6\xfb\xf7\x5e\xeb\xed\x6f\
-\xfc\xbe\x68\xe5\xdc\xff\x00\xc9\x9b\xe1\x9e\x2b\xa6\xaa\xa4\xa7\
-\xca\xe5\xff\x00\x96\xdf\x44\x60\xf6\x05\x49\xc8\xd0\x53\xd7\x51\
-\x6e\x99\xbe\x36\x6d\xac\x56\x2c\x64\x32\xb4\x49\x4f\x41\x4d\x9b\
-\xa0\xdc\x96\x5a\xc9\xd5\x63\x58\xeb\x12\x46\x21\x48\x20\x7b\xaf\
-\x74\xba\xfe\x54\x9d\x23\xdb\x3f\x1b\xff\x00\x97\x2f\xc3\xee\x8e\
-\xef\x7c\x53\xe0\xbb\x97\xad\xfa\x63\x6f\x60\x3b\x37\x0b\x36\xe0\
-\xc2\xee\xba\x8c\x4e\xf2\x12\xd6\x56\xe7\x31\xd5\x7b\x97\x6e\xe5\
-\xb3\xd8\x2c\xed\x6d\x1d\x6d\x63\x47\x3d\x55\x25\x6d\x54\x13\x4a\
-\xac\xc9\x2b\x83\xa8\xfb\xaf\x74\x07\x7f\x23\x9f\xfb\x20\x0c\x7f\
-\xfe\x2d\x97\xf3\x0e\xff\x00\xe0\xfb\xf9\x27\xef\xdd\x7b\xaf\x98\
-\xd7\xf3\x44\xe8\x4e\xef\xf9\x25\xfc\xeb\x7f\x98\x67\x57\x7c\x7c\
-\xea\x2e\xc9\xee\xde\xc6\xc8\xfc\xb4\xef\x5a\xfa\x4d\x91\xd5\x7b\
-\x2f\x70\xef\xbd\xce\xd8\xca\x3d\xef\x58\x95\xf9\x79\x70\xfb\x6b\
-\x1f\x91\xad\xa5\xc2\xe3\x0d\x4c\x66\xaa\xb6\x54\x4a\x5a\x54\x60\
-\xd2\xc8\x8b\xcf\xbf\x75\xee\xbe\x99\x7f\xce\xcd\xd3\x6d\x7f\x24\
-\x7f\x9c\x74\xf9\xd7\x4c\x6c\xd4\x9f\x12\xf2\x58\x2a\x85\x9d\xd4\
-\x88\xf2\xf5\x94\x78\x4c\x1d\x25\x0e\xb8\xcb\xa3\x4d\x51\x97\xa9\
-\x8e\x04\xb1\x2a\xce\xe3\x9b\x73\xef\xdd\x7b\xaf\x8c\xcf\xbf\x75\
-\xee\xbf\xff\xd1\xd0\x73\x6b\xee\x5c\xde\xcb\xdc\xdb\x77\x78\xed\
-\xaa\xdf\xe1\xbb\x8f\x69\xe7\x71\x1b\x97\x6f\xe4\x7e\xda\x92\xb3\
-\xec\x33\x78\x2c\x85\x3e\x53\x15\x5b\xf6\x95\xf0\x55\x50\x55\x7d\
-\xad\x7d\x2c\x72\x78\xe7\x8a\x48\x5f\x4e\x97\x56\x52\x41\xbc\x72\
-\x3c\x52\x47\x2c\x66\x92\x2b\x02\x0f\xa1\x06\xa3\x8e\x38\xf5\xee\
-\x8f\xaf\x63\xff\x00\x36\x0f\x9f\xbd\xb5\xb0\xf7\x6f\x59\x76\x0f\
-\x7d\xff\x00\x78\x36\x46\xf9\xc1\x64\x36\xd6\xe9\xc2\x7f\xa2\xde\
-\x96\xc5\x7f\x14\xc2\x65\x20\x6a\x6a\xfa\x2f\xe2\x58\x4e\xb9\xc6\
-\xe5\xe8\xbc\xf0\xb9\x5f\x25\x35\x44\x33\x2f\xd5\x58\x1e\x7d\x9c\
-\xcf\xcc\x9b\xd5\xcc\x32\xdb\xcf\x7b\xaa\x17\x52\x08\xd1\x18\xa8\
-\x3c\x72\x14\x1f\xd8\x7a\xb1\x66\x38\x27\xaa\xed\xf6\x47\xd5\x7a\
-\xb2\xdc\x87\xf3\x81\xfe\x62\xd9\x4d\xb9\x5b\xb4\xeb\xfe\x43\xf9\
-\xf6\xfe\x47\x0b\x53\xb7\x6b\x31\xff\x00\xe8\x97\xa3\x22\xf3\x61\
-\xea\xe8\x5f\x1b\x51\x47\xf7\x50\xf5\x94\x75\xb1\xf9\x28\xa4\x29\
-\xe4\x49\x16\x51\x7b\x86\x0d\xcf\xb3\xf6\xe6\x8d\xf5\x90\xc6\x6f\
-\xbb\x08\xa7\xc1\x1f\x0e\x1f\xc1\xd5\xb5\x37\xaf\x4d\x3d\x7b\xfc\
-\xd9\x7f\x98\x0f\x55\xec\x6d\xa3\xd6\xbb\x0b\xbf\x7f\x80\xec\xad\
-\x89\xb7\xb1\x3b\x53\x6a\xe1\x7f\xd1\x5f\x4a\x65\x3f\x85\x60\x30\
-\x74\x71\x63\xf1\x74\x1f\xc4\x73\x3d\x71\x91\xcb\x57\x7d\xad\x24\
-\x0a\x9e\x5a\x99\xe6\x99\xed\x77\x76\x62\x4f\xba\x41\xcc\x9b\xd5\
-\xbc\x31\x41\x0d\xed\x22\x45\x00\x0d\x11\x9a\x01\x80\x2a\x54\x9f\
-\xdb\xd7\x83\x30\xc5\x7a\x41\xf4\x9f\xf3\x18\xf9\x95\xf1\xd2\x83\
-\x7a\x63\x3a\x6f\xb8\xbf\xb9\xd4\x3d\x85\xbd\xf2\xdd\x8f\xbc\x20\
-\xff\x00\x47\xbd\x57\xb8\x7f\x8b\xef\x3c\xe4\x34\x94\xf9\x4c\xcf\
-\x93\x74\xec\x7c\xe4\xd8\xff\x00\xba\x86\x86\x21\xf6\xf4\xad\x05\
-\x22\x69\xba\x44\xa4\x92\x5a\xb4\xdf\x77\x5b\x11\x2a\xda\xdd\x69\
-\x0e\xe5\xdb\xb5\x0d\x58\xf1\x39\x53\x4e\x1c\x06\x3e\x5d\x68\x31\
-\x1c\x0f\x50\x2a\x3f\x98\x4f\xcc\x8a\x8e\xf4\x6f\x92\x8b\xde\x59\
-\xea\x1e\xe7\x97\x01\x8e\xda\xb5\xbb\xb3\x0f\x82\xd9\xb8\x2a\x4c\
-\xb6\xdb\xc4\xbf\x96\x83\x05\x9e\xda\x18\x5d\xb7\x41\xb2\x37\x06\
-\x2e\x09\x80\x93\xc3\x5b\x8d\xa8\x47\x91\x55\xd8\x33\x2a\x91\x53\
-\xbe\x6e\xa6\xf3\xeb\xfe\xb0\x8b\xad\x21\x6a\x02\x8a\x81\xc0\x15\
-\x03\x49\x1f\x68\xeb\xda\x8d\x6b\x5c\xf4\x28\x2f\xf3\x6e\xfe\x61\
-\xeb\xbd\x1f\xb0\x0f\xc9\x0c\xb4\x9b\x9d\xb6\xf4\xbb\x5a\x39\x67\
-\xd8\x5d\x4f\x51\x86\xa5\xc2\xd4\x57\x51\x64\xaa\xa1\xc7\xed\x49\
-\xf6\x14\x9b\x4f\x1b\x5b\x5b\x59\x8d\xa7\x6a\x8a\xca\x7a\x28\xab\
-\x2a\x16\x08\xd2\x49\x59\x11\x54\x28\xfe\xb3\x6f\x9e\x2f\x8d\xf5\
-\xe7\xc4\xd3\x4f\x85\x29\x4e\x38\x1a\x68\x38\x0c\x81\x5e\xb7\xa9\
-\xbd\x7a\x42\x6e\xbf\xe6\x43\xf3\x43\x7b\xf6\xff\x00\x59\x77\xd6\
-\xe8\xee\x5f\xe2\x7d\xb1\xd3\x94\x5b\x8f\x1f\xd7\x1b\xaf\xfd\x1d\
-\xf5\x4d\x17\xf7\x72\x8f\x76\xe3\x6a\xf1\x1b\x82\x1f\xe0\x58\xed\
-\x8b\x49\xb6\xf2\xff\x00\xc4\x31\xf5\xd2\xc7\xaa\xbe\x8e\xa9\xa2\
-\xd7\xaa\x32\x8c\x03\x06\x64\xdf\xb7\x59\xae\x6d\xef\x24\xba\xad\
-\xcc\x40\xe9\x3a\x53\x1a\x85\x0e\x02\xd0\xd4\x7a\x83\xd6\xb5\x1a\
-\x83\x5c\xf5\x13\xe4\x0f\xf3\x12\xf9\x8d\xf2\x9b\x62\x43\xd6\x9d\
-\xef\xdc\x1f\xdf\xad\x93\x4f\x9f\xc7\xee\x88\x70\xbf\xe8\xff\x00\
-\xab\x76\xc6\x8c\xee\x2e\x9b\x21\x47\x41\x5d\xfc\x4b\x67\x6c\x8d\
-\xbd\x96\x6f\x05\x36\x52\x75\xf1\x19\xcc\x2d\xe4\xbb\x21\x2a\xa4\
-\x6a\xf7\x7c\xdd\x37\x18\x7e\x9e\xf2\xeb\x5c\x35\x06\x9a\x50\x64\
-\x70\xca\xa8\x3e\x7e\xbd\x78\xb1\x3c\x4f\x44\xa7\xd9\x4f\x5a\xea\
-\xde\xfe\x33\xff\x00\x3e\xaf\xe6\xe3\xf1\x07\xab\x36\xf7\x4a\x74\
-\x1f\xcc\xfd\xe5\xb6\xba\xbf\x68\xe3\xa9\x30\xdb\x4b\x69\x6e\xbd\
-\x87\xd3\x9d\xb9\x4b\xb5\x70\x94\x0f\x54\xf4\x18\x2d\xb5\x5d\xdc\
-\x5d\x73\xbf\xb2\xd8\x0c\x16\x3d\x2a\xda\x28\x28\xa9\x2a\x21\xa5\
-\x82\x04\x8a\x14\x8d\x62\x86\x14\x4f\x75\xee\x9d\x7a\x9f\xfe\x14\
-\x03\xfc\xdc\xba\x3b\x75\x77\x76\xf6\xea\xdf\x96\x9f\xdd\x7d\xcf\
-\xf2\x37\xb2\xcf\x6f\xf7\x36\x4f\xfd\x03\xfc\x66\xcd\xff\x00\x7c\
-\xbb\x14\xed\xbc\x1e\xd0\x3b\x8b\xec\xb7\x17\x4c\xe5\xf1\xfb\x7b\
-\xfd\xfb\xbb\x6e\x8a\x9f\xed\x31\x51\x50\xd0\xfe\xcf\x93\xc3\xe5\
-\x79\x1d\xbd\xd7\xba\x8d\x8a\xfe\x7e\xdf\xcd\xab\x09\xf2\x37\x77\
-\x7c\xb5\xc5\xfc\xb0\xfb\x5f\x90\x5b\xeb\xab\x36\xdf\x4a\xee\xae\
-\xc0\xff\x00\x41\x3f\x1a\x66\xfe\x2b\xd6\x5b\x43\x3f\x90\xdd\x1b\
-\x77\x6d\x7f\x75\x6a\x3a\x6e\x5d\x93\x43\xfc\x3f\x3b\x95\xa8\x9f\
-\xef\x29\xb1\xb0\xe4\x25\xf2\x68\x96\x77\x8d\x55\x07\xba\xf7\x4a\
-\x5a\xaf\xf8\x51\x27\xf3\x88\xad\xee\xac\x2f\xc8\x9a\xaf\x97\x54\
-\xb3\xf7\x36\xdd\xeb\x0d\xcb\xd3\x38\x4d\xf0\xff\x00\x1d\x3e\x29\
-\x1a\xcc\x6f\x5a\x6f\x0d\xd5\xb5\xb7\xb6\xe6\xda\xf4\xf8\xc1\xd1\
-\xa3\x02\x20\xcc\x6e\x7d\x93\x8a\xaa\x96\xa0\xd2\x9a\xcb\xd1\x22\
-\x2c\xa2\x32\xc8\xde\xeb\xdd\x16\x7f\x98\x1f\xcd\x8b\xe7\xff\x00\
-\xcf\x7d\xd5\xd2\x7b\xdb\xe5\x97\x7e\x7f\xa5\x7d\xcf\xf1\xd3\x2b\
-\x9b\xcd\xf4\xde\x4f\xfd\x16\x74\xae\xc5\xfe\xe7\x65\x37\x16\x47\
-\x68\xe5\xb3\x35\x5f\x65\xd6\xbd\x71\xb3\xb1\xfb\x87\xef\x32\x1b\
-\x13\x15\x26\x8c\xac\x55\xd1\xc7\xf6\xba\x51\x55\x65\x98\x49\xee\
-\xbd\xd1\xcd\xdc\xdf\xf0\xa6\x8f\xe7\x77\xbc\x70\x59\x2d\xb3\xb9\
-\x7e\x6b\x26\x53\x07\x97\x85\x69\xf2\x14\x32\x7c\x6b\xf8\x89\x4e\
-\xb3\xc4\x92\xc7\x3a\x01\x3d\x27\x41\xd3\xd5\x42\xf1\xcf\x0a\xba\
-\xbc\x6e\xae\xac\xa0\x82\x0f\xbf\x75\xee\x91\x5d\xdb\xff\x00\x0a\
-\x25\xfe\x71\x9f\x23\x3a\x8b\xb1\xba\x23\xb9\x7e\x60\xff\x00\x7c\
-\x7a\xa7\xb6\xb6\x8e\x67\x62\x76\x0e\xd5\xff\x00\x65\xfb\xe2\xde\
-\xde\xfe\xf0\x6d\x5d\xc3\x49\x25\x06\x63\x15\xfc\x73\x6a\xf4\x96\
-\x0f\x72\x62\xbe\xee\x96\x56\x4f\x3d\x15\x65\x35\x4c\x77\xba\x48\
-\xa7\x9f\x7e\xeb\xdd\x52\x9f\xbf\x75\xee\xad\x5f\xe2\xb7\xf3\xbd\
-\xfe\x6a\x3f\x0a\x3a\x91\x7a\x23\xe3\x5f\xcc\x1d\xed\xb1\x3a\x96\
-\x9c\xd5\x0c\x46\xca\xcb\xed\x2e\xad\xec\xcc\x7e\xd5\x8a\xba\x4a\
-\xc9\xea\xe9\x76\x3d\x57\x6b\x6c\x4d\xf1\x94\xd8\x74\x35\x15\x79\
-\x09\xaa\x1a\x9f\x0b\x3d\x04\x06\xaa\x46\x9f\x47\x9b\xd7\xef\xdd\
-\x7b\xa1\xb7\xad\xbf\xe1\x48\xdf\xce\xb3\xa9\x76\x6e\x2f\x61\x6c\
-\x9f\x9b\xf9\xb8\x36\xe6\x22\xa3\x35\x59\x4d\xfd\xe4\xe9\x4f\x8d\
-\x5b\xf7\x3f\x53\x5d\xb8\xb3\xb9\x3d\xcd\x9c\xc8\xe6\x77\x8e\xfd\
-\xe9\xad\xcd\xbc\x37\x0e\x4b\x29\x9e\xcc\x54\xd4\xcd\x53\x5f\x5f\
-\x53\x3b\x3c\xa4\x6b\xd2\x14\x0f\x75\xee\x93\x7d\x1b\xff\x00\x0a\
-\x15\xfe\x70\x1f\x1b\x7a\xfe\x3e\xad\xe9\x6f\x97\x7f\xdc\xcd\x89\
-\x16\xed\xec\x3d\xf3\x1e\x0b\xfd\x01\x7c\x60\xdc\x5a\x77\x4f\x6b\
-\x6f\xfd\xcb\xda\x1b\xfb\x29\xfc\x4f\x75\xf4\xae\x77\x30\x7f\x8f\
-\x6f\xad\xdf\x91\xae\xf0\x1a\x8f\xb6\xa5\xfb\x8f\x0d\x34\x70\xd3\
-\xc7\x14\x49\xee\xbd\xd1\x52\xea\xcf\xe6\x6f\xf3\x83\xa5\x3e\x5f\
-\xef\xef\x9e\xbd\x65\xdd\xbf\xdd\xaf\x96\x1d\x9f\x59\xbe\x2b\xf7\
-\xcf\x6b\x7f\xa3\x6e\xa2\xcc\xff\x00\x1c\xab\xec\x8a\xa8\xeb\x77\
-\xa4\xbf\xdc\x6d\xc1\xb0\x72\xbd\x6d\x8c\xfe\x33\x53\x12\xb6\x9a\
-\x3c\x3d\x3a\xd3\xda\xd0\x08\x85\xc7\xbf\x75\xee\x84\x8f\x98\xbf\
-\xce\x67\xf9\x9b\x7c\xfa\xd8\x51\xf5\x67\xca\xef\x96\x5b\xcb\xb2\
-\xba\xd4\x57\x62\xf2\x55\x7b\x07\x17\xb5\xfa\xd7\xab\xb6\x7e\x66\
-\xbb\x07\x55\x51\x5f\x87\xa9\xdc\x9b\x7b\xa8\xb6\x4e\xc2\xc5\x6e\
-\x99\x31\x95\xf5\x1f\x71\x0f\xf1\x18\xaa\x84\x75\x11\x43\x28\xb3\
-\xd3\xc0\xd1\xfb\xaf\x75\x58\x9e\xfd\xd7\xba\xff\xd2\xf9\xff\x00\
-\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\
-\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\
-\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\
-\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd3\xf9\xff\x00\xfb\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\
-\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\
-\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd4\xf9\xff\x00\xfb\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\
-\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd5\xf9\xff\x00\xfb\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd6\xf9\xff\x00\xfb\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd7\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\
-\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xff\xd0\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\
-\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\
-\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xff\xd1\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\
-\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\
-\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xff\xd2\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\
-\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\
-\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\
-\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xff\xd3\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\
-\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\
-\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\
-\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\
-\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xff\xd4\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\
-\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\
-\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\
-\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\
-\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\
-\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\
-\xff\xd5\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\
-\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\
-\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\
-\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\
-\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\
-\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\
-\xd6\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\
-\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\
-\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\
-\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\
-\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\
-\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd7\
-\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\
-\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\
-\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\
-\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\
-\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\
-\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\
-\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd0\xf9\
-\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\
-\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\
-\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\
-\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\
-\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\
-\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd1\xf9\xff\
-\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\
-\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\
-\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\
-\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\
-\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd2\xf9\xff\x00\
-\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\
-\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\
-\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\
-\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd3\xf9\xff\x00\xfb\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\
-\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\
-\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd4\xf9\xff\x00\xfb\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\
-\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd5\xf9\xff\x00\xfb\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\
-\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd6\xf9\xff\x00\xfb\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\
-\x7b\xaf\x7b\xf7\x5e\xeb\xff\xd7\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\
-\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\
-\xaf\x7b\xf7\x5e\xeb\xff\xd0\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\
-\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\
-\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\
-\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\
-\x7b\xf7\x5e\xeb\xff\xd1\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\x97\xfd\x57\xd6\x9b\xab\xb9\x3b\x1b\x66\x75\
-\x6e\xc8\xa6\x82\xaf\x75\x6f\xac\xfd\x06\xdd\xc3\x47\x57\x39\xa6\
-\xa2\x8a\xa6\xba\x50\xaf\x59\x90\xa9\x58\xe6\x7a\x7c\x76\x3e\x9c\
-\x3c\xf5\x12\x2a\x3b\x24\x11\xb1\x0a\xc4\x05\x3a\x24\x00\x49\xe1\
-\xd5\xe3\x46\x91\xd6\x35\xf8\x89\xe8\xf5\xee\x8f\x82\xdd\x2d\x4d\
-\x9c\xc3\xed\x0e\xbb\xf9\xb7\xd6\x9d\x89\xbe\x69\xbb\x6f\xaf\xfa\
-\xa3\xb0\x76\x61\xd9\x59\x5d\xa1\x9c\xc2\x55\xef\x7d\xe3\x8a\xd9\
-\x15\x59\x6e\xba\x8b\x39\xb9\x1e\x1e\xe2\x8f\x6b\x65\x72\x66\x5a\
-\xe8\xf1\xcf\x4d\x1c\x74\x90\x3c\xaf\x34\x76\x2a\x28\x24\x3c\x4a\
-\x1a\x53\xa5\x4d\x6b\x1d\x42\xa5\xca\x96\xd4\x01\x14\xa7\x13\x4c\
-\x67\x34\xe9\x49\x9f\xfe\x5c\x1b\x2e\x83\xb3\xf2\x9d\x79\x82\xf9\
-\x6f\xb0\x33\x34\x5d\x6d\x07\x63\x64\x7e\x44\xee\x8c\x86\xc7\xcf\
-\xe0\x69\x7a\x3f\x11\xb1\x6a\x76\xb4\x54\x13\xe4\x29\xce\x63\x27\
-\x49\xb9\xf2\x1b\x9c\x6e\xd8\x21\x86\x9e\x9e\xb2\x9e\x34\xc8\x53\
-\x56\xd2\x47\x35\x43\xd1\x54\xb4\x7a\xf1\x0d\x2b\xa3\x8f\x0f\x9f\
-\x56\x36\x4a\x1c\xa0\xb8\x14\x5a\xea\x34\xf8\x69\x4f\xdb\x5a\xff\
-\x00\x87\xd3\xa0\x83\x7c\xfc\x31\xda\xf4\x95\x3d\x4b\xb9\xfa\x8b\
-\xe4\x97\x5b\x76\x6f\x45\xf6\xa6\xf4\xa9\xeb\x99\xbb\xaf\x73\x50\
-\xd6\x74\xde\x27\xae\xb7\xb6\x2a\x9c\xe5\x33\x18\x9e\xc7\xdb\xbb\
-\xd7\x23\x25\x7e\xd9\x85\x36\xf5\xeb\xe8\x64\x92\x62\xf9\x08\x14\
-\xe8\x8d\x3c\x94\xc6\xa3\x61\xce\x41\x52\x18\x79\x74\xd3\x5b\x28\
-\xf0\xda\x39\x95\xa2\x63\x4d\x47\x14\x3f\x30\x78\x74\xbf\xdf\x1f\
-\x03\xfa\xa7\x19\xd5\x19\x4e\xea\xeb\x2f\x95\xf4\xfd\xa3\xd7\x5b\
-\x17\x7d\x6c\x9d\xad\xdb\x7b\x94\xf4\x2f\x63\x6c\xdc\x3e\xd4\xc2\
-\x6e\xed\xd9\x16\xcc\xa9\xdd\x3b\x2f\x29\x95\xaf\xae\xc7\xf6\xc2\
-\x60\x33\x32\xde\x6a\x5c\x54\x8a\x64\x81\x75\xac\xa1\x9e\x34\x7f\
-\x09\x0d\x74\x94\xa1\xfb\x7a\xbb\x5a\x46\x23\x32\xa5\xc6\xa4\x04\
-\x02\x74\x91\x4a\x9a\x54\x7a\xfe\x5d\x19\xaf\x98\xdf\x10\x7a\xd7\
-\xb3\x3e\x5b\x6e\xf6\xdb\x5d\xdf\xb4\xfa\xf7\xae\xfa\xf7\xa7\xfa\
-\xf7\x73\x77\x7e\x5b\x21\xd7\x59\xbc\x36\xdf\xe8\xed\xb1\x87\xd8\
-\x7b\x03\x6b\x6c\x1a\x1c\x35\x05\x35\x45\x35\x2e\xfb\xcb\x76\x15\
-\x2c\xf0\x55\x51\x63\xf1\xc6\x93\xed\x35\x3d\x3b\xb1\x9d\x15\x64\
-\xa2\x39\x08\x2a\x33\x5c\x7c\xfa\x51\x73\x6e\x92\x5c\x35\x25\x0a\
-\x81\x41\x6c\x7c\x22\x80\x0f\xb6\xbd\x14\xba\xcf\xe5\xfd\x51\xba\
-\xb7\xd7\x48\x63\x7e\x3f\xf7\x4e\xd7\xee\xde\xab\xef\x2c\xde\xe0\
-\xdb\x78\x8e\xdb\x4d\xb1\x9c\xd8\xd4\xfb\x4b\x39\xb2\xf1\x6f\xb8\
-\xf7\xbe\x3f\x7b\xec\xfc\xc5\x46\x43\x31\x80\x9f\x09\xb5\x10\xe4\
-\x60\x59\x65\x0f\x5b\x02\xb5\x96\x3b\x02\xd7\xf1\x28\x1b\x50\xa1\
-\x1d\x26\xfa\x42\xcd\x10\x8a\x40\xd1\xb1\xe3\x4a\x52\x9c\x6a\x3e\
-\xce\x8c\xb5\x5f\x4a\xf5\x87\x52\x7f\x2f\xdf\x9c\x95\x1d\x49\xf2\
-\x0f\x6d\xfc\x85\xda\xf9\xcd\xd9\xf1\xcb\x0d\x5b\x9e\xc2\x6d\x2c\
-\xce\xca\xaa\xc1\xee\x5d\xa5\xd9\xd3\xae\x5b\x1d\x53\x87\xcc\xd7\
-\x64\xcd\x76\x2a\xa6\x0c\xed\x3c\xb4\x19\x3a\x6a\x89\x29\x2b\xe3\
-\xf2\x18\x8e\x94\xbb\x53\x51\x32\x25\x56\x87\x3d\x3f\xe1\xa4\x76\
-\x77\x5e\x1c\xc1\xd4\x95\xf2\xa6\x41\xff\x00\x56\x7a\x0d\x7f\x97\
-\x7e\xcc\xc6\xf6\x17\xc7\xff\x00\x9f\x9b\x47\x35\xbb\xf0\xdb\x03\
-\x05\x95\xeb\xde\x9f\x7c\xfe\xf6\xcf\xc5\x51\x53\x8b\xda\xfb\x7f\
-\x19\xbd\xb3\x79\x7c\xf6\x6a\x6a\x2a\x3f\xf2\xbc\x9c\xf4\x38\x8a\
-\x09\x9e\x0a\x48\x8a\x49\x59\x50\x12\x15\x64\x32\x06\x16\x90\xd1\
-\xa3\x34\xf5\xea\x96\x6a\x1e\x1b\xb5\x2c\x00\xa2\xe7\xd3\x27\xa4\
-\xcf\xfc\x37\x5e\x17\x37\xbd\xfa\xb3\x15\xd7\x1f\x22\x30\xbd\x8b\
-\xd6\xfd\xf1\xb1\xbb\x2b\x2f\xd3\x1d\x9d\x89\xeb\xbc\xc6\x36\x2d\
-\xc9\xd8\xfd\x69\x86\x9f\x33\x5f\xd5\x9b\xa7\x6c\xe4\xf7\x0c\x55\
-\x3b\x0f\x27\x92\x86\x99\xd6\x2a\x8a\xaa\xa9\xa6\x56\x46\x53\x48\
-\x64\x53\x1f\xbf\x78\x98\x35\x5c\x8e\xab\xf4\x60\xb4\x61\x26\x05\
-\x1c\x1a\x1a\x79\x8f\x22\x3c\xba\x28\xd4\x9d\x19\x1f\xfb\x2c\x99\
-\x6f\x91\xd9\x8d\xd7\x26\x25\x4f\x6e\xd0\xf5\x1e\xcd\xd9\xc3\x6f\
-\xfd\xdb\xee\xec\x8a\x6d\xb3\xba\x77\x36\x64\xe7\x5b\x35\x48\xd8\
-\x9c\x76\xdb\xc7\x49\x02\x12\x28\x6a\x96\x7a\x99\xd6\x3d\x71\x90\
-\x48\xbe\xae\xed\x34\xf2\xe9\x3f\x85\xfa\x06\x62\xdf\x8a\x80\x7a\
-\xe2\xa7\xf6\x75\xb6\xbf\xf2\x08\xff\x00\x87\x28\xff\x00\x86\x6b\
-\xf9\xc7\xff\x00\x0d\x45\xff\x00\x65\x73\xfe\xce\xef\x51\xff\x00\
-\x08\xff\x00\x99\x0b\xff\x00\x1e\x1f\xfa\x37\xc5\x7f\x7d\xbf\xec\
-\xa4\x7f\xe3\x19\x7f\xc0\x3f\x17\xf9\xdf\xf2\xcf\xf8\xe1\xea\xbf\
-\xbb\x74\xcf\x45\x5b\xf9\x95\x6d\xdf\xe7\x55\xd8\xd9\xaf\x8a\x5d\
-\x45\xff\x00\x0a\x22\xf9\x09\xfe\xca\xef\xc4\xcd\xeb\xd9\xfb\xcf\
-\x27\xb4\x7b\xaf\xfd\x13\xfc\x4e\xee\xcf\xee\x26\xee\xda\xdd\x7d\
-\x93\x6a\xdc\xcf\xfa\x37\xf8\x3b\x3d\x0f\x65\x6e\x8f\xb9\x8b\x33\
-\x49\x8c\xfb\x7a\xaa\x98\xa9\x53\xf8\x97\xdc\x28\x73\x4e\xfa\x7d\
-\xd7\xba\x06\x7b\x73\xf9\x17\x7c\x5f\x6f\x87\x9b\x3b\xe5\x4f\xc3\
-\x4f\xe6\x82\x3e\x5a\xe4\xbb\x8f\xe4\x97\x5a\xfc\x4f\xf8\xe3\xd6\
-\x7b\x93\xe1\x17\x69\xfc\x57\x6e\xfd\xee\x7d\xfb\xbe\xf6\xbe\xcf\
-\xc9\x60\xb6\x16\xe5\xee\x3e\xce\x39\x2c\xae\x2f\x65\xd1\x67\xe7\
-\xac\xc8\x65\xa8\x70\x79\x0c\x44\x75\x18\xe9\xe8\x24\xaa\x86\xad\
-\x64\x48\xfd\xd7\xba\x42\xf7\xf7\xf2\x46\xe9\x2d\x8b\xd6\xdf\x26\
-\xe9\xbe\x36\xff\x00\x33\xbe\x92\xf9\x6f\xf2\xdb\xe1\x2e\xc6\xcb\
-\xf6\x47\xca\xdf\x8a\xbb\x47\xa8\x77\xc7\x5f\xc7\xb4\xb6\x6e\xc5\
-\x31\xc7\xdc\x59\x9e\xa5\xee\x9d\xd3\xb9\x2a\xb6\x97\x7a\xc7\xd4\
-\x0e\x64\x93\x34\x98\xba\x2a\x69\x69\x21\xa7\x91\x6a\x16\x9e\xaf\
-\xc7\x47\x27\xba\xf7\x56\x27\xfc\xdc\x7f\x97\xf5\x1f\x7b\xee\x0e\
-\xbf\xf9\x87\xdf\x1d\xca\x3e\x32\xfc\x4d\xf8\xf1\xfc\xa7\xfe\x07\
-\x6d\xe6\xec\xc3\xd7\xe3\xb3\x77\x67\x70\x77\xe6\x6f\xac\xb2\xd9\
-\x1d\x97\xf1\xe3\xa6\x36\x05\x4e\xf8\xeb\x4a\x1d\xdb\xbe\x73\x54\
-\x1f\xe5\x59\x09\xe5\xcd\xd1\xd1\xe0\xa8\x24\x8a\xaa\xac\x88\x1c\
-\xba\x7b\xaf\x74\x4b\x77\x2f\xf2\xcb\xef\xbf\x98\x9d\x8d\xf0\x4b\
-\x6d\x77\xa7\xcd\x5d\x9d\x85\xe8\xed\x91\xfc\x98\x3a\x1f\xe5\x4e\
-\xeb\xf9\x09\xd8\x9d\x37\x89\xd9\x3b\x37\xe1\xdf\xc4\xd8\x37\xdf\
-\x67\x60\x36\x9f\x4b\xcd\x45\xb1\x72\x28\xdd\xc9\xb9\x30\x3b\xa6\
-\xaa\x6f\xe1\xd9\x4c\xa5\x6e\x33\x31\x9f\x19\x19\xc4\x85\x52\x80\
-\x5f\xdd\x7b\xa3\x57\xfc\xb0\xff\x00\x97\x27\x5e\x7c\x6d\xfe\x69\
-\x3f\xca\xaf\xe5\x6f\xc4\xdf\x98\x1b\x27\xe7\x97\xc3\x6e\xd6\xf9\
-\x11\xd8\xdd\x41\x1f\x77\x6d\xae\xb3\xdd\xbd\x15\xbb\x76\x0f\x7b\
-\xed\x2e\x9b\xec\x0c\xfe\x5f\xaa\xfb\x33\xa4\xfb\x07\x29\x97\xdd\
-\xfb\x42\xb7\x29\xb4\xa4\x4c\xbe\x12\xaa\x69\xc9\xca\x63\xd6\x4a\
-\x86\x82\x9e\x06\xa2\x9a\xbb\xdd\x7b\xad\x57\x3b\xeb\xfe\x67\x9f\
-\x73\xff\x00\xe2\x58\xec\x5f\xfd\xec\x33\x1e\xfd\xd7\xba\x09\xfd\
-\xfb\xaf\x75\xef\x7e\xeb\xdd\x7b\xdf\xba\xf7\x5f\xff\xd2\xf9\xff\
-\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\x8c\xcf\xc3\
-\x6e\xdc\xdb\xbd\x11\xf2\x7f\xa6\x7b\x5f\x77\x0a\x8f\xee\xb6\xd2\
-\xdd\xd1\xcb\xb8\xa6\xa5\xa6\x92\xb2\xa2\x8b\x0d\x96\xc7\xd7\xe0\
-\x32\x39\x38\xa8\xe1\x57\x9e\xad\xb1\x54\xb9\x56\xa9\xf1\x46\xad\
-\x2c\x9e\x2d\x28\x0b\x90\x3d\xd5\xc6\xa5\x20\x71\xe9\xfb\x69\x04\
-\x53\xc7\x23\x7c\x20\xff\x00\xb1\xd1\xea\xc2\x7c\x7b\xf8\xb3\xd0\
-\xfd\x9d\xb6\x3b\x67\x39\xf2\xe7\xac\x3b\x37\x23\x57\xf2\x33\xa7\
-\x72\x5d\x2d\x81\xea\xfd\xfb\x85\xad\xfe\x13\xb5\xe5\xed\x1c\x06\
-\x6b\x72\xee\xee\xfc\xa9\xc8\xe2\x2b\x57\x69\x52\xed\xed\xa4\xb3\
-\xbc\xb0\x7d\xc5\x28\x15\x51\x02\xf5\x43\x53\x47\x1b\x7a\x98\x8d\
-\x3a\x08\xc7\xfa\xa9\xd2\xa1\x0c\x11\x48\xb2\x1b\x85\x63\xac\x52\
-\x87\xca\xb9\x2d\xe9\x41\xd2\x97\xe3\x7f\xc9\x2d\xb3\xb0\x7e\x66\
-\x7c\xec\xc6\x62\xbb\x97\x6b\x75\x3a\x77\xce\xe7\xee\x08\xba\xaf\
-\xbf\x6a\x97\x07\xb9\xb6\x4e\x03\x74\xd0\x76\x8e\x77\x71\xec\xec\
-\xa5\x6b\xe4\x29\x72\xbb\x5a\xbb\x69\x6e\x7c\x5d\x64\xff\x00\xe5\
-\xb3\x17\xa7\xd2\x62\x31\x92\x64\x56\x1e\x65\x25\x13\x15\xa7\x97\
-\x5b\x82\x65\x4b\x9b\xa0\x24\x0b\xac\x9a\x37\x11\x5a\xe3\xe5\x43\
-\xd0\xa7\x9a\xef\x8a\xe8\x3b\x87\xe2\xd6\x03\xe6\x27\xce\x7e\x90\
-\xf9\x31\xb7\x28\x3b\x47\x27\xbd\x37\x0e\xd7\xeb\x4d\x85\xb0\xb7\
-\x17\x52\xf5\xde\x4f\x1f\xb3\x77\x6e\x07\xad\x77\x9e\xe2\xed\x2d\
-\xa9\xb7\x36\xad\x46\x69\xd3\x75\x67\xa9\xda\xab\x13\x25\x04\x74\
-\xf4\x90\x2c\xb5\x15\x12\x2a\xc5\x0c\x8d\x5d\x38\x6d\x08\x46\x3a\
-\x70\xca\x7c\x48\x05\xc5\xd2\xb8\xd5\x5a\x00\x28\x30\x68\x6a\x00\
-\xf3\xf2\xa7\x5d\x7c\x8a\xee\x5c\xee\x5b\xe2\xa7\xcb\x6e\xbe\xee\
-\x3f\x9a\x7d\x11\xdf\xdd\x89\xb8\xa9\x3a\x8b\x2d\xd7\x1b\x1f\xa7\
-\x72\xfb\x52\x9b\x62\xed\xad\xa7\x82\xee\x3c\x26\x42\xae\x83\x6c\
-\xd7\xd1\x50\x6d\xc8\x37\x2e\xeb\xa9\xc5\x45\xe5\xa9\xc6\x53\xae\
-\x4a\xbb\x1d\x43\x8d\x57\x9a\xa2\x5f\x2a\xbb\x79\x47\x7a\x90\x84\
-\x0e\xbd\x34\x84\xdb\xce\x92\x5c\xa3\xb9\xa5\x00\xa5\x00\xaf\x97\
-\xcf\xe5\x9e\x85\x08\xbb\xff\x00\x62\xed\xbf\x90\x1d\xb9\xba\x3a\
-\xfb\xe5\x77\x4f\x75\xe5\x7f\xcb\x8e\x89\xea\x21\xd5\xdd\x9d\x43\
-\x9a\xdb\x5b\xbe\x9b\xa9\x3b\x07\xa6\xb6\xbe\xd4\xc5\xcf\xb5\x7b\
-\xab\x11\x9f\xc2\xe5\xf0\x9b\x2a\x97\x78\x45\x35\x6c\x29\x35\x7c\
-\x0e\x52\x04\x93\x49\x82\xa9\x63\x1e\xf5\xa4\x95\x15\x43\x83\xfe\
-\x1e\x9c\xf1\x94\x4b\x23\x24\xea\xa6\x44\x14\x38\x34\x23\xc8\xfa\
-\x57\xa0\xc7\x21\xf2\xd7\x75\xf5\xff\x00\x73\xf4\x16\x1f\xe4\xd7\
-\xce\x1e\xb6\xf9\x23\x88\xc8\xcf\xd8\x34\x1d\x85\x4d\xd2\x3b\x17\
-\x64\x64\x76\x0f\x52\xe2\x37\xc6\xcc\xdc\x9d\x7f\x83\xdd\xb4\xdd\
-\xb7\xb4\x70\x7b\x56\xa3\x74\x66\x18\x67\xc4\xf5\x78\xb1\x8b\x75\
-\xa1\xa5\x86\x73\x2a\xb3\x9a\x47\x9b\x7a\x01\x0d\xa5\x08\xfb\x7a\
-\x6c\xdc\x32\x49\x10\x9e\xe9\x5c\x66\xba\x40\xa0\xa8\x22\xb5\x14\
-\xaf\xd9\x4f\xf2\x74\x5f\xf3\x7d\x69\xd3\x1f\x1c\xfe\x17\xfc\xc6\
-\xd8\x38\xdf\x94\x9d\x23\xdc\x9d\x87\xd9\xb9\xae\x83\xc8\xe0\x30\
-\xfd\x6d\xbc\x31\xd9\x18\xaa\xb6\x6e\xd4\xec\xda\xba\x9c\x45\x45\
-\x3d\x3c\xef\x15\x55\x66\xef\x92\x8e\xb6\xb6\xab\x33\x8c\xa2\x6a\
-\xe1\x85\xa7\x8e\x13\x2c\xa5\x65\x59\x5e\xd5\x66\x74\x3a\x48\x02\
-\xbd\x34\x52\x28\x6d\xae\x50\x4e\xac\xed\xa7\x81\xf2\x07\xfc\x3e\
-\xa3\xcb\xa0\xd3\xe0\x9c\x9d\x59\x9c\xe9\x1f\x9a\xbd\x5b\xd9\x7d\
-\xbb\xb2\xfa\x86\x5e\xd4\xda\x3d\x3b\x80\xda\x79\x8d\xe1\x9c\xa4\
-\xc5\xc5\x53\x9f\xa3\xdf\x99\x1a\xda\x17\x4a\x26\x9d\x72\x79\x0c\
-\x25\x06\x4c\xd2\x36\x62\x5a\x58\xa6\xfb\x0c\x6c\x92\x54\x4a\x04\
-\x68\x4f\xbd\xc9\x5d\x48\x40\xad\x3a\xa5\xa7\x86\x62\xba\x8d\xe4\
-\x0b\xa8\x0a\x57\xed\xff\x00\x55\x7a\x5b\xf6\x77\x6f\xed\x2f\x89\
-\x9b\x4b\xe1\x97\x51\xf5\x97\x6a\x6c\x9e\xea\xde\x1d\x11\xda\x39\
-\xee\xf8\xec\x7d\xe3\xd5\xf9\x58\xf3\x9b\x22\x3c\xbe\x77\x2b\x8c\
-\x4a\x6d\x87\xb5\xb7\x33\x45\xe0\xcc\x51\xd4\x6d\xfa\x6a\xb8\x6b\
-\xa4\xd3\x1e\xbf\x2c\x6c\xf1\x46\xce\x63\x8f\x41\x4b\x97\x24\x50\
-\x11\x4e\xac\xf2\x2d\xba\xdb\x46\x92\x06\x64\x6d\x44\x8e\x1f\x60\
-\x3d\x40\xfe\x6a\x39\x9d\x99\xb5\x77\xee\xc0\xf8\xf5\xd6\x72\x69\
-\xd9\x7d\x7f\x49\xbd\x3b\x57\x21\x4c\xaf\x25\x34\x90\xef\x1f\x90\
-\xdb\xba\xbb\xb1\xa4\xc6\xe4\x71\x4c\xaa\xf4\x73\xed\xfd\x9b\x53\
-\x88\x82\x99\x65\x02\x54\xa6\x94\x0d\x11\x82\x75\x6e\x2a\x90\x58\
-\xf1\xff\x00\x37\x5a\xbf\x2a\xae\x90\xa7\xc2\x2a\x7f\x36\x35\xff\
-\x00\x05\x3a\xb1\xcf\xe5\xa9\xd7\xfd\x4f\xf2\x93\xf9\x29\x7c\xcf\
-\xf8\x69\x94\xf9\xa9\xf0\x73\xe2\x7f\x71\xef\x8f\x9b\x5d\x31\xda\
-\x3b\x5a\x1f\x99\xbf\x23\xb6\xdf\x45\x61\xb3\x7b\x43\x64\x6c\x5a\
-\x18\xf3\x35\xf8\xc8\xea\x28\xb7\x06\xe9\xc9\x23\x55\x48\x60\x8a\
-\x5a\x7c\x5c\xd4\xa6\x74\x64\x79\x63\x23\xdb\xbd\x20\xe8\x13\xd8\
-\x9f\xc9\x43\xa4\xf6\x6f\xc8\xbf\x8b\x9b\x4f\xe4\x87\xf3\x7a\xfe\
-\x53\x19\xce\x88\xed\xae\xe2\x9b\x67\xf6\xa6\xec\xf8\xc7\xf3\x47\
-\x6c\xf6\x36\xe6\xeb\x7d\x9f\xb7\x7a\xe3\x7f\x76\x9e\x53\x39\xba\
-\x1f\x78\xed\x8e\xbc\xda\xfb\x27\x07\xbb\xd3\xaf\x86\xd3\xc7\x66\
-\xeb\x6b\x66\x86\x97\x72\xee\x1c\x62\x1a\x5a\xa3\x28\x81\xfd\xd7\
-\xba\xb5\xdf\x99\x52\x51\x75\x1f\xce\x1f\x8d\xdf\xcc\x6b\x0f\xfc\
-\xc1\xff\x00\x93\xfe\xed\xf8\x65\xfc\xb8\x7b\x13\xa1\xb0\x5f\x1c\
-\x3e\x05\xfc\x53\xf9\xb5\xfe\x98\x3b\x8f\x6c\xfc\x67\xda\xdd\x9b\
-\xb4\x36\xd6\x7e\x8b\xad\x7a\xa3\x17\xb0\x76\xb6\x27\x75\x77\x1e\
-\xe1\xdb\xf9\x1a\x8d\xc5\xb8\xab\x16\xbc\x3b\xc9\x4a\x04\xd5\x15\
-\x94\xb8\xda\x75\x6f\x75\xee\x87\xbf\xe6\x01\xf3\xef\xe5\xa5\x3f\
-\x53\x7c\xd3\xec\xac\x67\xfc\x29\x2f\xe1\x2f\x62\xfc\x52\xec\x4d\
-\x95\xd8\x30\xfc\x66\xf8\xc3\xd4\x3d\x1b\xf1\x8b\xb7\x7e\x53\xf6\
-\x7e\xdb\xec\xfc\x6e\x4e\x83\x0d\xd0\x5d\xbb\xd7\xb4\x7d\x4f\xb4\
-\xf7\x77\x47\xc3\x41\x8b\xce\xae\x12\xbf\x76\x4f\x94\xcb\x55\xc1\
-\x4b\x0c\x99\x29\xe9\x29\x6a\x3f\xc9\x17\xdd\x7b\xa4\x77\xcb\x8f\
-\x9b\x9f\x16\xbe\x76\x6d\x8d\xbf\xfc\xa7\xfb\x67\xe4\xaf\xc6\xba\
-\x5e\x97\xdc\x3f\xca\xe7\xe2\x3f\x65\xfc\x4f\xf9\x0f\x91\xec\xae\
-\xad\x87\xaf\xfe\x37\xff\x00\x30\x3e\x8c\xd8\x3b\x87\x29\xb8\xba\
-\xff\x00\x7f\x76\x98\x8b\x27\x82\xd9\x32\x76\xde\xd6\x92\xa3\x6b\
-\xee\x13\x98\xca\xd1\x54\xe2\xa3\x86\x3c\x75\x3c\x49\x57\x94\x5f\
-\x7e\xeb\xdd\x4d\xf8\x8b\xfc\xca\x3a\x6b\xa5\xbb\x37\xe3\x1f\x4b\
-\xed\x0f\x9a\xfd\x2b\xf1\xb7\x7a\xf7\x1f\xfc\x27\xd7\xe2\xaf\xc7\
-\xcd\xb1\xf2\xd1\xf3\x3d\x71\xda\xfb\x0b\xe3\x27\xcb\xde\x99\xed\
-\x7e\xf2\xdd\xd8\x9d\x81\xdc\xb8\xba\xf8\x37\x76\xc2\xc0\x1a\xcc\
-\x3e\xe4\xa8\x8f\x2f\x06\x78\x43\x26\x3c\x4d\x47\x78\xc3\x56\x41\
-\x20\xf7\x5e\xe9\x49\xb7\x3e\x75\xf7\x46\xda\xf9\xdb\xfc\xab\xb6\
-\xdf\xf3\x05\xfe\x7b\x7f\x0a\xbe\x6b\xd2\xed\xbf\x93\xdb\xb3\xb8\
-\x7b\x03\x6c\x7c\x7d\xda\x9f\x1c\x30\xbf\x18\x3e\x3e\xe3\x30\x7d\
-\x27\xdc\x1b\x17\x66\xf6\x3e\xec\xf9\xab\xb5\x36\x9f\x4d\xd3\x57\
-\x6e\x2d\xc3\x16\xfb\xa8\xc7\x7f\x75\xea\xf1\x54\xb4\xf4\xef\x54\
-\xd2\xcf\x2b\xbc\x74\x2f\x3f\xba\xf7\x5a\x35\xf7\x5d\x7d\x0e\x57\
-\xb9\x7b\x6f\x29\x8b\xad\xa4\xc9\x63\x32\x5d\x9b\xbf\x2b\xf1\xd9\
-\x1a\x0a\x98\x6b\x28\x6b\xe8\x6b\x37\x56\x56\xa2\x92\xb6\x8a\xae\
-\x9d\xe4\xa7\xaa\xa4\xaa\xa7\x91\x64\x8e\x48\xd9\x91\xd1\x83\x29\
-\x20\x83\xef\xdd\x7b\xa0\xcb\xdf\xba\xf7\x5e\xf7\xee\xbd\xd7\xbd\
-\xfb\xaf\x75\xff\xd3\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\
-\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\
-\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xa1\x27\xa8\xbb\x26\x4e\
-\xa2\xec\x2c\x07\x60\xc5\xb2\x3a\xeb\xb1\x9f\x00\x72\x44\x6c\xde\
-\xd7\xda\xe9\xbc\xb6\x1e\x5c\xe4\x71\x35\xd8\xa5\x6c\xde\xdf\x6a\
-\xcc\x7b\x56\x3e\x35\xab\x45\x5d\x2b\x24\xf1\x34\x35\x90\x45\x20\
-\x27\x49\x53\xa2\x2a\x29\x5e\xaf\x1b\xf8\x6e\x1f\x48\x34\xf2\x22\
-\xa3\xa8\x9d\xa7\xd9\x7b\xb7\xb9\x3b\x13\x77\xf6\x86\xfa\xad\x8f\
-\x21\xbb\x37\xb6\x6e\xab\x39\x99\xa8\x82\x11\x4d\x48\x93\x54\x15\
-\x48\x68\xa8\x29\x43\x38\xa5\xc6\xe3\x69\x23\x8e\x9e\x9a\x2d\x4d\
-\xe2\x82\x24\x5b\x9b\x5c\xf8\x00\x00\x03\x87\x5e\x91\xda\x47\x67\
-\x73\xdc\x4f\x48\x1f\x7b\xea\x9d\x7b\xdf\xba\xf7\x5e\xf7\xee\xbd\
-\xd7\xbd\xfb\xaf\x75\xef\x7e\xeb\xdd\x7b\xdf\xba\xf7\x5e\xf7\xee\
-\xbd\xd7\xbd\xfb\xaf\x75\xef\x7e\xeb\xdd\x7b\xdf\xba\xf7\x5e\xf7\
-\xee\xbd\xd7\xff\xd4\xf9\xff\x00\xfb\xf7\x5e\xeb\xde\xfd\xd7\xba\
-\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\xd7\
-\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\xfd\
-\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\xde\
-\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\xeb\
-\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\x5e\
-\xeb\xde\xfd\xd7\xba\xf7\xbf\x75\xee\xbd\xef\xdd\x7b\xaf\x7b\xf7\
-\x5e\xeb\xff\xd9\
-\x00\x00\x04\x2e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x03\xc3\x49\x44\x41\x54\x68\x43\xed\x98\x31\x8e\
-\xd4\x40\x10\x45\xe7\x08\x04\x24\x9b\x10\x70\x10\x4e\x00\xdc\x61\
-\x25\x0e\x00\x5c\x81\x98\x88\x1b\x10\x13\x11\x00\x42\x22\x44\x42\
-\xb0\xf1\x86\x20\x20\x22\xde\x80\x04\x34\xe8\x59\x7c\xf3\x5d\x2e\
-\x77\x97\xc7\x23\x16\x04\xc1\x53\xb5\xbb\xbb\x7e\xfb\x4f\x75\xdb\
-\xde\xdd\x3d\xbf\x7f\x6b\xff\xf2\xe6\x49\x17\xe6\x5d\x7c\x7e\xbf\
-\xff\xbe\xff\x96\xf2\xfa\xc9\xe3\x34\x2f\xe3\xd9\xa3\x07\xa9\x06\
-\x7c\xf8\xf4\x71\x58\x2b\xcb\xcb\x18\x0c\x5c\xdc\xb9\xd6\xe4\xeb\
-\xe9\xd5\x61\x72\xcf\xc0\x97\xd3\xeb\x69\xbe\xc3\x9c\xb7\x0f\xef\
-\xa6\x1a\x80\x81\xf3\x7b\x37\xd2\x5c\x07\x9d\x77\xb7\xaf\xfc\x32\
-\xa0\xc5\x3d\x0a\xae\x07\xd1\x15\x06\x96\x74\x88\x6b\x0d\x78\xae\
-\xf7\x4f\x0c\xf4\xa8\x56\x20\x2e\xe2\x68\xbc\x65\x00\x64\x20\xd3\
-\x52\x1f\x71\x34\xc0\x16\x89\x83\x4a\x10\x6b\x2a\x90\xe5\x0b\xc6\
-\x2a\x15\x88\x5a\xae\xe9\x7d\x93\x0a\x2c\x4d\x22\x1e\x62\x20\x8b\
-\x50\xad\x40\x96\xeb\xed\x74\x0b\xf9\x44\x5d\x13\x2b\x06\x7c\xbe\
-\xeb\x44\xbd\x63\x1d\x62\x98\x1d\xe2\xa5\x76\xef\x0c\xbc\x7a\xf1\
-\x74\x92\x17\xf3\x89\xe2\x90\x33\x10\xdb\x30\xab\x80\x26\xf9\x64\
-\xb1\xb6\x02\x8e\xf7\xd1\xde\x7a\x06\x74\x0d\xb3\x2d\xa4\xc1\xd8\
-\xee\x19\x50\x05\x34\x3f\xd3\xd0\xf8\x21\x67\x20\xd3\x19\x2a\x80\
-\x18\x17\x72\x1d\xa3\xe0\x9a\x5f\x27\x5b\x10\xa8\xc0\x92\x46\x8c\
-\xbd\x37\x71\xef\x9e\x3c\xee\xf8\xe5\xf8\x65\x87\x2d\xf0\x33\x9e\
-\x9d\xbd\x19\x23\xe3\x22\x5b\x50\x90\xcb\x7c\xd7\x72\x6d\xd7\xa2\
-\x2f\xd3\x10\x8c\xbb\x4e\xd4\xd5\xfd\xa1\xb5\xcb\x04\xfe\x26\xfe\
-\x5d\x03\xec\x55\x6d\x09\x6d\x8f\x18\xd7\x8c\x65\x6b\x54\xd8\x6c\
-\x80\xc5\x33\x18\xcf\xfa\x21\x8e\xa1\x93\xad\x51\x61\xd3\x16\x62\
-\x61\x6e\x66\x2b\x97\x62\x40\x0b\xc7\x9b\x39\x04\xaa\x90\xad\x51\
-\x61\xc7\xe3\x88\xe7\x2e\xcf\xe6\x5e\xe4\x11\xe6\xc9\x6e\x80\x76\
-\x55\x07\xdc\x40\xac\x80\xe6\x54\x74\xc6\x37\xb1\x3e\xa9\x63\x54\
-\x9b\x97\x86\x1b\xd0\xc2\xba\x09\xc4\x78\xb9\x30\x97\x37\x24\x31\
-\x5e\xa3\x45\x1f\x37\x40\x8e\xce\x83\x1b\xe0\x9a\xb5\x34\xbf\x15\
-\x27\xdf\x42\x08\x3b\xf4\xa9\x9f\x58\x35\xe0\x39\x31\x02\x8b\xca\
-\x00\xa0\x99\x19\x50\x5e\x44\x3a\xd2\x4a\xbf\x85\x20\x26\xc4\xaf\
-\x51\x16\x8a\x06\x94\xa7\x1c\x47\xfd\x44\x37\x20\x1d\xe9\x82\x0c\
-\x44\xa2\xf6\x68\x40\x65\x89\x90\xa0\xa4\x58\x01\x58\xaa\x40\xcc\
-\xf5\xfe\x58\x81\x68\x80\x6b\xd6\xf2\x1c\xc7\x35\x61\xb2\x85\x3c\
-\x46\x7a\x5b\x88\x87\x81\x44\xb3\x7c\xc1\xf8\x9a\x0a\xc4\xfb\xf2\
-\x38\xdb\x42\xd9\x24\xb5\x2b\x5b\x28\xcb\xf7\xa8\x76\xa5\x02\x59\
-\x5e\x8c\x13\x03\x71\x42\xa4\x5a\x01\xe6\x2e\x45\xe8\x6d\x21\xf0\
-\x0a\x2c\x81\x66\x7a\x06\x18\x10\x9e\x10\x0d\x40\x56\x01\xe5\xb5\
-\x62\xf5\x0c\x08\xcf\x77\xe8\x1b\xfe\xa0\x89\x03\x8e\x44\x7a\x5b\
-\xc8\x2b\xd0\x62\x4b\x05\xa4\xaf\x7b\x9a\x6d\xa1\x0c\x8d\x2d\x55\
-\x40\x2f\x23\xaf\x40\x8b\x9e\x01\xae\x63\x05\x96\x18\x0c\xb0\x30\
-\x82\x15\x10\xf7\x85\xbc\x02\xb4\x7d\x2e\x3f\x4c\x6c\x2b\xb2\xa6\
-\xf2\x94\x2b\x5d\xd0\xe7\x4d\x85\xff\x5f\xa3\xf1\x66\x04\xdb\x2d\
-\xeb\xcf\xb8\x14\x03\x50\xa9\x40\xc5\xc8\xa5\x56\xe0\x18\x6c\xfa\
-\x7b\x20\xeb\xac\x82\x09\x62\x7c\x3a\xfd\x4e\x36\x19\xf8\x13\xd8\
-\xf1\xeb\x55\xc9\x04\x44\x36\xbf\x45\xa6\x21\xb2\xf9\x4b\x0c\x2f\
-\x32\x5e\x08\x2d\x78\x0b\xf7\xfe\x3b\xcd\xb3\x9b\x39\x59\xbe\xc3\
-\x1c\xde\x03\x99\x06\xb0\x2d\x2b\xf7\x04\x68\x35\xdf\xc4\xf4\x8b\
-\xec\x4d\xec\x60\x40\x73\xa3\x46\xd4\xe2\x05\x94\x69\x00\x06\xf4\
-\x29\xe1\x3a\x11\xc6\x31\x31\x1a\xc8\xd0\x44\xa8\x18\xf0\xf9\x8e\
-\x2f\x4a\xac\x1a\x68\x81\xce\x68\x80\xaf\xd1\x6c\x71\x5f\x94\x72\
-\xe9\xa9\x93\xe1\x06\x88\x22\xea\xc1\x56\x03\xd2\x9d\x55\xc0\x17\
-\x8c\x8b\x57\x2b\x90\x69\xc4\xbe\x96\x01\xf0\x2d\xd4\xd2\x49\x2b\
-\x10\x27\xa9\x5d\x31\xe0\x79\x51\x4f\x7d\xb0\xe6\x0c\xf4\xe2\xec\
-\x0c\xd0\xa9\x09\xba\x26\x56\x9e\x42\x59\x9e\xf7\xe9\xba\x5a\x81\
-\x98\xef\x9a\xb0\x78\x06\xb2\x76\x75\x0b\x29\x2f\xa2\x31\xe2\x9a\
-\x33\x90\x69\xaa\xef\xe8\x67\xc0\xf3\x32\x2d\x22\xac\x3d\x03\xb1\
-\xad\xeb\x99\x81\x16\x55\x03\x3d\x7a\x06\x5a\x15\xc8\x4c\x0c\x06\
-\x48\x60\x8f\x83\xb7\x23\x3d\x03\xca\xed\xe9\xb5\xde\xc4\x80\x41\
-\x7e\xdd\xa8\x37\xd7\x3f\xd9\xff\x00\x0e\xe4\x3e\x60\x71\x7c\x3b\
-\xfd\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0c\x1c\
-\x00\
-\x00\x40\x26\x78\x9c\xed\x9b\x7b\x3c\x54\xe9\x1f\xc7\x07\x5d\xb0\
-\x4b\xb6\x5c\x42\x69\x8c\x5a\x8a\x71\x66\xc6\x75\xa6\xb9\x60\xc6\
-\x44\x51\x76\x4c\xb9\x86\x31\x73\x98\x59\x73\x6b\x66\x64\xc6\x76\
-\x43\x37\x49\xd1\x24\x42\x85\xee\x8b\x2e\xdb\x45\xa5\x36\x45\xd2\
-\x0d\x51\x72\xa9\x94\xb4\x29\x84\xfc\x90\xed\xe2\x37\x83\x4a\x68\
-\xf7\x77\xd9\x3f\xcf\xf3\x7a\x9d\x73\x9c\xef\xf7\xfb\xf9\xbe\x9f\
-\xf3\x3c\xcf\xf7\xf1\xfc\x33\xf1\x5e\x8b\x17\x68\x69\x1a\x69\xc2\
-\x60\x30\x2d\x77\x37\x0a\x4d\xf1\x44\x29\x2e\x7b\xf5\x49\x8a\x7b\
-\x4c\x80\x51\xba\xe2\x01\x67\xba\xd1\x3c\x61\xb0\xe8\x39\x30\xd8\
-\xba\x38\x18\xac\x7f\x40\xf1\x7c\x09\x83\x45\x2a\x02\x5f\x85\xc0\
-\x60\xb8\x34\x18\xcc\x40\xb0\x23\xf8\x1a\x55\x11\xab\x21\x74\xf3\
-\x13\xc3\x60\xda\x25\xca\x4b\x25\xc5\x52\xdb\x18\x06\x73\xd4\xe3\
-\xd0\x7d\x25\xbe\x9e\x1e\x38\xa6\x80\x67\xcd\x60\x09\x42\x41\x6b\
-\x29\x4f\x08\x53\x36\x3c\x49\x2a\x64\x30\x23\x40\x09\x3c\x14\x0c\
-\xe7\xf0\x09\x88\x8e\xc2\xcb\x08\x38\x87\x45\x40\xf8\xd8\x79\xa2\
-\x3c\x85\x64\x90\xcd\x71\x8b\x16\x81\xde\xd1\x8b\xe9\xcc\xe8\x08\
-\x26\x96\x85\x20\x11\x35\xf1\x52\x9c\x22\x01\x0f\x94\x30\xe0\x52\
-\x1e\x97\x2f\xc6\x49\x09\x88\xc1\xbc\x38\xc5\xdf\x4a\x33\x80\x80\
-\x0f\x86\x48\x22\x08\x08\x67\xa5\x03\xee\xeb\xe9\x05\x27\x0b\x44\
-\x20\xdc\xce\xda\x1e\xc9\x44\xdb\x38\xc2\x1d\xb0\xd6\x68\x3b\xac\
-\x23\xc6\xd6\x0a\x8e\x41\xa1\xed\x01\x14\x16\x40\xdb\x22\x51\x68\
-\x1c\x0a\x8b\x43\xa1\xe1\xc3\x0d\x41\xd4\x54\xdc\xf1\x22\x56\x18\
-\x8e\x46\xa1\x0e\xe3\x14\x6f\x04\x04\x5b\x22\x11\xe2\x00\x20\x2a\
-\x2a\xca\x3a\xca\xc6\x5a\x20\x0a\x07\xd0\x58\x2c\x16\x40\x61\x00\
-\x0c\x06\xa9\x88\x40\x8a\x65\x7c\x09\x43\x8a\xe4\x8b\xcd\x86\x92\
-\x7c\xca\x43\x01\xc5\x4c\x11\x47\x28\xe1\x08\xf8\x70\xe5\x3b\x23\
-\x54\x10\x29\x21\x20\x10\x9a\xf0\x11\x6d\xf8\xbb\x78\xc2\xcf\x20\
-\xbe\x78\x78\xec\x14\xa3\x08\x48\x19\x42\x00\x6d\x8d\x02\xc6\x13\
-\xb1\x98\x9f\x35\xc2\x48\x11\x77\xb0\x6b\x2c\x26\x00\x72\x41\x1e\
-\xc8\x97\x88\x15\x3a\xf4\xb8\x3a\x21\x5b\x20\x11\x88\xd9\x82\x6f\
-\x20\x3f\xbb\xbf\x09\x56\xf4\xd6\xd3\xf3\xaf\xfb\xcb\xe3\x8d\xab\
-\x14\x4b\x5c\x57\x4a\xfe\x5a\x29\xa6\xcb\x84\x20\x40\x03\xc5\x82\
-\x48\x11\x13\x74\x5d\xa9\xf8\x14\xb3\xf1\x52\x49\x38\x61\x61\xe3\
-\x67\x52\x7a\xbe\xd9\x77\x50\xca\xf9\x86\x4c\xe9\x19\x92\x11\xbf\
-\xe8\xf0\x8a\x6f\xc5\x91\x45\x20\x43\x22\x10\xd1\x05\x02\x2e\x71\
-\x68\x95\x79\x7d\x1a\x23\x38\x99\xac\x5c\x55\x0e\x70\x0b\x1f\x0e\
-\x9f\x25\x88\x12\xcf\xc5\x03\xa3\x25\xe3\x65\x03\x29\x8a\x8b\xa8\
-\x54\x22\x51\x36\x48\x0c\x96\x8e\x46\xe1\x6c\x1c\x71\xb6\xb6\xfe\
-\x23\xf4\x43\x41\xa3\xe4\x9e\x02\x16\x27\x4c\x36\x46\x8e\xc6\xa1\
-\xb1\x38\xb4\xe3\xb0\x7c\x44\xd0\x68\xb9\xa2\x6a\x58\x0c\x09\xe3\
-\xef\x12\x8c\x0c\x1b\x91\x82\xc5\xc4\x85\x09\x44\x3c\x86\x84\xc8\
-\xe1\x31\xc2\x41\x40\xc8\x0f\xc7\x03\x5f\x8c\x23\x22\x3f\x2f\x23\
-\x1c\x59\xc0\x15\x88\x14\x3d\x02\x89\x36\x78\x60\x3c\xf3\xd7\x5d\
-\xf4\xf4\xc4\xb9\xf3\xc5\x12\x06\x9f\x09\xba\x53\x88\x0a\x83\x35\
-\x87\xc3\xc2\xb1\x18\xb6\xa1\xa1\x0e\x0c\x16\xd2\x9e\xc1\xb4\x45\
-\x62\x6d\x6c\x41\x64\xa8\x2d\x0a\x85\x44\x85\x86\xd9\x61\xc3\xd0\
-\x18\x47\x14\x26\x74\xb0\xeb\x5f\xcb\xc7\xa4\xa6\x08\x98\x91\xca\
-\xf2\x18\x4e\xcd\xfa\x2f\x53\x8f\x90\x8f\x49\xbd\x44\xc4\x51\x6c\
-\x6d\x0c\xee\xff\x89\x18\x27\xcd\x18\x94\x1b\x47\xac\x58\x5d\x32\
-\xe2\x57\x0b\x7c\x70\xd3\xf1\x06\x57\x7c\x6d\xfd\xe4\xe0\x72\x06\
-\x37\x21\x21\x43\x24\x06\x95\x25\x46\x40\x7c\xaa\x31\xc4\x18\x81\
-\x52\x33\x58\xaa\x38\x06\x53\xb9\x7d\x11\x99\x83\xcb\x91\x85\x07\
-\xbe\xb2\x7e\x5b\xc6\xf9\x5f\x27\x70\x8c\xfc\xdb\x8c\x28\x36\xc8\
-\xff\x46\x05\x8d\x08\xf8\xb6\x5e\x2c\x08\x93\x44\x31\x44\xa0\x73\
-\xb8\x62\x90\xff\x93\xba\x1e\x4f\x36\x66\xa8\x81\xa1\xb1\x1e\x35\
-\x33\xc0\xd8\xa9\xf9\x34\xdd\x63\xa7\x12\xaf\xdc\xc0\x94\xcb\x40\
-\x01\x60\x0c\x0e\x34\x1a\x0f\x8c\xb1\x8d\x8e\xf7\x55\x4e\x27\x37\
-\x72\xd0\x67\x83\x1a\x6c\x00\x5a\x79\x1f\xd6\x8e\xf4\x8f\xd6\xfa\
-\xfd\x8d\xd6\xef\x2f\xb4\x5f\x5c\x4b\xf9\x1c\x09\x11\x33\x2c\x19\
-\x65\x1e\xa1\x52\xee\xb3\x43\xc5\xef\xad\x38\x12\x80\x44\x7b\x3b\
-\x3b\x1b\x3b\x3c\x30\xda\x3c\x5a\xe1\xc5\x91\x82\x5c\x5f\x0a\x47\
-\x51\x12\x62\x65\x3f\xb0\x68\xfb\x61\xd1\x68\xcf\xb8\x4a\xbf\x2f\
-\x7e\x34\xca\xf6\x2b\xa9\xdf\x18\xe9\xd0\x7c\x8d\xf8\xff\x3d\x74\
-\x38\x00\x86\x4f\x07\x8a\x83\x09\xf0\xf9\x64\x32\xde\x0a\xfb\xe7\
-\x1b\x04\x81\x20\x10\x04\x82\x40\x10\x08\x02\x41\x20\x08\x04\x81\
-\x20\x10\x04\x82\x40\x10\x08\x02\x41\x20\x08\x04\x81\x20\x10\x04\
-\x82\x40\x10\x08\x02\x41\x20\x08\x04\x81\x20\x10\x04\x82\x40\x10\
-\x08\x02\x41\x20\x08\x04\x81\x20\x10\x04\x82\x40\x10\x08\x02\x41\
-\x20\x08\x04\x81\x20\x10\x04\x82\x40\x10\x08\xf2\x0f\x43\x34\xbf\
-\xfc\xd6\x0f\xe4\xb3\x08\x88\x28\x04\x89\x48\x36\x47\x20\x61\xb0\
-\xc9\x09\xee\x14\x67\x3a\x9b\xdc\x9e\xae\x21\xf4\x76\x9d\x7e\x7d\
-\x60\xb5\xbb\x91\xe8\xf4\xcb\xe4\x9d\x26\x3a\x4e\x7b\x10\x41\x5e\
-\x74\x61\xe5\x4f\x49\xc5\x9a\x5b\xca\x60\x5b\x62\x55\xfd\x8f\x6c\
-\xd6\xd5\x71\x0d\xd7\x61\x34\xeb\x1f\xa4\x4d\xd4\x93\x24\x6d\x51\
-\xcd\xaf\xc9\x51\xc7\x20\x54\x55\x63\xd5\x1d\x73\xee\x8b\x52\x5d\
-\x38\x55\x96\xbc\xf4\xfd\x77\x9e\x16\x64\x18\xb4\x3b\x73\xaa\x37\
-\xba\xef\xb9\x21\xc0\xc9\xcb\x7f\x5f\xfd\xae\xb7\xa1\xa3\xd6\xe1\
-\xdd\x5a\x53\xbe\xea\x83\x75\x8d\xdd\x8b\xd0\xd8\x46\xed\x82\xea\
-\x0d\x4b\x3f\x9c\x6e\xd9\xdf\x0a\x0f\xea\x02\xd6\x38\x64\xb5\x89\
-\xf4\x1e\x9b\x24\xc7\xdf\x89\x93\x3f\x79\x9d\xbf\xc9\xab\x95\x12\
-\x7f\x27\x7e\xef\x5d\x11\x77\x86\x4e\x9c\xf4\x20\xbd\xed\xe5\xac\
-\x09\x5d\x0f\x80\xbc\xf4\xf4\x84\x9d\x19\xd5\x3f\xd1\xd8\x2e\xac\
-\x05\x76\x07\x4c\xd7\xd1\xd5\x9d\xad\x3c\x2f\x14\xb5\x15\x25\xfa\
-\x19\x24\xfd\x29\xff\xa9\xad\x7d\xd6\xfb\x50\x27\x7e\xa9\xf3\xd6\
-\x1a\xe4\xd5\xe3\x8d\x7b\x28\x92\x55\x8e\xb3\x31\x2a\xfc\xd4\x45\
-\x17\x35\xcf\x95\xdd\xb8\xb7\x7e\xc2\xc1\x09\x0d\x80\xaf\xce\xf9\
-\xa7\x56\x55\x4b\xe8\x9b\x7d\x1a\xa8\x19\x2e\x2d\xb5\xc7\xbc\xa5\
-\xe6\x76\x06\x67\x56\x4e\xa6\x1b\x2d\xd9\xda\x80\x3c\x93\xb4\xb4\
-\x4e\x28\xaa\x63\xeb\x72\xe8\x3a\x16\x93\xaf\xb2\x7b\xaf\x2d\x33\
-\x2f\x33\xf5\xda\x11\x50\xab\x66\x19\x11\x98\xb4\xc8\xa5\xf3\x0a\
-\x01\xf7\xfd\xcb\x03\xcd\x7d\x67\x37\x2e\x93\x15\x79\x79\xc5\xd4\
-\xa9\xd5\x84\xbe\x94\x07\xc0\xbf\x4b\xa9\x6c\xd6\x13\x7a\xe5\xa5\
-\x06\xe5\x95\xcc\xbc\x11\xef\x1b\x9e\x96\x50\x1e\xef\xff\xb3\x38\
-\xe6\x63\x25\xc1\x65\x63\xec\xc9\xe5\x28\x8f\xe3\x14\xc6\x19\x79\
-\x01\xa7\x79\xea\x7a\x9a\x34\xf1\x11\xaf\x88\x10\x1c\x7c\x40\x27\
-\x57\x6f\x41\x9f\xd6\x3e\x2d\xb7\x7d\x3b\xe2\xee\x05\x19\x5a\x58\
-\x62\xc8\xfb\xbd\xe3\xfa\x8f\x5f\x0d\xd9\x78\x4c\x3e\x29\x62\x20\
-\x33\xc6\xe0\xb1\x71\xf9\xbb\xfb\xb5\x33\xde\xa7\x32\xc4\xd1\x99\
-\x17\xff\xe4\xcf\x7c\x73\x5d\x42\xf5\x39\xa3\x7b\x4d\x7f\x72\x1f\
-\x65\xab\x4b\xec\x2d\x7d\x73\x7e\x7f\x8e\xce\xb4\xde\xe9\x52\x52\
-\x30\xfb\xa4\x4a\xf0\xa1\x8e\xeb\x16\x5b\xba\x99\x85\x8b\xc9\x19\
-\x3a\xda\x47\xe9\x4e\x91\x1b\x52\x42\x1f\x25\x9e\x0f\x30\xb9\xfe\
-\x5b\xc7\x3e\x67\x3a\x37\xad\xb6\x90\xd3\x64\x91\x1d\xa5\x95\x70\
-\xdd\x27\x8e\x39\xd7\xa1\x4c\x5a\x28\x9f\xfa\x48\x3e\x8b\xa4\xef\
-\x27\x5b\x63\x35\x90\xff\xbc\xff\x2e\x57\x7b\x46\x7d\xaf\xc1\xb2\
-\x25\x03\x93\x16\xbf\x29\xa4\x99\xbd\xe0\x59\x95\xe7\xff\x61\x84\
-\x3f\x13\x02\x37\x59\xd8\x7e\xab\xc1\x08\x13\xe6\x83\xde\xb6\xb3\
-\x56\xf6\xd0\x9c\x43\x4e\x26\xa0\x6a\xc4\xd9\x2a\x1d\x2f\x76\x77\
-\xd6\x27\x8b\x2c\x2c\x1c\xe8\x79\xdc\x1f\x7e\x8c\xde\xb5\xf5\x6a\
-\x2b\xa1\x9e\x64\x52\x95\x2b\x0d\xf0\xb6\xe5\x38\xdd\x7d\x49\xb3\
-\xda\x97\x94\xb8\xe8\xf0\x4d\x1d\x93\x83\x4e\xea\x5a\x2d\x47\x56\
-\x5c\x65\xe5\x95\x16\xad\xb8\x84\x8a\xbc\x5f\x1c\x5a\x61\x59\x4d\
-\x53\xbb\xe8\x41\xf2\x8a\xed\x31\xcf\xcd\x6a\x2d\x12\xc5\x2d\xb5\
-\xce\xba\xf7\xfa\x6a\xcf\x53\xda\x2a\xfb\x2c\xb3\x0f\x37\x4b\xf6\
-\xf6\x70\x74\x5d\xac\x2f\x88\xaf\x95\x70\x3d\x5a\x4f\x19\xa5\x50\
-\xbf\x43\x48\xe6\x99\xbc\x78\x7e\x2d\xac\x64\xb9\xc1\x86\xed\x03\
-\x7b\xef\xb7\x35\x07\xa8\x35\xe4\x57\x10\x0f\xbd\x98\xf6\xbb\x87\
-\x5e\x42\xfe\xbc\x5b\x53\xc2\x28\xb4\xc5\xa6\xa5\x03\xec\x75\x71\
-\x7e\xf7\xd7\x45\x4f\xe2\xfa\x5f\xd8\xf4\xa0\x7b\xda\xbb\xf2\xee\
-\x68\x6b\x2f\xe1\xb2\x14\x3f\x76\x4f\x4c\x3f\xf6\xd9\x09\xf6\xbb\
-\x09\x0b\x1f\xe6\x16\x9e\x46\x52\xaa\x5f\x75\xac\x42\x99\x34\xc8\
-\x9f\x39\x69\x2f\x30\xbc\x35\xe5\x4f\xb0\xff\x64\xc7\x6f\x7a\x77\
-\x77\xbf\x38\xd1\x2c\x3d\x5f\xdb\xa0\x36\x25\x3b\xee\xfc\xda\xd0\
-\xc8\x7a\x7b\x7f\x8e\xc3\xce\xa7\x7b\x1d\x0b\x96\x3e\x28\xe2\x47\
-\x86\x54\x35\x99\x4a\x43\x9a\xda\x2f\xde\x31\x58\xa5\x95\x6d\xd9\
-\xd5\xd5\x98\x92\x26\x3e\x97\x17\xb4\x86\x5e\x73\xa1\x3f\xcd\xb0\
-\xf9\xe4\x82\xc2\x5f\xe1\x2f\x9b\x5a\x1c\x06\xe4\xb2\x46\x33\x2b\
-\x5a\x4c\xa5\x36\xad\x7e\x67\xe6\x91\x2c\xa1\xa1\x2d\x51\x63\xd1\
-\x4a\x8f\x12\x2d\xf7\xae\xf7\xd4\xe0\x1b\xb8\x80\xc4\x45\x74\x93\
-\xba\xe2\x26\xf6\xc4\xeb\x81\x87\x7b\x03\x3b\x63\x66\xe7\xcf\x00\
-\xfa\xb6\x16\xb9\x1a\x85\xf7\xcd\x31\x6e\xce\x31\xc5\xd4\xc3\x1c\
-\xf6\xda\x17\x53\x32\xb2\x85\x2d\xad\x97\xa5\xfd\x4c\xf7\x9f\x8f\
-\x9d\x70\x6e\x24\x6f\xea\x39\x1c\xfe\xac\x0e\xbc\xd1\x84\x8a\x09\
-\x77\x6d\x64\xeb\x12\xb3\xaf\x23\x93\xb3\x2d\xc2\xe5\x87\xce\x3a\
-\xde\xdc\x9e\x29\xd6\x57\xc7\x60\x2f\xcd\xac\xc2\x9c\xac\x72\xb4\
-\x7d\xbe\xd8\xaa\x6c\x66\xc5\xa5\xbb\x8f\x2b\x2b\xb7\x5d\x8e\x74\
-\x9b\xb1\xb7\xf5\x07\xed\x84\x62\xf9\xed\x99\x65\xd3\x54\xfb\xd0\
-\x57\x7e\xdd\x8e\x6b\xaa\xbf\x78\xea\x9d\xdc\x2d\x7a\xe2\xd1\x80\
-\xad\xaf\x96\x9a\x9e\xcd\x3d\x1b\x55\x9b\xc1\x5b\x6e\xd4\xae\x36\
-\xe0\x10\x3b\x69\x42\x7a\x96\x4a\xcc\x8f\x6c\xa7\x2c\x0d\x23\x1d\
-\xf6\x38\xaf\xd1\x93\x4e\xec\x4f\xe9\xdd\xa6\x43\x5b\xbb\x4d\x95\
-\xb4\x9e\x35\xb0\xf9\x85\x4b\xfb\x1e\x51\x61\xc2\xac\xf9\xd1\x3f\
-\xa4\xe1\x4b\xb6\x26\x59\x82\x6f\x57\xb6\x03\xd2\x0f\xc9\x1e\x74\
-\x9f\xb3\x24\x72\xed\xdc\x87\x9d\x7b\x5c\x7d\xe5\xe1\x4d\x18\xbd\
-\xe2\xd7\x12\x72\x8b\xcd\xe9\xf9\x24\x59\xd8\x82\x79\x6d\x81\x47\
-\xe0\x15\x9b\xbb\x96\x37\x96\x5c\xc0\xce\x97\x1e\xee\x2d\x6a\x23\
-\x1f\x6c\xf9\x57\x9d\x2c\xd3\xe2\xb8\x33\xeb\x88\x39\x3b\xed\x8f\
-\x5d\x0f\xfd\x54\x18\x55\x3b\x26\x27\xf5\x3e\x55\xb7\xf6\xf5\xcd\
-\x6d\x4b\xba\x31\x27\x30\xa6\x2e\xa3\x67\xbe\xc9\xf6\xe0\xd8\x3d\
-\xad\xdb\xa3\xa9\x1a\xb0\x36\xa1\x4f\xaa\x4c\x3b\xa3\x22\xed\xae\
-\xfb\x9c\x98\xcc\xd0\xc3\xbf\xd6\x24\x6a\xbe\x29\x2d\xfc\x70\xda\
-\x57\x96\x7a\xf6\xf7\xa2\xae\xfe\xa6\x47\x65\x6b\x22\x48\x57\x73\
-\xf0\x93\x2f\xb5\x69\xca\x93\xd3\x54\xb1\xad\xfb\x93\x5b\x56\xa4\
-\x06\xb5\xd5\xe1\x79\xd8\x3d\x1f\xeb\x42\x8a\x4b\x08\x93\xd6\x68\
-\x1b\x39\x5b\x96\x97\x86\xe0\x02\x34\xae\xad\xad\xbf\x63\x64\x75\
-\xd1\xec\x66\x75\x32\xfb\x40\xa5\xe3\x1e\xeb\xbc\xb4\xa4\xc4\xe2\
-\xc6\x3f\xcc\x10\xd4\x89\x47\x3d\x54\x0f\x17\x4f\xf4\x76\xb7\x9b\
-\x2a\x58\x52\x74\xcb\x98\x5a\xe0\x66\xc6\x4e\x54\xf1\x98\x32\xfd\
-\x5d\x9c\xca\xa6\x44\xfb\x63\xf7\x50\xc9\x17\x77\xb9\x34\x38\x3d\
-\xc5\x38\x3a\xc7\xdc\xfe\x88\xf6\x42\x39\xe7\x6b\x27\xf6\xaa\xc4\
-\x53\x8a\x32\x6f\xa3\x7d\x7b\xc4\xf3\x48\xcd\xe0\x8e\xa9\xb9\x81\
-\x1e\x32\x00\xe7\xbd\xd1\xfd\x51\x63\x69\xfa\xee\x86\x92\xc7\x1f\
-\xe3\xdc\x3d\x96\x3b\xe8\x3d\xa1\x83\xc8\x50\xbd\xa9\x1f\x3d\x7a\
-\xe3\x63\xd3\xa7\xf6\x16\x75\x4e\x60\x4d\xd9\xc2\xb3\x95\x51\x4f\
-\x21\x1a\xaf\xe4\xcb\x7c\x6d\x9e\x19\x9f\x2b\xdb\x10\xd4\x55\x6c\
-\xf9\x86\xf0\xa1\x14\xfe\x7d\xc6\xc3\x4d\x05\x76\x07\x90\x88\x59\
-\x09\x62\x73\xcf\x84\xf8\xe9\xfb\x2f\x2c\x5f\xee\xc3\xae\x81\x01\
-\x19\xa9\xed\xae\x35\x5b\x2e\x79\x45\x58\x90\x74\x69\x41\xd1\x77\
-\x7e\x34\xd6\x7d\xe5\x75\xe0\x12\x49\xb5\xe0\xd1\x03\xcf\xb6\x97\
-\xd9\x58\xb5\x5e\x7d\xbf\xe4\xdf\x2a\xca\xf4\x6e\x5c\x58\x11\x44\
-\x5d\xf1\xb1\x29\xdf\xe8\x76\xeb\x87\xe0\xcc\xe0\x44\x7d\xe3\xa2\
-\x90\xe5\x3e\x87\x9a\x9f\x1c\x06\x06\x9c\x58\x5b\xeb\xe5\xb3\x76\
-\xda\xa4\x1c\xd4\x0f\x6c\xb4\xd1\x06\x78\xd3\x7b\x8e\x2f\x7b\xb8\
-\x53\xc5\x55\x7f\x72\x69\xbb\xfd\x13\xdf\xa3\x33\xeb\x71\x2b\xca\
-\x6f\x36\x55\x96\x2f\x5c\xb5\x70\x45\x79\xbd\xff\x96\x25\x1d\x2e\
-\xa6\xba\x69\xa7\x6a\x12\x4b\xd2\xf7\x57\x4b\x63\x7d\xa6\xdf\xc1\
-\x2f\x33\x2b\x4b\x6b\xea\x7e\xee\x76\x7e\xee\x4c\xc3\x0a\xc1\xf3\
-\xd5\x7e\x7a\xdd\x57\xd7\xab\x97\xde\xfb\x40\x9d\xcd\x3f\xbf\x4e\
-\x1c\x36\x19\x37\xef\xe0\xfb\x20\x33\xcf\x40\xb2\x89\x23\x06\xa1\
-\x92\xf1\xba\xa3\xa5\xba\xd9\x90\x28\xcb\x32\x5d\xb0\xb2\xd9\x8c\
-\x59\xbf\xcc\xf1\xc8\xc3\xa3\xaf\x36\x3f\xd1\x22\xf5\xaa\xa7\x6a\
-\x04\xe2\x40\xef\xee\xd7\x39\x1e\x79\xcc\xdc\xbe\xd7\x8f\xfc\xf1\
-\x55\x07\x7b\x6e\x86\x67\x7c\xdf\xb9\xa3\xbb\x5c\x85\x1b\xf8\x56\
-\xad\x11\x68\xd6\x34\x64\x85\x19\x6b\x57\x78\x50\x53\x82\xbe\x8b\
-\x59\x78\xc2\x67\x67\x88\x77\x01\x2d\xf3\x54\xdf\x6e\x9f\x5f\xa8\
-\x4f\x52\x82\x92\x2f\x5e\x42\xbe\xd5\x75\xf1\xec\x62\xfb\x93\x58\
-\xc6\x2f\x72\xfa\xb2\x8c\xdf\x1a\x58\xb6\x9d\x5a\xaf\xf3\xf4\x72\
-\x76\x9d\xf1\xec\xba\x2b\xf7\x4b\x7f\x61\x1e\xb5\x25\x3d\xba\x03\
-\xc8\xc3\xdf\x5e\x53\x8b\x44\xeb\xa7\x9f\x10\x35\x1f\x2e\x5b\xf8\
-\x5a\x2b\x6a\x87\xc9\xd4\x5e\x43\xed\x7c\x69\x0e\xb5\x94\x84\x6d\
-\xd5\x5f\xf9\x7c\xc9\x24\xff\x84\x46\xad\x4e\x11\xfe\xf8\x04\xef\
-\xc5\xf7\x3b\xb7\x7f\xdc\xd5\x97\x48\x1d\x38\x17\x91\xbd\x4a\x75\
-\x00\xd6\xf5\x94\xa0\xe1\xb4\x7a\xfd\x2d\xe5\xaf\xf3\xdd\x5d\x17\
-\x53\x8e\xb9\x84\xc4\xfe\x1b\x93\x6a\x5f\xae\
-"
-
-qt_resource_name = "\
-\x00\x09\
-\x0a\xc9\xc3\x8b\
-\x00\x77\
-\x00\x61\x00\x74\x00\x65\x00\x72\x00\x6d\x00\x61\x00\x72\x00\x6b\
-\x00\x08\
-\x07\x65\xf7\x5e\
-\x00\x61\
-\x00\x70\x00\x70\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\
-\x00\x04\
-\x00\x07\x35\xdf\
-\x00\x6c\
-\x00\x6f\x00\x67\x00\x6f\
-"
-
-qt_resource_struct = "\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
-\x00\x00\x00\x2e\x00\x01\x00\x00\x00\x01\x00\x00\x7d\xbb\
-\x00\x00\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x79\x89\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
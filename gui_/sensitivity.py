@@ -0,0 +1,52 @@
+from qtpy.QtWidgets import (QDialog, QComboBox, QVBoxLayout)
+from qtpy.QtCore import SIGNAL
+from matplotlib.backends.backend_qt4agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from rpm.sensitivity import parameter_label
+
+
+class SensitivityDialog(QDialog):
+    """Plots the results of a sensitivity analysis one parameter at a time"""
+
+    def __init__(self, results, parent=None):
+        """
+        :param results: mapping of parameter name to SweepResult as returned by rpm.sensitivity.sensitivity
+        """
+        super(SensitivityDialog, self).__init__(parent)
+        self.results = results
+        self.setWindowTitle("Sensitivity Analysis")
+        self.resize(700, 550)
+
+        self.parameterCombo = QComboBox(self)
+        self.parameterCombo.addItems([parameter_label(parameter) for parameter in results])
+        self.figure = Figure()
+        self.canvas = FigureCanvas(self.figure)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.parameterCombo)
+        layout.addWidget(self.canvas)
+
+        self.connect(self.parameterCombo, SIGNAL("currentIndexChanged(int)"), self.plot)
+        self.plot(0)
+
+    def plot(self, index):
+        result = list(self.results.values())[index]
+        values = getattr(result.values, "magnitude", result.values)
+        unit = getattr(result.values, "units", "")
+        x_label = "{} ({:~})".format(parameter_label(result.parameter), unit) if unit else \
+            parameter_label(result.parameter)
+
+        self.figure.clear()
+        fos_axes = self.figure.add_subplot(211)
+        fos_axes.plot(values, result.factor_of_safety, label="Pillar")
+        fos_axes.plot(values, result.bearing_capacity_factor_of_safety, label="Bearing Capacity")
+        fos_axes.set_ylabel("Factor of Safety")
+        fos_axes.legend(loc="best")
+        fos_axes.grid(True)
+
+        ratio_axes = self.figure.add_subplot(212, sharex=fos_axes)
+        ratio_axes.plot(values, result.extraction_ratio)
+        ratio_axes.set_ylabel("Extraction Ratio (%)")
+        ratio_axes.set_xlabel(x_label)
+        ratio_axes.grid(True)
+        self.canvas.draw()
@@ -3,45 +3,71 @@ from __future__ import generators
 from __future__ import absolute_import
 
 import sys
-from os.path import (dirname, join)
-from qtpy.QtGui import QPixmap
-from qtpy.QtCore import (QSize, SIGNAL)
-from qtpy.QtWidgets import (QApplication, QWizard)
+from collections import OrderedDict
+from qtpy.QtCore import (QSize, QTimer, SIGNAL)
+from qtpy.QtWidgets import (QApplication, QWizard, QGroupBox, QLabel, QVBoxLayout, QSpinBox)
 
 from . import wizard_ui
-from . import GUI_DIR
+from .images import pixmap
+from rpm import (DimensionalityError, unit_reg, Q_)
+from rpm.cases import CASE_FIELDS
 from rpm.constants import (OreTypes, Countries)
-from rpm.rpm_oop import ALL_FORMULA
+from rpm.preview import (LivePreview, PREVIEW_OUTPUTS, FORMULA_FIELDS)
+from rpm.rpm_oop import (RoomAndPillar, available_formula, name_to_formula)
+from rpm.utils import (text_to_enum, enum_to_text)
 
 
-def text_to_enum(enum, text, sep=" "):
-    """
-    Converts a string to a value in an enumeration by converting the string
-     to lowercase and replacing spaces with underscores
-    enum_name: case-sensitive string of the enumeration name
-    text: case-insensitive string probably formatted for human use
-    """
-    text = text.lower().replace(sep, "_")
-    for enum_ in enum:
-        if enum_.name == text:
-            return enum_
-    raise ValueError("{} has no {} attribute".format(enum, text))
+UNICODE_UNITS = {
+    "°": "degree",
+    "kg/m³": "kilogram per metre ** 3",
+}
+# case field: spin box of its value
+FIELD_SPINS = OrderedDict([
+    ("room_span", "roomWidthSpin"),
+    ("min_extraction", "minExtractionSpin"),
+    ("sample_height", "sampleHeightSpin"),
+    ("sample_diameter", "sampleDiameterSpin"),
+    ("sample_strength", "uniaxStrengthSpin"),
+    ("friction_angle", "frictionAngleSpin"),
+    ("cohesion", "cohesionSpin"),
+    ("rmr", "rmrSpin"),
+    ("seam_height", "seamHeightSpin"),
+    ("seam_dip", "seamDipSpin"),
+    ("mine_depth", "oreDepthSpin"),
+    ("overburden_density", "overburdenDensitySpin"),
+    ("floor_density", "floorDensitySpin"),
+    ("k", "constantKSpin"),
+    ("alpha", "constantASpin"),
+    ("beta", "constantBSpin"),
+])
+# milliseconds of quiet after an edit before the preview is recomputed
+PREVIEW_DELAY = 150
 
 
-def enum_to_text(enum, sep=" "):
-    """
-    Converts an enumeration to a format for display in gui
-    """
-    enum_name = enum.name
-    return enum_name.replace("_", sep).title()
+def quantity_from_spin(spin_widget):
+    magnitude = spin_widget.value()
+    unit = spin_widget.suffix().strip()
+    # pint does not support unicode units
+    unit = UNICODE_UNITS.get(unit, None) or unit
+    try:
+        unit = unit_reg(unit)
+    # AttributeError for when unit is None or NoneType
+    except (DimensionalityError, AttributeError) as e:
+        # print(e)
+        unit = None
+    quantity = Q_(magnitude)
+    if unit:
+        quantity *= unit
+    # print(quantity)
+    return quantity
 
 
-def name_to_formula(name):
-
-    for formula in ALL_FORMULA:
-        if formula.name == name:
-            return formula
-    raise ValueError("No formula called {}".format(name))
+def format_output(value):
+    if value is None:
+        return "-"
+    if isinstance(value, Q_):
+        return "{:.2f~P}".format(value)
+    return "{:.2f}".format(value)
 
 
 class ProjectWizard(QWizard, wizard_ui.Ui_Wizard):
@@ -49,13 +75,18 @@ class ProjectWizard(QWizard, wizard_ui.Ui_Wizard):
     def __init__(self, parent=None):
         super(ProjectWizard, self).__init__(parent)
         self.setupUi(self)
+        self.preview = None
+        # case fields edited since the preview was last recomputed
+        self._edited = set()
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_DELAY)
         self._configure_widgets()
+        self._create_preview()
         self._bindings()
         self.update_constant()
-        watermark = QPixmap(join(GUI_DIR,"watermark.png"))
-        logo = QPixmap(join(GUI_DIR, "icon.png"))
-        self.setPixmap(QWizard.LogoPixmap, logo)
-        self.setPixmap(QWizard.WatermarkPixmap, watermark)
+        self.setPixmap(QWizard.LogoPixmap, pixmap("icon"))
+        self.setPixmap(QWizard.WatermarkPixmap, pixmap("watermark"))
         self.setOption(QWizard.ExtendedWatermarkPixmap)
         self.setMinimumSize(QSize(650, 500))
         self.setWindowTitle("New RAP Project Wizard")
@@ -65,6 +96,99 @@ class ProjectWizard(QWizard, wizard_ui.Ui_Wizard):
 
     def _bindings(self):
         self.connect(self.pillarFormulaCombo, SIGNAL("currentIndexChanged(QString)"), self.update_constant)
+        self.connect(self.preview_timer, SIGNAL("timeout()"), self.refresh_preview)
+        self.connect(self.previewBox, SIGNAL("toggled(bool)"), self.toggle_preview)
+        for field, spin in FIELD_SPINS.items():
+            signal = "valueChanged(int)" if isinstance(getattr(self, spin), QSpinBox) else "valueChanged(double)"
+            self.connect(getattr(self, spin), SIGNAL(signal), lambda value, field=field: self.field_edited(field))
+        for combo in (self.locationCombo, self.oreTypeCombo, self.pillarFormulaCombo):
+            self.connect(combo, SIGNAL("currentIndexChanged(int)"), lambda index: self.field_edited(*FORMULA_FIELDS))
+        self.connect(self.redesignRadio, SIGNAL("toggled(bool)"), lambda checked: self.field_edited(*FORMULA_FIELDS))
+        self.connect(self.cylindricalSampleRadio, SIGNAL("toggled(bool)"),
+                     lambda checked: self.field_edited("cylindrical"))
+        self.connect(self.drillBlastRadio, SIGNAL("toggled(bool)"), lambda checked: self.field_edited("fragment_method"))
+
+    def _create_preview(self):
+        """Adds the live preview of the outputs beside the pages"""
+        self.previewBox = QGroupBox("Live Preview", self)
+        self.previewBox.setCheckable(True)
+        self.previewBox.setChecked(False)
+        self.previewLabel = QLabel(self.previewBox)
+        self.previewLabel.setWordWrap(True)
+        layout = QVBoxLayout(self.previewBox)
+        layout.addWidget(self.previewLabel)
+        layout.addStretch()
+        self.setSideWidget(self.previewBox)
+
+    # ------------------ LIVE PREVIEW ------------------------#
+
+    def field_edited(self, *fields):
+        """Records the edited case fields and restarts the preview delay"""
+        if not self.previewBox.isChecked():
+            return
+        self._edited.update(fields)
+        self.preview_timer.start()
+
+    def toggle_preview(self, checked):
+        self.preview = None
+        self._edited.clear()
+        if checked:
+            self.refresh_preview()
+        else:
+            self.previewLabel.clear()
+
+    def refresh_preview(self):
+        """Recomputes the outputs that depend on the fields edited since the last refresh"""
+        if self.preview is None:
+            self.preview = LivePreview(self.case())
+        else:
+            self.preview.update(dict((field, self.case_value(field)) for field in self._edited))
+        self._edited.clear()
+        self.show_preview()
+
+    def show_preview(self):
+        if self.preview.error is not None:
+            self.previewLabel.setText("<i>{}</i>".format(self.preview.error))
+            return
+        rows = []
+        for output in PREVIEW_OUTPUTS:
+            label = RoomAndPillar.OUTPUT.get(output) or RoomAndPillar.PILLAR_DATA["width"]
+            rows.append("<tr><td>{}</td><td align='right'>{}</td></tr>".format(
+                label, format_output(self.preview.values[output])))
+        self.previewLabel.setText("<table>{}</table>".format("".join(rows)))
+
+    # ------------------ CASE ------------------------#
+
+    def case_value(self, field):
+        """Returns the value of a field of rpm.cases.CASE_FIELDS entered in the wizard"""
+        if field == "project_name":
+            return self.projectNameLineEdit.text()
+        elif field == "location":
+            return self.locationCombo.currentText()
+        elif field == "ore_type":
+            return self.oreTypeCombo.currentText()
+        elif field == "fragment_method":
+            return RoomAndPillar.DRILL_BLAST if self.drillBlastRadio.isChecked() else RoomAndPillar.CONTINUOUS_MINER
+        elif field == "design_type":
+            return RoomAndPillar.REDESIGN if self.redesignRadio.isChecked() else RoomAndPillar.INITIAL
+        elif field == "cylindrical":
+            return self.cylindricalSampleRadio.isChecked()
+        elif field in ("pillar_formula", "alpha", "beta", "k"):
+            # the formula is only chosen for redesigns
+            if not self.redesignRadio.isChecked():
+                return None
+            if field == "pillar_formula":
+                return self.pillarFormulaCombo.currentText()
+            return getattr(self, FIELD_SPINS[field]).value()
+        elif field in ("min_extraction", "rmr"):
+            return getattr(self, FIELD_SPINS[field]).value()
+        elif field in ("overburden_density", "floor_density"):
+            return Q_("{}kilonewtons per metre ** 3".format(getattr(self, FIELD_SPINS[field]).value()))
+        return quantity_from_spin(getattr(self, FIELD_SPINS[field]))
+
+    def case(self):
+        """Returns the case of the design entered in the wizard, see rpm.cases"""
+        return dict((field, self.case_value(field)) for field in CASE_FIELDS)
 
     def center_on_parent(self, parent):
         qr = self.frameGeometry()
@@ -102,7 +226,7 @@ class ProjectWizard(QWizard, wizard_ui.Ui_Wizard):
         self.locationCombo.setEditable(False)
         self.oreTypeCombo.addItems([enum_to_text(ore_type) for ore_type in OreTypes])
         self.oreTypeCombo.setEditable(False)
-        self.pillarFormulaCombo.addItems([formula.name for formula in ALL_FORMULA])
+        self.pillarFormulaCombo.addItems([formula.name for formula in available_formula()])
         # self.projectNameLineEdit.setText("New RAP Project")
         self.projectNameLineEdit.selectAll()
         # self.drillBlastRadio.setChecked(True)
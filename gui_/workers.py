@@ -0,0 +1,87 @@
+"""
+Background computation for the main window.
+A Worker runs a function over a list of jobs on a thread of its own and reports
+back through signals, so long designs and sweeps do not freeze the window:
+
+    progress(int, int)      jobs done and number of jobs
+    result(int, PyObject)   index of a job and what the function returned for it
+    error(int, QString)     index of a job and the message of the exception it raised
+    cancelled()             cancel stopped the jobs before the last one
+
+The signals reach receivers in the gui thread through queued connections, so the
+slots connected to them may update widgets. The jobs must not share objects the gui
+thread changes while the worker runs; designs are copied before they are handed over.
+"""
+from collections import OrderedDict
+from copy import deepcopy
+
+from qtpy.QtCore import (QThread, SIGNAL)
+
+from rpm.cases import design_from_case
+from rpm.sensitivity import sweep
+
+
+class Worker(QThread):
+
+    def __init__(self, function, jobs, parent=None):
+        """
+        :param function: called with every job in turn, outside the gui thread
+        :param jobs: sequence of the arguments of function
+        """
+        super(Worker, self).__init__(parent)
+        self.function = function
+        self.jobs = list(jobs)
+        self._cancelled = False
+
+    def cancel(self):
+        """Stops the worker after the job it is running, which cannot be interrupted"""
+        self._cancelled = True
+
+    @property
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        total = len(self.jobs)
+        self.emit(SIGNAL("progress(int, int)"), 0, total)
+        for index, job in enumerate(self.jobs):
+            if self._cancelled:
+                self.emit(SIGNAL("cancelled()"))
+                return
+            try:
+                result = self.function(job)
+            except Exception as e:
+                self.emit(SIGNAL("error(int, QString)"), index, str(e))
+            else:
+                self.emit(SIGNAL("result(int, PyObject)"), index, result)
+            self.emit(SIGNAL("progress(int, int)"), index + 1, total)
+
+
+def design_report(case):
+    """Designs a case from the wizard and writes its html report. Returns the design"""
+    rap = design_from_case(case)
+    rap.formula_decide()
+    rap.pillar_width_from_fos_and_stress()
+    rap.to_html_with_header()
+    return rap
+
+
+def design_worker(cases, parent=None):
+    """Returns a Worker that designs the cases, see design_report"""
+    return Worker(design_report, cases, parent)
+
+
+def _sweep_job(job):
+    rap, parameter, values = job
+    # worker processes are not forked from a thread that runs beside the gui
+    return parameter, sweep(rap, parameter, values, processes=1)
+
+
+def sensitivity_worker(rap, ranges, parent=None):
+    """
+    Returns a Worker that sweeps a copy of rap over every parameter of ranges in turn,
+    each result is a (parameter, SweepResult) tuple
+    """
+    rap = deepcopy(rap)
+    return Worker(_sweep_job, [(rap, parameter, values) for parameter, values in OrderedDict(ranges).items()],
+                  parent)
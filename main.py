@@ -5,6 +5,10 @@ from os import system
 if __name__ == "__main__":
     if sys.argv[1] == "test":
         system("pytest --cache-clear --durations=10 --cov=tests/")
+    elif sys.argv[1] == "batch":
+        # headless, the gui and Qt are never imported
+        from rpm import cli
+        cli.main(sys.argv[2:])
     else:
         from gui_ import main
         main.main()
@@ -1,12 +1,53 @@
+"""
+The pint unit registry and the quantities built from it are created the first time
+one of UNIT_NAMES is used, so modules that only work on floats (rpm.batch kernels,
+rpm.solvers, rpm.compiled, ...) can be imported without the cost of pint.
+Diagnostics of the calculations are logged at DEBUG level to the loggers under "rpm",
+which are silent unless the application configures logging.
+"""
 from __future__ import absolute_import
 from __future__ import division
 
-from pint import UnitRegistry
-from pint.errors import DimensionalityError
+import logging
 
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-unit_reg = UnitRegistry()
-Q_ = unit_reg.Quantity
-DimError = DimensionalityError
-ZERO_LENGTH = Q_("0.0 metres")
-ZERO_FORCE = Q_("0.0 psi")
+
+UNIT_NAMES = ("unit_reg", "Q_", "DimError", "DimensionalityError", "ZERO_LENGTH", "ZERO_FORCE")
+
+
+def _load_units():
+    from pint import (UnitRegistry, set_application_registry)
+    from pint.errors import DimensionalityError
+
+    unit_reg = UnitRegistry()
+    # quantities sent to worker processes are unpickled into the application registry
+    set_application_registry(unit_reg)
+    Q_ = unit_reg.Quantity
+    globals().update(
+        unit_reg=unit_reg,
+        Q_=Q_,
+        DimError=DimensionalityError,
+        DimensionalityError=DimensionalityError,
+        ZERO_LENGTH=Q_("0.0 metres"),
+        ZERO_FORCE=Q_("0.0 psi"),
+    )
+
+
+def __getattr__(name):
+    if name in UNIT_NAMES:
+        _load_units()
+        return globals()[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def is_quantity(value):
+    """True when value is a pint quantity. Never creates the unit registry"""
+    Q_ = globals().get("Q_")
+    return Q_ is not None and isinstance(value, Q_)
+
+
+def quantity(magnitude, unit):
+    """Returns Q_(magnitude, unit), creating the unit registry on first use"""
+    Q_ = globals().get("Q_") or __getattr__("Q_")
+    return Q_(magnitude, unit)
@@ -0,0 +1,224 @@
+"""
+Columnar versions of Solid, Pillar and Sample.
+Every dimension is kept in a contiguous float64 array in a fixed unit (see UNITS)
+instead of one pint quantity per object, so a panel of hundreds of thousands of
+pillars takes a few megabytes. The derived quantities of the scalar classes are
+computed for all rows at once and slicing with a slice returns a view of the same
+arrays.
+"""
+from __future__ import division
+
+from collections import OrderedDict
+
+import numpy as np
+
+from . import quantity
+from .batch import (magnitudes, gaddy_factor, cubical_strength)
+
+
+# column: unit its values are kept in
+UNITS = {
+    "height": "metre",
+    "length": "metre",
+    "width": "metre",
+    "strength": "megapascal",
+    "cylindrical": None,
+}
+
+
+def _column(values, size=None):
+    column = np.array(values, dtype=float, ndmin=1)
+    if size is not None and column.size != size:
+        column = np.array(np.broadcast_to(column, (size,)))
+    return column
+
+
+class SolidArray(object):
+    """
+    Solid for many solids. Dimensions may be quantities, arrays or numbers, numbers and
+    arrays are taken to be in the units of UNITS. Like Solid, negative dimensions are
+    taken as zero and a missing or zero width is the length.
+    """
+
+    COLUMNS = ("height", "length", "width")
+    __slots__ = ("columns",)
+
+    def __init__(self, height, length, width=None):
+        height, length = magnitudes(height, UNITS["height"]), magnitudes(length, UNITS["length"])
+        width = length if width is None else magnitudes(width, UNITS["width"])
+        size = np.broadcast(height, length, width).size
+        height, length, width = (_column(np.maximum(value, 0.0), size) for value in (height, length, width))
+        width = np.where(width > 0, width, length)
+        self.columns = OrderedDict([("height", height), ("length", length), ("width", width)])
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Returns an array of solids that uses the given columns without copying them"""
+        solids = cls.__new__(cls)
+        solids.columns = OrderedDict((name, columns[name]) for name in cls.COLUMNS)
+        return solids
+
+    def _quantity(self, name):
+        return quantity(self.columns[name], UNITS[name])
+
+    def __len__(self):
+        return len(self.columns["height"])
+
+    def __getitem__(self, key):
+        """
+        Returns the scalar object of an integer index, otherwise an array of the selected
+        solids; with a slice its columns are views of these columns
+        """
+        if isinstance(key, (int, np.integer)):
+            return self.to_objects(slice(key, key + 1 or None))[0]
+        return self.from_columns(OrderedDict((name, column[key]) for name, column in self.columns.items()))
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+    @property
+    def height(self):
+        return self._quantity("height")
+
+    @property
+    def length(self):
+        return self._quantity("length")
+
+    @property
+    def width(self):
+        return self._quantity("width")
+
+    def is_square(self):
+        return self.columns["length"] == self.columns["width"]
+
+    @property
+    def volume(self):
+        return quantity(self.columns["length"] * self.columns["width"] * self.columns["height"], "metre ** 3")
+
+    def to_objects(self, key=slice(None)):
+        """Returns a list of the scalar objects of the selected solids"""
+        from .rpm_oop import Solid
+        return [Solid(*[quantity(value, UNITS[name]) for name, value in zip(self.COLUMNS, row)])
+                for row in zip(*[column[key] for column in self.columns.values()])]
+
+
+class SampleArray(SolidArray):
+    """Sample for many samples"""
+
+    COLUMNS = ("strength", "height", "length", "width", "cylindrical")
+    __slots__ = ()
+
+    def __init__(self, strength, height, diameter, cylindrical=False):
+        super(SampleArray, self).__init__(height, diameter, diameter)
+        size = len(self)
+        self.columns["strength"] = _column(magnitudes(strength, UNITS["strength"]), size)
+        self.columns["cylindrical"] = np.array(np.broadcast_to(cylindrical, (size,)), dtype=bool)
+        self.columns = OrderedDict((name, self.columns[name]) for name in self.COLUMNS)
+
+    @classmethod
+    def from_objects(cls, samples):
+        samples = list(samples)
+        return cls(np.array([magnitudes(sample.strength, UNITS["strength"]) for sample in samples]),
+                   np.array([magnitudes(sample.height, UNITS["height"]) for sample in samples]),
+                   np.array([magnitudes(sample.diameter, UNITS["length"]) for sample in samples]),
+                   np.array([bool(sample.is_cylinder) for sample in samples]))
+
+    @property
+    def strength(self):
+        return self._quantity("strength")
+
+    @property
+    def diameter(self):
+        return self.length
+
+    @property
+    def volume(self):
+        diameter, height = self.columns["length"], self.columns["height"]
+        cylinder = np.pi * (diameter / 2) ** 2 * height
+        return quantity(np.where(self.columns["cylindrical"], cylinder, diameter * diameter * height), "metre ** 3")
+
+    @property
+    def gaddy_factor(self):
+        return gaddy_factor(self.strength, self.diameter)
+
+    @property
+    def cubical_strength(self):
+        return cubical_strength(self.strength, self.diameter, self.height)
+
+    def to_objects(self, key=slice(None)):
+        from .rpm_oop import Sample
+        columns = self.columns
+        return [Sample(quantity(strength, UNITS["strength"]), quantity(height, UNITS["height"]),
+                       quantity(diameter, UNITS["length"]), bool(cylindrical))
+                for strength, height, diameter, cylindrical in zip(
+                    columns["strength"][key], columns["height"][key], columns["length"][key],
+                    columns["cylindrical"][key])]
+
+
+class PillarArray(SolidArray):
+    """
+    Pillar for many pillars. sample is a Sample shared by every pillar or a SampleArray
+    with a sample for each pillar.
+    """
+
+    __slots__ = ("sample",)
+
+    def __init__(self, sample, height, length, width=None):
+        super(PillarArray, self).__init__(height, length, width)
+        if not isinstance(sample, SampleArray):
+            sample = SampleArray.from_objects([sample])
+        if len(sample) not in (1, len(self)):
+            raise ValueError("{} samples given for {} pillars".format(len(sample), len(self)))
+        self.sample = sample
+
+    @classmethod
+    def from_columns(cls, columns, sample=None):
+        pillars = super(PillarArray, cls).from_columns(columns)
+        pillars.sample = sample
+        return pillars
+
+    @classmethod
+    def from_objects(cls, pillars):
+        pillars = list(pillars)
+        samples = [pillar.sample for pillar in pillars]
+        if all(sample is samples[0] for sample in samples):
+            samples = samples[:1]
+        return cls(SampleArray.from_objects(samples),
+                   np.array([magnitudes(pillar.height, UNITS["height"]) for pillar in pillars]),
+                   np.array([magnitudes(pillar.length, UNITS["length"]) for pillar in pillars]),
+                   np.array([magnitudes(pillar.width, UNITS["width"]) for pillar in pillars]))
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.to_objects(slice(key, key + 1 or None))[0]
+        sample = self.sample if len(self.sample) == 1 else self.sample[key]
+        return self.from_columns(OrderedDict((name, column[key]) for name, column in self.columns.items()), sample)
+
+    @property
+    def nbytes(self):
+        return super(PillarArray, self).nbytes + self.sample.nbytes
+
+    @property
+    def width_height_ratio(self):
+        return quantity(self.columns["width"] / self.columns["height"], "dimensionless")
+
+    @property
+    def cross_section_perimeter(self):
+        return quantity(2.0 * (self.columns["length"] + self.columns["width"]), "metre")
+
+    @property
+    def cross_section_area(self):
+        return quantity(self.columns["length"] * self.columns["width"], "metre ** 2")
+
+    def to_objects(self, key=slice(None)):
+        from .rpm_oop import Pillar
+        columns = self.columns
+        heights, lengths, widths = columns["height"][key], columns["length"][key], columns["width"][key]
+        if len(self.sample) == 1:
+            samples = self.sample.to_objects() * len(heights)
+        else:
+            samples = self.sample.to_objects(key)
+        return [Pillar(sample, quantity(height, UNITS["height"]), quantity(length, UNITS["length"]),
+                       quantity(width, UNITS["width"]))
+                for sample, height, length, width in zip(samples, heights, lengths, widths)]
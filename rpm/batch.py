@@ -0,0 +1,297 @@
+"""
+Vectorized versions of the pillar strength calculations in rpm_oop.
+Every function accepts numpy arrays (or pint quantities wrapping numpy arrays)
+so that many candidate pillar geometries can be evaluated in one call.
+Plain numbers and arrays are taken to already be in the unit the function expects.
+
+The functions without unit handling at the bottom of this file work on plain floats
+or arrays in metres, megapascals, meganewtons per cubic metre and radians.
+"""
+from __future__ import division
+
+import numpy as np
+
+from . import (is_quantity, quantity)
+from .bearing import bearing_capacity
+from .formulas import (StrengthFormula, ALL_FORMULA)
+from .instrument import timed
+
+
+SF = StrengthFormula
+HARDY_AGAPITO = ALL_FORMULA[0]
+CMRI = ALL_FORMULA[4]
+# (length unit, stress unit) in which each unit system expects its inputs
+FORMULA_UNITS = {
+    SF.METRIC: ("metre", "megapascal"),
+    SF.IMPERIAL: ("foot", "psi"),
+}
+# width to height ratio above which a pillar is regarded as highly squat
+SQUAT_RATIO = 10
+# exact conversions, so the unitless functions never need the unit registry
+FOOT = 0.3048  # metres
+PSI = 6.894757293168361e-3  # megapascals
+# vertical stress gradient of 1.1 psi/ft (megapascals per metre) used when the overburden density is unknown
+DEFAULT_STRESS_GRADIENT = 1.1 * PSI / FOOT
+# factors that convert metres and megapascals to the (length, stress) units of FORMULA_UNITS
+SCALE_FACTORS = {
+    SF.METRIC: (1.0, 1.0),
+    SF.IMPERIAL: (1 / FOOT, 1 / PSI),
+}
+
+
+def scale_factors(unit_system):
+    """
+    Returns the factors that convert metres and megapascals to the length and stress
+    units of a unit system
+    """
+    return SCALE_FACTORS[unit_system]
+
+
+@timed("unit_conversion")
+def magnitudes(quantity, unit):
+    """
+    Returns a float64 array of the magnitudes of quantity in the given unit.
+    Quantities without units are assumed to be in unit already.
+    """
+    if is_quantity(quantity):
+        quantity = quantity.to(unit).magnitude
+    return np.asarray(quantity, dtype=float)
+
+
+def gaddy_factor(strength, diameter):
+    """Vectorized Sample.gaddy_factor
+    :param strength: uniaxial compressive strength of the samples (psi)
+    :param diameter: diameter of the samples (inches)
+    """
+    strength = magnitudes(strength, "psi")
+    diameter = magnitudes(diameter, "inch")
+    return quantity(strength * np.sqrt(diameter), "psi")
+
+
+def cubical_strength(strength, diameter, height):
+    """Vectorized Sample.cubical_strength
+    :param strength: uniaxial compressive strength of the samples (psi)
+    :param diameter: diameter of the samples (inches)
+    :param height: height of the samples (inches)
+    """
+    gaddy = gaddy_factor(strength, diameter).magnitude
+    height = magnitudes(height, "inch")
+    with np.errstate(divide="ignore"):
+        cubical = np.where(height > 36, gaddy / 6, gaddy / np.sqrt(height))
+    return quantity(cubical, "psi")
+
+
+def sample_geometry(height, diameter, cylindrical=False):
+    """
+    Vectorized Sample.volume and sample height to diameter ratio, which the
+    Hardy-Agapito formula needs
+    :param height: height of the samples (metres)
+    :param diameter: diameter of the samples (metres)
+    :param cylindrical: True for cylindrical samples, else they are cuboids
+    :return: the volumes (cubic metres) and the height to diameter ratios
+    """
+    height = magnitudes(height, "metre")
+    diameter = magnitudes(diameter, "metre")
+    area = np.where(cylindrical, np.pi / 4, 1.0) * diameter ** 2
+    return area * height, height / diameter
+
+
+def sample_k(formula, strength, diameter, height):
+    """
+    Vectorized StrengthFormula.get_correct_k. Returns the material constant k of
+    formula for each sample in the stress unit of the formula's unit system.
+    """
+    if formula.k_type == SF.CUBICAL:
+        k_value = cubical_strength(strength, diameter, height)
+    elif formula.k_type == SF.GADDY:
+        k_value = gaddy_factor(strength, diameter)
+    elif formula.k_type == SF.UNIAXIAL:
+        k_value = strength
+    else:
+        return _formula_k(formula, None)
+    return magnitudes(k_value, FORMULA_UNITS[formula.unit_system][1])
+
+
+def _formula_k(formula, k):
+    if k is not None:
+        return magnitudes(k, FORMULA_UNITS[formula.unit_system][1])
+    if not formula.uses_k:
+        return None
+    if formula.k:
+        return formula.k
+    raise AttributeError("Attribute k for Pillar Strength formula is None.\n{}".format(formula))
+
+
+def formula_strength(formula, width, height, k=None, length=None, depth=None, sample_volume=None,
+                     sample_shape=None):
+    """
+    Vectorized StrengthFormula.pillar_strength
+    :param formula: StrengthFormula whose linear, exponential or custom relation is used
+    :param width: widths of the pillars (length unit of the formula's unit system)
+    :param height: heights of the pillars (length unit of the formula's unit system)
+    :param k: material constant for each pillar, see sample_k. Defaults to the k of the formula
+    :param length: lengths of the pillars, used by custom formulas and Hardy-Agapito, defaults to width
+    :param depth: depth of the ore, only used by custom formulas
+    :param sample_volume: volume of the samples (cube of the length unit), needed by Hardy-Agapito
+    :param sample_shape: height to diameter ratio of the samples, needed by Hardy-Agapito
+    :return: strengths in the stress unit of the formula's unit system
+    """
+    length_unit, stress_unit = FORMULA_UNITS[formula.unit_system]
+    k = _formula_k(formula, k)
+    a_base = magnitudes(width, length_unit)
+    b_base = magnitudes(height, length_unit)
+    length = None if length is None else magnitudes(length, length_unit)
+    depth = None if depth is None else magnitudes(depth, length_unit)
+    if formula.name == HARDY_AGAPITO.name:
+        sample_volume = None if sample_volume is None else magnitudes(sample_volume, length_unit + " ** 3")
+        return quantity(_hardy_agapito(formula, k, a_base, b_base, length, sample_volume, sample_shape),
+                        stress_unit)
+    return quantity(_formula_strength(formula, k, a_base, b_base, length, depth), stress_unit)
+
+
+def cmri_strength(strength, width, height, depth):
+    """Vectorized C.M.R.I. pillar strength
+    :param strength: uniaxial compressive strength of the samples (megapascal)
+    :param width: widths of the pillars (metres)
+    :param height: heights of the pillars (metres)
+    :param depth: depth of the ore (metres)
+    """
+    strength = magnitudes(strength, "megapascal")
+    width = magnitudes(width, "metre")
+    height = magnitudes(height, "metre")
+    depth = magnitudes(depth, "metre")
+    return quantity(_cmri(strength, width, height, depth), "megapascal")
+
+
+def high_stacey_page_strength(gaddy, width, length, height):
+    """Vectorized Stacey-Page strength of highly squat pillars
+    :param gaddy: gaddy factor of the pillar material (megapascal)
+    :param width: widths of the pillars (metres)
+    :param length: lengths of the pillars (metres)
+    :param height: heights of the pillars (metres)
+    """
+    constant_k = magnitudes(gaddy, "megapascal")
+    width = magnitudes(width, "metre")
+    length = magnitudes(length, "metre")
+    height = magnitudes(height, "metre")
+    return quantity(_high_stacey_page(constant_k, width, length, height), "megapascal")
+
+
+def pillar_strength(formula, width, height, k=None, length=None, depth=None, strength=None, gaddy=None,
+                    sample_volume=None, sample_shape=None):
+    """
+    Vectorized RoomAndPillar.pillar_strength. The C.M.R.I. formula and highly squat
+    pillars are handled the same way as the scalar version.
+    :param formula: StrengthFormula to use
+    :param width: widths of the pillars (metres)
+    :param height: heights of the pillars (metres)
+    :param k: material constant for each pillar, see sample_k
+    :param length: lengths of the pillars (metres), defaults to width (square pillars)
+    :param depth: depth of the ore (metres), needed by C.M.R.I. and custom formulas using it
+    :param strength: uniaxial compressive strength of the samples (megapascal), needed by C.M.R.I.
+    :param gaddy: gaddy factor of the samples (megapascal), needed when any pillar is highly squat
+    :param sample_volume: volume of the samples (cubic metres), needed by Hardy-Agapito, see sample_geometry
+    :param sample_shape: height to diameter ratio of the samples, needed by Hardy-Agapito
+    :return: strengths in the stress unit of the formula's unit system
+    """
+    stress_unit = FORMULA_UNITS[formula.unit_system][1]
+    width = magnitudes(width, "metre")
+    height = magnitudes(height, "metre")
+    length = None if length is None else magnitudes(length, "metre")
+    depth = None if depth is None else magnitudes(depth, "metre")
+    if formula.name == CMRI.name:
+        k = None
+        strength = magnitudes(strength, "megapascal")
+    else:
+        k = _formula_k(formula, k)
+    gaddy = None if gaddy is None else magnitudes(gaddy, "megapascal")
+    sample_volume = None if sample_volume is None else magnitudes(sample_volume, "metre ** 3")
+    result = design_strength(formula, k, width, height, length, depth, strength, gaddy, sample_volume, sample_shape)
+    return quantity(result, "megapascal").to(stress_unit)
+
+
+# ------------------ UNITLESS FUNCTIONS ------------------------#
+
+
+def _formula_strength(formula, k, a_base, b_base, length=None, depth=None):
+    if formula.category == SF.CUSTOM:
+        return formula.custom_strength(k, a_base, b_base, length, depth)
+    if formula.category == SF.LINEAR:
+        return formula.linear_strength(k, a_base, b_base)
+    return formula.exponential_strength(k, a_base, b_base)
+
+
+def _hardy_agapito(formula, k, width, height, length, sample_volume, sample_shape):
+    """The lengths and sample_volume may be in any unit as long as it is the same"""
+    if sample_volume is None or sample_shape is None:
+        raise ValueError("the sample volume and shape are needed by the Hardy-Agapito formula")
+    length = width if length is None else length
+    return formula.exponential_strength(k, width * length * height / sample_volume, width / height * sample_shape)
+
+
+def _cmri(strength, width, height, depth):
+    bracket_component = depth / 160 * (width / height - 1)
+    outside_bracket = 0.27 * strength * height ** -0.36
+    return outside_bracket + bracket_component
+
+
+def _high_stacey_page(constant_k, width, length, height):
+    effective_width = (4 * width * length) / (2 * width + 2 * length)
+    bracket_out = constant_k * (2.5 / (effective_width * height) ** 0.07)
+    inner_bracket = (effective_width / (4.5 * height)) ** 4.5 - 1
+    bracket_value = 0.13 * inner_bracket + 1
+    return bracket_out * bracket_value
+
+
+@timed("strength")
+def design_strength(formula, k, width, height, length=None, depth=None, strength=None, gaddy=None,
+                    sample_volume=None, sample_shape=None):
+    """
+    pillar_strength without unit handling. k is in the stress unit of the formula's
+    unit system; every other input and the result are in metres and megapascals.
+    """
+    if formula.name == CMRI.name:
+        return _cmri(strength, width, height, depth)
+
+    length_scale, stress_scale = scale_factors(formula.unit_system)
+    if formula.name == HARDY_AGAPITO.name:
+        result = _hardy_agapito(formula, k, width, height, length, sample_volume, sample_shape) / stress_scale
+    elif formula.category == SF.CUSTOM:
+        result = _formula_strength(formula, k, width * length_scale, height * length_scale,
+                                   None if length is None else length * length_scale,
+                                   None if depth is None else depth * length_scale) / stress_scale
+    else:
+        result = _formula_strength(formula, k, width * length_scale, height * length_scale) / stress_scale
+    squat = width / height > SQUAT_RATIO
+    if np.any(squat):
+        if gaddy is None:
+            raise ValueError("gaddy factor is needed for highly squat pillars")
+        length = width if length is None else length
+        result = np.where(squat, _high_stacey_page(gaddy, width, length, height), result)
+    return result
+
+
+@timed("stress")
+def vertical_stress(depth, overburden_density=None):
+    """
+    Vertical pre-mining stress in megapascals at depth (metres) under an overburden
+    of the given unit weight (meganewtons per cubic metre)
+    """
+    if overburden_density is None:
+        return DEFAULT_STRESS_GRADIENT * depth
+    return overburden_density * depth
+
+
+@timed("stress")
+def pillar_stress(pre_mining_stress, width, length, room_span):
+    """Tributary area stress on rectangular pillars separated by rooms of equal span"""
+    numerator = (length + room_span) * (width + room_span)
+    denominator = length * width
+    return pre_mining_stress * (numerator / denominator)
+
+
+def extraction_ratio(width, length, room_span):
+    """Extraction ratio in percentage rounded to 2 decimal places"""
+    first = width / (width + room_span)
+    second = length / (length + room_span)
+    return np.round(100 * (1 - first * second), 2)
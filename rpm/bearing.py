@@ -0,0 +1,75 @@
+"""
+Bearing capacity of the floor under the pillars.
+The bearing capacity factors only depend on the friction angle of the floor, so they
+are computed once per friction angle: scalar angles are memoized, and so are arrays
+holding a single angle, which is the usual case of a batch of pillars on one floor. Every function works on floats or
+arrays in radians, metres, megapascals and meganewtons per cubic metre.
+"""
+from __future__ import division
+
+from collections import namedtuple
+from functools import lru_cache
+import math
+
+import numpy as np
+
+from .instrument import timed
+
+
+BearingFactors = namedtuple("BearingFactors", ("bcf_q", "bcf_c", "bcf_gamma"))
+ShapeFactors = namedtuple("ShapeFactors", ("sf_q", "sf_gamma"))
+
+
+def _factors(friction_angle, tan, exp):
+    tan_phi = tan(friction_angle)
+    bcf_q = exp(math.pi * tan_phi) * tan(math.pi / 4 + friction_angle / 2) ** 2
+    return BearingFactors(bcf_q, (bcf_q - 1) / tan_phi, 1.5 * (bcf_q - 1) * tan_phi)
+
+
+@lru_cache(maxsize=1024)
+def _scalar_factors(friction_angle):
+    return _factors(friction_angle, math.tan, math.exp)
+
+
+def bearing_factors(friction_angle):
+    """
+    Returns the BearingFactors of a friction angle (radians), or of every friction angle
+    of an array. Scalars and arrays of one repeated angle are memoized; arrays of varied
+    angles, e.g. Monte Carlo samples, are evaluated element-wise since sorting out their
+    distinct values costs more than the factors themselves.
+    """
+    if np.ndim(friction_angle) == 0:
+        return _scalar_factors(float(friction_angle))
+    angles = np.asarray(friction_angle, dtype=float)
+    if angles.size and (angles == angles.flat[0]).all():
+        return BearingFactors(*[np.full(angles.shape, factor) for factor in _scalar_factors(float(angles.flat[0]))])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _factors(angles, np.tan, np.exp)
+
+
+def shape_factors(friction_angle, width, length):
+    """Returns the ShapeFactors of pillars of the given widths and lengths"""
+    ratio = width / length
+    return ShapeFactors(1.0 + np.sin(friction_angle) * ratio, 1.0 - 0.4 * ratio)
+
+
+@timed("bearing_capacity")
+def bearing_capacity(friction_angle, cohesion, floor_density, width, length):
+    """
+    Bearing capacity of the floor in megapascals
+    :param friction_angle: friction angle of the floor (radians)
+    :param cohesion: cohesion of the floor (megapascal)
+    :param floor_density: unit weight of the floor (meganewton per metre ** 3)
+    :param width: widths of the pillars (metres)
+    :param length: lengths of the pillars (metres)
+    """
+    bcf_q, _, bcf_gamma = bearing_factors(friction_angle)
+    sf_q, sf_gamma = shape_factors(friction_angle, width, length)
+    addend = cohesion / np.tan(friction_angle) * (bcf_q * sf_q - 1)
+    product = 0.5 * floor_density * width * bcf_gamma * sf_gamma
+    return product + addend
+
+
+def bearing_capacity_factor_of_safety(pillar_stress, friction_angle, cohesion, floor_density, width, length):
+    """Floor bearing capacity factor of safety of pillars under pillar_stress (megapascal)"""
+    return bearing_capacity(friction_angle, cohesion, floor_density, width, length) / pillar_stress
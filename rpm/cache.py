@@ -0,0 +1,156 @@
+"""
+Persistent cache of design results.
+Results are stored in a SQLite database under a key hashed from everything that
+decides them: the inputs of the design, its pillar geometry and the constants of
+its formula. Quantities are hashed by their magnitude in base units rounded to
+KEY_DIGITS significant digits, so the same input entered in different units gives
+the same key. The database runs in write-ahead-log mode so worker processes, each
+with a connection of its own, can read and write it at the same time, and the least
+recently used results are evicted once it holds more than max_entries.
+"""
+from __future__ import division
+
+from collections import namedtuple
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from . import is_quantity
+from .cases import design_from_case
+from .compiled import DesignResult
+from .rpm_oop import RoomAndPillar
+
+
+# changes whenever the calculations change, so older results are not used
+CACHE_VERSION = 2
+KEY_DIGITS = 12
+# inputs that do not affect any result
+UNKEYED_INPUTS = ("project_name",)
+# puts between two checks of the size of the cache
+EVICT_EVERY = 64
+
+CachedDesign = namedtuple("CachedDesign", ("formula", "pillar_width", "pillar_length") + DesignResult._fields)
+
+
+def _canonical(value):
+    """Returns a JSON value that is the same for equal values of an input"""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if is_quantity(value):
+        value = value.to_base_units()
+        return [float("{:.{}g}".format(value.magnitude, KEY_DIGITS)), "{:~}".format(value.units)]
+    if isinstance(value, (int, float)):
+        return float("{:.{}g}".format(value, KEY_DIGITS))
+    if hasattr(value, "name"):
+        return value.name
+    return str(value)
+
+
+def design_key(rap):
+    """Returns the hex sha256 key of the results of a design"""
+    pillar, formula = rap.pillar, rap.formula
+    content = {"version": CACHE_VERSION}
+    content["inputs"] = dict((name, _canonical(getattr(rap, name))) for name in RoomAndPillar.HUMAN_FRIENDLY
+                             if name not in UNKEYED_INPUTS)
+    if pillar is not None:
+        content["pillar"] = [_canonical(value) for value in (pillar.height, pillar.length, pillar.width)]
+        sample = pillar.sample
+        content["sample"] = [_canonical(value) for value in (sample.strength, sample.height, sample.diameter,
+                                                             sample.is_cylinder)]
+    if formula is not None:
+        content["formula"] = [_canonical(value) for value in (formula.name, formula.category, formula.k_type,
+                                                              formula.k, formula.alpha, formula.beta,
+                                                              formula.unit_system, formula.expression)]
+        content["formula"].append([_canonical(value) for value in formula.fos])
+    text = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResultCache(object):
+
+    def __init__(self, path, max_entries=100000, timeout=30.0):
+        """
+        Opens or creates the cache database at path. A ResultCache must not be shared
+        between processes, every process opens its own.
+        :param max_entries: number of results kept, the least recently used are evicted beyond it
+        :param timeout: seconds to wait for a lock held by another process
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS results "
+                                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, used REAL NOT NULL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+        self._puts = 0
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return self.connection.execute("SELECT count(*) FROM results").fetchone()[0]
+
+    def get(self, key):
+        """Returns the CachedDesign stored under key, None when there is none"""
+        row = self.connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.connection.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        return CachedDesign(*json.loads(row[0]))
+
+    def put(self, key, value):
+        """Stores a CachedDesign under key"""
+        self.connection.execute("INSERT OR REPLACE INTO results (key, value, used) VALUES (?, ?, ?)",
+                                (key, json.dumps(list(value)), time.time()))
+        self._puts += 1
+        if self._puts % EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self):
+        """Deletes the least recently used results beyond max_entries"""
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self.connection.execute("DELETE FROM results WHERE key IN "
+                                    "(SELECT key FROM results ORDER BY used LIMIT ?)", (excess,))
+
+    def clear(self):
+        self.connection.execute("DELETE FROM results")
+
+    def close(self):
+        self.evict()
+        self.connection.close()
+
+
+def solve_design(rap):
+    """Solves the pillar width of a design and returns its CachedDesign"""
+    rap.pillar_width_from_fos_and_stress()
+    bearing = None not in (rap.friction_angle, rap.cohesion, rap.floor_density)
+    result = rap.compile().evaluate(bearing)
+    return CachedDesign(rap.formula.name, rap.pillar.width.to("metre").magnitude,
+                        rap.pillar.length.to("metre").magnitude, *result)
+
+
+def solve_case_cached(case, cache=None):
+    """
+    rpm.cases.solve_case returning a CachedDesign, which is looked up in cache before
+    the pillar width is solved and stored in it after
+    """
+    rap = design_from_case(case)
+    rap.formula_decide()
+    if cache is None:
+        return solve_design(rap)
+    key = design_key(rap)
+    value = cache.get(key)
+    if value is None:
+        value = solve_design(rap)
+        cache.put(key, value)
+    return value
+
+
+def default_cache_path():
+    """Returns the path of the cache shared by the runs of a user"""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "rap-designer", "results.sqlite")
@@ -0,0 +1,174 @@
+"""
+Design cases: the fields the project wizard collects, as plain values.
+A case is a mapping of the names in CASE_FIELDS to quantities, numbers or text
+(e.g. a row of a csv file) from which a RoomAndPillar design can be built.
+"""
+from __future__ import division
+
+from collections import OrderedDict
+from copy import copy
+
+from . import (Q_, ZERO_LENGTH)
+from .constants import (Countries, OreTypes)
+from .rpm_oop import (RoomAndPillar, Pillar, Sample, StrengthFormula, name_to_formula)
+from .utils import text_to_enum
+
+
+# field name: unit a number without a unit is taken to be in, None for other values
+CASE_FIELDS = OrderedDict([
+    ("project_name", None),
+    ("location", None),
+    ("ore_type", None),
+    ("design_type", None),
+    ("fragment_method", None),
+    ("room_span", "metre"),
+    ("min_extraction", None),
+    ("sample_strength", "megapascal"),
+    ("sample_height", "centimetre"),
+    ("sample_diameter", "millimetre"),
+    ("cylindrical", None),
+    ("friction_angle", "degree"),
+    ("cohesion", "megapascal"),
+    ("rmr", None),
+    ("seam_height", "metre"),
+    ("seam_dip", "degree"),
+    ("mine_depth", "metre"),
+    ("overburden_density", "kilonewton per metre ** 3"),
+    ("floor_density", "kilonewton per metre ** 3"),
+    ("pillar_formula", None),
+    ("alpha", None),
+    ("beta", None),
+    ("k", None),
+])
+# case field: attribute path of its value in a RoomAndPillar
+CASE_PATHS = dict((field, field) for field in CASE_FIELDS)
+CASE_PATHS.update([
+    ("sample_strength", "pillar.sample.strength"),
+    ("sample_height", "pillar.sample.height"),
+    ("sample_diameter", "pillar.sample.diameter"),
+    ("cylindrical", "pillar.sample.is_cylinder"),
+    ("pillar_formula", "formula.name"),
+    ("alpha", "formula.alpha"),
+    ("beta", "formula.beta"),
+    ("k", "formula.k"),
+])
+FRAGMENT_METHODS = {
+    "drill blast": RoomAndPillar.DRILL_BLAST,
+    "continuous miner": RoomAndPillar.CONTINUOUS_MINER,
+}
+TRUE_TEXT = ("1", "true", "yes", "y")
+
+
+def _blank(value):
+    return value is None or (not isinstance(value, Q_) and str(value).strip() == "")
+
+
+def parse_quantity(value, unit):
+    """
+    Returns value as a quantity in unit. Numbers and numeric text are taken to be in
+    unit already, other text is parsed by pint, e.g. "150 m" or "3822 psi".
+    """
+    if _blank(value):
+        return None
+    if isinstance(value, Q_):
+        return value.to(unit)
+    try:
+        return Q_(float(value), unit)
+    except ValueError:
+        return Q_(value).to(unit)
+
+
+def parse_number(value):
+    return None if _blank(value) else float(value)
+
+
+def parse_enum(enum, value, default):
+    if _blank(value):
+        return default
+    if isinstance(value, enum):
+        return value
+    return text_to_enum(enum, str(value).strip())
+
+
+def parse_bool(value):
+    if _blank(value):
+        return False
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in TRUE_TEXT
+
+
+def design_value(rap, path):
+    """Returns the value at an attribute path of a design, None when a step of the path is None"""
+    value = rap
+    for attrib in path.split("."):
+        if value is None:
+            return None
+        value = getattr(value, attrib)
+    return value
+
+
+def case_formula(case):
+    """
+    Returns a copy of the formula named in the case with the constants of the case,
+    or None when the case does not name a formula
+    """
+    name = case.get("pillar_formula")
+    if _blank(name):
+        return None
+    formula = copy(name_to_formula(str(name).strip()))
+    alpha, beta, k = (parse_number(case.get(key)) for key in ("alpha", "beta", "k"))
+    if alpha is not None:
+        formula.alpha = alpha
+    if beta is not None:
+        formula.beta = beta
+    if k is not None and formula.k_type == StrengthFormula.OTHER:
+        formula.k = k
+    return formula
+
+
+def design_from_case(case):
+    """Returns the RoomAndPillar design described by a case, see CASE_FIELDS"""
+    rap = RoomAndPillar()
+    rap.project_name = case.get("project_name") or ""
+    rap.location = parse_enum(Countries, case.get("location"), Countries.other)
+    rap.ore_type = parse_enum(OreTypes, case.get("ore_type"), OreTypes.other)
+
+    rap.room_span = parse_quantity(case.get("room_span"), CASE_FIELDS["room_span"])
+    rap.min_extraction = parse_number(case.get("min_extraction"))
+    fragment_method = case.get("fragment_method")
+    if fragment_method in FRAGMENT_METHODS.values():
+        rap.fragment_method = fragment_method
+    else:
+        rap.fragment_method = FRAGMENT_METHODS.get(str(fragment_method or "drill blast").strip().lower(),
+                                                   RoomAndPillar.DRILL_BLAST)
+    design_type = str(case.get("design_type") or RoomAndPillar.INITIAL).strip().lower()
+    rap.design_type = RoomAndPillar.REDESIGN if design_type == RoomAndPillar.REDESIGN else RoomAndPillar.INITIAL
+
+    for field in ("friction_angle", "cohesion", "seam_height", "seam_dip", "mine_depth", "overburden_density",
+                  "floor_density"):
+        setattr(rap, field, parse_quantity(case.get(field), CASE_FIELDS[field]))
+    rmr = parse_number(case.get("rmr"))
+    rap.rmr = None if rmr is None else int(rmr)
+
+    sample = Sample(parse_quantity(case.get("sample_strength"), CASE_FIELDS["sample_strength"]),
+                    parse_quantity(case.get("sample_height"), CASE_FIELDS["sample_height"]),
+                    parse_quantity(case.get("sample_diameter"), CASE_FIELDS["sample_diameter"]),
+                    parse_bool(case.get("cylindrical")))
+    rap.pillar = Pillar(sample, rap.seam_height, ZERO_LENGTH)
+
+    if rap.design_type == RoomAndPillar.REDESIGN:
+        rap.formula = case_formula(case)
+    return rap
+
+
+def solve_case(case):
+    """
+    Builds the design of a case, picks its formula and solves its pillar width.
+    Returns the design and a DesignResult of its outputs (see rpm.compiled)
+    """
+    rap = design_from_case(case)
+    rap.formula_decide()
+    rap.pillar_width_from_fos_and_stress()
+    bearing = None not in (rap.friction_angle, rap.cohesion, rap.floor_density)
+    return rap, rap.compile().evaluate(bearing)
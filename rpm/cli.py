@@ -0,0 +1,213 @@
+"""
+Headless batch design.
+
+    python main.py batch cases.csv results.csv --processes 8
+
+Every row of the input csv is a design case whose columns are named after
+rpm.cases.CASE_FIELDS, .xlsx workbooks are read and written with rpm.spreadsheet.
+The pillar width of each case is solved by a pool of worker processes and a row
+of results is written for it as soon as it is ready. With --cache the results are
+also kept in a rpm.cache.ResultCache and cases solved before are not solved again.
+With --profile the time spent in every stage of the calculations (see rpm.instrument)
+is summed over all the workers and printed when the batch is done.
+Nothing in this module imports Qt.
+"""
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import csv
+import logging
+import os
+import sys
+from contextlib import ExitStack
+from multiprocessing import (Pool, cpu_count)
+from multiprocessing.util import Finalize
+
+from . import instrument
+from .cases import CASE_FIELDS
+from .cache import (ResultCache, solve_case_cached, default_cache_path)
+
+
+RESULT_FIELDS = (
+    "formula",
+    "pillar_width [m]",
+    "pillar_length [m]",
+    "extraction_ratio [%]",
+    "vertical_pre_mining_stress [MPa]",
+    "pillar_strength [MPa]",
+    "pillar_stress [MPa]",
+    "bearing_capacity [MPa]",
+    "factor_of_safety",
+    "bearing_capacity_factor_of_safety",
+    "error",
+)
+# key of the instrument stats a worker sends back with a row when profiling
+STATS_KEY = "_stats"
+
+# result cache of this process, opened by open_cache
+_cache = None
+
+
+def open_cache(path, max_entries=100000):
+    """Opens the result cache used by run_case in this process, None for no cache"""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+    _cache = None if path is None else ResultCache(path, max_entries)
+
+
+def close_cache():
+    open_cache(None)
+
+
+def start_worker(cache_path=None, max_cache_entries=100000, profile=False):
+    """Initializer of the worker processes, the cache is closed when the worker exits"""
+    open_cache(cache_path, max_cache_entries)
+    # workers leave with os._exit, which skips atexit but runs the multiprocessing finalizers
+    Finalize(None, close_cache, exitpriority=0)
+    if profile:
+        instrument.enable()
+
+
+def run_case(case):
+    """
+    Solves one case and returns the case extended with its results.
+    Errors are reported in the error column instead of stopping the batch.
+    While instrumentation is enabled the stats of the case are added under STATS_KEY.
+    """
+    row = dict(case)
+    try:
+        result = solve_case_cached(case, _cache)
+    except Exception as e:
+        row["error"] = "{}: {}".format(type(e).__name__, e)
+        return _with_stats(row)
+    row.update({
+        "formula": result.formula,
+        "pillar_width [m]": result.pillar_width,
+        "pillar_length [m]": result.pillar_length,
+        "extraction_ratio [%]": result.extraction_ratio,
+        "vertical_pre_mining_stress [MPa]": result.vertical_pre_mining_stress,
+        "pillar_strength [MPa]": result.pillar_strength,
+        "pillar_stress [MPa]": result.pillar_stress,
+        "bearing_capacity [MPa]": result.bearing_capacity,
+        "factor_of_safety": result.factor_of_safety,
+        "bearing_capacity_factor_of_safety": result.bearing_capacity_factor_of_safety,
+        "error": "",
+    })
+    return _with_stats(row)
+
+
+def _with_stats(row):
+    if instrument.is_enabled():
+        row[STATS_KEY] = instrument.take()
+    return row
+
+
+def _merged_stats(row):
+    """Adds the stats sent with a row to the stats of this process and returns the row without them"""
+    stats = row.pop(STATS_KEY, None)
+    if stats is not None:
+        instrument.merge(stats)
+    return row
+
+
+def run_cases(cases, processes=None, chunksize=16, cache_path=None, max_cache_entries=100000, profile=False):
+    """
+    Yields the result row of every case in the order of cases.
+    cases may be any iterable, e.g. a csv.DictReader, and is consumed lazily.
+    :param cache_path: path of the result cache database, None to solve every case
+    :param profile: enable instrumentation in the workers, their stats are merged into
+     the stats of this process
+    """
+    processes = processes or cpu_count()
+    if processes == 1:
+        open_cache(cache_path, max_cache_entries)
+        try:
+            for case in cases:
+                yield _merged_stats(run_case(case))
+        finally:
+            close_cache()
+        return
+    # every worker opens a connection of its own
+    pool = Pool(processes, initializer=start_worker, initargs=(cache_path, max_cache_entries, profile))
+    try:
+        for row in pool.imap(run_case, cases, chunksize):
+            yield _merged_stats(row)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def is_workbook(path):
+    return path.lower().endswith(".xlsx")
+
+
+def batch(input_path, output_path, processes=None, chunksize=16, cache_path=None, max_cache_entries=100000,
+          profile=False):
+    """
+    Solves every case of the csv file or .xlsx workbook (see rpm.spreadsheet) at
+    input_path and writes the results to a csv file or workbook at output_path
+    :param cache_path: path of the result cache database, None to solve every case
+    :param profile: time the stages of the calculations, the stats of the batch are
+     left in rpm.instrument
+    """
+    if cache_path is not None and os.path.dirname(cache_path):
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with ExitStack() as stack:
+        if profile:
+            instrument.reset()
+            instrument.enable()
+            stack.callback(instrument.disable)
+        if is_workbook(input_path):
+            from .spreadsheet import read_cases
+            cases, case_fields = read_cases(input_path), list(CASE_FIELDS)
+        else:
+            cases = csv.DictReader(stack.enter_context(open(input_path, newline="")))
+            case_fields = [field for field in cases.fieldnames if field not in RESULT_FIELDS]
+        fields = case_fields + list(RESULT_FIELDS)
+        rows = run_cases(cases, processes, chunksize, cache_path, max_cache_entries, profile)
+
+        if is_workbook(output_path):
+            from .spreadsheet import write_rows
+            return write_rows(output_path, fields, ([row.get(field) for field in fields] for row in rows))
+        results_file = stack.enter_context(open(output_path, "w", newline=""))
+        writer = csv.DictWriter(results_file, fields, extrasaction="ignore")
+        writer.writeheader()
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+            if count % chunksize == 0:
+                results_file.flush()
+        return count
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="main.py batch", description="Design room and pillar panels in batch.")
+    parser.add_argument("cases", help="csv file or .xlsx workbook of design cases with columns: {}".format(", ".join(CASE_FIELDS)))
+    parser.add_argument("results", help="csv file or .xlsx workbook the results are written to")
+    parser.add_argument("-p", "--processes", type=int, default=None,
+                        help="number of worker processes (default: number of cpus)")
+    parser.add_argument("--chunksize", type=int, default=16, help="cases handed to a worker at a time")
+    parser.add_argument("--cache", nargs="?", const=default_cache_path(), default=None, metavar="PATH",
+                        help="reuse the results of cases solved before, kept in a database at PATH "
+                             "(default: {})".format(default_cache_path()))
+    parser.add_argument("--max-cache-entries", type=int, default=100000,
+                        help="results kept in the cache, the least recently used are evicted beyond it")
+    parser.add_argument("--profile", action="store_true",
+                        help="print the calls and time of every stage of the calculations when done")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="log the diagnostics of the calculations to stderr, slows the batch down")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG, format="%(processName)s %(name)s: %(message)s")
+    count = batch(args.cases, args.results, args.processes, args.chunksize, args.cache, args.max_cache_entries,
+                  args.profile)
+    print("{} cases written to {}".format(count, args.results), file=sys.stderr)
+    if args.profile:
+        print(instrument.report(), file=sys.stderr)
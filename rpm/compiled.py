@@ -0,0 +1,126 @@
+"""
+Compiled design mode for RoomAndPillar.
+All the inputs of a design are converted to SI floats once, the arithmetic is done
+on plain floats and units are only attached again to the outputs.
+"""
+from __future__ import division
+
+from collections import namedtuple
+import math
+
+from . import quantity
+from .instrument import timed
+from .batch import (CMRI, HARDY_AGAPITO, design_strength, vertical_stress, pillar_stress, extraction_ratio,
+                    bearing_capacity)
+
+
+DesignResult = namedtuple("DesignResult", ("vertical_pre_mining_stress", "pillar_strength", "pillar_stress",
+                                           "factor_of_safety", "bearing_capacity",
+                                           "bearing_capacity_factor_of_safety", "extraction_ratio"))
+
+# SI unit each input of a design is normalised to
+LENGTH, STRESS, UNIT_WEIGHT = "metre", "megapascal", "meganewton per metre ** 3"
+
+
+@timed("unit_conversion")
+def _si(quantity, unit):
+    if quantity is None:
+        return None
+    return quantity.to(unit).magnitude
+
+
+class CompiledDesign(object):
+    """
+    A RoomAndPillar whose inputs have been normalised to floats.
+    Lengths are in metres, stresses in megapascals, unit weights in meganewtons
+    per cubic metre and the friction angle in radians. The sample volume (cubic metres)
+    and height to diameter ratio are only kept for the Hardy-Agapito formula.
+    """
+
+    __slots__ = ("formula", "k", "width", "length", "height", "room_span", "mine_depth", "overburden_density",
+                 "strength", "gaddy", "friction_angle", "cohesion", "floor_density", "sample_volume",
+                 "sample_shape")
+
+    def __init__(self, rap):
+        pillar = rap.pillar
+        sample = pillar.sample
+        self.formula = rap.formula
+        self.k = None
+        if rap.formula is not None and rap.formula.name != CMRI.name and rap.formula.uses_k:
+            self.k = rap.formula.get_correct_k(pillar)
+        self.width = _si(pillar.width, LENGTH)
+        self.length = _si(pillar.length, LENGTH)
+        self.height = _si(pillar.height, LENGTH)
+        self.room_span = _si(rap.room_span, LENGTH)
+        self.mine_depth = _si(rap.mine_depth, LENGTH)
+        self.overburden_density = _si(rap.overburden_density, UNIT_WEIGHT)
+        self.strength = _si(sample.strength, STRESS)
+        self.gaddy = _si(sample.gaddy_factor, STRESS)
+        self.friction_angle = _si(rap.friction_angle, "radian")
+        self.cohesion = _si(rap.cohesion, STRESS)
+        self.floor_density = _si(rap.floor_density, UNIT_WEIGHT)
+        self.sample_volume = self.sample_shape = None
+        if rap.formula is not None and rap.formula.name == HARDY_AGAPITO.name:
+            self.sample_volume = _si(sample.volume, LENGTH + " ** 3")
+            self.sample_shape = _si(sample.height / sample.diameter, "dimensionless")
+
+    # ------------------ FLOAT ARITHMETIC ------------------------#
+
+    def stress_values(self):
+        """Returns the vertical pre-mining stress and the pillar stress in megapascals"""
+        pre_mining = vertical_stress(self.mine_depth, self.overburden_density)
+        return pre_mining, pillar_stress(pre_mining, self.width, self.length, self.room_span)
+
+    def strength_value(self):
+        """Returns the pillar strength in megapascals"""
+        return float(design_strength(self.formula, self.k, self.width, self.height, self.length,
+                                     self.mine_depth, self.strength, self.gaddy, self.sample_volume,
+                                     self.sample_shape))
+
+    def bearing_capacity_value(self):
+        """Returns the bearing capacity of the floor in megapascals"""
+        return bearing_capacity(self.friction_angle, self.cohesion, self.floor_density, self.width, self.length)
+
+    def evaluate(self, bearing=True):
+        """
+        Returns all outputs of the design as a DesignResult of floats.
+        Set bearing to False when the floor parameters of the design are unknown.
+        """
+        pre_mining, stress = self.stress_values()
+        strength = self.strength_value()
+        capacity = capacity_fos = None
+        if bearing:
+            capacity = float(self.bearing_capacity_value())
+            capacity_fos = capacity / stress
+        ratio = float(extraction_ratio(self.width, self.length, self.room_span))
+        return DesignResult(pre_mining, strength, stress, strength / stress, capacity, capacity_fos, ratio)
+
+    # ------------------ OUTPUTS ------------------------#
+
+    @property
+    def vertical_pre_mining_stress(self):
+        return quantity(self.stress_values()[0], STRESS)
+
+    @property
+    def pillar_stress(self):
+        return quantity(self.stress_values()[1], STRESS)
+
+    @property
+    def pillar_strength(self):
+        return quantity(self.strength_value(), STRESS)
+
+    @property
+    def factor_of_safety(self):
+        return self.strength_value() / self.stress_values()[1]
+
+    @property
+    def bearing_capacity(self):
+        return quantity(float(self.bearing_capacity_value()), STRESS)
+
+    @property
+    def bearing_capacity_factor_of_safety(self):
+        return float(self.bearing_capacity_value()) / self.stress_values()[1]
+
+    @property
+    def extraction_ratio(self):
+        return float(extraction_ratio(self.width, self.length, self.room_span))
@@ -0,0 +1,93 @@
+"""
+Safe pillar strength expressions.
+An expression is ordinary arithmetic over the names in VARIABLES, numbers, the
+constants pi and e and the functions in FUNCTIONS, e.g.
+
+    k * (alpha + beta * width / height)
+    0.27 * k * height ** -0.36 + depth / 160 * (width / height - 1)
+
+Expressions are checked against a whitelist of syntax, so no attribute, subscript,
+keyword or other name can be reached, then compiled once into a function of arrays
+built from NumPy ufuncs. Numbers are floats, so powers too large overflow. Compiled functions are cached by the text of the expression.
+"""
+from __future__ import division
+
+import ast
+from functools import lru_cache
+
+import numpy as np
+
+
+# inputs of an expression, in the order the compiled function takes them
+VARIABLES = ("k", "alpha", "beta", "width", "height", "length", "depth")
+FUNCTIONS = {
+    "sqrt": np.sqrt,
+    "exp": np.exp,
+    "log": np.log,
+    "log10": np.log10,
+    "abs": np.abs,
+    "min": np.minimum,
+    "max": np.maximum,
+}
+CONSTANTS = {"pi": np.pi, "e": np.e}
+
+_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+          ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd)
+
+
+def parse_expression(text):
+    """
+    Returns the checked syntax tree of an expression
+    :raises ValueError: when the expression is not valid or uses anything not allowed
+    """
+    try:
+        tree = ast.parse(str(text).strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError("Invalid expression {!r}: {}".format(text, e.msg))
+    # functions may only be called, never used as values
+    callees = set(id(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call))
+    for node in ast.walk(tree):
+        if not isinstance(node, _NODES):
+            raise ValueError("{} is not allowed in expression {!r}".format(type(node).__name__, text))
+        if isinstance(node, ast.Constant) and (isinstance(node.value, bool) or
+                                               not isinstance(node.value, (int, float))):
+            raise ValueError("Only numbers are allowed in expression {!r}, not {!r}".format(text, node.value))
+        if isinstance(node, ast.Constant):
+            # integer arithmetic is unbounded, e.g. 9 ** 9 ** 9 would never finish, floats overflow
+            try:
+                node.value = float(node.value)
+            except OverflowError:
+                raise ValueError("Number too large in expression {!r}".format(text))
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords:
+                raise ValueError("Only calls of {} are allowed in expression {!r}".format(", ".join(FUNCTIONS), text))
+        elif isinstance(node, ast.Name) and id(node) not in callees:
+            if node.id in FUNCTIONS:
+                raise ValueError("Function {} must be called in expression {!r}".format(node.id, text))
+            if node.id not in VARIABLES and node.id not in CONSTANTS:
+                raise ValueError("Unknown name {} in expression {!r}".format(node.id, text))
+    return tree
+
+
+@lru_cache(maxsize=256)
+def expression_names(text):
+    """Returns the frozenset of VARIABLES an expression uses"""
+    return frozenset(node.id for node in ast.walk(parse_expression(text))
+                     if isinstance(node, ast.Name) and node.id in VARIABLES)
+
+
+@lru_cache(maxsize=256)
+def compile_expression(text):
+    """
+    Returns a function of the VARIABLES (all keyword arguments defaulting to None) that
+    evaluates the expression on numbers or arrays
+    :raises ValueError: see parse_expression
+    """
+    tree = parse_expression(text)
+    arguments = ast.arguments(posonlyargs=[], args=[ast.arg(arg=name) for name in VARIABLES], kwonlyargs=[],
+                              kw_defaults=[], defaults=[ast.Constant(value=None) for _ in VARIABLES])
+    function = ast.fix_missing_locations(ast.Expression(body=ast.Lambda(args=arguments, body=tree.body)))
+    namespace = {"__builtins__": {}}
+    namespace.update(FUNCTIONS)
+    namespace.update(CONSTANTS)
+    return eval(compile(function, "<strength expression>", "eval"), namespace)
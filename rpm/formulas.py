@@ -0,0 +1,246 @@
+"""
+Pillar strength formulas.
+A StrengthFormula only holds the constants of a formula and computes strengths from
+plain numbers, so this module can be used without the unit registry; quantities
+are only involved when a k is taken from a pillar sample.
+Formulas of the CUSTOM category compute strengths with an expression, see
+rpm.expressions, and are made available by name with register_formula.
+"""
+from __future__ import division
+from collections import namedtuple
+import logging
+
+from .instrument import timed
+
+
+logger = logging.getLogger(__name__)
+
+
+# bound to its type name as well so that formulas can be pickled
+SafetyTuple = fos_tuple = namedtuple("SafetyTuple", ("lower", "recommended", "upper"))
+
+
+class StrengthFormula(object):
+
+    CUBICAL, UNIAXIAL, GADDY, OTHER = "cubical", "uniaxial", "gaddy", "other"
+    METRIC, IMPERIAL = "metric", "imperial"
+    LINEAR, EXPONENTIAL, ODD, CUSTOM = "linear", "exponential", "odd", "custom"
+    __slots__ = ("k_type", "beta", "alpha", "category", "fos", "unit_system", "k", "name", "expression")
+
+    def __init__(self, alpha, beta, k_type, category,  fos=(1.0, 1.5, 2.0),
+                 unit_system=None, k=None, name=None, expression=None):
+        self.alpha = alpha
+        self.beta = beta
+        self.k_type = k_type
+        self.category = category
+        self.fos = fos_tuple(lower=fos[0], recommended=fos[1], upper=fos[-1])
+        self.unit_system = unit_system or self.IMPERIAL
+        self.k = k
+        self.name = name
+        # only used by custom formulas
+        self.expression = expression
+
+        # k should have a value only when k type is other
+        # all the other types are calculated from data
+        # some odd and custom formulas do not have k defined
+        if self.category not in (StrengthFormula.ODD, StrengthFormula.CUSTOM):
+            assert ((self.k_type == StrengthFormula.OTHER and k is not None) or
+                   (self.k_type != StrengthFormula.OTHER and k is None))
+
+    @property
+    def constants(self):
+        return self.k, self.alpha, self.beta
+
+    def __str__(self):
+        if self.category == self.CUSTOM:
+            return "{}, strength={}".format(self.name, self.expression)
+        return "{}, k={}, a={} and b={}".format(self.name, self.k or self.k_type, self.alpha, self.beta)
+
+    @property
+    def uses_k(self):
+        if self.category == self.CUSTOM:
+            from .expressions import expression_names
+            return "k" in expression_names(self.expression)
+        return True
+
+    def pillar_strength(self, pillar, k=None, depth=None):
+        """
+        The Hardy-Agapito formula relates the pillar to its sample, its a_base is the ratio
+        of the pillar to the sample volume and its b_base the ratio of their width to height
+        ratios. Every other formula uses the width and the height of the pillar.
+        :param depth: depth of the ore, only used by custom formulas
+        """
+        from . import unit_reg
+        length_unit = unit_reg.metre if self.unit_system == self.METRIC else unit_reg.foot
+        a_base = pillar.width.to(length_unit).magnitude
+        b_base = pillar.height.to(length_unit).magnitude
+
+        if self.category == self.CUSTOM:
+            k = self.get_correct_k(pillar, k) if self.uses_k else None
+            length = None if pillar.length is None else pillar.length.to(length_unit).magnitude
+            depth = None if depth is None else depth.to(length_unit).magnitude
+            strength = self.custom_strength(k, a_base, b_base, length, depth)
+        elif self.name == hardy_agapito.name:
+            sample = pillar.sample
+            a_base = (pillar.volume / sample.volume).to("dimensionless").magnitude
+            b_base = (pillar.width_height_ratio * sample.height / sample.diameter).to("dimensionless").magnitude
+            strength = self.exponential_strength(self.get_correct_k(pillar, k), a_base, b_base)
+        elif self.category == self.LINEAR:
+            # print("using linear relation in pillar strength")
+            strength = self.linear_strength(self.get_correct_k(pillar, k), a_base, b_base)
+        else:
+            # print("using exponential relation in pillar strength")
+            strength = self.exponential_strength(self.get_correct_k(pillar, k), a_base, b_base)
+        # print("Pillar strength incoming!:", strength)
+
+        if self.unit_system == self.METRIC:
+            return strength * unit_reg("megapascal")
+        else:
+            return strength * unit_reg.psi
+
+    def linear_strength(self, k, a_base, b_base):
+        # print("using a linear relation")
+        return k * (self.alpha + self.beta * (a_base / b_base))
+
+    def exponential_strength(self, k, a_base, b_base):
+        # print("using an exponential relation in exponential strength.")
+        # print(k, a_base, self.alpha, b_base, self.beta)
+        # print(a_base ** self.alpha)
+        # print(b_base ** self.beta)
+        return k * a_base ** self.alpha * b_base ** self.beta
+
+    def custom_strength(self, k, a_base, b_base, length=None, depth=None):
+        """
+        Strength from the expression of a custom formula, on numbers or arrays in the
+        units of the formula's unit system
+        :param length: pillar lengths, defaults to a_base (square pillars)
+        """
+        from .expressions import compile_expression
+        length = a_base if length is None else length
+        return compile_expression(self.expression)(k=k, alpha=self.alpha, beta=self.beta, width=a_base,
+                                                   height=b_base, length=length, depth=depth)
+
+    def is_good_factor_of_safety(self, fos):
+        return self.fos.lower <= fos <= self.fos.upper
+
+    @property
+    def recommended_fos(self):
+        return self.fos.recommended
+
+    @timed("unit_conversion")
+    def get_correct_k(self, pillar=None, default=None):
+        """
+        The various properties that can be used in place of constant k, the material constant
+        are properties of the pillar sample. Where this is not the case, they are empirical
+        values determined for the formula.
+        If no pillar object is provided it assumes the formula has a defined k which it tries
+        to return. If that too is not provided, then the function can be given a default value
+        which it returns.
+        When all the above, it raises an AttributeError.
+        """
+        if pillar is not None:
+            from . import unit_reg
+            sample = pillar.sample
+            if self.k_type == self.CUBICAL:
+                k_value = sample.cubical_strength
+            elif self.k_type == self.GADDY:
+                k_value = sample.gaddy_factor
+            elif self.k_type == self.UNIAXIAL:
+                k_value = sample.strength
+            # convert to the right unit system so that final calculation can be done blindly
+            # trying to do final calculation with 'wise' units raises several errors
+            try:
+                # for cases when all the above conditionals fail
+                if self.unit_system == self.METRIC:
+                    k_value.ito(unit_reg.megapascal)
+                else:
+                    k_value.ito(unit_reg.psi)
+                return k_value.magnitude
+            except Exception as e:
+                logger.debug("No k of %s from the pillar sample: %s", self.name, e)
+        # These values as raw values and do not need any unit conversion
+        if self.k:
+            logger.debug("Using the k of %s: %s", self.name, self.k)
+            return self.k
+        elif default:
+            logger.debug("Using the default k for %s: %s", self.name, default)
+            return default
+        raise AttributeError("Attribute k for Pillar Strength formula is None.\n{}".format(self))
+
+
+# The various formula that are used in calculating pillar strength
+# The value of each enumeration is a tuple of the constants that
+# are used along with the formula
+
+SF = StrengthFormula
+hardy_agapito = SF(alpha=-0.118, beta=0.833, k_type=SF.CUBICAL, fos=(1.0, 2.0, 2.0), unit_system=SF.METRIC,
+                   category=SF.EXPONENTIAL, name="Hardy-Agapito")
+salamon_munro = SF(alpha=0.46, beta=-0.66, k_type=SF.OTHER, fos=(1.31, 1.6, 1.88), unit_system=SF.IMPERIAL,
+                   category=SF.EXPONENTIAL, k=1320, name="Salamon-Munro")
+bieniawski = SF(alpha=0.64, beta=0.36, k_type=SF.CUBICAL, fos=(1.5, 1.5, 2.0), unit_system=SF.IMPERIAL,
+                category=SF.LINEAR, name="Bieniawski")
+stacey_page = SF(alpha=0.5, beta=0.7, k_type=SF.GADDY, fos=(1.0, 1.5, 2.0), unit_system=SF.METRIC,
+                 category=SF.EXPONENTIAL, name="Stacey-Page")
+cmri = SF(1, -1, k_type=SF.OTHER, fos=(1, 1, 1), category=SF.ODD, name="C.M.R.I.")
+obert_duval = SF(alpha=0.778, beta=0.22, category=SF.LINEAR, k_type=SF.CUBICAL, fos=(1.5, 2.0, 4.0),
+                 unit_system=SF.IMPERIAL, name="Obert-Duval")
+holland_gaddy = SF(alpha=0.5, beta=-1, k_type=SF.GADDY, fos=(1.8, 2.0, 2.2), unit_system=SF.IMPERIAL,
+                   category=SF.EXPONENTIAL, name="Holland-Gaddy")
+holland = SF(alpha=0.5, beta=-0.5, k_type=SF.CUBICAL, fos=(1.0, 2.0, 2.0), unit_system=SF.IMPERIAL,
+             category=SF.EXPONENTIAL, name="Holland")
+msalamon_munro = SF(alpha=0.46, beta=-0.66, k_type=SF.OTHER, fos=(1.31, 1.6, 1.88), unit_system=SF.METRIC,
+                   category=SF.EXPONENTIAL, k=7.2, name="Salamon-Munro (metric)")
+
+ALL_FORMULA = (hardy_agapito, salamon_munro, bieniawski, stacey_page, cmri, obert_duval, holland, holland_gaddy,
+               msalamon_munro)
+
+
+# custom formulas added with register_formula
+CUSTOM_FORMULA = []
+
+
+def available_formula():
+    """Returns the built-in formulas followed by the registered custom formulas"""
+    return ALL_FORMULA + tuple(CUSTOM_FORMULA)
+
+
+def register_formula(name, expression, k_type=SF.OTHER, k=None, alpha=None, beta=None, fos=(1.0, 1.5, 2.0),
+                     unit_system=SF.METRIC):
+    """
+    Creates a custom formula and makes it available by name.
+    Registered formulas only exist in the process that registers them.
+    :param expression: strength expression, see rpm.expressions for what it may use
+    :param k_type: where k comes from when the expression uses it, see StrengthFormula
+    :param k: value of k when k_type is StrengthFormula.OTHER
+    :param alpha: value of alpha when the expression uses it
+    :param beta: value of beta when the expression uses it
+    :param unit_system: unit system of the lengths the expression takes and of the stress it gives
+    :raises ValueError: when the expression is not valid, a constant it uses has no value or
+     a formula with the same name exists
+    """
+    from .expressions import expression_names
+    names = expression_names(expression)
+    missing = [constant for constant, value in (("alpha", alpha), ("beta", beta)) if constant in names and value is None]
+    if "k" in names and k_type == SF.OTHER and k is None:
+        missing.append("k")
+    if missing:
+        raise ValueError("{} used by formula {} must have a value".format(", ".join(missing), name))
+    if any(formula.name == name for formula in available_formula()):
+        raise ValueError("A formula called {} exists already".format(name))
+    formula = SF(alpha=alpha, beta=beta, k_type=k_type, category=SF.CUSTOM, fos=fos, unit_system=unit_system, k=k,
+                 name=name, expression=expression)
+    CUSTOM_FORMULA.append(formula)
+    return formula
+
+
+def unregister_formula(name):
+    """Removes the registered custom formula called name"""
+    CUSTOM_FORMULA[:] = [formula for formula in CUSTOM_FORMULA if formula.name != name]
+
+
+def name_to_formula(name):
+
+    for formula in available_formula():
+        if formula.name == name:
+            return formula
+    raise ValueError("No formula called {}".format(name))
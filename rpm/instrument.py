@@ -0,0 +1,132 @@
+"""
+Opt-in timing of the stages of the calculations.
+Functions of a stage are wrapped with timed, blocks with stage. While instrumentation
+is disabled, which is the default, a wrapped call only costs a check of a flag.
+Once enabled, the calls and the wall time of every stage are counted:
+
+    from rpm import instrument
+    instrument.enable()
+    ...
+    print(instrument.report())
+
+The time of a stage includes the stages it calls, e.g. the unit conversions done while
+computing a strength; a stage called from within itself is only counted once. The
+counts are kept per process (see rpm.cli for how the batch workers report theirs).
+"""
+from __future__ import division
+
+from collections import (namedtuple, OrderedDict)
+from contextlib import contextmanager
+from functools import wraps
+import threading
+from time import perf_counter
+
+
+STAGES = ("unit_conversion", "strength", "stress", "bearing_capacity", "root_bracketing", "root_solving")
+StageStats = namedtuple("StageStats", ("calls", "seconds"))
+
+_enabled = False
+# stage: [calls, seconds]
+_totals = dict((name, [0, 0.0]) for name in STAGES)
+_local = threading.local()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Sets the counts of every stage back to zero"""
+    for totals in _totals.values():
+        totals[:] = [0, 0.0]
+
+
+def stats():
+    """Returns an OrderedDict of every stage to its StageStats"""
+    return OrderedDict((name, StageStats(*_totals[name])) for name in STAGES)
+
+
+def take():
+    """Returns the stats and resets them"""
+    current = stats()
+    reset()
+    return current
+
+
+def merge(other):
+    """Adds stats taken in another process to the stats of this one"""
+    for name, (calls, seconds) in other.items():
+        totals = _totals[name]
+        totals[0] += calls
+        totals[1] += seconds
+
+
+def _active():
+    try:
+        return _local.active
+    except AttributeError:
+        _local.active = set()
+        return _local.active
+
+
+@contextmanager
+def _timing(name):
+    active = _active()
+    if name in active:
+        yield
+        return
+    active.add(name)
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        totals = _totals[name]
+        totals[0] += 1
+        totals[1] += perf_counter() - start
+        active.discard(name)
+
+
+@contextmanager
+def stage(name):
+    """Times a block of code as a call of the stage name"""
+    if not _enabled:
+        yield
+        return
+    with _timing(name):
+        yield
+
+
+def timed(name):
+    """Decorator timing every call of a function as a call of the stage name"""
+    if name not in _totals:
+        raise ValueError("No stage called {}".format(name))
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _timing(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def report(stats_=None):
+    """Returns a table of the stats"""
+    stats_ = stats() if stats_ is None else stats_
+    lines = ["{:<18} {:>10} {:>12} {:>12}".format("stage", "calls", "total/ms", "per call/us")]
+    for name, (calls, seconds) in stats_.items():
+        per_call = seconds / calls * 1e6 if calls else 0.0
+        lines.append("{:<18} {:>10} {:>12.3f} {:>12.2f}".format(name, calls, seconds * 1e3, per_call))
+    return "\n".join(lines)
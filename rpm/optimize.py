@@ -0,0 +1,181 @@
+"""
+Optimization of the layout of a room and pillar panel.
+Pillar width, pillar length and room span are searched together for the largest
+extraction ratio whose pillar factor of safety is at least the recommended one of
+the formula, whose floor bearing capacity factor of safety is at least a threshold
+and whose extraction ratio is at least the least extraction required.
+
+The search evaluates a grid of candidates at once with the unitless functions of
+rpm.batch, then repeatedly narrows the grid around the best feasible candidate.
+"""
+from __future__ import division
+
+from collections import namedtuple
+from multiprocessing import (Pool, cpu_count)
+
+import numpy as np
+
+from .batch import (magnitudes, design_strength, vertical_stress, pillar_stress, bearing_capacity)
+
+
+OptimizationResult = namedtuple("OptimizationResult", ("width", "length", "room_span", "extraction_ratio",
+                                                       "factor_of_safety", "bearing_capacity_factor_of_safety",
+                                                       "candidates"))
+Bounds = namedtuple("Bounds", ("lower", "upper"))
+
+DEFAULT_WIDTHS = Bounds(1.0, 60.0)
+# floor bearing capacity factor of safety required when none is given
+BEARING_FOS = 2.0
+
+
+def _bounds(bounds):
+    lower, upper = (float(magnitudes(value, "metre")) for value in bounds)
+    if not 0 < lower <= upper:
+        raise ValueError("Bounds must satisfy 0 < lower <= upper, not {} and {}".format(lower, upper))
+    return Bounds(lower, upper)
+
+
+def _grid(bounds, points):
+    if bounds.lower == bounds.upper:
+        return np.array([bounds.lower])
+    return np.linspace(bounds.lower, bounds.upper, points)
+
+
+def _narrow(bounds, grid, best, limits):
+    """Returns the bounds one grid step either side of best, kept within limits"""
+    if len(grid) == 1:
+        return bounds
+    step = grid[1] - grid[0]
+    return Bounds(max(limits.lower, best - step), min(limits.upper, best + step))
+
+
+def extraction(width, length, room_span):
+    """Unrounded extraction ratio in percentage"""
+    return 100 * (1 - (width / (width + room_span)) * (length / (length + room_span)))
+
+
+def evaluate_candidates(design, width, length, room_span, bearing=True):
+    """
+    Returns the pillar factor of safety, the floor bearing capacity factor of safety
+    (None without bearing) and the extraction ratio of every candidate layout
+    :param design: CompiledDesign supplying everything but the layout
+    :param width: pillar widths (metres), arrays broadcast against each other
+    :param length: pillar lengths (metres)
+    :param room_span: room spans (metres)
+    """
+    with np.errstate(all="ignore"):
+        strength = design_strength(design.formula, design.k, width, design.height, length, design.mine_depth,
+                                   design.strength, design.gaddy, design.sample_volume, design.sample_shape)
+        stress = pillar_stress(vertical_stress(design.mine_depth, design.overburden_density), width, length,
+                               room_span)
+        bearing_fos = None
+        if bearing:
+            capacity = bearing_capacity(design.friction_angle, design.cohesion, design.floor_density, width, length)
+            bearing_fos = capacity / stress
+        return strength / stress, bearing_fos, extraction(width, length, room_span)
+
+
+def optimize_compiled(design, fos, widths=DEFAULT_WIDTHS, lengths=None, spans=None, bearing_fos=BEARING_FOS,
+                      min_extraction=None, points=16, levels=5):
+    """
+    optimize for a CompiledDesign, every length is in metres and the factors of safety
+    are the least ones accepted. See optimize for the other parameters.
+    """
+    limits = [_bounds(widths), None if lengths is None else _bounds(lengths),
+              _bounds(spans if spans is not None else (design.room_span, design.room_span))]
+    current = list(limits)
+    bearing = bearing_fos is not None and None not in (design.friction_angle, design.cohesion,
+                                                       design.floor_density)
+    best = None
+    candidates = 0
+    for _ in range(levels):
+        width_grid = _grid(current[0], points)
+        length_grid = width_grid if current[1] is None else _grid(current[1], points)
+        span_grid = _grid(current[2], points)
+        if current[1] is None:
+            # square pillars
+            width, length = width_grid[:, None, None], width_grid[:, None, None]
+        else:
+            width, length = width_grid[:, None, None], length_grid[None, :, None]
+        room_span = span_grid[None, None, :]
+
+        pillar_fos, floor_fos, ratio = evaluate_candidates(design, width, length, room_span, bearing)
+        feasible = pillar_fos >= fos
+        if bearing:
+            feasible &= floor_fos >= bearing_fos
+        if min_extraction is not None:
+            feasible &= ratio >= min_extraction
+        feasible = np.broadcast_to(feasible, np.broadcast(width, length, room_span).shape)
+        candidates += feasible.size
+        if not feasible.any():
+            break
+
+        score = np.where(feasible, np.broadcast_to(ratio, feasible.shape), -np.inf)
+        i, j, s = np.unravel_index(np.argmax(score), score.shape)
+        # the best candidate of a coarser grid is usually not on the narrowed one, keep it
+        # unless this level beats it
+        if best is None or score[i, j, s] > best[3]:
+            best_width = width_grid[i]
+            best = (float(best_width), float(best_width if current[1] is None else length_grid[j]),
+                    float(span_grid[s]), float(score[i, j, s]),
+                    float(np.broadcast_to(pillar_fos, feasible.shape)[i, j, s]),
+                    None if floor_fos is None else float(np.broadcast_to(floor_fos, feasible.shape)[i, j, s]))
+
+        current = [_narrow(current[0], width_grid, best[0], limits[0]),
+                   None if current[1] is None else _narrow(current[1], length_grid, best[1], limits[1]),
+                   _narrow(current[2], span_grid, best[2], limits[2])]
+    if best is None:
+        return None
+    return OptimizationResult(*(best + (candidates,)))
+
+
+def optimize(rap, widths=DEFAULT_WIDTHS, lengths=None, spans=None, bearing_fos=BEARING_FOS, fos=None,
+             points=16, levels=5):
+    """
+    Finds the layout of a panel with the largest extraction ratio that meets its
+    factors of safety and its least extraction required (rap.min_extraction)
+    :param rap: RoomAndPillar with a formula and all the inputs needed to calculate its
+     factor of safety. Its pillar dimensions are not used, its room span only when spans is None
+    :param widths: (lower, upper) bounds of the pillar width, quantities or metres
+    :param lengths: bounds of the pillar length, None for square pillars
+    :param spans: bounds of the room span, None to keep the room span of the design
+    :param bearing_fos: least floor bearing capacity factor of safety, None to ignore the floor.
+     The floor is also ignored when its inputs have not been set
+    :param fos: least pillar factor of safety, defaults to the recommended one of the formula
+    :param points: grid points along each searched dimension at every level
+    :param levels: number of times the grid is narrowed around the best candidate; every
+     level divides the grid step by about points / 2
+    :return: OptimizationResult in metres, or None when no candidate is feasible
+    """
+    fos = rap.formula.recommended_fos if fos is None else fos
+    return optimize_compiled(rap.compile(), fos, widths, lengths, spans, bearing_fos, rap.min_extraction,
+                             points, levels)
+
+
+def _optimize_job(args):
+    design, fos, options = args
+    return optimize_compiled(design, fos, **options)
+
+
+def optimize_panels(raps, processes=None, **options):
+    """
+    Optimizes every panel of a mine plan, see optimize for the options.
+    Returns a list with an OptimizationResult or None for every design in raps.
+    :param processes: number of worker processes, defaults to the number of cpus.
+     With 1 the panels are optimized in this process
+    """
+    fos = options.pop("fos", None)
+    jobs = []
+    for rap in raps:
+        panel_options = dict(options, min_extraction=rap.min_extraction)
+        jobs.append((rap.compile(), rap.formula.recommended_fos if fos is None else fos, panel_options))
+
+    processes = processes or cpu_count()
+    if processes == 1:
+        return [_optimize_job(job) for job in jobs]
+    pool = Pool(processes)
+    try:
+        return pool.map(_optimize_job, jobs)
+    finally:
+        pool.close()
+        pool.join()
@@ -0,0 +1,131 @@
+"""
+Live preview of a design while its case is being edited.
+A LivePreview keeps one RoomAndPillar built from a case. Every update only changes
+the inputs of the fields that were edited, so the memoized outputs that do not
+depend on them (see RoomAndPillar.DEPENDENTS) are kept, and the pillar width is only
+solved again when an input it depends on has changed.
+"""
+from __future__ import division
+
+from collections import OrderedDict
+
+from .cases import (CASE_FIELDS, FRAGMENT_METHODS, case_formula, design_from_case, parse_bool, parse_number,
+                    parse_quantity, parse_enum)
+from .constants import (Countries, OreTypes)
+from .rpm_oop import (RoomAndPillar, Sample)
+
+
+# outputs shown by a preview, pillar_width is solved and the others are memoized by the design
+PREVIEW_OUTPUTS = ("pillar_width",) + tuple(RoomAndPillar.OUTPUT)
+# case fields stored as plain attributes of the design
+ATTRIBUTE_FIELDS = ("room_span", "friction_angle", "cohesion", "seam_dip", "mine_depth", "overburden_density",
+                    "floor_density")
+SAMPLE_FIELDS = ("sample_strength", "sample_height", "sample_diameter", "cylindrical")
+PILLAR_FIELDS = frozenset(SAMPLE_FIELDS + ("seam_height",))
+FORMULA_FIELDS = ("location", "ore_type", "design_type", "pillar_formula", "alpha", "beta", "k")
+# inputs of the design the pillar width is solved from
+WIDTH_INPUTS = ("formula", "pillar", "room_span", "mine_depth", "overburden_density")
+# errors of incomplete or impossible cases, which leave the outputs empty
+PREVIEW_ERRORS = (ArithmeticError, AttributeError, TypeError, ValueError)
+
+
+class LivePreview(object):
+
+    def __init__(self, case):
+        """
+        :param case: mapping of the fields of rpm.cases.CASE_FIELDS to their values
+        """
+        self.case = dict(case)
+        self.rap = None
+        self.error = None
+        self.values = OrderedDict((output, None) for output in PREVIEW_OUTPUTS)
+        self.update(self.case)
+
+    def _set_inputs(self, fields):
+        """Sets the inputs of the changed case fields on the design, returns the inputs changed"""
+        case, rap = self.case, self.rap
+        changed = set()
+        for field in fields:
+            if field in ATTRIBUTE_FIELDS:
+                setattr(rap, field, parse_quantity(case.get(field), CASE_FIELDS[field]))
+                changed.add(field)
+            elif field == "min_extraction":
+                rap.min_extraction = parse_number(case.get(field))
+                changed.add(field)
+            elif field == "rmr":
+                rmr = parse_number(case.get(field))
+                rap.rmr = None if rmr is None else int(rmr)
+            elif field == "fragment_method":
+                method = case.get(field)
+                if method not in FRAGMENT_METHODS.values():
+                    method = FRAGMENT_METHODS.get(str(method or "drill blast").strip().lower(),
+                                                  RoomAndPillar.DRILL_BLAST)
+                rap.fragment_method = method
+            elif field == "project_name":
+                rap.project_name = case.get(field) or ""
+
+        if PILLAR_FIELDS.intersection(fields):
+            rap.seam_height = parse_quantity(case.get("seam_height"), CASE_FIELDS["seam_height"])
+            rap.pillar.height = rap.seam_height
+            rap.pillar.sample = Sample(parse_quantity(case.get("sample_strength"), CASE_FIELDS["sample_strength"]),
+                                       parse_quantity(case.get("sample_height"), CASE_FIELDS["sample_height"]),
+                                       parse_quantity(case.get("sample_diameter"), CASE_FIELDS["sample_diameter"]),
+                                       parse_bool(case.get("cylindrical")))
+            rap.invalidate("pillar")
+            changed.add("pillar")
+
+        if set(FORMULA_FIELDS).intersection(fields):
+            rap.location = parse_enum(Countries, case.get("location"), Countries.other)
+            rap.ore_type = parse_enum(OreTypes, case.get("ore_type"), OreTypes.other)
+            design_type = str(case.get("design_type") or RoomAndPillar.INITIAL).strip().lower()
+            rap.design_type = RoomAndPillar.REDESIGN if design_type == RoomAndPillar.REDESIGN \
+                else RoomAndPillar.INITIAL
+            if rap.design_type == RoomAndPillar.REDESIGN:
+                rap.formula = case_formula(case)
+            else:
+                rap.formula_decide()
+            changed.add("formula")
+        return changed
+
+    def update(self, changes):
+        """
+        Applies the edited fields of the case and recomputes the outputs that depend on them
+        :param changes: mapping of the edited case fields to their new values
+        :return: OrderedDict of the outputs that were recomputed to their values, all of
+         them set to None when the case cannot be designed (see error)
+        """
+        self.case.update(changes)
+        affected = set()
+        try:
+            if self.rap is None or self.error is not None:
+                # a new or broken design is built again from the whole case
+                self.rap = design_from_case(self.case)
+                self.rap.formula_decide()
+                changed = set(WIDTH_INPUTS)
+            else:
+                changed = self._set_inputs(changes)
+            if changed.intersection(WIDTH_INPUTS):
+                self.rap.pillar_width_from_fos_and_stress()
+                changed.add("pillar")
+                affected.add("pillar_width")
+            for name in changed:
+                affected.update(RoomAndPillar.DEPENDENTS.get(name, ()))
+            recomputed = OrderedDict()
+            for output in PREVIEW_OUTPUTS:
+                if output in affected:
+                    recomputed[output] = self._output(output)
+        except PREVIEW_ERRORS as e:
+            self.error = str(e) or type(e).__name__
+            recomputed = OrderedDict((output, None) for output in PREVIEW_OUTPUTS)
+        else:
+            self.error = None
+        self.values.update(recomputed)
+        return recomputed
+
+    def _output(self, output):
+        rap = self.rap
+        if output == "pillar_width":
+            return rap.pillar.width
+        if output.startswith("bearing_capacity") and None in (rap.friction_angle, rap.cohesion, rap.floor_density):
+            return None
+        return getattr(rap, output)
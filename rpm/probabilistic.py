@@ -0,0 +1,159 @@
+"""
+Probabilistic design of room and pillar systems.
+The uncertain inputs of a RoomAndPillar are given as distributions, millions of
+realizations are drawn in vectorized batches spread over a pool of processes and
+the factors of safety of the pillars and the floor are summarised by their
+probability of failure and percentiles.
+"""
+from __future__ import division
+
+from collections import namedtuple
+from multiprocessing import (Pool, cpu_count)
+
+import numpy as np
+
+from .batch import (CMRI, magnitudes, design_strength, vertical_stress, pillar_stress, bearing_capacity)
+from .compiled import (LENGTH, STRESS, UNIT_WEIGHT)
+
+
+class Normal(namedtuple("Normal", ("mean", "std"))):
+    """Normal distribution. mean and std may be quantities"""
+
+    def sample(self, rng, size, unit):
+        return rng.normal(magnitudes(self.mean, unit), magnitudes(self.std, unit), size)
+
+
+class LogNormal(namedtuple("LogNormal", ("mean", "std"))):
+    """Log-normal distribution with the given mean and standard deviation"""
+
+    def sample(self, rng, size, unit):
+        mean, std = magnitudes(self.mean, unit), magnitudes(self.std, unit)
+        sigma = np.sqrt(np.log(1 + (std / mean) ** 2))
+        return rng.lognormal(np.log(mean) - sigma ** 2 / 2, sigma, size)
+
+
+class Uniform(namedtuple("Uniform", ("low", "high"))):
+
+    def sample(self, rng, size, unit):
+        return rng.uniform(magnitudes(self.low, unit), magnitudes(self.high, unit), size)
+
+
+class Triangular(namedtuple("Triangular", ("low", "mode", "high"))):
+
+    def sample(self, rng, size, unit):
+        return rng.triangular(magnitudes(self.low, unit), magnitudes(self.mode, unit),
+                              magnitudes(self.high, unit), size)
+
+
+# uncertain input: (attribute of CompiledDesign, unit its distribution is sampled in)
+RANDOM_INPUTS = {
+    "sample_strength": ("strength", STRESS),
+    "overburden_density": ("overburden_density", UNIT_WEIGHT),
+    "mine_depth": ("mine_depth", LENGTH),
+    "cohesion": ("cohesion", STRESS),
+    "friction_angle": ("friction_angle", "radian"),
+    "floor_density": ("floor_density", UNIT_WEIGHT),
+}
+BEARING_INPUTS = ("friction_angle", "cohesion", "floor_density")
+PERCENTILES = (1, 5, 10, 50, 90, 95, 99)
+
+MonteCarloResult = namedtuple("MonteCarloResult", ("realizations", "pillar_fos", "floor_fos",
+                                                   "pillar_failure_probability", "floor_failure_probability",
+                                                   "pillar_percentiles", "floor_percentiles",
+                                                   "pillar_invalid", "floor_invalid"))
+
+
+def _realize(args):
+    """Returns the pillar and floor factors of safety of one batch of realizations"""
+    design, distributions, seed, size = args
+    rng = np.random.default_rng(seed)
+    values = dict((field, getattr(design, field)) for field, _ in RANDOM_INPUTS.values())
+    for name in sorted(distributions):
+        field, unit = RANDOM_INPUTS[name]
+        values[field] = distributions[name].sample(rng, size, unit)
+
+    # every sample derived k and the gaddy factor are proportional to the sample strength
+    strength_ratio = values["strength"] / design.strength
+    k = design.k
+    if k is not None and design.formula.k_type != design.formula.OTHER and design.formula.name != CMRI.name:
+        k = k * strength_ratio
+    with np.errstate(all="ignore"):
+        strength = design_strength(design.formula, k, design.width, design.height, design.length,
+                                   values["mine_depth"], values["strength"], design.gaddy * strength_ratio,
+                                   design.sample_volume, design.sample_shape)
+        pre_mining = vertical_stress(values["mine_depth"], values["overburden_density"])
+        stress = pillar_stress(pre_mining, design.width, design.length, design.room_span)
+        pillar_fos = np.broadcast_to(strength / stress, (size,))
+        floor_fos = None
+        if all(values[RANDOM_INPUTS[name][0]] is not None for name in BEARING_INPUTS):
+            capacity = bearing_capacity(values["friction_angle"], values["cohesion"], values["floor_density"],
+                                        design.width, design.length)
+            floor_fos = np.broadcast_to(capacity / stress, (size,))
+    return pillar_fos, floor_fos
+
+
+def _summarise(fos, percentiles):
+    """Returns the probability of failure, the percentiles and the number of invalid realizations"""
+    if fos is None:
+        return None, None, None
+    valid = np.isfinite(fos)
+    finite = fos[valid]
+    invalid = fos.size - finite.size
+    # invalid realizations count as failures, so they can only raise the probability of failure
+    probability = (np.count_nonzero(finite < 1) + invalid) / fos.size
+    values = np.percentile(finite, percentiles) if finite.size else np.full(len(percentiles), np.nan)
+    return probability, dict(zip(percentiles, values)), invalid
+
+
+def monte_carlo(rap, distributions, realizations=10 ** 6, batch_size=10 ** 5, seed=None, processes=None,
+                percentiles=PERCENTILES):
+    """
+    Runs a Monte Carlo simulation of the factors of safety of a design.
+    The batches are seeded from seed independently of the number of processes, so a
+    seed always gives the same results. Realizations whose factor of safety is not a
+    finite number (e.g. the strength of a negative depth drawn from a normal distribution)
+    are invalid: they count as failures in the probabilities of failure, are left out
+    of the percentiles and their number is reported.
+    :param rap: RoomAndPillar with all the inputs needed to calculate its factor of safety
+    :param distributions: mapping of the names in RANDOM_INPUTS to Normal, LogNormal,
+     Uniform or Triangular distributions. Inputs without a distribution are fixed
+    :param realizations: number of realizations to draw, at least 1
+    :param batch_size: number of realizations drawn at once by a process
+    :param seed: seed of the random number generator
+    :param processes: number of worker processes, defaults to the number of cpus.
+     With 1 the batches are run in this process
+    :param percentiles: percentiles of the factors of safety to report
+    :return: MonteCarloResult. The floor results are None when the bearing capacity
+     inputs of the design are not set
+    """
+    unknown = set(distributions) - set(RANDOM_INPUTS)
+    if unknown:
+        raise ValueError("No uncertain input called {}".format(", ".join(sorted(unknown))))
+    if realizations < 1 or batch_size < 1:
+        raise ValueError("At least one realization is needed in batches of at least one")
+    design = rap.compile()
+    sizes = [batch_size] * (realizations // batch_size)
+    if realizations % batch_size:
+        sizes.append(realizations % batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(design, distributions, batch_seed, size) for batch_seed, size in zip(seeds, sizes)]
+
+    processes = processes or cpu_count()
+    if processes == 1:
+        batches = [_realize(job) for job in jobs]
+    else:
+        pool = Pool(processes)
+        try:
+            batches = pool.map(_realize, jobs)
+        finally:
+            pool.close()
+            pool.join()
+
+    pillar_fos = np.concatenate([pillar for pillar, _ in batches])
+    floor_fos = None
+    if batches[0][1] is not None:
+        floor_fos = np.concatenate([floor for _, floor in batches])
+    pillar_pof, pillar_percentiles, pillar_invalid = _summarise(pillar_fos, percentiles)
+    floor_pof, floor_percentiles, floor_invalid = _summarise(floor_fos, percentiles)
+    return MonteCarloResult(realizations, pillar_fos, floor_fos, pillar_pof, floor_pof,
+                            pillar_percentiles, floor_percentiles, pillar_invalid, floor_invalid)
@@ -0,0 +1,242 @@
+"""
+Project files of room and pillar designs.
+A project holds design variants, sensitivity sweeps and Monte Carlo simulations.
+The file is a small fixed preamble, a JSON header and the numeric arrays of the
+results stored raw, each at an offset aligned to ALIGNMENT bytes:
+
+    offset  size  content
+    0       8     MAGIC
+    8       2     format version, little-endian unsigned
+    10      4     size of the JSON header in bytes, little-endian unsigned
+    14      n     JSON header: designs as DesignRecords, the sweeps and simulations
+                  with the index of each of their arrays, and the dtype, shape and
+                  offset (from the start of the data) of every array
+    ...           padding up to the next multiple of ALIGNMENT, the start of the data
+
+On load the arrays are memory-mapped, so opening a project with millions of results
+only reads its header.
+"""
+from __future__ import division
+
+from collections import OrderedDict
+import json
+import os
+import struct
+
+import numpy as np
+
+from . import (is_quantity, quantity)
+from .formulas import (StrengthFormula, name_to_formula, register_formula)
+from .probabilistic import MonteCarloResult
+from .records import DesignRecord
+from .sensitivity import SweepResult
+
+
+MAGIC = b"RAPPROJ\x00"
+VERSION = 1
+ALIGNMENT = 64
+_PREAMBLE = struct.Struct("<8sHI")
+# fields of DesignRecord holding enumerations, stored by name
+_ENUM_FIELDS = ("location", "ore_type")
+_SWEEP_ARRAYS = ("values", "factor_of_safety", "bearing_capacity_factor_of_safety", "extraction_ratio")
+_SIMULATION_ARRAYS = ("pillar_fos", "floor_fos")
+
+
+class ProjectFileError(ValueError):
+    """
+    Raised for files that are not projects, are truncated or malformed, were written
+    by a newer version or hold a custom formula that conflicts with a registered one
+    """
+
+
+class Project(object):
+
+    def __init__(self, name="", designs=None, sweeps=None, simulations=None):
+        """
+        :param designs: list of RoomAndPillar design variants
+        :param sweeps: mapping of a name to a SweepResult, see rpm.sensitivity
+        :param simulations: mapping of a name to a MonteCarloResult, see rpm.probabilistic
+        """
+        self.name = name
+        self.designs = list(designs or [])
+        self.sweeps = OrderedDict(sweeps or ())
+        self.simulations = OrderedDict(simulations or ())
+
+
+def _aligned(size):
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+class _ArrayWriter(object):
+    """Collects the arrays of a project and lays them out one after the other"""
+
+    def __init__(self):
+        self.arrays = []
+        self.entries = []
+        self.size = 0
+
+    def add(self, array):
+        """Returns the index of array in the header, None for no array"""
+        if array is None:
+            return None
+        unit = None
+        if is_quantity(array):
+            array, unit = array.magnitude, str(array.units)
+        array = np.ascontiguousarray(array)
+        if array.dtype.kind not in "biuf":
+            raise TypeError("Only numeric arrays can be saved, not {}".format(array.dtype))
+        array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+        self.arrays.append(array)
+        self.entries.append({"dtype": array.dtype.str, "shape": list(array.shape), "offset": self.size,
+                             "unit": unit})
+        self.size = _aligned(self.size + array.nbytes)
+        return len(self.arrays) - 1
+
+
+def _record_to_json(record):
+    values = record._asdict()
+    for field in _ENUM_FIELDS:
+        if values[field] is not None:
+            values[field] = values[field].name
+    return values
+
+
+def _custom_formula(formula):
+    return {"name": formula.name, "expression": formula.expression, "k_type": formula.k_type, "k": formula.k,
+            "alpha": formula.alpha, "beta": formula.beta, "fos": list(formula.fos),
+            "unit_system": formula.unit_system}
+
+
+def save_project(path, project):
+    """Writes a Project to path, replacing any file there"""
+    writer = _ArrayWriter()
+    formulas = OrderedDict()
+    designs = []
+    for rap in project.designs:
+        designs.append(_record_to_json(DesignRecord.from_design(rap)))
+        if rap.formula is not None and rap.formula.category == StrengthFormula.CUSTOM:
+            formulas[rap.formula.name] = _custom_formula(rap.formula)
+
+    sweeps = []
+    for name, sweep in project.sweeps.items():
+        entry = {"name": name, "parameter": sweep.parameter}
+        entry.update((field, writer.add(getattr(sweep, field))) for field in _SWEEP_ARRAYS)
+        sweeps.append(entry)
+
+    simulations = []
+    for name, result in project.simulations.items():
+        entry = {"name": name, "realizations": int(result.realizations)}
+        entry.update((field, writer.add(getattr(result, field))) for field in _SIMULATION_ARRAYS)
+        for side in ("pillar", "floor"):
+            probability = getattr(result, side + "_failure_probability")
+            percentiles = getattr(result, side + "_percentiles")
+            invalid = getattr(result, side + "_invalid")
+            entry[side + "_failure_probability"] = None if probability is None else float(probability)
+            entry[side + "_invalid"] = None if invalid is None else int(invalid)
+            entry[side + "_percentiles"] = None if percentiles is None else \
+                [[float(key), float(value)] for key, value in percentiles.items()]
+        simulations.append(entry)
+
+    header = json.dumps({"name": project.name, "formulas": list(formulas.values()), "designs": designs,
+                         "sweeps": sweeps, "simulations": simulations, "arrays": writer.entries},
+                        separators=(",", ":")).encode("utf-8")
+    data_start = _aligned(_PREAMBLE.size + len(header))
+    with open(path, "wb") as project_file:
+        project_file.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        project_file.write(header)
+        for array, entry in zip(writer.arrays, writer.entries):
+            project_file.write(b"\0" * (data_start + entry["offset"] - project_file.tell()))
+            project_file.write(array.tobytes())
+
+
+def read_header(path):
+    """Returns the JSON header of a project file and the offset of its data"""
+    with open(path, "rb") as project_file:
+        preamble = project_file.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise ProjectFileError("{} is not a project file".format(path))
+        magic, version, size = _PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            raise ProjectFileError("{} is not a project file".format(path))
+        if version > VERSION:
+            raise ProjectFileError("{} was saved by a newer version (format {})".format(path, version))
+        content = project_file.read(size)
+    if len(content) < size:
+        raise ProjectFileError("{} is truncated".format(path))
+    try:
+        header = json.loads(content.decode("utf-8"))
+    except ValueError as e:
+        raise ProjectFileError("{} has a malformed header: {}".format(path, e))
+    if not isinstance(header, dict):
+        raise ProjectFileError("{} has a malformed header".format(path))
+    return header, _aligned(_PREAMBLE.size + size)
+
+
+def _formula(definition):
+    """
+    Returns the registered formula of a custom formula definition, registering it if needed
+    :raises ProjectFileError: when a different formula has the name of the definition
+    """
+    try:
+        formula = name_to_formula(definition["name"])
+    except ValueError:
+        return register_formula(**definition)
+    if formula.category != StrengthFormula.CUSTOM or _custom_formula(formula) != dict(definition,
+                                                                                       fos=list(definition["fos"])):
+        raise ProjectFileError("The project's formula {} differs from the formula of that name in use"
+                               .format(definition["name"]))
+    return formula
+
+
+def load_project(path, mmap=True):
+    """
+    Reads a Project. Custom formulas of its designs are registered when no formula
+    has their name.
+    :param mmap: memory-map the arrays read-only, False to read them into memory
+    :raises ProjectFileError: see ProjectFileError
+    """
+    header, data_start = read_header(path)
+    try:
+        return _read_project(path, header, data_start, mmap)
+    except (KeyError, TypeError, IndexError, AttributeError) as e:
+        raise ProjectFileError("{} has a malformed header: {!r}".format(path, e))
+
+
+def _read_project(path, header, data_start, mmap):
+    file_size = os.path.getsize(path)
+    arrays = []
+    for entry in header["arrays"]:
+        dtype, shape = np.dtype(entry["dtype"]), tuple(entry["shape"])
+        offset = data_start + entry["offset"]
+        if offset + dtype.itemsize * int(np.prod(shape, dtype=int)) > file_size:
+            raise ProjectFileError("{} is truncated".format(path))
+        if not np.prod(shape, dtype=int):
+            array = np.empty(shape, dtype)
+        elif mmap:
+            array = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+        else:
+            array = np.fromfile(path, dtype=dtype, count=int(np.prod(shape)), offset=offset).reshape(shape)
+        arrays.append(array if entry["unit"] is None else quantity(array, entry["unit"]))
+
+    def array(index):
+        return None if index is None else arrays[index]
+
+    for definition in header["formulas"]:
+        definition["fos"] = tuple(definition["fos"])
+        _formula(definition)
+    designs = [DesignRecord(**values).to_design() for values in header["designs"]]
+    sweeps = OrderedDict((entry["name"], SweepResult(entry["parameter"], *[array(entry[field]) for field in
+                                                                          _SWEEP_ARRAYS]))
+                         for entry in header["sweeps"])
+    simulations = OrderedDict()
+    for entry in header["simulations"]:
+        percentiles = [None if entry[side] is None else OrderedDict((int(key) if key == int(key) else key, value)
+                                                                  for key, value in entry[side])
+                       for side in ("pillar_percentiles", "floor_percentiles")]
+        simulations[entry["name"]] = MonteCarloResult(entry["realizations"], array(entry["pillar_fos"]),
+                                                      array(entry["floor_fos"]),
+                                                      entry["pillar_failure_probability"],
+                                                      entry["floor_failure_probability"], *percentiles,
+                                                      pillar_invalid=entry.get("pillar_invalid"),
+                                                      floor_invalid=entry.get("floor_invalid"))
+    return Project(header["name"], designs, sweeps, simulations)
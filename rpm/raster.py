@@ -0,0 +1,119 @@
+"""
+Evaluation of a panel over a raster of overburden depths.
+Every cell of the depth grid is the depth of cover over one pillar. The grid and the
+output rasters are memory-mapped and processed a tile of rows at a time, so grids
+larger than the memory of the machine can be evaluated.
+"""
+from __future__ import division
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from .batch import (design_strength, vertical_stress, pillar_stress)
+
+
+OUTPUTS = ("pillar_stress", "pillar_strength", "factor_of_safety")
+# bytes of float64 temporaries a tile may use
+TILE_BYTES = 64 * 2 ** 20
+# float64 temporaries used per cell while a tile is evaluated
+_TEMPORARIES = 12
+
+
+def open_grid(path, shape=None, dtype="float64", offset=0):
+    """
+    Memory-maps a grid read-only.
+    :param path: .npy file, or a raw raster with no header
+    :param shape: (rows, columns) of a raw raster
+    :param dtype: type of the cells of a raw raster
+    :param offset: bytes before the first cell of a raw raster
+    """
+    if str(path).endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    if shape is None:
+        raise ValueError("The shape of raw raster {} is needed".format(path))
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=tuple(shape))
+
+
+def tile_rows(columns, tile_bytes=TILE_BYTES):
+    """Returns the number of rows of a grid with the given columns evaluated at once"""
+    return max(1, int(tile_bytes // (columns * 8 * _TEMPORARIES)))
+
+
+def _layout(value, rows):
+    """Returns the rows of a layout that is a number or a grid"""
+    if value is None or np.ndim(value) == 0:
+        return value
+    return np.asarray(value[rows], dtype=float)
+
+
+def evaluate_tile(design, depth, width=None, length=None, room_span=None):
+    """
+    Returns the pillar stress, pillar strength (megapascals) and factor of safety of
+    the pillars under a tile of depths (metres)
+    :param design: CompiledDesign of the panel
+    :param width: pillar widths (metres) for the tile, defaults to the pillar width of design
+    """
+    width = design.width if width is None else width
+    length = design.length if length is None else length
+    room_span = design.room_span if room_span is None else room_span
+    with np.errstate(all="ignore"):
+        stress = pillar_stress(vertical_stress(depth, design.overburden_density), width, length, room_span)
+        strength = design_strength(design.formula, design.k, width, design.height, length, depth,
+                                   design.strength, design.gaddy, design.sample_volume, design.sample_shape)
+        return stress, np.broadcast_to(strength, np.shape(stress)), strength / stress
+
+
+def panel_rasters(rap, depth, outputs=None, width=None, length=None, room_span=None, depth_scale=1.0,
+                  nodata=None, tile_bytes=TILE_BYTES):
+    """
+    Evaluates a panel over a grid of depths a tile of rows at a time
+    :param rap: RoomAndPillar with all the inputs needed for its factor of safety; its
+     mine depth is replaced by the depth of every cell
+    :param depth: 2-d grid of depths, e.g. from open_grid
+    :param outputs: mapping of the names in OUTPUTS to the .npy paths they are written to.
+     Names mapped to None are kept in memory. Defaults to the factor of safety in memory
+    :param width: pillar width (metres), a number or a grid of the shape of depth
+    :param length: pillar length (metres), a number or a grid, defaults to width
+    :param room_span: room span (metres), a number or a grid
+    :param depth_scale: factor converting the depths to metres, e.g. 0.3048 for feet
+    :param nodata: depth value of cells without data, whose outputs are NaN
+    :param tile_bytes: memory the temporaries of a tile may use
+    :return: dict of the outputs, memory-mapped where a path was given
+    """
+    outputs = {"factor_of_safety": None} if outputs is None else outputs
+    unknown = set(outputs) - set(OUTPUTS)
+    if unknown:
+        raise ValueError("No output called {}".format(", ".join(sorted(unknown))))
+    if np.ndim(depth) != 2:
+        raise ValueError("The depth grid must have 2 dimensions, not {}".format(np.ndim(depth)))
+    shape = np.shape(depth)
+    rasters = {}
+    for name, path in outputs.items():
+        if path is None:
+            rasters[name] = np.empty(shape)
+        else:
+            rasters[name] = open_memmap(path, mode="w+", dtype="float64", shape=shape)
+
+    design = rap.compile()
+    length = width if length is None else length
+    step = tile_rows(shape[1], tile_bytes)
+    for start in range(0, shape[0], step):
+        rows = slice(start, min(start + step, shape[0]))
+        tile = np.asarray(depth[rows], dtype=float)
+        if nodata is not None:
+            tile = np.where(tile == nodata, np.nan, tile)
+        values = evaluate_tile(design, tile * depth_scale, _layout(width, rows), _layout(length, rows),
+                               _layout(room_span, rows))
+        for name, value in zip(OUTPUTS, values):
+            if name in rasters:
+                rasters[name][rows] = value
+
+    for raster in rasters.values():
+        if isinstance(raster, np.memmap):
+            raster.flush()
+    return rasters
+
+
+def fos_raster(rap, depth, output=None, **options):
+    """Returns the factor of safety raster of a panel, see panel_rasters for the options"""
+    return panel_rasters(rap, depth, {"factor_of_safety": output}, **options)["factor_of_safety"]
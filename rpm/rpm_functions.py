@@ -1,10 +1,14 @@
 from __future__ import division
 
+import logging
 import math
 
-from .rpm_oop import ALL_FORMULA
+from .bearing import bearing_factors
+from .formulas import ALL_FORMULA
 
 
+logger = logging.getLogger(__name__)
+
 SALAMON_MUNRO = ALL_FORMULA[1]
 OBERT_DUVAL = ALL_FORMULA[5]
 
@@ -149,11 +153,7 @@ def extraction_ratio(pillar_width, pillar_length, room_width):
 
 
 def strength_factor_ng(angle_of_friction):
-    constant_n = 1
-    radian_angle = math.radians(angle_of_friction)
-    first_part = math.e ** (constant_n * math.tan(radian_angle))
-    second_part = math.tan(math.radians(45) + radian_angle/2) ** 2
-    return first_part * second_part
+    return bearing_factors(math.radians(angle_of_friction)).bcf_q
 
 
 def strength_factor_ny(strength_fact_ng, angle_of_friction):
@@ -166,10 +166,11 @@ def shape_factor_gamma(pillar_width, pillar_length):
 
 
 def shape_factor_g(friction_angle, pillar_width, pillar_length):
-    print("\nFriction Angle:%d\tPillar Width:%d\tPillar Length:%d" % (friction_angle, pillar_width, pillar_length))
+    logger.debug("Friction angle: %s, pillar width: %s, pillar length: %s", friction_angle, pillar_width,
+                 pillar_length)
     a = math.sin(friction_angle)
     b = pillar_width / pillar_length
-    print("Print values:\n", a, b)
+    logger.debug("Shape factor terms: %s, %s", a, b)
     return 1.0 + (a * b)
 
 
@@ -179,8 +180,7 @@ def max_tensile_stress(sample_unit_weight, span, roof_thickness, constants=OBERT
 
 
 def is_good_roof_span_fos(factor):
-    print(factor)
-    pass
+    logger.debug("Roof span factor of safety: %s", factor)
 
 
 # def roof_floor_bearing_capacity(rock_density, pillar_width, pillar_length, friction_angle, cohesion):
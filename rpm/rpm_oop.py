@@ -1,19 +1,23 @@
 from __future__ import division
 from datetime import datetime
-from collections import namedtuple
+import logging
 import math
 from os.path import (dirname, join)
 
-from mpmath import findroot
-
 from . import (Q_, unit_reg, ZERO_LENGTH)
-from .utils import cotangent
+from .formulas import (SafetyTuple, fos_tuple, StrengthFormula, SF, hardy_agapito, salamon_munro, bieniawski,
+                       stacey_page, cmri, obert_duval, holland_gaddy, holland, msalamon_munro, ALL_FORMULA,
+                       name_to_formula, available_formula, register_formula)
+from .bearing import bearing_factors
+from .instrument import (stage, timed)
+from .utils import (cotangent, memoized_property, dependents)
 from .constants import OreTypes, Countries
 
 
+logger = logging.getLogger(__name__)
+
 rpm_dir = join(dirname(__file__), "..")
 MISC_DIR = join(rpm_dir, "misc")
-print(MISC_DIR)
 
 def requires(obj, attrib_list):
     """
@@ -32,151 +36,6 @@ def left_align_pad(string, size):
     return padded
 
 
-fos_tuple = namedtuple("SafetyTuple", ("lower", "recommended", "upper"))
-
-
-class StrengthFormula(object):
-
-    CUBICAL, UNIAXIAL, GADDY, OTHER = "cubical", "uniaxial", "gaddy", "other"
-    METRIC, IMPERIAL = "metric", "imperial"
-    LINEAR, EXPONENTIAL, ODD = "linear", "exponential", "odd"
-    __slots__ = ("k_type", "beta", "alpha", "category", "fos", "unit_system", "k", "name")
-
-    def __init__(self, alpha, beta, k_type, category,  fos=(1.0, 1.5, 2.0),
-                 unit_system=None, k=None, name=None):
-        self.alpha = alpha
-        self.beta = beta
-        self.k_type = k_type
-        self.category = category
-        self.fos = fos_tuple(lower=fos[0], recommended=fos[1], upper=fos[-1])
-        self.unit_system = unit_system or self.IMPERIAL
-        self.k = k
-        self.name = name
-
-        # k should have a value only when k type is other
-        # all the other types are calculated from data
-        # some odd formulas do not have k defined
-        if self.category != StrengthFormula.ODD:
-            assert ((self.k_type == StrengthFormula.OTHER and k is not None) or
-                   (self.k_type != StrengthFormula.OTHER and k is None))
-
-    @property
-    def constants(self):
-        return self.k, self.alpha, self.beta
-
-    def __str__(self):
-        return "{}, k={}, a={} and b={}".format(self.name, self.k or self.k_type, self.alpha, self.beta)
-
-    def pillar_strength(self, pillar, k=None):
-        k = self.get_correct_k(pillar, k)
-
-        a_base, b_base = pillar.width, pillar.height
-        if self.unit_system == self.METRIC:
-            a_base = a_base.to(unit_reg.metre).magnitude
-            b_base = b_base.to(unit_reg.metre).magnitude
-        else:
-            a_base = a_base.to(unit_reg.foot).magnitude
-            b_base = b_base.to(unit_reg.foot).magnitude
-
-        if self.category == self.LINEAR:
-            # print("using linear relation in pillar strength")
-            strength = self.linear_strength(k, a_base, b_base)
-        else:
-            # print("using exponential relation in pillar strength")
-            strength = self.exponential_strength(k, a_base, b_base)
-        # print("Pillar strength incoming!:", strength)
-
-        if self.unit_system == self.METRIC:
-            return strength * unit_reg("megapascal")
-        else:
-            return strength * unit_reg.psi
-
-    def linear_strength(self, k, a_base, b_base):
-        # print("using a linear relation")
-        return k * (self.alpha + self.beta * (a_base / b_base))
-
-    def exponential_strength(self, k, a_base, b_base):
-        # print("using an exponential relation in exponential strength.")
-        # print(k, a_base, self.alpha, b_base, self.beta)
-        # print(a_base ** self.alpha)
-        # print(b_base ** self.beta)
-        return k * a_base ** self.alpha * b_base ** self.beta
-
-    def is_good_factor_of_safety(self, fos):
-        return self.fos.lower <= fos <= self.fos.upper
-
-    @property
-    def recommended_fos(self):
-        return self.fos.recommended
-
-    def get_correct_k(self, pillar=None, default=None):
-        """
-        The various properties that can be used in place of constant k, the material constant
-        are properties of the pillar sample. Where this is not the case, they are empirical
-        values determined for the formula.
-        If no pillar object is provided it assumes the formula has a defined k which it tries
-        to return. If that too is not provided, then the function can be given a default value
-        which it returns.
-        When all the above, it raises an AttributeError.
-        """
-        print("Trying to get correct k")
-        if pillar is not None:
-            print("Pillar is not None")
-            sample = pillar.sample
-            if self.k_type == self.CUBICAL:
-                k_value = sample.cubical_strength
-            elif self.k_type == self.GADDY:
-                k_value = sample.gaddy_factor
-            elif self.k_type == self.UNIAXIAL:
-                k_value = sample.strength
-            # convert to the right unit system so that final calculation can be done blindly
-            # trying to do final calculation with 'wise' units raises several errors
-            try:
-                # for cases when all the above conditionals fail
-                if self.unit_system == self.METRIC:
-                    k_value.ito(unit_reg.mpa)
-                else:
-                    k_value.ito(unit_reg.psi)
-                return k_value.magnitude
-            except Exception as e:
-                print(e)
-        # These values as raw values and do not need any unit conversion
-        if self.k:
-            print("Pillar is none or formula has k")
-            return self.k
-        elif default:
-            print("Pillar is none or formula has default")
-            return default
-        raise AttributeError("Attribute k for Pillar Strength formula is None.\n{}".format(self))
-
-
-# The various formula that are used in calculating pillar strength
-# The value of each enumeration is a tuple of the constants that
-# are used along with the formula
-
-SF = StrengthFormula
-hardy_agapito = SF(alpha=-0.118, beta=0.833, k_type=SF.CUBICAL, fos=(1.0, 2.0, 2.0), unit_system=SF.METRIC,
-                   category=SF.EXPONENTIAL, name="Hardy-Agapito")
-salamon_munro = SF(alpha=0.46, beta=-0.66, k_type=SF.OTHER, fos=(1.31, 1.6, 1.88), unit_system=SF.IMPERIAL,
-                   category=SF.EXPONENTIAL, k=1320, name="Salamon-Munro")
-bieniawski = SF(alpha=0.64, beta=0.36, k_type=SF.CUBICAL, fos=(1.5, 1.5, 2.0), unit_system=SF.IMPERIAL,
-                category=SF.LINEAR, name="Bieniawski")
-stacey_page = SF(alpha=0.5, beta=0.7, k_type=SF.GADDY, fos=(1.0, 1.5, 2.0), unit_system=SF.METRIC,
-                 category=SF.EXPONENTIAL, name="Stacey-Page")
-cmri = SF(1, -1, k_type=SF.OTHER, fos=(1, 1, 1), category=SF.ODD, name="C.M.R.I.")
-obert_duval = SF(alpha=0.778, beta=0.22, category=SF.LINEAR, k_type=SF.CUBICAL, fos=(1.5, 2.0, 4.0),
-                 unit_system=SF.IMPERIAL, name="Obert-Duval")
-holland_gaddy = SF(alpha=0.5, beta=-1, k_type=SF.GADDY, fos=(1.8, 2.0, 2.2), unit_system=SF.IMPERIAL,
-                   category=SF.EXPONENTIAL, name="Holland-Gaddy")
-holland = SF(alpha=0.5, beta=-0.5, k_type=SF.CUBICAL, fos=(1.0, 2.0, 2.0), unit_system=SF.IMPERIAL,
-             category=SF.EXPONENTIAL, name="Holland")
-msalamon_munro = SF(alpha=0.46, beta=-0.66, k_type=SF.OTHER, fos=(1.31, 1.6, 1.88), unit_system=SF.METRIC,
-                   category=SF.EXPONENTIAL, k=7.2, name="Salamon-Munro (metric)")
-
-ALL_FORMULA = (hardy_agapito, salamon_munro, bieniawski, stacey_page, cmri, obert_duval, holland, holland_gaddy,
-               msalamon_munro)
-
-
 class Solid(object):
     """A class to represent a solid/3D body such as pillars and core samples
     Most of the classes that subclass this one usually have square cross-section
@@ -184,6 +43,8 @@ class Solid(object):
      as the x dimension.
     """
 
+    __slots__ = ("height", "length", "width")
+
     def __init__(self, height, length, width=None):
         """
         None of the following dimensions is allowed to be negative
@@ -211,6 +72,8 @@ class Solid(object):
 
 class Pillar(Solid):
 
+    __slots__ = ("sample",)
+
     def __init__(self, sample, height, length, width=None):
         """
         :param sample: sample of pillar material used in compressive test
@@ -245,6 +108,8 @@ class Sample(Solid):
     in uniaxial compressive tests.
     """
 
+    __slots__ = ("strength", "is_cylinder")
+
     def __init__(self, strength, height, diameter, cylindrical=False):
         """
         None of the following dimensions is allowed to be negative
@@ -336,9 +201,15 @@ class RoomAndPillar(object):
     DRILL_BLAST, CONTINUOUS_MINER = range(233583, 233585)
     INITIAL, REDESIGN = "initial", "redesign"
 
+    # input: every memoized property computed from it, filled in after the class body
+    DEPENDENTS = {}
+    __slots__ = tuple(HUMAN_FRIENDLY) + ("pillar", "formula", "inputIO", "outputIO", "html_report", "_cache")
+
     def __init__(self, pillar=None, formula=None, room_span=None):
+        self._cache = {}
         for attrib in RoomAndPillar.HUMAN_FRIENDLY.keys():
-            self.__setattr__(attrib, None)
+            # nothing has been memoized yet so there is nothing to invalidate
+            object.__setattr__(self, attrib, None)
         self.pillar = pillar
         self.room_span = room_span
         self.formula = formula
@@ -346,6 +217,43 @@ class RoomAndPillar(object):
         self.outputIO = ""
         self.html_report = ""
 
+    def __getstate__(self):
+        state = dict((name, getattr(self, name)) for name in self.__slots__ if hasattr(self, name))
+        # a copy memoizes its own outputs
+        state["_cache"] = dict(self._cache)
+        return state
+
+    def __setstate__(self, state):
+        # copies and unpickled designs keep their memoized outputs, so nothing is invalidated
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        super(RoomAndPillar, self).__setattr__(name, value)
+        if name in self.DEPENDENTS:
+            self.invalidate(name)
+
+    def invalidate(self, *names):
+        """
+        Forgets the memoized outputs computed from the given inputs, or all of them when
+        no input is given. Reassigning an input does this automatically but changes made
+        inside the pillar, its sample or the formula need a call to invalidate("pillar")
+        or invalidate("formula").
+        """
+        if not names:
+            self._cache.clear()
+        for name in names:
+            for dependent in self.DEPENDENTS.get(name, ()):
+                self._cache.pop(dependent, None)
+
+    def compile(self):
+        """
+        Returns a CompiledDesign of this design which does its calculations on plain SI floats.
+        The compiled design does not follow later changes to this design.
+        """
+        from .compiled import CompiledDesign
+        return CompiledDesign(self)
+
     def print_data(self):
         for attrib, friendly_name in RoomAndPillar.HUMAN_FRIENDLY.items():
             attribute = self.__getattribute__(attrib)
@@ -359,7 +267,6 @@ class RoomAndPillar(object):
             data_input.write("{space}INPUT{space}\n".format(space="=" * 15))
             data_input.write("%s\n\n\n" % datetime.today())
             biggest_space = len(sorted(self.HUMAN_FRIENDLY.values(), key=len)[-1])
-            print(biggest_space)
             for attrib, friendly_name in self.HUMAN_FRIENDLY.items():
                 attribute = getattr(self, attrib)
                 try:
@@ -439,7 +346,8 @@ class RoomAndPillar(object):
         html_file.close()
         self.html_report = html
 
-    @property
+    @memoized_property("overburden_density", "mine_depth")
+    @timed("stress")
     def vertical_pre_mining_stress(self):
         if self.overburden_density:
             overburden_density = self.overburden_density.to(unit_reg("meganewton per metre ** 3"))
@@ -450,7 +358,8 @@ class RoomAndPillar(object):
         stress = 1.1 * self.mine_depth.to(unit_reg.foot)
         return stress.magnitude * unit_reg.psi
 
-    @property
+    @memoized_property("pillar", "room_span", "vertical_pre_mining_stress")
+    @timed("stress")
     def pillar_stress(self):
         # requires(self, ["vertical_pre_mining_stress", "pillar", "room_span"])
         pillar = self.pillar
@@ -458,7 +367,7 @@ class RoomAndPillar(object):
         denominator = pillar.length * pillar.width
         return self.vertical_pre_mining_stress * (numerator / denominator)
 
-    @property
+    @memoized_property("pillar", "room_span")
     def extraction_ratio(self):
         """Returns the extraction ratio in percentage rounded to 2 decimal places"""
         requires(self, ["room_span", "pillar"])
@@ -486,45 +395,44 @@ class RoomAndPillar(object):
         else:
             self.formula = ALL_FORMULA[2] # bieniaswki
 
-    @property
+    @memoized_property("formula", "pillar", "mine_depth")
+    @timed("strength")
     def pillar_strength(self):
         formula = self.formula
-        if formula.name == "C.M.R.I":
-            print("This is a CMRI Formula")
-            bracket_component = self.mine_depth.to("metre").magnitude / 160 * (self.pillar.width_height_ratio - 1)
-            outside_bracket = 0.27 * self.pillar.sample.strength.magnitude * self.pillar.height.magnitude ** -0.36
-            return (outside_bracket + bracket_component) * unit_reg.mpa
-
-        elif self.pillar.width_height_ratio > 10:
-            print("This is a highly squat pillar. Use high stacey-page.")
+        # computed once for the branches, so logging it costs no pint arithmetic
+        width_height_ratio = self.pillar.width_height_ratio
+        if formula.name == cmri.name:
+            logger.debug("Strength from the CMRI formula at a depth of %s", self.mine_depth)
+            bracket_component = self.mine_depth.to("metre").magnitude / 160 * (width_height_ratio - 1)
+            strength = self.pillar.sample.strength.to(unit_reg.megapascal).magnitude
+            outside_bracket = 0.27 * strength * self.pillar.height.to(unit_reg.metre).magnitude ** -0.36
+            return (outside_bracket + bracket_component) * unit_reg.megapascal
+
+        elif width_height_ratio > 10:
+            logger.debug("Width to height ratio %s above 10, strength from high Stacey-Page", width_height_ratio)
             return self.high_stacey_page()
 
-        elif formula.name == "Hardy-Agapito":
-            print("Use Hardy-Agapito")
-            a_base = self.pillar.sample.volume / self.pillar.volume
-            b_base = self.pillar.width_height_ratio * self.pillar.sample.height_width_ratio
-            self.formula.pillar_strength(a_base, b_base)
-        # if formula.name in ("Holland", "Holland-Gaddy", "Bieniawski", "Salamon-Munro", "Orbet-Duval", "Stacey-Page"):
+        # Hardy-Agapito takes the volume and shape of the sample from the pillar as well
         else:
-            print("Other formula must deal with this.")
-            return self.formula.pillar_strength(self.pillar)
+            logger.debug("Strength from %s", formula.name)
+            return self.formula.pillar_strength(self.pillar, depth=self.mine_depth)
 
     def high_stacey_page(self):
-        width = self.pillar.width.ito(unit_reg.metre)
-        height = self.pillar.height.ito(unit_reg.metre)
-        length = self.pillar.length.ito(unit_reg.metre)
-        constant_k = self.pillar.sample.gaddy_factor.ito(unit_reg.mpa)
+        width = self.pillar.width.to(unit_reg.metre).magnitude
+        height = self.pillar.height.to(unit_reg.metre).magnitude
+        length = self.pillar.length.to(unit_reg.metre).magnitude
+        constant_k = self.pillar.sample.gaddy_factor.to(unit_reg.megapascal).magnitude
         effective_width = (4 * width * length) / (2 * width + 2 * length)
         bracket_out = constant_k * (2.5 / (effective_width * height) ** 0.07)
         inner_bracket = (effective_width / (4.5 * height)) ** 4.5 - 1
         bracket_value = 0.13 * inner_bracket + 1
-        return bracket_out * bracket_value
+        return bracket_out * bracket_value * unit_reg.megapascal
 
-    @property
+    @memoized_property("vertical_pre_mining_stress", "extraction_ratio")
     def pillar_strength2(self):
         return self.vertical_pre_mining_stress / (1 - (self.extraction_ratio / 100))
 
-    @property
+    @memoized_property("pillar_strength", "pillar_stress")
     def factor_of_safety(self):
         strength = self.pillar_strength.to(unit_reg("megapascal"))
         stress = self.pillar_stress.to(unit_reg("megapascal"))
@@ -532,42 +440,43 @@ class RoomAndPillar(object):
 
     # ------------------ SHAPE FACTORS ------------------------#
 
-    @property
+    @memoized_property("pillar")
     def sf_gamma(self):
         return 1.0 - 0.4 * (self.pillar.width / self.pillar.length)
 
-    @property
+    @memoized_property("pillar", "friction_angle")
     def sf_q(self):
         return 1.0 + math.sin(self.friction_angle) * (self.pillar.width / self.pillar.length)
 
     # ---------- BEARING CAPACITY FACTORS ---------------------#
+    # the factors only depend on the friction angle, rpm.bearing keeps them per angle
 
     @property
+    def bearing_factors(self):
+        return bearing_factors(self.friction_angle.to(unit_reg.radian).magnitude)
+
+    @memoized_property("friction_angle")
     def bcf_c(self):
-        friction_angle = math.radians(self.friction_angle.magnitude)
-        return (self.bcf_q - 1) * cotangent(self.friction_angle)
+        return self.bearing_factors.bcf_c
 
-    @property
+    @memoized_property("friction_angle")
     def bcf_gamma(self):
-        friction_angle = math.radians(self.friction_angle.magnitude)
-        return 1.5 * (self.bcf_q - 1) * math.tan(friction_angle)
+        return self.bearing_factors.bcf_gamma
 
-    @property
+    @memoized_property("friction_angle")
     def bcf_q(self):
-        friction_angle = math.radians(self.friction_angle.magnitude)
-        first = math.e ** (math.pi * math.tan(friction_angle))
-        second = math.tan((math.pi / 4) + (friction_angle / 2)) ** 2
-        value = first * second
-        return value
+        return self.bearing_factors.bcf_q
 
-    @property
+    @memoized_property("pillar", "friction_angle", "cohesion", "floor_density",
+                       "bcf_q", "bcf_gamma", "sf_q", "sf_gamma")
+    @timed("bearing_capacity")
     def bearing_capacity(self):
         friction_angle = math.radians(self.friction_angle.magnitude)
         addend = self.cohesion * cotangent(friction_angle) * ((self.bcf_q * self.sf_q) - 1)
         product = 0.5 * self.floor_density * self.pillar.width * self.bcf_gamma * self.sf_gamma
         return product + addend
 
-    @property
+    @memoized_property("bearing_capacity", "pillar_stress")
     def bearing_capacity_factor_of_safety(self):
         bc = self.bearing_capacity.to(unit_reg("megapascal"))
         stress = self.pillar_stress.to(unit_reg("megapascal"))
@@ -576,42 +485,43 @@ class RoomAndPillar(object):
         return (bc / stress).magnitude
 
     def pillar_width_from_fos_and_stress(self):
-        k = self.formula.get_correct_k(self.pillar)
-        alpha = self.formula.alpha
-        beta = self.formula.beta
-        exp_m = self.formula.recommended_fos * self.vertical_pre_mining_stress.to(unit_reg("megapascal")).magnitude
-        room_span = self.room_span.to(unit_reg.metre).magnitude
-        height = self.pillar.height.to(unit_reg.metre).magnitude
+        # mpmath is only needed here, it is imported on the first solve
+        from mpmath import findroot
+        from .solvers import (width_coefficients, bracket_root, custom_pillar_width, hardy_agapito_constants)
+        with stage("unit_conversion"):
+            k = self.formula.get_correct_k(self.pillar) if self.formula.uses_k else None
+            alpha = self.formula.alpha
+            beta = self.formula.beta
+            if self.formula.name == hardy_agapito.name:
+                sample = self.pillar.sample
+                k, alpha, beta = hardy_agapito_constants(
+                    k, alpha, beta, sample.volume.to(unit_reg.metre ** 3).magnitude,
+                    (sample.height / sample.diameter).to(unit_reg.dimensionless).magnitude,
+                    self.formula.unit_system)
+            exp_m = self.formula.recommended_fos * self.vertical_pre_mining_stress.to(unit_reg("megapascal")).magnitude
+            room_span = self.room_span.to(unit_reg.metre).magnitude
+            height = self.pillar.height.to(unit_reg.metre).magnitude
+
+        if self.formula.category == StrengthFormula.CUSTOM:
+            depth = None if self.mine_depth is None else self.mine_depth.to(unit_reg.metre).magnitude
+            pillar_width = custom_pillar_width(self.formula, k, height, room_span, exp_m, depth)
+            self.pillar.width = self.pillar.length = Q_("{}metre".format(round(pillar_width, 2)))
+            self.invalidate("pillar")
+            return
 
-        if self.formula.category == SF.LINEAR:
-            other_coef = (k * beta) / height
-            other_expo = 3
-            square_coef = exp_m - (k * alpha)
-        else:
-            other_coef = k * height ** beta
-            other_expo = alpha + 2
-            square_coef = exp_m
-        print("alpha", alpha)
-        uni_coef = 2 * room_span * exp_m
-        constant_c = exp_m * room_span ** 2
+        other_coef, other_expo, square_coef, uni_coef, constant_c = width_coefficients(
+            self.formula.category, k, alpha, beta, height, room_span, exp_m, self.formula.unit_system)
+        logger.debug("Solving the pillar width with %s: k %s, alpha %s, beta %s", self.formula.name, k, alpha, beta)
 
         f = lambda x : other_coef * x ** other_expo - square_coef * x ** 2 - uni_coef * x - constant_c
-        start = self._starting_point(f)
-        pillar_width = findroot(f, start, solver="newton", tol=0.001)
+        bracket = bracket_root(f)
+        with stage("root_solving"):
+            pillar_width = findroot(f, bracket, solver="anderson", tol=0.001)
         # print(pillar_width)
         pillar_width = Q_("{}metre".format(round(pillar_width, 2)))
         self.pillar.width = pillar_width
         self.pillar.length = pillar_width
+        self.invalidate("pillar")
+
 
-    def _starting_point(self, f):
-        cur_x, cur_val = 0, f(0)
-        op = "<" if cur_val < 0 else ">"
-        str_comp = "{} {} 0".format(cur_val, op)
-        while eval(str_comp):
-            # print("current x:", cur_x)
-            cur_x += 1
-            cur_val = f(cur_x)
-            str_comp = "{} {} 0".format(cur_val, op)
-
-        # print(cur_x - 1)
-        return cur_x - 1
+RoomAndPillar.DEPENDENTS = dependents(RoomAndPillar)
@@ -0,0 +1,149 @@
+"""
+Sensitivity analysis of a room and pillar design.
+One input of a RoomAndPillar is swept over a range of values while the others are
+kept fixed, and the factors of safety and the extraction ratio are recorded for
+every value. The points of a sweep are shared out among a pool of processes.
+"""
+from __future__ import division
+
+from collections import (namedtuple, OrderedDict)
+from copy import deepcopy
+from multiprocessing import (Pool, cpu_count)
+
+import numpy as np
+
+
+SweepResult = namedtuple("SweepResult", ("parameter", "values", "factor_of_safety",
+                                         "bearing_capacity_factor_of_safety", "extraction_ratio"))
+# parameter name: (attributes of the design it sets, human friendly name)
+PARAMETERS = OrderedDict([
+    ("mine_depth", (("mine_depth",), "Depth of the Ore")),
+    ("room_span", (("room_span",), "Length of room")),
+    ("seam_height", (("seam_height", "pillar.height"), "Height of the Orebody")),
+    ("friction_angle", (("friction_angle",), "Friction Angle")),
+    ("sample_strength", (("pillar.sample.strength",), "Uniaxial Compressive Strength of Sample")),
+    ("cohesion", (("cohesion",), "Cohesion")),
+    ("overburden_density", (("overburden_density",), "Unit Weight of the Overburden")),
+    ("floor_density", (("floor_density",), "Unit Weight of the Floor")),
+    ("pillar_width", (("pillar.width", "pillar.length"), "Pillar Width")),
+])
+DEFAULT_PARAMETERS = ("mine_depth", "room_span", "seam_height", "friction_angle", "sample_strength")
+BEARING_INPUTS = ("friction_angle", "cohesion", "floor_density")
+
+# design held by each worker process of the pool
+_design = None
+
+
+def parameter_paths(parameter):
+    """Returns the attribute paths set by parameter, which may also be a dotted attribute path"""
+    try:
+        return PARAMETERS[parameter][0]
+    except KeyError:
+        return (parameter,)
+
+
+def parameter_label(parameter):
+    try:
+        return PARAMETERS[parameter][1]
+    except KeyError:
+        return parameter.replace("_", " ").replace(".", " ").title()
+
+
+def get_path(obj, path):
+    for attrib in path.split("."):
+        obj = getattr(obj, attrib)
+    return obj
+
+
+def set_path(obj, path, value):
+    parent, _, attrib = path.rpartition(".")
+    if parent:
+        obj = get_path(obj, parent)
+    setattr(obj, attrib, value)
+
+
+def _evaluate(rap, paths, values):
+    rows = []
+    for value in values:
+        for path in paths:
+            set_path(rap, path, value)
+            rap.invalidate(path.split(".")[0])
+        bearing = all(getattr(rap, attrib) is not None for attrib in BEARING_INPUTS)
+        try:
+            result = rap.compile().evaluate(bearing)
+        except (ArithmeticError, ValueError):
+            rows.append((np.nan, np.nan, np.nan))
+            continue
+        bearing_fos = result.bearing_capacity_factor_of_safety if bearing else np.nan
+        rows.append((result.factor_of_safety, bearing_fos, result.extraction_ratio))
+    return rows
+
+
+def _init_worker(rap):
+    global _design
+    _design = rap
+
+
+def _evaluate_in_worker(args):
+    paths, values = args
+    return _evaluate(deepcopy(_design), paths, values)
+
+
+def _chunks(values, size):
+    return [values[start:start + size] for start in range(0, len(values), size)]
+
+
+def sensitivity(rap, ranges, processes=None):
+    """
+    Sweeps several inputs of a design.
+    :param rap: RoomAndPillar with all the inputs needed to calculate its outputs
+    :param ranges: mapping of parameter name (see PARAMETERS) or dotted attribute path to
+     the values it takes. Quantities must have units the attribute accepts
+    :param processes: number of worker processes, defaults to the number of cpus.
+     With 1 the sweeps are run in this process
+    :return: OrderedDict of parameter name to SweepResult
+    """
+    processes = processes or cpu_count()
+    jobs = []
+    for parameter, values in ranges.items():
+        values = list(values)
+        size = max(1, -(-len(values) // processes))
+        jobs.extend((parameter, parameter_paths(parameter), chunk) for chunk in _chunks(values, size))
+
+    if processes == 1:
+        rows = [_evaluate(deepcopy(rap), paths, chunk) for _, paths, chunk in jobs]
+    else:
+        pool = Pool(processes, initializer=_init_worker, initargs=(rap,))
+        try:
+            rows = pool.map(_evaluate_in_worker, [(paths, chunk) for _, paths, chunk in jobs])
+        finally:
+            pool.close()
+            pool.join()
+
+    collected = OrderedDict((parameter, []) for parameter in ranges)
+    for (parameter, _, _), chunk_rows in zip(jobs, rows):
+        collected[parameter].extend(chunk_rows)
+    results = OrderedDict()
+    for parameter, values in ranges.items():
+        columns = np.array(collected[parameter], dtype=float).reshape(-1, 3).T
+        results[parameter] = SweepResult(parameter, values, *columns)
+    return results
+
+
+def sweep(rap, parameter, values, processes=None):
+    """Sweeps one input of a design, see sensitivity. Returns a SweepResult"""
+    return sensitivity(rap, OrderedDict([(parameter, values)]), processes)[parameter]
+
+
+def default_ranges(rap, parameters=DEFAULT_PARAMETERS, spread=0.5, points=200):
+    """
+    Returns ranges that vary each parameter by the fraction spread on either side of
+    its current value. Parameters that have not been set are left out.
+    """
+    ranges = OrderedDict()
+    factors = np.linspace(1 - spread, 1 + spread, points)
+    for parameter in parameters:
+        current = get_path(rap, parameter_paths(parameter)[0])
+        if current is not None:
+            ranges[parameter] = current * factors
+    return ranges
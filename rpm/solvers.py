@@ -0,0 +1,208 @@
+"""
+Solvers for the pillar width that gives a required factor of safety.
+The width is the positive root of
+
+    other_coef * x ** other_expo - square_coef * x ** 2 - uni_coef * x - constant_c
+
+which is found by balancing pillar strength against the tributary area stress of
+square pillars. Custom formulas have no such polynomial; their width is bracketed
+directly on the balance of strength and stress, see custom_pillar_width.
+All inputs are SI floats or arrays (metres and megapascals).
+"""
+from __future__ import division
+
+from collections import namedtuple
+
+import numpy as np
+
+from .formulas import StrengthFormula
+from .batch import (scale_factors, vertical_stress)
+from .instrument import (stage, timed)
+
+
+SF = StrengthFormula
+Bracket = namedtuple("Bracket", ("lower", "upper"))
+WidthSolution = namedtuple("WidthSolution", ("width", "converged"))
+WidthCoefficients = namedtuple("WidthCoefficients", ("other_coef", "other_expo", "square_coef", "uni_coef",
+                                                     "constant_c"))
+
+
+def width_coefficients(category, k, alpha, beta, height, room_span, exp_m, unit_system=SF.METRIC):
+    """
+    Returns the coefficients of the pillar width polynomial
+    :param category: StrengthFormula.LINEAR or StrengthFormula.EXPONENTIAL
+    :param k: material constant in the stress unit of the formula's unit system
+    :param alpha: alpha of the formula
+    :param beta: beta of the formula
+    :param height: pillar height (metres)
+    :param room_span: room span (metres)
+    :param exp_m: product of the factor of safety and the vertical pre-mining stress (megapascal)
+    :param unit_system: unit system of the formula, which decides the units of k
+    :raises ValueError: for custom formulas
+    """
+    if category == SF.CUSTOM:
+        raise ValueError("Custom formulas have no width polynomial, see custom_pillar_width")
+    length_scale, stress_scale = scale_factors(unit_system)
+    k = k / stress_scale
+    if category == SF.LINEAR:
+        other_coef = (k * beta) / height
+        other_expo = 3
+        square_coef = exp_m - (k * alpha)
+    else:
+        other_coef = k * length_scale ** (alpha + beta) * height ** beta
+        other_expo = alpha + 2
+        square_coef = exp_m
+    uni_coef = 2 * room_span * exp_m
+    constant_c = exp_m * room_span ** 2
+    return WidthCoefficients(other_coef, other_expo, square_coef, uni_coef, constant_c)
+
+
+def hardy_agapito_constants(k, alpha, beta, sample_volume, sample_shape, unit_system=SF.METRIC):
+    """
+    Returns the k, alpha and beta of the exponential relation that gives the same
+    strengths as the Hardy-Agapito formula for square pillars, so its widths are
+    solved like those of any other exponential formula
+    :param sample_volume: volume of the samples (cubic metres)
+    :param sample_shape: height to diameter ratio of the samples
+    """
+    length_scale, _ = scale_factors(unit_system)
+    k = k * (sample_volume * length_scale ** 3) ** -alpha * sample_shape ** beta
+    return k, 2 * alpha + beta, alpha - beta
+
+
+@timed("root_bracketing")
+def bracket_root(f, start=0.0, step=1.0, xtol=1e-2, max_expansions=60, max_bisections=60):
+    """
+    Returns a Bracket whose ends give f values of opposite signs.
+    The upper end is moved away from start in steps that double in size until the
+    sign of f changes, then the bracket is halved until it is no wider than xtol.
+    Both stages are bounded so at most max_expansions + max_bisections + 1 values
+    of f are computed.
+    :raises ValueError: when the sign of f does not change within the expansions
+    """
+    lower, f_lower = start, f(start)
+    if f_lower == 0:
+        return Bracket(start, start)
+    for _ in range(max_expansions):
+        upper = lower + step
+        f_upper = f(upper)
+        if (f_upper > 0) != (f_lower > 0) or f_upper == 0:
+            break
+        lower, f_lower = upper, f_upper
+        step *= 2
+    else:
+        raise ValueError("No sign change of f between {} and {}".format(start, lower))
+
+    for _ in range(max_bisections):
+        if upper - lower <= xtol:
+            break
+        middle = 0.5 * (lower + upper)
+        f_middle = f(middle)
+        if (f_middle > 0) == (f_lower > 0) and f_middle != 0:
+            lower, f_lower = middle, f_middle
+        else:
+            upper = middle
+    return Bracket(lower, upper)
+
+
+@timed("root_solving")
+def custom_pillar_width(formula, k, height, room_span, exp_m, depth=None, xtol=1e-4):
+    """
+    Returns the width of square pillars whose strength from a custom formula is exp_m
+    times their tributary area stress ratio
+    :param formula: StrengthFormula of the CUSTOM category
+    :param k: material constant in the stress unit of the formula's unit system, None when not used
+    :param height: pillar height (metres)
+    :param room_span: room span (metres)
+    :param exp_m: product of the factor of safety and the vertical pre-mining stress (megapascal)
+    :param depth: depth of the ore (metres)
+    :raises ValueError: when no width balances strength and stress
+    """
+    length_scale, stress_scale = scale_factors(formula.unit_system)
+    depth = None if depth is None else depth * length_scale
+
+    def balance(width):
+        with np.errstate(all="ignore"):
+            strength = formula.custom_strength(k, width * length_scale, height * length_scale, None, depth)
+        return strength / stress_scale * width ** 2 - exp_m * (width + room_span) ** 2
+
+    bracket = bracket_root(balance, xtol=xtol)
+    return 0.5 * (bracket.lower + bracket.upper)
+
+
+def _polynomial(coefs, x):
+    return coefs.other_coef * x ** coefs.other_expo - coefs.square_coef * x ** 2 - coefs.uni_coef * x \
+        - coefs.constant_c
+
+
+def _derivative(coefs, x):
+    return coefs.other_expo * coefs.other_coef * x ** (coefs.other_expo - 1) - 2 * coefs.square_coef * x \
+        - coefs.uni_coef
+
+
+def solve_pillar_width(depth, room_span, height, k, alpha, beta, fos, category=SF.EXPONENTIAL,
+                       unit_system=SF.METRIC, overburden_density=None, tol=1e-6, max_iter=100, max_expansions=60):
+    """
+    Vectorized RoomAndPillar.pillar_width_from_fos_and_stress.
+    Every row is bracketed by doubling an upper bound from the larger of the room span
+    and the pillar height, then solved with Newton iterations that fall back to
+    bisection whenever a step leaves the bracket.
+    :param depth: depth of the ore (metres)
+    :param room_span: room span (metres)
+    :param height: pillar height (metres)
+    :param k: material constant in the stress unit of unit_system
+    :param alpha: alpha of the formula
+    :param beta: beta of the formula
+    :param fos: required factor of safety
+    :param category: StrengthFormula.LINEAR or StrengthFormula.EXPONENTIAL
+    :param unit_system: unit system of the formula
+    :param overburden_density: unit weight of the overburden (meganewton per metre ** 3)
+    :param tol: largest change in width (metres) accepted as converged
+    :return: WidthSolution of the widths (NaN where no root was bracketed) and
+     a boolean array which is False for the rows that did not converge
+    """
+    depth, room_span, height, k, alpha, beta, fos = np.broadcast_arrays(
+        *[np.asarray(value, dtype=float) for value in (depth, room_span, height, k, alpha, beta, fos)])
+    pre_mining = vertical_stress(depth, None if overburden_density is None
+                                 else np.asarray(overburden_density, dtype=float))
+    coefs = width_coefficients(category, k, alpha, beta, height, room_span, fos * pre_mining, unit_system)
+    coefs = WidthCoefficients(*[np.broadcast_to(value, depth.shape).ravel() for value in coefs])
+
+    size = coefs.constant_c.size
+    lo = np.zeros(size)
+    hi = np.maximum(np.maximum(room_span, height).ravel(), 1.0)
+    with np.errstate(all="ignore"):
+        with stage("root_bracketing"):
+            for _ in range(max_expansions):
+                below = _polynomial(coefs, hi) < 0
+                if not below.any():
+                    break
+                lo = np.where(below, hi, lo)
+                hi = np.where(below, 2 * hi, hi)
+            bracketed = _polynomial(coefs, hi) >= 0
+
+        with stage("root_solving"):
+            x = hi.copy()
+            converged = np.zeros(size, dtype=bool)
+            active = bracketed.copy()
+            for _ in range(max_iter):
+                idx = np.flatnonzero(active)
+                if idx.size == 0:
+                    break
+                row = WidthCoefficients(*[value[idx] for value in coefs])
+                x_idx, lo_idx, hi_idx = x[idx], lo[idx], hi[idx]
+                value = _polynomial(row, x_idx)
+                negative = value < 0
+                lo_idx = np.where(negative, x_idx, lo_idx)
+                hi_idx = np.where(negative, hi_idx, x_idx)
+                slope = _derivative(row, x_idx)
+                newton = x_idx - value / slope
+                inside = (slope > 0) & (newton > lo_idx) & (newton < hi_idx)
+                new_x = np.where(inside, newton, 0.5 * (lo_idx + hi_idx))
+                done = (np.abs(new_x - x_idx) <= tol) | (value == 0)
+                x[idx], lo[idx], hi[idx] = new_x, lo_idx, hi_idx
+                converged[idx[done]] = True
+                active[idx[done]] = False
+
+    width = np.where(converged, x, np.nan).reshape(depth.shape)
+    return WidthSolution(width, converged.reshape(depth.shape))
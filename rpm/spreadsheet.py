@@ -0,0 +1,181 @@
+"""
+Import and export of design cases and designs as .xlsx workbooks.
+Every column is headed by a human friendly name and, for quantities, the unit its
+cells are in, e.g. "Depth of the Ore [ft]". Workbooks are read and written in the
+streaming modes of openpyxl so memory use does not grow with the number of rows,
+and the unit of a column is parsed once for the whole column.
+"""
+from __future__ import division
+
+import re
+from collections import OrderedDict
+
+from . import (Q_, unit_reg)
+from .cases import (CASE_FIELDS, CASE_PATHS, FRAGMENT_METHODS, design_from_case, design_value)
+from .rpm_oop import RoomAndPillar
+from .utils import enum_to_text
+
+
+# case field: human friendly name of its column
+CASE_LABELS = OrderedDict((field, RoomAndPillar.HUMAN_FRIENDLY.get(field, field)) for field in CASE_FIELDS)
+CASE_LABELS.update([
+    ("pillar_formula", "Pillar Formula"),
+    ("sample_strength", "Uniaxial Compressive Strength of Sample"),
+    ("sample_height", "Height of Sample"),
+    ("sample_diameter", "Diameter of Sample"),
+    ("cylindrical", "Cylindrical Sample"),
+    ("alpha", "Alpha"),
+    ("beta", "Beta"),
+    ("k", "K"),
+])
+PILLAR_UNIT = "metre"
+OUTPUT_UNITS = {
+    "vertical_pre_mining_stress": "megapascal",
+    "pillar_strength": "megapascal",
+    "pillar_stress": "megapascal",
+    "bearing_capacity": "megapascal",
+}
+HEADER = re.compile(r"^\s*(?P<label>.*?)\s*(\[(?P<unit>[^\]]*)\])?\s*$")
+FRAGMENT_TEXT = dict((method, text) for text, method in FRAGMENT_METHODS.items())
+
+
+def header(label, unit=None):
+    """Returns the column header of label, e.g. 'Depth of the Ore [m]'"""
+    if unit is None:
+        return label
+    return "{} [{:~}]".format(label, unit_reg.Unit(unit))
+
+
+def parse_header(text):
+    """Returns the label and the unit (None when there is none) of a column header"""
+    match = HEADER.match(str(text or ""))
+    unit = match.group("unit")
+    return match.group("label"), unit.strip() if unit else None
+
+
+def _column_reader(text):
+    """
+    Returns the case field of a column header and a function converting the cells of
+    that column, or None for columns that are not case fields
+    """
+    label, unit = parse_header(text)
+    fields = dict((name.lower(), field) for field, name in CASE_LABELS.items())
+    fields.update((field, field) for field in CASE_FIELDS)
+    field = fields.get(label.lower())
+    if field is None:
+        return None
+    default = CASE_FIELDS[field]
+    if default is None or unit is None:
+        return field, lambda value: value
+    factor = Q_(1.0, unit).to(default).magnitude
+
+    def convert(value):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value * factor
+        try:
+            return float(value) * factor
+        except (TypeError, ValueError):
+            # text with its own unit or a blank cell, left to rpm.cases
+            return value
+    return field, convert
+
+
+def read_cases(path, sheet=None):
+    """
+    Yields the design cases in the rows of a worksheet as dicts of CASE_FIELDS, with the
+    quantities converted to the units of CASE_FIELDS. Columns are matched by their
+    human friendly name (see CASE_LABELS) or their field name, others are ignored.
+    :param path: path of the .xlsx workbook
+    :param sheet: name of the worksheet, defaults to the active one
+    """
+    from openpyxl import load_workbook
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.active
+        rows = worksheet.iter_rows(values_only=True)
+        columns = [(index, reader) for index, reader in enumerate(map(_column_reader, next(rows, ())))
+                   if reader is not None]
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            case = {}
+            for index, (field, convert) in columns:
+                value = row[index] if index < len(row) else None
+                if value is not None:
+                    case[field] = convert(value)
+            yield case
+    finally:
+        workbook.close()
+
+
+def read_designs(path, sheet=None):
+    """Yields a RoomAndPillar for every case in the worksheet, see read_cases"""
+    for case in read_cases(path, sheet):
+        yield design_from_case(case)
+
+
+def write_rows(path, headers, rows, sheet="Designs"):
+    """
+    Writes rows of cell values under headers to a new workbook
+    :return: the number of rows written
+    """
+    from openpyxl import Workbook
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheet)
+    worksheet.append(list(headers))
+    count = 0
+    for row in rows:
+        worksheet.append(list(row))
+        count += 1
+    workbook.save(path)
+    return count
+
+
+def _cell(value, unit):
+    """Returns value as something a cell can hold, in unit when it is a quantity"""
+    if value is None:
+        return None
+    if isinstance(value, Q_):
+        return value.m_as(unit) if unit is not None else value.magnitude
+    if hasattr(value, "name") and hasattr(value, "value"):
+        return enum_to_text(value)
+    return value
+
+
+def design_columns(outputs=True):
+    """Returns the (header, attribute path, unit) of every column a design is exported to"""
+    columns = [(header(CASE_LABELS[field], unit), CASE_PATHS[field], unit)
+               for field, unit in CASE_FIELDS.items()]
+    if outputs:
+        columns.extend((header(name, PILLAR_UNIT), "pillar." + attrib, PILLAR_UNIT)
+                       for attrib, name in sorted(RoomAndPillar.PILLAR_DATA.items()))
+        columns.extend((header(name, OUTPUT_UNITS.get(attrib)), attrib, OUTPUT_UNITS.get(attrib))
+                       for attrib, name in sorted(RoomAndPillar.OUTPUT.items()))
+    return columns
+
+
+def design_row(rap, columns):
+    """Returns the cells of a design for columns of (header, attribute path, pint Unit or None)"""
+    row = []
+    for _, path, unit in columns:
+        try:
+            value = design_value(rap, path)
+        except (AttributeError, TypeError, ValueError, ArithmeticError):
+            # an output whose inputs are missing
+            value = None
+        if path == "fragment_method":
+            value = FRAGMENT_TEXT.get(value, value)
+        row.append(_cell(value, unit))
+    return row
+
+
+def write_designs(path, designs, outputs=True, sheet="Designs"):
+    """
+    Writes the inputs and, with outputs, the pillar dimensions and outputs of designs to
+    a new workbook. designs may be any iterable and is consumed lazily.
+    :return: the number of designs written
+    """
+    columns = [(name, path_, unit_reg.Unit(unit) if unit else None)
+               for name, path_, unit in design_columns(outputs)]
+    return write_rows(path, [name for name, _, _ in columns],
+                      (design_row(rap, columns) for rap in designs), sheet)
@@ -0,0 +1,166 @@
+"""
+Tributary area stress of irregular pillar layouts.
+Every pillar carries the overburden over the part of the panel that is closer to it
+than to any other pillar, its Voronoi cell. The cells are built once for all the
+pillars of a survey, with the pillar centroids near the edges of the panel mirrored
+across them so that every cell is closed and ends at the panel boundary. A k-d tree
+of the centroids finds the neighbours and the centroids near the edges.
+
+Pillars are polygons given as (n, 2) arrays of their vertices in metres.
+"""
+from __future__ import division
+
+from collections import namedtuple
+
+import numpy as np
+
+from .batch import (design_strength, vertical_stress)
+
+
+Polygons = namedtuple("Polygons", ("vertices", "starts"))
+TributaryResult = namedtuple("TributaryResult", ("pillar_area", "tributary_area", "extraction_ratio",
+                                                 "effective_width", "pillar_stress", "factor_of_safety"))
+
+
+def pack_polygons(polygons):
+    """
+    Packs polygons into one array of vertices and the index of the first vertex of
+    each polygon. A last vertex repeating the first is dropped.
+    """
+    arrays = []
+    for polygon in polygons:
+        polygon = np.asarray(polygon, dtype=float)
+        if len(polygon) > 3 and np.array_equal(polygon[0], polygon[-1]):
+            polygon = polygon[:-1]
+        arrays.append(polygon)
+    starts = np.cumsum([0] + [len(polygon) for polygon in arrays[:-1]])
+    return Polygons(np.concatenate(arrays), starts)
+
+
+def _next_vertex(polygons):
+    """Returns the index of the vertex following every vertex of its polygon"""
+    size = len(polygons.vertices)
+    following = np.arange(1, size + 1)
+    ends = np.append(polygons.starts[1:], size) - 1
+    following[ends] = polygons.starts
+    return following
+
+
+def polygon_properties(polygons):
+    """
+    Returns the areas, centroids and perimeters of packed polygons (shoelace formula
+    for all of them at once)
+    """
+    x, y = polygons.vertices.T
+    following = _next_vertex(polygons)
+    x_next, y_next = x[following], y[following]
+    cross = x * y_next - x_next * y
+    signed_area = np.add.reduceat(cross, polygons.starts) / 2
+    centroid_x = np.add.reduceat((x + x_next) * cross, polygons.starts) / (6 * signed_area)
+    centroid_y = np.add.reduceat((y + y_next) * cross, polygons.starts) / (6 * signed_area)
+    perimeter = np.add.reduceat(np.hypot(x_next - x, y_next - y), polygons.starts)
+    return np.abs(signed_area), np.column_stack((centroid_x, centroid_y)), perimeter
+
+
+def panel_bounds(polygons, margin=None, tree=None):
+    """
+    Returns the (x min, y min, x max, y max) box around the pillars. The box is widened
+    by margin, which defaults to half the median distance between the edges of
+    neighbouring pillars (half a room span in a regular layout).
+    :param tree: cKDTree of the pillar centroids, built when it is not given
+    """
+    vertices = polygons.vertices
+    lower, upper = vertices.min(axis=0), vertices.max(axis=0)
+    if margin is None:
+        areas, centroids, _ = polygon_properties(polygons)
+        if len(centroids) < 2:
+            margin = 0.0
+        else:
+            tree = _tree(centroids) if tree is None else tree
+            distances, _ = tree.query(centroids, k=2)
+            margin = max(0.0, float(np.median(distances[:, 1] - np.sqrt(areas))) / 2)
+    return (lower[0] - margin, lower[1] - margin, upper[0] + margin, upper[1] + margin)
+
+
+def _tree(points):
+    from scipy.spatial import cKDTree
+    return cKDTree(points)
+
+
+def _edge_band(tree, start, end, samples):
+    """
+    Returns a distance from the edge start-end beyond which no Voronoi cell reaches the
+    edge: a point of the edge is in the cell of its nearest centroid, so no cell reaches
+    further than the largest distance from the edge to its nearest centroid
+    """
+    points = np.linspace(start, end, samples)
+    step = np.hypot(*(np.subtract(end, start))) / (samples - 1)
+    distances, _ = tree.query(points)
+    # distances change by at most step / 2 between samples
+    return distances.max() + step / 2
+
+
+def tributary_areas(centroids, bounds, tree=None):
+    """
+    Returns the area of the Voronoi cell of every centroid within the box bounds.
+    Only the centroids whose cells can reach an edge of the box are mirrored across it,
+    which are found with a k-d tree, so the cost grows as n log n.
+    :param centroids: (n, 2) array of pillar centroids, all inside bounds
+    :param bounds: (x min, y min, x max, y max) of the panel
+    :param tree: cKDTree of the centroids, built when it is not given
+    """
+    from scipy.spatial import Voronoi
+    tree = _tree(centroids) if tree is None else tree
+    x_min, y_min, x_max, y_max = bounds
+    x, y = centroids.T
+    samples = 4 * int(np.sqrt(len(centroids))) + 16
+    corners = [(x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)]
+    bands = [_edge_band(tree, corners[index], corners[(index + 1) % 4], samples) for index in range(4)]
+    # the mirror images close the cells of the pillars along the boundary
+    mirrors = [np.column_stack((x, 2 * y_min - y))[y - y_min <= bands[0]],
+               np.column_stack((2 * x_max - x, y))[x_max - x <= bands[1]],
+               np.column_stack((x, 2 * y_max - y))[y_max - y <= bands[2]],
+               np.column_stack((2 * x_min - x, y))[x - x_min <= bands[3]]]
+    voronoi = Voronoi(np.concatenate([centroids] + mirrors))
+    regions = [voronoi.regions[index] for index in voronoi.point_region[:len(centroids)]]
+    cells = Polygons(voronoi.vertices[np.concatenate(regions)],
+                     np.cumsum([0] + [len(region) for region in regions[:-1]]))
+    return polygon_properties(cells)[0]
+
+
+def tributary_stress(polygons, pre_mining_stress, bounds=None, design=None):
+    """
+    Tributary area stress of every pillar of an irregular layout
+    :param polygons: sequence of (n, 2) vertex arrays (metres), or Polygons from pack_polygons
+    :param pre_mining_stress: vertical pre-mining stress (megapascal), one for the panel
+     or one for each pillar
+    :param bounds: (x min, y min, x max, y max) of the panel, see panel_bounds for the default
+    :param design: CompiledDesign whose formula gives the strength of every pillar from its
+     effective width (4 * area / perimeter), None to leave the factor of safety out
+    :return: TributaryResult of arrays with a value for each pillar: areas in square metres,
+     extraction ratio of its cell in percentage, stress in megapascals
+    """
+    if not isinstance(polygons, Polygons):
+        polygons = pack_polygons(polygons)
+    pillar_area, centroids, perimeter = polygon_properties(polygons)
+    tree = _tree(centroids)
+    bounds = panel_bounds(polygons, tree=tree) if bounds is None else bounds
+    tributary_area = tributary_areas(centroids, bounds, tree)
+    stress = pre_mining_stress * tributary_area / pillar_area
+    effective_width = 4 * pillar_area / perimeter
+    fos = None
+    if design is not None:
+        with np.errstate(all="ignore"):
+            strength = design_strength(design.formula, design.k, effective_width, design.height, effective_width,
+                                       design.mine_depth, design.strength, design.gaddy, design.sample_volume,
+                                       design.sample_shape)
+        fos = strength / stress
+    ratio = 100 * (1 - pillar_area / tributary_area)
+    return TributaryResult(pillar_area, tributary_area, ratio, effective_width, stress, fos)
+
+
+def panel_tributary_stress(rap, polygons, bounds=None):
+    """tributary_stress of a layout of the pillars of a design, with their factors of safety"""
+    design = rap.compile()
+    pre_mining = vertical_stress(design.mine_depth, design.overburden_density)
+    return tributary_stress(polygons, pre_mining, bounds, design)
@@ -4,3 +4,79 @@ from math import tan
 
 def cotangent(radian_angle):
     return 1 / tan(radian_angle)
+
+
+def text_to_enum(enum, text, sep=" "):
+    """
+    Converts a string to a value in an enumeration by converting the string
+     to lowercase and replacing spaces with underscores
+    enum_name: case-sensitive string of the enumeration name
+    text: case-insensitive string probably formatted for human use
+    """
+    text = text.lower().replace(sep, "_")
+    for enum_ in enum:
+        if enum_.name == text:
+            return enum_
+    raise ValueError("{} has no {} attribute".format(enum, text))
+
+
+def enum_to_text(enum, sep=" "):
+    """
+    Converts an enumeration to a format for display in gui
+    """
+    enum_name = enum.name
+    return enum_name.replace("_", sep).title()
+
+
+class memoized_property(object):
+    """
+    A read-only property whose value is kept in the _cache dict of its instance.
+    depends_on names the attributes (inputs or other memoized properties) the value
+    is computed from, so the owner can drop the value when one of them changes.
+    """
+
+    def __init__(self, *depends_on):
+        self.depends_on = depends_on
+        self.func = None
+        self.name = None
+
+    def __call__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+        return self
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        cache = obj._cache
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(obj)
+            return value
+
+
+def dependents(cls):
+    """
+    Returns a dict of every attribute the memoized properties of cls depend on to
+    the names of all the memoized properties that depend on it, directly or through
+    other memoized properties.
+    """
+    direct = {}
+    for name in dir(cls):
+        prop = getattr(cls, name)
+        if isinstance(prop, memoized_property):
+            for dependency in prop.depends_on:
+                direct.setdefault(dependency, set()).add(name)
+
+    closure = {}
+    for dependency in direct:
+        found, pending = set(), list(direct[dependency])
+        while pending:
+            name = pending.pop()
+            if name not in found:
+                found.add(name)
+                pending.extend(direct.get(name, ()))
+        closure[dependency] = frozenset(found)
+    return closure
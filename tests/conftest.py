@@ -0,0 +1,86 @@
+import csv
+import sys
+
+import pytest
+
+from rpm.rpm_oop import (RoomAndPillar, Pillar, Sample, StrengthFormula, ALL_FORMULA)
+from rpm import Q_
+
+
+BEARING_INPUTS = ("friction_angle", "cohesion", "floor_density")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The QApplication of the GUI tests, Qt is only imported by the tests that use it"""
+    from qtpy.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+@pytest.fixture
+def case():
+    return {"project_name": "Panel 1", "location": "South Africa", "ore_type": "Hard Rock", "room_span": "6",
+            "sample_strength": "38.47", "sample_height": "25.4", "sample_diameter": "54", "seam_height": "4",
+            "mine_depth": "150", "overburden_density": "20", "friction_angle": "28", "cohesion": "1.2",
+            "floor_density": "22"}
+
+
+@pytest.fixture
+def cases(case):
+    """Cases of a batch, the second one without the bearing capacity inputs and the last one unsolvable"""
+    without_floor = dict((field, value) for field, value in case.items() if field not in BEARING_INPUTS)
+    return [dict(case, ore_type="coal", friction_angle="19"),
+            dict(without_floor, project_name="Panel 2", ore_type="coal", mine_depth="300"),
+            {"project_name": "Broken", "ore_type": "coal", "room_span": "6", "seam_height": "4"}]
+
+
+@pytest.fixture
+def cases_file(cases, tmpdir):
+    path = str(tmpdir.join("cases.csv"))
+    with open(path, "w", newline="") as cases_csv:
+        writer = csv.DictWriter(cases_csv, sorted(set().union(*cases)))
+        writer.writeheader()
+        writer.writerows(cases)
+    return path
+
+
+@pytest.fixture
+def rap():
+    sample = Sample(strength=Q_("3822psi"), height=Q_("40in"), diameter=Q_("54mm"))
+    pillar = Pillar(sample=sample, height=Q_("3m"), length=Q_("10m"), width=Q_("8m"))
+    rap_object = RoomAndPillar(pillar=pillar, formula=ALL_FORMULA[2], room_span=Q_("6m"))
+    rap_object.cohesion = Q_("1.2megapascal")
+    rap_object.friction_angle = Q_("28degrees")
+    rap_object.floor_density = Q_("22kilonewton per metre ** 3")
+    rap_object.mine_depth = Q_("150m")
+    rap_object.seam_height = Q_("3m")
+    rap_object.overburden_density = Q_("22.5kilonewton per metre ** 3")
+    return rap_object
+
+
+@pytest.fixture
+def rap_for_bearing_cap():
+    sample = Sample(strength=Q_("3822psi"), height=Q_("40in"), diameter=Q_("54mm"))
+    pillar = Pillar(sample=sample, height=Q_("3m"), length=Q_("10m"))
+    rap_object = RoomAndPillar(pillar=pillar)
+    rap_object.cohesion = Q_("1.2megapascal")
+    rap_object.friction_angle = Q_("28degrees")
+    rap_object.floor_density = Q_("22kilonewton per metre ** 3")
+    rap_object.room_span = Q_("6m")
+    rap_object.mine_depth = Q_("150m")
+    rap_object.seam_height = Q_("3m")
+    rap_object.overburden_density = Q_("22.5kilonewton per metre ** 3")
+    return rap_object
+
+
+@pytest.fixture
+def amoako_rap():
+    formula = StrengthFormula(alpha=0.4, beta=-0.6, k=15, k_type=StrengthFormula.OTHER, fos=(1, 1.5, 2.0),
+                              unit_system=StrengthFormula.METRIC, category=StrengthFormula.EXPONENTIAL)
+    sample = Sample(strength=Q_("3822psi"), height=Q_("40in"), diameter=Q_("54mm"))
+    pillar = Pillar(sample, height=Q_("4m"), length=Q_("4m"), width=Q_("4m"))
+    amoako = RoomAndPillar(pillar, formula, Q_("6m"))
+    amoako.overburden_density = Q_("20kilonewton per metre ** 3")
+    amoako.mine_depth = Q_("150m")
+    amoako.seam_dip = Q_("15degrees")
+    return amoako
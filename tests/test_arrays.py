@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from rpm.arrays import (SolidArray, SampleArray, PillarArray)
+from rpm.rpm_oop import (Sample, Pillar)
+from rpm import Q_
+
+
+@pytest.fixture
+def samples(request):
+    return [Sample(Q_("38.47MPa"), Q_("25.4cm"), Q_("54mm"), True),
+            Sample(Q_("5580psi"), Q_("2in"), Q_("2in"), False)]
+
+
+@pytest.fixture
+def pillars(samples):
+    return [Pillar(samples[0], Q_("4m"), Q_("10m")), Pillar(samples[1], Q_("13ft"), Q_("20m"), Q_("12m"))]
+
+
+def test_solid_array_follows_solid_rules():
+    solids = SolidArray(np.array([2.0, -1.0]), 5.0, np.array([0.0, 3.0]))
+    assert list(solids.columns["height"]) == [2.0, 0.0]
+    assert list(solids.columns["width"]) == [5.0, 3.0]
+    assert list(solids.volume.to("metre ** 3").magnitude) == [50.0, 0.0]
+
+
+@pytest.mark.parametrize("attrib,unit", [("volume", "metre ** 3"), ("gaddy_factor", "psi"),
+                                         ("cubical_strength", "psi"), ("strength", "megapascal")])
+def test_sample_array_matches_samples(samples, attrib, unit):
+    array = SampleArray.from_objects(samples)
+    for value, sample in zip(getattr(array, attrib), samples):
+        assert round(value.to(unit), 6) == round(getattr(sample, attrib).to(unit), 6)
+
+
+@pytest.mark.parametrize("attrib,unit", [("volume", "metre ** 3"), ("width_height_ratio", "dimensionless"),
+                                         ("cross_section_area", "metre ** 2"),
+                                         ("cross_section_perimeter", "metre")])
+def test_pillar_array_matches_pillars(pillars, attrib, unit):
+    array = PillarArray.from_objects(pillars)
+    for value, pillar in zip(getattr(array, attrib), pillars):
+        assert round(value.to(unit), 6) == round(getattr(pillar, attrib).to(unit), 6)
+
+
+def test_slices_are_views(samples):
+    pillars = PillarArray(SampleArray.from_objects(samples * 5), 4.0, np.arange(10.0) + 5)
+    view = pillars[2:6]
+    assert len(view) == 4 and len(view.sample) == 4
+    assert all(np.shares_memory(view.columns[name], pillars.columns[name]) for name in view.columns)
+    view.columns["width"][0] = 100.0
+    assert pillars.columns["width"][2] == 100.0
+
+
+def test_shared_sample_is_kept_when_sliced(samples):
+    pillars = PillarArray(samples[0], Q_("4m"), np.linspace(5, 20, 1000))
+    assert len(pillars.sample) == 1
+    assert pillars[10:20].sample is pillars.sample
+    assert pillars.nbytes < 1000 * 3 * 8 + 100
+
+
+def test_integer_index_returns_scalar_object(pillars):
+    array = PillarArray.from_objects(pillars)
+    pillar = array[-1]
+    assert isinstance(pillar, Pillar)
+    assert round(pillar.height, 4) == round(pillars[1].height.to("metre"), 4)
+    assert round(pillar.sample.strength, 4) == round(pillars[1].sample.strength.to("megapascal"), 4)
+
+
+def test_pillar_array_rejects_mismatched_samples(samples):
+    with pytest.raises(ValueError):
+        PillarArray(SampleArray.from_objects(samples), 4.0, np.arange(3.0))
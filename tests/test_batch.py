@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+
+from rpm import batch
+from rpm.rpm_oop import (RoomAndPillar, Pillar, Sample, StrengthFormula, ALL_FORMULA)
+from rpm import Q_
+
+
+WIDTHS = (4.0, 7.5, 12.0, 20.0)
+HEIGHTS = (3.0, 3.5, 4.0, 2.5)
+
+
+@pytest.fixture
+def sample(request):
+    return Sample(strength=Q_("3822psi"), height=Q_("40in"), diameter=Q_("54mm"))
+
+
+@pytest.fixture
+def pillars(request, sample):
+    return [Pillar(sample, height=Q_(h, "metre"), length=Q_(w, "metre"), width=Q_(w, "metre"))
+            for w, h in zip(WIDTHS, HEIGHTS)]
+
+
+def test_gaddy_factor_matches_sample(sample):
+    result = batch.gaddy_factor(Q_(np.array([3822.0]), "psi"), Q_(np.array([54.0]), "mm"))
+    assert round(result[0], 0) == round(sample.gaddy_factor, 0)
+
+
+def test_cubical_strength_matches_sample(sample):
+    result = batch.cubical_strength(Q_(np.array([3822.0]), "psi"), Q_(np.array([54.0]), "mm"),
+                                    Q_(np.array([40.0]), "inch"))
+    assert round(result[0], 0) == round(sample.cubical_strength, 0)
+
+
+@pytest.mark.parametrize("formula", [f for f in ALL_FORMULA if f.category != StrengthFormula.ODD],
+                         ids=lambda f: f.name)
+def test_formula_strength_matches_scalar_strength(formula, sample, pillars):
+    k = batch.sample_k(formula, sample.strength, sample.diameter, sample.height)
+    volume, shape = batch.sample_geometry(sample.height, sample.diameter)
+    result = batch.formula_strength(formula, Q_(np.array(WIDTHS), "metre"), Q_(np.array(HEIGHTS), "metre"), k,
+                                    sample_volume=Q_(volume, "metre ** 3"), sample_shape=shape)
+    expected = [formula.pillar_strength(pillar).magnitude for pillar in pillars]
+    assert np.allclose(result.magnitude, expected)
+
+
+def test_pillar_strength_uses_cmri_formula(sample, pillars):
+    formula = ALL_FORMULA[4]
+    result = batch.pillar_strength(formula, np.array(WIDTHS), np.array(HEIGHTS), depth=150.0,
+                                   strength=sample.strength.to("megapascal").magnitude)
+    for pillar, value in zip(pillars, result):
+        rap = RoomAndPillar(pillar, formula, Q_("6m"))
+        rap.mine_depth = Q_("150m")
+        assert round(value.to("megapascal"), 6) == round(rap.pillar_strength.to("megapascal"), 6)
+
+
+@pytest.mark.parametrize("cylindrical", [False, True])
+def test_pillar_strength_uses_sample_volume_for_hardy_agapito(pillars, cylindrical):
+    formula = ALL_FORMULA[0]
+    sample = Sample(strength=Q_("38.47MPa"), height=Q_("108mm"), diameter=Q_("54mm"), cylindrical=cylindrical)
+    volume, shape = batch.sample_geometry(sample.height, sample.diameter, cylindrical)
+    assert round(volume, 12) == round(sample.volume.to("metre ** 3").magnitude, 12)
+    k = batch.sample_k(formula, sample.strength, sample.diameter, sample.height)
+    result = batch.pillar_strength(formula, np.array(WIDTHS), np.array(HEIGHTS), k, sample_volume=volume,
+                                   sample_shape=shape)
+    for pillar, value in zip(pillars, result):
+        pillar.sample = sample
+        rap = RoomAndPillar(pillar, formula, Q_("6m"))
+        assert round(value.to("megapascal"), 6) == round(rap.pillar_strength.to("megapascal"), 6)
+
+
+def test_pillar_strength_uses_high_stacey_page_for_squat_pillars(sample):
+    formula = ALL_FORMULA[2]  # bieniawski
+    pillar = Pillar(sample, height=Q_("2m"), length=Q_("30m"), width=Q_("25m"))
+    rap = RoomAndPillar(pillar, formula, Q_("6m"))
+    expected = rap.pillar_strength.to("megapascal")
+    k = batch.sample_k(formula, sample.strength, sample.diameter, sample.height)
+    gaddy = sample.gaddy_factor.to("megapascal").magnitude
+    result = batch.pillar_strength(formula, np.array([25.0, 8.0]), np.array([2.0, 2.0]), k,
+                                   length=np.array([30.0, 8.0]), gaddy=gaddy)
+    assert round(result[0].to("megapascal"), 6) == round(expected, 6)
+    assert round(result[1], 6) == round(batch.formula_strength(formula, Q_(8.0, "metre"), Q_(2.0, "metre"), k), 6)
+
+
+def test_pillar_strength_requires_gaddy_factor_for_squat_pillars():
+    with pytest.raises(ValueError):
+        batch.pillar_strength(ALL_FORMULA[1], np.array([30.0]), np.array([2.0]))
+
+
+def test_formula_strength_raises_when_k_is_unknown():
+    with pytest.raises(AttributeError):
+        batch.formula_strength(ALL_FORMULA[2], np.array([6.0]), np.array([3.0]))
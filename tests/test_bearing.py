@@ -0,0 +1,44 @@
+import math
+
+import numpy as np
+
+from rpm.bearing import (bearing_factors, bearing_capacity, bearing_capacity_factor_of_safety, _scalar_factors)
+from rpm.rpm_functions import strength_factor_ng
+
+
+def test_scalar_bearing_factors():
+    factors = bearing_factors(math.radians(28))
+    assert round(factors.bcf_q, 2) == 14.72
+    assert round(factors.bcf_gamma, 2) == 10.94
+    assert round(factors.bcf_c, 2) == 25.80
+    assert round(strength_factor_ng(28), 6) == round(factors.bcf_q, 6)
+
+
+def test_scalar_bearing_factors_are_memoized():
+    angle = math.radians(31.5)
+    first = bearing_factors(angle)
+    hits = _scalar_factors.cache_info().hits
+    assert bearing_factors(angle) is first
+    assert _scalar_factors.cache_info().hits == hits + 1
+
+
+def test_array_bearing_factors_match_scalars():
+    angles = np.radians([[28, 30, 28], [35, 30, 28]])
+    factors = bearing_factors(angles)
+    assert factors.bcf_q.shape == angles.shape
+    for index in np.ndindex(angles.shape):
+        scalar = bearing_factors(angles[index])
+        for value, expected in zip(factors, scalar):
+            assert round(value[index], 9) == round(expected, 9)
+
+
+def test_vectorized_bearing_capacity_matches_design(rap_for_bearing_cap):
+    rap = rap_for_bearing_cap
+    angle = np.full(4, math.radians(28))
+    widths = np.array([rap.pillar.width.to("metre").magnitude, 5.0, 10.0, 15.0])
+    capacity = bearing_capacity(angle, 1.2, 0.022, widths, 10.0)
+    assert round(capacity[0], 6) == round(rap.bearing_capacity.to("megapascal").magnitude, 6)
+    assert np.all(np.diff(capacity[1:]) > 0)
+    fos = bearing_capacity_factor_of_safety(rap.pillar_stress.to("megapascal").magnitude, angle, 1.2, 0.022,
+                                            widths, 10.0)
+    assert round(fos[0], 6) == round(float(rap.bearing_capacity_factor_of_safety), 6)
@@ -0,0 +1,75 @@
+from copy import copy
+import csv
+
+import pytest
+
+from rpm import (cache, cli, Q_)
+from rpm.cache import (ResultCache, design_key, solve_case_cached)
+from rpm.cases import design_from_case
+
+
+def solver_not_called(rap):
+    raise AssertionError("the solver should not be called")
+
+
+def decided(case):
+    rap = design_from_case(case)
+    rap.formula_decide()
+    return rap
+
+
+def test_design_key_ignores_units_and_names_but_not_inputs(cases):
+    key = design_key(decided(cases[0]))
+    assert design_key(decided(dict(cases[0], room_span=Q_("600 cm"), project_name="Other"))) == key
+    assert design_key(decided(dict(cases[0], room_span="6.5"))) != key
+    rap = decided(cases[0])
+    rap.formula = copy(rap.formula)
+    rap.formula.alpha += 0.01
+    assert design_key(rap) != key
+
+
+def test_cached_results_skip_the_solver(cases, tmpdir, monkeypatch):
+    results = ResultCache(str(tmpdir.join("results.sqlite")))
+    first = solve_case_cached(cases[0], results)
+    assert (results.hits, results.misses, len(results)) == (0, 1, 1)
+
+    monkeypatch.setattr(cache, "solve_design", solver_not_called)
+    assert solve_case_cached(dict(cases[0]), results) == first
+    assert results.hits == 1
+    results.close()
+
+
+def test_least_recently_used_results_are_evicted(tmpdir):
+    results = ResultCache(str(tmpdir.join("results.sqlite")), max_entries=3)
+    for index in range(5):
+        results.put("key{}".format(index), (index,) * 10)
+    results.get("key0")
+    results.evict()
+    assert len(results) == 3
+    assert results.get("key0") is not None
+    assert results.get("key1") is None and results.get("key2") is None
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_batch_reuses_the_cache(cases_file, tmpdir, processes, monkeypatch):
+    cache_path = str(tmpdir.join("cache", "results.sqlite"))
+    rows = []
+    for run in range(2):
+        if run:
+            # the workers are forked by batch, after the patch
+            monkeypatch.setattr(cache, "solve_design", solver_not_called)
+        results_path = str(tmpdir.join("results{}.csv".format(run)))
+        assert cli.batch(cases_file, results_path, processes=processes, cache_path=cache_path) == 3
+        with open(results_path, newline="") as results:
+            rows.append(list(csv.DictReader(results)))
+    assert rows[0] == rows[1]
+    assert rows[1][0]["error"] == rows[1][1]["error"] == ""
+    assert len(ResultCache(cache_path)) == 2
+
+
+def test_workers_close_their_cache(cases_file, tmpdir):
+    cache_path = str(tmpdir.join("results.sqlite"))
+    assert cli.batch(cases_file, str(tmpdir.join("results.csv")), processes=2, cache_path=cache_path,
+                     max_cache_entries=1) == 3
+    # closing a cache evicts the results beyond max_entries
+    assert len(ResultCache(cache_path)) == 1
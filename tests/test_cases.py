@@ -0,0 +1,47 @@
+import pytest
+
+from rpm.cases import (design_from_case, solve_case, parse_quantity, case_formula)
+from rpm.constants import (Countries, OreTypes)
+from rpm.rpm_oop import (RoomAndPillar, ALL_FORMULA)
+from rpm import Q_
+
+
+@pytest.fixture
+def case(case):
+    return dict(case, design_type="initial", fragment_method="drill blast", min_extraction="50", cylindrical="no",
+                friction_angle="19", rmr="44", seam_dip="15")
+
+
+def test_parse_quantity_uses_default_unit_for_numbers():
+    assert parse_quantity("150", "metre") == Q_("150m")
+
+
+def test_parse_quantity_converts_text_with_units():
+    assert round(parse_quantity("500 ft", "metre"), 1) == Q_("152.4m")
+
+
+def test_parse_quantity_returns_none_for_blank_values():
+    assert parse_quantity(" ", "metre") is None
+
+
+def test_design_from_case_has_wizard_fields(case):
+    rap = design_from_case(case)
+    assert rap.location == Countries.south_africa
+    assert rap.ore_type == OreTypes.hard_rock
+    assert rap.fragment_method == RoomAndPillar.DRILL_BLAST
+    assert rap.mine_depth == Q_("150m")
+    assert rap.pillar.height == Q_("4m")
+    assert rap.pillar.sample.diameter == Q_("54mm")
+
+
+def test_case_formula_does_not_change_shared_formula(case):
+    case.update(design_type="redesign", pillar_formula="Salamon-Munro", alpha="0.5", k="1000")
+    formula = case_formula(case)
+    assert formula.alpha == 0.5 and formula.k == 1000
+    assert ALL_FORMULA[1].alpha == 0.46
+
+
+def test_solve_case_gives_recommended_factor_of_safety(case):
+    rap, result = solve_case(case)
+    assert rap.formula is ALL_FORMULA[3]  # stacey-page
+    assert round(result.factor_of_safety, 1) == rap.formula.recommended_fos
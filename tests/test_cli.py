@@ -0,0 +1,39 @@
+import csv
+import subprocess
+import sys
+
+import pytest
+
+from rpm import cli
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_batch_writes_a_result_row_for_every_case(cases_file, tmpdir, processes):
+    results_path = str(tmpdir.join("results.csv"))
+    assert cli.batch(cases_file, results_path, processes=processes) == 3
+    with open(results_path, newline="") as results:
+        rows = list(csv.DictReader(results))
+    assert [row["project_name"] for row in rows] == ["Panel 1", "Panel 2", "Broken"]
+    assert rows[0]["error"] == "" and float(rows[0]["pillar_width [m]"]) > 0
+    assert rows[1]["bearing_capacity [MPa]"] == ""
+    assert float(rows[1]["pillar_width [m]"]) > float(rows[0]["pillar_width [m]"])
+    assert rows[2]["error"] != ""
+
+
+def test_batch_does_not_import_qt():
+    code = "import sys; import rpm.cli; sys.exit(any(m.split('.')[0] in ('qtpy', 'PySide') for m in sys.modules))"
+    assert subprocess.call([sys.executable, "-c", code]) == 0
+
+
+def test_batch_reads_and_writes_workbooks(cases, tmpdir):
+    from openpyxl import (Workbook, load_workbook)
+    cases_path, results_path = str(tmpdir.join("cases.xlsx")), str(tmpdir.join("results.xlsx"))
+    workbook = Workbook()
+    fields = sorted(cases[0])
+    workbook.active.append(fields)
+    workbook.active.append([cases[0][field] for field in fields])
+    workbook.save(cases_path)
+    assert cli.batch(cases_path, results_path, processes=1) == 1
+    headers, row = load_workbook(results_path, read_only=True).active.iter_rows(values_only=True)
+    cells = dict(zip(headers, row))
+    assert cells["project_name"] == "Panel 1" and cells["pillar_width [m]"] > 0
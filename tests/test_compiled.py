@@ -0,0 +1,37 @@
+import pytest
+
+from rpm.rpm_oop import (StrengthFormula, ALL_FORMULA)
+
+
+@pytest.mark.parametrize("attrib", ["vertical_pre_mining_stress", "pillar_strength", "pillar_stress",
+                                    "bearing_capacity"])
+def test_compiled_design_returns_same_quantities_as_design(rap, attrib):
+    expected = getattr(rap, attrib).to("megapascal")
+    result = getattr(rap.compile(), attrib)
+    assert round(result, 6) == round(expected, 6)
+
+
+@pytest.mark.parametrize("attrib", ["factor_of_safety", "bearing_capacity_factor_of_safety", "extraction_ratio"])
+def test_compiled_design_returns_same_ratios_as_design(rap, attrib):
+    assert round(getattr(rap.compile(), attrib), 6) == round(getattr(rap, attrib), 6)
+
+
+@pytest.mark.parametrize("formula", [f for f in ALL_FORMULA if f.category != StrengthFormula.ODD],
+                         ids=lambda f: f.name)
+def test_compiled_design_pillar_strength_for_all_formula(rap, formula):
+    rap.formula = formula
+    expected = rap.pillar_strength.to("megapascal").magnitude
+    assert round(rap.compile().pillar_strength.magnitude, 6) == round(expected, 6)
+
+
+def test_compiled_design_uses_stress_gradient_without_overburden_density(rap):
+    rap.overburden_density = None
+    expected = rap.vertical_pre_mining_stress.to("megapascal")
+    assert round(rap.compile().vertical_pre_mining_stress, 6) == round(expected, 6)
+
+
+def test_evaluate_skips_bearing_capacity_when_asked(rap):
+    rap.cohesion = None
+    result = rap.compile().evaluate(bearing=False)
+    assert result.bearing_capacity is None
+    assert round(result.factor_of_safety, 6) == round(rap.factor_of_safety, 6)
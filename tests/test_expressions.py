@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from rpm import Q_
+from rpm.batch import (design_strength, formula_strength)
+from rpm.cases import solve_case
+from rpm.expressions import (compile_expression, expression_names)
+from rpm.formulas import (bieniawski, cmri, register_formula, unregister_formula, name_to_formula, SF)
+from rpm.rpm_oop import (RoomAndPillar, Pillar, Sample)
+
+
+@pytest.fixture
+def custom_cmri(request):
+    formula = register_formula("Site C.M.R.I.", "0.27 * k * height ** -0.36 + depth / 160 * (width / height - 1)",
+                               k_type=SF.UNIAXIAL, fos=(1, 1, 1))
+    request.addfinalizer(lambda: unregister_formula("Site C.M.R.I."))
+    return formula
+
+
+@pytest.fixture
+def custom_bieniawski(request):
+    formula = register_formula("Site Bieniawski", "k * (alpha + beta * width / height)", k_type=SF.CUBICAL,
+                               alpha=0.64, beta=0.36, fos=(1.5, 1.5, 2.0), unit_system=SF.IMPERIAL)
+    request.addfinalizer(lambda: unregister_formula("Site Bieniawski"))
+    return formula
+
+
+def test_expressions_are_compiled_once_and_vectorized():
+    function = compile_expression("k * sqrt(width) / max(height, 1)")
+    assert compile_expression("k * sqrt(width) / max(height, 1)") is function
+    assert expression_names("k * sqrt(width) / max(height, 1)") == {"k", "width", "height"}
+    result = function(k=2.0, width=np.array([4.0, 9.0]), height=np.array([0.5, 3.0]))
+    assert np.allclose(result, [4.0, 2.0])
+
+
+@pytest.mark.parametrize("text", ["__import__('os')", "width.real", "k[0]", "lambda: 1", "open('x')",
+                                  "sqrt(x=width)", "'text'", "width if k else height", "area * 2", "k *",
+                                  "sqrt + 1", "max(sqrt, k)", "sqrt"])
+def test_unsafe_or_invalid_expressions_are_rejected(text):
+    with pytest.raises(ValueError):
+        compile_expression(text)
+
+
+def test_numbers_are_floats_so_huge_powers_overflow():
+    with pytest.raises(OverflowError):
+        compile_expression("k * 9 ** 9 ** 9")(k=1.0)
+    with pytest.raises(ValueError):
+        compile_expression("k * 1" + "0" * 400)
+    assert compile_expression("k * 2 ** 10")(k=1.0) == 1024.0
+
+
+def test_registered_formulas_are_found_by_name(custom_cmri):
+    assert name_to_formula("Site C.M.R.I.") is custom_cmri
+    with pytest.raises(ValueError):
+        register_formula("Site C.M.R.I.", "k")
+    with pytest.raises(ValueError):
+        register_formula("No k", "k * width")
+
+
+def test_custom_formula_matches_built_in(custom_cmri, custom_bieniawski):
+    width, height, depth = np.array([5.0, 8.0, 12.0]), 3.0, 200.0
+    expected = design_strength(cmri, None, width, height, depth=depth, strength=30.0)
+    assert np.allclose(design_strength(custom_cmri, 30.0, width, height, depth=depth), expected)
+    expected = formula_strength(bieniawski, Q_(width, "metre"), Q_(height, "metre"), k=Q_(4000, "psi"))
+    result = formula_strength(custom_bieniawski, Q_(width, "metre"), Q_(height, "metre"), k=Q_(4000, "psi"))
+    assert np.allclose(result.magnitude, expected.magnitude)
+
+
+def test_room_and_pillar_solves_custom_formula(custom_bieniawski):
+    sample = Sample(strength=Q_("38.47megapascal"), height=Q_("25.4mm"), diameter=Q_("54mm"))
+    designs = []
+    for formula in (bieniawski, custom_bieniawski):
+        rap = RoomAndPillar(pillar=Pillar(sample=sample, height=Q_("3m"), length=Q_("0m")))
+        rap.formula = formula
+        rap.room_span = Q_("6m")
+        rap.mine_depth = Q_("150m")
+        rap.overburden_density = Q_("22.5kilonewton per metre ** 3")
+        rap.pillar_width_from_fos_and_stress()
+        designs.append(rap)
+    built_in, custom = designs
+    assert abs(custom.pillar.width - built_in.pillar.width) <= Q_("0.01m")
+    assert round(custom.factor_of_safety, 2) >= 1.5
+
+
+def test_cases_use_registered_formulas(custom_cmri, case):
+    rap, result = solve_case(dict(case, location="India", ore_type="Coal", design_type="Redesign",
+                                  pillar_formula="Site C.M.R.I.", seam_height="3"))
+    assert rap.formula.name == "Site C.M.R.I."
+    assert round(result.factor_of_safety, 2) >= 1.0
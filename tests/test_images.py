@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+from gui_.images import (IMAGES, image_path, pixmap, icon)
+
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+@pytest.mark.parametrize("name", sorted(IMAGES))
+def test_every_image_has_a_file(name):
+    assert os.path.isfile(image_path(name))
+
+
+def test_images_are_loaded_once():
+    assert not pixmap("watermark").isNull()
+    assert pixmap("watermark") is pixmap("watermark")
+    assert icon("icon") is icon("icon")
+    with pytest.raises(ValueError):
+        pixmap("missing")
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import pytest
+
+
+NUMERIC_MODULES = ["rpm", "rpm.formulas", "rpm.batch", "rpm.solvers", "rpm.compiled", "rpm.sensitivity",
+                   "rpm.probabilistic", "rpm.rpm_functions"]
+
+
+def loaded_after_import(module):
+    code = "import sys, {}; print(' '.join(sorted(sys.modules)))".format(module)
+    return subprocess.check_output([sys.executable, "-c", code]).decode().split()
+
+
+@pytest.mark.parametrize("module", NUMERIC_MODULES)
+def test_numeric_modules_do_not_import_pint_or_mpmath(module):
+    loaded = loaded_after_import(module)
+    assert "pint" not in loaded
+    assert "mpmath" not in loaded
+
+
+def test_rpm_oop_imports_mpmath_on_first_solve():
+    loaded = loaded_after_import("rpm.rpm_oop")
+    assert "pint" in loaded
+    assert "mpmath" not in loaded
+
+
+def test_unit_names_are_created_on_first_use():
+    code = "import sys, rpm; assert 'pint' not in sys.modules; print(rpm.Q_('1 m').to('cm'))"
+    assert subprocess.check_output([sys.executable, "-c", code]).decode().strip() == "100.0 centimeter"
@@ -0,0 +1,59 @@
+import pytest
+
+from rpm import instrument
+from rpm import cli
+from rpm.cases import solve_case
+
+
+@pytest.fixture
+def instrumented(request):
+    instrument.reset()
+    instrument.enable()
+
+    def restore():
+        instrument.disable()
+        instrument.reset()
+    request.addfinalizer(restore)
+
+
+def test_nothing_is_counted_while_disabled(case):
+    instrument.reset()
+    solve_case(case)
+    assert all(stats == (0, 0.0) for stats in instrument.stats().values())
+
+
+def test_stages_of_a_design_are_counted(case, instrumented):
+    solve_case(case)
+    stats = instrument.stats()
+    assert tuple(stats) == instrument.STAGES
+    for name in ("unit_conversion", "strength", "stress", "bearing_capacity", "root_bracketing", "root_solving"):
+        assert stats[name].calls > 0 and stats[name].seconds > 0
+    assert "root_solving" in instrument.report()
+
+
+def test_nested_calls_of_a_stage_are_counted_once(instrumented):
+    @instrument.timed("strength")
+    def strength(depth):
+        return strength(depth - 1) if depth else 0
+
+    strength(3)
+    with instrument.stage("stress"):
+        pass
+    stats = instrument.take()
+    assert (stats["strength"].calls, stats["stress"].calls) == (1, 1)
+    assert instrument.stats()["strength"] == (0, 0.0)
+
+
+def test_unknown_stages_are_rejected():
+    with pytest.raises(ValueError):
+        instrument.timed("parsing")
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_batch_profile_sums_the_workers(cases_file, tmpdir, processes, request):
+    request.addfinalizer(instrument.reset)
+    assert cli.batch(cases_file, str(tmpdir.join("results.csv")), processes=processes, profile=True) == 3
+    assert not instrument.is_enabled()
+    stats = instrument.stats()
+    assert stats["root_bracketing"].calls == 2
+    assert stats["strength"].calls >= 2
@@ -0,0 +1,50 @@
+import pytest
+
+from rpm.cases import solve_case
+from rpm.optimize import (optimize, optimize_panels, evaluate_candidates)
+from rpm import Q_
+
+
+@pytest.fixture
+def design(case):
+    return solve_case(dict(case, friction_angle="19", min_extraction="50"))[0]
+
+
+def test_optimum_meets_the_constraints(design):
+    result = optimize(design, lengths=(Q_("1m"), Q_("60m")), spans=(4, 10))
+    assert result.factor_of_safety >= design.formula.recommended_fos
+    assert result.bearing_capacity_factor_of_safety >= 2.0
+    assert result.extraction_ratio >= design.min_extraction
+    assert 4 <= result.room_span <= 10
+
+
+def test_optimum_is_on_the_binding_constraint(design):
+    result = optimize(design)
+    assert result.length == result.width and result.room_span == 6
+    pillar_fos, floor_fos, _ = evaluate_candidates(design.compile(), 0.99 * result.width, 0.99 * result.width, 6)
+    assert floor_fos < 2.0
+    assert round(result.bearing_capacity_factor_of_safety, 2) == 2.0
+
+
+def test_floor_can_be_ignored(design):
+    with_floor = optimize(design)
+    without_floor = optimize(design, bearing_fos=None)
+    assert without_floor.bearing_capacity_factor_of_safety is None
+    assert without_floor.extraction_ratio > with_floor.extraction_ratio
+    assert round(without_floor.factor_of_safety, 2) == design.formula.recommended_fos
+
+
+def test_infeasible_panel_gives_none(design):
+    design.min_extraction = 99.9
+    assert optimize(design) is None
+
+
+def test_optimize_panels_in_worker_processes(design):
+    assert optimize_panels([design] * 3, processes=2) == [optimize(design)] * 3
+
+
+@pytest.mark.parametrize("depth", ["115.3m", "144.9m", "192.4m"])
+def test_more_levels_never_give_a_worse_optimum(design, depth):
+    design.mine_depth = Q_(depth)
+    ratios = [optimize(design, levels=levels).extraction_ratio for levels in range(1, 6)]
+    assert ratios == sorted(ratios)
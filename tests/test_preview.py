@@ -0,0 +1,53 @@
+from rpm import Q_
+from rpm.cases import solve_case
+from rpm.preview import (LivePreview, PREVIEW_OUTPUTS)
+from rpm.rpm_oop import RoomAndPillar
+
+
+def test_preview_computes_every_output(case):
+    preview = LivePreview(case)
+    assert preview.error is None
+    rap, result = solve_case(case)
+    assert preview.values["pillar_width"] == rap.pillar.width
+    assert round(preview.values["factor_of_safety"], 6) == round(result.factor_of_safety, 6)
+    assert set(preview.values) == set(PREVIEW_OUTPUTS)
+
+
+def test_preview_only_recomputes_outputs_of_edited_fields(case):
+    preview = LivePreview(case)
+    width = preview.values["pillar_width"]
+    recomputed = preview.update({"cohesion": "1.5"})
+    assert set(recomputed) == {"bearing_capacity", "bearing_capacity_factor_of_safety"}
+    assert preview.values["pillar_width"] == width
+
+    recomputed = preview.update({"mine_depth": "300"})
+    assert "pillar_width" in recomputed
+    assert preview.values["pillar_width"] > width
+    case.update(cohesion="1.5", mine_depth="300")
+    rap, result = solve_case(case)
+    assert preview.values["pillar_width"] == rap.pillar.width
+    assert round(preview.values["bearing_capacity_factor_of_safety"], 6) == \
+        round(result.bearing_capacity_factor_of_safety, 6)
+
+
+def test_preview_recovers_from_invalid_input(case):
+    preview = LivePreview(case)
+    preview.update({"mine_depth": "deep"})
+    assert preview.error is not None
+    assert all(value is None for value in preview.values.values())
+    preview.update({"mine_depth": Q_("150m")})
+    assert preview.error is None
+    assert preview.values["factor_of_safety"] is not None
+
+
+def test_preview_does_not_solve_the_width_for_floor_inputs(case, monkeypatch):
+    preview = LivePreview(case)
+
+    def solver_not_called(rap):
+        raise AssertionError("the pillar width should not be solved")
+
+    monkeypatch.setattr(RoomAndPillar, "pillar_width_from_fos_and_stress", solver_not_called)
+    recomputed = preview.update({"friction_angle": "30", "cohesion": "1.5", "floor_density": "23"})
+    assert preview.error is None
+    assert "pillar_width" not in recomputed and "factor_of_safety" not in recomputed
+    assert recomputed["bearing_capacity_factor_of_safety"] is not None
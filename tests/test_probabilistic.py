@@ -0,0 +1,66 @@
+import pytest
+import numpy as np
+
+from rpm.probabilistic import (monte_carlo, Normal, LogNormal, Uniform, _summarise)
+from rpm import Q_
+
+
+@pytest.fixture
+def distributions(request):
+    return {
+        "sample_strength": LogNormal(Q_("3822psi"), Q_("400psi")),
+        "mine_depth": Uniform(Q_("140m"), Q_("160m")),
+        "friction_angle": Normal(Q_("28degrees"), Q_("2degrees")),
+    }
+
+
+def test_monte_carlo_without_spread_gives_deterministic_factors_of_safety(rap):
+    distributions = {"sample_strength": Normal(Q_("3822psi"), Q_("0psi")),
+                     "cohesion": Normal(Q_("1.2megapascal"), Q_("0megapascal"))}
+    result = monte_carlo(rap, distributions, realizations=10, batch_size=4, seed=1, processes=1)
+    assert np.allclose(result.pillar_fos, rap.factor_of_safety)
+    assert np.allclose(result.floor_fos, rap.bearing_capacity_factor_of_safety)
+
+
+def test_monte_carlo_is_reproducible_across_processes(rap, distributions):
+    serial = monte_carlo(rap, distributions, realizations=1000, batch_size=300, seed=7, processes=1)
+    parallel = monte_carlo(rap, distributions, realizations=1000, batch_size=300, seed=7, processes=2)
+    assert np.array_equal(serial.pillar_fos, parallel.pillar_fos)
+    assert serial.floor_percentiles == parallel.floor_percentiles
+
+
+def test_monte_carlo_reports_probability_of_failure(rap, distributions):
+    result = monte_carlo(rap, distributions, realizations=5000, batch_size=1000, seed=3, processes=1)
+    assert result.pillar_fos.size == 5000
+    assert result.pillar_failure_probability == np.mean(result.pillar_fos < 1)
+    assert result.pillar_percentiles[5] < result.pillar_percentiles[50] < result.pillar_percentiles[95]
+
+
+def test_monte_carlo_skips_floor_without_bearing_capacity_inputs(rap, distributions):
+    rap.cohesion = None
+    result = monte_carlo(rap, {"mine_depth": distributions["mine_depth"]}, realizations=10, processes=1)
+    assert result.floor_fos is None
+    assert result.floor_failure_probability is None
+
+
+def test_monte_carlo_rejects_unknown_inputs(rap):
+    with pytest.raises(ValueError):
+        monte_carlo(rap, {"room_span": Normal(6, 1)}, realizations=10, processes=1)
+
+
+def test_invalid_realizations_count_as_failures():
+    probability, percentiles, invalid = _summarise(np.array([0.5, 1.5, 2.0, np.nan, -np.inf]), (50,))
+    assert invalid == 2
+    assert probability == 3 / 5
+    assert percentiles[50] == 1.5
+
+
+def test_monte_carlo_reports_no_invalid_realizations_for_valid_draws(rap, distributions):
+    result = monte_carlo(rap, distributions, realizations=100, seed=3, processes=1)
+    assert (result.pillar_invalid, result.floor_invalid) == (0, 0)
+
+
+@pytest.mark.parametrize("realizations", [0, -5])
+def test_monte_carlo_rejects_runs_without_realizations(rap, distributions, realizations):
+    with pytest.raises(ValueError):
+        monte_carlo(rap, distributions, realizations=realizations, processes=1)
@@ -0,0 +1,105 @@
+import json
+
+import numpy as np
+import pytest
+
+from rpm import Q_
+from rpm.cases import solve_case
+from rpm.formulas import (register_formula, unregister_formula, CUSTOM_FORMULA, SF)
+from rpm.probabilistic import (monte_carlo, Normal)
+from rpm.project import (Project, save_project, load_project, read_header, ProjectFileError, ALIGNMENT, MAGIC,
+                         VERSION, _PREAMBLE)
+from rpm.sensitivity import sweep
+
+
+@pytest.fixture
+def project(case):
+    rap, _ = solve_case(case)
+    variant, _ = solve_case(dict(case, mine_depth="250", room_span="7"))
+    depth_sweep = sweep(rap, "mine_depth", Q_(np.linspace(100, 200, 11), "metre"), processes=1)
+    simulation = monte_carlo(rap, {"sample_strength": Normal(Q_("38.47 MPa"), Q_("4 MPa"))}, realizations=5000,
+                             batch_size=1000, seed=7, processes=1)
+    return Project("Mine", [rap, variant], {"depth": depth_sweep}, {"strength": simulation})
+
+
+def test_project_round_trip(project, tmpdir):
+    path = str(tmpdir.join("mine.rap"))
+    save_project(path, project)
+    loaded = load_project(path)
+    assert loaded.name == "Mine"
+    for original, design in zip(project.designs, loaded.designs):
+        assert design.pillar.width == original.pillar.width
+        assert design.location == original.location
+        assert round(design.factor_of_safety, 9) == round(original.factor_of_safety, 9)
+
+    depth_sweep, saved = project.sweeps["depth"], loaded.sweeps["depth"]
+    assert saved.parameter == "mine_depth"
+    assert np.array_equal(saved.values.to("metre").magnitude, depth_sweep.values.magnitude)
+    assert np.array_equal(saved.factor_of_safety, depth_sweep.factor_of_safety)
+
+    simulation, saved = project.simulations["strength"], loaded.simulations["strength"]
+    assert isinstance(saved.pillar_fos, np.memmap)
+    assert np.array_equal(saved.pillar_fos, simulation.pillar_fos)
+    assert saved.pillar_percentiles == simulation.pillar_percentiles
+    assert saved.pillar_failure_probability == simulation.pillar_failure_probability
+    assert saved.pillar_invalid == simulation.pillar_invalid == 0
+
+
+def test_arrays_are_aligned_and_read_without_mmap(project, tmpdir):
+    path = str(tmpdir.join("mine.rap"))
+    save_project(path, project)
+    header, data_start = read_header(path)
+    assert data_start % ALIGNMENT == 0
+    assert all(entry["offset"] % ALIGNMENT == 0 for entry in header["arrays"])
+    loaded = load_project(path, mmap=False)
+    assert not isinstance(loaded.simulations["strength"].pillar_fos, np.memmap)
+    assert np.array_equal(loaded.simulations["strength"].pillar_fos, project.simulations["strength"].pillar_fos)
+
+
+def test_custom_formulas_are_saved_with_the_designs(case, tmpdir, request):
+    formula = register_formula("Saved Formula", "k * (0.7 + 0.3 * width / height)", k_type=SF.UNIAXIAL)
+    request.addfinalizer(lambda: unregister_formula("Saved Formula"))
+    rap, _ = solve_case(dict(case, design_type="Redesign", pillar_formula="Saved Formula"))
+    path = str(tmpdir.join("custom.rap"))
+    save_project(path, Project(designs=[rap]))
+    unregister_formula("Saved Formula")
+    design = load_project(path).designs[0]
+    assert design.formula.expression == formula.expression
+    assert design.formula in CUSTOM_FORMULA
+    assert round(design.factor_of_safety, 9) == round(rap.factor_of_safety, 9)
+
+
+def test_conflicting_custom_formulas_are_rejected(case, tmpdir, request):
+    register_formula("Saved Formula", "k * (0.7 + 0.3 * width / height)", k_type=SF.UNIAXIAL)
+    request.addfinalizer(lambda: unregister_formula("Saved Formula"))
+    rap, _ = solve_case(dict(case, design_type="Redesign", pillar_formula="Saved Formula"))
+    path = str(tmpdir.join("custom.rap"))
+    save_project(path, Project(designs=[rap]))
+    assert load_project(path).designs[0].formula.name == "Saved Formula"
+    unregister_formula("Saved Formula")
+    register_formula("Saved Formula", "k * (0.6 + 0.4 * width / height)", k_type=SF.UNIAXIAL)
+    with pytest.raises(ProjectFileError):
+        load_project(path)
+
+
+def test_malformed_projects_are_rejected(project, tmpdir):
+    path = str(tmpdir.join("mine.rap"))
+    save_project(path, project)
+    header, data_start = read_header(path)
+    content = open(path, "rb").read()
+    truncated = tmpdir.join("truncated.rap")
+    truncated.write_binary(content[:40])
+    del header["designs"]
+    text = json.dumps(header).encode("utf-8")
+    malformed = tmpdir.join("malformed.rap")
+    malformed.write_binary(_PREAMBLE.pack(MAGIC, VERSION, len(text)) + text)
+    for bad in (truncated, malformed):
+        with pytest.raises(ProjectFileError):
+            load_project(str(bad))
+
+
+def test_other_files_are_rejected(tmpdir):
+    path = tmpdir.join("other.rap")
+    path.write_binary(b"PK\x03\x04 not a project")
+    with pytest.raises(ProjectFileError):
+        load_project(str(path))
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from rpm.cases import solve_case
+from rpm.raster import (open_grid, panel_rasters, fos_raster, tile_rows)
+from rpm import Q_
+
+
+@pytest.fixture
+def design(case):
+    return solve_case(case)[0]
+
+
+@pytest.fixture
+def depths(request):
+    return np.linspace(100.0, 400.0, 37 * 23).reshape(37, 23)
+
+
+def test_fos_raster_matches_design(design, depths):
+    raster = fos_raster(design, depths, tile_bytes=23 * 8 * 12 * 5)
+    assert raster.shape == depths.shape
+    for index in [(0, 0), (10, 7), (36, 22)]:
+        design.mine_depth = Q_(depths[index], "metre")
+        assert round(raster[index], 6) == round(design.factor_of_safety, 6)
+
+
+def test_rasters_are_written_to_memory_mapped_files(design, depths, tmpdir):
+    depth_path, fos_path = str(tmpdir.join("depth.npy")), str(tmpdir.join("fos.npy"))
+    np.save(depth_path, depths)
+    grid = open_grid(depth_path)
+    assert isinstance(grid, np.memmap)
+    rasters = panel_rasters(design, grid, {"factor_of_safety": fos_path, "pillar_stress": None}, tile_bytes=1)
+    assert np.array_equal(np.load(fos_path), fos_raster(design, depths))
+    assert np.all(np.diff(rasters["pillar_stress"].ravel()) > 0)
+
+
+def test_raw_rasters_and_layout_grids(design, depths, tmpdir):
+    path = str(tmpdir.join("depth.raw"))
+    (depths / 0.3048).astype("float32").tofile(path)
+    grid = open_grid(path, shape=depths.shape, dtype="float32")
+    widths = np.full(depths.shape, 20.0)
+    raster = fos_raster(design, grid, width=widths, depth_scale=0.3048)
+    design.pillar.width = design.pillar.length = Q_("20m")
+    design.invalidate("pillar")
+    design.mine_depth = Q_(depths[5, 5], "metre")
+    assert round(raster[5, 5], 4) == round(design.factor_of_safety, 4)
+
+
+def test_nodata_cells_are_nan(design, depths):
+    depths[3, 4] = -9999
+    raster = fos_raster(design, depths, nodata=-9999)
+    assert np.isnan(raster[3, 4]) and np.isfinite(raster[3, 5])
+
+
+def test_tiles_fit_the_memory_budget():
+    assert tile_rows(1000, tile_bytes=1000 * 8 * 12 * 10) == 10
+    assert tile_rows(10 ** 9, tile_bytes=1) == 1
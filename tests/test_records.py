@@ -0,0 +1,69 @@
+import copy
+import pickle
+
+import pytest
+
+from rpm.cases import solve_case
+from rpm.records import DesignRecord
+from rpm.rpm_oop import ALL_FORMULA
+from rpm import Q_
+
+
+@pytest.fixture
+def design(case):
+    return solve_case(dict(case, ore_type="Coal", friction_angle="19"))[0]
+
+
+def test_record_is_hashable_and_immutable(design):
+    record = DesignRecord.from_design(design)
+    assert record == DesignRecord.from_design(design)
+    assert len({record, DesignRecord.from_design(design)}) == 1
+    with pytest.raises(AttributeError):
+        record.mine_depth = 10
+
+
+def test_record_has_case_units(design):
+    record = DesignRecord.from_design(design)
+    assert record.mine_depth == 150
+    assert round(record.sample_height, 2) == 25.4
+    assert record.pillar_formula == "Bieniawski"
+    assert record.pillar_width == round(design.pillar.width.to("metre").magnitude, 2)
+
+
+def test_design_survives_a_round_trip(design):
+    copy = DesignRecord.from_design(design).to_design()
+    assert copy.formula is design.formula
+    assert copy.location == design.location
+    assert copy.pillar.width == design.pillar.width
+    assert round(copy.factor_of_safety, 6) == round(design.factor_of_safety, 6)
+    assert round(copy.bearing_capacity.to("megapascal"), 6) == round(design.bearing_capacity.to("megapascal"), 6)
+
+
+def test_changed_formula_constants_are_kept(design):
+    record = DesignRecord.from_design(design)._replace(alpha=0.6)
+    formula = record.to_design().formula
+    assert formula.alpha == 0.6 and formula.name == "Bieniawski"
+    assert ALL_FORMULA[2].alpha == 0.64
+
+
+def test_solids_and_designs_have_no_instance_dict(design):
+    for obj in (design, design.pillar, design.pillar.sample):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_pickled_design_keeps_its_outputs(design):
+    fos = design.factor_of_safety
+    unpickled = pickle.loads(pickle.dumps(design))
+    assert unpickled.factor_of_safety == fos
+    unpickled.mine_depth = Q_("300m")
+    assert unpickled.factor_of_safety < fos
+
+
+@pytest.mark.parametrize("duplicate", [copy.copy, lambda design: pickle.loads(pickle.dumps(design))])
+def test_changing_a_copy_leaves_the_original_outputs(design, duplicate):
+    stress, fos = design.pillar_stress, design.factor_of_safety
+    deeper = duplicate(design)
+    deeper.mine_depth = Q_("300m")
+    assert deeper.pillar_stress > stress
+    assert design.mine_depth == Q_("150m")
+    assert (design.pillar_stress, design.factor_of_safety) == (stress, fos)
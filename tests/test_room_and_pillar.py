@@ -1,3 +1,4 @@
+import logging
 import pytest
 # from unittest.mock import MagicMock
 
@@ -29,34 +30,6 @@ def rap_obj2(request):
     return rap
 
 
-@pytest.fixture
-def amoako_rap(request):
-    formula = StrengthFormula(alpha=0.4, beta=-0.6, k=15, k_type=StrengthFormula.OTHER, fos=(1, 1.5, 2.0),
-                              unit_system=StrengthFormula.METRIC, category=StrengthFormula.EXPONENTIAL)
-    sample = Sample(strength=Q_("3822psi"), height=Q_("40in"), diameter=Q_("54mm"))
-    pillar = Pillar(sample, height=Q_("4m"), length=Q_("4m"), width=Q_("4m"))
-    amoako = RoomAndPillar(pillar, formula, Q_("6m"))
-    amoako.overburden_density = Q_("20kilonewton per metre ** 3")
-    amoako.mine_depth = Q_("150m")
-    amoako.seam_dip = Q_("15degrees")
-    return amoako
-
-
-@pytest.fixture
-def rap_for_bearing_cap(request):
-    sample = Sample(strength=Q_("3822psi"), height=Q_("40in"), diameter=Q_("54mm"))
-    pillar = Pillar(sample=sample, height=Q_("3m"), length=Q_("10m"))
-    rap_object = RoomAndPillar(pillar=pillar)
-    rap_object.cohesion = Q_("1.2megapascal")
-    rap_object.friction_angle = Q_("28degrees")
-    rap_object.floor_density = Q_("22kilonewton per metre ** 3")
-    rap_object.room_span = Q_("6m")
-    rap_object.mine_depth = Q_("150m")
-    rap_object.seam_height = Q_("3m")
-    rap_object.overburden_density = Q_("22.5kilonewton per metre ** 3")
-    return rap_object
-
-
 def test_room_and_pillar_object_returns_correct_bieniawski_pillar_strength(rap_object):
     rap_object.formula = ALL_FORMULA[2] # bieniawski
     expected = rap_object.pillar_strength
@@ -134,3 +107,37 @@ def test_room_and_pillar_returns_correct_bearing_capacity_fos(rap_for_bearing_ca
     expected = 5.47
     result = rap_for_bearing_cap.bearing_capacity_factor_of_safety
     assert round(result, 2) == expected
+
+# ------- Memoized Output Tests -----------------
+
+
+def test_room_and_pillar_memoizes_outputs(rap_for_bearing_cap):
+    assert rap_for_bearing_cap.pillar_stress is rap_for_bearing_cap.pillar_stress
+
+
+def test_reassigning_an_input_invalidates_outputs_computed_from_it(rap_for_bearing_cap):
+    stress = rap_for_bearing_cap.pillar_stress
+    capacity = rap_for_bearing_cap.bearing_capacity
+    rap_for_bearing_cap.mine_depth = Q_("300m")
+    assert round(rap_for_bearing_cap.pillar_stress / stress, 2) == 2
+    assert rap_for_bearing_cap.bearing_capacity is capacity
+
+
+def test_reassigning_an_input_keeps_unrelated_outputs(rap_for_bearing_cap):
+    stress = rap_for_bearing_cap.pillar_stress
+    rap_for_bearing_cap.cohesion = Q_("2megapascal")
+    assert rap_for_bearing_cap.pillar_stress is stress
+
+
+def test_solving_pillar_width_invalidates_outputs(amoako_rap):
+    fos = amoako_rap.factor_of_safety
+    amoako_rap.pillar_width_from_fos_and_stress()
+    assert round(amoako_rap.factor_of_safety, 2) != round(fos, 2)
+
+
+def test_designs_log_diagnostics_instead_of_printing(amoako_rap, capsys, caplog):
+    with caplog.at_level(logging.DEBUG, logger="rpm"):
+        amoako_rap.pillar_width_from_fos_and_stress()
+        amoako_rap.factor_of_safety
+    assert capsys.readouterr().out == ""
+    assert any("alpha 0.4" in record.getMessage() for record in caplog.records)
@@ -0,0 +1,36 @@
+import numpy as np
+
+from rpm.sensitivity import (sweep, sensitivity, default_ranges, DEFAULT_PARAMETERS)
+from rpm import Q_
+
+
+def test_sweep_matches_design_outputs(rap):
+    depths = Q_(np.array([100.0, 150.0, 200.0]), "metre")
+    result = sweep(rap, "mine_depth", depths, processes=1)
+    assert rap.mine_depth == Q_("150m")
+    rap.mine_depth = Q_("200m")
+    assert round(result.factor_of_safety[2], 6) == round(rap.factor_of_safety, 6)
+    assert round(result.bearing_capacity_factor_of_safety[2], 6) == round(rap.bearing_capacity_factor_of_safety, 6)
+    assert result.extraction_ratio[2] == rap.extraction_ratio
+
+
+def test_sweep_of_nested_attribute(rap):
+    strengths = Q_(np.array([3000.0, 6000.0]), "psi")
+    result = sweep(rap, "sample_strength", strengths, processes=1)
+    assert result.factor_of_safety[1] > result.factor_of_safety[0]
+
+
+def test_sensitivity_gives_same_results_in_worker_processes(rap):
+    ranges = default_ranges(rap, points=7)
+    serial = sensitivity(rap, ranges, processes=1)
+    parallel = sensitivity(rap, ranges, processes=2)
+    assert list(parallel) == list(DEFAULT_PARAMETERS)
+    for parameter, result in serial.items():
+        assert np.allclose(result.factor_of_safety, parallel[parameter].factor_of_safety, equal_nan=True)
+
+
+def test_default_ranges_skip_parameters_that_are_not_set(rap):
+    rap.friction_angle = None
+    ranges = default_ranges(rap, points=5)
+    assert "friction_angle" not in ranges
+    assert len(ranges["mine_depth"]) == 5
@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+
+from rpm.rpm_oop import (RoomAndPillar, Pillar, Sample, ALL_FORMULA)
+from rpm.solvers import (solve_pillar_width, bracket_root, hardy_agapito_constants)
+from rpm import Q_
+
+
+def test_solve_pillar_width_against_known_values():
+    solution = solve_pillar_width(150, 6, 4, 15, 0.4, -0.6, 1.5, overburden_density=0.02)
+    assert solution.converged
+    assert round(float(solution.width), 1) == 7.5
+
+
+def test_solve_pillar_width_matches_scalar_solver(amoako_rap):
+    depths = np.array([100.0, 150.0, 300.0])
+    solution = solve_pillar_width(depths, 6, 4, 15, 0.4, -0.6, 1.5, overburden_density=0.02)
+    for depth, width in zip(depths, solution.width):
+        amoako_rap.mine_depth = Q_(depth, "metre")
+        amoako_rap.pillar_width_from_fos_and_stress()
+        assert round(width, 2) == amoako_rap.pillar.width.magnitude
+
+
+@pytest.mark.parametrize("formula", [ALL_FORMULA[2], ALL_FORMULA[1]], ids=lambda f: f.name)
+def test_solved_width_gives_required_factor_of_safety(formula):
+    sample = Sample(strength=Q_("3822psi"), height=Q_("40in"), diameter=Q_("54mm"))
+    k = formula.get_correct_k(Pillar(sample, Q_("3m"), Q_("3m")))
+    solution = solve_pillar_width(150, 6, 3, k, formula.alpha, formula.beta, formula.recommended_fos,
+                                  category=formula.category, unit_system=formula.unit_system,
+                                  overburden_density=0.0225)
+    width = Q_(float(solution.width), "metre")
+    rap = RoomAndPillar(Pillar(sample, Q_("3m"), width, width), formula, Q_("6m"))
+    rap.mine_depth = Q_("150m")
+    rap.overburden_density = Q_("22.5kilonewton per metre ** 3")
+    assert round(rap.factor_of_safety, 3) == formula.recommended_fos
+
+
+def test_hardy_agapito_widths_are_solved_with_the_sample_volume():
+    formula = ALL_FORMULA[0]
+    sample = Sample(strength=Q_("38.47MPa"), height=Q_("108mm"), diameter=Q_("54mm"), cylindrical=True)
+    k = formula.get_correct_k(Pillar(sample, Q_("3m"), Q_("3m")))
+    constants = hardy_agapito_constants(k, formula.alpha, formula.beta, sample.volume.to("metre ** 3").magnitude, 2.0)
+    solution = solve_pillar_width(150, 6, 3, *constants, fos=formula.recommended_fos, overburden_density=0.0225)
+    width = Q_(float(solution.width), "metre")
+    rap = RoomAndPillar(Pillar(sample, Q_("3m"), width, width), formula, Q_("6m"))
+    rap.mine_depth = Q_("150m")
+    rap.overburden_density = Q_("22.5kilonewton per metre ** 3")
+    assert round(rap.factor_of_safety, 3) == formula.recommended_fos
+    rap.pillar_width_from_fos_and_stress()
+    assert rap.pillar.width.magnitude == round(float(solution.width), 2)
+
+
+def test_solve_pillar_width_reports_rows_without_a_root():
+    solution = solve_pillar_width(150, 6, 4, [15, 0.01], [0.4, -0.5], -0.6, 1.5, overburden_density=0.02)
+    assert solution.converged.tolist() == [True, False]
+    assert np.isnan(solution.width[1])
+
+
+@pytest.mark.parametrize("root", [0.3, 2.0, 7.5, 199.9])
+def test_bracket_root_contains_root(root):
+    bracket = bracket_root(lambda x: x ** 3 - root ** 3)
+    assert bracket.lower <= root <= bracket.upper
+    assert bracket.upper - bracket.lower <= 1e-2
+
+
+def test_bracket_root_raises_without_sign_change():
+    with pytest.raises(ValueError):
+        bracket_root(lambda x: -1 - x ** 2, max_expansions=10)
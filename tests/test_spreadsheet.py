@@ -0,0 +1,67 @@
+import pytest
+from openpyxl import (Workbook, load_workbook)
+
+from rpm import spreadsheet
+from rpm.cases import solve_case
+from rpm.constants import OreTypes
+from rpm.spreadsheet import (header, parse_header, read_cases, read_designs, write_designs)
+
+
+@pytest.fixture
+def cases_workbook(tmpdir):
+    path = str(tmpdir.join("cases.xlsx"))
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(["Name of the Project", "Depth of the Ore [ft]", "Length of room [m]",
+                      "Uniaxial Compressive Strength of Sample [psi]", "sample_height [in]", "Diameter of Sample [in]",
+                      "Height of the Orebody", "Substance being Mined", "Notes"])
+    worksheet.append(["Panel 1", 500, 6, 5580, 1, 2.126, 4, "Coal", "not a case field"])
+    worksheet.append([None] * 9)
+    worksheet.append(["Panel 2", "600", 6, 5580, 1, 2.126, 4, "Coal", None])
+    workbook.save(path)
+    return path
+
+
+def test_header_round_trip():
+    assert header("Depth of the Ore", "metre") == "Depth of the Ore [m]"
+    assert parse_header("Depth of the Ore [ft]") == ("Depth of the Ore", "ft")
+    assert parse_header("Rock Mass Rating") == ("Rock Mass Rating", None)
+
+
+def test_read_cases_converts_columns_to_case_units(cases_workbook):
+    first, second = read_cases(cases_workbook)
+    assert round(first["mine_depth"], 2) == 152.4
+    assert round(second["mine_depth"], 2) == 182.88
+    assert round(first["sample_strength"], 2) == 38.47
+    assert round(first["sample_height"], 2) == 2.54
+    assert first["seam_height"] == 4
+    assert "Notes" not in first
+
+
+def test_designs_survive_a_round_trip(cases_workbook, tmpdir):
+    designs = [solve_case(case)[0] for case in read_cases(cases_workbook)]
+    path = str(tmpdir.join("designs.xlsx"))
+    assert write_designs(path, designs) == 2
+    for design, read in zip(designs, read_designs(path)):
+        assert read.ore_type == OreTypes.coal
+        assert round(read.mine_depth, 2) == round(design.mine_depth, 2)
+        assert round(read.pillar.sample.strength, 2) == round(design.pillar.sample.strength, 2)
+        assert read.formula is None
+
+
+def test_write_designs_writes_outputs(cases_workbook, tmpdir):
+    design = solve_case(next(read_cases(cases_workbook)))[0]
+    path = str(tmpdir.join("designs.xlsx"))
+    write_designs(path, [design])
+    headers, row = load_workbook(path, read_only=True).active.iter_rows(values_only=True)
+    cells = dict(zip(headers, row))
+    assert cells["Pillar Width [m]"] == round(design.pillar.width.magnitude, 2)
+    assert round(cells["Factor of Safety for Pillar"], 2) == round(design.factor_of_safety, 2)
+    assert cells["Bearing Capacity of Floor [MPa]"] is None
+
+
+def test_write_designs_leaves_outputs_out(cases_workbook, tmpdir):
+    path = str(tmpdir.join("inputs.xlsx"))
+    write_designs(path, read_designs(cases_workbook), outputs=False)
+    headers, _, _ = load_workbook(path, read_only=True).active.iter_rows(values_only=True)
+    assert len(headers) == len(spreadsheet.CASE_FIELDS)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from rpm.batch import pillar_stress
+from rpm.cases import solve_case
+from rpm.tributary import (pack_polygons, polygon_properties, panel_bounds, tributary_stress,
+                           panel_tributary_stress)
+from rpm import Q_
+
+
+SQUARE = np.array([[0, 0], [10, 0], [10, 10], [0, 10]], dtype=float)
+
+
+def grid_layout(rows, columns, pitch, pillar=SQUARE):
+    return [pillar + (column * pitch, row * pitch) for row in range(rows) for column in range(columns)]
+
+
+def test_polygon_properties():
+    triangle = np.array([[0, 0], [4, 0], [0, 3], [0, 0]], dtype=float)
+    areas, centroids, perimeters = polygon_properties(pack_polygons([SQUARE, triangle, SQUARE[::-1]]))
+    assert list(areas) == [100, 6, 100]
+    assert np.allclose(centroids, [[5, 5], [4 / 3, 1], [5, 5]])
+    assert list(perimeters) == [40, 12, 40]
+
+
+def test_default_bounds_leave_half_a_room_around_the_pillars():
+    bounds = panel_bounds(pack_polygons(grid_layout(3, 4, 16.0)))
+    assert np.allclose(bounds, (-3, -3, 61, 45))
+
+
+def test_regular_layout_matches_tributary_area_formula():
+    result = tributary_stress(grid_layout(20, 30, 16.0), 3.0)
+    assert np.allclose(result.tributary_area, 256)
+    assert np.allclose(result.pillar_stress, pillar_stress(3.0, 10.0, 10.0, 6.0))
+    assert np.allclose(result.effective_width, 10)
+
+
+def test_cells_partition_the_panel():
+    rng = np.random.default_rng(7)
+    centres = rng.uniform(5, 495, (2000, 2))
+    sizes = rng.uniform(1, 4, (2000, 1))
+    polygons = [SQUARE / 10 * size + centre - size / 2 for centre, size in zip(centres, sizes)]
+    bounds = (0, 0, 500, 500)
+    result = tributary_stress(polygons, rng.uniform(2, 4, 2000), bounds)
+    assert round(result.tributary_area.sum(), 6) == 500 * 500
+    assert np.all(result.tributary_area > 0)
+
+
+def test_panel_factor_of_safety_matches_design(case):
+    design = solve_case(case)[0]
+    design.pillar.width = design.pillar.length = Q_("10m")
+    design.invalidate("pillar")
+    result = panel_tributary_stress(design, grid_layout(5, 5, 16.0))
+    assert np.allclose(result.factor_of_safety, design.factor_of_safety)
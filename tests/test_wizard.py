@@ -1,21 +1,18 @@
 import pytest
-import sys
 
 # from qtpy.QtCore import
 # from qtpy.QtGui import
 # from qtpy.QtTest import QTest
-from qtpy.QtWidgets import QApplication
 
 from gui_.wizard import ProjectWizard
 from rpm.constants import (OreTypes, Countries)
+from rpm import Q_
+from rpm.cases import CASE_FIELDS
 from rpm.rpm_oop import ALL_FORMULA
 
 
-app = QApplication(sys.argv)
-
-
 @pytest.fixture
-def wizard(request):
+def wizard(qapp):
     return ProjectWizard()
 
 
@@ -80,3 +77,18 @@ def test_pillar_location_combo_has_correct_number_of_items(wizard):
         assert wizard.locationCombo.currentText() != ""
     wizard.locationCombo.setCurrentIndex(item_no + 1)
     assert wizard.locationCombo.currentText() == ""
+
+
+def test_wizard_case_has_every_case_field(wizard):
+    case = wizard.case()
+    assert set(case) == set(CASE_FIELDS)
+    assert case["room_span"] == Q_("6m")
+    assert case["pillar_formula"] is None
+
+
+def test_live_preview_recomputes_edited_fields(wizard):
+    wizard.previewBox.setChecked(True)
+    width = wizard.preview.values["pillar_width"]
+    wizard.oreDepthSpin.setValue(wizard.oreDepthSpin.value() * 2)
+    wizard.refresh_preview()
+    assert wizard.preview.values["pillar_width"] > width
@@ -0,0 +1,48 @@
+import pytest
+from qtpy.QtCore import SIGNAL
+
+from gui_.workers import (Worker, design_worker)
+
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+def record(worker):
+    """Connects the signals of worker to lists of what they send"""
+    signals = {"progress": [], "result": [], "error": [], "cancelled": []}
+    worker.connect(worker, SIGNAL("progress(int, int)"), lambda *args: signals["progress"].append(args))
+    worker.connect(worker, SIGNAL("result(int, PyObject)"), lambda *args: signals["result"].append(args))
+    worker.connect(worker, SIGNAL("error(int, QString)"), lambda *args: signals["error"].append(args))
+    worker.connect(worker, SIGNAL("cancelled()"), lambda: signals["cancelled"].append(True))
+    return signals
+
+
+def test_worker_reports_results_errors_and_progress():
+    worker = Worker(lambda job: 10 / job, [5, 0, 2])
+    signals = record(worker)
+    # run in this thread so that the signals are delivered at once
+    worker.run()
+    assert signals["result"] == [(0, 2.0), (2, 5.0)]
+    assert [index for index, _ in signals["error"]] == [1]
+    assert signals["progress"] == [(0, 3), (1, 3), (2, 3), (3, 3)]
+
+
+def test_cancelled_worker_stops_before_the_next_job():
+    worker = Worker(lambda job: job, range(5))
+    signals = record(worker)
+    worker.cancel()
+    worker.run()
+    assert worker.is_cancelled
+    assert signals["result"] == []
+    assert signals["cancelled"] == [True]
+
+
+def test_design_worker_solves_cases_in_the_background(case, qapp):
+    worker = design_worker([case])
+    signals = record(worker)
+    worker.start()
+    assert worker.wait(30000)
+    qapp.processEvents()
+    (index, rap), = signals["result"]
+    assert rap.pillar.width.magnitude > 0
+    assert "<html" in rap.html_report.lower()